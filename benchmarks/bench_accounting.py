@@ -0,0 +1,93 @@
+# Copyright 2018 www.privaz.io Valletech AB
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+# Usage per user of an accounting document, from the complete bindings or streamed.
+# Each way runs in its own process to report its peak memory.
+#
+#   python benchmarks/bench_accounting.py [number of records]
+
+import os
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from pyone import bindings
+from pyone.accounting import aggregate_accounting
+
+RECORD = ("<HISTORY><OID>%(id)d</OID><SEQ>0</SEQ><HOSTNAME>host%(host)d</HOSTNAME><HID>%(host)d</HID>"
+          "<CID>0</CID><STIME>%(start)d</STIME><ETIME>%(end)d</ETIME><VM_MAD>kvm</VM_MAD><TM_MAD>ssh</TM_MAD>"
+          "<DS_ID>0</DS_ID><PSTIME>%(start)d</PSTIME><PETIME>%(start)d</PETIME><RSTIME>%(start)d</RSTIME>"
+          "<RETIME>%(end)d</RETIME><ESTIME>0</ESTIME><EETIME>0</EETIME><ACTION>0</ACTION><UID>0</UID><GID>0</GID>"
+          "<REQUEST_ID>-1</REQUEST_ID><VM><ID>%(id)d</ID><UID>%(uid)d</UID><GID>%(gid)d</GID><UNAME>u</UNAME>"
+          "<GNAME>g</GNAME><NAME>vm-%(id)d</NAME><LAST_POLL>0</LAST_POLL><STATE>6</STATE><LCM_STATE>0</LCM_STATE>"
+          "<PREV_STATE>6</PREV_STATE><PREV_LCM_STATE>0</PREV_LCM_STATE><RESCHED>0</RESCHED>"
+          "<STIME>%(start)d</STIME><ETIME>%(end)d</ETIME><DEPLOY_ID>one-%(id)d</DEPLOY_ID><MONITORING/>"
+          "<TEMPLATE><CPU>1</CPU><MEMORY>2048</MEMORY><VCPU>2</VCPU><DISK><SIZE>10240</SIZE><TYPE>fs</TYPE>"
+          "</DISK><NIC><IP>10.0.0.1</IP><MAC>02:00:0a:00:00:01</MAC></NIC></TEMPLATE><USER_TEMPLATE/>"
+          "<HISTORY_RECORDS/></VM></HISTORY>")
+
+
+def write_records(path, size):
+    with open(path, "w") as f:
+        f.write("<HISTORY_RECORDS>")
+        for i in range(size):
+            start = 1500000000 + i * 60
+            f.write(RECORD % {"id": i, "host": i % 50, "uid": i % 100, "gid": i % 10,
+                              "start": start, "end": start + 3600})
+        f.write("</HISTORY_RECORDS>")
+
+
+def bindings_usage(path):
+    # what the billing runs did: parse it all, then sum
+    with open(path, "rb") as f:
+        records = bindings.parseString(f.read())
+    usage = {}
+    for record in records.HISTORY:
+        hours = (record.RETIME - record.RSTIME) / 3600.0
+        usage[record.VM.UID] = usage.get(record.VM.UID, 0) + float(record.VM.TEMPLATE["CPU"]) * hours
+    return usage
+
+
+def run(mode, path):
+    start = time.time()
+    if mode == "bindings":
+        bindings_usage(path)
+    else:
+        aggregate_accounting(path, by=("UID",), now=0)
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024.0
+    print("%-9s %7.3f s, %7.1f MB peak RSS" % (mode, time.time() - start, peak))
+
+
+def main():
+    if len(sys.argv) > 2:
+        run(sys.argv[1], sys.argv[2])
+        return
+    size = int(sys.argv[1]) if len(sys.argv) > 1 else 50000
+    fd, path = tempfile.mkstemp(suffix=".xml")
+    os.close(fd)
+    try:
+        write_records(path, size)
+        print("%d records, %.1f MB of XML" % (size, os.path.getsize(path) / 1e6))
+        for mode in ("bindings", "streamed"):
+            subprocess.check_call([sys.executable, __file__, mode, path])
+    finally:
+        os.remove(path)
+
+
+if __name__ == '__main__':
+    main()
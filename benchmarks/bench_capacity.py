@@ -0,0 +1,81 @@
+# Copyright 2018 www.privaz.io Valletech AB
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+# Placement of a VM in the hosts of a pool, walking the bindings or with a CapacityIndex.
+#
+#   python benchmarks/bench_capacity.py [number of hosts]
+
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from pyone import bindings, CapacityIndex
+
+QUERIES = 1000
+TEMPLATE = {"CPU": "2", "MEMORY": "4096", "DISK": {"SIZE": "20480"}}
+
+
+def host_pool(size):
+    random.seed(1)
+    hosts = []
+    for i in range(size):
+        hosts.append("<HOST><ID>%d</ID><NAME>node%d</NAME><STATE>%d</STATE><CLUSTER_ID>%d</CLUSTER_ID><HOST_SHARE>"
+                     "<MEM_USAGE>%d</MEM_USAGE><CPU_USAGE>%d</CPU_USAGE><MAX_MEM>134217728</MAX_MEM>"
+                     "<MAX_CPU>3200</MAX_CPU><RUNNING_VMS>10</RUNNING_VMS><DATASTORES><DS><ID>0</ID>"
+                     "<FREE_MB>%d</FREE_MB></DS></DATASTORES></HOST_SHARE></HOST>"
+                     % (i, i, random.choice((2, 2, 2, 4)), i % 10, random.randint(0, 134217728),
+                        random.randint(0, 3200), random.randint(0, 10 ** 6)))
+    return bindings.parseString(("<HOST_POOL>%s</HOST_POOL>" % "".join(hosts)).encode("utf-8"))
+
+
+def walk(pool, k):
+    # what the placement scripts did, host by host
+    fits = []
+    for host in pool.HOST:
+        share = host.HOST_SHARE
+        free_cpu = share.MAX_CPU - share.CPU_USAGE
+        free_mem = share.MAX_MEM - share.MEM_USAGE
+        free_disk = max(ds.FREE_MB for ds in share.DATASTORES.DS)
+        if host.STATE == 2 and free_cpu >= 200 and free_mem >= 4 * 1024 * 1024 and free_disk >= 20480:
+            fits.append((free_cpu, host.ID))
+    return sorted(fits, reverse=True)[:k]
+
+
+def main():
+    size = int(sys.argv[1]) if len(sys.argv) > 1 else 5000
+    pool = host_pool(size)
+    start = time.time()
+    index = CapacityIndex()
+    index.update(pool)
+    print("%d hosts, indexed in %.3f s" % (size, time.time() - start))
+
+    start = time.time()
+    for _ in range(QUERIES):
+        walk(pool, 5)
+    print("%-9s %8.3f ms per query" % ("bindings", (time.time() - start) * 1000 / QUERIES))
+    start = time.time()
+    for _ in range(QUERIES):
+        index.fit(TEMPLATE, k=5)
+    print("%-9s %8.3f ms per query" % ("fit", (time.time() - start) * 1000 / QUERIES))
+    start = time.time()
+    for i in range(QUERIES):
+        index.update(pool.HOST[i % size:i % size + 1])
+    print("%-9s %8.3f ms per host update" % ("update", (time.time() - start) * 1000 / QUERIES))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,84 @@
+# Copyright 2018 www.privaz.io Valletech AB
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+# Compares the serialization of templates by pyone.util.cast2one with the previous implementation,
+# which concatenated the attribute=value vector one attribute at a time and used dicttoxml for XML.
+# The dicttoxml measures are skipped when it is not installed, it is no longer a dependency of pyone.
+#
+#   python benchmarks/bench_cast2one.py [number of attributes] [number of disks]
+
+import os
+import sys
+import time
+from collections import OrderedDict
+
+try:
+    import dicttoxml
+except ImportError:
+    dicttoxml = None
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from pyone.util import dict2template, dict2xml
+
+
+def concatenated(param):
+    ret = u""
+    for (k, v) in param.items():
+        ret = u'''%s%s="%s"\n''' % (ret, k, v)
+    return ret
+
+
+def with_dicttoxml(param):
+    return dicttoxml.dicttoxml(param, root=False, attr_type=False, cdata=True).decode('utf8')
+
+
+def context(size):
+    # a large CONTEXT section, e.g. with the SSH keys and scripts of many users
+    return OrderedDict(("VAR_%d" % i, "value of the context variable %d " % i * 4) for i in range(size))
+
+
+def disks(size):
+    return OrderedDict([("NAME", "vm"), ("CPU", "1"), ("MEMORY", "1024"),
+                        ("DISK", [OrderedDict([("IMAGE_ID", str(i)), ("SIZE", "10240"), ("TARGET", "vd%d" % i),
+                                               ("CACHE", "none"), ("DEV_PREFIX", "vd")]) for i in range(size)])])
+
+
+def measure(name, function, argument):
+    if function is with_dicttoxml and dicttoxml is None:
+        print("%-40s   skipped, dicttoxml is not installed" % name)
+        return
+    start = time.time()
+    function(argument)
+    print("%-40s %8.3f s" % (name, time.time() - start))
+
+
+def main():
+    attributes = int(sys.argv[1]) if len(sys.argv) > 1 else 20000
+    size = int(sys.argv[2]) if len(sys.argv) > 2 else 5000
+    flat = context(attributes)
+    measure("%d attributes, concatenated" % attributes, concatenated, flat)
+    measure("%d attributes, dict2template" % attributes, dict2template, flat)
+    measure("CONTEXT with %d attributes, dicttoxml" % attributes, with_dicttoxml, {"CONTEXT": flat})
+    measure("CONTEXT with %d attributes, dict2xml" % attributes, dict2xml, {"CONTEXT": flat})
+
+    template = disks(size)
+    # the previous vector serialization wrote the disks as their Python representation
+    measure("%d disks, dict2template" % size, dict2template, template)
+    measure("%d disks, dicttoxml" % size, with_dicttoxml, {"TEMPLATE": template})
+    measure("%d disks, dict2xml" % size, dict2xml, {"TEMPLATE": template})
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,67 @@
+# Copyright 2018 www.privaz.io Valletech AB
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+# Compares pyone.util.child2dict with the previous implementation, which serialized
+# each TEMPLATE element and parsed it back with xmltodict.
+#
+#   python benchmarks/bench_child2dict.py [repetitions]
+
+import os
+import sys
+import timeit
+import xmltodict
+from collections import OrderedDict
+from lxml import etree
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from pyone.util import child2dict, none2emptystr
+
+data_dir = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'tests', 'ci', 'test_issue_006_data')
+
+
+def xmltodict_child2dict(element):
+    xml = etree.tostring(element)
+    ret = xmltodict.parse(xml)
+    if "}" in element.tag:
+        tagName = element.tag.split('}')[1]
+        del ret[tagName]['@xmlns']
+    else:
+        tagName = element.tag
+    if ret[tagName] is None:
+        ret[tagName] = OrderedDict()
+    none2emptystr(ret)
+    return ret[tagName]
+
+
+def templates():
+    ret = []
+    for name in sorted(os.listdir(data_dir)):
+        tree = etree.parse(os.path.join(data_dir, name))
+        ret.extend(tree.xpath("//*[local-name()='TEMPLATE' or local-name()='USER_TEMPLATE']"))
+    return ret
+
+
+def main():
+    repetitions = int(sys.argv[1]) if len(sys.argv) > 1 else 500
+    elements = templates()
+    print("%d TEMPLATE/USER_TEMPLATE elements, %d repetitions" % (len(elements), repetitions))
+
+    for name, function in (("tostring + xmltodict", xmltodict_child2dict), ("child2dict", child2dict)):
+        seconds = timeit.timeit(lambda: [function(e) for e in elements], number=repetitions)
+        print("%-22s %8.2f us per template" % (name, seconds * 1e6 / (repetitions * len(elements))))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,67 @@
+# Copyright 2018 www.privaz.io Valletech AB
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+# Extraction of a few fields of a VM pool as columns, walking the bindings or with to_columns.
+#
+#   python benchmarks/bench_columns.py [number of VMs]
+
+import os
+import re
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from pyone import bindings, columns
+
+data_dir = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'tests', 'ci', 'test_issue_006_data')
+
+FIELDS = ['ID', 'STATE', 'LCM_STATE', 'STIME', 'ETIME', 'HISTORY_RECORDS/HISTORY/HOSTNAME']
+
+
+def vm_pool(size):
+    with open(os.path.join(data_dir, 'vm_01.xml'), 'rb') as f:
+        vm = f.read().decode('utf-8')
+    vm = re.sub(r'^<\?xml[^>]*>\s*', '', vm)
+    vms = [re.sub(r'<ID>\d+</ID>', '<ID>%d</ID>' % i, vm, count=1) for i in range(size)]
+    return ('<VM_POOL>%s</VM_POOL>' % ''.join(vms)).encode('utf-8')
+
+
+def walk(xml):
+    # what the dashboards did, binding by binding
+    pool = bindings.parseString(xml)
+    ret = dict((field, []) for field in FIELDS)
+    for vm in pool.VM:
+        ret['ID'].append(vm.ID)
+        ret['STATE'].append(vm.STATE)
+        ret['LCM_STATE'].append(vm.LCM_STATE)
+        ret['STIME'].append(vm.STIME)
+        ret['ETIME'].append(vm.ETIME)
+        history = vm.HISTORY_RECORDS.HISTORY if vm.HISTORY_RECORDS else None
+        ret['HISTORY_RECORDS/HISTORY/HOSTNAME'].append(history[0].HOSTNAME if history else None)
+    return ret
+
+
+def main():
+    size = int(sys.argv[1]) if len(sys.argv) > 1 else 5000
+    xml = vm_pool(size)
+    print("%d VMs, %.1f MB of XML, %s" % (size, len(xml) / 1e6, "NumPy" if columns.numpy else "array.array"))
+    for name, extract in (("bindings", walk), ("to_columns", lambda xml: bindings.to_columns(xml, FIELDS))):
+        start = time.time()
+        extract(xml)
+        print("%-10s %7.3f s" % (name, time.time() - start))
+
+
+if __name__ == '__main__':
+    main()
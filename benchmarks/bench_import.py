@@ -0,0 +1,69 @@
+# Copyright 2018 www.privaz.io Valletech AB
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+# Cold import time of pyone, each sample in a new interpreter, as paid by command line tools.
+# "eager" also imports what was imported with pyone before the bindings were split: all the binding
+# modules, the constants, the helpers and pyone.columns with NumPy.
+#
+#   python benchmarks/bench_import.py [number of samples]
+
+import os
+import subprocess
+import sys
+
+root_dir = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..')
+
+# milliseconds, with bytecode, importing everything as before took 140 to 180 ms
+TARGET = 70
+
+LAZY = "import pyone"
+PARSE = LAZY + "; pyone.bindings.parseString(b'<VM_POOL><VM><ID>0</ID></VM></VM_POOL>')"
+EAGER = LAZY + "; import pyone.columns; [getattr(pyone, name) for name in dir(pyone)]; " \
+               "[getattr(pyone.bindings.supermod, name) for name in pyone.bindings.supermod._MODULES]"
+
+SAMPLE = "import time; start = time.time(); %s; print(time.time() - start)"
+
+
+def sample(statement, bytecode):
+    env = dict(os.environ)
+    env.pop("PYTHONDONTWRITEBYTECODE", None)
+    if not bytecode:
+        env["PYTHONDONTWRITEBYTECODE"] = "1"
+    command = [sys.executable]
+    if not bytecode:
+        # no cached bytecode is read either, everything is compiled as on a first run
+        command.append("-X")
+        command.append("pycache_prefix=%s" % os.path.join(root_dir, "build", "no_pycache_%d" % os.getpid()))
+    output = subprocess.check_output(command + ["-c", SAMPLE % statement], cwd=root_dir, env=env)
+    return float(output.decode("utf-8").split()[-1]) * 1000
+
+
+def median(statement, bytecode, samples):
+    times = sorted(sample(statement, bytecode) for _ in range(samples))
+    return times[len(times) // 2]
+
+
+def main():
+    samples = int(sys.argv[1]) if len(sys.argv) > 1 else 11
+    # writes the bytecode of every module once
+    sample(EAGER, True)
+    for name, statement in (("import pyone", LAZY), ("import, parse a VM_POOL", PARSE), ("eager", EAGER)):
+        print("%-25s %8.1f ms %8.1f ms without bytecode" %
+              (name, median(statement, True, samples), median(statement, False, 3)))
+    lazy = median(LAZY, True, samples)
+    print("import pyone %.1f ms, target %d ms: %s" % (lazy, TARGET, "ok" if lazy <= TARGET else "over target"))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,65 @@
+# Copyright 2018 www.privaz.io Valletech AB
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+# Parse time and memory of a VM pool with eager and lazy templates, reading only state fields.
+#
+#   python benchmarks/bench_lazy_templates.py [number of VMs]
+
+import os
+import re
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from pyone import bindings
+from pyone.util import lazy_templates
+
+data_dir = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'tests', 'ci', 'test_issue_006_data')
+
+
+def vm_pool(size):
+    with open(os.path.join(data_dir, 'vm_01.xml'), 'rb') as f:
+        vm = f.read().decode('utf-8')
+    vm = re.sub(r'^<\?xml[^>]*>\s*', '', vm)
+    vms = [re.sub(r'<ID>\d+</ID>', '<ID>%d</ID>' % i, vm, count=1) for i in range(size)]
+    return ('<VM_POOL>%s</VM_POOL>' % ''.join(vms)).encode('utf-8')
+
+
+def scan(xml, lazy):
+    with lazy_templates(lazy):
+        pool = bindings.parseString(xml)
+    return [(vm.ID, vm.STATE, vm.LCM_STATE) for vm in pool.VM], pool
+
+
+def main():
+    size = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    xml = vm_pool(size)
+    print("%d VMs, %.1f MB of XML" % (size, len(xml) / 1e6))
+    for lazy in (False, True):
+        start = time.time()
+        scan(xml, lazy)
+        elapsed = time.time() - start
+
+        tracemalloc.start()
+        states, pool = scan(xml, lazy)
+        current, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        print("%-6s templates: %7.3f s, %7.1f MB retained, %7.1f MB peak" %
+              ("lazy" if lazy else "eager", elapsed, current / 1e6, peak / 1e6))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,68 @@
+# Copyright 2018 www.privaz.io Valletech AB
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+# Decoding the monitoring of a VM pool, per VM dictionaries vs decode_monitoring arrays.
+#
+#   python benchmarks/bench_monitoring.py [number of VMs]
+
+import os
+import re
+import sys
+import timeit
+from io import BytesIO
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from lxml import etree
+from pyone import monitoring
+from pyone.monitoring import decode_monitoring, MONITORING_COUNTERS
+
+data_dir = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'tests', 'ci', 'test_issue_006_data')
+
+
+def monitoring_data(size):
+    # as returned by vmpool.monitoring, the ID, LAST_POLL and MONITORING of each VM
+    with open(os.path.join(data_dir, 'vm_01.xml'), 'rb') as f:
+        vm = f.read().decode('utf-8')
+    record = re.search(r'<MONITORING>.*?</MONITORING>', vm, re.S).group(0)
+    vms = ['<VM><ID>%d</ID><LAST_POLL>%d</LAST_POLL>%s</VM>' % (i, 1511608767 + i, record) for i in range(size)]
+    return ('<MONITORING_DATA>%s</MONITORING_DATA>' % ''.join(vms)).encode('utf-8')
+
+
+def dictionaries(xml):
+    # what per VM dictionary digging costs
+    ret = {}
+    for vm in etree.parse(BytesIO(xml)).getroot():
+        values = dict((child.tag, child.text) for child in vm.find('MONITORING'))
+        ret[int(vm.findtext('ID'))] = dict((counter, float(values[counter])) for counter in MONITORING_COUNTERS
+                                           if counter in values)
+    return ret
+
+
+def main():
+    size = int(sys.argv[1]) if len(sys.argv) > 1 else 20000
+    xml = monitoring_data(size)
+    root = etree.parse(BytesIO(xml), parser=etree.ETCompatXMLParser()).getroot()
+    print("%d VMs, %.1f MB of XML, %s" % (size, len(xml) / 1e6, "NumPy" if monitoring.numpy else "array.array"))
+    for name, decode in (("dictionaries", lambda: dictionaries(xml)),
+                         ("decode", lambda: decode_monitoring(xml)),
+                         ("decode parsed", lambda: decode_monitoring(root))):
+        print("%-14s %7.3f s" % (name, min(timeit.repeat(decode, number=1, repeat=3))))
+    previous = decode_monitoring(xml)
+    current = decode_monitoring(xml.replace(b'<LAST_POLL>', b'<LAST_POLL>1'))
+    print("%-14s %7.3f s" % ("rates", min(timeit.repeat(lambda: current.rates(previous), number=1, repeat=3))))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,93 @@
+# Copyright 2018 www.privaz.io Valletech AB
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+# Memory held by a VM pool snapshot with the generated bindings and with a __slots__ copy of them,
+# as built by "make slots". Templates are lazy to measure the binding objects themselves.
+#
+#   python benchmarks/bench_slots.py [number of VMs]
+
+import importlib
+import io
+import os
+import re
+import shutil
+import sys
+import tempfile
+import time
+import tracemalloc
+
+root_dir = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..')
+sys.path.insert(0, root_dir)
+sys.path.insert(0, os.path.join(root_dir, 'src'))
+
+from lxml import etree
+from pyone import bindings
+from pyone.util import lazy_templates
+from slotify import slotify
+
+data_dir = os.path.join(root_dir, 'tests', 'ci', 'test_issue_006_data')
+
+
+def vm_pool(size):
+    with open(os.path.join(data_dir, 'vm_01.xml'), 'rb') as f:
+        vm = f.read().decode('utf-8')
+    vm = re.sub(r'^<\?xml[^>]*>\s*', '', vm)
+    vms = [re.sub(r'<ID>\d+</ID>', '<ID>%d</ID>' % i, vm, count=1) for i in range(size)]
+    return ('<VM_POOL>%s</VM_POOL>' % ''.join(vms)).encode('utf-8')
+
+
+def slotted_bindings(directory):
+    package = os.path.join(directory, 'slotted_bindings')
+    os.mkdir(package)
+    for name in sorted(os.listdir(os.path.dirname(bindings.__file__))):
+        if not name.endswith('.py'):
+            continue
+        with io.open(os.path.join(os.path.dirname(bindings.__file__), name), encoding='utf-8') as f:
+            source = f.read()
+        with io.open(os.path.join(package, name), 'w', encoding='utf-8') as f:
+            f.write(slotify(source))
+    sys.path.insert(0, directory)
+    return importlib.import_module('slotted_bindings')
+
+
+def build(module, xml):
+    root = etree.fromstring(xml)
+    with lazy_templates():
+        return module.get_root_tag(root)[1].factory().build(root)
+
+
+def main():
+    size = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    xml = vm_pool(size)
+    print("%d VMs, %.1f MB of XML" % (size, len(xml) / 1e6))
+    directory = tempfile.mkdtemp()
+    try:
+        for name, module in (("__dict__", bindings), ("__slots__", slotted_bindings(directory))):
+            start = time.time()
+            build(module, xml)
+            elapsed = time.time() - start
+
+            tracemalloc.start()
+            pool = build(module, xml)
+            current, peak = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+            print("%-9s %7.3f s, %7.1f MB retained, %6d bytes per VM" %
+                  (name, elapsed, current / 1e6, current / size))
+            pool = None
+    finally:
+        shutil.rmtree(directory)
+
+
+if __name__ == '__main__':
+    main()
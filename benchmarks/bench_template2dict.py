@@ -0,0 +1,57 @@
+# Copyright 2018 www.privaz.io Valletech AB
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+# Parses a large template from its text with pyone.util.template2dict, and from its XML with child2dict.
+#
+#   python benchmarks/bench_template2dict.py [number of attributes] [number of disks]
+
+import io
+import os
+import sys
+import time
+from collections import OrderedDict
+from lxml import etree
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from pyone.util import child2dict, dict2template, dict2xml, template2dict
+
+
+def template(attributes, disks):
+    ret = OrderedDict(("VAR_%d" % i, "value of the \"context\" variable %d " % i * 4) for i in range(attributes))
+    ret["DISK"] = [OrderedDict([("IMAGE_ID", str(i)), ("SIZE", "10240"), ("TARGET", "vd%d" % i),
+                                ("CACHE", "none"), ("DEV_PREFIX", "vd")]) for i in range(disks)]
+    return ret
+
+
+def measure(name, function, argument):
+    start = time.time()
+    function(argument)
+    print("%-28s %8.3f s" % (name, time.time() - start))
+
+
+def main():
+    attributes = int(sys.argv[1]) if len(sys.argv) > 1 else 20000
+    disks = int(sys.argv[2]) if len(sys.argv) > 2 else 5000
+    d = template(attributes, disks)
+    text = dict2template(d)
+    xml = dict2xml({"TEMPLATE": d}).encode("utf-8")
+    print("%d attributes and %d disks, %.1f MB of text" % (attributes, disks, len(text) / 1e6))
+    measure("template2dict", template2dict, text)
+    measure("template2dict, from a file", template2dict, io.BytesIO(text.encode("utf-8")))
+    measure("XML, child2dict", lambda xml: child2dict(etree.fromstring(xml)), xml)
+
+
+if __name__ == '__main__':
+    main()
@@ -12,12 +12,19 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import sys
+from importlib import import_module
 from pyone import bindings
 from six import string_types
 import xmlrpc.client
-import socket
+from contextlib import contextmanager
 
-from .util import cast2one
+from lxml import etree
+
+from .util import cast2one, element2binding, lazy_templates, TrackedTemplate
+from .parsing import project
+from .cache import ResponseCache
+from .transport import OneTransport, OneSafeTransport, PooledTransport, PooledSafeTransport
 
 #
 # Exceptions as defined in the XML-API reference
@@ -39,160 +46,59 @@ class OneInternalException(OneException):
     pass
 
 #
-# Constants, naming follows those in Open Nebula Ruby API
+# Constants, naming follows those in Open Nebula Ruby API, and helpers. They are not needed to make calls and are
+# imported on first use, e.g. pyone.VM_STATE, keeping the import of pyone short for command line tools.
 #
 
-from aenum import IntEnum
-
-DATASTORE_TYPES = IntEnum('DATASTORE_TYPES','IMAGE SYSTEM FILE',start=0)
-DATASTORE_STATES = IntEnum('DATASTORE_STATES','READY DISABLED',start=0)
-
-DISK_TYPES = IntEnum('DISK_TYPES','FILE CD_ROM BLOCK RBD',start=0)
-
-HISTORY_ACTION = IntEnum('HISTORY_ACTION','none migrate live-migrate shutdown shutdown-hard undeploy undeploy-hard hold release stop suspend resume boot delete delete-recreate reboot reboot-hard resched unresched poweroff poweroff-hard disk-attach disk-detach nic-attach nic-detach disk-snapshot-create disk-snapshot-delete terminate terminate-hard disk-resize deploy chown chmod updateconf rename resize update snapshot-resize snapshot-delete snapshot-revert disk-saveas disk-snapshot-revert recover retry monitor',start=0)
-
-HOST_STATES = IntEnum('HOST_STATES','INIT MONITORING_MONITORED MONITORED ERROR DISABLED MONITORING_ERROR MONITORING_INIT MONITORING_DISABLED OFFLINE', start=0)
-HOST_STATUS = IntEnum('HOST_STATUS','ENABLED DISABLED OFFLINE',start=0)
-
-IMAGE_STATES = IntEnum('IMAGE_STATES','INIT READY USED DISABLED LOCKED ERROR CLONE DELETE USED_PERS LOCKED_USED LOCKED_USED_PERS', start=0)
-IMAGE_TYPES = IntEnum('IMAGE_TYPES','OS CDROM DATABLOCK KERNEL RAMDISK CONTEXT', start=0)
-
-LCM_STATE = IntEnum('LCM_STATE','''
-            LCM_INIT
-            PROLOG
-            BOOT
-            RUNNING
-            MIGRATE
-            SAVE_STOP
-            SAVE_SUSPEND
-            SAVE_MIGRATE
-            PROLOG_MIGRATE
-            PROLOG_RESUME
-            EPILOG_STOP
-            EPILOG
-            SHUTDOWN
-            CANCEL
-            FAILURE
-            CLEANUP_RESUBMIT
-            UNKNOWN
-            HOTPLUG
-            SHUTDOWN_POWEROFF
-            BOOT_UNKNOWN
-            BOOT_POWEROFF
-            BOOT_SUSPENDED
-            BOOT_STOPPED
-            CLEANUP_DELETE
-            HOTPLUG_SNAPSHOT
-            HOTPLUG_NIC
-            HOTPLUG_SAVEAS
-            HOTPLUG_SAVEAS_POWEROFF
-            HOTPLUG_SAVEAS_SUSPENDED
-            SHUTDOWN_UNDEPLOY
-            EPILOG_UNDEPLOY
-            PROLOG_UNDEPLOY
-            BOOT_UNDEPLOY
-            HOTPLUG_PROLOG_POWEROFF
-            HOTPLUG_EPILOG_POWEROFF
-            BOOT_MIGRATE
-            BOOT_FAILURE
-            BOOT_MIGRATE_FAILURE
-            PROLOG_MIGRATE_FAILURE
-            PROLOG_FAILURE
-            EPILOG_FAILURE
-            EPILOG_STOP_FAILURE
-            EPILOG_UNDEPLOY_FAILURE
-            PROLOG_MIGRATE_POWEROFF
-            PROLOG_MIGRATE_POWEROFF_FAILURE
-            PROLOG_MIGRATE_SUSPEND
-            PROLOG_MIGRATE_SUSPEND_FAILURE
-            BOOT_UNDEPLOY_FAILURE
-            BOOT_STOPPED_FAILURE
-            PROLOG_RESUME_FAILURE
-            PROLOG_UNDEPLOY_FAILURE
-            DISK_SNAPSHOT_POWEROFF
-            DISK_SNAPSHOT_REVERT_POWEROFF
-            DISK_SNAPSHOT_DELETE_POWEROFF
-            DISK_SNAPSHOT_SUSPENDED
-            DISK_SNAPSHOT_REVERT_SUSPENDED
-            DISK_SNAPSHOT_DELETE_SUSPENDED
-            DISK_SNAPSHOT
-            DISK_SNAPSHOT_REVERT
-            DISK_SNAPSHOT_DELETE
-            PROLOG_MIGRATE_UNKNOWN
-            PROLOG_MIGRATE_UNKNOWN_FAILURE
-            DISK_RESIZE
-            DISK_RESIZE_POWEROFF
-            DISK_RESIZE_UNDEPLOYED''',start=0)
-
-MARKETPLACEAPP_STATES = IntEnum('MARKETPLACEAPP_STATES', 'INIT READY LOCKED ERROR DISABLED', start=0)
-MARKETPLACEAPP_TYPES = IntEnum('MARKETPLACEAPP_TYPES','UNKNOWN IMAGE VMTEMPLATE SERVICE_TEMPLATE', start=0)
-
-PAGINATED_POOLS = IntEnum('PAGINATED_POOLS','VM_POOL IMAGE_POOL TEMPLATE_POOL VN_POOL DOCUMENT_POOL SECGROUP_POOL',start=0)
-
-REMOVE_VNET_ATTRS = IntEnum('REMOVE_VNET_ATTRS','{AR_ID BRIDGE CLUSTER_ID IP MAC TARGET NIC_ID NETWORK_ID VN_MAD SECURITY_GROUPS VLAN_ID',start=0)
-
-VM_STATE = IntEnum('VM_STATE','INIT PENDING HOLD ACTIVE STOPPED SUSPENDED DONE FAILED POWEROFF UNDEPLOYED CLONING CLONING_FAILURE',start=0)
+_CONSTANTS = ("DATASTORE_TYPES", "DATASTORE_STATES", "DISK_TYPES", "HISTORY_ACTION", "HOST_STATES", "HOST_STATUS",
+              "IMAGE_STATES", "IMAGE_TYPES", "LCM_STATE", "MARKETPLACEAPP_STATES", "MARKETPLACEAPP_TYPES",
+              "PAGINATED_POOLS", "REMOVE_VNET_ATTRS", "VM_STATE")
 
+_LAZY_ATTRIBUTES = dict([(name, ".constants") for name in _CONSTANTS] + [
+    ("marketapp_export", ".helpers"), ("update_template", ".helpers"),
+    ("OneBatch", ".batch"), ("bulk", ".batch"),
+    ("iter_pool", ".pools"),
+    ("wait_for", ".waiter"), ("OneWaitTimeout", ".waiter"), ("OneWaitFailure", ".waiter"),
+    ("PoolWatcher", ".watcher"),
+    ("Inventory", ".inventory"),
+    ("AddressIndex", ".addresses"),
+    ("CapacityIndex", ".capacity")])
 
-#
-# Import helper methods after definitions they are likely to refer to.
-#
 
-from .helpers import marketapp_export
+def __getattr__(name):
+    module = _LAZY_ATTRIBUTES.get(name)
+    if module is None:
+        raise AttributeError("module %r has no attribute %r" % (__name__, name))
+    value = getattr(import_module(module, __name__), name)
+    globals()[name] = value
+    return value
+
 
-class OneServer(xmlrpc.client.ServerProxy):
+def __dir__():
+    return sorted(set(globals()).union(_LAZY_ATTRIBUTES))
+
+
+if sys.version_info < (3, 7):
+    # module __getattr__ is not supported, the constants go first as the helpers import them
+    for _name in sorted(_LAZY_ATTRIBUTES, key=lambda name: name not in _CONSTANTS):
+        __getattr__(_name)
+
+class OneServerBase(object):
     """
-    XML-RPC OpenNebula Server
-    Slightly tuned ServerProxy
+    Logic shared by the OpenNebula clients, independent of how requests are transported:
+      - session handling and parameter casting
+      - helper registration
+      - processing of the OpenNebula response
     """
 
-    def __init__(self, uri, session, timeout=None, **options):
-        """
-        Override the constructor to take the authentication or session
-        Will also configure the socket timeout
-        :param uri: OpenNebula endpoint
-        :param session: OpenNebula authentication session
-        :param timeout: Socket timetout
-        :param options: additional options for ServerProxy
-        """
-
+    def __init__(self, session, lazy_templates=False):
         self.__session = session
-        if timeout:
-            # note that this will affect other classes using sockets too.
-            socket.setdefaulttimeout(timeout)
+        self._lazy_templates = lazy_templates
         # register helpers:
-        self.__helpers = {
+        from .helpers import marketapp_export
+        self._helpers = {
             "marketapp.export": marketapp_export
         }
-        xmlrpc.client.ServerProxy.__init__(self, uri, **options)
-
-    #
-    def _ServerProxy__request(self, methodname, params):
-        """
-        Override/patch the (private) request method to:
-          - structured parameters will be casted to attribute=value or XML
-          - automatically prefix all methodnames with "one."
-          - automatically add the authentication info as first parameter
-          - process the response
-
-        :param methodname: XMLRPC method name
-        :param params: XMLRPC parameters
-        :return: opennebula object or XMLRPC returned value
-        """
-
-        # check if this is a helper or a XMLPRC method call
-
-        if methodname in self.__helpers:
-            return self.__helpers[methodname](self, *params)
-        else:
-            ret = self._do_request("one."+methodname,self._cast_parms(params))
-            return self.__response(ret)
-
-    def _do_request(self, method, params):
-        try:
-            return xmlrpc.client.ServerProxy._ServerProxy__request(self, method, params)
-        except xmlrpc.client.Fault as e:
-            raise OneException(str(e))
 
     def _cast_parms(self,params):
         """
@@ -208,21 +114,31 @@ class OneServer(xmlrpc.client.ServerProxy):
         params = (self.__session,) + params
         return params
 
-
     #
     # Process the response from one XML-RPC server
     # will throw exceptions for each error condition
     # will bind returned xml to objects generated from xsd schemas
-    def __response(self, rawResponse):
+    # fields optionally restricts the elements that are bound, see pyone.parsing
+    # raw returns the document as received, unbound
+    def _response(self, rawResponse, fields=None, raw=False):
         sucess = rawResponse[0]
         code = rawResponse[2]
 
         if sucess:
             ret = rawResponse[1]
+            if raw:
+                return ret
             if isinstance(ret, string_types):
                 # detect xml
                 if ret[0] == '<':
-                    return bindings.parseString(ret.encode("utf-8"))
+                    with lazy_templates(self._lazy_templates):
+                        return bindings.parseString(ret.encode("utf-8"), fields=fields)
+            elif isinstance(ret, etree._Element):
+                # already parsed by the transport
+                if fields is not None:
+                    ret = project(ret, fields)
+                with lazy_templates(self._lazy_templates):
+                    return element2binding(ret)
             return ret
 
         else:
@@ -242,13 +158,272 @@ class OneServer(xmlrpc.client.ServerProxy):
             else:
                 raise OneException(message)
 
+    def _request_options(self, methodname, options):
+        """
+        Validates the keyword arguments of a XML-RPC method call
+        :param methodname: XMLRPC method name
+        :param options: keyword arguments
+        :return: the keyword arguments of _response, the projection fields and raw
+        """
+        options = dict(options or {})
+        ret = {"fields": options.pop("fields", None), "raw": options.pop("raw", False)}
+        if options:
+            raise TypeError("%s got unexpected keyword arguments: %s" % (methodname, ", ".join(sorted(options))))
+        return ret
+
     def server_retry_interval(self):
         '''returns the recommended wait time between attempts to check if the opennebula platform has
         reached a desired state, in seconds'''
         return 1
 
+
+class _Method(object):
+    # dotted name dispatch, same as xmlrpc.client._Method but passing keyword arguments along
+    def __init__(self, request, name):
+        self.__request = request
+        self.__name = name
+
+    def __getattr__(self, name):
+        return _Method(self.__request, "%s.%s" % (self.__name, name))
+
+    def __call__(self, *args, **kwargs):
+        return self.__request(self.__name, args, kwargs)
+
+
+class OneServer(OneServerBase, xmlrpc.client.ServerProxy):
+    """
+    XML-RPC OpenNebula Server
+    Slightly tuned ServerProxy
+    """
+
+    def __init__(self, uri, session, timeout=None, pool_size=None, pool_idle_timeout=60,
+                 single_pass_decoding=False, lazy_templates=False, connect_timeout=None, cache=None, **options):
+        """
+        Override the constructor to take the authentication or session
+        Will also configure the transport timeouts
+        :param uri: OpenNebula endpoint
+        :param session: OpenNebula authentication session
+        :param timeout: seconds to wait for the server to answer, and to connect unless connect_timeout is set.
+                        Calls can override it with the _timeout keyword, e.g. one.vmpool.info(..., _timeout=120)
+        :param pool_size: if set, use a thread safe transport keeping up to pool_size persistent connections
+        :param pool_idle_timeout: seconds a pooled connection can stay idle before being closed
+        :param single_pass_decoding: parse returned XML documents while reading the response,
+                                     instead of unmarshalling them to a string first. Implies a pooled transport.
+        :param lazy_templates: build TEMPLATE and USER_TEMPLATE dictionaries when first accessed
+        :param connect_timeout: seconds to wait for a connection to be established
+        :param cache: True, or a ResponseCache, to cache the responses of read only calls such as hostpool.info
+        :param options: additional options for ServerProxy. Timeouts only apply to the transports built
+                        by OneServer, not to one passed as the transport option.
+        """
+
+        OneServerBase.__init__(self, session, lazy_templates)
+        # cleared the first time system.multicall is found not to be supported
+        self._multicall = True
+        self._cache = ResponseCache() if cache is True else (cache or None)
+        if not options.get("transport"):
+            if connect_timeout is None:
+                connect_timeout = timeout
+            options["transport"] = self._transport(uri, pool_size, pool_idle_timeout, single_pass_decoding,
+                                                   connect_timeout, timeout, options)
+        xmlrpc.client.ServerProxy.__init__(self, uri, **options)
+
+    @staticmethod
+    def _transport(uri, pool_size, idle_timeout, single_pass, connect_timeout, read_timeout, options):
+        """
+        Builds the transport matching the uri scheme, pooled if a pool size is given or for single pass decoding.
+        ServerProxy options that configure its default transport are consumed here.
+        """
+        kwargs = {
+            "use_datetime": options.get("use_datetime", False),
+            "use_builtin_types": options.get("use_builtin_types", False),
+            "connect_timeout": connect_timeout,
+            "read_timeout": read_timeout,
+            "headers": options.pop("headers", ())
+        }
+        if uri.lower().startswith("https"):
+            kwargs["context"] = options.pop("context", None)
+        if pool_size or single_pass:
+            cls = PooledSafeTransport if "context" in kwargs else PooledTransport
+            return cls(pool_size or 1, idle_timeout, single_pass=single_pass, **kwargs)
+        else:
+            cls = OneSafeTransport if "context" in kwargs else OneTransport
+            return cls(**kwargs)
+
+    @contextmanager
+    def _call_timeout(self, timeout):
+        """
+        Scopes the timeouts of the calls made by the current thread
+        :param timeout: seconds, bounds both connecting and waiting for the response. None keeps the defaults.
+        """
+        if timeout is None:
+            yield
+            return
+        transport = self._ServerProxy__transport
+        if not isinstance(transport, OneTransport):
+            raise TypeError("Per call timeouts require a OneTransport")
+        connect_timeout = transport.connect_timeout
+        if connect_timeout is None or connect_timeout > timeout:
+            connect_timeout = timeout
+        with transport.timeouts(connect_timeout, timeout):
+            yield
+
+    def server_pool_stats(self):
+        """
+        :return: statistics of the pooled transport connections, or None if the server is not pooled
+        """
+        transport = self._ServerProxy__transport
+        if isinstance(transport, PooledTransport):
+            return transport.stats()
+        return None
+
+    def server_cache_stats(self):
+        """
+        :return: hit, miss, eviction and invalidation counters of the response cache, or None if not caching
+        """
+        if self._cache is None:
+            return None
+        return self._cache.stats()
+
+    def server_cache_invalidate(self, kind=None):
+        """
+        Drops cached responses, e.g. after changes made by other clients
+        :param kind: kind of object, e.g. "host" for host.info and hostpool.info, all responses if None
+        """
+        if self._cache is not None:
+            self._cache.invalidate(kind)
+
+    def batch(self, chunk_size=None):
+        """
+        Returns a context to queue calls that will be sent together in a system.multicall request
+        :param chunk_size: maximum number of calls per request, unlimited by default
+        :return: OneBatch
+        """
+        from .batch import OneBatch
+        return OneBatch(self, chunk_size)
+
+    def bulk(self, methodname, items, concurrency=None, rate=None, progress=None):
+        """
+        Calls a method once per item, in parallel when the server is pooled or concurrency is set,
+        see pyone.batch.bulk
+        :param methodname: XMLRPC method name, e.g. "vm.action"
+        :param items: parameters of each call, e.g. [("poweroff", id) for id in ids]
+        :param concurrency: number of calls in flight, defaults to the pool size
+        :param rate: maximum number of calls started per second
+        :param progress: callable receiving the number of completed calls, the total and the last completed call
+        :return: OneBulkResult holding the result or exception of each call
+        """
+        from .batch import bulk
+        return bulk(self, methodname, items, concurrency, rate, progress)
+
+    def iter_pool(self, pool, filter=-2, page_size=500, prefetch=False, extra=None):
+        """
+        Iterates over the objects of a paginated pool, see PAGINATED_POOLS, fetching them page by page.
+        :param pool: pool name, e.g. "vmpool", or PAGINATED_POOLS constant
+        :param filter: ownership filter flag, -2 for all resources
+        :param page_size: number of objects per request, at least 2
+        :param prefetch: fetch the next page in a background thread
+        :param extra: additional pool.info parameters, e.g. the VM state
+        :return: generator of pool objects
+        """
+        from .pools import iter_pool
+        return iter_pool(self, pool, filter, page_size, prefetch, extra)
+
+    def wait_for(self, kind, ids, state=None, lcm_state=None, timeout=None, **kwargs):
+        """
+        Waits for objects to reach a state, polling them in pool requests with exponential backoff.
+        See pyone.waiter.wait_for for the other options.
+        :param kind: vm, image, host or marketapp
+        :param ids: object ID or list of IDs
+        :param state: expected STATE, or list of accepted states
+        :param lcm_state: expected LCM_STATE of VMs, or list of accepted states
+        :param timeout: seconds to wait before raising OneWaitTimeout, None to wait forever
+        :return: the objects as last polled
+        """
+        from .waiter import wait_for
+        return wait_for(self, kind, ids, state, lcm_state, timeout, **kwargs)
+
+    def pool_watcher(self, pool="vmpool", filter=-2, signature=None, extended=False):
+        """
+        Returns a PoolWatcher reporting the objects added, changed and removed between polls of a pool
+        :param pool: pool method namespace, e.g. "vmpool"
+        :param filter: ownership filter flag, -2 for all resources
+        :param signature: elements compared to detect changes, defaults to those of the pool
+        :param extended: poll the signatures only and request the changed objects with infoextended
+        :return: PoolWatcher
+        """
+        from .watcher import PoolWatcher
+        return PoolWatcher(self, pool, filter, signature, extended)
+
+    def update_template(self, method, id, template):
+        """
+        Sends the changes of a TrackedTemplate, merging the changed attributes, see pyone.helpers.update_template
+        :param method: update method, e.g. "vm.update"
+        :param id: object ID
+        :param template: TrackedTemplate
+        :return: the result of the call, None if nothing changed
+        """
+        from .helpers import update_template
+        return update_template(self, method, id, template)
+
+    def __getattr__(self, name):
+        # XML-RPC method namespaces, calls may take keyword arguments such as fields
+        return _Method(self._ServerProxy__request, name)
+
+    #
+    def _ServerProxy__request(self, methodname, params, options=None):
+        """
+        Override/patch the (private) request method to:
+          - structured parameters will be casted to attribute=value or XML
+          - automatically prefix all methodnames with "one."
+          - automatically add the authentication info as first parameter
+          - process the response
+
+        :param methodname: XMLRPC method name
+        :param params: XMLRPC parameters
+        :param options: keyword arguments, passed to helpers. Methods accept fields, the projection
+                        of the returned document, e.g. one.vmpool.info(-2, -1, -1, -1, fields=['ID', 'STATE']),
+                        and raw, to get the XML document, or the parsed element with single_pass_decoding,
+                        instead of the bindings.
+                        Both accept _timeout, the timeout in seconds for this call.
+        :return: opennebula object or XMLRPC returned value
+        """
+
+        options = dict(options or {})
+        with self._call_timeout(options.pop("_timeout", None)):
+
+            # check if this is a helper or a XMLPRC method call
+
+            if methodname in self._helpers:
+                return self._helpers[methodname](self, *params, **options)
+            else:
+                options = self._request_options(methodname, options)
+                params = self._cast_parms(params)
+                ret = self._cached_request(methodname, params)
+                return self._response(ret, **options)
+
+    def _cached_request(self, methodname, params):
+        cache = self._cache
+        if cache is None:
+            return self._do_request("one."+methodname, params)
+        ret = cache.get(methodname, params)
+        if ret is None:
+            try:
+                ret = self._do_request("one."+methodname, params)
+            finally:
+                # failed calls can still have changed objects
+                cache.put(methodname, params, ret)
+        return ret
+
+    def _do_request(self, method, params):
+        try:
+            return xmlrpc.client.ServerProxy._ServerProxy__request(self, method, params)
+        except xmlrpc.client.Fault as e:
+            raise OneException(str(e))
+
     def server_close(self):
-        pass
+        transport = self._ServerProxy__transport
+        if isinstance(transport, PooledTransport):
+            transport.close()
 
 
 
@@ -0,0 +1,249 @@
+# Copyright 2018 www.privaz.io Valletech AB
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+# Streaming aggregation of accounting documents (acct.xsd), as returned by vmpool.accounting.
+
+import array
+import time
+from collections import OrderedDict
+from io import BytesIO
+from lxml import etree
+from six import PY2, text_type
+from .util import INT64_TYPECODE
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+# grouping keys and where they are read from, the VM owner is the one accounted
+GROUP_KEYS = ("UID", "GID", "HID", "HOSTNAME", "VM")
+
+# aggregated values: CPU-hours, memory and disk MB-hours, running hours and number of records,
+# records are counted in the first window they overlap
+USAGE = ("CPU_HOURS", "MEMORY_HOURS", "DISK_HOURS", "HOURS", "RECORDS")
+
+# HISTORY children read
+RECORD_ELEMENTS = ("OID", "HID", "HOSTNAME", "STIME", "ETIME", "RSTIME", "RETIME", "VM")
+
+
+def _overlap(start, end, window_start, window_end):
+    if window_start is not None and window_start > start:
+        start = window_start
+    if window_end is not None and window_end < end:
+        end = window_end
+    return start, end
+
+
+def _number(text):
+    try:
+        return float(text)
+    except (TypeError, ValueError):
+        return 0.0
+
+
+class AccountingAggregator(object):
+    '''
+    Sums the usage of accounting records per group, e.g. per user, reading the HISTORY elements
+    one at a time and releasing them, without building bindings:
+
+        aggregator = AccountingAggregator(by=("UID",), start=month_start, end=month_end)
+        aggregator.add(one.vmpool.accounting(-2, month_start, month_end, raw=True))
+        aggregator.results()
+
+    CPU and memory are accounted while the VM was running in the host (RSTIME to RETIME),
+    disks for the whole record (STIME to ETIME). Records still open are accounted until now.
+    '''
+
+    def __init__(self, by=("UID",), start=None, end=None, window=None, now=None):
+        '''
+        :param by: grouping keys, any of UID, GID, HID, HOSTNAME and VM. The VM owner UID and GID are used.
+        :param start: start of the accounted period, in seconds since the epoch, None for no limit
+        :param end: end of the accounted period, None for no limit
+        :param window: split the usage in windows of this many seconds, aligned to the epoch,
+                       the start of the window is then the last grouping key
+        :param now: end of the records still open, defaults to the current time
+        '''
+        unknown = [key for key in by if key not in GROUP_KEYS]
+        if unknown:
+            raise ValueError("Unknown grouping keys: %s" % ", ".join(unknown))
+        self.by = tuple(by)
+        self.start = start
+        self.end = end
+        self.window = window
+        self.now = now
+        # group key: [CPU_HOURS, MEMORY_HOURS, DISK_HOURS, HOURS, RECORDS]
+        self._totals = {}
+
+    def add(self, source):
+        '''
+        Adds the records of an accounting document
+        :param source: document as text or bytes, file name or file object, or parsed element
+        :return: number of records read
+        '''
+        count = 0
+        if isinstance(source, etree._Element):
+            for record in source.iterchildren("{*}HISTORY"):
+                self._add(record)
+                count += 1
+            return count
+
+        if isinstance(source, text_type) and source.lstrip().startswith(u"<"):
+            source = source.encode("utf-8")
+        if isinstance(source, bytes) and (not PY2 or source.lstrip().startswith(b"<")):
+            # file names are bytes too in Python 2
+            source = BytesIO(source)
+        for _, record in etree.iterparse(source, events=("end",), tag="{*}HISTORY"):
+            parent = record.getparent()
+            if parent is None or parent.getparent() is not None:
+                # history of the VM inside a record
+                continue
+            self._add(record)
+            count += 1
+            # release the record and anything before it
+            record.clear()
+            while record.getprevious() is not None:
+                del parent[0]
+        return count
+
+    def _add(self, record):
+        # lxml filters the children, with the exact namespace of the document if any
+        ns = record.tag[:record.tag.index("}") + 1] if record.tag.startswith("{") else ""
+        values = {}
+        vm = None
+        for child in record.iterchildren(*[ns + tag for tag in RECORD_ELEMENTS]):
+            if child.tag == ns + "VM":
+                vm = child
+            else:
+                values[child.tag[len(ns):]] = child.text
+        cpu = memory = disk = 0.0
+        uid = gid = None
+        if vm is not None:
+            for child in vm.iterchildren(ns + "UID", ns + "GID", ns + "TEMPLATE"):
+                tag = child.tag[len(ns):]
+                if tag == "UID":
+                    uid = child.text
+                elif tag == "GID":
+                    gid = child.text
+                else:
+                    for attribute in child.iterchildren(ns + "CPU", ns + "MEMORY", ns + "DISK"):
+                        tag = attribute.tag[len(ns):]
+                        if tag == "CPU":
+                            cpu = _number(attribute.text)
+                        elif tag == "MEMORY":
+                            memory = _number(attribute.text)
+                        else:
+                            disk += sum(_number(size.text) for size in attribute.iterchildren(ns + "SIZE"))
+
+        keys = {"UID": uid, "GID": gid, "HID": values.get("HID"), "HOSTNAME": values.get("HOSTNAME"),
+                "VM": values.get("OID")}
+        group = tuple(int(keys[key]) if keys[key] is not None and key != "HOSTNAME" else keys[key]
+                      for key in self.by)
+
+        now = self.now if self.now is not None else int(time.time())
+        running = self._interval(values.get("RSTIME"), values.get("RETIME"), now)
+        existing = self._interval(values.get("STIME"), values.get("ETIME"), now)
+        counted = False
+        for window, seconds in self._split(*running):
+            hours = seconds / 3600.0
+            totals = self._group(group, window)
+            totals[0] += cpu * hours
+            totals[1] += memory * hours
+            totals[3] += hours
+            if not counted:
+                totals[4] += 1
+                counted = True
+        for window, seconds in self._split(*existing):
+            totals = self._group(group, window)
+            totals[2] += disk * seconds / 3600.0
+            if not counted:
+                totals[4] += 1
+                counted = True
+
+    @staticmethod
+    def _interval(start, end, now):
+        start = int(start or 0)
+        end = int(end or 0)
+        if not start:
+            return 0, 0
+        # records still open have no end time
+        return start, end or now
+
+    def _group(self, group, window):
+        key = group + (window,) if self.window else group
+        totals = self._totals.get(key)
+        if totals is None:
+            totals = self._totals[key] = [0.0, 0.0, 0.0, 0.0, 0]
+        return totals
+
+    def _split(self, start, end):
+        # seconds of the interval in each window of the accounted period
+        start, end = _overlap(start, end, self.start, self.end)
+        if end <= start:
+            return
+        if not self.window:
+            yield None, end - start
+            return
+        window = start - start % self.window
+        while window < end:
+            following = window + self.window
+            yield window, min(end, following) - max(start, window)
+            window = following
+
+    def results(self):
+        '''
+        :return: dictionary with a dictionary of USAGE values per group key tuple, the keys listed in by,
+                 followed by the start of the window when windowed
+        '''
+        return dict((key, dict(zip(USAGE, totals))) for key, totals in self._totals.items())
+
+    def columns(self):
+        '''
+        :return: ordered dictionary of arrays, a column per grouping key and per USAGE value, a row per group.
+                 NumPy arrays if NumPy is installed, array.array otherwise. HOSTNAME is kept as a list.
+        '''
+        keys = sorted(self._totals, key=lambda key: tuple((value is None, value) for value in key))
+        names = list(self.by) + (["WINDOW"] if self.window else [])
+        ret = OrderedDict()
+        for i, name in enumerate(names):
+            values = [key[i] for key in keys]
+            if name == "HOSTNAME":
+                ret[name] = values
+            else:
+                ret[name] = self._array(INT64_TYPECODE, [-1 if value is None else value for value in values])
+        for i, name in enumerate(USAGE):
+            ret[name] = self._array(INT64_TYPECODE if name == "RECORDS" else "d",
+                                    [self._totals[key][i] for key in keys])
+        return ret
+
+    @staticmethod
+    def _array(code, values):
+        if numpy is not None:
+            return numpy.array(values, dtype=numpy.float64 if code == "d" else numpy.int64)
+        return array.array(code, values)
+
+
+def aggregate_accounting(source, by=("UID",), start=None, end=None, window=None, now=None):
+    '''
+    Aggregates an accounting document, see AccountingAggregator
+    :param source: document as text or bytes, file name or file object, parsed element, or a list of those
+    :return: dictionary with the usage per group
+    '''
+    aggregator = AccountingAggregator(by, start, end, window, now)
+    if isinstance(source, (list, tuple)):
+        for document in source:
+            aggregator.add(document)
+    else:
+        aggregator.add(source)
+    return aggregator.results()
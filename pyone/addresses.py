@@ -0,0 +1,303 @@
+# Copyright 2018 www.privaz.io Valletech AB
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+# Index of the address ranges and leases of virtual networks (vnet.xsd).
+
+import socket
+import struct
+import threading
+from bisect import bisect_left, bisect_right
+from collections import namedtuple
+from . import OneException
+
+# an address of a network, vm and vrouter are None for free addresses and vm is -1 for held ones
+Address = namedtuple("Address", ["vnet", "ar", "ip", "mac", "vm", "vrouter"])
+
+# lease elements holding IPv6 addresses
+IP6_ELEMENTS = ("IP6", "IP6_GLOBAL", "IP6_ULA", "IP6_LINK")
+
+
+def _packed(ip):
+    # binary form of an IPv4 or IPv6 address, as the key of the leases
+    try:
+        return socket.inet_pton(socket.AF_INET6 if ":" in ip else socket.AF_INET, ip)
+    except (socket.error, ValueError):
+        raise OneException("Invalid IP address: %s" % ip)
+
+
+def _ip4(ip):
+    return struct.unpack("!I", _packed(ip))[0]
+
+
+def _ip4_text(number):
+    return socket.inet_ntoa(struct.pack("!I", number))
+
+
+def _mac(mac):
+    try:
+        return int(mac.replace(":", ""), 16)
+    except (AttributeError, ValueError):
+        raise OneException("Invalid MAC address: %s" % mac)
+
+
+def _mac_text(number):
+    text = "%012x" % number
+    return ":".join(text[i:i + 2] for i in range(0, 12, 2))
+
+
+def _int(value):
+    return None if value is None or value == "" else int(value)
+
+
+class _Range(object):
+    # an address range of a network, addresses are numbered by their offset from the first one
+    __slots__ = ("vnet", "ar", "ip", "mac", "size", "leases", "free")
+
+    def __init__(self, vnet, ar):
+        self.vnet = vnet
+        self.ar = int(ar.AR_ID)
+        self.ip = _ip4(ar.IP) if ar.IP else None
+        self.mac = _mac(ar.MAC)
+        self.size = int(ar.SIZE)
+        # offset: Address of the leased addresses, None when the network came from a pool, without leases
+        self.leases = None
+        # sorted (first, last) offsets of the runs of free addresses, built with the leases
+        self.free = None
+
+    def index_free(self):
+        self.free = []
+        start = 0
+        for offset in sorted(self.leases):
+            if offset > start:
+                self.free.append((start, offset - 1))
+            start = offset + 1
+        if start < self.size:
+            self.free.append((start, self.size - 1))
+
+    def address(self, offset, vm=None, vrouter=None):
+        ip = _ip4_text(self.ip + offset) if self.ip is not None else None
+        return Address(self.vnet, self.ar, ip, _mac_text(self.mac + offset), vm, vrouter)
+
+
+class _Intervals(object):
+    # address ranges split at their bounds into disjoint segments, each with the ranges covering it
+    # by network and range ID, so that a lookup is a binary search however the ranges are nested
+    def __init__(self, intervals):
+        self.starts = sorted(set([start for start, _, _ in intervals] + [end + 1 for _, end, _ in intervals]))
+        segments = [[] for _ in self.starts]
+        for start, end, address_range in intervals:
+            for i in range(bisect_left(self.starts, start), bisect_left(self.starts, end + 1)):
+                segments[i].append(address_range)
+        self.ranges = [sorted(ranges, key=lambda ar: (ar.vnet, ar.ar)) for ranges in segments]
+
+    def find(self, address):
+        i = bisect_right(self.starts, address) - 1
+        return self.ranges[i] if i >= 0 else []
+
+
+class AddressIndex(object):
+    '''
+    Index of the address ranges of virtual networks and of their leases, fed from vn.info responses.
+    Answers which VM or virtual router holds an address in constant time, the range of a free address
+    in logarithmic time, and lists n free addresses in O(n), skipping the leased ones:
+
+        index = AddressIndex()
+        index.update(one.vn.info(vnet_id))
+        index.lookup_ip("10.0.0.12").vm
+        index.free_addresses(vnet_id, 4)
+
+    Pool responses, e.g. vnpool.info, do not include the leases: their ranges are indexed,
+    but free_addresses requires the vn.info of the network. Ranges are looked up by IPv4 and MAC address,
+    IPv6 addresses only for the leases. The index is thread safe.
+    '''
+
+    def __init__(self):
+        self._lock = threading.RLock()
+        # vnet ID: list of _Range
+        self._vnets = {}
+        # packed IP or MAC number: {vnet ID: Address}
+        self._ips = {}
+        self._macs = {}
+        # vnet ID: list of (leases, key), to remove its leases
+        self._keys = {}
+        # _Intervals over the IPv4 and MAC ranges, rebuilt on the first lookup after a change
+        self._ip_ranges = None
+        self._mac_ranges = None
+
+    def update(self, response):
+        '''
+        Adds or replaces networks
+        :param response: a network as returned by vn.info, a pool as returned by vnpool.info,
+                         or an iterable of networks
+        :return: number of networks updated
+        '''
+        from pyone.bindings import supermod
+        if isinstance(response, supermod.VNET_POOL):
+            vnets = response.VNET or []
+        elif isinstance(response, supermod.VNET):
+            vnets = [response]
+        else:
+            vnets = response
+
+        count = 0
+        with self._lock:
+            for vnet in vnets:
+                self._remove(vnet.ID)
+                self._add(vnet)
+                count += 1
+            self._ip_ranges = self._mac_ranges = None
+        return count
+
+    def remove(self, vnet):
+        '''
+        Removes a network, e.g. after deleting it
+        :param vnet: network ID
+        :return: True if the network was indexed
+        '''
+        with self._lock:
+            removed = self._remove(vnet)
+            self._ip_ranges = self._mac_ranges = None
+            return removed
+
+    def _add(self, vnet):
+        ranges = []
+        keys = self._keys[vnet.ID] = []
+        ars = vnet.AR_POOL.AR if vnet.AR_POOL is not None else []
+        for ar in ars or []:
+            address_range = _Range(vnet.ID, ar)
+            ranges.append(address_range)
+            if not hasattr(ar, "LEASES"):
+                # the pool element of the range has no leases
+                continue
+            address_range.leases = {}
+            leases = ar.LEASES.LEASE if ar.LEASES is not None else []
+            for lease in leases or []:
+                self._lease(address_range, lease, keys)
+            address_range.index_free()
+        self._vnets[vnet.ID] = ranges
+
+    def _lease(self, address_range, lease, keys):
+        mac = _mac(lease.MAC)
+        address = Address(address_range.vnet, address_range.ar, lease.IP, lease.MAC,
+                          _int(lease.VM), _int(lease.VROUTER))
+        offset = mac - address_range.mac
+        if 0 <= offset < address_range.size:
+            address_range.leases[offset] = address
+        self._macs.setdefault(mac, {})[address.vnet] = address
+        keys.append((self._macs, mac))
+        for ip in [lease.IP] + [getattr(lease, element, None) for element in IP6_ELEMENTS]:
+            if ip:
+                key = _packed(ip)
+                self._ips.setdefault(key, {})[address.vnet] = address
+                keys.append((self._ips, key))
+
+    def _remove(self, vnet):
+        if self._vnets.pop(vnet, None) is None:
+            return False
+        for leases, key in self._keys.pop(vnet):
+            entries = leases.get(key)
+            if entries is not None:
+                entries.pop(vnet, None)
+                if not entries:
+                    del leases[key]
+        return True
+
+    def _intervals(self):
+        if self._ip_ranges is None:
+            ips = []
+            macs = []
+            for ranges in self._vnets.values():
+                for address_range in ranges:
+                    if address_range.ip is not None:
+                        ips.append((address_range.ip, address_range.ip + address_range.size - 1, address_range))
+                    macs.append((address_range.mac, address_range.mac + address_range.size - 1, address_range))
+            self._mac_ranges = _Intervals(macs)
+            self._ip_ranges = _Intervals(ips)
+        return self._ip_ranges, self._mac_ranges
+
+    @staticmethod
+    def _choose(entries, vnet):
+        if vnet is not None:
+            return entries.get(vnet)
+        return entries[min(entries)] if entries else None
+
+    def _lookup(self, leases, key, number, intervals, vnet):
+        with self._lock:
+            address = self._choose(leases.get(key, {}), vnet)
+            if address is not None or number is None:
+                return address
+            ranges = intervals()
+            ar = next((ar for ar in ranges.find(number) if vnet is None or ar.vnet == vnet), None)
+            if ar is None:
+                return None
+            return ar.address(number - (ar.ip if ranges is self._ip_ranges else ar.mac))
+
+    def lookup_ip(self, ip, vnet=None):
+        '''
+        Looks up an IP address
+        :param ip: IPv4 or IPv6 address
+        :param vnet: network ID, None looks in all the networks, the lowest ID first
+        :return: the Address, with the VM or virtual router holding it, or None if no range includes it
+        '''
+        key = _packed(ip)
+        number = struct.unpack("!I", key)[0] if len(key) == 4 else None
+        return self._lookup(self._ips, key, number, lambda: self._intervals()[0], vnet)
+
+    def lookup_mac(self, mac, vnet=None):
+        '''
+        Looks up a MAC address
+        :param mac: MAC address, e.g. 02:00:0a:00:00:01
+        :param vnet: network ID, None looks in all the networks, the lowest ID first
+        :return: the Address, with the VM or virtual router holding it, or None if no range includes it
+        '''
+        number = _mac(mac)
+        return self._lookup(self._macs, number, number, lambda: self._intervals()[1], vnet)
+
+    def free_addresses(self, vnet, n=1, ar=None):
+        '''
+        Lists free addresses of a network, in range and address order
+        :param vnet: network ID
+        :param n: maximum number of addresses
+        :param ar: address range ID, None for all the ranges
+        :return: list of Address, with no VM nor virtual router
+        '''
+        with self._lock:
+            ranges = self._vnets.get(vnet)
+            if ranges is None:
+                raise OneException("Network %s is not indexed" % vnet)
+            free = []
+            for address_range in ranges:
+                if ar is not None and address_range.ar != ar:
+                    continue
+                if address_range.leases is None:
+                    raise OneException("Leases of network %s are unknown, index its vn.info" % vnet)
+                # each run holds at least one address, at most n + 1 runs are visited
+                for first, last in address_range.free:
+                    for offset in range(first, min(last + 1, first + n - len(free))):
+                        free.append(address_range.address(offset))
+                    if len(free) >= n:
+                        return free
+            return free
+
+    def leases(self, vnet):
+        '''
+        :return: list of the leased Address of a network, by range and address
+        '''
+        with self._lock:
+            ranges = self._vnets.get(vnet) or []
+            return [address_range.leases[offset] for address_range in ranges
+                    for offset in sorted(address_range.leases or {})]
+
+    def __len__(self):
+        return len(self._vnets)
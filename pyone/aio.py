@@ -0,0 +1,289 @@
+# Copyright 2018 www.privaz.io Valletech AB
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+# asyncio based OpenNebula client, requires Python 3.5 or newer.
+# This module is not imported by pyone itself.
+
+import asyncio
+import gzip
+import ssl
+import xmlrpc.client
+from urllib.parse import urlsplit
+
+from . import OneServerBase, OneException
+
+# the loop of the running coroutine, get_event_loop before Python 3.7
+_get_running_loop = getattr(asyncio, "get_running_loop", asyncio.get_event_loop)
+
+
+class AsyncTransport(object):
+    '''
+    Non blocking HTTP/1.1 transport for XML-RPC requests.
+    Keeps a pool of persistent connections and limits the number of requests in flight.
+    '''
+
+    def __init__(self, uri, max_concurrency=32, context=None, timeout=None, use_builtin_types=False):
+        '''
+        :param uri: XML-RPC endpoint
+        :param max_concurrency: maximum number of requests in flight, and of open connections
+        :param context: SSL context for https endpoints
+        :param timeout: seconds to wait for a complete response
+        '''
+        p = urlsplit(uri)
+        if p.scheme not in ("http", "https"):
+            raise OSError("unsupported XML-RPC protocol")
+        self.host = p.hostname
+        self.port = p.port or (443 if p.scheme == "https" else 80)
+        self.netloc = p.netloc
+        self.handler = p.path or "/RPC2"
+        if p.query:
+            self.handler += "?" + p.query
+        if p.scheme == "https":
+            self.ssl = context or ssl.create_default_context()
+        else:
+            self.ssl = None
+        self.timeout = timeout
+        self.use_builtin_types = use_builtin_types
+        self.max_concurrency = max_concurrency
+        self._semaphore = None
+        self._idle = []
+
+    def _get_semaphore(self):
+        # created lazily so that it binds to the running loop
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+        return self._semaphore
+
+    async def request(self, method, params, timeout=None):
+        '''
+        Sends an XML-RPC request
+        :param method: full XML-RPC method name
+        :param params: tuple of already casted parameters
+        :param timeout: overrides the transport timeout for this request
+        :return: unmarshalled response
+        '''
+        body = xmlrpc.client.dumps(params, method, encoding="utf-8", allow_none=True).encode("utf-8", "xmlcharrefreplace")
+        timeout = timeout or self.timeout
+
+        async with self._get_semaphore():
+            if timeout:
+                data = await asyncio.wait_for(self._exchange(body), timeout)
+            else:
+                data = await self._exchange(body)
+
+        response, _ = xmlrpc.client.loads(data, use_builtin_types=self.use_builtin_types)
+        if len(response) == 1:
+            response = response[0]
+        return response
+
+    async def _exchange(self, body):
+        # a pooled connection may have been closed by the server, retry once on a new one
+        for attempt in (0, 1):
+            reused = bool(self._idle)
+            reader, writer = await self._acquire()
+            try:
+                ret, keep_alive = await self._roundtrip(reader, writer, body)
+            except (ConnectionError, asyncio.IncompleteReadError):
+                writer.close()
+                if attempt or not reused:
+                    raise
+                continue
+            except BaseException:
+                writer.close()
+                raise
+            if keep_alive:
+                self._idle.append((reader, writer))
+            else:
+                writer.close()
+            return ret
+
+    async def _acquire(self):
+        while self._idle:
+            reader, writer = self._idle.pop()
+            if not reader.at_eof() and not writer.is_closing():
+                return reader, writer
+            writer.close()
+        return await asyncio.open_connection(self.host, self.port, ssl=self.ssl)
+
+    async def _roundtrip(self, reader, writer, body):
+        headers = ("POST %s HTTP/1.1\r\n"
+                   "Host: %s\r\n"
+                   "User-Agent: %s\r\n"
+                   "Content-Type: text/xml\r\n"
+                   "Accept-Encoding: gzip\r\n"
+                   "Content-Length: %d\r\n"
+                   "\r\n") % (self.handler, self.netloc, xmlrpc.client.Transport.user_agent, len(body))
+        writer.write(headers.encode("latin-1") + body)
+        await writer.drain()
+
+        status_line = await reader.readline()
+        if not status_line:
+            raise ConnectionResetError("connection closed by server")
+        version, status, reason = (status_line.decode("latin-1").rstrip("\r\n").split(" ", 2) + [""])[:3]
+        status = int(status)
+
+        response_headers = {}
+        while True:
+            line = await reader.readline()
+            if line in (b"\r\n", b"\n", b""):
+                break
+            key, _, value = line.decode("latin-1").partition(":")
+            response_headers[key.strip().lower()] = value.strip()
+
+        if response_headers.get("transfer-encoding", "").lower() == "chunked":
+            data = await self._read_chunked(reader)
+        elif "content-length" in response_headers:
+            data = await reader.readexactly(int(response_headers["content-length"]))
+        else:
+            data = await reader.read()
+            response_headers["connection"] = "close"
+
+        keep_alive = response_headers.get("connection", "").lower() != "close" and version != "HTTP/1.0"
+
+        if status != 200:
+            raise xmlrpc.client.ProtocolError(self.netloc + self.handler, status, reason, response_headers)
+
+        if response_headers.get("content-encoding", "") == "gzip":
+            data = gzip.decompress(data)
+
+        return data, keep_alive
+
+    @staticmethod
+    async def _read_chunked(reader):
+        chunks = []
+        while True:
+            size = int((await reader.readline()).split(b";")[0], 16)
+            if size == 0:
+                # skip trailers
+                while (await reader.readline()) not in (b"\r\n", b"\n", b""):
+                    pass
+                return b"".join(chunks)
+            chunks.append(await reader.readexactly(size))
+            await reader.readline()
+
+    def close(self):
+        while self._idle:
+            reader, writer = self._idle.pop()
+            writer.close()
+
+
+class _AsyncMethod(object):
+    # dotted name dispatch, same as xmlrpc.client._Method but returning coroutines
+    def __init__(self, request, name):
+        self.__request = request
+        self.__name = name
+
+    def __getattr__(self, name):
+        return _AsyncMethod(self.__request, "%s.%s" % (self.__name, name))
+
+    def __call__(self, *args, **kwargs):
+        return self.__request(self.__name, args, kwargs)
+
+
+class _BlockingFacade(object):
+    '''
+    Presents an AsyncOneServer with the blocking OneServer interface to code running in a worker thread.
+    Calls are scheduled on the event loop of the server and the thread waits for the result.
+    This is how the (synchronous) helpers are reused by the asyncio client.
+    '''
+
+    def __init__(self, server, loop, name=None):
+        self.__server = server
+        self.__loop = loop
+        self.__name = name
+
+    def __getattr__(self, name):
+        if self.__name:
+            name = "%s.%s" % (self.__name, name)
+        return _BlockingFacade(self.__server, self.__loop, name)
+
+    def __call__(self, *args, **kwargs):
+        coro = self.__server._request(self.__name, args, kwargs)
+        return asyncio.run_coroutine_threadsafe(coro, self.__loop).result()
+
+    def server_retry_interval(self):
+        return self.__server.server_retry_interval()
+
+
+class AsyncOneServer(OneServerBase):
+    '''
+    asyncio OpenNebula client, methods are called as in OneServer but return coroutines:
+
+        one = AsyncOneServer(uri, session)
+        vm = await one.vm.info(1)
+    '''
+
+    def __init__(self, uri, session, timeout=None, max_concurrency=32, context=None, transport=None,
+                 lazy_templates=False):
+        '''
+        :param uri: OpenNebula endpoint
+        :param session: OpenNebula authentication session
+        :param timeout: seconds to wait for each call to complete, calls can override it with the _timeout keyword
+        :param max_concurrency: maximum number of calls in flight
+        :param context: SSL context for https endpoints
+        :param transport: alternative transport, must provide request(method, params) and close(),
+                          and accept a timeout keyword for calls using _timeout
+        :param lazy_templates: build TEMPLATE and USER_TEMPLATE dictionaries when first accessed
+        '''
+        OneServerBase.__init__(self, session, lazy_templates)
+        self._transport = transport or AsyncTransport(uri, max_concurrency=max_concurrency,
+                                                      context=context, timeout=timeout)
+
+    def __getattr__(self, name):
+        # only invoked for non existing attributes, those are treated as XML-RPC method namespaces
+        if name.startswith("_"):
+            raise AttributeError(name)
+        return _AsyncMethod(self._request, name)
+
+    async def _request(self, methodname, params, options=None):
+        '''
+        Asynchronous version of OneServer._ServerProxy__request
+        :param methodname: XMLRPC method name
+        :param params: XMLRPC parameters
+        :param options: keyword arguments, see OneServer._ServerProxy__request
+        :return: opennebula object or XMLRPC returned value
+        '''
+        options = dict(options or {})
+        timeout = options.pop("_timeout", None)
+        if methodname in self._helpers:
+            call = self._helper(methodname, params, options)
+            return await (call if timeout is None else asyncio.wait_for(call, timeout))
+        else:
+            options = self._request_options(methodname, options)
+            ret = await self._do_request("one." + methodname, self._cast_parms(params), timeout)
+            return self._response(ret, **options)
+
+    async def _helper(self, methodname, params, options):
+        # helpers are plain functions written against the blocking API, run them in a worker thread
+        loop = _get_running_loop()
+        facade = _BlockingFacade(self, loop)
+        helper = self._helpers[methodname]
+        return await loop.run_in_executor(None, lambda: helper(facade, *params, **options))
+
+    async def _do_request(self, method, params, timeout=None):
+        # custom transports are only required to support timeouts if they are used
+        kwargs = {"timeout": timeout} if timeout is not None else {}
+        try:
+            return await self._transport.request(method, params, **kwargs)
+        except xmlrpc.client.Fault as e:
+            raise OneException(str(e))
+
+    async def server_close(self):
+        self._transport.close()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self.server_close()
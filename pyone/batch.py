@@ -0,0 +1,304 @@
+# Copyright 2018 www.privaz.io Valletech AB
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import re
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from six.moves import queue
+from . import OneException
+from .transport import OneTransport, PooledTransport
+
+# threads sending the calls of a batch one by one when the server transport is not pooled
+FALLBACK_WORKERS = 4
+
+# faults of servers that do not implement system.multicall: xmlrpc-c, the XML-RPC specification
+# and Python's SimpleXMLRPCServer, which reports the method as not supported
+_UNSUPPORTED = re.compile(r"<Fault (-506|-32601):|method .* not (supported|found|defined)|(no such|unknown) method",
+                          re.IGNORECASE)
+
+
+class OneBatchCall(object):
+    '''
+    A call queued in a batch. Holds its outcome once the batch has been executed.
+    '''
+
+    def __init__(self, methodname, params):
+        self.methodname = methodname
+        self.params = params
+        self.done = False
+        self._result = None
+        self._exception = None
+
+    def set_result(self, result):
+        self._result = result
+        self.done = True
+
+    def set_exception(self, exception):
+        self._exception = exception
+        self.done = True
+
+    def exception(self):
+        '''
+        :return: the exception raised by the call, or None if it succeeded
+        '''
+        self._check_done()
+        return self._exception
+
+    def result(self):
+        '''
+        :return: the value returned by the call, its exception is raised if it failed
+        '''
+        self._check_done()
+        if self._exception is not None:
+            raise self._exception
+        return self._result
+
+    def _check_done(self):
+        if not self.done:
+            raise OneException("Batch has not been executed yet")
+
+
+class _BatchMethod(object):
+    # dotted name dispatch, same as xmlrpc.client._Method but queueing the call
+    def __init__(self, batch, name):
+        self.__batch = batch
+        self.__name = name
+
+    def __getattr__(self, name):
+        return _BatchMethod(self.__batch, "%s.%s" % (self.__name, name))
+
+    def __call__(self, *args):
+        return self.__batch.add(self.__name, args)
+
+
+class RateLimiter(object):
+    '''
+    Spaces calls evenly so that no more than rate calls per second are started, shared by threads.
+    '''
+
+    def __init__(self, rate):
+        '''
+        :param rate: calls per second
+        '''
+        if rate <= 0:
+            raise ValueError("Rate must be positive")
+        self.interval = 1.0 / rate
+        self._next = 0
+        self._lock = threading.Lock()
+
+    def wait(self):
+        with self._lock:
+            now = time.time()
+            start = max(self._next, now)
+            self._next = start + self.interval
+        if start > now:
+            time.sleep(start - now)
+
+
+def fan_out(one, calls, max_workers=None, rate=None, progress=None):
+    '''
+    Executes OneBatchCalls as individual requests, in parallel over a pooled transport.
+    Other transports send them sequentially, unless max_workers is set: each thread then
+    opens a connection of its own.
+    :param one: the XMLRPC server
+    :param calls: list of OneBatchCall
+    :param max_workers: number of threads, defaults to the size of the connection pool
+    :param rate: maximum number of calls started per second
+    :param progress: callable receiving the number of completed calls, the total and the last completed call.
+                     Invoked from the worker threads, one at a time.
+    '''
+
+    limiter = RateLimiter(rate) if rate else None
+    lock = threading.Lock()
+    completed = [0]
+
+    def execute(call):
+        if limiter:
+            limiter.wait()
+        try:
+            call.set_result(one._ServerProxy__request(call.methodname, call.params))
+        except Exception as e:
+            call.set_exception(e)
+        if progress:
+            with lock:
+                completed[0] += 1
+                progress(completed[0], len(calls), call)
+
+    transport = one._ServerProxy__transport
+    pending = queue.Queue()
+    for call in calls:
+        pending.put(call)
+
+    def worker():
+        with transport.own_connection():
+            while True:
+                try:
+                    call = pending.get_nowait()
+                except queue.Empty:
+                    return
+                execute(call)
+
+    if isinstance(transport, PooledTransport):
+        max_workers = max_workers or transport.pool_size
+    elif not isinstance(transport, OneTransport):
+        max_workers = 1
+    max_workers = min(max_workers or 1, len(calls))
+    if max_workers > 1:
+        with ThreadPoolExecutor(max_workers) as executor:
+            for future in [executor.submit(worker) for _ in range(max_workers)]:
+                future.result()
+    else:
+        for call in calls:
+            execute(call)
+
+
+class OneBulkResult(object):
+    '''
+    Outcome of a bulk execution, the OneBatchCall of each item in order
+    '''
+
+    def __init__(self, calls):
+        self.calls = calls
+
+    def results(self):
+        '''
+        :return: list with the result or the exception of each call, in order
+        '''
+        return [call._exception if call._exception is not None else call._result for call in self.calls]
+
+    def succeeded(self):
+        return [call for call in self.calls if call.exception() is None]
+
+    def failed(self):
+        return [call for call in self.calls if call.exception() is not None]
+
+    def __len__(self):
+        return len(self.calls)
+
+    def __iter__(self):
+        return iter(self.calls)
+
+
+def bulk(one, methodname, items, concurrency=None, rate=None, progress=None):
+    '''
+    Calls a method once per item, in parallel over a pooled transport:
+
+        result = one.bulk('vm.action', [('poweroff', id) for id in ids], concurrency=32, rate=50)
+        for call in result.failed():
+            print(call.params, call.exception())
+
+    A failed call does not stop the others.
+    :param one: the XMLRPC server
+    :param methodname: XMLRPC method name, without the "one." prefix
+    :param items: parameters of each call, as tuples. Other values are passed as the only parameter.
+    :param concurrency: number of calls in flight, defaults to the size of the connection pool.
+                        Calls are sequential by default if the server transport is not pooled.
+    :param rate: maximum number of calls started per second
+    :param progress: callable receiving the number of completed calls, the total and the last completed call
+    :return: OneBulkResult
+    '''
+    calls = [OneBatchCall(methodname, item if isinstance(item, tuple) else (item,)) for item in items]
+    fan_out(one, calls, concurrency, rate, progress)
+    return OneBulkResult(calls)
+
+
+class OneBatch(object):
+    '''
+    Collects XML-RPC calls and sends them to OpenNebula in a single system.multicall request:
+
+        with one.batch() as b:
+            vm1 = b.vm.info(1)
+            vm2 = b.vm.info(2)
+        print(vm1.result().NAME)
+
+    If the server does not support system.multicall, or fails a multicall request, the calls are sent
+    individually and in parallel.
+    '''
+
+    def __init__(self, one, chunk_size=None):
+        '''
+        :param one: the XMLRPC server
+        :param chunk_size: maximum number of calls per system.multicall request
+        '''
+        self._one = one
+        self.chunk_size = chunk_size
+        self.calls = []
+
+    def __getattr__(self, name):
+        if name.startswith("_"):
+            raise AttributeError(name)
+        return _BatchMethod(self, name)
+
+    def add(self, methodname, params):
+        '''
+        Queues a call
+        :param methodname: XMLRPC method name, without the "one." prefix
+        :param params: XMLRPC parameters
+        :return: OneBatchCall that will hold the result
+        '''
+        if methodname in self._one._helpers:
+            raise OneException("Helper %s cannot be batched" % methodname)
+        call = OneBatchCall(methodname, params)
+        self.calls.append(call)
+        return call
+
+    def execute(self):
+        '''
+        Sends all pending calls
+        :return: list with the result or the exception of each call, in order
+        '''
+        pending = [call for call in self.calls if not call.done]
+        size = self.chunk_size or len(pending)
+        for i in range(0, len(pending), size or 1):
+            self._execute(pending[i:i + size])
+        return self.results()
+
+    def results(self):
+        return [call._exception if call._exception is not None else call._result for call in self.calls]
+
+    def _execute(self, calls):
+        one = self._one
+        if one._multicall:
+            multicall = [{"methodName": "one." + call.methodname, "params": one._cast_parms(call.params)}
+                         for call in calls]
+            try:
+                responses = one._do_request("system.multicall", (multicall,))
+            except OneException as e:
+                if _UNSUPPORTED.search(str(e)):
+                    # the server does not implement system.multicall, do not try again
+                    one._multicall = False
+            else:
+                for call, params, response in zip(calls, multicall, responses):
+                    if one._cache is not None:
+                        one._cache.put(call.methodname, params["params"],
+                                       None if isinstance(response, dict) else response[0])
+                    if isinstance(response, dict):
+                        call.set_exception(OneException(
+                            "<Fault %s: %r>" % (response.get("faultCode"), response.get("faultString"))))
+                        continue
+                    try:
+                        call.set_result(one._response(response[0]))
+                    except Exception as e:
+                        call.set_exception(e)
+                return
+        transport = one._ServerProxy__transport
+        fan_out(one, calls, None if isinstance(transport, PooledTransport) else FALLBACK_WORKERS)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        if exc_type is None:
+            self.execute()
@@ -0,0 +1,196 @@
+#!/usr/bin/env python
+
+#
+# Generated Sun Oct 18 16:36:48 2026 by generateDS.py version 2.29.24.
+# Python 3.11.7 (main, Oct  2 2025, 21:14:28) [GCC 12.2.0]
+#
+# Command line options:
+#   ('-q', '')
+#   ('-f', '')
+#   ('-o', 'pyone/bindings/supbind.py')
+#   ('-s', 'pyone/bindings/__init__.py')
+#   ('--super', 'supbind')
+#   ('--external-encoding', 'utf-8')
+#   ('--silence', '')
+#
+# Command line arguments:
+#   pyone/xsd/index.xsd
+#
+# Command line:
+#   /root/.pyenv/versions/3.11.7/bin/generateDS -q -f -o "pyone/bindings/supbind.py" -s "pyone/bindings/__init__.py" --super="supbind" --external-encoding="utf-8" --silence pyone/xsd/index.xsd
+#
+# Current working directory (os.getcwd()):
+#   package
+#
+
+import sys
+from pyone.util import TemplatedType
+from lxml import etree as etree_
+
+from . import supbind as supermod
+
+def parsexml_(infile, parser=None, **kwargs):
+    if parser is None:
+        # Use the lxml ElementTree compatible parser so that, e.g.,
+        #   we ignore comments.
+        parser = etree_.ETCompatXMLParser()
+    doc = etree_.parse(infile, parser=parser, **kwargs)
+    return doc
+
+#
+# Globals
+#
+
+ExternalEncoding = 'utf-8'
+
+#
+# Data representation classes
+#
+
+
+
+#
+# Subclasses are defined with their binding classes, see supbind
+#
+
+from importlib import import_module
+
+
+def __getattr__(name):
+    module = supermod._MODULES.get(name[:-3]) if name.endswith("Sub") else None
+    ret = getattr(import_module("." + module, __name__), name, None) if module is not None else None
+    if ret is None:
+        raise AttributeError("module %r has no attribute %r" % (__name__, name))
+    return ret
+
+
+if sys.version_info < (3, 7):
+    # module __getattr__ is not supported, all the bindings are imported, once supbind is
+    for _name in sorted(supermod._MODULES):
+        supermod._binding(_name)
+    for _module in sorted(set(supermod._MODULES.values())):
+        globals().update((_name, _value) for _name, _value in vars(import_module("." + _module, __name__)).items()
+                         if _name.endswith("Sub"))
+
+
+def get_root_tag(node):
+    tag = supermod.Tag_pattern_.match(node.tag).groups()[-1]
+    rootClass = None
+    rootClass = supermod.GDSClassesMapping.get(tag)
+    if rootClass is None and hasattr(supermod, tag):
+        rootClass = getattr(supermod, tag)
+    return tag, rootClass
+
+
+def parse(inFilename, silence=False):
+    parser = None
+    doc = parsexml_(inFilename, parser)
+    rootNode = doc.getroot()
+    rootTag, rootClass = get_root_tag(rootNode)
+    if rootClass is None:
+        rootTag = 'HISTORY_RECORDS'
+        rootClass = supermod.HISTORY_RECORDS
+    rootObj = rootClass.factory()
+    rootObj.build(rootNode)
+    # Enable Python to collect the space used by the DOM.
+    doc = None
+##     if not silence:
+##         sys.stdout.write('<?xml version="1.0" ?>\n')
+##         rootObj.export(
+##             sys.stdout, 0, name_=rootTag,
+##             namespacedef_='',
+##             pretty_print=True)
+    return rootObj
+
+
+def parseEtree(inFilename, silence=False):
+    parser = None
+    doc = parsexml_(inFilename, parser)
+    rootNode = doc.getroot()
+    rootTag, rootClass = get_root_tag(rootNode)
+    if rootClass is None:
+        rootTag = 'HISTORY_RECORDS'
+        rootClass = supermod.HISTORY_RECORDS
+    rootObj = rootClass.factory()
+    rootObj.build(rootNode)
+    # Enable Python to collect the space used by the DOM.
+    doc = None
+    mapping = {}
+    rootElement = rootObj.to_etree(None, name_=rootTag, mapping_=mapping)
+    reverse_mapping = rootObj.gds_reverse_node_mapping(mapping)
+##     if not silence:
+##         content = etree_.tostring(
+##             rootElement, pretty_print=True,
+##             xml_declaration=True, encoding="utf-8")
+##         sys.stdout.write(content)
+##         sys.stdout.write('\n')
+    return rootObj, rootElement, mapping, reverse_mapping
+
+
+def parseString(inString, silence=False):
+    if sys.version_info.major == 2:
+        from StringIO import StringIO
+    else:
+        from io import BytesIO as StringIO
+    parser = None
+    doc = parsexml_(StringIO(inString), parser)
+    rootNode = doc.getroot()
+    rootTag, rootClass = get_root_tag(rootNode)
+    if rootClass is None:
+        rootTag = 'HISTORY_RECORDS'
+        rootClass = supermod.HISTORY_RECORDS
+    rootObj = rootClass.factory()
+    rootObj.build(rootNode)
+    # Enable Python to collect the space used by the DOM.
+    doc = None
+##     if not silence:
+##         sys.stdout.write('<?xml version="1.0" ?>\n')
+##         rootObj.export(
+##             sys.stdout, 0, name_=rootTag,
+##             namespacedef_='')
+    return rootObj
+
+
+def parseLiteral(inFilename, silence=False):
+    parser = None
+    doc = parsexml_(inFilename, parser)
+    rootNode = doc.getroot()
+    rootTag, rootClass = get_root_tag(rootNode)
+    if rootClass is None:
+        rootTag = 'HISTORY_RECORDS'
+        rootClass = supermod.HISTORY_RECORDS
+    rootObj = rootClass.factory()
+    rootObj.build(rootNode)
+    # Enable Python to collect the space used by the DOM.
+    doc = None
+##     if not silence:
+##         sys.stdout.write('#from supbind import *\n\n')
+##         sys.stdout.write('from . import supbind as model_\n\n')
+##         sys.stdout.write('rootObj = model_.rootClass(\n')
+##         rootObj.exportLiteral(sys.stdout, 0, name_=rootTag)
+##         sys.stdout.write(')\n')
+    return rootObj
+
+
+USAGE_TEXT = """
+Usage: python ???.py <infilename>
+"""
+
+
+def usage():
+    print(USAGE_TEXT)
+    sys.exit(1)
+
+
+def main():
+    args = sys.argv[1:]
+    if len(args) != 1:
+        usage()
+    infilename = args[0]
+    parse(infilename)
+
+
+if __name__ == '__main__':
+    #import pdb; pdb.set_trace()
+    main()
+from pyone.parsing import parseString, iterparse, to_columns  # noqa
@@ -0,0 +1,528 @@
+#!/usr/bin/env python
+
+#
+# Bindings of CLUSTER_POOL, CLUSTER, generated by generateDS.py and split from supbind by src/split_bindings.py
+#
+
+import sys
+import re as re_
+import base64
+import datetime as datetime_
+import warnings as warnings_
+try:
+    from lxml import etree as etree_
+except ImportError:
+    from xml.etree import ElementTree as etree_
+from pyone.util import TemplatedType
+from . import supbind as supermod
+from .supbind import (
+    GenerateDSNamespaceDefs_,
+    GeneratedsSuper,
+    Tag_pattern_,
+    getSubclassFromModule_,
+    quote_xml,
+    raise_parse_error,
+    showIndent,
+)
+
+
+class CLUSTER_POOL(GeneratedsSuper):
+    subclass = None
+    superclass = None
+    def __init__(self, CLUSTER=None):
+        self.original_tagname_ = None
+        if CLUSTER is None:
+            self.CLUSTER = []
+        else:
+            self.CLUSTER = CLUSTER
+    def factory(*args_, **kwargs_):
+        if supermod.CurrentSubclassModule_ is not None:
+            subclass = getSubclassFromModule_(
+                supermod.CurrentSubclassModule_, CLUSTER_POOL)
+            if subclass is not None:
+                return subclass(*args_, **kwargs_)
+        if CLUSTER_POOL.subclass:
+            return CLUSTER_POOL.subclass(*args_, **kwargs_)
+        else:
+            return CLUSTER_POOL(*args_, **kwargs_)
+    factory = staticmethod(factory)
+    def get_CLUSTER(self): return self.CLUSTER
+    def set_CLUSTER(self, CLUSTER): self.CLUSTER = CLUSTER
+    def add_CLUSTER(self, value): self.CLUSTER.append(value)
+    def insert_CLUSTER_at(self, index, value): self.CLUSTER.insert(index, value)
+    def replace_CLUSTER_at(self, index, value): self.CLUSTER[index] = value
+    def hasContent_(self):
+        if (
+            self.CLUSTER
+        ):
+            return True
+        else:
+            return False
+    def export(self, outfile, level, namespaceprefix_='', name_='CLUSTER_POOL', namespacedef_='', pretty_print=True):
+        imported_ns_def_ = GenerateDSNamespaceDefs_.get('CLUSTER_POOL')
+        if imported_ns_def_ is not None:
+            namespacedef_ = imported_ns_def_
+        if pretty_print:
+            eol_ = '\n'
+        else:
+            eol_ = ''
+        if self.original_tagname_ is not None:
+            name_ = self.original_tagname_
+        showIndent(outfile, level, pretty_print)
+        outfile.write('<%s%s%s' % (namespaceprefix_, name_, namespacedef_ and ' ' + namespacedef_ or '', ))
+        already_processed = set()
+        self.exportAttributes(outfile, level, already_processed, namespaceprefix_, name_='CLUSTER_POOL')
+        if self.hasContent_():
+            outfile.write('>%s' % (eol_, ))
+            self.exportChildren(outfile, level + 1, namespaceprefix_='', name_='CLUSTER_POOL', pretty_print=pretty_print)
+            showIndent(outfile, level, pretty_print)
+            outfile.write('</%s%s>%s' % (namespaceprefix_, name_, eol_))
+        else:
+            outfile.write('/>%s' % (eol_, ))
+    def exportAttributes(self, outfile, level, already_processed, namespaceprefix_='', name_='CLUSTER_POOL'):
+        pass
+    def exportChildren(self, outfile, level, namespaceprefix_='', name_='CLUSTER_POOL', fromsubclass_=False, pretty_print=True):
+        if pretty_print:
+            eol_ = '\n'
+        else:
+            eol_ = ''
+        for CLUSTER_ in self.CLUSTER:
+            CLUSTER_.export(outfile, level, namespaceprefix_, name_='CLUSTER', pretty_print=pretty_print)
+    def build(self, node):
+        already_processed = set()
+        self.buildAttributes(node, node.attrib, already_processed)
+        for child in node:
+            nodeName_ = Tag_pattern_.match(child.tag).groups()[-1]
+            self.buildChildren(child, node, nodeName_)
+        return self
+    def buildAttributes(self, node, attrs, already_processed):
+        pass
+    def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
+        if nodeName_ == 'CLUSTER':
+            obj_ = CLUSTER.factory()
+            obj_.build(child_)
+            self.CLUSTER.append(obj_)
+            obj_.original_tagname_ = 'CLUSTER'
+# end class CLUSTER_POOL
+
+
+class CLUSTER(GeneratedsSuper):
+    subclass = None
+    superclass = None
+    def __init__(self, ID=None, NAME=None, HOSTS=None, DATASTORES=None, VNETS=None, TEMPLATE=None):
+        self.original_tagname_ = None
+        self.ID = ID
+        self.NAME = NAME
+        self.HOSTS = HOSTS
+        self.DATASTORES = DATASTORES
+        self.VNETS = VNETS
+        self.TEMPLATE = TEMPLATE
+    def factory(*args_, **kwargs_):
+        if supermod.CurrentSubclassModule_ is not None:
+            subclass = getSubclassFromModule_(
+                supermod.CurrentSubclassModule_, CLUSTER)
+            if subclass is not None:
+                return subclass(*args_, **kwargs_)
+        if CLUSTER.subclass:
+            return CLUSTER.subclass(*args_, **kwargs_)
+        else:
+            return CLUSTER(*args_, **kwargs_)
+    factory = staticmethod(factory)
+    def get_ID(self): return self.ID
+    def set_ID(self, ID): self.ID = ID
+    def get_NAME(self): return self.NAME
+    def set_NAME(self, NAME): self.NAME = NAME
+    def get_HOSTS(self): return self.HOSTS
+    def set_HOSTS(self, HOSTS): self.HOSTS = HOSTS
+    def get_DATASTORES(self): return self.DATASTORES
+    def set_DATASTORES(self, DATASTORES): self.DATASTORES = DATASTORES
+    def get_VNETS(self): return self.VNETS
+    def set_VNETS(self, VNETS): self.VNETS = VNETS
+    def get_TEMPLATE(self): return self.TEMPLATE
+    def set_TEMPLATE(self, TEMPLATE): self.TEMPLATE = TEMPLATE
+    def hasContent_(self):
+        if (
+            self.ID is not None or
+            self.NAME is not None or
+            self.HOSTS is not None or
+            self.DATASTORES is not None or
+            self.VNETS is not None or
+            self.TEMPLATE is not None
+        ):
+            return True
+        else:
+            return False
+    def export(self, outfile, level, namespaceprefix_='', name_='CLUSTER', namespacedef_='', pretty_print=True):
+        imported_ns_def_ = GenerateDSNamespaceDefs_.get('CLUSTER')
+        if imported_ns_def_ is not None:
+            namespacedef_ = imported_ns_def_
+        if pretty_print:
+            eol_ = '\n'
+        else:
+            eol_ = ''
+        if self.original_tagname_ is not None:
+            name_ = self.original_tagname_
+        showIndent(outfile, level, pretty_print)
+        outfile.write('<%s%s%s' % (namespaceprefix_, name_, namespacedef_ and ' ' + namespacedef_ or '', ))
+        already_processed = set()
+        self.exportAttributes(outfile, level, already_processed, namespaceprefix_, name_='CLUSTER')
+        if self.hasContent_():
+            outfile.write('>%s' % (eol_, ))
+            self.exportChildren(outfile, level + 1, namespaceprefix_='', name_='CLUSTER', pretty_print=pretty_print)
+            showIndent(outfile, level, pretty_print)
+            outfile.write('</%s%s>%s' % (namespaceprefix_, name_, eol_))
+        else:
+            outfile.write('/>%s' % (eol_, ))
+    def exportAttributes(self, outfile, level, already_processed, namespaceprefix_='', name_='CLUSTER'):
+        pass
+    def exportChildren(self, outfile, level, namespaceprefix_='', name_='CLUSTER', fromsubclass_=False, pretty_print=True):
+        if pretty_print:
+            eol_ = '\n'
+        else:
+            eol_ = ''
+        if self.ID is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<ID>%s</ID>%s' % (self.gds_format_integer(self.ID, input_name='ID'), eol_))
+        if self.NAME is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<NAME>%s</NAME>%s' % (self.gds_encode(self.gds_format_string(quote_xml(self.NAME), input_name='NAME')), eol_))
+        if self.HOSTS is not None:
+            self.HOSTS.export(outfile, level, namespaceprefix_, name_='HOSTS', pretty_print=pretty_print)
+        if self.DATASTORES is not None:
+            self.DATASTORES.export(outfile, level, namespaceprefix_, name_='DATASTORES', pretty_print=pretty_print)
+        if self.VNETS is not None:
+            self.VNETS.export(outfile, level, namespaceprefix_, name_='VNETS', pretty_print=pretty_print)
+        if self.TEMPLATE is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<TEMPLATE>%s</TEMPLATE>%s' % (self.gds_encode(self.gds_format_string(quote_xml(self.TEMPLATE), input_name='TEMPLATE')), eol_))
+    def build(self, node):
+        already_processed = set()
+        self.buildAttributes(node, node.attrib, already_processed)
+        for child in node:
+            nodeName_ = Tag_pattern_.match(child.tag).groups()[-1]
+            self.buildChildren(child, node, nodeName_)
+        return self
+    def buildAttributes(self, node, attrs, already_processed):
+        pass
+    def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
+        if nodeName_ == 'ID' and child_.text:
+            sval_ = child_.text
+            try:
+                ival_ = int(sval_)
+            except (TypeError, ValueError) as exp:
+                raise_parse_error(child_, 'requires integer: %s' % exp)
+            ival_ = self.gds_validate_integer(ival_, node, 'ID')
+            self.ID = ival_
+        elif nodeName_ == 'NAME':
+            NAME_ = child_.text
+            NAME_ = self.gds_validate_string(NAME_, node, 'NAME')
+            self.NAME = NAME_
+        elif nodeName_ == 'HOSTS':
+            obj_ = HOSTSType.factory()
+            obj_.build(child_)
+            self.HOSTS = obj_
+            obj_.original_tagname_ = 'HOSTS'
+        elif nodeName_ == 'DATASTORES':
+            obj_ = DATASTORESType.factory()
+            obj_.build(child_)
+            self.DATASTORES = obj_
+            obj_.original_tagname_ = 'DATASTORES'
+        elif nodeName_ == 'VNETS':
+            obj_ = VNETSType.factory()
+            obj_.build(child_)
+            self.VNETS = obj_
+            obj_.original_tagname_ = 'VNETS'
+        elif nodeName_ == 'TEMPLATE':
+            TEMPLATE_ = child_.text
+            TEMPLATE_ = self.gds_validate_string(TEMPLATE_, node, 'TEMPLATE')
+            self.TEMPLATE = TEMPLATE_
+# end class CLUSTER
+
+
+class HOSTSType(GeneratedsSuper):
+    subclass = None
+    superclass = None
+    def __init__(self, ID=None):
+        self.original_tagname_ = None
+        if ID is None:
+            self.ID = []
+        else:
+            self.ID = ID
+    def factory(*args_, **kwargs_):
+        if supermod.CurrentSubclassModule_ is not None:
+            subclass = getSubclassFromModule_(
+                supermod.CurrentSubclassModule_, HOSTSType)
+            if subclass is not None:
+                return subclass(*args_, **kwargs_)
+        if HOSTSType.subclass:
+            return HOSTSType.subclass(*args_, **kwargs_)
+        else:
+            return HOSTSType(*args_, **kwargs_)
+    factory = staticmethod(factory)
+    def get_ID(self): return self.ID
+    def set_ID(self, ID): self.ID = ID
+    def add_ID(self, value): self.ID.append(value)
+    def insert_ID_at(self, index, value): self.ID.insert(index, value)
+    def replace_ID_at(self, index, value): self.ID[index] = value
+    def hasContent_(self):
+        if (
+            self.ID
+        ):
+            return True
+        else:
+            return False
+    def export(self, outfile, level, namespaceprefix_='', name_='HOSTSType', namespacedef_='', pretty_print=True):
+        imported_ns_def_ = GenerateDSNamespaceDefs_.get('HOSTSType')
+        if imported_ns_def_ is not None:
+            namespacedef_ = imported_ns_def_
+        if pretty_print:
+            eol_ = '\n'
+        else:
+            eol_ = ''
+        if self.original_tagname_ is not None:
+            name_ = self.original_tagname_
+        showIndent(outfile, level, pretty_print)
+        outfile.write('<%s%s%s' % (namespaceprefix_, name_, namespacedef_ and ' ' + namespacedef_ or '', ))
+        already_processed = set()
+        self.exportAttributes(outfile, level, already_processed, namespaceprefix_, name_='HOSTSType')
+        if self.hasContent_():
+            outfile.write('>%s' % (eol_, ))
+            self.exportChildren(outfile, level + 1, namespaceprefix_='', name_='HOSTSType', pretty_print=pretty_print)
+            showIndent(outfile, level, pretty_print)
+            outfile.write('</%s%s>%s' % (namespaceprefix_, name_, eol_))
+        else:
+            outfile.write('/>%s' % (eol_, ))
+    def exportAttributes(self, outfile, level, already_processed, namespaceprefix_='', name_='HOSTSType'):
+        pass
+    def exportChildren(self, outfile, level, namespaceprefix_='', name_='HOSTSType', fromsubclass_=False, pretty_print=True):
+        if pretty_print:
+            eol_ = '\n'
+        else:
+            eol_ = ''
+        for ID_ in self.ID:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<ID>%s</ID>%s' % (self.gds_format_integer(ID_, input_name='ID'), eol_))
+    def build(self, node):
+        already_processed = set()
+        self.buildAttributes(node, node.attrib, already_processed)
+        for child in node:
+            nodeName_ = Tag_pattern_.match(child.tag).groups()[-1]
+            self.buildChildren(child, node, nodeName_)
+        return self
+    def buildAttributes(self, node, attrs, already_processed):
+        pass
+    def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
+        if nodeName_ == 'ID' and child_.text:
+            sval_ = child_.text
+            try:
+                ival_ = int(sval_)
+            except (TypeError, ValueError) as exp:
+                raise_parse_error(child_, 'requires integer: %s' % exp)
+            ival_ = self.gds_validate_integer(ival_, node, 'ID')
+            self.ID.append(ival_)
+# end class HOSTSType
+
+
+class DATASTORESType(GeneratedsSuper):
+    subclass = None
+    superclass = None
+    def __init__(self, ID=None):
+        self.original_tagname_ = None
+        if ID is None:
+            self.ID = []
+        else:
+            self.ID = ID
+    def factory(*args_, **kwargs_):
+        if supermod.CurrentSubclassModule_ is not None:
+            subclass = getSubclassFromModule_(
+                supermod.CurrentSubclassModule_, DATASTORESType)
+            if subclass is not None:
+                return subclass(*args_, **kwargs_)
+        if DATASTORESType.subclass:
+            return DATASTORESType.subclass(*args_, **kwargs_)
+        else:
+            return DATASTORESType(*args_, **kwargs_)
+    factory = staticmethod(factory)
+    def get_ID(self): return self.ID
+    def set_ID(self, ID): self.ID = ID
+    def add_ID(self, value): self.ID.append(value)
+    def insert_ID_at(self, index, value): self.ID.insert(index, value)
+    def replace_ID_at(self, index, value): self.ID[index] = value
+    def hasContent_(self):
+        if (
+            self.ID
+        ):
+            return True
+        else:
+            return False
+    def export(self, outfile, level, namespaceprefix_='', name_='DATASTORESType', namespacedef_='', pretty_print=True):
+        imported_ns_def_ = GenerateDSNamespaceDefs_.get('DATASTORESType')
+        if imported_ns_def_ is not None:
+            namespacedef_ = imported_ns_def_
+        if pretty_print:
+            eol_ = '\n'
+        else:
+            eol_ = ''
+        if self.original_tagname_ is not None:
+            name_ = self.original_tagname_
+        showIndent(outfile, level, pretty_print)
+        outfile.write('<%s%s%s' % (namespaceprefix_, name_, namespacedef_ and ' ' + namespacedef_ or '', ))
+        already_processed = set()
+        self.exportAttributes(outfile, level, already_processed, namespaceprefix_, name_='DATASTORESType')
+        if self.hasContent_():
+            outfile.write('>%s' % (eol_, ))
+            self.exportChildren(outfile, level + 1, namespaceprefix_='', name_='DATASTORESType', pretty_print=pretty_print)
+            showIndent(outfile, level, pretty_print)
+            outfile.write('</%s%s>%s' % (namespaceprefix_, name_, eol_))
+        else:
+            outfile.write('/>%s' % (eol_, ))
+    def exportAttributes(self, outfile, level, already_processed, namespaceprefix_='', name_='DATASTORESType'):
+        pass
+    def exportChildren(self, outfile, level, namespaceprefix_='', name_='DATASTORESType', fromsubclass_=False, pretty_print=True):
+        if pretty_print:
+            eol_ = '\n'
+        else:
+            eol_ = ''
+        for ID_ in self.ID:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<ID>%s</ID>%s' % (self.gds_format_integer(ID_, input_name='ID'), eol_))
+    def build(self, node):
+        already_processed = set()
+        self.buildAttributes(node, node.attrib, already_processed)
+        for child in node:
+            nodeName_ = Tag_pattern_.match(child.tag).groups()[-1]
+            self.buildChildren(child, node, nodeName_)
+        return self
+    def buildAttributes(self, node, attrs, already_processed):
+        pass
+    def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
+        if nodeName_ == 'ID' and child_.text:
+            sval_ = child_.text
+            try:
+                ival_ = int(sval_)
+            except (TypeError, ValueError) as exp:
+                raise_parse_error(child_, 'requires integer: %s' % exp)
+            ival_ = self.gds_validate_integer(ival_, node, 'ID')
+            self.ID.append(ival_)
+# end class DATASTORESType
+
+
+class VNETSType(GeneratedsSuper):
+    subclass = None
+    superclass = None
+    def __init__(self, ID=None):
+        self.original_tagname_ = None
+        if ID is None:
+            self.ID = []
+        else:
+            self.ID = ID
+    def factory(*args_, **kwargs_):
+        if supermod.CurrentSubclassModule_ is not None:
+            subclass = getSubclassFromModule_(
+                supermod.CurrentSubclassModule_, VNETSType)
+            if subclass is not None:
+                return subclass(*args_, **kwargs_)
+        if VNETSType.subclass:
+            return VNETSType.subclass(*args_, **kwargs_)
+        else:
+            return VNETSType(*args_, **kwargs_)
+    factory = staticmethod(factory)
+    def get_ID(self): return self.ID
+    def set_ID(self, ID): self.ID = ID
+    def add_ID(self, value): self.ID.append(value)
+    def insert_ID_at(self, index, value): self.ID.insert(index, value)
+    def replace_ID_at(self, index, value): self.ID[index] = value
+    def hasContent_(self):
+        if (
+            self.ID
+        ):
+            return True
+        else:
+            return False
+    def export(self, outfile, level, namespaceprefix_='', name_='VNETSType', namespacedef_='', pretty_print=True):
+        imported_ns_def_ = GenerateDSNamespaceDefs_.get('VNETSType')
+        if imported_ns_def_ is not None:
+            namespacedef_ = imported_ns_def_
+        if pretty_print:
+            eol_ = '\n'
+        else:
+            eol_ = ''
+        if self.original_tagname_ is not None:
+            name_ = self.original_tagname_
+        showIndent(outfile, level, pretty_print)
+        outfile.write('<%s%s%s' % (namespaceprefix_, name_, namespacedef_ and ' ' + namespacedef_ or '', ))
+        already_processed = set()
+        self.exportAttributes(outfile, level, already_processed, namespaceprefix_, name_='VNETSType')
+        if self.hasContent_():
+            outfile.write('>%s' % (eol_, ))
+            self.exportChildren(outfile, level + 1, namespaceprefix_='', name_='VNETSType', pretty_print=pretty_print)
+            showIndent(outfile, level, pretty_print)
+            outfile.write('</%s%s>%s' % (namespaceprefix_, name_, eol_))
+        else:
+            outfile.write('/>%s' % (eol_, ))
+    def exportAttributes(self, outfile, level, already_processed, namespaceprefix_='', name_='VNETSType'):
+        pass
+    def exportChildren(self, outfile, level, namespaceprefix_='', name_='VNETSType', fromsubclass_=False, pretty_print=True):
+        if pretty_print:
+            eol_ = '\n'
+        else:
+            eol_ = ''
+        for ID_ in self.ID:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<ID>%s</ID>%s' % (self.gds_format_integer(ID_, input_name='ID'), eol_))
+    def build(self, node):
+        already_processed = set()
+        self.buildAttributes(node, node.attrib, already_processed)
+        for child in node:
+            nodeName_ = Tag_pattern_.match(child.tag).groups()[-1]
+            self.buildChildren(child, node, nodeName_)
+        return self
+    def buildAttributes(self, node, attrs, already_processed):
+        pass
+    def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
+        if nodeName_ == 'ID' and child_.text:
+            sval_ = child_.text
+            try:
+                ival_ = int(sval_)
+            except (TypeError, ValueError) as exp:
+                raise_parse_error(child_, 'requires integer: %s' % exp)
+            ival_ = self.gds_validate_integer(ival_, node, 'ID')
+            self.ID.append(ival_)
+# end class VNETSType
+
+
+class CLUSTER_POOLSub(TemplatedType, CLUSTER_POOL):
+    def __init__(self, CLUSTER=None):
+        super(CLUSTER_POOLSub, self).__init__(CLUSTER, )
+CLUSTER_POOL.subclass = CLUSTER_POOLSub
+# end class CLUSTER_POOLSub
+
+
+class CLUSTERSub(TemplatedType, CLUSTER):
+    def __init__(self, ID=None, NAME=None, HOSTS=None, DATASTORES=None, VNETS=None, TEMPLATE=None):
+        super(CLUSTERSub, self).__init__(ID, NAME, HOSTS, DATASTORES, VNETS, TEMPLATE, )
+CLUSTER.subclass = CLUSTERSub
+# end class CLUSTERSub
+
+
+class HOSTSTypeSub(TemplatedType, HOSTSType):
+    def __init__(self, ID=None):
+        super(HOSTSTypeSub, self).__init__(ID, )
+HOSTSType.subclass = HOSTSTypeSub
+# end class HOSTSTypeSub
+
+
+class DATASTORESTypeSub(TemplatedType, DATASTORESType):
+    def __init__(self, ID=None):
+        super(DATASTORESTypeSub, self).__init__(ID, )
+DATASTORESType.subclass = DATASTORESTypeSub
+# end class DATASTORESTypeSub
+
+
+class VNETSTypeSub(TemplatedType, VNETSType):
+    def __init__(self, ID=None):
+        super(VNETSTypeSub, self).__init__(ID, )
+VNETSType.subclass = VNETSTypeSub
+# end class VNETSTypeSub
+
+
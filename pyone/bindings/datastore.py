@@ -0,0 +1,817 @@
+#!/usr/bin/env python
+
+#
+# Bindings of DATASTORE_POOL, DATASTORE, generated by generateDS.py and split from supbind by src/split_bindings.py
+#
+
+import sys
+import re as re_
+import base64
+import datetime as datetime_
+import warnings as warnings_
+try:
+    from lxml import etree as etree_
+except ImportError:
+    from xml.etree import ElementTree as etree_
+from pyone.util import TemplatedType
+from . import supbind as supermod
+from .supbind import (
+    GenerateDSNamespaceDefs_,
+    GeneratedsSuper,
+    Tag_pattern_,
+    getSubclassFromModule_,
+    quote_xml,
+    raise_parse_error,
+    showIndent,
+)
+
+
+class DATASTORE_POOL(GeneratedsSuper):
+    subclass = None
+    superclass = None
+    def __init__(self, DATASTORE=None):
+        self.original_tagname_ = None
+        if DATASTORE is None:
+            self.DATASTORE = []
+        else:
+            self.DATASTORE = DATASTORE
+    def factory(*args_, **kwargs_):
+        if supermod.CurrentSubclassModule_ is not None:
+            subclass = getSubclassFromModule_(
+                supermod.CurrentSubclassModule_, DATASTORE_POOL)
+            if subclass is not None:
+                return subclass(*args_, **kwargs_)
+        if DATASTORE_POOL.subclass:
+            return DATASTORE_POOL.subclass(*args_, **kwargs_)
+        else:
+            return DATASTORE_POOL(*args_, **kwargs_)
+    factory = staticmethod(factory)
+    def get_DATASTORE(self): return self.DATASTORE
+    def set_DATASTORE(self, DATASTORE): self.DATASTORE = DATASTORE
+    def add_DATASTORE(self, value): self.DATASTORE.append(value)
+    def insert_DATASTORE_at(self, index, value): self.DATASTORE.insert(index, value)
+    def replace_DATASTORE_at(self, index, value): self.DATASTORE[index] = value
+    def hasContent_(self):
+        if (
+            self.DATASTORE
+        ):
+            return True
+        else:
+            return False
+    def export(self, outfile, level, namespaceprefix_='', name_='DATASTORE_POOL', namespacedef_='', pretty_print=True):
+        imported_ns_def_ = GenerateDSNamespaceDefs_.get('DATASTORE_POOL')
+        if imported_ns_def_ is not None:
+            namespacedef_ = imported_ns_def_
+        if pretty_print:
+            eol_ = '\n'
+        else:
+            eol_ = ''
+        if self.original_tagname_ is not None:
+            name_ = self.original_tagname_
+        showIndent(outfile, level, pretty_print)
+        outfile.write('<%s%s%s' % (namespaceprefix_, name_, namespacedef_ and ' ' + namespacedef_ or '', ))
+        already_processed = set()
+        self.exportAttributes(outfile, level, already_processed, namespaceprefix_, name_='DATASTORE_POOL')
+        if self.hasContent_():
+            outfile.write('>%s' % (eol_, ))
+            self.exportChildren(outfile, level + 1, namespaceprefix_='', name_='DATASTORE_POOL', pretty_print=pretty_print)
+            showIndent(outfile, level, pretty_print)
+            outfile.write('</%s%s>%s' % (namespaceprefix_, name_, eol_))
+        else:
+            outfile.write('/>%s' % (eol_, ))
+    def exportAttributes(self, outfile, level, already_processed, namespaceprefix_='', name_='DATASTORE_POOL'):
+        pass
+    def exportChildren(self, outfile, level, namespaceprefix_='', name_='DATASTORE_POOL', fromsubclass_=False, pretty_print=True):
+        if pretty_print:
+            eol_ = '\n'
+        else:
+            eol_ = ''
+        for DATASTORE_ in self.DATASTORE:
+            DATASTORE_.export(outfile, level, namespaceprefix_, name_='DATASTORE', pretty_print=pretty_print)
+    def build(self, node):
+        already_processed = set()
+        self.buildAttributes(node, node.attrib, already_processed)
+        for child in node:
+            nodeName_ = Tag_pattern_.match(child.tag).groups()[-1]
+            self.buildChildren(child, node, nodeName_)
+        return self
+    def buildAttributes(self, node, attrs, already_processed):
+        pass
+    def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
+        if nodeName_ == 'DATASTORE':
+            obj_ = DATASTORE.factory()
+            obj_.build(child_)
+            self.DATASTORE.append(obj_)
+            obj_.original_tagname_ = 'DATASTORE'
+# end class DATASTORE_POOL
+
+
+class DATASTORE(GeneratedsSuper):
+    subclass = None
+    superclass = None
+    def __init__(self, ID=None, UID=None, GID=None, UNAME=None, GNAME=None, NAME=None, PERMISSIONS=None, DS_MAD=None, TM_MAD=None, BASE_PATH=None, TYPE=None, DISK_TYPE=None, STATE=None, CLUSTERS=None, TOTAL_MB=None, FREE_MB=None, USED_MB=None, IMAGES=None, TEMPLATE=None):
+        self.original_tagname_ = None
+        self.ID = ID
+        self.UID = UID
+        self.GID = GID
+        self.UNAME = UNAME
+        self.GNAME = GNAME
+        self.NAME = NAME
+        self.PERMISSIONS = PERMISSIONS
+        self.DS_MAD = DS_MAD
+        self.TM_MAD = TM_MAD
+        self.BASE_PATH = BASE_PATH
+        self.TYPE = TYPE
+        self.DISK_TYPE = DISK_TYPE
+        self.STATE = STATE
+        self.CLUSTERS = CLUSTERS
+        self.TOTAL_MB = TOTAL_MB
+        self.FREE_MB = FREE_MB
+        self.USED_MB = USED_MB
+        self.IMAGES = IMAGES
+        self.TEMPLATE = TEMPLATE
+    def factory(*args_, **kwargs_):
+        if supermod.CurrentSubclassModule_ is not None:
+            subclass = getSubclassFromModule_(
+                supermod.CurrentSubclassModule_, DATASTORE)
+            if subclass is not None:
+                return subclass(*args_, **kwargs_)
+        if DATASTORE.subclass:
+            return DATASTORE.subclass(*args_, **kwargs_)
+        else:
+            return DATASTORE(*args_, **kwargs_)
+    factory = staticmethod(factory)
+    def get_ID(self): return self.ID
+    def set_ID(self, ID): self.ID = ID
+    def get_UID(self): return self.UID
+    def set_UID(self, UID): self.UID = UID
+    def get_GID(self): return self.GID
+    def set_GID(self, GID): self.GID = GID
+    def get_UNAME(self): return self.UNAME
+    def set_UNAME(self, UNAME): self.UNAME = UNAME
+    def get_GNAME(self): return self.GNAME
+    def set_GNAME(self, GNAME): self.GNAME = GNAME
+    def get_NAME(self): return self.NAME
+    def set_NAME(self, NAME): self.NAME = NAME
+    def get_PERMISSIONS(self): return self.PERMISSIONS
+    def set_PERMISSIONS(self, PERMISSIONS): self.PERMISSIONS = PERMISSIONS
+    def get_DS_MAD(self): return self.DS_MAD
+    def set_DS_MAD(self, DS_MAD): self.DS_MAD = DS_MAD
+    def get_TM_MAD(self): return self.TM_MAD
+    def set_TM_MAD(self, TM_MAD): self.TM_MAD = TM_MAD
+    def get_BASE_PATH(self): return self.BASE_PATH
+    def set_BASE_PATH(self, BASE_PATH): self.BASE_PATH = BASE_PATH
+    def get_TYPE(self): return self.TYPE
+    def set_TYPE(self, TYPE): self.TYPE = TYPE
+    def get_DISK_TYPE(self): return self.DISK_TYPE
+    def set_DISK_TYPE(self, DISK_TYPE): self.DISK_TYPE = DISK_TYPE
+    def get_STATE(self): return self.STATE
+    def set_STATE(self, STATE): self.STATE = STATE
+    def get_CLUSTERS(self): return self.CLUSTERS
+    def set_CLUSTERS(self, CLUSTERS): self.CLUSTERS = CLUSTERS
+    def get_TOTAL_MB(self): return self.TOTAL_MB
+    def set_TOTAL_MB(self, TOTAL_MB): self.TOTAL_MB = TOTAL_MB
+    def get_FREE_MB(self): return self.FREE_MB
+    def set_FREE_MB(self, FREE_MB): self.FREE_MB = FREE_MB
+    def get_USED_MB(self): return self.USED_MB
+    def set_USED_MB(self, USED_MB): self.USED_MB = USED_MB
+    def get_IMAGES(self): return self.IMAGES
+    def set_IMAGES(self, IMAGES): self.IMAGES = IMAGES
+    def get_TEMPLATE(self): return self.TEMPLATE
+    def set_TEMPLATE(self, TEMPLATE): self.TEMPLATE = TEMPLATE
+    def hasContent_(self):
+        if (
+            self.ID is not None or
+            self.UID is not None or
+            self.GID is not None or
+            self.UNAME is not None or
+            self.GNAME is not None or
+            self.NAME is not None or
+            self.PERMISSIONS is not None or
+            self.DS_MAD is not None or
+            self.TM_MAD is not None or
+            self.BASE_PATH is not None or
+            self.TYPE is not None or
+            self.DISK_TYPE is not None or
+            self.STATE is not None or
+            self.CLUSTERS is not None or
+            self.TOTAL_MB is not None or
+            self.FREE_MB is not None or
+            self.USED_MB is not None or
+            self.IMAGES is not None or
+            self.TEMPLATE is not None
+        ):
+            return True
+        else:
+            return False
+    def export(self, outfile, level, namespaceprefix_='', name_='DATASTORE', namespacedef_='', pretty_print=True):
+        imported_ns_def_ = GenerateDSNamespaceDefs_.get('DATASTORE')
+        if imported_ns_def_ is not None:
+            namespacedef_ = imported_ns_def_
+        if pretty_print:
+            eol_ = '\n'
+        else:
+            eol_ = ''
+        if self.original_tagname_ is not None:
+            name_ = self.original_tagname_
+        showIndent(outfile, level, pretty_print)
+        outfile.write('<%s%s%s' % (namespaceprefix_, name_, namespacedef_ and ' ' + namespacedef_ or '', ))
+        already_processed = set()
+        self.exportAttributes(outfile, level, already_processed, namespaceprefix_, name_='DATASTORE')
+        if self.hasContent_():
+            outfile.write('>%s' % (eol_, ))
+            self.exportChildren(outfile, level + 1, namespaceprefix_='', name_='DATASTORE', pretty_print=pretty_print)
+            showIndent(outfile, level, pretty_print)
+            outfile.write('</%s%s>%s' % (namespaceprefix_, name_, eol_))
+        else:
+            outfile.write('/>%s' % (eol_, ))
+    def exportAttributes(self, outfile, level, already_processed, namespaceprefix_='', name_='DATASTORE'):
+        pass
+    def exportChildren(self, outfile, level, namespaceprefix_='', name_='DATASTORE', fromsubclass_=False, pretty_print=True):
+        if pretty_print:
+            eol_ = '\n'
+        else:
+            eol_ = ''
+        if self.ID is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<ID>%s</ID>%s' % (self.gds_format_integer(self.ID, input_name='ID'), eol_))
+        if self.UID is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<UID>%s</UID>%s' % (self.gds_format_integer(self.UID, input_name='UID'), eol_))
+        if self.GID is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<GID>%s</GID>%s' % (self.gds_format_integer(self.GID, input_name='GID'), eol_))
+        if self.UNAME is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<UNAME>%s</UNAME>%s' % (self.gds_encode(self.gds_format_string(quote_xml(self.UNAME), input_name='UNAME')), eol_))
+        if self.GNAME is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<GNAME>%s</GNAME>%s' % (self.gds_encode(self.gds_format_string(quote_xml(self.GNAME), input_name='GNAME')), eol_))
+        if self.NAME is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<NAME>%s</NAME>%s' % (self.gds_encode(self.gds_format_string(quote_xml(self.NAME), input_name='NAME')), eol_))
+        if self.PERMISSIONS is not None:
+            self.PERMISSIONS.export(outfile, level, namespaceprefix_, name_='PERMISSIONS', pretty_print=pretty_print)
+        if self.DS_MAD is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<DS_MAD>%s</DS_MAD>%s' % (self.gds_encode(self.gds_format_string(quote_xml(self.DS_MAD), input_name='DS_MAD')), eol_))
+        if self.TM_MAD is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<TM_MAD>%s</TM_MAD>%s' % (self.gds_encode(self.gds_format_string(quote_xml(self.TM_MAD), input_name='TM_MAD')), eol_))
+        if self.BASE_PATH is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<BASE_PATH>%s</BASE_PATH>%s' % (self.gds_encode(self.gds_format_string(quote_xml(self.BASE_PATH), input_name='BASE_PATH')), eol_))
+        if self.TYPE is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<TYPE>%s</TYPE>%s' % (self.gds_format_integer(self.TYPE, input_name='TYPE'), eol_))
+        if self.DISK_TYPE is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<DISK_TYPE>%s</DISK_TYPE>%s' % (self.gds_format_integer(self.DISK_TYPE, input_name='DISK_TYPE'), eol_))
+        if self.STATE is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<STATE>%s</STATE>%s' % (self.gds_format_integer(self.STATE, input_name='STATE'), eol_))
+        if self.CLUSTERS is not None:
+            self.CLUSTERS.export(outfile, level, namespaceprefix_, name_='CLUSTERS', pretty_print=pretty_print)
+        if self.TOTAL_MB is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<TOTAL_MB>%s</TOTAL_MB>%s' % (self.gds_format_integer(self.TOTAL_MB, input_name='TOTAL_MB'), eol_))
+        if self.FREE_MB is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<FREE_MB>%s</FREE_MB>%s' % (self.gds_format_integer(self.FREE_MB, input_name='FREE_MB'), eol_))
+        if self.USED_MB is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<USED_MB>%s</USED_MB>%s' % (self.gds_format_integer(self.USED_MB, input_name='USED_MB'), eol_))
+        if self.IMAGES is not None:
+            self.IMAGES.export(outfile, level, namespaceprefix_, name_='IMAGES', pretty_print=pretty_print)
+        if self.TEMPLATE is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<TEMPLATE>%s</TEMPLATE>%s' % (self.gds_encode(self.gds_format_string(quote_xml(self.TEMPLATE), input_name='TEMPLATE')), eol_))
+    def build(self, node):
+        already_processed = set()
+        self.buildAttributes(node, node.attrib, already_processed)
+        for child in node:
+            nodeName_ = Tag_pattern_.match(child.tag).groups()[-1]
+            self.buildChildren(child, node, nodeName_)
+        return self
+    def buildAttributes(self, node, attrs, already_processed):
+        pass
+    def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
+        if nodeName_ == 'ID' and child_.text:
+            sval_ = child_.text
+            try:
+                ival_ = int(sval_)
+            except (TypeError, ValueError) as exp:
+                raise_parse_error(child_, 'requires integer: %s' % exp)
+            ival_ = self.gds_validate_integer(ival_, node, 'ID')
+            self.ID = ival_
+        elif nodeName_ == 'UID' and child_.text:
+            sval_ = child_.text
+            try:
+                ival_ = int(sval_)
+            except (TypeError, ValueError) as exp:
+                raise_parse_error(child_, 'requires integer: %s' % exp)
+            ival_ = self.gds_validate_integer(ival_, node, 'UID')
+            self.UID = ival_
+        elif nodeName_ == 'GID' and child_.text:
+            sval_ = child_.text
+            try:
+                ival_ = int(sval_)
+            except (TypeError, ValueError) as exp:
+                raise_parse_error(child_, 'requires integer: %s' % exp)
+            ival_ = self.gds_validate_integer(ival_, node, 'GID')
+            self.GID = ival_
+        elif nodeName_ == 'UNAME':
+            UNAME_ = child_.text
+            UNAME_ = self.gds_validate_string(UNAME_, node, 'UNAME')
+            self.UNAME = UNAME_
+        elif nodeName_ == 'GNAME':
+            GNAME_ = child_.text
+            GNAME_ = self.gds_validate_string(GNAME_, node, 'GNAME')
+            self.GNAME = GNAME_
+        elif nodeName_ == 'NAME':
+            NAME_ = child_.text
+            NAME_ = self.gds_validate_string(NAME_, node, 'NAME')
+            self.NAME = NAME_
+        elif nodeName_ == 'PERMISSIONS':
+            obj_ = PERMISSIONSType1.factory()
+            obj_.build(child_)
+            self.PERMISSIONS = obj_
+            obj_.original_tagname_ = 'PERMISSIONS'
+        elif nodeName_ == 'DS_MAD':
+            DS_MAD_ = child_.text
+            DS_MAD_ = self.gds_validate_string(DS_MAD_, node, 'DS_MAD')
+            self.DS_MAD = DS_MAD_
+        elif nodeName_ == 'TM_MAD':
+            TM_MAD_ = child_.text
+            TM_MAD_ = self.gds_validate_string(TM_MAD_, node, 'TM_MAD')
+            self.TM_MAD = TM_MAD_
+        elif nodeName_ == 'BASE_PATH':
+            BASE_PATH_ = child_.text
+            BASE_PATH_ = self.gds_validate_string(BASE_PATH_, node, 'BASE_PATH')
+            self.BASE_PATH = BASE_PATH_
+        elif nodeName_ == 'TYPE' and child_.text:
+            sval_ = child_.text
+            try:
+                ival_ = int(sval_)
+            except (TypeError, ValueError) as exp:
+                raise_parse_error(child_, 'requires integer: %s' % exp)
+            ival_ = self.gds_validate_integer(ival_, node, 'TYPE')
+            self.TYPE = ival_
+        elif nodeName_ == 'DISK_TYPE' and child_.text:
+            sval_ = child_.text
+            try:
+                ival_ = int(sval_)
+            except (TypeError, ValueError) as exp:
+                raise_parse_error(child_, 'requires integer: %s' % exp)
+            ival_ = self.gds_validate_integer(ival_, node, 'DISK_TYPE')
+            self.DISK_TYPE = ival_
+        elif nodeName_ == 'STATE' and child_.text:
+            sval_ = child_.text
+            try:
+                ival_ = int(sval_)
+            except (TypeError, ValueError) as exp:
+                raise_parse_error(child_, 'requires integer: %s' % exp)
+            ival_ = self.gds_validate_integer(ival_, node, 'STATE')
+            self.STATE = ival_
+        elif nodeName_ == 'CLUSTERS':
+            obj_ = CLUSTERSType.factory()
+            obj_.build(child_)
+            self.CLUSTERS = obj_
+            obj_.original_tagname_ = 'CLUSTERS'
+        elif nodeName_ == 'TOTAL_MB' and child_.text:
+            sval_ = child_.text
+            try:
+                ival_ = int(sval_)
+            except (TypeError, ValueError) as exp:
+                raise_parse_error(child_, 'requires integer: %s' % exp)
+            ival_ = self.gds_validate_integer(ival_, node, 'TOTAL_MB')
+            self.TOTAL_MB = ival_
+        elif nodeName_ == 'FREE_MB' and child_.text:
+            sval_ = child_.text
+            try:
+                ival_ = int(sval_)
+            except (TypeError, ValueError) as exp:
+                raise_parse_error(child_, 'requires integer: %s' % exp)
+            ival_ = self.gds_validate_integer(ival_, node, 'FREE_MB')
+            self.FREE_MB = ival_
+        elif nodeName_ == 'USED_MB' and child_.text:
+            sval_ = child_.text
+            try:
+                ival_ = int(sval_)
+            except (TypeError, ValueError) as exp:
+                raise_parse_error(child_, 'requires integer: %s' % exp)
+            ival_ = self.gds_validate_integer(ival_, node, 'USED_MB')
+            self.USED_MB = ival_
+        elif nodeName_ == 'IMAGES':
+            obj_ = IMAGESType.factory()
+            obj_.build(child_)
+            self.IMAGES = obj_
+            obj_.original_tagname_ = 'IMAGES'
+        elif nodeName_ == 'TEMPLATE':
+            TEMPLATE_ = child_.text
+            TEMPLATE_ = self.gds_validate_string(TEMPLATE_, node, 'TEMPLATE')
+            self.TEMPLATE = TEMPLATE_
+# end class DATASTORE
+
+
+class PERMISSIONSType1(GeneratedsSuper):
+    subclass = None
+    superclass = None
+    def __init__(self, OWNER_U=None, OWNER_M=None, OWNER_A=None, GROUP_U=None, GROUP_M=None, GROUP_A=None, OTHER_U=None, OTHER_M=None, OTHER_A=None):
+        self.original_tagname_ = None
+        self.OWNER_U = OWNER_U
+        self.OWNER_M = OWNER_M
+        self.OWNER_A = OWNER_A
+        self.GROUP_U = GROUP_U
+        self.GROUP_M = GROUP_M
+        self.GROUP_A = GROUP_A
+        self.OTHER_U = OTHER_U
+        self.OTHER_M = OTHER_M
+        self.OTHER_A = OTHER_A
+    def factory(*args_, **kwargs_):
+        if supermod.CurrentSubclassModule_ is not None:
+            subclass = getSubclassFromModule_(
+                supermod.CurrentSubclassModule_, PERMISSIONSType1)
+            if subclass is not None:
+                return subclass(*args_, **kwargs_)
+        if PERMISSIONSType1.subclass:
+            return PERMISSIONSType1.subclass(*args_, **kwargs_)
+        else:
+            return PERMISSIONSType1(*args_, **kwargs_)
+    factory = staticmethod(factory)
+    def get_OWNER_U(self): return self.OWNER_U
+    def set_OWNER_U(self, OWNER_U): self.OWNER_U = OWNER_U
+    def get_OWNER_M(self): return self.OWNER_M
+    def set_OWNER_M(self, OWNER_M): self.OWNER_M = OWNER_M
+    def get_OWNER_A(self): return self.OWNER_A
+    def set_OWNER_A(self, OWNER_A): self.OWNER_A = OWNER_A
+    def get_GROUP_U(self): return self.GROUP_U
+    def set_GROUP_U(self, GROUP_U): self.GROUP_U = GROUP_U
+    def get_GROUP_M(self): return self.GROUP_M
+    def set_GROUP_M(self, GROUP_M): self.GROUP_M = GROUP_M
+    def get_GROUP_A(self): return self.GROUP_A
+    def set_GROUP_A(self, GROUP_A): self.GROUP_A = GROUP_A
+    def get_OTHER_U(self): return self.OTHER_U
+    def set_OTHER_U(self, OTHER_U): self.OTHER_U = OTHER_U
+    def get_OTHER_M(self): return self.OTHER_M
+    def set_OTHER_M(self, OTHER_M): self.OTHER_M = OTHER_M
+    def get_OTHER_A(self): return self.OTHER_A
+    def set_OTHER_A(self, OTHER_A): self.OTHER_A = OTHER_A
+    def hasContent_(self):
+        if (
+            self.OWNER_U is not None or
+            self.OWNER_M is not None or
+            self.OWNER_A is not None or
+            self.GROUP_U is not None or
+            self.GROUP_M is not None or
+            self.GROUP_A is not None or
+            self.OTHER_U is not None or
+            self.OTHER_M is not None or
+            self.OTHER_A is not None
+        ):
+            return True
+        else:
+            return False
+    def export(self, outfile, level, namespaceprefix_='', name_='PERMISSIONSType1', namespacedef_='', pretty_print=True):
+        imported_ns_def_ = GenerateDSNamespaceDefs_.get('PERMISSIONSType1')
+        if imported_ns_def_ is not None:
+            namespacedef_ = imported_ns_def_
+        if pretty_print:
+            eol_ = '\n'
+        else:
+            eol_ = ''
+        if self.original_tagname_ is not None:
+            name_ = self.original_tagname_
+        showIndent(outfile, level, pretty_print)
+        outfile.write('<%s%s%s' % (namespaceprefix_, name_, namespacedef_ and ' ' + namespacedef_ or '', ))
+        already_processed = set()
+        self.exportAttributes(outfile, level, already_processed, namespaceprefix_, name_='PERMISSIONSType1')
+        if self.hasContent_():
+            outfile.write('>%s' % (eol_, ))
+            self.exportChildren(outfile, level + 1, namespaceprefix_='', name_='PERMISSIONSType1', pretty_print=pretty_print)
+            showIndent(outfile, level, pretty_print)
+            outfile.write('</%s%s>%s' % (namespaceprefix_, name_, eol_))
+        else:
+            outfile.write('/>%s' % (eol_, ))
+    def exportAttributes(self, outfile, level, already_processed, namespaceprefix_='', name_='PERMISSIONSType1'):
+        pass
+    def exportChildren(self, outfile, level, namespaceprefix_='', name_='PERMISSIONSType1', fromsubclass_=False, pretty_print=True):
+        if pretty_print:
+            eol_ = '\n'
+        else:
+            eol_ = ''
+        if self.OWNER_U is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<OWNER_U>%s</OWNER_U>%s' % (self.gds_format_integer(self.OWNER_U, input_name='OWNER_U'), eol_))
+        if self.OWNER_M is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<OWNER_M>%s</OWNER_M>%s' % (self.gds_format_integer(self.OWNER_M, input_name='OWNER_M'), eol_))
+        if self.OWNER_A is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<OWNER_A>%s</OWNER_A>%s' % (self.gds_format_integer(self.OWNER_A, input_name='OWNER_A'), eol_))
+        if self.GROUP_U is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<GROUP_U>%s</GROUP_U>%s' % (self.gds_format_integer(self.GROUP_U, input_name='GROUP_U'), eol_))
+        if self.GROUP_M is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<GROUP_M>%s</GROUP_M>%s' % (self.gds_format_integer(self.GROUP_M, input_name='GROUP_M'), eol_))
+        if self.GROUP_A is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<GROUP_A>%s</GROUP_A>%s' % (self.gds_format_integer(self.GROUP_A, input_name='GROUP_A'), eol_))
+        if self.OTHER_U is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<OTHER_U>%s</OTHER_U>%s' % (self.gds_format_integer(self.OTHER_U, input_name='OTHER_U'), eol_))
+        if self.OTHER_M is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<OTHER_M>%s</OTHER_M>%s' % (self.gds_format_integer(self.OTHER_M, input_name='OTHER_M'), eol_))
+        if self.OTHER_A is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<OTHER_A>%s</OTHER_A>%s' % (self.gds_format_integer(self.OTHER_A, input_name='OTHER_A'), eol_))
+    def build(self, node):
+        already_processed = set()
+        self.buildAttributes(node, node.attrib, already_processed)
+        for child in node:
+            nodeName_ = Tag_pattern_.match(child.tag).groups()[-1]
+            self.buildChildren(child, node, nodeName_)
+        return self
+    def buildAttributes(self, node, attrs, already_processed):
+        pass
+    def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
+        if nodeName_ == 'OWNER_U' and child_.text:
+            sval_ = child_.text
+            try:
+                ival_ = int(sval_)
+            except (TypeError, ValueError) as exp:
+                raise_parse_error(child_, 'requires integer: %s' % exp)
+            ival_ = self.gds_validate_integer(ival_, node, 'OWNER_U')
+            self.OWNER_U = ival_
+        elif nodeName_ == 'OWNER_M' and child_.text:
+            sval_ = child_.text
+            try:
+                ival_ = int(sval_)
+            except (TypeError, ValueError) as exp:
+                raise_parse_error(child_, 'requires integer: %s' % exp)
+            ival_ = self.gds_validate_integer(ival_, node, 'OWNER_M')
+            self.OWNER_M = ival_
+        elif nodeName_ == 'OWNER_A' and child_.text:
+            sval_ = child_.text
+            try:
+                ival_ = int(sval_)
+            except (TypeError, ValueError) as exp:
+                raise_parse_error(child_, 'requires integer: %s' % exp)
+            ival_ = self.gds_validate_integer(ival_, node, 'OWNER_A')
+            self.OWNER_A = ival_
+        elif nodeName_ == 'GROUP_U' and child_.text:
+            sval_ = child_.text
+            try:
+                ival_ = int(sval_)
+            except (TypeError, ValueError) as exp:
+                raise_parse_error(child_, 'requires integer: %s' % exp)
+            ival_ = self.gds_validate_integer(ival_, node, 'GROUP_U')
+            self.GROUP_U = ival_
+        elif nodeName_ == 'GROUP_M' and child_.text:
+            sval_ = child_.text
+            try:
+                ival_ = int(sval_)
+            except (TypeError, ValueError) as exp:
+                raise_parse_error(child_, 'requires integer: %s' % exp)
+            ival_ = self.gds_validate_integer(ival_, node, 'GROUP_M')
+            self.GROUP_M = ival_
+        elif nodeName_ == 'GROUP_A' and child_.text:
+            sval_ = child_.text
+            try:
+                ival_ = int(sval_)
+            except (TypeError, ValueError) as exp:
+                raise_parse_error(child_, 'requires integer: %s' % exp)
+            ival_ = self.gds_validate_integer(ival_, node, 'GROUP_A')
+            self.GROUP_A = ival_
+        elif nodeName_ == 'OTHER_U' and child_.text:
+            sval_ = child_.text
+            try:
+                ival_ = int(sval_)
+            except (TypeError, ValueError) as exp:
+                raise_parse_error(child_, 'requires integer: %s' % exp)
+            ival_ = self.gds_validate_integer(ival_, node, 'OTHER_U')
+            self.OTHER_U = ival_
+        elif nodeName_ == 'OTHER_M' and child_.text:
+            sval_ = child_.text
+            try:
+                ival_ = int(sval_)
+            except (TypeError, ValueError) as exp:
+                raise_parse_error(child_, 'requires integer: %s' % exp)
+            ival_ = self.gds_validate_integer(ival_, node, 'OTHER_M')
+            self.OTHER_M = ival_
+        elif nodeName_ == 'OTHER_A' and child_.text:
+            sval_ = child_.text
+            try:
+                ival_ = int(sval_)
+            except (TypeError, ValueError) as exp:
+                raise_parse_error(child_, 'requires integer: %s' % exp)
+            ival_ = self.gds_validate_integer(ival_, node, 'OTHER_A')
+            self.OTHER_A = ival_
+# end class PERMISSIONSType1
+
+
+class CLUSTERSType(GeneratedsSuper):
+    subclass = None
+    superclass = None
+    def __init__(self, ID=None):
+        self.original_tagname_ = None
+        if ID is None:
+            self.ID = []
+        else:
+            self.ID = ID
+    def factory(*args_, **kwargs_):
+        if supermod.CurrentSubclassModule_ is not None:
+            subclass = getSubclassFromModule_(
+                supermod.CurrentSubclassModule_, CLUSTERSType)
+            if subclass is not None:
+                return subclass(*args_, **kwargs_)
+        if CLUSTERSType.subclass:
+            return CLUSTERSType.subclass(*args_, **kwargs_)
+        else:
+            return CLUSTERSType(*args_, **kwargs_)
+    factory = staticmethod(factory)
+    def get_ID(self): return self.ID
+    def set_ID(self, ID): self.ID = ID
+    def add_ID(self, value): self.ID.append(value)
+    def insert_ID_at(self, index, value): self.ID.insert(index, value)
+    def replace_ID_at(self, index, value): self.ID[index] = value
+    def hasContent_(self):
+        if (
+            self.ID
+        ):
+            return True
+        else:
+            return False
+    def export(self, outfile, level, namespaceprefix_='', name_='CLUSTERSType', namespacedef_='', pretty_print=True):
+        imported_ns_def_ = GenerateDSNamespaceDefs_.get('CLUSTERSType')
+        if imported_ns_def_ is not None:
+            namespacedef_ = imported_ns_def_
+        if pretty_print:
+            eol_ = '\n'
+        else:
+            eol_ = ''
+        if self.original_tagname_ is not None:
+            name_ = self.original_tagname_
+        showIndent(outfile, level, pretty_print)
+        outfile.write('<%s%s%s' % (namespaceprefix_, name_, namespacedef_ and ' ' + namespacedef_ or '', ))
+        already_processed = set()
+        self.exportAttributes(outfile, level, already_processed, namespaceprefix_, name_='CLUSTERSType')
+        if self.hasContent_():
+            outfile.write('>%s' % (eol_, ))
+            self.exportChildren(outfile, level + 1, namespaceprefix_='', name_='CLUSTERSType', pretty_print=pretty_print)
+            showIndent(outfile, level, pretty_print)
+            outfile.write('</%s%s>%s' % (namespaceprefix_, name_, eol_))
+        else:
+            outfile.write('/>%s' % (eol_, ))
+    def exportAttributes(self, outfile, level, already_processed, namespaceprefix_='', name_='CLUSTERSType'):
+        pass
+    def exportChildren(self, outfile, level, namespaceprefix_='', name_='CLUSTERSType', fromsubclass_=False, pretty_print=True):
+        if pretty_print:
+            eol_ = '\n'
+        else:
+            eol_ = ''
+        for ID_ in self.ID:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<ID>%s</ID>%s' % (self.gds_format_integer(ID_, input_name='ID'), eol_))
+    def build(self, node):
+        already_processed = set()
+        self.buildAttributes(node, node.attrib, already_processed)
+        for child in node:
+            nodeName_ = Tag_pattern_.match(child.tag).groups()[-1]
+            self.buildChildren(child, node, nodeName_)
+        return self
+    def buildAttributes(self, node, attrs, already_processed):
+        pass
+    def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
+        if nodeName_ == 'ID' and child_.text:
+            sval_ = child_.text
+            try:
+                ival_ = int(sval_)
+            except (TypeError, ValueError) as exp:
+                raise_parse_error(child_, 'requires integer: %s' % exp)
+            ival_ = self.gds_validate_integer(ival_, node, 'ID')
+            self.ID.append(ival_)
+# end class CLUSTERSType
+
+
+class IMAGESType(GeneratedsSuper):
+    subclass = None
+    superclass = None
+    def __init__(self, ID=None):
+        self.original_tagname_ = None
+        if ID is None:
+            self.ID = []
+        else:
+            self.ID = ID
+    def factory(*args_, **kwargs_):
+        if supermod.CurrentSubclassModule_ is not None:
+            subclass = getSubclassFromModule_(
+                supermod.CurrentSubclassModule_, IMAGESType)
+            if subclass is not None:
+                return subclass(*args_, **kwargs_)
+        if IMAGESType.subclass:
+            return IMAGESType.subclass(*args_, **kwargs_)
+        else:
+            return IMAGESType(*args_, **kwargs_)
+    factory = staticmethod(factory)
+    def get_ID(self): return self.ID
+    def set_ID(self, ID): self.ID = ID
+    def add_ID(self, value): self.ID.append(value)
+    def insert_ID_at(self, index, value): self.ID.insert(index, value)
+    def replace_ID_at(self, index, value): self.ID[index] = value
+    def hasContent_(self):
+        if (
+            self.ID
+        ):
+            return True
+        else:
+            return False
+    def export(self, outfile, level, namespaceprefix_='', name_='IMAGESType', namespacedef_='', pretty_print=True):
+        imported_ns_def_ = GenerateDSNamespaceDefs_.get('IMAGESType')
+        if imported_ns_def_ is not None:
+            namespacedef_ = imported_ns_def_
+        if pretty_print:
+            eol_ = '\n'
+        else:
+            eol_ = ''
+        if self.original_tagname_ is not None:
+            name_ = self.original_tagname_
+        showIndent(outfile, level, pretty_print)
+        outfile.write('<%s%s%s' % (namespaceprefix_, name_, namespacedef_ and ' ' + namespacedef_ or '', ))
+        already_processed = set()
+        self.exportAttributes(outfile, level, already_processed, namespaceprefix_, name_='IMAGESType')
+        if self.hasContent_():
+            outfile.write('>%s' % (eol_, ))
+            self.exportChildren(outfile, level + 1, namespaceprefix_='', name_='IMAGESType', pretty_print=pretty_print)
+            showIndent(outfile, level, pretty_print)
+            outfile.write('</%s%s>%s' % (namespaceprefix_, name_, eol_))
+        else:
+            outfile.write('/>%s' % (eol_, ))
+    def exportAttributes(self, outfile, level, already_processed, namespaceprefix_='', name_='IMAGESType'):
+        pass
+    def exportChildren(self, outfile, level, namespaceprefix_='', name_='IMAGESType', fromsubclass_=False, pretty_print=True):
+        if pretty_print:
+            eol_ = '\n'
+        else:
+            eol_ = ''
+        for ID_ in self.ID:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<ID>%s</ID>%s' % (self.gds_format_integer(ID_, input_name='ID'), eol_))
+    def build(self, node):
+        already_processed = set()
+        self.buildAttributes(node, node.attrib, already_processed)
+        for child in node:
+            nodeName_ = Tag_pattern_.match(child.tag).groups()[-1]
+            self.buildChildren(child, node, nodeName_)
+        return self
+    def buildAttributes(self, node, attrs, already_processed):
+        pass
+    def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
+        if nodeName_ == 'ID' and child_.text:
+            sval_ = child_.text
+            try:
+                ival_ = int(sval_)
+            except (TypeError, ValueError) as exp:
+                raise_parse_error(child_, 'requires integer: %s' % exp)
+            ival_ = self.gds_validate_integer(ival_, node, 'ID')
+            self.ID.append(ival_)
+# end class IMAGESType
+
+
+class DATASTORE_POOLSub(TemplatedType, DATASTORE_POOL):
+    def __init__(self, DATASTORE=None):
+        super(DATASTORE_POOLSub, self).__init__(DATASTORE, )
+DATASTORE_POOL.subclass = DATASTORE_POOLSub
+# end class DATASTORE_POOLSub
+
+
+class DATASTORESub(TemplatedType, DATASTORE):
+    def __init__(self, ID=None, UID=None, GID=None, UNAME=None, GNAME=None, NAME=None, PERMISSIONS=None, DS_MAD=None, TM_MAD=None, BASE_PATH=None, TYPE=None, DISK_TYPE=None, STATE=None, CLUSTERS=None, TOTAL_MB=None, FREE_MB=None, USED_MB=None, IMAGES=None, TEMPLATE=None):
+        super(DATASTORESub, self).__init__(ID, UID, GID, UNAME, GNAME, NAME, PERMISSIONS, DS_MAD, TM_MAD, BASE_PATH, TYPE, DISK_TYPE, STATE, CLUSTERS, TOTAL_MB, FREE_MB, USED_MB, IMAGES, TEMPLATE, )
+DATASTORE.subclass = DATASTORESub
+# end class DATASTORESub
+
+
+class PERMISSIONSType1Sub(TemplatedType, PERMISSIONSType1):
+    def __init__(self, OWNER_U=None, OWNER_M=None, OWNER_A=None, GROUP_U=None, GROUP_M=None, GROUP_A=None, OTHER_U=None, OTHER_M=None, OTHER_A=None):
+        super(PERMISSIONSType1Sub, self).__init__(OWNER_U, OWNER_M, OWNER_A, GROUP_U, GROUP_M, GROUP_A, OTHER_U, OTHER_M, OTHER_A, )
+PERMISSIONSType1.subclass = PERMISSIONSType1Sub
+# end class PERMISSIONSType1Sub
+
+
+class CLUSTERSTypeSub(TemplatedType, CLUSTERSType):
+    def __init__(self, ID=None):
+        super(CLUSTERSTypeSub, self).__init__(ID, )
+CLUSTERSType.subclass = CLUSTERSTypeSub
+# end class CLUSTERSTypeSub
+
+
+class IMAGESTypeSub(TemplatedType, IMAGESType):
+    def __init__(self, ID=None):
+        super(IMAGESTypeSub, self).__init__(ID, )
+IMAGESType.subclass = IMAGESTypeSub
+# end class IMAGESTypeSub
+
+
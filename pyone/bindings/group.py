@@ -0,0 +1,2170 @@
+#!/usr/bin/env python
+
+#
+# Bindings of GROUP, generated by generateDS.py and split from supbind by src/split_bindings.py
+#
+
+import sys
+import re as re_
+import base64
+import datetime as datetime_
+import warnings as warnings_
+try:
+    from lxml import etree as etree_
+except ImportError:
+    from xml.etree import ElementTree as etree_
+from pyone.util import TemplatedType
+from . import supbind as supermod
+from .supbind import (
+    GenerateDSNamespaceDefs_,
+    GeneratedsSuper,
+    Tag_pattern_,
+    getSubclassFromModule_,
+    quote_xml,
+    raise_parse_error,
+    showIndent,
+)
+
+
+class GROUP(GeneratedsSuper):
+    subclass = None
+    superclass = None
+    def __init__(self, ID=None, NAME=None, TEMPLATE=None, USERS=None, ADMINS=None, DATASTORE_QUOTA=None, NETWORK_QUOTA=None, VM_QUOTA=None, IMAGE_QUOTA=None, DEFAULT_GROUP_QUOTAS=None):
+        self.original_tagname_ = None
+        self.ID = ID
+        self.NAME = NAME
+        self.TEMPLATE = TEMPLATE
+        self.USERS = USERS
+        self.ADMINS = ADMINS
+        self.DATASTORE_QUOTA = DATASTORE_QUOTA
+        self.NETWORK_QUOTA = NETWORK_QUOTA
+        self.VM_QUOTA = VM_QUOTA
+        self.IMAGE_QUOTA = IMAGE_QUOTA
+        self.DEFAULT_GROUP_QUOTAS = DEFAULT_GROUP_QUOTAS
+    def factory(*args_, **kwargs_):
+        if supermod.CurrentSubclassModule_ is not None:
+            subclass = getSubclassFromModule_(
+                supermod.CurrentSubclassModule_, GROUP)
+            if subclass is not None:
+                return subclass(*args_, **kwargs_)
+        if GROUP.subclass:
+            return GROUP.subclass(*args_, **kwargs_)
+        else:
+            return GROUP(*args_, **kwargs_)
+    factory = staticmethod(factory)
+    def get_ID(self): return self.ID
+    def set_ID(self, ID): self.ID = ID
+    def get_NAME(self): return self.NAME
+    def set_NAME(self, NAME): self.NAME = NAME
+    def get_TEMPLATE(self): return self.TEMPLATE
+    def set_TEMPLATE(self, TEMPLATE): self.TEMPLATE = TEMPLATE
+    def get_USERS(self): return self.USERS
+    def set_USERS(self, USERS): self.USERS = USERS
+    def get_ADMINS(self): return self.ADMINS
+    def set_ADMINS(self, ADMINS): self.ADMINS = ADMINS
+    def get_DATASTORE_QUOTA(self): return self.DATASTORE_QUOTA
+    def set_DATASTORE_QUOTA(self, DATASTORE_QUOTA): self.DATASTORE_QUOTA = DATASTORE_QUOTA
+    def get_NETWORK_QUOTA(self): return self.NETWORK_QUOTA
+    def set_NETWORK_QUOTA(self, NETWORK_QUOTA): self.NETWORK_QUOTA = NETWORK_QUOTA
+    def get_VM_QUOTA(self): return self.VM_QUOTA
+    def set_VM_QUOTA(self, VM_QUOTA): self.VM_QUOTA = VM_QUOTA
+    def get_IMAGE_QUOTA(self): return self.IMAGE_QUOTA
+    def set_IMAGE_QUOTA(self, IMAGE_QUOTA): self.IMAGE_QUOTA = IMAGE_QUOTA
+    def get_DEFAULT_GROUP_QUOTAS(self): return self.DEFAULT_GROUP_QUOTAS
+    def set_DEFAULT_GROUP_QUOTAS(self, DEFAULT_GROUP_QUOTAS): self.DEFAULT_GROUP_QUOTAS = DEFAULT_GROUP_QUOTAS
+    def hasContent_(self):
+        if (
+            self.ID is not None or
+            self.NAME is not None or
+            self.TEMPLATE is not None or
+            self.USERS is not None or
+            self.ADMINS is not None or
+            self.DATASTORE_QUOTA is not None or
+            self.NETWORK_QUOTA is not None or
+            self.VM_QUOTA is not None or
+            self.IMAGE_QUOTA is not None or
+            self.DEFAULT_GROUP_QUOTAS is not None
+        ):
+            return True
+        else:
+            return False
+    def export(self, outfile, level, namespaceprefix_='', name_='GROUP', namespacedef_='', pretty_print=True):
+        imported_ns_def_ = GenerateDSNamespaceDefs_.get('GROUP')
+        if imported_ns_def_ is not None:
+            namespacedef_ = imported_ns_def_
+        if pretty_print:
+            eol_ = '\n'
+        else:
+            eol_ = ''
+        if self.original_tagname_ is not None:
+            name_ = self.original_tagname_
+        showIndent(outfile, level, pretty_print)
+        outfile.write('<%s%s%s' % (namespaceprefix_, name_, namespacedef_ and ' ' + namespacedef_ or '', ))
+        already_processed = set()
+        self.exportAttributes(outfile, level, already_processed, namespaceprefix_, name_='GROUP')
+        if self.hasContent_():
+            outfile.write('>%s' % (eol_, ))
+            self.exportChildren(outfile, level + 1, namespaceprefix_='', name_='GROUP', pretty_print=pretty_print)
+            showIndent(outfile, level, pretty_print)
+            outfile.write('</%s%s>%s' % (namespaceprefix_, name_, eol_))
+        else:
+            outfile.write('/>%s' % (eol_, ))
+    def exportAttributes(self, outfile, level, already_processed, namespaceprefix_='', name_='GROUP'):
+        pass
+    def exportChildren(self, outfile, level, namespaceprefix_='', name_='GROUP', fromsubclass_=False, pretty_print=True):
+        if pretty_print:
+            eol_ = '\n'
+        else:
+            eol_ = ''
+        if self.ID is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<ID>%s</ID>%s' % (self.gds_format_integer(self.ID, input_name='ID'), eol_))
+        if self.NAME is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<NAME>%s</NAME>%s' % (self.gds_encode(self.gds_format_string(quote_xml(self.NAME), input_name='NAME')), eol_))
+        if self.TEMPLATE is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<TEMPLATE>%s</TEMPLATE>%s' % (self.gds_encode(self.gds_format_string(quote_xml(self.TEMPLATE), input_name='TEMPLATE')), eol_))
+        if self.USERS is not None:
+            self.USERS.export(outfile, level, namespaceprefix_, name_='USERS', pretty_print=pretty_print)
+        if self.ADMINS is not None:
+            self.ADMINS.export(outfile, level, namespaceprefix_, name_='ADMINS', pretty_print=pretty_print)
+        if self.DATASTORE_QUOTA is not None:
+            self.DATASTORE_QUOTA.export(outfile, level, namespaceprefix_, name_='DATASTORE_QUOTA', pretty_print=pretty_print)
+        if self.NETWORK_QUOTA is not None:
+            self.NETWORK_QUOTA.export(outfile, level, namespaceprefix_, name_='NETWORK_QUOTA', pretty_print=pretty_print)
+        if self.VM_QUOTA is not None:
+            self.VM_QUOTA.export(outfile, level, namespaceprefix_, name_='VM_QUOTA', pretty_print=pretty_print)
+        if self.IMAGE_QUOTA is not None:
+            self.IMAGE_QUOTA.export(outfile, level, namespaceprefix_, name_='IMAGE_QUOTA', pretty_print=pretty_print)
+        if self.DEFAULT_GROUP_QUOTAS is not None:
+            self.DEFAULT_GROUP_QUOTAS.export(outfile, level, namespaceprefix_, name_='DEFAULT_GROUP_QUOTAS', pretty_print=pretty_print)
+    def build(self, node):
+        already_processed = set()
+        self.buildAttributes(node, node.attrib, already_processed)
+        for child in node:
+            nodeName_ = Tag_pattern_.match(child.tag).groups()[-1]
+            self.buildChildren(child, node, nodeName_)
+        return self
+    def buildAttributes(self, node, attrs, already_processed):
+        pass
+    def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
+        if nodeName_ == 'ID' and child_.text:
+            sval_ = child_.text
+            try:
+                ival_ = int(sval_)
+            except (TypeError, ValueError) as exp:
+                raise_parse_error(child_, 'requires integer: %s' % exp)
+            ival_ = self.gds_validate_integer(ival_, node, 'ID')
+            self.ID = ival_
+        elif nodeName_ == 'NAME':
+            NAME_ = child_.text
+            NAME_ = self.gds_validate_string(NAME_, node, 'NAME')
+            self.NAME = NAME_
+        elif nodeName_ == 'TEMPLATE':
+            TEMPLATE_ = child_.text
+            TEMPLATE_ = self.gds_validate_string(TEMPLATE_, node, 'TEMPLATE')
+            self.TEMPLATE = TEMPLATE_
+        elif nodeName_ == 'USERS':
+            obj_ = USERSType11.factory()
+            obj_.build(child_)
+            self.USERS = obj_
+            obj_.original_tagname_ = 'USERS'
+        elif nodeName_ == 'ADMINS':
+            obj_ = ADMINSType12.factory()
+            obj_.build(child_)
+            self.ADMINS = obj_
+            obj_.original_tagname_ = 'ADMINS'
+        elif nodeName_ == 'DATASTORE_QUOTA':
+            obj_ = DATASTORE_QUOTAType13.factory()
+            obj_.build(child_)
+            self.DATASTORE_QUOTA = obj_
+            obj_.original_tagname_ = 'DATASTORE_QUOTA'
+        elif nodeName_ == 'NETWORK_QUOTA':
+            obj_ = NETWORK_QUOTAType15.factory()
+            obj_.build(child_)
+            self.NETWORK_QUOTA = obj_
+            obj_.original_tagname_ = 'NETWORK_QUOTA'
+        elif nodeName_ == 'VM_QUOTA':
+            obj_ = VM_QUOTAType17.factory()
+            obj_.build(child_)
+            self.VM_QUOTA = obj_
+            obj_.original_tagname_ = 'VM_QUOTA'
+        elif nodeName_ == 'IMAGE_QUOTA':
+            obj_ = IMAGE_QUOTAType19.factory()
+            obj_.build(child_)
+            self.IMAGE_QUOTA = obj_
+            obj_.original_tagname_ = 'IMAGE_QUOTA'
+        elif nodeName_ == 'DEFAULT_GROUP_QUOTAS':
+            obj_ = DEFAULT_GROUP_QUOTASType21.factory()
+            obj_.build(child_)
+            self.DEFAULT_GROUP_QUOTAS = obj_
+            obj_.original_tagname_ = 'DEFAULT_GROUP_QUOTAS'
+# end class GROUP
+
+
+class USERSType11(GeneratedsSuper):
+    subclass = None
+    superclass = None
+    def __init__(self, ID=None):
+        self.original_tagname_ = None
+        if ID is None:
+            self.ID = []
+        else:
+            self.ID = ID
+    def factory(*args_, **kwargs_):
+        if supermod.CurrentSubclassModule_ is not None:
+            subclass = getSubclassFromModule_(
+                supermod.CurrentSubclassModule_, USERSType11)
+            if subclass is not None:
+                return subclass(*args_, **kwargs_)
+        if USERSType11.subclass:
+            return USERSType11.subclass(*args_, **kwargs_)
+        else:
+            return USERSType11(*args_, **kwargs_)
+    factory = staticmethod(factory)
+    def get_ID(self): return self.ID
+    def set_ID(self, ID): self.ID = ID
+    def add_ID(self, value): self.ID.append(value)
+    def insert_ID_at(self, index, value): self.ID.insert(index, value)
+    def replace_ID_at(self, index, value): self.ID[index] = value
+    def hasContent_(self):
+        if (
+            self.ID
+        ):
+            return True
+        else:
+            return False
+    def export(self, outfile, level, namespaceprefix_='', name_='USERSType11', namespacedef_='', pretty_print=True):
+        imported_ns_def_ = GenerateDSNamespaceDefs_.get('USERSType11')
+        if imported_ns_def_ is not None:
+            namespacedef_ = imported_ns_def_
+        if pretty_print:
+            eol_ = '\n'
+        else:
+            eol_ = ''
+        if self.original_tagname_ is not None:
+            name_ = self.original_tagname_
+        showIndent(outfile, level, pretty_print)
+        outfile.write('<%s%s%s' % (namespaceprefix_, name_, namespacedef_ and ' ' + namespacedef_ or '', ))
+        already_processed = set()
+        self.exportAttributes(outfile, level, already_processed, namespaceprefix_, name_='USERSType11')
+        if self.hasContent_():
+            outfile.write('>%s' % (eol_, ))
+            self.exportChildren(outfile, level + 1, namespaceprefix_='', name_='USERSType11', pretty_print=pretty_print)
+            showIndent(outfile, level, pretty_print)
+            outfile.write('</%s%s>%s' % (namespaceprefix_, name_, eol_))
+        else:
+            outfile.write('/>%s' % (eol_, ))
+    def exportAttributes(self, outfile, level, already_processed, namespaceprefix_='', name_='USERSType11'):
+        pass
+    def exportChildren(self, outfile, level, namespaceprefix_='', name_='USERSType11', fromsubclass_=False, pretty_print=True):
+        if pretty_print:
+            eol_ = '\n'
+        else:
+            eol_ = ''
+        for ID_ in self.ID:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<ID>%s</ID>%s' % (self.gds_format_integer(ID_, input_name='ID'), eol_))
+    def build(self, node):
+        already_processed = set()
+        self.buildAttributes(node, node.attrib, already_processed)
+        for child in node:
+            nodeName_ = Tag_pattern_.match(child.tag).groups()[-1]
+            self.buildChildren(child, node, nodeName_)
+        return self
+    def buildAttributes(self, node, attrs, already_processed):
+        pass
+    def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
+        if nodeName_ == 'ID' and child_.text:
+            sval_ = child_.text
+            try:
+                ival_ = int(sval_)
+            except (TypeError, ValueError) as exp:
+                raise_parse_error(child_, 'requires integer: %s' % exp)
+            ival_ = self.gds_validate_integer(ival_, node, 'ID')
+            self.ID.append(ival_)
+# end class USERSType11
+
+
+class ADMINSType12(GeneratedsSuper):
+    subclass = None
+    superclass = None
+    def __init__(self, ID=None):
+        self.original_tagname_ = None
+        if ID is None:
+            self.ID = []
+        else:
+            self.ID = ID
+    def factory(*args_, **kwargs_):
+        if supermod.CurrentSubclassModule_ is not None:
+            subclass = getSubclassFromModule_(
+                supermod.CurrentSubclassModule_, ADMINSType12)
+            if subclass is not None:
+                return subclass(*args_, **kwargs_)
+        if ADMINSType12.subclass:
+            return ADMINSType12.subclass(*args_, **kwargs_)
+        else:
+            return ADMINSType12(*args_, **kwargs_)
+    factory = staticmethod(factory)
+    def get_ID(self): return self.ID
+    def set_ID(self, ID): self.ID = ID
+    def add_ID(self, value): self.ID.append(value)
+    def insert_ID_at(self, index, value): self.ID.insert(index, value)
+    def replace_ID_at(self, index, value): self.ID[index] = value
+    def hasContent_(self):
+        if (
+            self.ID
+        ):
+            return True
+        else:
+            return False
+    def export(self, outfile, level, namespaceprefix_='', name_='ADMINSType12', namespacedef_='', pretty_print=True):
+        imported_ns_def_ = GenerateDSNamespaceDefs_.get('ADMINSType12')
+        if imported_ns_def_ is not None:
+            namespacedef_ = imported_ns_def_
+        if pretty_print:
+            eol_ = '\n'
+        else:
+            eol_ = ''
+        if self.original_tagname_ is not None:
+            name_ = self.original_tagname_
+        showIndent(outfile, level, pretty_print)
+        outfile.write('<%s%s%s' % (namespaceprefix_, name_, namespacedef_ and ' ' + namespacedef_ or '', ))
+        already_processed = set()
+        self.exportAttributes(outfile, level, already_processed, namespaceprefix_, name_='ADMINSType12')
+        if self.hasContent_():
+            outfile.write('>%s' % (eol_, ))
+            self.exportChildren(outfile, level + 1, namespaceprefix_='', name_='ADMINSType12', pretty_print=pretty_print)
+            showIndent(outfile, level, pretty_print)
+            outfile.write('</%s%s>%s' % (namespaceprefix_, name_, eol_))
+        else:
+            outfile.write('/>%s' % (eol_, ))
+    def exportAttributes(self, outfile, level, already_processed, namespaceprefix_='', name_='ADMINSType12'):
+        pass
+    def exportChildren(self, outfile, level, namespaceprefix_='', name_='ADMINSType12', fromsubclass_=False, pretty_print=True):
+        if pretty_print:
+            eol_ = '\n'
+        else:
+            eol_ = ''
+        for ID_ in self.ID:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<ID>%s</ID>%s' % (self.gds_format_integer(ID_, input_name='ID'), eol_))
+    def build(self, node):
+        already_processed = set()
+        self.buildAttributes(node, node.attrib, already_processed)
+        for child in node:
+            nodeName_ = Tag_pattern_.match(child.tag).groups()[-1]
+            self.buildChildren(child, node, nodeName_)
+        return self
+    def buildAttributes(self, node, attrs, already_processed):
+        pass
+    def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
+        if nodeName_ == 'ID' and child_.text:
+            sval_ = child_.text
+            try:
+                ival_ = int(sval_)
+            except (TypeError, ValueError) as exp:
+                raise_parse_error(child_, 'requires integer: %s' % exp)
+            ival_ = self.gds_validate_integer(ival_, node, 'ID')
+            self.ID.append(ival_)
+# end class ADMINSType12
+
+
+class DATASTORE_QUOTAType13(GeneratedsSuper):
+    subclass = None
+    superclass = None
+    def __init__(self, DATASTORE=None):
+        self.original_tagname_ = None
+        if DATASTORE is None:
+            self.DATASTORE = []
+        else:
+            self.DATASTORE = DATASTORE
+    def factory(*args_, **kwargs_):
+        if supermod.CurrentSubclassModule_ is not None:
+            subclass = getSubclassFromModule_(
+                supermod.CurrentSubclassModule_, DATASTORE_QUOTAType13)
+            if subclass is not None:
+                return subclass(*args_, **kwargs_)
+        if DATASTORE_QUOTAType13.subclass:
+            return DATASTORE_QUOTAType13.subclass(*args_, **kwargs_)
+        else:
+            return DATASTORE_QUOTAType13(*args_, **kwargs_)
+    factory = staticmethod(factory)
+    def get_DATASTORE(self): return self.DATASTORE
+    def set_DATASTORE(self, DATASTORE): self.DATASTORE = DATASTORE
+    def add_DATASTORE(self, value): self.DATASTORE.append(value)
+    def insert_DATASTORE_at(self, index, value): self.DATASTORE.insert(index, value)
+    def replace_DATASTORE_at(self, index, value): self.DATASTORE[index] = value
+    def hasContent_(self):
+        if (
+            self.DATASTORE
+        ):
+            return True
+        else:
+            return False
+    def export(self, outfile, level, namespaceprefix_='', name_='DATASTORE_QUOTAType13', namespacedef_='', pretty_print=True):
+        imported_ns_def_ = GenerateDSNamespaceDefs_.get('DATASTORE_QUOTAType13')
+        if imported_ns_def_ is not None:
+            namespacedef_ = imported_ns_def_
+        if pretty_print:
+            eol_ = '\n'
+        else:
+            eol_ = ''
+        if self.original_tagname_ is not None:
+            name_ = self.original_tagname_
+        showIndent(outfile, level, pretty_print)
+        outfile.write('<%s%s%s' % (namespaceprefix_, name_, namespacedef_ and ' ' + namespacedef_ or '', ))
+        already_processed = set()
+        self.exportAttributes(outfile, level, already_processed, namespaceprefix_, name_='DATASTORE_QUOTAType13')
+        if self.hasContent_():
+            outfile.write('>%s' % (eol_, ))
+            self.exportChildren(outfile, level + 1, namespaceprefix_='', name_='DATASTORE_QUOTAType13', pretty_print=pretty_print)
+            showIndent(outfile, level, pretty_print)
+            outfile.write('</%s%s>%s' % (namespaceprefix_, name_, eol_))
+        else:
+            outfile.write('/>%s' % (eol_, ))
+    def exportAttributes(self, outfile, level, already_processed, namespaceprefix_='', name_='DATASTORE_QUOTAType13'):
+        pass
+    def exportChildren(self, outfile, level, namespaceprefix_='', name_='DATASTORE_QUOTAType13', fromsubclass_=False, pretty_print=True):
+        if pretty_print:
+            eol_ = '\n'
+        else:
+            eol_ = ''
+        for DATASTORE_ in self.DATASTORE:
+            DATASTORE_.export(outfile, level, namespaceprefix_, name_='DATASTORE', pretty_print=pretty_print)
+    def build(self, node):
+        already_processed = set()
+        self.buildAttributes(node, node.attrib, already_processed)
+        for child in node:
+            nodeName_ = Tag_pattern_.match(child.tag).groups()[-1]
+            self.buildChildren(child, node, nodeName_)
+        return self
+    def buildAttributes(self, node, attrs, already_processed):
+        pass
+    def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
+        if nodeName_ == 'DATASTORE':
+            obj_ = DATASTOREType14.factory()
+            obj_.build(child_)
+            self.DATASTORE.append(obj_)
+            obj_.original_tagname_ = 'DATASTORE'
+# end class DATASTORE_QUOTAType13
+
+
+class DATASTOREType14(GeneratedsSuper):
+    subclass = None
+    superclass = None
+    def __init__(self, ID=None, IMAGES=None, IMAGES_USED=None, SIZE=None, SIZE_USED=None):
+        self.original_tagname_ = None
+        self.ID = ID
+        self.IMAGES = IMAGES
+        self.IMAGES_USED = IMAGES_USED
+        self.SIZE = SIZE
+        self.SIZE_USED = SIZE_USED
+    def factory(*args_, **kwargs_):
+        if supermod.CurrentSubclassModule_ is not None:
+            subclass = getSubclassFromModule_(
+                supermod.CurrentSubclassModule_, DATASTOREType14)
+            if subclass is not None:
+                return subclass(*args_, **kwargs_)
+        if DATASTOREType14.subclass:
+            return DATASTOREType14.subclass(*args_, **kwargs_)
+        else:
+            return DATASTOREType14(*args_, **kwargs_)
+    factory = staticmethod(factory)
+    def get_ID(self): return self.ID
+    def set_ID(self, ID): self.ID = ID
+    def get_IMAGES(self): return self.IMAGES
+    def set_IMAGES(self, IMAGES): self.IMAGES = IMAGES
+    def get_IMAGES_USED(self): return self.IMAGES_USED
+    def set_IMAGES_USED(self, IMAGES_USED): self.IMAGES_USED = IMAGES_USED
+    def get_SIZE(self): return self.SIZE
+    def set_SIZE(self, SIZE): self.SIZE = SIZE
+    def get_SIZE_USED(self): return self.SIZE_USED
+    def set_SIZE_USED(self, SIZE_USED): self.SIZE_USED = SIZE_USED
+    def hasContent_(self):
+        if (
+            self.ID is not None or
+            self.IMAGES is not None or
+            self.IMAGES_USED is not None or
+            self.SIZE is not None or
+            self.SIZE_USED is not None
+        ):
+            return True
+        else:
+            return False
+    def export(self, outfile, level, namespaceprefix_='', name_='DATASTOREType14', namespacedef_='', pretty_print=True):
+        imported_ns_def_ = GenerateDSNamespaceDefs_.get('DATASTOREType14')
+        if imported_ns_def_ is not None:
+            namespacedef_ = imported_ns_def_
+        if pretty_print:
+            eol_ = '\n'
+        else:
+            eol_ = ''
+        if self.original_tagname_ is not None:
+            name_ = self.original_tagname_
+        showIndent(outfile, level, pretty_print)
+        outfile.write('<%s%s%s' % (namespaceprefix_, name_, namespacedef_ and ' ' + namespacedef_ or '', ))
+        already_processed = set()
+        self.exportAttributes(outfile, level, already_processed, namespaceprefix_, name_='DATASTOREType14')
+        if self.hasContent_():
+            outfile.write('>%s' % (eol_, ))
+            self.exportChildren(outfile, level + 1, namespaceprefix_='', name_='DATASTOREType14', pretty_print=pretty_print)
+            showIndent(outfile, level, pretty_print)
+            outfile.write('</%s%s>%s' % (namespaceprefix_, name_, eol_))
+        else:
+            outfile.write('/>%s' % (eol_, ))
+    def exportAttributes(self, outfile, level, already_processed, namespaceprefix_='', name_='DATASTOREType14'):
+        pass
+    def exportChildren(self, outfile, level, namespaceprefix_='', name_='DATASTOREType14', fromsubclass_=False, pretty_print=True):
+        if pretty_print:
+            eol_ = '\n'
+        else:
+            eol_ = ''
+        if self.ID is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<ID>%s</ID>%s' % (self.gds_encode(self.gds_format_string(quote_xml(self.ID), input_name='ID')), eol_))
+        if self.IMAGES is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<IMAGES>%s</IMAGES>%s' % (self.gds_encode(self.gds_format_string(quote_xml(self.IMAGES), input_name='IMAGES')), eol_))
+        if self.IMAGES_USED is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<IMAGES_USED>%s</IMAGES_USED>%s' % (self.gds_encode(self.gds_format_string(quote_xml(self.IMAGES_USED), input_name='IMAGES_USED')), eol_))
+        if self.SIZE is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<SIZE>%s</SIZE>%s' % (self.gds_encode(self.gds_format_string(quote_xml(self.SIZE), input_name='SIZE')), eol_))
+        if self.SIZE_USED is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<SIZE_USED>%s</SIZE_USED>%s' % (self.gds_encode(self.gds_format_string(quote_xml(self.SIZE_USED), input_name='SIZE_USED')), eol_))
+    def build(self, node):
+        already_processed = set()
+        self.buildAttributes(node, node.attrib, already_processed)
+        for child in node:
+            nodeName_ = Tag_pattern_.match(child.tag).groups()[-1]
+            self.buildChildren(child, node, nodeName_)
+        return self
+    def buildAttributes(self, node, attrs, already_processed):
+        pass
+    def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
+        if nodeName_ == 'ID':
+            ID_ = child_.text
+            ID_ = self.gds_validate_string(ID_, node, 'ID')
+            self.ID = ID_
+        elif nodeName_ == 'IMAGES':
+            IMAGES_ = child_.text
+            IMAGES_ = self.gds_validate_string(IMAGES_, node, 'IMAGES')
+            self.IMAGES = IMAGES_
+        elif nodeName_ == 'IMAGES_USED':
+            IMAGES_USED_ = child_.text
+            IMAGES_USED_ = self.gds_validate_string(IMAGES_USED_, node, 'IMAGES_USED')
+            self.IMAGES_USED = IMAGES_USED_
+        elif nodeName_ == 'SIZE':
+            SIZE_ = child_.text
+            SIZE_ = self.gds_validate_string(SIZE_, node, 'SIZE')
+            self.SIZE = SIZE_
+        elif nodeName_ == 'SIZE_USED':
+            SIZE_USED_ = child_.text
+            SIZE_USED_ = self.gds_validate_string(SIZE_USED_, node, 'SIZE_USED')
+            self.SIZE_USED = SIZE_USED_
+# end class DATASTOREType14
+
+
+class NETWORK_QUOTAType15(GeneratedsSuper):
+    subclass = None
+    superclass = None
+    def __init__(self, NETWORK=None):
+        self.original_tagname_ = None
+        if NETWORK is None:
+            self.NETWORK = []
+        else:
+            self.NETWORK = NETWORK
+    def factory(*args_, **kwargs_):
+        if supermod.CurrentSubclassModule_ is not None:
+            subclass = getSubclassFromModule_(
+                supermod.CurrentSubclassModule_, NETWORK_QUOTAType15)
+            if subclass is not None:
+                return subclass(*args_, **kwargs_)
+        if NETWORK_QUOTAType15.subclass:
+            return NETWORK_QUOTAType15.subclass(*args_, **kwargs_)
+        else:
+            return NETWORK_QUOTAType15(*args_, **kwargs_)
+    factory = staticmethod(factory)
+    def get_NETWORK(self): return self.NETWORK
+    def set_NETWORK(self, NETWORK): self.NETWORK = NETWORK
+    def add_NETWORK(self, value): self.NETWORK.append(value)
+    def insert_NETWORK_at(self, index, value): self.NETWORK.insert(index, value)
+    def replace_NETWORK_at(self, index, value): self.NETWORK[index] = value
+    def hasContent_(self):
+        if (
+            self.NETWORK
+        ):
+            return True
+        else:
+            return False
+    def export(self, outfile, level, namespaceprefix_='', name_='NETWORK_QUOTAType15', namespacedef_='', pretty_print=True):
+        imported_ns_def_ = GenerateDSNamespaceDefs_.get('NETWORK_QUOTAType15')
+        if imported_ns_def_ is not None:
+            namespacedef_ = imported_ns_def_
+        if pretty_print:
+            eol_ = '\n'
+        else:
+            eol_ = ''
+        if self.original_tagname_ is not None:
+            name_ = self.original_tagname_
+        showIndent(outfile, level, pretty_print)
+        outfile.write('<%s%s%s' % (namespaceprefix_, name_, namespacedef_ and ' ' + namespacedef_ or '', ))
+        already_processed = set()
+        self.exportAttributes(outfile, level, already_processed, namespaceprefix_, name_='NETWORK_QUOTAType15')
+        if self.hasContent_():
+            outfile.write('>%s' % (eol_, ))
+            self.exportChildren(outfile, level + 1, namespaceprefix_='', name_='NETWORK_QUOTAType15', pretty_print=pretty_print)
+            showIndent(outfile, level, pretty_print)
+            outfile.write('</%s%s>%s' % (namespaceprefix_, name_, eol_))
+        else:
+            outfile.write('/>%s' % (eol_, ))
+    def exportAttributes(self, outfile, level, already_processed, namespaceprefix_='', name_='NETWORK_QUOTAType15'):
+        pass
+    def exportChildren(self, outfile, level, namespaceprefix_='', name_='NETWORK_QUOTAType15', fromsubclass_=False, pretty_print=True):
+        if pretty_print:
+            eol_ = '\n'
+        else:
+            eol_ = ''
+        for NETWORK_ in self.NETWORK:
+            NETWORK_.export(outfile, level, namespaceprefix_, name_='NETWORK', pretty_print=pretty_print)
+    def build(self, node):
+        already_processed = set()
+        self.buildAttributes(node, node.attrib, already_processed)
+        for child in node:
+            nodeName_ = Tag_pattern_.match(child.tag).groups()[-1]
+            self.buildChildren(child, node, nodeName_)
+        return self
+    def buildAttributes(self, node, attrs, already_processed):
+        pass
+    def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
+        if nodeName_ == 'NETWORK':
+            obj_ = NETWORKType16.factory()
+            obj_.build(child_)
+            self.NETWORK.append(obj_)
+            obj_.original_tagname_ = 'NETWORK'
+# end class NETWORK_QUOTAType15
+
+
+class NETWORKType16(GeneratedsSuper):
+    subclass = None
+    superclass = None
+    def __init__(self, ID=None, LEASES=None, LEASES_USED=None):
+        self.original_tagname_ = None
+        self.ID = ID
+        self.LEASES = LEASES
+        self.LEASES_USED = LEASES_USED
+    def factory(*args_, **kwargs_):
+        if supermod.CurrentSubclassModule_ is not None:
+            subclass = getSubclassFromModule_(
+                supermod.CurrentSubclassModule_, NETWORKType16)
+            if subclass is not None:
+                return subclass(*args_, **kwargs_)
+        if NETWORKType16.subclass:
+            return NETWORKType16.subclass(*args_, **kwargs_)
+        else:
+            return NETWORKType16(*args_, **kwargs_)
+    factory = staticmethod(factory)
+    def get_ID(self): return self.ID
+    def set_ID(self, ID): self.ID = ID
+    def get_LEASES(self): return self.LEASES
+    def set_LEASES(self, LEASES): self.LEASES = LEASES
+    def get_LEASES_USED(self): return self.LEASES_USED
+    def set_LEASES_USED(self, LEASES_USED): self.LEASES_USED = LEASES_USED
+    def hasContent_(self):
+        if (
+            self.ID is not None or
+            self.LEASES is not None or
+            self.LEASES_USED is not None
+        ):
+            return True
+        else:
+            return False
+    def export(self, outfile, level, namespaceprefix_='', name_='NETWORKType16', namespacedef_='', pretty_print=True):
+        imported_ns_def_ = GenerateDSNamespaceDefs_.get('NETWORKType16')
+        if imported_ns_def_ is not None:
+            namespacedef_ = imported_ns_def_
+        if pretty_print:
+            eol_ = '\n'
+        else:
+            eol_ = ''
+        if self.original_tagname_ is not None:
+            name_ = self.original_tagname_
+        showIndent(outfile, level, pretty_print)
+        outfile.write('<%s%s%s' % (namespaceprefix_, name_, namespacedef_ and ' ' + namespacedef_ or '', ))
+        already_processed = set()
+        self.exportAttributes(outfile, level, already_processed, namespaceprefix_, name_='NETWORKType16')
+        if self.hasContent_():
+            outfile.write('>%s' % (eol_, ))
+            self.exportChildren(outfile, level + 1, namespaceprefix_='', name_='NETWORKType16', pretty_print=pretty_print)
+            showIndent(outfile, level, pretty_print)
+            outfile.write('</%s%s>%s' % (namespaceprefix_, name_, eol_))
+        else:
+            outfile.write('/>%s' % (eol_, ))
+    def exportAttributes(self, outfile, level, already_processed, namespaceprefix_='', name_='NETWORKType16'):
+        pass
+    def exportChildren(self, outfile, level, namespaceprefix_='', name_='NETWORKType16', fromsubclass_=False, pretty_print=True):
+        if pretty_print:
+            eol_ = '\n'
+        else:
+            eol_ = ''
+        if self.ID is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<ID>%s</ID>%s' % (self.gds_encode(self.gds_format_string(quote_xml(self.ID), input_name='ID')), eol_))
+        if self.LEASES is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<LEASES>%s</LEASES>%s' % (self.gds_encode(self.gds_format_string(quote_xml(self.LEASES), input_name='LEASES')), eol_))
+        if self.LEASES_USED is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<LEASES_USED>%s</LEASES_USED>%s' % (self.gds_encode(self.gds_format_string(quote_xml(self.LEASES_USED), input_name='LEASES_USED')), eol_))
+    def build(self, node):
+        already_processed = set()
+        self.buildAttributes(node, node.attrib, already_processed)
+        for child in node:
+            nodeName_ = Tag_pattern_.match(child.tag).groups()[-1]
+            self.buildChildren(child, node, nodeName_)
+        return self
+    def buildAttributes(self, node, attrs, already_processed):
+        pass
+    def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
+        if nodeName_ == 'ID':
+            ID_ = child_.text
+            ID_ = self.gds_validate_string(ID_, node, 'ID')
+            self.ID = ID_
+        elif nodeName_ == 'LEASES':
+            LEASES_ = child_.text
+            LEASES_ = self.gds_validate_string(LEASES_, node, 'LEASES')
+            self.LEASES = LEASES_
+        elif nodeName_ == 'LEASES_USED':
+            LEASES_USED_ = child_.text
+            LEASES_USED_ = self.gds_validate_string(LEASES_USED_, node, 'LEASES_USED')
+            self.LEASES_USED = LEASES_USED_
+# end class NETWORKType16
+
+
+class VM_QUOTAType17(GeneratedsSuper):
+    subclass = None
+    superclass = None
+    def __init__(self, VM=None):
+        self.original_tagname_ = None
+        self.VM = VM
+    def factory(*args_, **kwargs_):
+        if supermod.CurrentSubclassModule_ is not None:
+            subclass = getSubclassFromModule_(
+                supermod.CurrentSubclassModule_, VM_QUOTAType17)
+            if subclass is not None:
+                return subclass(*args_, **kwargs_)
+        if VM_QUOTAType17.subclass:
+            return VM_QUOTAType17.subclass(*args_, **kwargs_)
+        else:
+            return VM_QUOTAType17(*args_, **kwargs_)
+    factory = staticmethod(factory)
+    def get_VM(self): return self.VM
+    def set_VM(self, VM): self.VM = VM
+    def hasContent_(self):
+        if (
+            self.VM is not None
+        ):
+            return True
+        else:
+            return False
+    def export(self, outfile, level, namespaceprefix_='', name_='VM_QUOTAType17', namespacedef_='', pretty_print=True):
+        imported_ns_def_ = GenerateDSNamespaceDefs_.get('VM_QUOTAType17')
+        if imported_ns_def_ is not None:
+            namespacedef_ = imported_ns_def_
+        if pretty_print:
+            eol_ = '\n'
+        else:
+            eol_ = ''
+        if self.original_tagname_ is not None:
+            name_ = self.original_tagname_
+        showIndent(outfile, level, pretty_print)
+        outfile.write('<%s%s%s' % (namespaceprefix_, name_, namespacedef_ and ' ' + namespacedef_ or '', ))
+        already_processed = set()
+        self.exportAttributes(outfile, level, already_processed, namespaceprefix_, name_='VM_QUOTAType17')
+        if self.hasContent_():
+            outfile.write('>%s' % (eol_, ))
+            self.exportChildren(outfile, level + 1, namespaceprefix_='', name_='VM_QUOTAType17', pretty_print=pretty_print)
+            showIndent(outfile, level, pretty_print)
+            outfile.write('</%s%s>%s' % (namespaceprefix_, name_, eol_))
+        else:
+            outfile.write('/>%s' % (eol_, ))
+    def exportAttributes(self, outfile, level, already_processed, namespaceprefix_='', name_='VM_QUOTAType17'):
+        pass
+    def exportChildren(self, outfile, level, namespaceprefix_='', name_='VM_QUOTAType17', fromsubclass_=False, pretty_print=True):
+        if pretty_print:
+            eol_ = '\n'
+        else:
+            eol_ = ''
+        if self.VM is not None:
+            self.VM.export(outfile, level, namespaceprefix_, name_='VM', pretty_print=pretty_print)
+    def build(self, node):
+        already_processed = set()
+        self.buildAttributes(node, node.attrib, already_processed)
+        for child in node:
+            nodeName_ = Tag_pattern_.match(child.tag).groups()[-1]
+            self.buildChildren(child, node, nodeName_)
+        return self
+    def buildAttributes(self, node, attrs, already_processed):
+        pass
+    def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
+        if nodeName_ == 'VM':
+            obj_ = VMType18.factory()
+            obj_.build(child_)
+            self.VM = obj_
+            obj_.original_tagname_ = 'VM'
+# end class VM_QUOTAType17
+
+
+class VMType18(GeneratedsSuper):
+    subclass = None
+    superclass = None
+    def __init__(self, CPU=None, CPU_USED=None, MEMORY=None, MEMORY_USED=None, SYSTEM_DISK_SIZE=None, SYSTEM_DISK_SIZE_USED=None, VMS=None, VMS_USED=None):
+        self.original_tagname_ = None
+        self.CPU = CPU
+        self.CPU_USED = CPU_USED
+        self.MEMORY = MEMORY
+        self.MEMORY_USED = MEMORY_USED
+        self.SYSTEM_DISK_SIZE = SYSTEM_DISK_SIZE
+        self.SYSTEM_DISK_SIZE_USED = SYSTEM_DISK_SIZE_USED
+        self.VMS = VMS
+        self.VMS_USED = VMS_USED
+    def factory(*args_, **kwargs_):
+        if supermod.CurrentSubclassModule_ is not None:
+            subclass = getSubclassFromModule_(
+                supermod.CurrentSubclassModule_, VMType18)
+            if subclass is not None:
+                return subclass(*args_, **kwargs_)
+        if VMType18.subclass:
+            return VMType18.subclass(*args_, **kwargs_)
+        else:
+            return VMType18(*args_, **kwargs_)
+    factory = staticmethod(factory)
+    def get_CPU(self): return self.CPU
+    def set_CPU(self, CPU): self.CPU = CPU
+    def get_CPU_USED(self): return self.CPU_USED
+    def set_CPU_USED(self, CPU_USED): self.CPU_USED = CPU_USED
+    def get_MEMORY(self): return self.MEMORY
+    def set_MEMORY(self, MEMORY): self.MEMORY = MEMORY
+    def get_MEMORY_USED(self): return self.MEMORY_USED
+    def set_MEMORY_USED(self, MEMORY_USED): self.MEMORY_USED = MEMORY_USED
+    def get_SYSTEM_DISK_SIZE(self): return self.SYSTEM_DISK_SIZE
+    def set_SYSTEM_DISK_SIZE(self, SYSTEM_DISK_SIZE): self.SYSTEM_DISK_SIZE = SYSTEM_DISK_SIZE
+    def get_SYSTEM_DISK_SIZE_USED(self): return self.SYSTEM_DISK_SIZE_USED
+    def set_SYSTEM_DISK_SIZE_USED(self, SYSTEM_DISK_SIZE_USED): self.SYSTEM_DISK_SIZE_USED = SYSTEM_DISK_SIZE_USED
+    def get_VMS(self): return self.VMS
+    def set_VMS(self, VMS): self.VMS = VMS
+    def get_VMS_USED(self): return self.VMS_USED
+    def set_VMS_USED(self, VMS_USED): self.VMS_USED = VMS_USED
+    def hasContent_(self):
+        if (
+            self.CPU is not None or
+            self.CPU_USED is not None or
+            self.MEMORY is not None or
+            self.MEMORY_USED is not None or
+            self.SYSTEM_DISK_SIZE is not None or
+            self.SYSTEM_DISK_SIZE_USED is not None or
+            self.VMS is not None or
+            self.VMS_USED is not None
+        ):
+            return True
+        else:
+            return False
+    def export(self, outfile, level, namespaceprefix_='', name_='VMType18', namespacedef_='', pretty_print=True):
+        imported_ns_def_ = GenerateDSNamespaceDefs_.get('VMType18')
+        if imported_ns_def_ is not None:
+            namespacedef_ = imported_ns_def_
+        if pretty_print:
+            eol_ = '\n'
+        else:
+            eol_ = ''
+        if self.original_tagname_ is not None:
+            name_ = self.original_tagname_
+        showIndent(outfile, level, pretty_print)
+        outfile.write('<%s%s%s' % (namespaceprefix_, name_, namespacedef_ and ' ' + namespacedef_ or '', ))
+        already_processed = set()
+        self.exportAttributes(outfile, level, already_processed, namespaceprefix_, name_='VMType18')
+        if self.hasContent_():
+            outfile.write('>%s' % (eol_, ))
+            self.exportChildren(outfile, level + 1, namespaceprefix_='', name_='VMType18', pretty_print=pretty_print)
+            showIndent(outfile, level, pretty_print)
+            outfile.write('</%s%s>%s' % (namespaceprefix_, name_, eol_))
+        else:
+            outfile.write('/>%s' % (eol_, ))
+    def exportAttributes(self, outfile, level, already_processed, namespaceprefix_='', name_='VMType18'):
+        pass
+    def exportChildren(self, outfile, level, namespaceprefix_='', name_='VMType18', fromsubclass_=False, pretty_print=True):
+        if pretty_print:
+            eol_ = '\n'
+        else:
+            eol_ = ''
+        if self.CPU is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<CPU>%s</CPU>%s' % (self.gds_encode(self.gds_format_string(quote_xml(self.CPU), input_name='CPU')), eol_))
+        if self.CPU_USED is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<CPU_USED>%s</CPU_USED>%s' % (self.gds_encode(self.gds_format_string(quote_xml(self.CPU_USED), input_name='CPU_USED')), eol_))
+        if self.MEMORY is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<MEMORY>%s</MEMORY>%s' % (self.gds_encode(self.gds_format_string(quote_xml(self.MEMORY), input_name='MEMORY')), eol_))
+        if self.MEMORY_USED is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<MEMORY_USED>%s</MEMORY_USED>%s' % (self.gds_encode(self.gds_format_string(quote_xml(self.MEMORY_USED), input_name='MEMORY_USED')), eol_))
+        if self.SYSTEM_DISK_SIZE is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<SYSTEM_DISK_SIZE>%s</SYSTEM_DISK_SIZE>%s' % (self.gds_encode(self.gds_format_string(quote_xml(self.SYSTEM_DISK_SIZE), input_name='SYSTEM_DISK_SIZE')), eol_))
+        if self.SYSTEM_DISK_SIZE_USED is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<SYSTEM_DISK_SIZE_USED>%s</SYSTEM_DISK_SIZE_USED>%s' % (self.gds_encode(self.gds_format_string(quote_xml(self.SYSTEM_DISK_SIZE_USED), input_name='SYSTEM_DISK_SIZE_USED')), eol_))
+        if self.VMS is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<VMS>%s</VMS>%s' % (self.gds_encode(self.gds_format_string(quote_xml(self.VMS), input_name='VMS')), eol_))
+        if self.VMS_USED is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<VMS_USED>%s</VMS_USED>%s' % (self.gds_encode(self.gds_format_string(quote_xml(self.VMS_USED), input_name='VMS_USED')), eol_))
+    def build(self, node):
+        already_processed = set()
+        self.buildAttributes(node, node.attrib, already_processed)
+        for child in node:
+            nodeName_ = Tag_pattern_.match(child.tag).groups()[-1]
+            self.buildChildren(child, node, nodeName_)
+        return self
+    def buildAttributes(self, node, attrs, already_processed):
+        pass
+    def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
+        if nodeName_ == 'CPU':
+            CPU_ = child_.text
+            CPU_ = self.gds_validate_string(CPU_, node, 'CPU')
+            self.CPU = CPU_
+        elif nodeName_ == 'CPU_USED':
+            CPU_USED_ = child_.text
+            CPU_USED_ = self.gds_validate_string(CPU_USED_, node, 'CPU_USED')
+            self.CPU_USED = CPU_USED_
+        elif nodeName_ == 'MEMORY':
+            MEMORY_ = child_.text
+            MEMORY_ = self.gds_validate_string(MEMORY_, node, 'MEMORY')
+            self.MEMORY = MEMORY_
+        elif nodeName_ == 'MEMORY_USED':
+            MEMORY_USED_ = child_.text
+            MEMORY_USED_ = self.gds_validate_string(MEMORY_USED_, node, 'MEMORY_USED')
+            self.MEMORY_USED = MEMORY_USED_
+        elif nodeName_ == 'SYSTEM_DISK_SIZE':
+            SYSTEM_DISK_SIZE_ = child_.text
+            SYSTEM_DISK_SIZE_ = self.gds_validate_string(SYSTEM_DISK_SIZE_, node, 'SYSTEM_DISK_SIZE')
+            self.SYSTEM_DISK_SIZE = SYSTEM_DISK_SIZE_
+        elif nodeName_ == 'SYSTEM_DISK_SIZE_USED':
+            SYSTEM_DISK_SIZE_USED_ = child_.text
+            SYSTEM_DISK_SIZE_USED_ = self.gds_validate_string(SYSTEM_DISK_SIZE_USED_, node, 'SYSTEM_DISK_SIZE_USED')
+            self.SYSTEM_DISK_SIZE_USED = SYSTEM_DISK_SIZE_USED_
+        elif nodeName_ == 'VMS':
+            VMS_ = child_.text
+            VMS_ = self.gds_validate_string(VMS_, node, 'VMS')
+            self.VMS = VMS_
+        elif nodeName_ == 'VMS_USED':
+            VMS_USED_ = child_.text
+            VMS_USED_ = self.gds_validate_string(VMS_USED_, node, 'VMS_USED')
+            self.VMS_USED = VMS_USED_
+# end class VMType18
+
+
+class IMAGE_QUOTAType19(GeneratedsSuper):
+    subclass = None
+    superclass = None
+    def __init__(self, IMAGE=None):
+        self.original_tagname_ = None
+        if IMAGE is None:
+            self.IMAGE = []
+        else:
+            self.IMAGE = IMAGE
+    def factory(*args_, **kwargs_):
+        if supermod.CurrentSubclassModule_ is not None:
+            subclass = getSubclassFromModule_(
+                supermod.CurrentSubclassModule_, IMAGE_QUOTAType19)
+            if subclass is not None:
+                return subclass(*args_, **kwargs_)
+        if IMAGE_QUOTAType19.subclass:
+            return IMAGE_QUOTAType19.subclass(*args_, **kwargs_)
+        else:
+            return IMAGE_QUOTAType19(*args_, **kwargs_)
+    factory = staticmethod(factory)
+    def get_IMAGE(self): return self.IMAGE
+    def set_IMAGE(self, IMAGE): self.IMAGE = IMAGE
+    def add_IMAGE(self, value): self.IMAGE.append(value)
+    def insert_IMAGE_at(self, index, value): self.IMAGE.insert(index, value)
+    def replace_IMAGE_at(self, index, value): self.IMAGE[index] = value
+    def hasContent_(self):
+        if (
+            self.IMAGE
+        ):
+            return True
+        else:
+            return False
+    def export(self, outfile, level, namespaceprefix_='', name_='IMAGE_QUOTAType19', namespacedef_='', pretty_print=True):
+        imported_ns_def_ = GenerateDSNamespaceDefs_.get('IMAGE_QUOTAType19')
+        if imported_ns_def_ is not None:
+            namespacedef_ = imported_ns_def_
+        if pretty_print:
+            eol_ = '\n'
+        else:
+            eol_ = ''
+        if self.original_tagname_ is not None:
+            name_ = self.original_tagname_
+        showIndent(outfile, level, pretty_print)
+        outfile.write('<%s%s%s' % (namespaceprefix_, name_, namespacedef_ and ' ' + namespacedef_ or '', ))
+        already_processed = set()
+        self.exportAttributes(outfile, level, already_processed, namespaceprefix_, name_='IMAGE_QUOTAType19')
+        if self.hasContent_():
+            outfile.write('>%s' % (eol_, ))
+            self.exportChildren(outfile, level + 1, namespaceprefix_='', name_='IMAGE_QUOTAType19', pretty_print=pretty_print)
+            showIndent(outfile, level, pretty_print)
+            outfile.write('</%s%s>%s' % (namespaceprefix_, name_, eol_))
+        else:
+            outfile.write('/>%s' % (eol_, ))
+    def exportAttributes(self, outfile, level, already_processed, namespaceprefix_='', name_='IMAGE_QUOTAType19'):
+        pass
+    def exportChildren(self, outfile, level, namespaceprefix_='', name_='IMAGE_QUOTAType19', fromsubclass_=False, pretty_print=True):
+        if pretty_print:
+            eol_ = '\n'
+        else:
+            eol_ = ''
+        for IMAGE_ in self.IMAGE:
+            IMAGE_.export(outfile, level, namespaceprefix_, name_='IMAGE', pretty_print=pretty_print)
+    def build(self, node):
+        already_processed = set()
+        self.buildAttributes(node, node.attrib, already_processed)
+        for child in node:
+            nodeName_ = Tag_pattern_.match(child.tag).groups()[-1]
+            self.buildChildren(child, node, nodeName_)
+        return self
+    def buildAttributes(self, node, attrs, already_processed):
+        pass
+    def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
+        if nodeName_ == 'IMAGE':
+            obj_ = IMAGEType20.factory()
+            obj_.build(child_)
+            self.IMAGE.append(obj_)
+            obj_.original_tagname_ = 'IMAGE'
+# end class IMAGE_QUOTAType19
+
+
+class IMAGEType20(GeneratedsSuper):
+    subclass = None
+    superclass = None
+    def __init__(self, ID=None, RVMS=None, RVMS_USED=None):
+        self.original_tagname_ = None
+        self.ID = ID
+        self.RVMS = RVMS
+        self.RVMS_USED = RVMS_USED
+    def factory(*args_, **kwargs_):
+        if supermod.CurrentSubclassModule_ is not None:
+            subclass = getSubclassFromModule_(
+                supermod.CurrentSubclassModule_, IMAGEType20)
+            if subclass is not None:
+                return subclass(*args_, **kwargs_)
+        if IMAGEType20.subclass:
+            return IMAGEType20.subclass(*args_, **kwargs_)
+        else:
+            return IMAGEType20(*args_, **kwargs_)
+    factory = staticmethod(factory)
+    def get_ID(self): return self.ID
+    def set_ID(self, ID): self.ID = ID
+    def get_RVMS(self): return self.RVMS
+    def set_RVMS(self, RVMS): self.RVMS = RVMS
+    def get_RVMS_USED(self): return self.RVMS_USED
+    def set_RVMS_USED(self, RVMS_USED): self.RVMS_USED = RVMS_USED
+    def hasContent_(self):
+        if (
+            self.ID is not None or
+            self.RVMS is not None or
+            self.RVMS_USED is not None
+        ):
+            return True
+        else:
+            return False
+    def export(self, outfile, level, namespaceprefix_='', name_='IMAGEType20', namespacedef_='', pretty_print=True):
+        imported_ns_def_ = GenerateDSNamespaceDefs_.get('IMAGEType20')
+        if imported_ns_def_ is not None:
+            namespacedef_ = imported_ns_def_
+        if pretty_print:
+            eol_ = '\n'
+        else:
+            eol_ = ''
+        if self.original_tagname_ is not None:
+            name_ = self.original_tagname_
+        showIndent(outfile, level, pretty_print)
+        outfile.write('<%s%s%s' % (namespaceprefix_, name_, namespacedef_ and ' ' + namespacedef_ or '', ))
+        already_processed = set()
+        self.exportAttributes(outfile, level, already_processed, namespaceprefix_, name_='IMAGEType20')
+        if self.hasContent_():
+            outfile.write('>%s' % (eol_, ))
+            self.exportChildren(outfile, level + 1, namespaceprefix_='', name_='IMAGEType20', pretty_print=pretty_print)
+            showIndent(outfile, level, pretty_print)
+            outfile.write('</%s%s>%s' % (namespaceprefix_, name_, eol_))
+        else:
+            outfile.write('/>%s' % (eol_, ))
+    def exportAttributes(self, outfile, level, already_processed, namespaceprefix_='', name_='IMAGEType20'):
+        pass
+    def exportChildren(self, outfile, level, namespaceprefix_='', name_='IMAGEType20', fromsubclass_=False, pretty_print=True):
+        if pretty_print:
+            eol_ = '\n'
+        else:
+            eol_ = ''
+        if self.ID is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<ID>%s</ID>%s' % (self.gds_encode(self.gds_format_string(quote_xml(self.ID), input_name='ID')), eol_))
+        if self.RVMS is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<RVMS>%s</RVMS>%s' % (self.gds_encode(self.gds_format_string(quote_xml(self.RVMS), input_name='RVMS')), eol_))
+        if self.RVMS_USED is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<RVMS_USED>%s</RVMS_USED>%s' % (self.gds_encode(self.gds_format_string(quote_xml(self.RVMS_USED), input_name='RVMS_USED')), eol_))
+    def build(self, node):
+        already_processed = set()
+        self.buildAttributes(node, node.attrib, already_processed)
+        for child in node:
+            nodeName_ = Tag_pattern_.match(child.tag).groups()[-1]
+            self.buildChildren(child, node, nodeName_)
+        return self
+    def buildAttributes(self, node, attrs, already_processed):
+        pass
+    def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
+        if nodeName_ == 'ID':
+            ID_ = child_.text
+            ID_ = self.gds_validate_string(ID_, node, 'ID')
+            self.ID = ID_
+        elif nodeName_ == 'RVMS':
+            RVMS_ = child_.text
+            RVMS_ = self.gds_validate_string(RVMS_, node, 'RVMS')
+            self.RVMS = RVMS_
+        elif nodeName_ == 'RVMS_USED':
+            RVMS_USED_ = child_.text
+            RVMS_USED_ = self.gds_validate_string(RVMS_USED_, node, 'RVMS_USED')
+            self.RVMS_USED = RVMS_USED_
+# end class IMAGEType20
+
+
+class DEFAULT_GROUP_QUOTASType21(GeneratedsSuper):
+    subclass = None
+    superclass = None
+    def __init__(self, DATASTORE_QUOTA=None, NETWORK_QUOTA=None, VM_QUOTA=None, IMAGE_QUOTA=None):
+        self.original_tagname_ = None
+        self.DATASTORE_QUOTA = DATASTORE_QUOTA
+        self.NETWORK_QUOTA = NETWORK_QUOTA
+        self.VM_QUOTA = VM_QUOTA
+        self.IMAGE_QUOTA = IMAGE_QUOTA
+    def factory(*args_, **kwargs_):
+        if supermod.CurrentSubclassModule_ is not None:
+            subclass = getSubclassFromModule_(
+                supermod.CurrentSubclassModule_, DEFAULT_GROUP_QUOTASType21)
+            if subclass is not None:
+                return subclass(*args_, **kwargs_)
+        if DEFAULT_GROUP_QUOTASType21.subclass:
+            return DEFAULT_GROUP_QUOTASType21.subclass(*args_, **kwargs_)
+        else:
+            return DEFAULT_GROUP_QUOTASType21(*args_, **kwargs_)
+    factory = staticmethod(factory)
+    def get_DATASTORE_QUOTA(self): return self.DATASTORE_QUOTA
+    def set_DATASTORE_QUOTA(self, DATASTORE_QUOTA): self.DATASTORE_QUOTA = DATASTORE_QUOTA
+    def get_NETWORK_QUOTA(self): return self.NETWORK_QUOTA
+    def set_NETWORK_QUOTA(self, NETWORK_QUOTA): self.NETWORK_QUOTA = NETWORK_QUOTA
+    def get_VM_QUOTA(self): return self.VM_QUOTA
+    def set_VM_QUOTA(self, VM_QUOTA): self.VM_QUOTA = VM_QUOTA
+    def get_IMAGE_QUOTA(self): return self.IMAGE_QUOTA
+    def set_IMAGE_QUOTA(self, IMAGE_QUOTA): self.IMAGE_QUOTA = IMAGE_QUOTA
+    def hasContent_(self):
+        if (
+            self.DATASTORE_QUOTA is not None or
+            self.NETWORK_QUOTA is not None or
+            self.VM_QUOTA is not None or
+            self.IMAGE_QUOTA is not None
+        ):
+            return True
+        else:
+            return False
+    def export(self, outfile, level, namespaceprefix_='', name_='DEFAULT_GROUP_QUOTASType21', namespacedef_='', pretty_print=True):
+        imported_ns_def_ = GenerateDSNamespaceDefs_.get('DEFAULT_GROUP_QUOTASType21')
+        if imported_ns_def_ is not None:
+            namespacedef_ = imported_ns_def_
+        if pretty_print:
+            eol_ = '\n'
+        else:
+            eol_ = ''
+        if self.original_tagname_ is not None:
+            name_ = self.original_tagname_
+        showIndent(outfile, level, pretty_print)
+        outfile.write('<%s%s%s' % (namespaceprefix_, name_, namespacedef_ and ' ' + namespacedef_ or '', ))
+        already_processed = set()
+        self.exportAttributes(outfile, level, already_processed, namespaceprefix_, name_='DEFAULT_GROUP_QUOTASType21')
+        if self.hasContent_():
+            outfile.write('>%s' % (eol_, ))
+            self.exportChildren(outfile, level + 1, namespaceprefix_='', name_='DEFAULT_GROUP_QUOTASType21', pretty_print=pretty_print)
+            showIndent(outfile, level, pretty_print)
+            outfile.write('</%s%s>%s' % (namespaceprefix_, name_, eol_))
+        else:
+            outfile.write('/>%s' % (eol_, ))
+    def exportAttributes(self, outfile, level, already_processed, namespaceprefix_='', name_='DEFAULT_GROUP_QUOTASType21'):
+        pass
+    def exportChildren(self, outfile, level, namespaceprefix_='', name_='DEFAULT_GROUP_QUOTASType21', fromsubclass_=False, pretty_print=True):
+        if pretty_print:
+            eol_ = '\n'
+        else:
+            eol_ = ''
+        if self.DATASTORE_QUOTA is not None:
+            self.DATASTORE_QUOTA.export(outfile, level, namespaceprefix_, name_='DATASTORE_QUOTA', pretty_print=pretty_print)
+        if self.NETWORK_QUOTA is not None:
+            self.NETWORK_QUOTA.export(outfile, level, namespaceprefix_, name_='NETWORK_QUOTA', pretty_print=pretty_print)
+        if self.VM_QUOTA is not None:
+            self.VM_QUOTA.export(outfile, level, namespaceprefix_, name_='VM_QUOTA', pretty_print=pretty_print)
+        if self.IMAGE_QUOTA is not None:
+            self.IMAGE_QUOTA.export(outfile, level, namespaceprefix_, name_='IMAGE_QUOTA', pretty_print=pretty_print)
+    def build(self, node):
+        already_processed = set()
+        self.buildAttributes(node, node.attrib, already_processed)
+        for child in node:
+            nodeName_ = Tag_pattern_.match(child.tag).groups()[-1]
+            self.buildChildren(child, node, nodeName_)
+        return self
+    def buildAttributes(self, node, attrs, already_processed):
+        pass
+    def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
+        if nodeName_ == 'DATASTORE_QUOTA':
+            obj_ = DATASTORE_QUOTAType22.factory()
+            obj_.build(child_)
+            self.DATASTORE_QUOTA = obj_
+            obj_.original_tagname_ = 'DATASTORE_QUOTA'
+        elif nodeName_ == 'NETWORK_QUOTA':
+            obj_ = NETWORK_QUOTAType24.factory()
+            obj_.build(child_)
+            self.NETWORK_QUOTA = obj_
+            obj_.original_tagname_ = 'NETWORK_QUOTA'
+        elif nodeName_ == 'VM_QUOTA':
+            obj_ = VM_QUOTAType26.factory()
+            obj_.build(child_)
+            self.VM_QUOTA = obj_
+            obj_.original_tagname_ = 'VM_QUOTA'
+        elif nodeName_ == 'IMAGE_QUOTA':
+            obj_ = IMAGE_QUOTAType28.factory()
+            obj_.build(child_)
+            self.IMAGE_QUOTA = obj_
+            obj_.original_tagname_ = 'IMAGE_QUOTA'
+# end class DEFAULT_GROUP_QUOTASType21
+
+
+class DATASTORE_QUOTAType22(GeneratedsSuper):
+    subclass = None
+    superclass = None
+    def __init__(self, DATASTORE=None):
+        self.original_tagname_ = None
+        if DATASTORE is None:
+            self.DATASTORE = []
+        else:
+            self.DATASTORE = DATASTORE
+    def factory(*args_, **kwargs_):
+        if supermod.CurrentSubclassModule_ is not None:
+            subclass = getSubclassFromModule_(
+                supermod.CurrentSubclassModule_, DATASTORE_QUOTAType22)
+            if subclass is not None:
+                return subclass(*args_, **kwargs_)
+        if DATASTORE_QUOTAType22.subclass:
+            return DATASTORE_QUOTAType22.subclass(*args_, **kwargs_)
+        else:
+            return DATASTORE_QUOTAType22(*args_, **kwargs_)
+    factory = staticmethod(factory)
+    def get_DATASTORE(self): return self.DATASTORE
+    def set_DATASTORE(self, DATASTORE): self.DATASTORE = DATASTORE
+    def add_DATASTORE(self, value): self.DATASTORE.append(value)
+    def insert_DATASTORE_at(self, index, value): self.DATASTORE.insert(index, value)
+    def replace_DATASTORE_at(self, index, value): self.DATASTORE[index] = value
+    def hasContent_(self):
+        if (
+            self.DATASTORE
+        ):
+            return True
+        else:
+            return False
+    def export(self, outfile, level, namespaceprefix_='', name_='DATASTORE_QUOTAType22', namespacedef_='', pretty_print=True):
+        imported_ns_def_ = GenerateDSNamespaceDefs_.get('DATASTORE_QUOTAType22')
+        if imported_ns_def_ is not None:
+            namespacedef_ = imported_ns_def_
+        if pretty_print:
+            eol_ = '\n'
+        else:
+            eol_ = ''
+        if self.original_tagname_ is not None:
+            name_ = self.original_tagname_
+        showIndent(outfile, level, pretty_print)
+        outfile.write('<%s%s%s' % (namespaceprefix_, name_, namespacedef_ and ' ' + namespacedef_ or '', ))
+        already_processed = set()
+        self.exportAttributes(outfile, level, already_processed, namespaceprefix_, name_='DATASTORE_QUOTAType22')
+        if self.hasContent_():
+            outfile.write('>%s' % (eol_, ))
+            self.exportChildren(outfile, level + 1, namespaceprefix_='', name_='DATASTORE_QUOTAType22', pretty_print=pretty_print)
+            showIndent(outfile, level, pretty_print)
+            outfile.write('</%s%s>%s' % (namespaceprefix_, name_, eol_))
+        else:
+            outfile.write('/>%s' % (eol_, ))
+    def exportAttributes(self, outfile, level, already_processed, namespaceprefix_='', name_='DATASTORE_QUOTAType22'):
+        pass
+    def exportChildren(self, outfile, level, namespaceprefix_='', name_='DATASTORE_QUOTAType22', fromsubclass_=False, pretty_print=True):
+        if pretty_print:
+            eol_ = '\n'
+        else:
+            eol_ = ''
+        for DATASTORE_ in self.DATASTORE:
+            DATASTORE_.export(outfile, level, namespaceprefix_, name_='DATASTORE', pretty_print=pretty_print)
+    def build(self, node):
+        already_processed = set()
+        self.buildAttributes(node, node.attrib, already_processed)
+        for child in node:
+            nodeName_ = Tag_pattern_.match(child.tag).groups()[-1]
+            self.buildChildren(child, node, nodeName_)
+        return self
+    def buildAttributes(self, node, attrs, already_processed):
+        pass
+    def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
+        if nodeName_ == 'DATASTORE':
+            obj_ = DATASTOREType23.factory()
+            obj_.build(child_)
+            self.DATASTORE.append(obj_)
+            obj_.original_tagname_ = 'DATASTORE'
+# end class DATASTORE_QUOTAType22
+
+
+class DATASTOREType23(GeneratedsSuper):
+    subclass = None
+    superclass = None
+    def __init__(self, ID=None, IMAGES=None, IMAGES_USED=None, SIZE=None, SIZE_USED=None):
+        self.original_tagname_ = None
+        self.ID = ID
+        self.IMAGES = IMAGES
+        self.IMAGES_USED = IMAGES_USED
+        self.SIZE = SIZE
+        self.SIZE_USED = SIZE_USED
+    def factory(*args_, **kwargs_):
+        if supermod.CurrentSubclassModule_ is not None:
+            subclass = getSubclassFromModule_(
+                supermod.CurrentSubclassModule_, DATASTOREType23)
+            if subclass is not None:
+                return subclass(*args_, **kwargs_)
+        if DATASTOREType23.subclass:
+            return DATASTOREType23.subclass(*args_, **kwargs_)
+        else:
+            return DATASTOREType23(*args_, **kwargs_)
+    factory = staticmethod(factory)
+    def get_ID(self): return self.ID
+    def set_ID(self, ID): self.ID = ID
+    def get_IMAGES(self): return self.IMAGES
+    def set_IMAGES(self, IMAGES): self.IMAGES = IMAGES
+    def get_IMAGES_USED(self): return self.IMAGES_USED
+    def set_IMAGES_USED(self, IMAGES_USED): self.IMAGES_USED = IMAGES_USED
+    def get_SIZE(self): return self.SIZE
+    def set_SIZE(self, SIZE): self.SIZE = SIZE
+    def get_SIZE_USED(self): return self.SIZE_USED
+    def set_SIZE_USED(self, SIZE_USED): self.SIZE_USED = SIZE_USED
+    def hasContent_(self):
+        if (
+            self.ID is not None or
+            self.IMAGES is not None or
+            self.IMAGES_USED is not None or
+            self.SIZE is not None or
+            self.SIZE_USED is not None
+        ):
+            return True
+        else:
+            return False
+    def export(self, outfile, level, namespaceprefix_='', name_='DATASTOREType23', namespacedef_='', pretty_print=True):
+        imported_ns_def_ = GenerateDSNamespaceDefs_.get('DATASTOREType23')
+        if imported_ns_def_ is not None:
+            namespacedef_ = imported_ns_def_
+        if pretty_print:
+            eol_ = '\n'
+        else:
+            eol_ = ''
+        if self.original_tagname_ is not None:
+            name_ = self.original_tagname_
+        showIndent(outfile, level, pretty_print)
+        outfile.write('<%s%s%s' % (namespaceprefix_, name_, namespacedef_ and ' ' + namespacedef_ or '', ))
+        already_processed = set()
+        self.exportAttributes(outfile, level, already_processed, namespaceprefix_, name_='DATASTOREType23')
+        if self.hasContent_():
+            outfile.write('>%s' % (eol_, ))
+            self.exportChildren(outfile, level + 1, namespaceprefix_='', name_='DATASTOREType23', pretty_print=pretty_print)
+            showIndent(outfile, level, pretty_print)
+            outfile.write('</%s%s>%s' % (namespaceprefix_, name_, eol_))
+        else:
+            outfile.write('/>%s' % (eol_, ))
+    def exportAttributes(self, outfile, level, already_processed, namespaceprefix_='', name_='DATASTOREType23'):
+        pass
+    def exportChildren(self, outfile, level, namespaceprefix_='', name_='DATASTOREType23', fromsubclass_=False, pretty_print=True):
+        if pretty_print:
+            eol_ = '\n'
+        else:
+            eol_ = ''
+        if self.ID is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<ID>%s</ID>%s' % (self.gds_encode(self.gds_format_string(quote_xml(self.ID), input_name='ID')), eol_))
+        if self.IMAGES is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<IMAGES>%s</IMAGES>%s' % (self.gds_encode(self.gds_format_string(quote_xml(self.IMAGES), input_name='IMAGES')), eol_))
+        if self.IMAGES_USED is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<IMAGES_USED>%s</IMAGES_USED>%s' % (self.gds_encode(self.gds_format_string(quote_xml(self.IMAGES_USED), input_name='IMAGES_USED')), eol_))
+        if self.SIZE is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<SIZE>%s</SIZE>%s' % (self.gds_encode(self.gds_format_string(quote_xml(self.SIZE), input_name='SIZE')), eol_))
+        if self.SIZE_USED is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<SIZE_USED>%s</SIZE_USED>%s' % (self.gds_encode(self.gds_format_string(quote_xml(self.SIZE_USED), input_name='SIZE_USED')), eol_))
+    def build(self, node):
+        already_processed = set()
+        self.buildAttributes(node, node.attrib, already_processed)
+        for child in node:
+            nodeName_ = Tag_pattern_.match(child.tag).groups()[-1]
+            self.buildChildren(child, node, nodeName_)
+        return self
+    def buildAttributes(self, node, attrs, already_processed):
+        pass
+    def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
+        if nodeName_ == 'ID':
+            ID_ = child_.text
+            ID_ = self.gds_validate_string(ID_, node, 'ID')
+            self.ID = ID_
+        elif nodeName_ == 'IMAGES':
+            IMAGES_ = child_.text
+            IMAGES_ = self.gds_validate_string(IMAGES_, node, 'IMAGES')
+            self.IMAGES = IMAGES_
+        elif nodeName_ == 'IMAGES_USED':
+            IMAGES_USED_ = child_.text
+            IMAGES_USED_ = self.gds_validate_string(IMAGES_USED_, node, 'IMAGES_USED')
+            self.IMAGES_USED = IMAGES_USED_
+        elif nodeName_ == 'SIZE':
+            SIZE_ = child_.text
+            SIZE_ = self.gds_validate_string(SIZE_, node, 'SIZE')
+            self.SIZE = SIZE_
+        elif nodeName_ == 'SIZE_USED':
+            SIZE_USED_ = child_.text
+            SIZE_USED_ = self.gds_validate_string(SIZE_USED_, node, 'SIZE_USED')
+            self.SIZE_USED = SIZE_USED_
+# end class DATASTOREType23
+
+
+class NETWORK_QUOTAType24(GeneratedsSuper):
+    subclass = None
+    superclass = None
+    def __init__(self, NETWORK=None):
+        self.original_tagname_ = None
+        if NETWORK is None:
+            self.NETWORK = []
+        else:
+            self.NETWORK = NETWORK
+    def factory(*args_, **kwargs_):
+        if supermod.CurrentSubclassModule_ is not None:
+            subclass = getSubclassFromModule_(
+                supermod.CurrentSubclassModule_, NETWORK_QUOTAType24)
+            if subclass is not None:
+                return subclass(*args_, **kwargs_)
+        if NETWORK_QUOTAType24.subclass:
+            return NETWORK_QUOTAType24.subclass(*args_, **kwargs_)
+        else:
+            return NETWORK_QUOTAType24(*args_, **kwargs_)
+    factory = staticmethod(factory)
+    def get_NETWORK(self): return self.NETWORK
+    def set_NETWORK(self, NETWORK): self.NETWORK = NETWORK
+    def add_NETWORK(self, value): self.NETWORK.append(value)
+    def insert_NETWORK_at(self, index, value): self.NETWORK.insert(index, value)
+    def replace_NETWORK_at(self, index, value): self.NETWORK[index] = value
+    def hasContent_(self):
+        if (
+            self.NETWORK
+        ):
+            return True
+        else:
+            return False
+    def export(self, outfile, level, namespaceprefix_='', name_='NETWORK_QUOTAType24', namespacedef_='', pretty_print=True):
+        imported_ns_def_ = GenerateDSNamespaceDefs_.get('NETWORK_QUOTAType24')
+        if imported_ns_def_ is not None:
+            namespacedef_ = imported_ns_def_
+        if pretty_print:
+            eol_ = '\n'
+        else:
+            eol_ = ''
+        if self.original_tagname_ is not None:
+            name_ = self.original_tagname_
+        showIndent(outfile, level, pretty_print)
+        outfile.write('<%s%s%s' % (namespaceprefix_, name_, namespacedef_ and ' ' + namespacedef_ or '', ))
+        already_processed = set()
+        self.exportAttributes(outfile, level, already_processed, namespaceprefix_, name_='NETWORK_QUOTAType24')
+        if self.hasContent_():
+            outfile.write('>%s' % (eol_, ))
+            self.exportChildren(outfile, level + 1, namespaceprefix_='', name_='NETWORK_QUOTAType24', pretty_print=pretty_print)
+            showIndent(outfile, level, pretty_print)
+            outfile.write('</%s%s>%s' % (namespaceprefix_, name_, eol_))
+        else:
+            outfile.write('/>%s' % (eol_, ))
+    def exportAttributes(self, outfile, level, already_processed, namespaceprefix_='', name_='NETWORK_QUOTAType24'):
+        pass
+    def exportChildren(self, outfile, level, namespaceprefix_='', name_='NETWORK_QUOTAType24', fromsubclass_=False, pretty_print=True):
+        if pretty_print:
+            eol_ = '\n'
+        else:
+            eol_ = ''
+        for NETWORK_ in self.NETWORK:
+            NETWORK_.export(outfile, level, namespaceprefix_, name_='NETWORK', pretty_print=pretty_print)
+    def build(self, node):
+        already_processed = set()
+        self.buildAttributes(node, node.attrib, already_processed)
+        for child in node:
+            nodeName_ = Tag_pattern_.match(child.tag).groups()[-1]
+            self.buildChildren(child, node, nodeName_)
+        return self
+    def buildAttributes(self, node, attrs, already_processed):
+        pass
+    def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
+        if nodeName_ == 'NETWORK':
+            obj_ = NETWORKType25.factory()
+            obj_.build(child_)
+            self.NETWORK.append(obj_)
+            obj_.original_tagname_ = 'NETWORK'
+# end class NETWORK_QUOTAType24
+
+
+class NETWORKType25(GeneratedsSuper):
+    subclass = None
+    superclass = None
+    def __init__(self, ID=None, LEASES=None, LEASES_USED=None):
+        self.original_tagname_ = None
+        self.ID = ID
+        self.LEASES = LEASES
+        self.LEASES_USED = LEASES_USED
+    def factory(*args_, **kwargs_):
+        if supermod.CurrentSubclassModule_ is not None:
+            subclass = getSubclassFromModule_(
+                supermod.CurrentSubclassModule_, NETWORKType25)
+            if subclass is not None:
+                return subclass(*args_, **kwargs_)
+        if NETWORKType25.subclass:
+            return NETWORKType25.subclass(*args_, **kwargs_)
+        else:
+            return NETWORKType25(*args_, **kwargs_)
+    factory = staticmethod(factory)
+    def get_ID(self): return self.ID
+    def set_ID(self, ID): self.ID = ID
+    def get_LEASES(self): return self.LEASES
+    def set_LEASES(self, LEASES): self.LEASES = LEASES
+    def get_LEASES_USED(self): return self.LEASES_USED
+    def set_LEASES_USED(self, LEASES_USED): self.LEASES_USED = LEASES_USED
+    def hasContent_(self):
+        if (
+            self.ID is not None or
+            self.LEASES is not None or
+            self.LEASES_USED is not None
+        ):
+            return True
+        else:
+            return False
+    def export(self, outfile, level, namespaceprefix_='', name_='NETWORKType25', namespacedef_='', pretty_print=True):
+        imported_ns_def_ = GenerateDSNamespaceDefs_.get('NETWORKType25')
+        if imported_ns_def_ is not None:
+            namespacedef_ = imported_ns_def_
+        if pretty_print:
+            eol_ = '\n'
+        else:
+            eol_ = ''
+        if self.original_tagname_ is not None:
+            name_ = self.original_tagname_
+        showIndent(outfile, level, pretty_print)
+        outfile.write('<%s%s%s' % (namespaceprefix_, name_, namespacedef_ and ' ' + namespacedef_ or '', ))
+        already_processed = set()
+        self.exportAttributes(outfile, level, already_processed, namespaceprefix_, name_='NETWORKType25')
+        if self.hasContent_():
+            outfile.write('>%s' % (eol_, ))
+            self.exportChildren(outfile, level + 1, namespaceprefix_='', name_='NETWORKType25', pretty_print=pretty_print)
+            showIndent(outfile, level, pretty_print)
+            outfile.write('</%s%s>%s' % (namespaceprefix_, name_, eol_))
+        else:
+            outfile.write('/>%s' % (eol_, ))
+    def exportAttributes(self, outfile, level, already_processed, namespaceprefix_='', name_='NETWORKType25'):
+        pass
+    def exportChildren(self, outfile, level, namespaceprefix_='', name_='NETWORKType25', fromsubclass_=False, pretty_print=True):
+        if pretty_print:
+            eol_ = '\n'
+        else:
+            eol_ = ''
+        if self.ID is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<ID>%s</ID>%s' % (self.gds_encode(self.gds_format_string(quote_xml(self.ID), input_name='ID')), eol_))
+        if self.LEASES is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<LEASES>%s</LEASES>%s' % (self.gds_encode(self.gds_format_string(quote_xml(self.LEASES), input_name='LEASES')), eol_))
+        if self.LEASES_USED is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<LEASES_USED>%s</LEASES_USED>%s' % (self.gds_encode(self.gds_format_string(quote_xml(self.LEASES_USED), input_name='LEASES_USED')), eol_))
+    def build(self, node):
+        already_processed = set()
+        self.buildAttributes(node, node.attrib, already_processed)
+        for child in node:
+            nodeName_ = Tag_pattern_.match(child.tag).groups()[-1]
+            self.buildChildren(child, node, nodeName_)
+        return self
+    def buildAttributes(self, node, attrs, already_processed):
+        pass
+    def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
+        if nodeName_ == 'ID':
+            ID_ = child_.text
+            ID_ = self.gds_validate_string(ID_, node, 'ID')
+            self.ID = ID_
+        elif nodeName_ == 'LEASES':
+            LEASES_ = child_.text
+            LEASES_ = self.gds_validate_string(LEASES_, node, 'LEASES')
+            self.LEASES = LEASES_
+        elif nodeName_ == 'LEASES_USED':
+            LEASES_USED_ = child_.text
+            LEASES_USED_ = self.gds_validate_string(LEASES_USED_, node, 'LEASES_USED')
+            self.LEASES_USED = LEASES_USED_
+# end class NETWORKType25
+
+
+class VM_QUOTAType26(GeneratedsSuper):
+    subclass = None
+    superclass = None
+    def __init__(self, VM=None):
+        self.original_tagname_ = None
+        self.VM = VM
+    def factory(*args_, **kwargs_):
+        if supermod.CurrentSubclassModule_ is not None:
+            subclass = getSubclassFromModule_(
+                supermod.CurrentSubclassModule_, VM_QUOTAType26)
+            if subclass is not None:
+                return subclass(*args_, **kwargs_)
+        if VM_QUOTAType26.subclass:
+            return VM_QUOTAType26.subclass(*args_, **kwargs_)
+        else:
+            return VM_QUOTAType26(*args_, **kwargs_)
+    factory = staticmethod(factory)
+    def get_VM(self): return self.VM
+    def set_VM(self, VM): self.VM = VM
+    def hasContent_(self):
+        if (
+            self.VM is not None
+        ):
+            return True
+        else:
+            return False
+    def export(self, outfile, level, namespaceprefix_='', name_='VM_QUOTAType26', namespacedef_='', pretty_print=True):
+        imported_ns_def_ = GenerateDSNamespaceDefs_.get('VM_QUOTAType26')
+        if imported_ns_def_ is not None:
+            namespacedef_ = imported_ns_def_
+        if pretty_print:
+            eol_ = '\n'
+        else:
+            eol_ = ''
+        if self.original_tagname_ is not None:
+            name_ = self.original_tagname_
+        showIndent(outfile, level, pretty_print)
+        outfile.write('<%s%s%s' % (namespaceprefix_, name_, namespacedef_ and ' ' + namespacedef_ or '', ))
+        already_processed = set()
+        self.exportAttributes(outfile, level, already_processed, namespaceprefix_, name_='VM_QUOTAType26')
+        if self.hasContent_():
+            outfile.write('>%s' % (eol_, ))
+            self.exportChildren(outfile, level + 1, namespaceprefix_='', name_='VM_QUOTAType26', pretty_print=pretty_print)
+            showIndent(outfile, level, pretty_print)
+            outfile.write('</%s%s>%s' % (namespaceprefix_, name_, eol_))
+        else:
+            outfile.write('/>%s' % (eol_, ))
+    def exportAttributes(self, outfile, level, already_processed, namespaceprefix_='', name_='VM_QUOTAType26'):
+        pass
+    def exportChildren(self, outfile, level, namespaceprefix_='', name_='VM_QUOTAType26', fromsubclass_=False, pretty_print=True):
+        if pretty_print:
+            eol_ = '\n'
+        else:
+            eol_ = ''
+        if self.VM is not None:
+            self.VM.export(outfile, level, namespaceprefix_, name_='VM', pretty_print=pretty_print)
+    def build(self, node):
+        already_processed = set()
+        self.buildAttributes(node, node.attrib, already_processed)
+        for child in node:
+            nodeName_ = Tag_pattern_.match(child.tag).groups()[-1]
+            self.buildChildren(child, node, nodeName_)
+        return self
+    def buildAttributes(self, node, attrs, already_processed):
+        pass
+    def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
+        if nodeName_ == 'VM':
+            obj_ = VMType27.factory()
+            obj_.build(child_)
+            self.VM = obj_
+            obj_.original_tagname_ = 'VM'
+# end class VM_QUOTAType26
+
+
+class VMType27(GeneratedsSuper):
+    subclass = None
+    superclass = None
+    def __init__(self, CPU=None, CPU_USED=None, MEMORY=None, MEMORY_USED=None, SYSTEM_DISK_SIZE=None, SYSTEM_DISK_SIZE_USED=None, VMS=None, VMS_USED=None):
+        self.original_tagname_ = None
+        self.CPU = CPU
+        self.CPU_USED = CPU_USED
+        self.MEMORY = MEMORY
+        self.MEMORY_USED = MEMORY_USED
+        self.SYSTEM_DISK_SIZE = SYSTEM_DISK_SIZE
+        self.SYSTEM_DISK_SIZE_USED = SYSTEM_DISK_SIZE_USED
+        self.VMS = VMS
+        self.VMS_USED = VMS_USED
+    def factory(*args_, **kwargs_):
+        if supermod.CurrentSubclassModule_ is not None:
+            subclass = getSubclassFromModule_(
+                supermod.CurrentSubclassModule_, VMType27)
+            if subclass is not None:
+                return subclass(*args_, **kwargs_)
+        if VMType27.subclass:
+            return VMType27.subclass(*args_, **kwargs_)
+        else:
+            return VMType27(*args_, **kwargs_)
+    factory = staticmethod(factory)
+    def get_CPU(self): return self.CPU
+    def set_CPU(self, CPU): self.CPU = CPU
+    def get_CPU_USED(self): return self.CPU_USED
+    def set_CPU_USED(self, CPU_USED): self.CPU_USED = CPU_USED
+    def get_MEMORY(self): return self.MEMORY
+    def set_MEMORY(self, MEMORY): self.MEMORY = MEMORY
+    def get_MEMORY_USED(self): return self.MEMORY_USED
+    def set_MEMORY_USED(self, MEMORY_USED): self.MEMORY_USED = MEMORY_USED
+    def get_SYSTEM_DISK_SIZE(self): return self.SYSTEM_DISK_SIZE
+    def set_SYSTEM_DISK_SIZE(self, SYSTEM_DISK_SIZE): self.SYSTEM_DISK_SIZE = SYSTEM_DISK_SIZE
+    def get_SYSTEM_DISK_SIZE_USED(self): return self.SYSTEM_DISK_SIZE_USED
+    def set_SYSTEM_DISK_SIZE_USED(self, SYSTEM_DISK_SIZE_USED): self.SYSTEM_DISK_SIZE_USED = SYSTEM_DISK_SIZE_USED
+    def get_VMS(self): return self.VMS
+    def set_VMS(self, VMS): self.VMS = VMS
+    def get_VMS_USED(self): return self.VMS_USED
+    def set_VMS_USED(self, VMS_USED): self.VMS_USED = VMS_USED
+    def hasContent_(self):
+        if (
+            self.CPU is not None or
+            self.CPU_USED is not None or
+            self.MEMORY is not None or
+            self.MEMORY_USED is not None or
+            self.SYSTEM_DISK_SIZE is not None or
+            self.SYSTEM_DISK_SIZE_USED is not None or
+            self.VMS is not None or
+            self.VMS_USED is not None
+        ):
+            return True
+        else:
+            return False
+    def export(self, outfile, level, namespaceprefix_='', name_='VMType27', namespacedef_='', pretty_print=True):
+        imported_ns_def_ = GenerateDSNamespaceDefs_.get('VMType27')
+        if imported_ns_def_ is not None:
+            namespacedef_ = imported_ns_def_
+        if pretty_print:
+            eol_ = '\n'
+        else:
+            eol_ = ''
+        if self.original_tagname_ is not None:
+            name_ = self.original_tagname_
+        showIndent(outfile, level, pretty_print)
+        outfile.write('<%s%s%s' % (namespaceprefix_, name_, namespacedef_ and ' ' + namespacedef_ or '', ))
+        already_processed = set()
+        self.exportAttributes(outfile, level, already_processed, namespaceprefix_, name_='VMType27')
+        if self.hasContent_():
+            outfile.write('>%s' % (eol_, ))
+            self.exportChildren(outfile, level + 1, namespaceprefix_='', name_='VMType27', pretty_print=pretty_print)
+            showIndent(outfile, level, pretty_print)
+            outfile.write('</%s%s>%s' % (namespaceprefix_, name_, eol_))
+        else:
+            outfile.write('/>%s' % (eol_, ))
+    def exportAttributes(self, outfile, level, already_processed, namespaceprefix_='', name_='VMType27'):
+        pass
+    def exportChildren(self, outfile, level, namespaceprefix_='', name_='VMType27', fromsubclass_=False, pretty_print=True):
+        if pretty_print:
+            eol_ = '\n'
+        else:
+            eol_ = ''
+        if self.CPU is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<CPU>%s</CPU>%s' % (self.gds_encode(self.gds_format_string(quote_xml(self.CPU), input_name='CPU')), eol_))
+        if self.CPU_USED is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<CPU_USED>%s</CPU_USED>%s' % (self.gds_encode(self.gds_format_string(quote_xml(self.CPU_USED), input_name='CPU_USED')), eol_))
+        if self.MEMORY is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<MEMORY>%s</MEMORY>%s' % (self.gds_encode(self.gds_format_string(quote_xml(self.MEMORY), input_name='MEMORY')), eol_))
+        if self.MEMORY_USED is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<MEMORY_USED>%s</MEMORY_USED>%s' % (self.gds_encode(self.gds_format_string(quote_xml(self.MEMORY_USED), input_name='MEMORY_USED')), eol_))
+        if self.SYSTEM_DISK_SIZE is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<SYSTEM_DISK_SIZE>%s</SYSTEM_DISK_SIZE>%s' % (self.gds_encode(self.gds_format_string(quote_xml(self.SYSTEM_DISK_SIZE), input_name='SYSTEM_DISK_SIZE')), eol_))
+        if self.SYSTEM_DISK_SIZE_USED is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<SYSTEM_DISK_SIZE_USED>%s</SYSTEM_DISK_SIZE_USED>%s' % (self.gds_encode(self.gds_format_string(quote_xml(self.SYSTEM_DISK_SIZE_USED), input_name='SYSTEM_DISK_SIZE_USED')), eol_))
+        if self.VMS is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<VMS>%s</VMS>%s' % (self.gds_encode(self.gds_format_string(quote_xml(self.VMS), input_name='VMS')), eol_))
+        if self.VMS_USED is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<VMS_USED>%s</VMS_USED>%s' % (self.gds_encode(self.gds_format_string(quote_xml(self.VMS_USED), input_name='VMS_USED')), eol_))
+    def build(self, node):
+        already_processed = set()
+        self.buildAttributes(node, node.attrib, already_processed)
+        for child in node:
+            nodeName_ = Tag_pattern_.match(child.tag).groups()[-1]
+            self.buildChildren(child, node, nodeName_)
+        return self
+    def buildAttributes(self, node, attrs, already_processed):
+        pass
+    def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
+        if nodeName_ == 'CPU':
+            CPU_ = child_.text
+            CPU_ = self.gds_validate_string(CPU_, node, 'CPU')
+            self.CPU = CPU_
+        elif nodeName_ == 'CPU_USED':
+            CPU_USED_ = child_.text
+            CPU_USED_ = self.gds_validate_string(CPU_USED_, node, 'CPU_USED')
+            self.CPU_USED = CPU_USED_
+        elif nodeName_ == 'MEMORY':
+            MEMORY_ = child_.text
+            MEMORY_ = self.gds_validate_string(MEMORY_, node, 'MEMORY')
+            self.MEMORY = MEMORY_
+        elif nodeName_ == 'MEMORY_USED':
+            MEMORY_USED_ = child_.text
+            MEMORY_USED_ = self.gds_validate_string(MEMORY_USED_, node, 'MEMORY_USED')
+            self.MEMORY_USED = MEMORY_USED_
+        elif nodeName_ == 'SYSTEM_DISK_SIZE':
+            SYSTEM_DISK_SIZE_ = child_.text
+            SYSTEM_DISK_SIZE_ = self.gds_validate_string(SYSTEM_DISK_SIZE_, node, 'SYSTEM_DISK_SIZE')
+            self.SYSTEM_DISK_SIZE = SYSTEM_DISK_SIZE_
+        elif nodeName_ == 'SYSTEM_DISK_SIZE_USED':
+            SYSTEM_DISK_SIZE_USED_ = child_.text
+            SYSTEM_DISK_SIZE_USED_ = self.gds_validate_string(SYSTEM_DISK_SIZE_USED_, node, 'SYSTEM_DISK_SIZE_USED')
+            self.SYSTEM_DISK_SIZE_USED = SYSTEM_DISK_SIZE_USED_
+        elif nodeName_ == 'VMS':
+            VMS_ = child_.text
+            VMS_ = self.gds_validate_string(VMS_, node, 'VMS')
+            self.VMS = VMS_
+        elif nodeName_ == 'VMS_USED':
+            VMS_USED_ = child_.text
+            VMS_USED_ = self.gds_validate_string(VMS_USED_, node, 'VMS_USED')
+            self.VMS_USED = VMS_USED_
+# end class VMType27
+
+
+class IMAGE_QUOTAType28(GeneratedsSuper):
+    subclass = None
+    superclass = None
+    def __init__(self, IMAGE=None):
+        self.original_tagname_ = None
+        if IMAGE is None:
+            self.IMAGE = []
+        else:
+            self.IMAGE = IMAGE
+    def factory(*args_, **kwargs_):
+        if supermod.CurrentSubclassModule_ is not None:
+            subclass = getSubclassFromModule_(
+                supermod.CurrentSubclassModule_, IMAGE_QUOTAType28)
+            if subclass is not None:
+                return subclass(*args_, **kwargs_)
+        if IMAGE_QUOTAType28.subclass:
+            return IMAGE_QUOTAType28.subclass(*args_, **kwargs_)
+        else:
+            return IMAGE_QUOTAType28(*args_, **kwargs_)
+    factory = staticmethod(factory)
+    def get_IMAGE(self): return self.IMAGE
+    def set_IMAGE(self, IMAGE): self.IMAGE = IMAGE
+    def add_IMAGE(self, value): self.IMAGE.append(value)
+    def insert_IMAGE_at(self, index, value): self.IMAGE.insert(index, value)
+    def replace_IMAGE_at(self, index, value): self.IMAGE[index] = value
+    def hasContent_(self):
+        if (
+            self.IMAGE
+        ):
+            return True
+        else:
+            return False
+    def export(self, outfile, level, namespaceprefix_='', name_='IMAGE_QUOTAType28', namespacedef_='', pretty_print=True):
+        imported_ns_def_ = GenerateDSNamespaceDefs_.get('IMAGE_QUOTAType28')
+        if imported_ns_def_ is not None:
+            namespacedef_ = imported_ns_def_
+        if pretty_print:
+            eol_ = '\n'
+        else:
+            eol_ = ''
+        if self.original_tagname_ is not None:
+            name_ = self.original_tagname_
+        showIndent(outfile, level, pretty_print)
+        outfile.write('<%s%s%s' % (namespaceprefix_, name_, namespacedef_ and ' ' + namespacedef_ or '', ))
+        already_processed = set()
+        self.exportAttributes(outfile, level, already_processed, namespaceprefix_, name_='IMAGE_QUOTAType28')
+        if self.hasContent_():
+            outfile.write('>%s' % (eol_, ))
+            self.exportChildren(outfile, level + 1, namespaceprefix_='', name_='IMAGE_QUOTAType28', pretty_print=pretty_print)
+            showIndent(outfile, level, pretty_print)
+            outfile.write('</%s%s>%s' % (namespaceprefix_, name_, eol_))
+        else:
+            outfile.write('/>%s' % (eol_, ))
+    def exportAttributes(self, outfile, level, already_processed, namespaceprefix_='', name_='IMAGE_QUOTAType28'):
+        pass
+    def exportChildren(self, outfile, level, namespaceprefix_='', name_='IMAGE_QUOTAType28', fromsubclass_=False, pretty_print=True):
+        if pretty_print:
+            eol_ = '\n'
+        else:
+            eol_ = ''
+        for IMAGE_ in self.IMAGE:
+            IMAGE_.export(outfile, level, namespaceprefix_, name_='IMAGE', pretty_print=pretty_print)
+    def build(self, node):
+        already_processed = set()
+        self.buildAttributes(node, node.attrib, already_processed)
+        for child in node:
+            nodeName_ = Tag_pattern_.match(child.tag).groups()[-1]
+            self.buildChildren(child, node, nodeName_)
+        return self
+    def buildAttributes(self, node, attrs, already_processed):
+        pass
+    def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
+        if nodeName_ == 'IMAGE':
+            obj_ = IMAGEType29.factory()
+            obj_.build(child_)
+            self.IMAGE.append(obj_)
+            obj_.original_tagname_ = 'IMAGE'
+# end class IMAGE_QUOTAType28
+
+
+class IMAGEType29(GeneratedsSuper):
+    subclass = None
+    superclass = None
+    def __init__(self, ID=None, RVMS=None, RVMS_USED=None):
+        self.original_tagname_ = None
+        self.ID = ID
+        self.RVMS = RVMS
+        self.RVMS_USED = RVMS_USED
+    def factory(*args_, **kwargs_):
+        if supermod.CurrentSubclassModule_ is not None:
+            subclass = getSubclassFromModule_(
+                supermod.CurrentSubclassModule_, IMAGEType29)
+            if subclass is not None:
+                return subclass(*args_, **kwargs_)
+        if IMAGEType29.subclass:
+            return IMAGEType29.subclass(*args_, **kwargs_)
+        else:
+            return IMAGEType29(*args_, **kwargs_)
+    factory = staticmethod(factory)
+    def get_ID(self): return self.ID
+    def set_ID(self, ID): self.ID = ID
+    def get_RVMS(self): return self.RVMS
+    def set_RVMS(self, RVMS): self.RVMS = RVMS
+    def get_RVMS_USED(self): return self.RVMS_USED
+    def set_RVMS_USED(self, RVMS_USED): self.RVMS_USED = RVMS_USED
+    def hasContent_(self):
+        if (
+            self.ID is not None or
+            self.RVMS is not None or
+            self.RVMS_USED is not None
+        ):
+            return True
+        else:
+            return False
+    def export(self, outfile, level, namespaceprefix_='', name_='IMAGEType29', namespacedef_='', pretty_print=True):
+        imported_ns_def_ = GenerateDSNamespaceDefs_.get('IMAGEType29')
+        if imported_ns_def_ is not None:
+            namespacedef_ = imported_ns_def_
+        if pretty_print:
+            eol_ = '\n'
+        else:
+            eol_ = ''
+        if self.original_tagname_ is not None:
+            name_ = self.original_tagname_
+        showIndent(outfile, level, pretty_print)
+        outfile.write('<%s%s%s' % (namespaceprefix_, name_, namespacedef_ and ' ' + namespacedef_ or '', ))
+        already_processed = set()
+        self.exportAttributes(outfile, level, already_processed, namespaceprefix_, name_='IMAGEType29')
+        if self.hasContent_():
+            outfile.write('>%s' % (eol_, ))
+            self.exportChildren(outfile, level + 1, namespaceprefix_='', name_='IMAGEType29', pretty_print=pretty_print)
+            showIndent(outfile, level, pretty_print)
+            outfile.write('</%s%s>%s' % (namespaceprefix_, name_, eol_))
+        else:
+            outfile.write('/>%s' % (eol_, ))
+    def exportAttributes(self, outfile, level, already_processed, namespaceprefix_='', name_='IMAGEType29'):
+        pass
+    def exportChildren(self, outfile, level, namespaceprefix_='', name_='IMAGEType29', fromsubclass_=False, pretty_print=True):
+        if pretty_print:
+            eol_ = '\n'
+        else:
+            eol_ = ''
+        if self.ID is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<ID>%s</ID>%s' % (self.gds_encode(self.gds_format_string(quote_xml(self.ID), input_name='ID')), eol_))
+        if self.RVMS is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<RVMS>%s</RVMS>%s' % (self.gds_encode(self.gds_format_string(quote_xml(self.RVMS), input_name='RVMS')), eol_))
+        if self.RVMS_USED is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<RVMS_USED>%s</RVMS_USED>%s' % (self.gds_encode(self.gds_format_string(quote_xml(self.RVMS_USED), input_name='RVMS_USED')), eol_))
+    def build(self, node):
+        already_processed = set()
+        self.buildAttributes(node, node.attrib, already_processed)
+        for child in node:
+            nodeName_ = Tag_pattern_.match(child.tag).groups()[-1]
+            self.buildChildren(child, node, nodeName_)
+        return self
+    def buildAttributes(self, node, attrs, already_processed):
+        pass
+    def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
+        if nodeName_ == 'ID':
+            ID_ = child_.text
+            ID_ = self.gds_validate_string(ID_, node, 'ID')
+            self.ID = ID_
+        elif nodeName_ == 'RVMS':
+            RVMS_ = child_.text
+            RVMS_ = self.gds_validate_string(RVMS_, node, 'RVMS')
+            self.RVMS = RVMS_
+        elif nodeName_ == 'RVMS_USED':
+            RVMS_USED_ = child_.text
+            RVMS_USED_ = self.gds_validate_string(RVMS_USED_, node, 'RVMS_USED')
+            self.RVMS_USED = RVMS_USED_
+# end class IMAGEType29
+
+
+class GROUPSub(TemplatedType, GROUP):
+    def __init__(self, ID=None, NAME=None, TEMPLATE=None, USERS=None, ADMINS=None, DATASTORE_QUOTA=None, NETWORK_QUOTA=None, VM_QUOTA=None, IMAGE_QUOTA=None, DEFAULT_GROUP_QUOTAS=None):
+        super(GROUPSub, self).__init__(ID, NAME, TEMPLATE, USERS, ADMINS, DATASTORE_QUOTA, NETWORK_QUOTA, VM_QUOTA, IMAGE_QUOTA, DEFAULT_GROUP_QUOTAS, )
+GROUP.subclass = GROUPSub
+# end class GROUPSub
+
+
+class USERSType11Sub(TemplatedType, USERSType11):
+    def __init__(self, ID=None):
+        super(USERSType11Sub, self).__init__(ID, )
+USERSType11.subclass = USERSType11Sub
+# end class USERSType11Sub
+
+
+class ADMINSType12Sub(TemplatedType, ADMINSType12):
+    def __init__(self, ID=None):
+        super(ADMINSType12Sub, self).__init__(ID, )
+ADMINSType12.subclass = ADMINSType12Sub
+# end class ADMINSType12Sub
+
+
+class DATASTORE_QUOTAType13Sub(TemplatedType, DATASTORE_QUOTAType13):
+    def __init__(self, DATASTORE=None):
+        super(DATASTORE_QUOTAType13Sub, self).__init__(DATASTORE, )
+DATASTORE_QUOTAType13.subclass = DATASTORE_QUOTAType13Sub
+# end class DATASTORE_QUOTAType13Sub
+
+
+class DATASTOREType14Sub(TemplatedType, DATASTOREType14):
+    def __init__(self, ID=None, IMAGES=None, IMAGES_USED=None, SIZE=None, SIZE_USED=None):
+        super(DATASTOREType14Sub, self).__init__(ID, IMAGES, IMAGES_USED, SIZE, SIZE_USED, )
+DATASTOREType14.subclass = DATASTOREType14Sub
+# end class DATASTOREType14Sub
+
+
+class NETWORK_QUOTAType15Sub(TemplatedType, NETWORK_QUOTAType15):
+    def __init__(self, NETWORK=None):
+        super(NETWORK_QUOTAType15Sub, self).__init__(NETWORK, )
+NETWORK_QUOTAType15.subclass = NETWORK_QUOTAType15Sub
+# end class NETWORK_QUOTAType15Sub
+
+
+class NETWORKType16Sub(TemplatedType, NETWORKType16):
+    def __init__(self, ID=None, LEASES=None, LEASES_USED=None):
+        super(NETWORKType16Sub, self).__init__(ID, LEASES, LEASES_USED, )
+NETWORKType16.subclass = NETWORKType16Sub
+# end class NETWORKType16Sub
+
+
+class VM_QUOTAType17Sub(TemplatedType, VM_QUOTAType17):
+    def __init__(self, VM=None):
+        super(VM_QUOTAType17Sub, self).__init__(VM, )
+VM_QUOTAType17.subclass = VM_QUOTAType17Sub
+# end class VM_QUOTAType17Sub
+
+
+class VMType18Sub(TemplatedType, VMType18):
+    def __init__(self, CPU=None, CPU_USED=None, MEMORY=None, MEMORY_USED=None, SYSTEM_DISK_SIZE=None, SYSTEM_DISK_SIZE_USED=None, VMS=None, VMS_USED=None):
+        super(VMType18Sub, self).__init__(CPU, CPU_USED, MEMORY, MEMORY_USED, SYSTEM_DISK_SIZE, SYSTEM_DISK_SIZE_USED, VMS, VMS_USED, )
+VMType18.subclass = VMType18Sub
+# end class VMType18Sub
+
+
+class IMAGE_QUOTAType19Sub(TemplatedType, IMAGE_QUOTAType19):
+    def __init__(self, IMAGE=None):
+        super(IMAGE_QUOTAType19Sub, self).__init__(IMAGE, )
+IMAGE_QUOTAType19.subclass = IMAGE_QUOTAType19Sub
+# end class IMAGE_QUOTAType19Sub
+
+
+class IMAGEType20Sub(TemplatedType, IMAGEType20):
+    def __init__(self, ID=None, RVMS=None, RVMS_USED=None):
+        super(IMAGEType20Sub, self).__init__(ID, RVMS, RVMS_USED, )
+IMAGEType20.subclass = IMAGEType20Sub
+# end class IMAGEType20Sub
+
+
+class DEFAULT_GROUP_QUOTASType21Sub(TemplatedType, DEFAULT_GROUP_QUOTASType21):
+    def __init__(self, DATASTORE_QUOTA=None, NETWORK_QUOTA=None, VM_QUOTA=None, IMAGE_QUOTA=None):
+        super(DEFAULT_GROUP_QUOTASType21Sub, self).__init__(DATASTORE_QUOTA, NETWORK_QUOTA, VM_QUOTA, IMAGE_QUOTA, )
+DEFAULT_GROUP_QUOTASType21.subclass = DEFAULT_GROUP_QUOTASType21Sub
+# end class DEFAULT_GROUP_QUOTASType21Sub
+
+
+class DATASTORE_QUOTAType22Sub(TemplatedType, DATASTORE_QUOTAType22):
+    def __init__(self, DATASTORE=None):
+        super(DATASTORE_QUOTAType22Sub, self).__init__(DATASTORE, )
+DATASTORE_QUOTAType22.subclass = DATASTORE_QUOTAType22Sub
+# end class DATASTORE_QUOTAType22Sub
+
+
+class DATASTOREType23Sub(TemplatedType, DATASTOREType23):
+    def __init__(self, ID=None, IMAGES=None, IMAGES_USED=None, SIZE=None, SIZE_USED=None):
+        super(DATASTOREType23Sub, self).__init__(ID, IMAGES, IMAGES_USED, SIZE, SIZE_USED, )
+DATASTOREType23.subclass = DATASTOREType23Sub
+# end class DATASTOREType23Sub
+
+
+class NETWORK_QUOTAType24Sub(TemplatedType, NETWORK_QUOTAType24):
+    def __init__(self, NETWORK=None):
+        super(NETWORK_QUOTAType24Sub, self).__init__(NETWORK, )
+NETWORK_QUOTAType24.subclass = NETWORK_QUOTAType24Sub
+# end class NETWORK_QUOTAType24Sub
+
+
+class NETWORKType25Sub(TemplatedType, NETWORKType25):
+    def __init__(self, ID=None, LEASES=None, LEASES_USED=None):
+        super(NETWORKType25Sub, self).__init__(ID, LEASES, LEASES_USED, )
+NETWORKType25.subclass = NETWORKType25Sub
+# end class NETWORKType25Sub
+
+
+class VM_QUOTAType26Sub(TemplatedType, VM_QUOTAType26):
+    def __init__(self, VM=None):
+        super(VM_QUOTAType26Sub, self).__init__(VM, )
+VM_QUOTAType26.subclass = VM_QUOTAType26Sub
+# end class VM_QUOTAType26Sub
+
+
+class VMType27Sub(TemplatedType, VMType27):
+    def __init__(self, CPU=None, CPU_USED=None, MEMORY=None, MEMORY_USED=None, SYSTEM_DISK_SIZE=None, SYSTEM_DISK_SIZE_USED=None, VMS=None, VMS_USED=None):
+        super(VMType27Sub, self).__init__(CPU, CPU_USED, MEMORY, MEMORY_USED, SYSTEM_DISK_SIZE, SYSTEM_DISK_SIZE_USED, VMS, VMS_USED, )
+VMType27.subclass = VMType27Sub
+# end class VMType27Sub
+
+
+class IMAGE_QUOTAType28Sub(TemplatedType, IMAGE_QUOTAType28):
+    def __init__(self, IMAGE=None):
+        super(IMAGE_QUOTAType28Sub, self).__init__(IMAGE, )
+IMAGE_QUOTAType28.subclass = IMAGE_QUOTAType28Sub
+# end class IMAGE_QUOTAType28Sub
+
+
+class IMAGEType29Sub(TemplatedType, IMAGEType29):
+    def __init__(self, ID=None, RVMS=None, RVMS_USED=None):
+        super(IMAGEType29Sub, self).__init__(ID, RVMS, RVMS_USED, )
+IMAGEType29.subclass = IMAGEType29Sub
+# end class IMAGEType29Sub
+
+
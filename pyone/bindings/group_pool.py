@@ -0,0 +1,2359 @@
+#!/usr/bin/env python
+
+#
+# Bindings of GROUP_POOL, generated by generateDS.py and split from supbind by src/split_bindings.py
+#
+
+import sys
+import re as re_
+import base64
+import datetime as datetime_
+import warnings as warnings_
+try:
+    from lxml import etree as etree_
+except ImportError:
+    from xml.etree import ElementTree as etree_
+from pyone.util import TemplatedType
+from . import supbind as supermod
+from .supbind import (
+    GenerateDSNamespaceDefs_,
+    GeneratedsSuper,
+    Tag_pattern_,
+    getSubclassFromModule_,
+    quote_xml,
+    raise_parse_error,
+    showIndent,
+)
+
+
+class GROUP_POOL(GeneratedsSuper):
+    subclass = None
+    superclass = None
+    def __init__(self, GROUP=None, QUOTAS=None, DEFAULT_GROUP_QUOTAS=None):
+        self.original_tagname_ = None
+        if GROUP is None:
+            self.GROUP = []
+        else:
+            self.GROUP = GROUP
+        if QUOTAS is None:
+            self.QUOTAS = []
+        else:
+            self.QUOTAS = QUOTAS
+        self.DEFAULT_GROUP_QUOTAS = DEFAULT_GROUP_QUOTAS
+    def factory(*args_, **kwargs_):
+        if supermod.CurrentSubclassModule_ is not None:
+            subclass = getSubclassFromModule_(
+                supermod.CurrentSubclassModule_, GROUP_POOL)
+            if subclass is not None:
+                return subclass(*args_, **kwargs_)
+        if GROUP_POOL.subclass:
+            return GROUP_POOL.subclass(*args_, **kwargs_)
+        else:
+            return GROUP_POOL(*args_, **kwargs_)
+    factory = staticmethod(factory)
+    def get_GROUP(self): return self.GROUP
+    def set_GROUP(self, GROUP): self.GROUP = GROUP
+    def add_GROUP(self, value): self.GROUP.append(value)
+    def insert_GROUP_at(self, index, value): self.GROUP.insert(index, value)
+    def replace_GROUP_at(self, index, value): self.GROUP[index] = value
+    def get_QUOTAS(self): return self.QUOTAS
+    def set_QUOTAS(self, QUOTAS): self.QUOTAS = QUOTAS
+    def add_QUOTAS(self, value): self.QUOTAS.append(value)
+    def insert_QUOTAS_at(self, index, value): self.QUOTAS.insert(index, value)
+    def replace_QUOTAS_at(self, index, value): self.QUOTAS[index] = value
+    def get_DEFAULT_GROUP_QUOTAS(self): return self.DEFAULT_GROUP_QUOTAS
+    def set_DEFAULT_GROUP_QUOTAS(self, DEFAULT_GROUP_QUOTAS): self.DEFAULT_GROUP_QUOTAS = DEFAULT_GROUP_QUOTAS
+    def hasContent_(self):
+        if (
+            self.GROUP or
+            self.QUOTAS or
+            self.DEFAULT_GROUP_QUOTAS is not None
+        ):
+            return True
+        else:
+            return False
+    def export(self, outfile, level, namespaceprefix_='', name_='GROUP_POOL', namespacedef_='', pretty_print=True):
+        imported_ns_def_ = GenerateDSNamespaceDefs_.get('GROUP_POOL')
+        if imported_ns_def_ is not None:
+            namespacedef_ = imported_ns_def_
+        if pretty_print:
+            eol_ = '\n'
+        else:
+            eol_ = ''
+        if self.original_tagname_ is not None:
+            name_ = self.original_tagname_
+        showIndent(outfile, level, pretty_print)
+        outfile.write('<%s%s%s' % (namespaceprefix_, name_, namespacedef_ and ' ' + namespacedef_ or '', ))
+        already_processed = set()
+        self.exportAttributes(outfile, level, already_processed, namespaceprefix_, name_='GROUP_POOL')
+        if self.hasContent_():
+            outfile.write('>%s' % (eol_, ))
+            self.exportChildren(outfile, level + 1, namespaceprefix_='', name_='GROUP_POOL', pretty_print=pretty_print)
+            showIndent(outfile, level, pretty_print)
+            outfile.write('</%s%s>%s' % (namespaceprefix_, name_, eol_))
+        else:
+            outfile.write('/>%s' % (eol_, ))
+    def exportAttributes(self, outfile, level, already_processed, namespaceprefix_='', name_='GROUP_POOL'):
+        pass
+    def exportChildren(self, outfile, level, namespaceprefix_='', name_='GROUP_POOL', fromsubclass_=False, pretty_print=True):
+        if pretty_print:
+            eol_ = '\n'
+        else:
+            eol_ = ''
+        for GROUP_ in self.GROUP:
+            GROUP_.export(outfile, level, namespaceprefix_, name_='GROUP', pretty_print=pretty_print)
+        for QUOTAS_ in self.QUOTAS:
+            QUOTAS_.export(outfile, level, namespaceprefix_, name_='QUOTAS', pretty_print=pretty_print)
+        if self.DEFAULT_GROUP_QUOTAS is not None:
+            self.DEFAULT_GROUP_QUOTAS.export(outfile, level, namespaceprefix_, name_='DEFAULT_GROUP_QUOTAS', pretty_print=pretty_print)
+    def build(self, node):
+        already_processed = set()
+        self.buildAttributes(node, node.attrib, already_processed)
+        for child in node:
+            nodeName_ = Tag_pattern_.match(child.tag).groups()[-1]
+            self.buildChildren(child, node, nodeName_)
+        return self
+    def buildAttributes(self, node, attrs, already_processed):
+        pass
+    def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
+        if nodeName_ == 'GROUP':
+            obj_ = GROUPType.factory()
+            obj_.build(child_)
+            self.GROUP.append(obj_)
+            obj_.original_tagname_ = 'GROUP'
+        elif nodeName_ == 'QUOTAS':
+            obj_ = QUOTASType.factory()
+            obj_.build(child_)
+            self.QUOTAS.append(obj_)
+            obj_.original_tagname_ = 'QUOTAS'
+        elif nodeName_ == 'DEFAULT_GROUP_QUOTAS':
+            obj_ = DEFAULT_GROUP_QUOTASType.factory()
+            obj_.build(child_)
+            self.DEFAULT_GROUP_QUOTAS = obj_
+            obj_.original_tagname_ = 'DEFAULT_GROUP_QUOTAS'
+# end class GROUP_POOL
+
+
+class GROUPType(GeneratedsSuper):
+    subclass = None
+    superclass = None
+    def __init__(self, ID=None, NAME=None, TEMPLATE=None, USERS=None, ADMINS=None):
+        self.original_tagname_ = None
+        self.ID = ID
+        self.NAME = NAME
+        self.TEMPLATE = TEMPLATE
+        self.USERS = USERS
+        self.ADMINS = ADMINS
+    def factory(*args_, **kwargs_):
+        if supermod.CurrentSubclassModule_ is not None:
+            subclass = getSubclassFromModule_(
+                supermod.CurrentSubclassModule_, GROUPType)
+            if subclass is not None:
+                return subclass(*args_, **kwargs_)
+        if GROUPType.subclass:
+            return GROUPType.subclass(*args_, **kwargs_)
+        else:
+            return GROUPType(*args_, **kwargs_)
+    factory = staticmethod(factory)
+    def get_ID(self): return self.ID
+    def set_ID(self, ID): self.ID = ID
+    def get_NAME(self): return self.NAME
+    def set_NAME(self, NAME): self.NAME = NAME
+    def get_TEMPLATE(self): return self.TEMPLATE
+    def set_TEMPLATE(self, TEMPLATE): self.TEMPLATE = TEMPLATE
+    def get_USERS(self): return self.USERS
+    def set_USERS(self, USERS): self.USERS = USERS
+    def get_ADMINS(self): return self.ADMINS
+    def set_ADMINS(self, ADMINS): self.ADMINS = ADMINS
+    def hasContent_(self):
+        if (
+            self.ID is not None or
+            self.NAME is not None or
+            self.TEMPLATE is not None or
+            self.USERS is not None or
+            self.ADMINS is not None
+        ):
+            return True
+        else:
+            return False
+    def export(self, outfile, level, namespaceprefix_='', name_='GROUPType', namespacedef_='', pretty_print=True):
+        imported_ns_def_ = GenerateDSNamespaceDefs_.get('GROUPType')
+        if imported_ns_def_ is not None:
+            namespacedef_ = imported_ns_def_
+        if pretty_print:
+            eol_ = '\n'
+        else:
+            eol_ = ''
+        if self.original_tagname_ is not None:
+            name_ = self.original_tagname_
+        showIndent(outfile, level, pretty_print)
+        outfile.write('<%s%s%s' % (namespaceprefix_, name_, namespacedef_ and ' ' + namespacedef_ or '', ))
+        already_processed = set()
+        self.exportAttributes(outfile, level, already_processed, namespaceprefix_, name_='GROUPType')
+        if self.hasContent_():
+            outfile.write('>%s' % (eol_, ))
+            self.exportChildren(outfile, level + 1, namespaceprefix_='', name_='GROUPType', pretty_print=pretty_print)
+            showIndent(outfile, level, pretty_print)
+            outfile.write('</%s%s>%s' % (namespaceprefix_, name_, eol_))
+        else:
+            outfile.write('/>%s' % (eol_, ))
+    def exportAttributes(self, outfile, level, already_processed, namespaceprefix_='', name_='GROUPType'):
+        pass
+    def exportChildren(self, outfile, level, namespaceprefix_='', name_='GROUPType', fromsubclass_=False, pretty_print=True):
+        if pretty_print:
+            eol_ = '\n'
+        else:
+            eol_ = ''
+        if self.ID is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<ID>%s</ID>%s' % (self.gds_format_integer(self.ID, input_name='ID'), eol_))
+        if self.NAME is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<NAME>%s</NAME>%s' % (self.gds_encode(self.gds_format_string(quote_xml(self.NAME), input_name='NAME')), eol_))
+        if self.TEMPLATE is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<TEMPLATE>%s</TEMPLATE>%s' % (self.gds_encode(self.gds_format_string(quote_xml(self.TEMPLATE), input_name='TEMPLATE')), eol_))
+        if self.USERS is not None:
+            self.USERS.export(outfile, level, namespaceprefix_, name_='USERS', pretty_print=pretty_print)
+        if self.ADMINS is not None:
+            self.ADMINS.export(outfile, level, namespaceprefix_, name_='ADMINS', pretty_print=pretty_print)
+    def build(self, node):
+        already_processed = set()
+        self.buildAttributes(node, node.attrib, already_processed)
+        for child in node:
+            nodeName_ = Tag_pattern_.match(child.tag).groups()[-1]
+            self.buildChildren(child, node, nodeName_)
+        return self
+    def buildAttributes(self, node, attrs, already_processed):
+        pass
+    def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
+        if nodeName_ == 'ID' and child_.text:
+            sval_ = child_.text
+            try:
+                ival_ = int(sval_)
+            except (TypeError, ValueError) as exp:
+                raise_parse_error(child_, 'requires integer: %s' % exp)
+            ival_ = self.gds_validate_integer(ival_, node, 'ID')
+            self.ID = ival_
+        elif nodeName_ == 'NAME':
+            NAME_ = child_.text
+            NAME_ = self.gds_validate_string(NAME_, node, 'NAME')
+            self.NAME = NAME_
+        elif nodeName_ == 'TEMPLATE':
+            TEMPLATE_ = child_.text
+            TEMPLATE_ = self.gds_validate_string(TEMPLATE_, node, 'TEMPLATE')
+            self.TEMPLATE = TEMPLATE_
+        elif nodeName_ == 'USERS':
+            obj_ = USERSType.factory()
+            obj_.build(child_)
+            self.USERS = obj_
+            obj_.original_tagname_ = 'USERS'
+        elif nodeName_ == 'ADMINS':
+            obj_ = ADMINSType.factory()
+            obj_.build(child_)
+            self.ADMINS = obj_
+            obj_.original_tagname_ = 'ADMINS'
+# end class GROUPType
+
+
+class USERSType(GeneratedsSuper):
+    subclass = None
+    superclass = None
+    def __init__(self, ID=None):
+        self.original_tagname_ = None
+        if ID is None:
+            self.ID = []
+        else:
+            self.ID = ID
+    def factory(*args_, **kwargs_):
+        if supermod.CurrentSubclassModule_ is not None:
+            subclass = getSubclassFromModule_(
+                supermod.CurrentSubclassModule_, USERSType)
+            if subclass is not None:
+                return subclass(*args_, **kwargs_)
+        if USERSType.subclass:
+            return USERSType.subclass(*args_, **kwargs_)
+        else:
+            return USERSType(*args_, **kwargs_)
+    factory = staticmethod(factory)
+    def get_ID(self): return self.ID
+    def set_ID(self, ID): self.ID = ID
+    def add_ID(self, value): self.ID.append(value)
+    def insert_ID_at(self, index, value): self.ID.insert(index, value)
+    def replace_ID_at(self, index, value): self.ID[index] = value
+    def hasContent_(self):
+        if (
+            self.ID
+        ):
+            return True
+        else:
+            return False
+    def export(self, outfile, level, namespaceprefix_='', name_='USERSType', namespacedef_='', pretty_print=True):
+        imported_ns_def_ = GenerateDSNamespaceDefs_.get('USERSType')
+        if imported_ns_def_ is not None:
+            namespacedef_ = imported_ns_def_
+        if pretty_print:
+            eol_ = '\n'
+        else:
+            eol_ = ''
+        if self.original_tagname_ is not None:
+            name_ = self.original_tagname_
+        showIndent(outfile, level, pretty_print)
+        outfile.write('<%s%s%s' % (namespaceprefix_, name_, namespacedef_ and ' ' + namespacedef_ or '', ))
+        already_processed = set()
+        self.exportAttributes(outfile, level, already_processed, namespaceprefix_, name_='USERSType')
+        if self.hasContent_():
+            outfile.write('>%s' % (eol_, ))
+            self.exportChildren(outfile, level + 1, namespaceprefix_='', name_='USERSType', pretty_print=pretty_print)
+            showIndent(outfile, level, pretty_print)
+            outfile.write('</%s%s>%s' % (namespaceprefix_, name_, eol_))
+        else:
+            outfile.write('/>%s' % (eol_, ))
+    def exportAttributes(self, outfile, level, already_processed, namespaceprefix_='', name_='USERSType'):
+        pass
+    def exportChildren(self, outfile, level, namespaceprefix_='', name_='USERSType', fromsubclass_=False, pretty_print=True):
+        if pretty_print:
+            eol_ = '\n'
+        else:
+            eol_ = ''
+        for ID_ in self.ID:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<ID>%s</ID>%s' % (self.gds_format_integer(ID_, input_name='ID'), eol_))
+    def build(self, node):
+        already_processed = set()
+        self.buildAttributes(node, node.attrib, already_processed)
+        for child in node:
+            nodeName_ = Tag_pattern_.match(child.tag).groups()[-1]
+            self.buildChildren(child, node, nodeName_)
+        return self
+    def buildAttributes(self, node, attrs, already_processed):
+        pass
+    def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
+        if nodeName_ == 'ID' and child_.text:
+            sval_ = child_.text
+            try:
+                ival_ = int(sval_)
+            except (TypeError, ValueError) as exp:
+                raise_parse_error(child_, 'requires integer: %s' % exp)
+            ival_ = self.gds_validate_integer(ival_, node, 'ID')
+            self.ID.append(ival_)
+# end class USERSType
+
+
+class ADMINSType(GeneratedsSuper):
+    subclass = None
+    superclass = None
+    def __init__(self, ID=None):
+        self.original_tagname_ = None
+        if ID is None:
+            self.ID = []
+        else:
+            self.ID = ID
+    def factory(*args_, **kwargs_):
+        if supermod.CurrentSubclassModule_ is not None:
+            subclass = getSubclassFromModule_(
+                supermod.CurrentSubclassModule_, ADMINSType)
+            if subclass is not None:
+                return subclass(*args_, **kwargs_)
+        if ADMINSType.subclass:
+            return ADMINSType.subclass(*args_, **kwargs_)
+        else:
+            return ADMINSType(*args_, **kwargs_)
+    factory = staticmethod(factory)
+    def get_ID(self): return self.ID
+    def set_ID(self, ID): self.ID = ID
+    def add_ID(self, value): self.ID.append(value)
+    def insert_ID_at(self, index, value): self.ID.insert(index, value)
+    def replace_ID_at(self, index, value): self.ID[index] = value
+    def hasContent_(self):
+        if (
+            self.ID
+        ):
+            return True
+        else:
+            return False
+    def export(self, outfile, level, namespaceprefix_='', name_='ADMINSType', namespacedef_='', pretty_print=True):
+        imported_ns_def_ = GenerateDSNamespaceDefs_.get('ADMINSType')
+        if imported_ns_def_ is not None:
+            namespacedef_ = imported_ns_def_
+        if pretty_print:
+            eol_ = '\n'
+        else:
+            eol_ = ''
+        if self.original_tagname_ is not None:
+            name_ = self.original_tagname_
+        showIndent(outfile, level, pretty_print)
+        outfile.write('<%s%s%s' % (namespaceprefix_, name_, namespacedef_ and ' ' + namespacedef_ or '', ))
+        already_processed = set()
+        self.exportAttributes(outfile, level, already_processed, namespaceprefix_, name_='ADMINSType')
+        if self.hasContent_():
+            outfile.write('>%s' % (eol_, ))
+            self.exportChildren(outfile, level + 1, namespaceprefix_='', name_='ADMINSType', pretty_print=pretty_print)
+            showIndent(outfile, level, pretty_print)
+            outfile.write('</%s%s>%s' % (namespaceprefix_, name_, eol_))
+        else:
+            outfile.write('/>%s' % (eol_, ))
+    def exportAttributes(self, outfile, level, already_processed, namespaceprefix_='', name_='ADMINSType'):
+        pass
+    def exportChildren(self, outfile, level, namespaceprefix_='', name_='ADMINSType', fromsubclass_=False, pretty_print=True):
+        if pretty_print:
+            eol_ = '\n'
+        else:
+            eol_ = ''
+        for ID_ in self.ID:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<ID>%s</ID>%s' % (self.gds_format_integer(ID_, input_name='ID'), eol_))
+    def build(self, node):
+        already_processed = set()
+        self.buildAttributes(node, node.attrib, already_processed)
+        for child in node:
+            nodeName_ = Tag_pattern_.match(child.tag).groups()[-1]
+            self.buildChildren(child, node, nodeName_)
+        return self
+    def buildAttributes(self, node, attrs, already_processed):
+        pass
+    def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
+        if nodeName_ == 'ID' and child_.text:
+            sval_ = child_.text
+            try:
+                ival_ = int(sval_)
+            except (TypeError, ValueError) as exp:
+                raise_parse_error(child_, 'requires integer: %s' % exp)
+            ival_ = self.gds_validate_integer(ival_, node, 'ID')
+            self.ID.append(ival_)
+# end class ADMINSType
+
+
+class QUOTASType(GeneratedsSuper):
+    subclass = None
+    superclass = None
+    def __init__(self, ID=None, DATASTORE_QUOTA=None, NETWORK_QUOTA=None, VM_QUOTA=None, IMAGE_QUOTA=None):
+        self.original_tagname_ = None
+        self.ID = ID
+        self.DATASTORE_QUOTA = DATASTORE_QUOTA
+        self.NETWORK_QUOTA = NETWORK_QUOTA
+        self.VM_QUOTA = VM_QUOTA
+        self.IMAGE_QUOTA = IMAGE_QUOTA
+    def factory(*args_, **kwargs_):
+        if supermod.CurrentSubclassModule_ is not None:
+            subclass = getSubclassFromModule_(
+                supermod.CurrentSubclassModule_, QUOTASType)
+            if subclass is not None:
+                return subclass(*args_, **kwargs_)
+        if QUOTASType.subclass:
+            return QUOTASType.subclass(*args_, **kwargs_)
+        else:
+            return QUOTASType(*args_, **kwargs_)
+    factory = staticmethod(factory)
+    def get_ID(self): return self.ID
+    def set_ID(self, ID): self.ID = ID
+    def get_DATASTORE_QUOTA(self): return self.DATASTORE_QUOTA
+    def set_DATASTORE_QUOTA(self, DATASTORE_QUOTA): self.DATASTORE_QUOTA = DATASTORE_QUOTA
+    def get_NETWORK_QUOTA(self): return self.NETWORK_QUOTA
+    def set_NETWORK_QUOTA(self, NETWORK_QUOTA): self.NETWORK_QUOTA = NETWORK_QUOTA
+    def get_VM_QUOTA(self): return self.VM_QUOTA
+    def set_VM_QUOTA(self, VM_QUOTA): self.VM_QUOTA = VM_QUOTA
+    def get_IMAGE_QUOTA(self): return self.IMAGE_QUOTA
+    def set_IMAGE_QUOTA(self, IMAGE_QUOTA): self.IMAGE_QUOTA = IMAGE_QUOTA
+    def hasContent_(self):
+        if (
+            self.ID is not None or
+            self.DATASTORE_QUOTA is not None or
+            self.NETWORK_QUOTA is not None or
+            self.VM_QUOTA is not None or
+            self.IMAGE_QUOTA is not None
+        ):
+            return True
+        else:
+            return False
+    def export(self, outfile, level, namespaceprefix_='', name_='QUOTASType', namespacedef_='', pretty_print=True):
+        imported_ns_def_ = GenerateDSNamespaceDefs_.get('QUOTASType')
+        if imported_ns_def_ is not None:
+            namespacedef_ = imported_ns_def_
+        if pretty_print:
+            eol_ = '\n'
+        else:
+            eol_ = ''
+        if self.original_tagname_ is not None:
+            name_ = self.original_tagname_
+        showIndent(outfile, level, pretty_print)
+        outfile.write('<%s%s%s' % (namespaceprefix_, name_, namespacedef_ and ' ' + namespacedef_ or '', ))
+        already_processed = set()
+        self.exportAttributes(outfile, level, already_processed, namespaceprefix_, name_='QUOTASType')
+        if self.hasContent_():
+            outfile.write('>%s' % (eol_, ))
+            self.exportChildren(outfile, level + 1, namespaceprefix_='', name_='QUOTASType', pretty_print=pretty_print)
+            showIndent(outfile, level, pretty_print)
+            outfile.write('</%s%s>%s' % (namespaceprefix_, name_, eol_))
+        else:
+            outfile.write('/>%s' % (eol_, ))
+    def exportAttributes(self, outfile, level, already_processed, namespaceprefix_='', name_='QUOTASType'):
+        pass
+    def exportChildren(self, outfile, level, namespaceprefix_='', name_='QUOTASType', fromsubclass_=False, pretty_print=True):
+        if pretty_print:
+            eol_ = '\n'
+        else:
+            eol_ = ''
+        if self.ID is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<ID>%s</ID>%s' % (self.gds_format_integer(self.ID, input_name='ID'), eol_))
+        if self.DATASTORE_QUOTA is not None:
+            self.DATASTORE_QUOTA.export(outfile, level, namespaceprefix_, name_='DATASTORE_QUOTA', pretty_print=pretty_print)
+        if self.NETWORK_QUOTA is not None:
+            self.NETWORK_QUOTA.export(outfile, level, namespaceprefix_, name_='NETWORK_QUOTA', pretty_print=pretty_print)
+        if self.VM_QUOTA is not None:
+            self.VM_QUOTA.export(outfile, level, namespaceprefix_, name_='VM_QUOTA', pretty_print=pretty_print)
+        if self.IMAGE_QUOTA is not None:
+            self.IMAGE_QUOTA.export(outfile, level, namespaceprefix_, name_='IMAGE_QUOTA', pretty_print=pretty_print)
+    def build(self, node):
+        already_processed = set()
+        self.buildAttributes(node, node.attrib, already_processed)
+        for child in node:
+            nodeName_ = Tag_pattern_.match(child.tag).groups()[-1]
+            self.buildChildren(child, node, nodeName_)
+        return self
+    def buildAttributes(self, node, attrs, already_processed):
+        pass
+    def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
+        if nodeName_ == 'ID' and child_.text:
+            sval_ = child_.text
+            try:
+                ival_ = int(sval_)
+            except (TypeError, ValueError) as exp:
+                raise_parse_error(child_, 'requires integer: %s' % exp)
+            ival_ = self.gds_validate_integer(ival_, node, 'ID')
+            self.ID = ival_
+        elif nodeName_ == 'DATASTORE_QUOTA':
+            obj_ = DATASTORE_QUOTAType.factory()
+            obj_.build(child_)
+            self.DATASTORE_QUOTA = obj_
+            obj_.original_tagname_ = 'DATASTORE_QUOTA'
+        elif nodeName_ == 'NETWORK_QUOTA':
+            obj_ = NETWORK_QUOTAType.factory()
+            obj_.build(child_)
+            self.NETWORK_QUOTA = obj_
+            obj_.original_tagname_ = 'NETWORK_QUOTA'
+        elif nodeName_ == 'VM_QUOTA':
+            obj_ = VM_QUOTAType.factory()
+            obj_.build(child_)
+            self.VM_QUOTA = obj_
+            obj_.original_tagname_ = 'VM_QUOTA'
+        elif nodeName_ == 'IMAGE_QUOTA':
+            obj_ = IMAGE_QUOTAType.factory()
+            obj_.build(child_)
+            self.IMAGE_QUOTA = obj_
+            obj_.original_tagname_ = 'IMAGE_QUOTA'
+# end class QUOTASType
+
+
+class DATASTORE_QUOTAType(GeneratedsSuper):
+    subclass = None
+    superclass = None
+    def __init__(self, DATASTORE=None):
+        self.original_tagname_ = None
+        if DATASTORE is None:
+            self.DATASTORE = []
+        else:
+            self.DATASTORE = DATASTORE
+    def factory(*args_, **kwargs_):
+        if supermod.CurrentSubclassModule_ is not None:
+            subclass = getSubclassFromModule_(
+                supermod.CurrentSubclassModule_, DATASTORE_QUOTAType)
+            if subclass is not None:
+                return subclass(*args_, **kwargs_)
+        if DATASTORE_QUOTAType.subclass:
+            return DATASTORE_QUOTAType.subclass(*args_, **kwargs_)
+        else:
+            return DATASTORE_QUOTAType(*args_, **kwargs_)
+    factory = staticmethod(factory)
+    def get_DATASTORE(self): return self.DATASTORE
+    def set_DATASTORE(self, DATASTORE): self.DATASTORE = DATASTORE
+    def add_DATASTORE(self, value): self.DATASTORE.append(value)
+    def insert_DATASTORE_at(self, index, value): self.DATASTORE.insert(index, value)
+    def replace_DATASTORE_at(self, index, value): self.DATASTORE[index] = value
+    def hasContent_(self):
+        if (
+            self.DATASTORE
+        ):
+            return True
+        else:
+            return False
+    def export(self, outfile, level, namespaceprefix_='', name_='DATASTORE_QUOTAType', namespacedef_='', pretty_print=True):
+        imported_ns_def_ = GenerateDSNamespaceDefs_.get('DATASTORE_QUOTAType')
+        if imported_ns_def_ is not None:
+            namespacedef_ = imported_ns_def_
+        if pretty_print:
+            eol_ = '\n'
+        else:
+            eol_ = ''
+        if self.original_tagname_ is not None:
+            name_ = self.original_tagname_
+        showIndent(outfile, level, pretty_print)
+        outfile.write('<%s%s%s' % (namespaceprefix_, name_, namespacedef_ and ' ' + namespacedef_ or '', ))
+        already_processed = set()
+        self.exportAttributes(outfile, level, already_processed, namespaceprefix_, name_='DATASTORE_QUOTAType')
+        if self.hasContent_():
+            outfile.write('>%s' % (eol_, ))
+            self.exportChildren(outfile, level + 1, namespaceprefix_='', name_='DATASTORE_QUOTAType', pretty_print=pretty_print)
+            showIndent(outfile, level, pretty_print)
+            outfile.write('</%s%s>%s' % (namespaceprefix_, name_, eol_))
+        else:
+            outfile.write('/>%s' % (eol_, ))
+    def exportAttributes(self, outfile, level, already_processed, namespaceprefix_='', name_='DATASTORE_QUOTAType'):
+        pass
+    def exportChildren(self, outfile, level, namespaceprefix_='', name_='DATASTORE_QUOTAType', fromsubclass_=False, pretty_print=True):
+        if pretty_print:
+            eol_ = '\n'
+        else:
+            eol_ = ''
+        for DATASTORE_ in self.DATASTORE:
+            DATASTORE_.export(outfile, level, namespaceprefix_, name_='DATASTORE', pretty_print=pretty_print)
+    def build(self, node):
+        already_processed = set()
+        self.buildAttributes(node, node.attrib, already_processed)
+        for child in node:
+            nodeName_ = Tag_pattern_.match(child.tag).groups()[-1]
+            self.buildChildren(child, node, nodeName_)
+        return self
+    def buildAttributes(self, node, attrs, already_processed):
+        pass
+    def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
+        if nodeName_ == 'DATASTORE':
+            obj_ = DATASTOREType.factory()
+            obj_.build(child_)
+            self.DATASTORE.append(obj_)
+            obj_.original_tagname_ = 'DATASTORE'
+# end class DATASTORE_QUOTAType
+
+
+class DATASTOREType(GeneratedsSuper):
+    subclass = None
+    superclass = None
+    def __init__(self, ID=None, IMAGES=None, IMAGES_USED=None, SIZE=None, SIZE_USED=None):
+        self.original_tagname_ = None
+        self.ID = ID
+        self.IMAGES = IMAGES
+        self.IMAGES_USED = IMAGES_USED
+        self.SIZE = SIZE
+        self.SIZE_USED = SIZE_USED
+    def factory(*args_, **kwargs_):
+        if supermod.CurrentSubclassModule_ is not None:
+            subclass = getSubclassFromModule_(
+                supermod.CurrentSubclassModule_, DATASTOREType)
+            if subclass is not None:
+                return subclass(*args_, **kwargs_)
+        if DATASTOREType.subclass:
+            return DATASTOREType.subclass(*args_, **kwargs_)
+        else:
+            return DATASTOREType(*args_, **kwargs_)
+    factory = staticmethod(factory)
+    def get_ID(self): return self.ID
+    def set_ID(self, ID): self.ID = ID
+    def get_IMAGES(self): return self.IMAGES
+    def set_IMAGES(self, IMAGES): self.IMAGES = IMAGES
+    def get_IMAGES_USED(self): return self.IMAGES_USED
+    def set_IMAGES_USED(self, IMAGES_USED): self.IMAGES_USED = IMAGES_USED
+    def get_SIZE(self): return self.SIZE
+    def set_SIZE(self, SIZE): self.SIZE = SIZE
+    def get_SIZE_USED(self): return self.SIZE_USED
+    def set_SIZE_USED(self, SIZE_USED): self.SIZE_USED = SIZE_USED
+    def hasContent_(self):
+        if (
+            self.ID is not None or
+            self.IMAGES is not None or
+            self.IMAGES_USED is not None or
+            self.SIZE is not None or
+            self.SIZE_USED is not None
+        ):
+            return True
+        else:
+            return False
+    def export(self, outfile, level, namespaceprefix_='', name_='DATASTOREType', namespacedef_='', pretty_print=True):
+        imported_ns_def_ = GenerateDSNamespaceDefs_.get('DATASTOREType')
+        if imported_ns_def_ is not None:
+            namespacedef_ = imported_ns_def_
+        if pretty_print:
+            eol_ = '\n'
+        else:
+            eol_ = ''
+        if self.original_tagname_ is not None:
+            name_ = self.original_tagname_
+        showIndent(outfile, level, pretty_print)
+        outfile.write('<%s%s%s' % (namespaceprefix_, name_, namespacedef_ and ' ' + namespacedef_ or '', ))
+        already_processed = set()
+        self.exportAttributes(outfile, level, already_processed, namespaceprefix_, name_='DATASTOREType')
+        if self.hasContent_():
+            outfile.write('>%s' % (eol_, ))
+            self.exportChildren(outfile, level + 1, namespaceprefix_='', name_='DATASTOREType', pretty_print=pretty_print)
+            showIndent(outfile, level, pretty_print)
+            outfile.write('</%s%s>%s' % (namespaceprefix_, name_, eol_))
+        else:
+            outfile.write('/>%s' % (eol_, ))
+    def exportAttributes(self, outfile, level, already_processed, namespaceprefix_='', name_='DATASTOREType'):
+        pass
+    def exportChildren(self, outfile, level, namespaceprefix_='', name_='DATASTOREType', fromsubclass_=False, pretty_print=True):
+        if pretty_print:
+            eol_ = '\n'
+        else:
+            eol_ = ''
+        if self.ID is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<ID>%s</ID>%s' % (self.gds_encode(self.gds_format_string(quote_xml(self.ID), input_name='ID')), eol_))
+        if self.IMAGES is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<IMAGES>%s</IMAGES>%s' % (self.gds_encode(self.gds_format_string(quote_xml(self.IMAGES), input_name='IMAGES')), eol_))
+        if self.IMAGES_USED is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<IMAGES_USED>%s</IMAGES_USED>%s' % (self.gds_encode(self.gds_format_string(quote_xml(self.IMAGES_USED), input_name='IMAGES_USED')), eol_))
+        if self.SIZE is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<SIZE>%s</SIZE>%s' % (self.gds_encode(self.gds_format_string(quote_xml(self.SIZE), input_name='SIZE')), eol_))
+        if self.SIZE_USED is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<SIZE_USED>%s</SIZE_USED>%s' % (self.gds_encode(self.gds_format_string(quote_xml(self.SIZE_USED), input_name='SIZE_USED')), eol_))
+    def build(self, node):
+        already_processed = set()
+        self.buildAttributes(node, node.attrib, already_processed)
+        for child in node:
+            nodeName_ = Tag_pattern_.match(child.tag).groups()[-1]
+            self.buildChildren(child, node, nodeName_)
+        return self
+    def buildAttributes(self, node, attrs, already_processed):
+        pass
+    def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
+        if nodeName_ == 'ID':
+            ID_ = child_.text
+            ID_ = self.gds_validate_string(ID_, node, 'ID')
+            self.ID = ID_
+        elif nodeName_ == 'IMAGES':
+            IMAGES_ = child_.text
+            IMAGES_ = self.gds_validate_string(IMAGES_, node, 'IMAGES')
+            self.IMAGES = IMAGES_
+        elif nodeName_ == 'IMAGES_USED':
+            IMAGES_USED_ = child_.text
+            IMAGES_USED_ = self.gds_validate_string(IMAGES_USED_, node, 'IMAGES_USED')
+            self.IMAGES_USED = IMAGES_USED_
+        elif nodeName_ == 'SIZE':
+            SIZE_ = child_.text
+            SIZE_ = self.gds_validate_string(SIZE_, node, 'SIZE')
+            self.SIZE = SIZE_
+        elif nodeName_ == 'SIZE_USED':
+            SIZE_USED_ = child_.text
+            SIZE_USED_ = self.gds_validate_string(SIZE_USED_, node, 'SIZE_USED')
+            self.SIZE_USED = SIZE_USED_
+# end class DATASTOREType
+
+
+class NETWORK_QUOTAType(GeneratedsSuper):
+    subclass = None
+    superclass = None
+    def __init__(self, NETWORK=None):
+        self.original_tagname_ = None
+        if NETWORK is None:
+            self.NETWORK = []
+        else:
+            self.NETWORK = NETWORK
+    def factory(*args_, **kwargs_):
+        if supermod.CurrentSubclassModule_ is not None:
+            subclass = getSubclassFromModule_(
+                supermod.CurrentSubclassModule_, NETWORK_QUOTAType)
+            if subclass is not None:
+                return subclass(*args_, **kwargs_)
+        if NETWORK_QUOTAType.subclass:
+            return NETWORK_QUOTAType.subclass(*args_, **kwargs_)
+        else:
+            return NETWORK_QUOTAType(*args_, **kwargs_)
+    factory = staticmethod(factory)
+    def get_NETWORK(self): return self.NETWORK
+    def set_NETWORK(self, NETWORK): self.NETWORK = NETWORK
+    def add_NETWORK(self, value): self.NETWORK.append(value)
+    def insert_NETWORK_at(self, index, value): self.NETWORK.insert(index, value)
+    def replace_NETWORK_at(self, index, value): self.NETWORK[index] = value
+    def hasContent_(self):
+        if (
+            self.NETWORK
+        ):
+            return True
+        else:
+            return False
+    def export(self, outfile, level, namespaceprefix_='', name_='NETWORK_QUOTAType', namespacedef_='', pretty_print=True):
+        imported_ns_def_ = GenerateDSNamespaceDefs_.get('NETWORK_QUOTAType')
+        if imported_ns_def_ is not None:
+            namespacedef_ = imported_ns_def_
+        if pretty_print:
+            eol_ = '\n'
+        else:
+            eol_ = ''
+        if self.original_tagname_ is not None:
+            name_ = self.original_tagname_
+        showIndent(outfile, level, pretty_print)
+        outfile.write('<%s%s%s' % (namespaceprefix_, name_, namespacedef_ and ' ' + namespacedef_ or '', ))
+        already_processed = set()
+        self.exportAttributes(outfile, level, already_processed, namespaceprefix_, name_='NETWORK_QUOTAType')
+        if self.hasContent_():
+            outfile.write('>%s' % (eol_, ))
+            self.exportChildren(outfile, level + 1, namespaceprefix_='', name_='NETWORK_QUOTAType', pretty_print=pretty_print)
+            showIndent(outfile, level, pretty_print)
+            outfile.write('</%s%s>%s' % (namespaceprefix_, name_, eol_))
+        else:
+            outfile.write('/>%s' % (eol_, ))
+    def exportAttributes(self, outfile, level, already_processed, namespaceprefix_='', name_='NETWORK_QUOTAType'):
+        pass
+    def exportChildren(self, outfile, level, namespaceprefix_='', name_='NETWORK_QUOTAType', fromsubclass_=False, pretty_print=True):
+        if pretty_print:
+            eol_ = '\n'
+        else:
+            eol_ = ''
+        for NETWORK_ in self.NETWORK:
+            NETWORK_.export(outfile, level, namespaceprefix_, name_='NETWORK', pretty_print=pretty_print)
+    def build(self, node):
+        already_processed = set()
+        self.buildAttributes(node, node.attrib, already_processed)
+        for child in node:
+            nodeName_ = Tag_pattern_.match(child.tag).groups()[-1]
+            self.buildChildren(child, node, nodeName_)
+        return self
+    def buildAttributes(self, node, attrs, already_processed):
+        pass
+    def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
+        if nodeName_ == 'NETWORK':
+            obj_ = NETWORKType.factory()
+            obj_.build(child_)
+            self.NETWORK.append(obj_)
+            obj_.original_tagname_ = 'NETWORK'
+# end class NETWORK_QUOTAType
+
+
+class NETWORKType(GeneratedsSuper):
+    subclass = None
+    superclass = None
+    def __init__(self, ID=None, LEASES=None, LEASES_USED=None):
+        self.original_tagname_ = None
+        self.ID = ID
+        self.LEASES = LEASES
+        self.LEASES_USED = LEASES_USED
+    def factory(*args_, **kwargs_):
+        if supermod.CurrentSubclassModule_ is not None:
+            subclass = getSubclassFromModule_(
+                supermod.CurrentSubclassModule_, NETWORKType)
+            if subclass is not None:
+                return subclass(*args_, **kwargs_)
+        if NETWORKType.subclass:
+            return NETWORKType.subclass(*args_, **kwargs_)
+        else:
+            return NETWORKType(*args_, **kwargs_)
+    factory = staticmethod(factory)
+    def get_ID(self): return self.ID
+    def set_ID(self, ID): self.ID = ID
+    def get_LEASES(self): return self.LEASES
+    def set_LEASES(self, LEASES): self.LEASES = LEASES
+    def get_LEASES_USED(self): return self.LEASES_USED
+    def set_LEASES_USED(self, LEASES_USED): self.LEASES_USED = LEASES_USED
+    def hasContent_(self):
+        if (
+            self.ID is not None or
+            self.LEASES is not None or
+            self.LEASES_USED is not None
+        ):
+            return True
+        else:
+            return False
+    def export(self, outfile, level, namespaceprefix_='', name_='NETWORKType', namespacedef_='', pretty_print=True):
+        imported_ns_def_ = GenerateDSNamespaceDefs_.get('NETWORKType')
+        if imported_ns_def_ is not None:
+            namespacedef_ = imported_ns_def_
+        if pretty_print:
+            eol_ = '\n'
+        else:
+            eol_ = ''
+        if self.original_tagname_ is not None:
+            name_ = self.original_tagname_
+        showIndent(outfile, level, pretty_print)
+        outfile.write('<%s%s%s' % (namespaceprefix_, name_, namespacedef_ and ' ' + namespacedef_ or '', ))
+        already_processed = set()
+        self.exportAttributes(outfile, level, already_processed, namespaceprefix_, name_='NETWORKType')
+        if self.hasContent_():
+            outfile.write('>%s' % (eol_, ))
+            self.exportChildren(outfile, level + 1, namespaceprefix_='', name_='NETWORKType', pretty_print=pretty_print)
+            showIndent(outfile, level, pretty_print)
+            outfile.write('</%s%s>%s' % (namespaceprefix_, name_, eol_))
+        else:
+            outfile.write('/>%s' % (eol_, ))
+    def exportAttributes(self, outfile, level, already_processed, namespaceprefix_='', name_='NETWORKType'):
+        pass
+    def exportChildren(self, outfile, level, namespaceprefix_='', name_='NETWORKType', fromsubclass_=False, pretty_print=True):
+        if pretty_print:
+            eol_ = '\n'
+        else:
+            eol_ = ''
+        if self.ID is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<ID>%s</ID>%s' % (self.gds_encode(self.gds_format_string(quote_xml(self.ID), input_name='ID')), eol_))
+        if self.LEASES is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<LEASES>%s</LEASES>%s' % (self.gds_encode(self.gds_format_string(quote_xml(self.LEASES), input_name='LEASES')), eol_))
+        if self.LEASES_USED is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<LEASES_USED>%s</LEASES_USED>%s' % (self.gds_encode(self.gds_format_string(quote_xml(self.LEASES_USED), input_name='LEASES_USED')), eol_))
+    def build(self, node):
+        already_processed = set()
+        self.buildAttributes(node, node.attrib, already_processed)
+        for child in node:
+            nodeName_ = Tag_pattern_.match(child.tag).groups()[-1]
+            self.buildChildren(child, node, nodeName_)
+        return self
+    def buildAttributes(self, node, attrs, already_processed):
+        pass
+    def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
+        if nodeName_ == 'ID':
+            ID_ = child_.text
+            ID_ = self.gds_validate_string(ID_, node, 'ID')
+            self.ID = ID_
+        elif nodeName_ == 'LEASES':
+            LEASES_ = child_.text
+            LEASES_ = self.gds_validate_string(LEASES_, node, 'LEASES')
+            self.LEASES = LEASES_
+        elif nodeName_ == 'LEASES_USED':
+            LEASES_USED_ = child_.text
+            LEASES_USED_ = self.gds_validate_string(LEASES_USED_, node, 'LEASES_USED')
+            self.LEASES_USED = LEASES_USED_
+# end class NETWORKType
+
+
+class VM_QUOTAType(GeneratedsSuper):
+    subclass = None
+    superclass = None
+    def __init__(self, VM=None):
+        self.original_tagname_ = None
+        self.VM = VM
+    def factory(*args_, **kwargs_):
+        if supermod.CurrentSubclassModule_ is not None:
+            subclass = getSubclassFromModule_(
+                supermod.CurrentSubclassModule_, VM_QUOTAType)
+            if subclass is not None:
+                return subclass(*args_, **kwargs_)
+        if VM_QUOTAType.subclass:
+            return VM_QUOTAType.subclass(*args_, **kwargs_)
+        else:
+            return VM_QUOTAType(*args_, **kwargs_)
+    factory = staticmethod(factory)
+    def get_VM(self): return self.VM
+    def set_VM(self, VM): self.VM = VM
+    def hasContent_(self):
+        if (
+            self.VM is not None
+        ):
+            return True
+        else:
+            return False
+    def export(self, outfile, level, namespaceprefix_='', name_='VM_QUOTAType', namespacedef_='', pretty_print=True):
+        imported_ns_def_ = GenerateDSNamespaceDefs_.get('VM_QUOTAType')
+        if imported_ns_def_ is not None:
+            namespacedef_ = imported_ns_def_
+        if pretty_print:
+            eol_ = '\n'
+        else:
+            eol_ = ''
+        if self.original_tagname_ is not None:
+            name_ = self.original_tagname_
+        showIndent(outfile, level, pretty_print)
+        outfile.write('<%s%s%s' % (namespaceprefix_, name_, namespacedef_ and ' ' + namespacedef_ or '', ))
+        already_processed = set()
+        self.exportAttributes(outfile, level, already_processed, namespaceprefix_, name_='VM_QUOTAType')
+        if self.hasContent_():
+            outfile.write('>%s' % (eol_, ))
+            self.exportChildren(outfile, level + 1, namespaceprefix_='', name_='VM_QUOTAType', pretty_print=pretty_print)
+            showIndent(outfile, level, pretty_print)
+            outfile.write('</%s%s>%s' % (namespaceprefix_, name_, eol_))
+        else:
+            outfile.write('/>%s' % (eol_, ))
+    def exportAttributes(self, outfile, level, already_processed, namespaceprefix_='', name_='VM_QUOTAType'):
+        pass
+    def exportChildren(self, outfile, level, namespaceprefix_='', name_='VM_QUOTAType', fromsubclass_=False, pretty_print=True):
+        if pretty_print:
+            eol_ = '\n'
+        else:
+            eol_ = ''
+        if self.VM is not None:
+            self.VM.export(outfile, level, namespaceprefix_, name_='VM', pretty_print=pretty_print)
+    def build(self, node):
+        already_processed = set()
+        self.buildAttributes(node, node.attrib, already_processed)
+        for child in node:
+            nodeName_ = Tag_pattern_.match(child.tag).groups()[-1]
+            self.buildChildren(child, node, nodeName_)
+        return self
+    def buildAttributes(self, node, attrs, already_processed):
+        pass
+    def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
+        if nodeName_ == 'VM':
+            obj_ = VMType2.factory()
+            obj_.build(child_)
+            self.VM = obj_
+            obj_.original_tagname_ = 'VM'
+# end class VM_QUOTAType
+
+
+class VMType2(GeneratedsSuper):
+    subclass = None
+    superclass = None
+    def __init__(self, CPU=None, CPU_USED=None, MEMORY=None, MEMORY_USED=None, SYSTEM_DISK_SIZE=None, SYSTEM_DISK_SIZE_USED=None, VMS=None, VMS_USED=None):
+        self.original_tagname_ = None
+        self.CPU = CPU
+        self.CPU_USED = CPU_USED
+        self.MEMORY = MEMORY
+        self.MEMORY_USED = MEMORY_USED
+        self.SYSTEM_DISK_SIZE = SYSTEM_DISK_SIZE
+        self.SYSTEM_DISK_SIZE_USED = SYSTEM_DISK_SIZE_USED
+        self.VMS = VMS
+        self.VMS_USED = VMS_USED
+    def factory(*args_, **kwargs_):
+        if supermod.CurrentSubclassModule_ is not None:
+            subclass = getSubclassFromModule_(
+                supermod.CurrentSubclassModule_, VMType2)
+            if subclass is not None:
+                return subclass(*args_, **kwargs_)
+        if VMType2.subclass:
+            return VMType2.subclass(*args_, **kwargs_)
+        else:
+            return VMType2(*args_, **kwargs_)
+    factory = staticmethod(factory)
+    def get_CPU(self): return self.CPU
+    def set_CPU(self, CPU): self.CPU = CPU
+    def get_CPU_USED(self): return self.CPU_USED
+    def set_CPU_USED(self, CPU_USED): self.CPU_USED = CPU_USED
+    def get_MEMORY(self): return self.MEMORY
+    def set_MEMORY(self, MEMORY): self.MEMORY = MEMORY
+    def get_MEMORY_USED(self): return self.MEMORY_USED
+    def set_MEMORY_USED(self, MEMORY_USED): self.MEMORY_USED = MEMORY_USED
+    def get_SYSTEM_DISK_SIZE(self): return self.SYSTEM_DISK_SIZE
+    def set_SYSTEM_DISK_SIZE(self, SYSTEM_DISK_SIZE): self.SYSTEM_DISK_SIZE = SYSTEM_DISK_SIZE
+    def get_SYSTEM_DISK_SIZE_USED(self): return self.SYSTEM_DISK_SIZE_USED
+    def set_SYSTEM_DISK_SIZE_USED(self, SYSTEM_DISK_SIZE_USED): self.SYSTEM_DISK_SIZE_USED = SYSTEM_DISK_SIZE_USED
+    def get_VMS(self): return self.VMS
+    def set_VMS(self, VMS): self.VMS = VMS
+    def get_VMS_USED(self): return self.VMS_USED
+    def set_VMS_USED(self, VMS_USED): self.VMS_USED = VMS_USED
+    def hasContent_(self):
+        if (
+            self.CPU is not None or
+            self.CPU_USED is not None or
+            self.MEMORY is not None or
+            self.MEMORY_USED is not None or
+            self.SYSTEM_DISK_SIZE is not None or
+            self.SYSTEM_DISK_SIZE_USED is not None or
+            self.VMS is not None or
+            self.VMS_USED is not None
+        ):
+            return True
+        else:
+            return False
+    def export(self, outfile, level, namespaceprefix_='', name_='VMType2', namespacedef_='', pretty_print=True):
+        imported_ns_def_ = GenerateDSNamespaceDefs_.get('VMType2')
+        if imported_ns_def_ is not None:
+            namespacedef_ = imported_ns_def_
+        if pretty_print:
+            eol_ = '\n'
+        else:
+            eol_ = ''
+        if self.original_tagname_ is not None:
+            name_ = self.original_tagname_
+        showIndent(outfile, level, pretty_print)
+        outfile.write('<%s%s%s' % (namespaceprefix_, name_, namespacedef_ and ' ' + namespacedef_ or '', ))
+        already_processed = set()
+        self.exportAttributes(outfile, level, already_processed, namespaceprefix_, name_='VMType2')
+        if self.hasContent_():
+            outfile.write('>%s' % (eol_, ))
+            self.exportChildren(outfile, level + 1, namespaceprefix_='', name_='VMType2', pretty_print=pretty_print)
+            showIndent(outfile, level, pretty_print)
+            outfile.write('</%s%s>%s' % (namespaceprefix_, name_, eol_))
+        else:
+            outfile.write('/>%s' % (eol_, ))
+    def exportAttributes(self, outfile, level, already_processed, namespaceprefix_='', name_='VMType2'):
+        pass
+    def exportChildren(self, outfile, level, namespaceprefix_='', name_='VMType2', fromsubclass_=False, pretty_print=True):
+        if pretty_print:
+            eol_ = '\n'
+        else:
+            eol_ = ''
+        if self.CPU is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<CPU>%s</CPU>%s' % (self.gds_encode(self.gds_format_string(quote_xml(self.CPU), input_name='CPU')), eol_))
+        if self.CPU_USED is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<CPU_USED>%s</CPU_USED>%s' % (self.gds_encode(self.gds_format_string(quote_xml(self.CPU_USED), input_name='CPU_USED')), eol_))
+        if self.MEMORY is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<MEMORY>%s</MEMORY>%s' % (self.gds_encode(self.gds_format_string(quote_xml(self.MEMORY), input_name='MEMORY')), eol_))
+        if self.MEMORY_USED is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<MEMORY_USED>%s</MEMORY_USED>%s' % (self.gds_encode(self.gds_format_string(quote_xml(self.MEMORY_USED), input_name='MEMORY_USED')), eol_))
+        if self.SYSTEM_DISK_SIZE is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<SYSTEM_DISK_SIZE>%s</SYSTEM_DISK_SIZE>%s' % (self.gds_encode(self.gds_format_string(quote_xml(self.SYSTEM_DISK_SIZE), input_name='SYSTEM_DISK_SIZE')), eol_))
+        if self.SYSTEM_DISK_SIZE_USED is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<SYSTEM_DISK_SIZE_USED>%s</SYSTEM_DISK_SIZE_USED>%s' % (self.gds_encode(self.gds_format_string(quote_xml(self.SYSTEM_DISK_SIZE_USED), input_name='SYSTEM_DISK_SIZE_USED')), eol_))
+        if self.VMS is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<VMS>%s</VMS>%s' % (self.gds_encode(self.gds_format_string(quote_xml(self.VMS), input_name='VMS')), eol_))
+        if self.VMS_USED is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<VMS_USED>%s</VMS_USED>%s' % (self.gds_encode(self.gds_format_string(quote_xml(self.VMS_USED), input_name='VMS_USED')), eol_))
+    def build(self, node):
+        already_processed = set()
+        self.buildAttributes(node, node.attrib, already_processed)
+        for child in node:
+            nodeName_ = Tag_pattern_.match(child.tag).groups()[-1]
+            self.buildChildren(child, node, nodeName_)
+        return self
+    def buildAttributes(self, node, attrs, already_processed):
+        pass
+    def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
+        if nodeName_ == 'CPU':
+            CPU_ = child_.text
+            CPU_ = self.gds_validate_string(CPU_, node, 'CPU')
+            self.CPU = CPU_
+        elif nodeName_ == 'CPU_USED':
+            CPU_USED_ = child_.text
+            CPU_USED_ = self.gds_validate_string(CPU_USED_, node, 'CPU_USED')
+            self.CPU_USED = CPU_USED_
+        elif nodeName_ == 'MEMORY':
+            MEMORY_ = child_.text
+            MEMORY_ = self.gds_validate_string(MEMORY_, node, 'MEMORY')
+            self.MEMORY = MEMORY_
+        elif nodeName_ == 'MEMORY_USED':
+            MEMORY_USED_ = child_.text
+            MEMORY_USED_ = self.gds_validate_string(MEMORY_USED_, node, 'MEMORY_USED')
+            self.MEMORY_USED = MEMORY_USED_
+        elif nodeName_ == 'SYSTEM_DISK_SIZE':
+            SYSTEM_DISK_SIZE_ = child_.text
+            SYSTEM_DISK_SIZE_ = self.gds_validate_string(SYSTEM_DISK_SIZE_, node, 'SYSTEM_DISK_SIZE')
+            self.SYSTEM_DISK_SIZE = SYSTEM_DISK_SIZE_
+        elif nodeName_ == 'SYSTEM_DISK_SIZE_USED':
+            SYSTEM_DISK_SIZE_USED_ = child_.text
+            SYSTEM_DISK_SIZE_USED_ = self.gds_validate_string(SYSTEM_DISK_SIZE_USED_, node, 'SYSTEM_DISK_SIZE_USED')
+            self.SYSTEM_DISK_SIZE_USED = SYSTEM_DISK_SIZE_USED_
+        elif nodeName_ == 'VMS':
+            VMS_ = child_.text
+            VMS_ = self.gds_validate_string(VMS_, node, 'VMS')
+            self.VMS = VMS_
+        elif nodeName_ == 'VMS_USED':
+            VMS_USED_ = child_.text
+            VMS_USED_ = self.gds_validate_string(VMS_USED_, node, 'VMS_USED')
+            self.VMS_USED = VMS_USED_
+# end class VMType2
+
+
+class IMAGE_QUOTAType(GeneratedsSuper):
+    subclass = None
+    superclass = None
+    def __init__(self, IMAGE=None):
+        self.original_tagname_ = None
+        if IMAGE is None:
+            self.IMAGE = []
+        else:
+            self.IMAGE = IMAGE
+    def factory(*args_, **kwargs_):
+        if supermod.CurrentSubclassModule_ is not None:
+            subclass = getSubclassFromModule_(
+                supermod.CurrentSubclassModule_, IMAGE_QUOTAType)
+            if subclass is not None:
+                return subclass(*args_, **kwargs_)
+        if IMAGE_QUOTAType.subclass:
+            return IMAGE_QUOTAType.subclass(*args_, **kwargs_)
+        else:
+            return IMAGE_QUOTAType(*args_, **kwargs_)
+    factory = staticmethod(factory)
+    def get_IMAGE(self): return self.IMAGE
+    def set_IMAGE(self, IMAGE): self.IMAGE = IMAGE
+    def add_IMAGE(self, value): self.IMAGE.append(value)
+    def insert_IMAGE_at(self, index, value): self.IMAGE.insert(index, value)
+    def replace_IMAGE_at(self, index, value): self.IMAGE[index] = value
+    def hasContent_(self):
+        if (
+            self.IMAGE
+        ):
+            return True
+        else:
+            return False
+    def export(self, outfile, level, namespaceprefix_='', name_='IMAGE_QUOTAType', namespacedef_='', pretty_print=True):
+        imported_ns_def_ = GenerateDSNamespaceDefs_.get('IMAGE_QUOTAType')
+        if imported_ns_def_ is not None:
+            namespacedef_ = imported_ns_def_
+        if pretty_print:
+            eol_ = '\n'
+        else:
+            eol_ = ''
+        if self.original_tagname_ is not None:
+            name_ = self.original_tagname_
+        showIndent(outfile, level, pretty_print)
+        outfile.write('<%s%s%s' % (namespaceprefix_, name_, namespacedef_ and ' ' + namespacedef_ or '', ))
+        already_processed = set()
+        self.exportAttributes(outfile, level, already_processed, namespaceprefix_, name_='IMAGE_QUOTAType')
+        if self.hasContent_():
+            outfile.write('>%s' % (eol_, ))
+            self.exportChildren(outfile, level + 1, namespaceprefix_='', name_='IMAGE_QUOTAType', pretty_print=pretty_print)
+            showIndent(outfile, level, pretty_print)
+            outfile.write('</%s%s>%s' % (namespaceprefix_, name_, eol_))
+        else:
+            outfile.write('/>%s' % (eol_, ))
+    def exportAttributes(self, outfile, level, already_processed, namespaceprefix_='', name_='IMAGE_QUOTAType'):
+        pass
+    def exportChildren(self, outfile, level, namespaceprefix_='', name_='IMAGE_QUOTAType', fromsubclass_=False, pretty_print=True):
+        if pretty_print:
+            eol_ = '\n'
+        else:
+            eol_ = ''
+        for IMAGE_ in self.IMAGE:
+            IMAGE_.export(outfile, level, namespaceprefix_, name_='IMAGE', pretty_print=pretty_print)
+    def build(self, node):
+        already_processed = set()
+        self.buildAttributes(node, node.attrib, already_processed)
+        for child in node:
+            nodeName_ = Tag_pattern_.match(child.tag).groups()[-1]
+            self.buildChildren(child, node, nodeName_)
+        return self
+    def buildAttributes(self, node, attrs, already_processed):
+        pass
+    def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
+        if nodeName_ == 'IMAGE':
+            obj_ = IMAGEType.factory()
+            obj_.build(child_)
+            self.IMAGE.append(obj_)
+            obj_.original_tagname_ = 'IMAGE'
+# end class IMAGE_QUOTAType
+
+
+class IMAGEType(GeneratedsSuper):
+    subclass = None
+    superclass = None
+    def __init__(self, ID=None, RVMS=None, RVMS_USED=None):
+        self.original_tagname_ = None
+        self.ID = ID
+        self.RVMS = RVMS
+        self.RVMS_USED = RVMS_USED
+    def factory(*args_, **kwargs_):
+        if supermod.CurrentSubclassModule_ is not None:
+            subclass = getSubclassFromModule_(
+                supermod.CurrentSubclassModule_, IMAGEType)
+            if subclass is not None:
+                return subclass(*args_, **kwargs_)
+        if IMAGEType.subclass:
+            return IMAGEType.subclass(*args_, **kwargs_)
+        else:
+            return IMAGEType(*args_, **kwargs_)
+    factory = staticmethod(factory)
+    def get_ID(self): return self.ID
+    def set_ID(self, ID): self.ID = ID
+    def get_RVMS(self): return self.RVMS
+    def set_RVMS(self, RVMS): self.RVMS = RVMS
+    def get_RVMS_USED(self): return self.RVMS_USED
+    def set_RVMS_USED(self, RVMS_USED): self.RVMS_USED = RVMS_USED
+    def hasContent_(self):
+        if (
+            self.ID is not None or
+            self.RVMS is not None or
+            self.RVMS_USED is not None
+        ):
+            return True
+        else:
+            return False
+    def export(self, outfile, level, namespaceprefix_='', name_='IMAGEType', namespacedef_='', pretty_print=True):
+        imported_ns_def_ = GenerateDSNamespaceDefs_.get('IMAGEType')
+        if imported_ns_def_ is not None:
+            namespacedef_ = imported_ns_def_
+        if pretty_print:
+            eol_ = '\n'
+        else:
+            eol_ = ''
+        if self.original_tagname_ is not None:
+            name_ = self.original_tagname_
+        showIndent(outfile, level, pretty_print)
+        outfile.write('<%s%s%s' % (namespaceprefix_, name_, namespacedef_ and ' ' + namespacedef_ or '', ))
+        already_processed = set()
+        self.exportAttributes(outfile, level, already_processed, namespaceprefix_, name_='IMAGEType')
+        if self.hasContent_():
+            outfile.write('>%s' % (eol_, ))
+            self.exportChildren(outfile, level + 1, namespaceprefix_='', name_='IMAGEType', pretty_print=pretty_print)
+            showIndent(outfile, level, pretty_print)
+            outfile.write('</%s%s>%s' % (namespaceprefix_, name_, eol_))
+        else:
+            outfile.write('/>%s' % (eol_, ))
+    def exportAttributes(self, outfile, level, already_processed, namespaceprefix_='', name_='IMAGEType'):
+        pass
+    def exportChildren(self, outfile, level, namespaceprefix_='', name_='IMAGEType', fromsubclass_=False, pretty_print=True):
+        if pretty_print:
+            eol_ = '\n'
+        else:
+            eol_ = ''
+        if self.ID is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<ID>%s</ID>%s' % (self.gds_encode(self.gds_format_string(quote_xml(self.ID), input_name='ID')), eol_))
+        if self.RVMS is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<RVMS>%s</RVMS>%s' % (self.gds_encode(self.gds_format_string(quote_xml(self.RVMS), input_name='RVMS')), eol_))
+        if self.RVMS_USED is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<RVMS_USED>%s</RVMS_USED>%s' % (self.gds_encode(self.gds_format_string(quote_xml(self.RVMS_USED), input_name='RVMS_USED')), eol_))
+    def build(self, node):
+        already_processed = set()
+        self.buildAttributes(node, node.attrib, already_processed)
+        for child in node:
+            nodeName_ = Tag_pattern_.match(child.tag).groups()[-1]
+            self.buildChildren(child, node, nodeName_)
+        return self
+    def buildAttributes(self, node, attrs, already_processed):
+        pass
+    def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
+        if nodeName_ == 'ID':
+            ID_ = child_.text
+            ID_ = self.gds_validate_string(ID_, node, 'ID')
+            self.ID = ID_
+        elif nodeName_ == 'RVMS':
+            RVMS_ = child_.text
+            RVMS_ = self.gds_validate_string(RVMS_, node, 'RVMS')
+            self.RVMS = RVMS_
+        elif nodeName_ == 'RVMS_USED':
+            RVMS_USED_ = child_.text
+            RVMS_USED_ = self.gds_validate_string(RVMS_USED_, node, 'RVMS_USED')
+            self.RVMS_USED = RVMS_USED_
+# end class IMAGEType
+
+
+class DEFAULT_GROUP_QUOTASType(GeneratedsSuper):
+    subclass = None
+    superclass = None
+    def __init__(self, DATASTORE_QUOTA=None, NETWORK_QUOTA=None, VM_QUOTA=None, IMAGE_QUOTA=None):
+        self.original_tagname_ = None
+        self.DATASTORE_QUOTA = DATASTORE_QUOTA
+        self.NETWORK_QUOTA = NETWORK_QUOTA
+        self.VM_QUOTA = VM_QUOTA
+        self.IMAGE_QUOTA = IMAGE_QUOTA
+    def factory(*args_, **kwargs_):
+        if supermod.CurrentSubclassModule_ is not None:
+            subclass = getSubclassFromModule_(
+                supermod.CurrentSubclassModule_, DEFAULT_GROUP_QUOTASType)
+            if subclass is not None:
+                return subclass(*args_, **kwargs_)
+        if DEFAULT_GROUP_QUOTASType.subclass:
+            return DEFAULT_GROUP_QUOTASType.subclass(*args_, **kwargs_)
+        else:
+            return DEFAULT_GROUP_QUOTASType(*args_, **kwargs_)
+    factory = staticmethod(factory)
+    def get_DATASTORE_QUOTA(self): return self.DATASTORE_QUOTA
+    def set_DATASTORE_QUOTA(self, DATASTORE_QUOTA): self.DATASTORE_QUOTA = DATASTORE_QUOTA
+    def get_NETWORK_QUOTA(self): return self.NETWORK_QUOTA
+    def set_NETWORK_QUOTA(self, NETWORK_QUOTA): self.NETWORK_QUOTA = NETWORK_QUOTA
+    def get_VM_QUOTA(self): return self.VM_QUOTA
+    def set_VM_QUOTA(self, VM_QUOTA): self.VM_QUOTA = VM_QUOTA
+    def get_IMAGE_QUOTA(self): return self.IMAGE_QUOTA
+    def set_IMAGE_QUOTA(self, IMAGE_QUOTA): self.IMAGE_QUOTA = IMAGE_QUOTA
+    def hasContent_(self):
+        if (
+            self.DATASTORE_QUOTA is not None or
+            self.NETWORK_QUOTA is not None or
+            self.VM_QUOTA is not None or
+            self.IMAGE_QUOTA is not None
+        ):
+            return True
+        else:
+            return False
+    def export(self, outfile, level, namespaceprefix_='', name_='DEFAULT_GROUP_QUOTASType', namespacedef_='', pretty_print=True):
+        imported_ns_def_ = GenerateDSNamespaceDefs_.get('DEFAULT_GROUP_QUOTASType')
+        if imported_ns_def_ is not None:
+            namespacedef_ = imported_ns_def_
+        if pretty_print:
+            eol_ = '\n'
+        else:
+            eol_ = ''
+        if self.original_tagname_ is not None:
+            name_ = self.original_tagname_
+        showIndent(outfile, level, pretty_print)
+        outfile.write('<%s%s%s' % (namespaceprefix_, name_, namespacedef_ and ' ' + namespacedef_ or '', ))
+        already_processed = set()
+        self.exportAttributes(outfile, level, already_processed, namespaceprefix_, name_='DEFAULT_GROUP_QUOTASType')
+        if self.hasContent_():
+            outfile.write('>%s' % (eol_, ))
+            self.exportChildren(outfile, level + 1, namespaceprefix_='', name_='DEFAULT_GROUP_QUOTASType', pretty_print=pretty_print)
+            showIndent(outfile, level, pretty_print)
+            outfile.write('</%s%s>%s' % (namespaceprefix_, name_, eol_))
+        else:
+            outfile.write('/>%s' % (eol_, ))
+    def exportAttributes(self, outfile, level, already_processed, namespaceprefix_='', name_='DEFAULT_GROUP_QUOTASType'):
+        pass
+    def exportChildren(self, outfile, level, namespaceprefix_='', name_='DEFAULT_GROUP_QUOTASType', fromsubclass_=False, pretty_print=True):
+        if pretty_print:
+            eol_ = '\n'
+        else:
+            eol_ = ''
+        if self.DATASTORE_QUOTA is not None:
+            self.DATASTORE_QUOTA.export(outfile, level, namespaceprefix_, name_='DATASTORE_QUOTA', pretty_print=pretty_print)
+        if self.NETWORK_QUOTA is not None:
+            self.NETWORK_QUOTA.export(outfile, level, namespaceprefix_, name_='NETWORK_QUOTA', pretty_print=pretty_print)
+        if self.VM_QUOTA is not None:
+            self.VM_QUOTA.export(outfile, level, namespaceprefix_, name_='VM_QUOTA', pretty_print=pretty_print)
+        if self.IMAGE_QUOTA is not None:
+            self.IMAGE_QUOTA.export(outfile, level, namespaceprefix_, name_='IMAGE_QUOTA', pretty_print=pretty_print)
+    def build(self, node):
+        already_processed = set()
+        self.buildAttributes(node, node.attrib, already_processed)
+        for child in node:
+            nodeName_ = Tag_pattern_.match(child.tag).groups()[-1]
+            self.buildChildren(child, node, nodeName_)
+        return self
+    def buildAttributes(self, node, attrs, already_processed):
+        pass
+    def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
+        if nodeName_ == 'DATASTORE_QUOTA':
+            obj_ = DATASTORE_QUOTAType3.factory()
+            obj_.build(child_)
+            self.DATASTORE_QUOTA = obj_
+            obj_.original_tagname_ = 'DATASTORE_QUOTA'
+        elif nodeName_ == 'NETWORK_QUOTA':
+            obj_ = NETWORK_QUOTAType5.factory()
+            obj_.build(child_)
+            self.NETWORK_QUOTA = obj_
+            obj_.original_tagname_ = 'NETWORK_QUOTA'
+        elif nodeName_ == 'VM_QUOTA':
+            obj_ = VM_QUOTAType7.factory()
+            obj_.build(child_)
+            self.VM_QUOTA = obj_
+            obj_.original_tagname_ = 'VM_QUOTA'
+        elif nodeName_ == 'IMAGE_QUOTA':
+            obj_ = IMAGE_QUOTAType9.factory()
+            obj_.build(child_)
+            self.IMAGE_QUOTA = obj_
+            obj_.original_tagname_ = 'IMAGE_QUOTA'
+# end class DEFAULT_GROUP_QUOTASType
+
+
+class DATASTORE_QUOTAType3(GeneratedsSuper):
+    subclass = None
+    superclass = None
+    def __init__(self, DATASTORE=None):
+        self.original_tagname_ = None
+        if DATASTORE is None:
+            self.DATASTORE = []
+        else:
+            self.DATASTORE = DATASTORE
+    def factory(*args_, **kwargs_):
+        if supermod.CurrentSubclassModule_ is not None:
+            subclass = getSubclassFromModule_(
+                supermod.CurrentSubclassModule_, DATASTORE_QUOTAType3)
+            if subclass is not None:
+                return subclass(*args_, **kwargs_)
+        if DATASTORE_QUOTAType3.subclass:
+            return DATASTORE_QUOTAType3.subclass(*args_, **kwargs_)
+        else:
+            return DATASTORE_QUOTAType3(*args_, **kwargs_)
+    factory = staticmethod(factory)
+    def get_DATASTORE(self): return self.DATASTORE
+    def set_DATASTORE(self, DATASTORE): self.DATASTORE = DATASTORE
+    def add_DATASTORE(self, value): self.DATASTORE.append(value)
+    def insert_DATASTORE_at(self, index, value): self.DATASTORE.insert(index, value)
+    def replace_DATASTORE_at(self, index, value): self.DATASTORE[index] = value
+    def hasContent_(self):
+        if (
+            self.DATASTORE
+        ):
+            return True
+        else:
+            return False
+    def export(self, outfile, level, namespaceprefix_='', name_='DATASTORE_QUOTAType3', namespacedef_='', pretty_print=True):
+        imported_ns_def_ = GenerateDSNamespaceDefs_.get('DATASTORE_QUOTAType3')
+        if imported_ns_def_ is not None:
+            namespacedef_ = imported_ns_def_
+        if pretty_print:
+            eol_ = '\n'
+        else:
+            eol_ = ''
+        if self.original_tagname_ is not None:
+            name_ = self.original_tagname_
+        showIndent(outfile, level, pretty_print)
+        outfile.write('<%s%s%s' % (namespaceprefix_, name_, namespacedef_ and ' ' + namespacedef_ or '', ))
+        already_processed = set()
+        self.exportAttributes(outfile, level, already_processed, namespaceprefix_, name_='DATASTORE_QUOTAType3')
+        if self.hasContent_():
+            outfile.write('>%s' % (eol_, ))
+            self.exportChildren(outfile, level + 1, namespaceprefix_='', name_='DATASTORE_QUOTAType3', pretty_print=pretty_print)
+            showIndent(outfile, level, pretty_print)
+            outfile.write('</%s%s>%s' % (namespaceprefix_, name_, eol_))
+        else:
+            outfile.write('/>%s' % (eol_, ))
+    def exportAttributes(self, outfile, level, already_processed, namespaceprefix_='', name_='DATASTORE_QUOTAType3'):
+        pass
+    def exportChildren(self, outfile, level, namespaceprefix_='', name_='DATASTORE_QUOTAType3', fromsubclass_=False, pretty_print=True):
+        if pretty_print:
+            eol_ = '\n'
+        else:
+            eol_ = ''
+        for DATASTORE_ in self.DATASTORE:
+            DATASTORE_.export(outfile, level, namespaceprefix_, name_='DATASTORE', pretty_print=pretty_print)
+    def build(self, node):
+        already_processed = set()
+        self.buildAttributes(node, node.attrib, already_processed)
+        for child in node:
+            nodeName_ = Tag_pattern_.match(child.tag).groups()[-1]
+            self.buildChildren(child, node, nodeName_)
+        return self
+    def buildAttributes(self, node, attrs, already_processed):
+        pass
+    def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
+        if nodeName_ == 'DATASTORE':
+            obj_ = DATASTOREType4.factory()
+            obj_.build(child_)
+            self.DATASTORE.append(obj_)
+            obj_.original_tagname_ = 'DATASTORE'
+# end class DATASTORE_QUOTAType3
+
+
+class DATASTOREType4(GeneratedsSuper):
+    subclass = None
+    superclass = None
+    def __init__(self, ID=None, IMAGES=None, IMAGES_USED=None, SIZE=None, SIZE_USED=None):
+        self.original_tagname_ = None
+        self.ID = ID
+        self.IMAGES = IMAGES
+        self.IMAGES_USED = IMAGES_USED
+        self.SIZE = SIZE
+        self.SIZE_USED = SIZE_USED
+    def factory(*args_, **kwargs_):
+        if supermod.CurrentSubclassModule_ is not None:
+            subclass = getSubclassFromModule_(
+                supermod.CurrentSubclassModule_, DATASTOREType4)
+            if subclass is not None:
+                return subclass(*args_, **kwargs_)
+        if DATASTOREType4.subclass:
+            return DATASTOREType4.subclass(*args_, **kwargs_)
+        else:
+            return DATASTOREType4(*args_, **kwargs_)
+    factory = staticmethod(factory)
+    def get_ID(self): return self.ID
+    def set_ID(self, ID): self.ID = ID
+    def get_IMAGES(self): return self.IMAGES
+    def set_IMAGES(self, IMAGES): self.IMAGES = IMAGES
+    def get_IMAGES_USED(self): return self.IMAGES_USED
+    def set_IMAGES_USED(self, IMAGES_USED): self.IMAGES_USED = IMAGES_USED
+    def get_SIZE(self): return self.SIZE
+    def set_SIZE(self, SIZE): self.SIZE = SIZE
+    def get_SIZE_USED(self): return self.SIZE_USED
+    def set_SIZE_USED(self, SIZE_USED): self.SIZE_USED = SIZE_USED
+    def hasContent_(self):
+        if (
+            self.ID is not None or
+            self.IMAGES is not None or
+            self.IMAGES_USED is not None or
+            self.SIZE is not None or
+            self.SIZE_USED is not None
+        ):
+            return True
+        else:
+            return False
+    def export(self, outfile, level, namespaceprefix_='', name_='DATASTOREType4', namespacedef_='', pretty_print=True):
+        imported_ns_def_ = GenerateDSNamespaceDefs_.get('DATASTOREType4')
+        if imported_ns_def_ is not None:
+            namespacedef_ = imported_ns_def_
+        if pretty_print:
+            eol_ = '\n'
+        else:
+            eol_ = ''
+        if self.original_tagname_ is not None:
+            name_ = self.original_tagname_
+        showIndent(outfile, level, pretty_print)
+        outfile.write('<%s%s%s' % (namespaceprefix_, name_, namespacedef_ and ' ' + namespacedef_ or '', ))
+        already_processed = set()
+        self.exportAttributes(outfile, level, already_processed, namespaceprefix_, name_='DATASTOREType4')
+        if self.hasContent_():
+            outfile.write('>%s' % (eol_, ))
+            self.exportChildren(outfile, level + 1, namespaceprefix_='', name_='DATASTOREType4', pretty_print=pretty_print)
+            showIndent(outfile, level, pretty_print)
+            outfile.write('</%s%s>%s' % (namespaceprefix_, name_, eol_))
+        else:
+            outfile.write('/>%s' % (eol_, ))
+    def exportAttributes(self, outfile, level, already_processed, namespaceprefix_='', name_='DATASTOREType4'):
+        pass
+    def exportChildren(self, outfile, level, namespaceprefix_='', name_='DATASTOREType4', fromsubclass_=False, pretty_print=True):
+        if pretty_print:
+            eol_ = '\n'
+        else:
+            eol_ = ''
+        if self.ID is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<ID>%s</ID>%s' % (self.gds_encode(self.gds_format_string(quote_xml(self.ID), input_name='ID')), eol_))
+        if self.IMAGES is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<IMAGES>%s</IMAGES>%s' % (self.gds_encode(self.gds_format_string(quote_xml(self.IMAGES), input_name='IMAGES')), eol_))
+        if self.IMAGES_USED is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<IMAGES_USED>%s</IMAGES_USED>%s' % (self.gds_encode(self.gds_format_string(quote_xml(self.IMAGES_USED), input_name='IMAGES_USED')), eol_))
+        if self.SIZE is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<SIZE>%s</SIZE>%s' % (self.gds_encode(self.gds_format_string(quote_xml(self.SIZE), input_name='SIZE')), eol_))
+        if self.SIZE_USED is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<SIZE_USED>%s</SIZE_USED>%s' % (self.gds_encode(self.gds_format_string(quote_xml(self.SIZE_USED), input_name='SIZE_USED')), eol_))
+    def build(self, node):
+        already_processed = set()
+        self.buildAttributes(node, node.attrib, already_processed)
+        for child in node:
+            nodeName_ = Tag_pattern_.match(child.tag).groups()[-1]
+            self.buildChildren(child, node, nodeName_)
+        return self
+    def buildAttributes(self, node, attrs, already_processed):
+        pass
+    def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
+        if nodeName_ == 'ID':
+            ID_ = child_.text
+            ID_ = self.gds_validate_string(ID_, node, 'ID')
+            self.ID = ID_
+        elif nodeName_ == 'IMAGES':
+            IMAGES_ = child_.text
+            IMAGES_ = self.gds_validate_string(IMAGES_, node, 'IMAGES')
+            self.IMAGES = IMAGES_
+        elif nodeName_ == 'IMAGES_USED':
+            IMAGES_USED_ = child_.text
+            IMAGES_USED_ = self.gds_validate_string(IMAGES_USED_, node, 'IMAGES_USED')
+            self.IMAGES_USED = IMAGES_USED_
+        elif nodeName_ == 'SIZE':
+            SIZE_ = child_.text
+            SIZE_ = self.gds_validate_string(SIZE_, node, 'SIZE')
+            self.SIZE = SIZE_
+        elif nodeName_ == 'SIZE_USED':
+            SIZE_USED_ = child_.text
+            SIZE_USED_ = self.gds_validate_string(SIZE_USED_, node, 'SIZE_USED')
+            self.SIZE_USED = SIZE_USED_
+# end class DATASTOREType4
+
+
+class NETWORK_QUOTAType5(GeneratedsSuper):
+    subclass = None
+    superclass = None
+    def __init__(self, NETWORK=None):
+        self.original_tagname_ = None
+        if NETWORK is None:
+            self.NETWORK = []
+        else:
+            self.NETWORK = NETWORK
+    def factory(*args_, **kwargs_):
+        if supermod.CurrentSubclassModule_ is not None:
+            subclass = getSubclassFromModule_(
+                supermod.CurrentSubclassModule_, NETWORK_QUOTAType5)
+            if subclass is not None:
+                return subclass(*args_, **kwargs_)
+        if NETWORK_QUOTAType5.subclass:
+            return NETWORK_QUOTAType5.subclass(*args_, **kwargs_)
+        else:
+            return NETWORK_QUOTAType5(*args_, **kwargs_)
+    factory = staticmethod(factory)
+    def get_NETWORK(self): return self.NETWORK
+    def set_NETWORK(self, NETWORK): self.NETWORK = NETWORK
+    def add_NETWORK(self, value): self.NETWORK.append(value)
+    def insert_NETWORK_at(self, index, value): self.NETWORK.insert(index, value)
+    def replace_NETWORK_at(self, index, value): self.NETWORK[index] = value
+    def hasContent_(self):
+        if (
+            self.NETWORK
+        ):
+            return True
+        else:
+            return False
+    def export(self, outfile, level, namespaceprefix_='', name_='NETWORK_QUOTAType5', namespacedef_='', pretty_print=True):
+        imported_ns_def_ = GenerateDSNamespaceDefs_.get('NETWORK_QUOTAType5')
+        if imported_ns_def_ is not None:
+            namespacedef_ = imported_ns_def_
+        if pretty_print:
+            eol_ = '\n'
+        else:
+            eol_ = ''
+        if self.original_tagname_ is not None:
+            name_ = self.original_tagname_
+        showIndent(outfile, level, pretty_print)
+        outfile.write('<%s%s%s' % (namespaceprefix_, name_, namespacedef_ and ' ' + namespacedef_ or '', ))
+        already_processed = set()
+        self.exportAttributes(outfile, level, already_processed, namespaceprefix_, name_='NETWORK_QUOTAType5')
+        if self.hasContent_():
+            outfile.write('>%s' % (eol_, ))
+            self.exportChildren(outfile, level + 1, namespaceprefix_='', name_='NETWORK_QUOTAType5', pretty_print=pretty_print)
+            showIndent(outfile, level, pretty_print)
+            outfile.write('</%s%s>%s' % (namespaceprefix_, name_, eol_))
+        else:
+            outfile.write('/>%s' % (eol_, ))
+    def exportAttributes(self, outfile, level, already_processed, namespaceprefix_='', name_='NETWORK_QUOTAType5'):
+        pass
+    def exportChildren(self, outfile, level, namespaceprefix_='', name_='NETWORK_QUOTAType5', fromsubclass_=False, pretty_print=True):
+        if pretty_print:
+            eol_ = '\n'
+        else:
+            eol_ = ''
+        for NETWORK_ in self.NETWORK:
+            NETWORK_.export(outfile, level, namespaceprefix_, name_='NETWORK', pretty_print=pretty_print)
+    def build(self, node):
+        already_processed = set()
+        self.buildAttributes(node, node.attrib, already_processed)
+        for child in node:
+            nodeName_ = Tag_pattern_.match(child.tag).groups()[-1]
+            self.buildChildren(child, node, nodeName_)
+        return self
+    def buildAttributes(self, node, attrs, already_processed):
+        pass
+    def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
+        if nodeName_ == 'NETWORK':
+            obj_ = NETWORKType6.factory()
+            obj_.build(child_)
+            self.NETWORK.append(obj_)
+            obj_.original_tagname_ = 'NETWORK'
+# end class NETWORK_QUOTAType5
+
+
+class NETWORKType6(GeneratedsSuper):
+    subclass = None
+    superclass = None
+    def __init__(self, ID=None, LEASES=None, LEASES_USED=None):
+        self.original_tagname_ = None
+        self.ID = ID
+        self.LEASES = LEASES
+        self.LEASES_USED = LEASES_USED
+    def factory(*args_, **kwargs_):
+        if supermod.CurrentSubclassModule_ is not None:
+            subclass = getSubclassFromModule_(
+                supermod.CurrentSubclassModule_, NETWORKType6)
+            if subclass is not None:
+                return subclass(*args_, **kwargs_)
+        if NETWORKType6.subclass:
+            return NETWORKType6.subclass(*args_, **kwargs_)
+        else:
+            return NETWORKType6(*args_, **kwargs_)
+    factory = staticmethod(factory)
+    def get_ID(self): return self.ID
+    def set_ID(self, ID): self.ID = ID
+    def get_LEASES(self): return self.LEASES
+    def set_LEASES(self, LEASES): self.LEASES = LEASES
+    def get_LEASES_USED(self): return self.LEASES_USED
+    def set_LEASES_USED(self, LEASES_USED): self.LEASES_USED = LEASES_USED
+    def hasContent_(self):
+        if (
+            self.ID is not None or
+            self.LEASES is not None or
+            self.LEASES_USED is not None
+        ):
+            return True
+        else:
+            return False
+    def export(self, outfile, level, namespaceprefix_='', name_='NETWORKType6', namespacedef_='', pretty_print=True):
+        imported_ns_def_ = GenerateDSNamespaceDefs_.get('NETWORKType6')
+        if imported_ns_def_ is not None:
+            namespacedef_ = imported_ns_def_
+        if pretty_print:
+            eol_ = '\n'
+        else:
+            eol_ = ''
+        if self.original_tagname_ is not None:
+            name_ = self.original_tagname_
+        showIndent(outfile, level, pretty_print)
+        outfile.write('<%s%s%s' % (namespaceprefix_, name_, namespacedef_ and ' ' + namespacedef_ or '', ))
+        already_processed = set()
+        self.exportAttributes(outfile, level, already_processed, namespaceprefix_, name_='NETWORKType6')
+        if self.hasContent_():
+            outfile.write('>%s' % (eol_, ))
+            self.exportChildren(outfile, level + 1, namespaceprefix_='', name_='NETWORKType6', pretty_print=pretty_print)
+            showIndent(outfile, level, pretty_print)
+            outfile.write('</%s%s>%s' % (namespaceprefix_, name_, eol_))
+        else:
+            outfile.write('/>%s' % (eol_, ))
+    def exportAttributes(self, outfile, level, already_processed, namespaceprefix_='', name_='NETWORKType6'):
+        pass
+    def exportChildren(self, outfile, level, namespaceprefix_='', name_='NETWORKType6', fromsubclass_=False, pretty_print=True):
+        if pretty_print:
+            eol_ = '\n'
+        else:
+            eol_ = ''
+        if self.ID is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<ID>%s</ID>%s' % (self.gds_encode(self.gds_format_string(quote_xml(self.ID), input_name='ID')), eol_))
+        if self.LEASES is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<LEASES>%s</LEASES>%s' % (self.gds_encode(self.gds_format_string(quote_xml(self.LEASES), input_name='LEASES')), eol_))
+        if self.LEASES_USED is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<LEASES_USED>%s</LEASES_USED>%s' % (self.gds_encode(self.gds_format_string(quote_xml(self.LEASES_USED), input_name='LEASES_USED')), eol_))
+    def build(self, node):
+        already_processed = set()
+        self.buildAttributes(node, node.attrib, already_processed)
+        for child in node:
+            nodeName_ = Tag_pattern_.match(child.tag).groups()[-1]
+            self.buildChildren(child, node, nodeName_)
+        return self
+    def buildAttributes(self, node, attrs, already_processed):
+        pass
+    def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
+        if nodeName_ == 'ID':
+            ID_ = child_.text
+            ID_ = self.gds_validate_string(ID_, node, 'ID')
+            self.ID = ID_
+        elif nodeName_ == 'LEASES':
+            LEASES_ = child_.text
+            LEASES_ = self.gds_validate_string(LEASES_, node, 'LEASES')
+            self.LEASES = LEASES_
+        elif nodeName_ == 'LEASES_USED':
+            LEASES_USED_ = child_.text
+            LEASES_USED_ = self.gds_validate_string(LEASES_USED_, node, 'LEASES_USED')
+            self.LEASES_USED = LEASES_USED_
+# end class NETWORKType6
+
+
+class VM_QUOTAType7(GeneratedsSuper):
+    subclass = None
+    superclass = None
+    def __init__(self, VM=None):
+        self.original_tagname_ = None
+        self.VM = VM
+    def factory(*args_, **kwargs_):
+        if supermod.CurrentSubclassModule_ is not None:
+            subclass = getSubclassFromModule_(
+                supermod.CurrentSubclassModule_, VM_QUOTAType7)
+            if subclass is not None:
+                return subclass(*args_, **kwargs_)
+        if VM_QUOTAType7.subclass:
+            return VM_QUOTAType7.subclass(*args_, **kwargs_)
+        else:
+            return VM_QUOTAType7(*args_, **kwargs_)
+    factory = staticmethod(factory)
+    def get_VM(self): return self.VM
+    def set_VM(self, VM): self.VM = VM
+    def hasContent_(self):
+        if (
+            self.VM is not None
+        ):
+            return True
+        else:
+            return False
+    def export(self, outfile, level, namespaceprefix_='', name_='VM_QUOTAType7', namespacedef_='', pretty_print=True):
+        imported_ns_def_ = GenerateDSNamespaceDefs_.get('VM_QUOTAType7')
+        if imported_ns_def_ is not None:
+            namespacedef_ = imported_ns_def_
+        if pretty_print:
+            eol_ = '\n'
+        else:
+            eol_ = ''
+        if self.original_tagname_ is not None:
+            name_ = self.original_tagname_
+        showIndent(outfile, level, pretty_print)
+        outfile.write('<%s%s%s' % (namespaceprefix_, name_, namespacedef_ and ' ' + namespacedef_ or '', ))
+        already_processed = set()
+        self.exportAttributes(outfile, level, already_processed, namespaceprefix_, name_='VM_QUOTAType7')
+        if self.hasContent_():
+            outfile.write('>%s' % (eol_, ))
+            self.exportChildren(outfile, level + 1, namespaceprefix_='', name_='VM_QUOTAType7', pretty_print=pretty_print)
+            showIndent(outfile, level, pretty_print)
+            outfile.write('</%s%s>%s' % (namespaceprefix_, name_, eol_))
+        else:
+            outfile.write('/>%s' % (eol_, ))
+    def exportAttributes(self, outfile, level, already_processed, namespaceprefix_='', name_='VM_QUOTAType7'):
+        pass
+    def exportChildren(self, outfile, level, namespaceprefix_='', name_='VM_QUOTAType7', fromsubclass_=False, pretty_print=True):
+        if pretty_print:
+            eol_ = '\n'
+        else:
+            eol_ = ''
+        if self.VM is not None:
+            self.VM.export(outfile, level, namespaceprefix_, name_='VM', pretty_print=pretty_print)
+    def build(self, node):
+        already_processed = set()
+        self.buildAttributes(node, node.attrib, already_processed)
+        for child in node:
+            nodeName_ = Tag_pattern_.match(child.tag).groups()[-1]
+            self.buildChildren(child, node, nodeName_)
+        return self
+    def buildAttributes(self, node, attrs, already_processed):
+        pass
+    def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
+        if nodeName_ == 'VM':
+            obj_ = VMType8.factory()
+            obj_.build(child_)
+            self.VM = obj_
+            obj_.original_tagname_ = 'VM'
+# end class VM_QUOTAType7
+
+
+class VMType8(GeneratedsSuper):
+    subclass = None
+    superclass = None
+    def __init__(self, CPU=None, CPU_USED=None, MEMORY=None, MEMORY_USED=None, SYSTEM_DISK_SIZE=None, SYSTEM_DISK_SIZE_USED=None, VMS=None, VMS_USED=None):
+        self.original_tagname_ = None
+        self.CPU = CPU
+        self.CPU_USED = CPU_USED
+        self.MEMORY = MEMORY
+        self.MEMORY_USED = MEMORY_USED
+        self.SYSTEM_DISK_SIZE = SYSTEM_DISK_SIZE
+        self.SYSTEM_DISK_SIZE_USED = SYSTEM_DISK_SIZE_USED
+        self.VMS = VMS
+        self.VMS_USED = VMS_USED
+    def factory(*args_, **kwargs_):
+        if supermod.CurrentSubclassModule_ is not None:
+            subclass = getSubclassFromModule_(
+                supermod.CurrentSubclassModule_, VMType8)
+            if subclass is not None:
+                return subclass(*args_, **kwargs_)
+        if VMType8.subclass:
+            return VMType8.subclass(*args_, **kwargs_)
+        else:
+            return VMType8(*args_, **kwargs_)
+    factory = staticmethod(factory)
+    def get_CPU(self): return self.CPU
+    def set_CPU(self, CPU): self.CPU = CPU
+    def get_CPU_USED(self): return self.CPU_USED
+    def set_CPU_USED(self, CPU_USED): self.CPU_USED = CPU_USED
+    def get_MEMORY(self): return self.MEMORY
+    def set_MEMORY(self, MEMORY): self.MEMORY = MEMORY
+    def get_MEMORY_USED(self): return self.MEMORY_USED
+    def set_MEMORY_USED(self, MEMORY_USED): self.MEMORY_USED = MEMORY_USED
+    def get_SYSTEM_DISK_SIZE(self): return self.SYSTEM_DISK_SIZE
+    def set_SYSTEM_DISK_SIZE(self, SYSTEM_DISK_SIZE): self.SYSTEM_DISK_SIZE = SYSTEM_DISK_SIZE
+    def get_SYSTEM_DISK_SIZE_USED(self): return self.SYSTEM_DISK_SIZE_USED
+    def set_SYSTEM_DISK_SIZE_USED(self, SYSTEM_DISK_SIZE_USED): self.SYSTEM_DISK_SIZE_USED = SYSTEM_DISK_SIZE_USED
+    def get_VMS(self): return self.VMS
+    def set_VMS(self, VMS): self.VMS = VMS
+    def get_VMS_USED(self): return self.VMS_USED
+    def set_VMS_USED(self, VMS_USED): self.VMS_USED = VMS_USED
+    def hasContent_(self):
+        if (
+            self.CPU is not None or
+            self.CPU_USED is not None or
+            self.MEMORY is not None or
+            self.MEMORY_USED is not None or
+            self.SYSTEM_DISK_SIZE is not None or
+            self.SYSTEM_DISK_SIZE_USED is not None or
+            self.VMS is not None or
+            self.VMS_USED is not None
+        ):
+            return True
+        else:
+            return False
+    def export(self, outfile, level, namespaceprefix_='', name_='VMType8', namespacedef_='', pretty_print=True):
+        imported_ns_def_ = GenerateDSNamespaceDefs_.get('VMType8')
+        if imported_ns_def_ is not None:
+            namespacedef_ = imported_ns_def_
+        if pretty_print:
+            eol_ = '\n'
+        else:
+            eol_ = ''
+        if self.original_tagname_ is not None:
+            name_ = self.original_tagname_
+        showIndent(outfile, level, pretty_print)
+        outfile.write('<%s%s%s' % (namespaceprefix_, name_, namespacedef_ and ' ' + namespacedef_ or '', ))
+        already_processed = set()
+        self.exportAttributes(outfile, level, already_processed, namespaceprefix_, name_='VMType8')
+        if self.hasContent_():
+            outfile.write('>%s' % (eol_, ))
+            self.exportChildren(outfile, level + 1, namespaceprefix_='', name_='VMType8', pretty_print=pretty_print)
+            showIndent(outfile, level, pretty_print)
+            outfile.write('</%s%s>%s' % (namespaceprefix_, name_, eol_))
+        else:
+            outfile.write('/>%s' % (eol_, ))
+    def exportAttributes(self, outfile, level, already_processed, namespaceprefix_='', name_='VMType8'):
+        pass
+    def exportChildren(self, outfile, level, namespaceprefix_='', name_='VMType8', fromsubclass_=False, pretty_print=True):
+        if pretty_print:
+            eol_ = '\n'
+        else:
+            eol_ = ''
+        if self.CPU is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<CPU>%s</CPU>%s' % (self.gds_encode(self.gds_format_string(quote_xml(self.CPU), input_name='CPU')), eol_))
+        if self.CPU_USED is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<CPU_USED>%s</CPU_USED>%s' % (self.gds_encode(self.gds_format_string(quote_xml(self.CPU_USED), input_name='CPU_USED')), eol_))
+        if self.MEMORY is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<MEMORY>%s</MEMORY>%s' % (self.gds_encode(self.gds_format_string(quote_xml(self.MEMORY), input_name='MEMORY')), eol_))
+        if self.MEMORY_USED is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<MEMORY_USED>%s</MEMORY_USED>%s' % (self.gds_encode(self.gds_format_string(quote_xml(self.MEMORY_USED), input_name='MEMORY_USED')), eol_))
+        if self.SYSTEM_DISK_SIZE is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<SYSTEM_DISK_SIZE>%s</SYSTEM_DISK_SIZE>%s' % (self.gds_encode(self.gds_format_string(quote_xml(self.SYSTEM_DISK_SIZE), input_name='SYSTEM_DISK_SIZE')), eol_))
+        if self.SYSTEM_DISK_SIZE_USED is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<SYSTEM_DISK_SIZE_USED>%s</SYSTEM_DISK_SIZE_USED>%s' % (self.gds_encode(self.gds_format_string(quote_xml(self.SYSTEM_DISK_SIZE_USED), input_name='SYSTEM_DISK_SIZE_USED')), eol_))
+        if self.VMS is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<VMS>%s</VMS>%s' % (self.gds_encode(self.gds_format_string(quote_xml(self.VMS), input_name='VMS')), eol_))
+        if self.VMS_USED is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<VMS_USED>%s</VMS_USED>%s' % (self.gds_encode(self.gds_format_string(quote_xml(self.VMS_USED), input_name='VMS_USED')), eol_))
+    def build(self, node):
+        already_processed = set()
+        self.buildAttributes(node, node.attrib, already_processed)
+        for child in node:
+            nodeName_ = Tag_pattern_.match(child.tag).groups()[-1]
+            self.buildChildren(child, node, nodeName_)
+        return self
+    def buildAttributes(self, node, attrs, already_processed):
+        pass
+    def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
+        if nodeName_ == 'CPU':
+            CPU_ = child_.text
+            CPU_ = self.gds_validate_string(CPU_, node, 'CPU')
+            self.CPU = CPU_
+        elif nodeName_ == 'CPU_USED':
+            CPU_USED_ = child_.text
+            CPU_USED_ = self.gds_validate_string(CPU_USED_, node, 'CPU_USED')
+            self.CPU_USED = CPU_USED_
+        elif nodeName_ == 'MEMORY':
+            MEMORY_ = child_.text
+            MEMORY_ = self.gds_validate_string(MEMORY_, node, 'MEMORY')
+            self.MEMORY = MEMORY_
+        elif nodeName_ == 'MEMORY_USED':
+            MEMORY_USED_ = child_.text
+            MEMORY_USED_ = self.gds_validate_string(MEMORY_USED_, node, 'MEMORY_USED')
+            self.MEMORY_USED = MEMORY_USED_
+        elif nodeName_ == 'SYSTEM_DISK_SIZE':
+            SYSTEM_DISK_SIZE_ = child_.text
+            SYSTEM_DISK_SIZE_ = self.gds_validate_string(SYSTEM_DISK_SIZE_, node, 'SYSTEM_DISK_SIZE')
+            self.SYSTEM_DISK_SIZE = SYSTEM_DISK_SIZE_
+        elif nodeName_ == 'SYSTEM_DISK_SIZE_USED':
+            SYSTEM_DISK_SIZE_USED_ = child_.text
+            SYSTEM_DISK_SIZE_USED_ = self.gds_validate_string(SYSTEM_DISK_SIZE_USED_, node, 'SYSTEM_DISK_SIZE_USED')
+            self.SYSTEM_DISK_SIZE_USED = SYSTEM_DISK_SIZE_USED_
+        elif nodeName_ == 'VMS':
+            VMS_ = child_.text
+            VMS_ = self.gds_validate_string(VMS_, node, 'VMS')
+            self.VMS = VMS_
+        elif nodeName_ == 'VMS_USED':
+            VMS_USED_ = child_.text
+            VMS_USED_ = self.gds_validate_string(VMS_USED_, node, 'VMS_USED')
+            self.VMS_USED = VMS_USED_
+# end class VMType8
+
+
+class IMAGE_QUOTAType9(GeneratedsSuper):
+    subclass = None
+    superclass = None
+    def __init__(self, IMAGE=None):
+        self.original_tagname_ = None
+        if IMAGE is None:
+            self.IMAGE = []
+        else:
+            self.IMAGE = IMAGE
+    def factory(*args_, **kwargs_):
+        if supermod.CurrentSubclassModule_ is not None:
+            subclass = getSubclassFromModule_(
+                supermod.CurrentSubclassModule_, IMAGE_QUOTAType9)
+            if subclass is not None:
+                return subclass(*args_, **kwargs_)
+        if IMAGE_QUOTAType9.subclass:
+            return IMAGE_QUOTAType9.subclass(*args_, **kwargs_)
+        else:
+            return IMAGE_QUOTAType9(*args_, **kwargs_)
+    factory = staticmethod(factory)
+    def get_IMAGE(self): return self.IMAGE
+    def set_IMAGE(self, IMAGE): self.IMAGE = IMAGE
+    def add_IMAGE(self, value): self.IMAGE.append(value)
+    def insert_IMAGE_at(self, index, value): self.IMAGE.insert(index, value)
+    def replace_IMAGE_at(self, index, value): self.IMAGE[index] = value
+    def hasContent_(self):
+        if (
+            self.IMAGE
+        ):
+            return True
+        else:
+            return False
+    def export(self, outfile, level, namespaceprefix_='', name_='IMAGE_QUOTAType9', namespacedef_='', pretty_print=True):
+        imported_ns_def_ = GenerateDSNamespaceDefs_.get('IMAGE_QUOTAType9')
+        if imported_ns_def_ is not None:
+            namespacedef_ = imported_ns_def_
+        if pretty_print:
+            eol_ = '\n'
+        else:
+            eol_ = ''
+        if self.original_tagname_ is not None:
+            name_ = self.original_tagname_
+        showIndent(outfile, level, pretty_print)
+        outfile.write('<%s%s%s' % (namespaceprefix_, name_, namespacedef_ and ' ' + namespacedef_ or '', ))
+        already_processed = set()
+        self.exportAttributes(outfile, level, already_processed, namespaceprefix_, name_='IMAGE_QUOTAType9')
+        if self.hasContent_():
+            outfile.write('>%s' % (eol_, ))
+            self.exportChildren(outfile, level + 1, namespaceprefix_='', name_='IMAGE_QUOTAType9', pretty_print=pretty_print)
+            showIndent(outfile, level, pretty_print)
+            outfile.write('</%s%s>%s' % (namespaceprefix_, name_, eol_))
+        else:
+            outfile.write('/>%s' % (eol_, ))
+    def exportAttributes(self, outfile, level, already_processed, namespaceprefix_='', name_='IMAGE_QUOTAType9'):
+        pass
+    def exportChildren(self, outfile, level, namespaceprefix_='', name_='IMAGE_QUOTAType9', fromsubclass_=False, pretty_print=True):
+        if pretty_print:
+            eol_ = '\n'
+        else:
+            eol_ = ''
+        for IMAGE_ in self.IMAGE:
+            IMAGE_.export(outfile, level, namespaceprefix_, name_='IMAGE', pretty_print=pretty_print)
+    def build(self, node):
+        already_processed = set()
+        self.buildAttributes(node, node.attrib, already_processed)
+        for child in node:
+            nodeName_ = Tag_pattern_.match(child.tag).groups()[-1]
+            self.buildChildren(child, node, nodeName_)
+        return self
+    def buildAttributes(self, node, attrs, already_processed):
+        pass
+    def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
+        if nodeName_ == 'IMAGE':
+            obj_ = IMAGEType10.factory()
+            obj_.build(child_)
+            self.IMAGE.append(obj_)
+            obj_.original_tagname_ = 'IMAGE'
+# end class IMAGE_QUOTAType9
+
+
+class IMAGEType10(GeneratedsSuper):
+    subclass = None
+    superclass = None
+    def __init__(self, ID=None, RVMS=None, RVMS_USED=None):
+        self.original_tagname_ = None
+        self.ID = ID
+        self.RVMS = RVMS
+        self.RVMS_USED = RVMS_USED
+    def factory(*args_, **kwargs_):
+        if supermod.CurrentSubclassModule_ is not None:
+            subclass = getSubclassFromModule_(
+                supermod.CurrentSubclassModule_, IMAGEType10)
+            if subclass is not None:
+                return subclass(*args_, **kwargs_)
+        if IMAGEType10.subclass:
+            return IMAGEType10.subclass(*args_, **kwargs_)
+        else:
+            return IMAGEType10(*args_, **kwargs_)
+    factory = staticmethod(factory)
+    def get_ID(self): return self.ID
+    def set_ID(self, ID): self.ID = ID
+    def get_RVMS(self): return self.RVMS
+    def set_RVMS(self, RVMS): self.RVMS = RVMS
+    def get_RVMS_USED(self): return self.RVMS_USED
+    def set_RVMS_USED(self, RVMS_USED): self.RVMS_USED = RVMS_USED
+    def hasContent_(self):
+        if (
+            self.ID is not None or
+            self.RVMS is not None or
+            self.RVMS_USED is not None
+        ):
+            return True
+        else:
+            return False
+    def export(self, outfile, level, namespaceprefix_='', name_='IMAGEType10', namespacedef_='', pretty_print=True):
+        imported_ns_def_ = GenerateDSNamespaceDefs_.get('IMAGEType10')
+        if imported_ns_def_ is not None:
+            namespacedef_ = imported_ns_def_
+        if pretty_print:
+            eol_ = '\n'
+        else:
+            eol_ = ''
+        if self.original_tagname_ is not None:
+            name_ = self.original_tagname_
+        showIndent(outfile, level, pretty_print)
+        outfile.write('<%s%s%s' % (namespaceprefix_, name_, namespacedef_ and ' ' + namespacedef_ or '', ))
+        already_processed = set()
+        self.exportAttributes(outfile, level, already_processed, namespaceprefix_, name_='IMAGEType10')
+        if self.hasContent_():
+            outfile.write('>%s' % (eol_, ))
+            self.exportChildren(outfile, level + 1, namespaceprefix_='', name_='IMAGEType10', pretty_print=pretty_print)
+            showIndent(outfile, level, pretty_print)
+            outfile.write('</%s%s>%s' % (namespaceprefix_, name_, eol_))
+        else:
+            outfile.write('/>%s' % (eol_, ))
+    def exportAttributes(self, outfile, level, already_processed, namespaceprefix_='', name_='IMAGEType10'):
+        pass
+    def exportChildren(self, outfile, level, namespaceprefix_='', name_='IMAGEType10', fromsubclass_=False, pretty_print=True):
+        if pretty_print:
+            eol_ = '\n'
+        else:
+            eol_ = ''
+        if self.ID is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<ID>%s</ID>%s' % (self.gds_encode(self.gds_format_string(quote_xml(self.ID), input_name='ID')), eol_))
+        if self.RVMS is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<RVMS>%s</RVMS>%s' % (self.gds_encode(self.gds_format_string(quote_xml(self.RVMS), input_name='RVMS')), eol_))
+        if self.RVMS_USED is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<RVMS_USED>%s</RVMS_USED>%s' % (self.gds_encode(self.gds_format_string(quote_xml(self.RVMS_USED), input_name='RVMS_USED')), eol_))
+    def build(self, node):
+        already_processed = set()
+        self.buildAttributes(node, node.attrib, already_processed)
+        for child in node:
+            nodeName_ = Tag_pattern_.match(child.tag).groups()[-1]
+            self.buildChildren(child, node, nodeName_)
+        return self
+    def buildAttributes(self, node, attrs, already_processed):
+        pass
+    def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
+        if nodeName_ == 'ID':
+            ID_ = child_.text
+            ID_ = self.gds_validate_string(ID_, node, 'ID')
+            self.ID = ID_
+        elif nodeName_ == 'RVMS':
+            RVMS_ = child_.text
+            RVMS_ = self.gds_validate_string(RVMS_, node, 'RVMS')
+            self.RVMS = RVMS_
+        elif nodeName_ == 'RVMS_USED':
+            RVMS_USED_ = child_.text
+            RVMS_USED_ = self.gds_validate_string(RVMS_USED_, node, 'RVMS_USED')
+            self.RVMS_USED = RVMS_USED_
+# end class IMAGEType10
+
+
+class GROUP_POOLSub(TemplatedType, GROUP_POOL):
+    def __init__(self, GROUP=None, QUOTAS=None, DEFAULT_GROUP_QUOTAS=None):
+        super(GROUP_POOLSub, self).__init__(GROUP, QUOTAS, DEFAULT_GROUP_QUOTAS, )
+GROUP_POOL.subclass = GROUP_POOLSub
+# end class GROUP_POOLSub
+
+
+class GROUPTypeSub(TemplatedType, GROUPType):
+    def __init__(self, ID=None, NAME=None, TEMPLATE=None, USERS=None, ADMINS=None):
+        super(GROUPTypeSub, self).__init__(ID, NAME, TEMPLATE, USERS, ADMINS, )
+GROUPType.subclass = GROUPTypeSub
+# end class GROUPTypeSub
+
+
+class USERSTypeSub(TemplatedType, USERSType):
+    def __init__(self, ID=None):
+        super(USERSTypeSub, self).__init__(ID, )
+USERSType.subclass = USERSTypeSub
+# end class USERSTypeSub
+
+
+class ADMINSTypeSub(TemplatedType, ADMINSType):
+    def __init__(self, ID=None):
+        super(ADMINSTypeSub, self).__init__(ID, )
+ADMINSType.subclass = ADMINSTypeSub
+# end class ADMINSTypeSub
+
+
+class QUOTASTypeSub(TemplatedType, QUOTASType):
+    def __init__(self, ID=None, DATASTORE_QUOTA=None, NETWORK_QUOTA=None, VM_QUOTA=None, IMAGE_QUOTA=None):
+        super(QUOTASTypeSub, self).__init__(ID, DATASTORE_QUOTA, NETWORK_QUOTA, VM_QUOTA, IMAGE_QUOTA, )
+QUOTASType.subclass = QUOTASTypeSub
+# end class QUOTASTypeSub
+
+
+class DATASTORE_QUOTATypeSub(TemplatedType, DATASTORE_QUOTAType):
+    def __init__(self, DATASTORE=None):
+        super(DATASTORE_QUOTATypeSub, self).__init__(DATASTORE, )
+DATASTORE_QUOTAType.subclass = DATASTORE_QUOTATypeSub
+# end class DATASTORE_QUOTATypeSub
+
+
+class DATASTORETypeSub(TemplatedType, DATASTOREType):
+    def __init__(self, ID=None, IMAGES=None, IMAGES_USED=None, SIZE=None, SIZE_USED=None):
+        super(DATASTORETypeSub, self).__init__(ID, IMAGES, IMAGES_USED, SIZE, SIZE_USED, )
+DATASTOREType.subclass = DATASTORETypeSub
+# end class DATASTORETypeSub
+
+
+class NETWORK_QUOTATypeSub(TemplatedType, NETWORK_QUOTAType):
+    def __init__(self, NETWORK=None):
+        super(NETWORK_QUOTATypeSub, self).__init__(NETWORK, )
+NETWORK_QUOTAType.subclass = NETWORK_QUOTATypeSub
+# end class NETWORK_QUOTATypeSub
+
+
+class NETWORKTypeSub(TemplatedType, NETWORKType):
+    def __init__(self, ID=None, LEASES=None, LEASES_USED=None):
+        super(NETWORKTypeSub, self).__init__(ID, LEASES, LEASES_USED, )
+NETWORKType.subclass = NETWORKTypeSub
+# end class NETWORKTypeSub
+
+
+class VM_QUOTATypeSub(TemplatedType, VM_QUOTAType):
+    def __init__(self, VM=None):
+        super(VM_QUOTATypeSub, self).__init__(VM, )
+VM_QUOTAType.subclass = VM_QUOTATypeSub
+# end class VM_QUOTATypeSub
+
+
+class VMType2Sub(TemplatedType, VMType2):
+    def __init__(self, CPU=None, CPU_USED=None, MEMORY=None, MEMORY_USED=None, SYSTEM_DISK_SIZE=None, SYSTEM_DISK_SIZE_USED=None, VMS=None, VMS_USED=None):
+        super(VMType2Sub, self).__init__(CPU, CPU_USED, MEMORY, MEMORY_USED, SYSTEM_DISK_SIZE, SYSTEM_DISK_SIZE_USED, VMS, VMS_USED, )
+VMType2.subclass = VMType2Sub
+# end class VMType2Sub
+
+
+class IMAGE_QUOTATypeSub(TemplatedType, IMAGE_QUOTAType):
+    def __init__(self, IMAGE=None):
+        super(IMAGE_QUOTATypeSub, self).__init__(IMAGE, )
+IMAGE_QUOTAType.subclass = IMAGE_QUOTATypeSub
+# end class IMAGE_QUOTATypeSub
+
+
+class IMAGETypeSub(TemplatedType, IMAGEType):
+    def __init__(self, ID=None, RVMS=None, RVMS_USED=None):
+        super(IMAGETypeSub, self).__init__(ID, RVMS, RVMS_USED, )
+IMAGEType.subclass = IMAGETypeSub
+# end class IMAGETypeSub
+
+
+class DEFAULT_GROUP_QUOTASTypeSub(TemplatedType, DEFAULT_GROUP_QUOTASType):
+    def __init__(self, DATASTORE_QUOTA=None, NETWORK_QUOTA=None, VM_QUOTA=None, IMAGE_QUOTA=None):
+        super(DEFAULT_GROUP_QUOTASTypeSub, self).__init__(DATASTORE_QUOTA, NETWORK_QUOTA, VM_QUOTA, IMAGE_QUOTA, )
+DEFAULT_GROUP_QUOTASType.subclass = DEFAULT_GROUP_QUOTASTypeSub
+# end class DEFAULT_GROUP_QUOTASTypeSub
+
+
+class DATASTORE_QUOTAType3Sub(TemplatedType, DATASTORE_QUOTAType3):
+    def __init__(self, DATASTORE=None):
+        super(DATASTORE_QUOTAType3Sub, self).__init__(DATASTORE, )
+DATASTORE_QUOTAType3.subclass = DATASTORE_QUOTAType3Sub
+# end class DATASTORE_QUOTAType3Sub
+
+
+class DATASTOREType4Sub(TemplatedType, DATASTOREType4):
+    def __init__(self, ID=None, IMAGES=None, IMAGES_USED=None, SIZE=None, SIZE_USED=None):
+        super(DATASTOREType4Sub, self).__init__(ID, IMAGES, IMAGES_USED, SIZE, SIZE_USED, )
+DATASTOREType4.subclass = DATASTOREType4Sub
+# end class DATASTOREType4Sub
+
+
+class NETWORK_QUOTAType5Sub(TemplatedType, NETWORK_QUOTAType5):
+    def __init__(self, NETWORK=None):
+        super(NETWORK_QUOTAType5Sub, self).__init__(NETWORK, )
+NETWORK_QUOTAType5.subclass = NETWORK_QUOTAType5Sub
+# end class NETWORK_QUOTAType5Sub
+
+
+class NETWORKType6Sub(TemplatedType, NETWORKType6):
+    def __init__(self, ID=None, LEASES=None, LEASES_USED=None):
+        super(NETWORKType6Sub, self).__init__(ID, LEASES, LEASES_USED, )
+NETWORKType6.subclass = NETWORKType6Sub
+# end class NETWORKType6Sub
+
+
+class VM_QUOTAType7Sub(TemplatedType, VM_QUOTAType7):
+    def __init__(self, VM=None):
+        super(VM_QUOTAType7Sub, self).__init__(VM, )
+VM_QUOTAType7.subclass = VM_QUOTAType7Sub
+# end class VM_QUOTAType7Sub
+
+
+class VMType8Sub(TemplatedType, VMType8):
+    def __init__(self, CPU=None, CPU_USED=None, MEMORY=None, MEMORY_USED=None, SYSTEM_DISK_SIZE=None, SYSTEM_DISK_SIZE_USED=None, VMS=None, VMS_USED=None):
+        super(VMType8Sub, self).__init__(CPU, CPU_USED, MEMORY, MEMORY_USED, SYSTEM_DISK_SIZE, SYSTEM_DISK_SIZE_USED, VMS, VMS_USED, )
+VMType8.subclass = VMType8Sub
+# end class VMType8Sub
+
+
+class IMAGE_QUOTAType9Sub(TemplatedType, IMAGE_QUOTAType9):
+    def __init__(self, IMAGE=None):
+        super(IMAGE_QUOTAType9Sub, self).__init__(IMAGE, )
+IMAGE_QUOTAType9.subclass = IMAGE_QUOTAType9Sub
+# end class IMAGE_QUOTAType9Sub
+
+
+class IMAGEType10Sub(TemplatedType, IMAGEType10):
+    def __init__(self, ID=None, RVMS=None, RVMS_USED=None):
+        super(IMAGEType10Sub, self).__init__(ID, RVMS, RVMS_USED, )
+IMAGEType10.subclass = IMAGEType10Sub
+# end class IMAGEType10Sub
+
+
@@ -0,0 +1,1034 @@
+#!/usr/bin/env python
+
+#
+# Bindings of HOST_POOL, HOST, generated by generateDS.py and split from supbind by src/split_bindings.py
+#
+
+import sys
+import re as re_
+import base64
+import datetime as datetime_
+import warnings as warnings_
+try:
+    from lxml import etree as etree_
+except ImportError:
+    from xml.etree import ElementTree as etree_
+from pyone.util import TemplatedType
+from . import supbind as supermod
+from .supbind import (
+    GenerateDSNamespaceDefs_,
+    GeneratedsSuper,
+    Tag_pattern_,
+    getSubclassFromModule_,
+    quote_xml,
+    raise_parse_error,
+    showIndent,
+)
+
+
+class HOST_POOL(GeneratedsSuper):
+    subclass = None
+    superclass = None
+    def __init__(self, HOST=None):
+        self.original_tagname_ = None
+        if HOST is None:
+            self.HOST = []
+        else:
+            self.HOST = HOST
+    def factory(*args_, **kwargs_):
+        if supermod.CurrentSubclassModule_ is not None:
+            subclass = getSubclassFromModule_(
+                supermod.CurrentSubclassModule_, HOST_POOL)
+            if subclass is not None:
+                return subclass(*args_, **kwargs_)
+        if HOST_POOL.subclass:
+            return HOST_POOL.subclass(*args_, **kwargs_)
+        else:
+            return HOST_POOL(*args_, **kwargs_)
+    factory = staticmethod(factory)
+    def get_HOST(self): return self.HOST
+    def set_HOST(self, HOST): self.HOST = HOST
+    def add_HOST(self, value): self.HOST.append(value)
+    def insert_HOST_at(self, index, value): self.HOST.insert(index, value)
+    def replace_HOST_at(self, index, value): self.HOST[index] = value
+    def hasContent_(self):
+        if (
+            self.HOST
+        ):
+            return True
+        else:
+            return False
+    def export(self, outfile, level, namespaceprefix_='', name_='HOST_POOL', namespacedef_='', pretty_print=True):
+        imported_ns_def_ = GenerateDSNamespaceDefs_.get('HOST_POOL')
+        if imported_ns_def_ is not None:
+            namespacedef_ = imported_ns_def_
+        if pretty_print:
+            eol_ = '\n'
+        else:
+            eol_ = ''
+        if self.original_tagname_ is not None:
+            name_ = self.original_tagname_
+        showIndent(outfile, level, pretty_print)
+        outfile.write('<%s%s%s' % (namespaceprefix_, name_, namespacedef_ and ' ' + namespacedef_ or '', ))
+        already_processed = set()
+        self.exportAttributes(outfile, level, already_processed, namespaceprefix_, name_='HOST_POOL')
+        if self.hasContent_():
+            outfile.write('>%s' % (eol_, ))
+            self.exportChildren(outfile, level + 1, namespaceprefix_='', name_='HOST_POOL', pretty_print=pretty_print)
+            showIndent(outfile, level, pretty_print)
+            outfile.write('</%s%s>%s' % (namespaceprefix_, name_, eol_))
+        else:
+            outfile.write('/>%s' % (eol_, ))
+    def exportAttributes(self, outfile, level, already_processed, namespaceprefix_='', name_='HOST_POOL'):
+        pass
+    def exportChildren(self, outfile, level, namespaceprefix_='', name_='HOST_POOL', fromsubclass_=False, pretty_print=True):
+        if pretty_print:
+            eol_ = '\n'
+        else:
+            eol_ = ''
+        for HOST_ in self.HOST:
+            HOST_.export(outfile, level, namespaceprefix_, name_='HOST', pretty_print=pretty_print)
+    def build(self, node):
+        already_processed = set()
+        self.buildAttributes(node, node.attrib, already_processed)
+        for child in node:
+            nodeName_ = Tag_pattern_.match(child.tag).groups()[-1]
+            self.buildChildren(child, node, nodeName_)
+        return self
+    def buildAttributes(self, node, attrs, already_processed):
+        pass
+    def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
+        if nodeName_ == 'HOST':
+            obj_ = HOST.factory()
+            obj_.build(child_)
+            self.HOST.append(obj_)
+            obj_.original_tagname_ = 'HOST'
+# end class HOST_POOL
+
+
+class HOST(GeneratedsSuper):
+    subclass = None
+    superclass = None
+    def __init__(self, ID=None, NAME=None, STATE=None, IM_MAD=None, VM_MAD=None, LAST_MON_TIME=None, CLUSTER_ID=None, CLUSTER=None, HOST_SHARE=None, VMS=None, TEMPLATE=None):
+        self.original_tagname_ = None
+        self.ID = ID
+        self.NAME = NAME
+        self.STATE = STATE
+        self.IM_MAD = IM_MAD
+        self.VM_MAD = VM_MAD
+        self.LAST_MON_TIME = LAST_MON_TIME
+        self.CLUSTER_ID = CLUSTER_ID
+        self.CLUSTER = CLUSTER
+        self.HOST_SHARE = HOST_SHARE
+        self.VMS = VMS
+        self.TEMPLATE = TEMPLATE
+    def factory(*args_, **kwargs_):
+        if supermod.CurrentSubclassModule_ is not None:
+            subclass = getSubclassFromModule_(
+                supermod.CurrentSubclassModule_, HOST)
+            if subclass is not None:
+                return subclass(*args_, **kwargs_)
+        if HOST.subclass:
+            return HOST.subclass(*args_, **kwargs_)
+        else:
+            return HOST(*args_, **kwargs_)
+    factory = staticmethod(factory)
+    def get_ID(self): return self.ID
+    def set_ID(self, ID): self.ID = ID
+    def get_NAME(self): return self.NAME
+    def set_NAME(self, NAME): self.NAME = NAME
+    def get_STATE(self): return self.STATE
+    def set_STATE(self, STATE): self.STATE = STATE
+    def get_IM_MAD(self): return self.IM_MAD
+    def set_IM_MAD(self, IM_MAD): self.IM_MAD = IM_MAD
+    def get_VM_MAD(self): return self.VM_MAD
+    def set_VM_MAD(self, VM_MAD): self.VM_MAD = VM_MAD
+    def get_LAST_MON_TIME(self): return self.LAST_MON_TIME
+    def set_LAST_MON_TIME(self, LAST_MON_TIME): self.LAST_MON_TIME = LAST_MON_TIME
+    def get_CLUSTER_ID(self): return self.CLUSTER_ID
+    def set_CLUSTER_ID(self, CLUSTER_ID): self.CLUSTER_ID = CLUSTER_ID
+    def get_CLUSTER(self): return self.CLUSTER
+    def set_CLUSTER(self, CLUSTER): self.CLUSTER = CLUSTER
+    def get_HOST_SHARE(self): return self.HOST_SHARE
+    def set_HOST_SHARE(self, HOST_SHARE): self.HOST_SHARE = HOST_SHARE
+    def get_VMS(self): return self.VMS
+    def set_VMS(self, VMS): self.VMS = VMS
+    def get_TEMPLATE(self): return self.TEMPLATE
+    def set_TEMPLATE(self, TEMPLATE): self.TEMPLATE = TEMPLATE
+    def hasContent_(self):
+        if (
+            self.ID is not None or
+            self.NAME is not None or
+            self.STATE is not None or
+            self.IM_MAD is not None or
+            self.VM_MAD is not None or
+            self.LAST_MON_TIME is not None or
+            self.CLUSTER_ID is not None or
+            self.CLUSTER is not None or
+            self.HOST_SHARE is not None or
+            self.VMS is not None or
+            self.TEMPLATE is not None
+        ):
+            return True
+        else:
+            return False
+    def export(self, outfile, level, namespaceprefix_='', name_='HOST', namespacedef_='', pretty_print=True):
+        imported_ns_def_ = GenerateDSNamespaceDefs_.get('HOST')
+        if imported_ns_def_ is not None:
+            namespacedef_ = imported_ns_def_
+        if pretty_print:
+            eol_ = '\n'
+        else:
+            eol_ = ''
+        if self.original_tagname_ is not None:
+            name_ = self.original_tagname_
+        showIndent(outfile, level, pretty_print)
+        outfile.write('<%s%s%s' % (namespaceprefix_, name_, namespacedef_ and ' ' + namespacedef_ or '', ))
+        already_processed = set()
+        self.exportAttributes(outfile, level, already_processed, namespaceprefix_, name_='HOST')
+        if self.hasContent_():
+            outfile.write('>%s' % (eol_, ))
+            self.exportChildren(outfile, level + 1, namespaceprefix_='', name_='HOST', pretty_print=pretty_print)
+            showIndent(outfile, level, pretty_print)
+            outfile.write('</%s%s>%s' % (namespaceprefix_, name_, eol_))
+        else:
+            outfile.write('/>%s' % (eol_, ))
+    def exportAttributes(self, outfile, level, already_processed, namespaceprefix_='', name_='HOST'):
+        pass
+    def exportChildren(self, outfile, level, namespaceprefix_='', name_='HOST', fromsubclass_=False, pretty_print=True):
+        if pretty_print:
+            eol_ = '\n'
+        else:
+            eol_ = ''
+        if self.ID is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<ID>%s</ID>%s' % (self.gds_format_integer(self.ID, input_name='ID'), eol_))
+        if self.NAME is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<NAME>%s</NAME>%s' % (self.gds_encode(self.gds_format_string(quote_xml(self.NAME), input_name='NAME')), eol_))
+        if self.STATE is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<STATE>%s</STATE>%s' % (self.gds_format_integer(self.STATE, input_name='STATE'), eol_))
+        if self.IM_MAD is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<IM_MAD>%s</IM_MAD>%s' % (self.gds_encode(self.gds_format_string(quote_xml(self.IM_MAD), input_name='IM_MAD')), eol_))
+        if self.VM_MAD is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<VM_MAD>%s</VM_MAD>%s' % (self.gds_encode(self.gds_format_string(quote_xml(self.VM_MAD), input_name='VM_MAD')), eol_))
+        if self.LAST_MON_TIME is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<LAST_MON_TIME>%s</LAST_MON_TIME>%s' % (self.gds_format_integer(self.LAST_MON_TIME, input_name='LAST_MON_TIME'), eol_))
+        if self.CLUSTER_ID is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<CLUSTER_ID>%s</CLUSTER_ID>%s' % (self.gds_format_integer(self.CLUSTER_ID, input_name='CLUSTER_ID'), eol_))
+        if self.CLUSTER is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<CLUSTER>%s</CLUSTER>%s' % (self.gds_encode(self.gds_format_string(quote_xml(self.CLUSTER), input_name='CLUSTER')), eol_))
+        if self.HOST_SHARE is not None:
+            self.HOST_SHARE.export(outfile, level, namespaceprefix_, name_='HOST_SHARE', pretty_print=pretty_print)
+        if self.VMS is not None:
+            self.VMS.export(outfile, level, namespaceprefix_, name_='VMS', pretty_print=pretty_print)
+        if self.TEMPLATE is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<TEMPLATE>%s</TEMPLATE>%s' % (self.gds_encode(self.gds_format_string(quote_xml(self.TEMPLATE), input_name='TEMPLATE')), eol_))
+    def build(self, node):
+        already_processed = set()
+        self.buildAttributes(node, node.attrib, already_processed)
+        for child in node:
+            nodeName_ = Tag_pattern_.match(child.tag).groups()[-1]
+            self.buildChildren(child, node, nodeName_)
+        return self
+    def buildAttributes(self, node, attrs, already_processed):
+        pass
+    def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
+        if nodeName_ == 'ID' and child_.text:
+            sval_ = child_.text
+            try:
+                ival_ = int(sval_)
+            except (TypeError, ValueError) as exp:
+                raise_parse_error(child_, 'requires integer: %s' % exp)
+            ival_ = self.gds_validate_integer(ival_, node, 'ID')
+            self.ID = ival_
+        elif nodeName_ == 'NAME':
+            NAME_ = child_.text
+            NAME_ = self.gds_validate_string(NAME_, node, 'NAME')
+            self.NAME = NAME_
+        elif nodeName_ == 'STATE' and child_.text:
+            sval_ = child_.text
+            try:
+                ival_ = int(sval_)
+            except (TypeError, ValueError) as exp:
+                raise_parse_error(child_, 'requires integer: %s' % exp)
+            ival_ = self.gds_validate_integer(ival_, node, 'STATE')
+            self.STATE = ival_
+        elif nodeName_ == 'IM_MAD':
+            IM_MAD_ = child_.text
+            IM_MAD_ = self.gds_validate_string(IM_MAD_, node, 'IM_MAD')
+            self.IM_MAD = IM_MAD_
+        elif nodeName_ == 'VM_MAD':
+            VM_MAD_ = child_.text
+            VM_MAD_ = self.gds_validate_string(VM_MAD_, node, 'VM_MAD')
+            self.VM_MAD = VM_MAD_
+        elif nodeName_ == 'LAST_MON_TIME' and child_.text:
+            sval_ = child_.text
+            try:
+                ival_ = int(sval_)
+            except (TypeError, ValueError) as exp:
+                raise_parse_error(child_, 'requires integer: %s' % exp)
+            ival_ = self.gds_validate_integer(ival_, node, 'LAST_MON_TIME')
+            self.LAST_MON_TIME = ival_
+        elif nodeName_ == 'CLUSTER_ID' and child_.text:
+            sval_ = child_.text
+            try:
+                ival_ = int(sval_)
+            except (TypeError, ValueError) as exp:
+                raise_parse_error(child_, 'requires integer: %s' % exp)
+            ival_ = self.gds_validate_integer(ival_, node, 'CLUSTER_ID')
+            self.CLUSTER_ID = ival_
+        elif nodeName_ == 'CLUSTER':
+            CLUSTER_ = child_.text
+            CLUSTER_ = self.gds_validate_string(CLUSTER_, node, 'CLUSTER')
+            self.CLUSTER = CLUSTER_
+        elif nodeName_ == 'HOST_SHARE':
+            obj_ = HOST_SHAREType.factory()
+            obj_.build(child_)
+            self.HOST_SHARE = obj_
+            obj_.original_tagname_ = 'HOST_SHARE'
+        elif nodeName_ == 'VMS':
+            obj_ = VMSType.factory()
+            obj_.build(child_)
+            self.VMS = obj_
+            obj_.original_tagname_ = 'VMS'
+        elif nodeName_ == 'TEMPLATE':
+            TEMPLATE_ = child_.text
+            TEMPLATE_ = self.gds_validate_string(TEMPLATE_, node, 'TEMPLATE')
+            self.TEMPLATE = TEMPLATE_
+# end class HOST
+
+
+class HOST_SHAREType(GeneratedsSuper):
+    subclass = None
+    superclass = None
+    def __init__(self, DISK_USAGE=None, MEM_USAGE=None, CPU_USAGE=None, TOTAL_MEM=None, TOTAL_CPU=None, MAX_DISK=None, MAX_MEM=None, MAX_CPU=None, FREE_DISK=None, FREE_MEM=None, FREE_CPU=None, USED_DISK=None, USED_MEM=None, USED_CPU=None, RUNNING_VMS=None, DATASTORES=None, PCI_DEVICES=None):
+        self.original_tagname_ = None
+        self.DISK_USAGE = DISK_USAGE
+        self.MEM_USAGE = MEM_USAGE
+        self.CPU_USAGE = CPU_USAGE
+        self.TOTAL_MEM = TOTAL_MEM
+        self.TOTAL_CPU = TOTAL_CPU
+        self.MAX_DISK = MAX_DISK
+        self.MAX_MEM = MAX_MEM
+        self.MAX_CPU = MAX_CPU
+        self.FREE_DISK = FREE_DISK
+        self.FREE_MEM = FREE_MEM
+        self.FREE_CPU = FREE_CPU
+        self.USED_DISK = USED_DISK
+        self.USED_MEM = USED_MEM
+        self.USED_CPU = USED_CPU
+        self.RUNNING_VMS = RUNNING_VMS
+        self.DATASTORES = DATASTORES
+        self.PCI_DEVICES = PCI_DEVICES
+    def factory(*args_, **kwargs_):
+        if supermod.CurrentSubclassModule_ is not None:
+            subclass = getSubclassFromModule_(
+                supermod.CurrentSubclassModule_, HOST_SHAREType)
+            if subclass is not None:
+                return subclass(*args_, **kwargs_)
+        if HOST_SHAREType.subclass:
+            return HOST_SHAREType.subclass(*args_, **kwargs_)
+        else:
+            return HOST_SHAREType(*args_, **kwargs_)
+    factory = staticmethod(factory)
+    def get_DISK_USAGE(self): return self.DISK_USAGE
+    def set_DISK_USAGE(self, DISK_USAGE): self.DISK_USAGE = DISK_USAGE
+    def get_MEM_USAGE(self): return self.MEM_USAGE
+    def set_MEM_USAGE(self, MEM_USAGE): self.MEM_USAGE = MEM_USAGE
+    def get_CPU_USAGE(self): return self.CPU_USAGE
+    def set_CPU_USAGE(self, CPU_USAGE): self.CPU_USAGE = CPU_USAGE
+    def get_TOTAL_MEM(self): return self.TOTAL_MEM
+    def set_TOTAL_MEM(self, TOTAL_MEM): self.TOTAL_MEM = TOTAL_MEM
+    def get_TOTAL_CPU(self): return self.TOTAL_CPU
+    def set_TOTAL_CPU(self, TOTAL_CPU): self.TOTAL_CPU = TOTAL_CPU
+    def get_MAX_DISK(self): return self.MAX_DISK
+    def set_MAX_DISK(self, MAX_DISK): self.MAX_DISK = MAX_DISK
+    def get_MAX_MEM(self): return self.MAX_MEM
+    def set_MAX_MEM(self, MAX_MEM): self.MAX_MEM = MAX_MEM
+    def get_MAX_CPU(self): return self.MAX_CPU
+    def set_MAX_CPU(self, MAX_CPU): self.MAX_CPU = MAX_CPU
+    def get_FREE_DISK(self): return self.FREE_DISK
+    def set_FREE_DISK(self, FREE_DISK): self.FREE_DISK = FREE_DISK
+    def get_FREE_MEM(self): return self.FREE_MEM
+    def set_FREE_MEM(self, FREE_MEM): self.FREE_MEM = FREE_MEM
+    def get_FREE_CPU(self): return self.FREE_CPU
+    def set_FREE_CPU(self, FREE_CPU): self.FREE_CPU = FREE_CPU
+    def get_USED_DISK(self): return self.USED_DISK
+    def set_USED_DISK(self, USED_DISK): self.USED_DISK = USED_DISK
+    def get_USED_MEM(self): return self.USED_MEM
+    def set_USED_MEM(self, USED_MEM): self.USED_MEM = USED_MEM
+    def get_USED_CPU(self): return self.USED_CPU
+    def set_USED_CPU(self, USED_CPU): self.USED_CPU = USED_CPU
+    def get_RUNNING_VMS(self): return self.RUNNING_VMS
+    def set_RUNNING_VMS(self, RUNNING_VMS): self.RUNNING_VMS = RUNNING_VMS
+    def get_DATASTORES(self): return self.DATASTORES
+    def set_DATASTORES(self, DATASTORES): self.DATASTORES = DATASTORES
+    def get_PCI_DEVICES(self): return self.PCI_DEVICES
+    def set_PCI_DEVICES(self, PCI_DEVICES): self.PCI_DEVICES = PCI_DEVICES
+    def hasContent_(self):
+        if (
+            self.DISK_USAGE is not None or
+            self.MEM_USAGE is not None or
+            self.CPU_USAGE is not None or
+            self.TOTAL_MEM is not None or
+            self.TOTAL_CPU is not None or
+            self.MAX_DISK is not None or
+            self.MAX_MEM is not None or
+            self.MAX_CPU is not None or
+            self.FREE_DISK is not None or
+            self.FREE_MEM is not None or
+            self.FREE_CPU is not None or
+            self.USED_DISK is not None or
+            self.USED_MEM is not None or
+            self.USED_CPU is not None or
+            self.RUNNING_VMS is not None or
+            self.DATASTORES is not None or
+            self.PCI_DEVICES is not None
+        ):
+            return True
+        else:
+            return False
+    def export(self, outfile, level, namespaceprefix_='', name_='HOST_SHAREType', namespacedef_='', pretty_print=True):
+        imported_ns_def_ = GenerateDSNamespaceDefs_.get('HOST_SHAREType')
+        if imported_ns_def_ is not None:
+            namespacedef_ = imported_ns_def_
+        if pretty_print:
+            eol_ = '\n'
+        else:
+            eol_ = ''
+        if self.original_tagname_ is not None:
+            name_ = self.original_tagname_
+        showIndent(outfile, level, pretty_print)
+        outfile.write('<%s%s%s' % (namespaceprefix_, name_, namespacedef_ and ' ' + namespacedef_ or '', ))
+        already_processed = set()
+        self.exportAttributes(outfile, level, already_processed, namespaceprefix_, name_='HOST_SHAREType')
+        if self.hasContent_():
+            outfile.write('>%s' % (eol_, ))
+            self.exportChildren(outfile, level + 1, namespaceprefix_='', name_='HOST_SHAREType', pretty_print=pretty_print)
+            showIndent(outfile, level, pretty_print)
+            outfile.write('</%s%s>%s' % (namespaceprefix_, name_, eol_))
+        else:
+            outfile.write('/>%s' % (eol_, ))
+    def exportAttributes(self, outfile, level, already_processed, namespaceprefix_='', name_='HOST_SHAREType'):
+        pass
+    def exportChildren(self, outfile, level, namespaceprefix_='', name_='HOST_SHAREType', fromsubclass_=False, pretty_print=True):
+        if pretty_print:
+            eol_ = '\n'
+        else:
+            eol_ = ''
+        if self.DISK_USAGE is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<DISK_USAGE>%s</DISK_USAGE>%s' % (self.gds_format_integer(self.DISK_USAGE, input_name='DISK_USAGE'), eol_))
+        if self.MEM_USAGE is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<MEM_USAGE>%s</MEM_USAGE>%s' % (self.gds_format_integer(self.MEM_USAGE, input_name='MEM_USAGE'), eol_))
+        if self.CPU_USAGE is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<CPU_USAGE>%s</CPU_USAGE>%s' % (self.gds_format_integer(self.CPU_USAGE, input_name='CPU_USAGE'), eol_))
+        if self.TOTAL_MEM is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<TOTAL_MEM>%s</TOTAL_MEM>%s' % (self.gds_format_integer(self.TOTAL_MEM, input_name='TOTAL_MEM'), eol_))
+        if self.TOTAL_CPU is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<TOTAL_CPU>%s</TOTAL_CPU>%s' % (self.gds_format_integer(self.TOTAL_CPU, input_name='TOTAL_CPU'), eol_))
+        if self.MAX_DISK is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<MAX_DISK>%s</MAX_DISK>%s' % (self.gds_format_integer(self.MAX_DISK, input_name='MAX_DISK'), eol_))
+        if self.MAX_MEM is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<MAX_MEM>%s</MAX_MEM>%s' % (self.gds_format_integer(self.MAX_MEM, input_name='MAX_MEM'), eol_))
+        if self.MAX_CPU is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<MAX_CPU>%s</MAX_CPU>%s' % (self.gds_format_integer(self.MAX_CPU, input_name='MAX_CPU'), eol_))
+        if self.FREE_DISK is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<FREE_DISK>%s</FREE_DISK>%s' % (self.gds_format_integer(self.FREE_DISK, input_name='FREE_DISK'), eol_))
+        if self.FREE_MEM is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<FREE_MEM>%s</FREE_MEM>%s' % (self.gds_format_integer(self.FREE_MEM, input_name='FREE_MEM'), eol_))
+        if self.FREE_CPU is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<FREE_CPU>%s</FREE_CPU>%s' % (self.gds_format_integer(self.FREE_CPU, input_name='FREE_CPU'), eol_))
+        if self.USED_DISK is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<USED_DISK>%s</USED_DISK>%s' % (self.gds_format_integer(self.USED_DISK, input_name='USED_DISK'), eol_))
+        if self.USED_MEM is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<USED_MEM>%s</USED_MEM>%s' % (self.gds_format_integer(self.USED_MEM, input_name='USED_MEM'), eol_))
+        if self.USED_CPU is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<USED_CPU>%s</USED_CPU>%s' % (self.gds_format_integer(self.USED_CPU, input_name='USED_CPU'), eol_))
+        if self.RUNNING_VMS is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<RUNNING_VMS>%s</RUNNING_VMS>%s' % (self.gds_format_integer(self.RUNNING_VMS, input_name='RUNNING_VMS'), eol_))
+        if self.DATASTORES is not None:
+            self.DATASTORES.export(outfile, level, namespaceprefix_, name_='DATASTORES', pretty_print=pretty_print)
+        if self.PCI_DEVICES is not None:
+            self.PCI_DEVICES.export(outfile, level, namespaceprefix_, name_='PCI_DEVICES', pretty_print=pretty_print)
+    def build(self, node):
+        already_processed = set()
+        self.buildAttributes(node, node.attrib, already_processed)
+        for child in node:
+            nodeName_ = Tag_pattern_.match(child.tag).groups()[-1]
+            self.buildChildren(child, node, nodeName_)
+        return self
+    def buildAttributes(self, node, attrs, already_processed):
+        pass
+    def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
+        if nodeName_ == 'DISK_USAGE' and child_.text:
+            sval_ = child_.text
+            try:
+                ival_ = int(sval_)
+            except (TypeError, ValueError) as exp:
+                raise_parse_error(child_, 'requires integer: %s' % exp)
+            ival_ = self.gds_validate_integer(ival_, node, 'DISK_USAGE')
+            self.DISK_USAGE = ival_
+        elif nodeName_ == 'MEM_USAGE' and child_.text:
+            sval_ = child_.text
+            try:
+                ival_ = int(sval_)
+            except (TypeError, ValueError) as exp:
+                raise_parse_error(child_, 'requires integer: %s' % exp)
+            ival_ = self.gds_validate_integer(ival_, node, 'MEM_USAGE')
+            self.MEM_USAGE = ival_
+        elif nodeName_ == 'CPU_USAGE' and child_.text:
+            sval_ = child_.text
+            try:
+                ival_ = int(sval_)
+            except (TypeError, ValueError) as exp:
+                raise_parse_error(child_, 'requires integer: %s' % exp)
+            ival_ = self.gds_validate_integer(ival_, node, 'CPU_USAGE')
+            self.CPU_USAGE = ival_
+        elif nodeName_ == 'TOTAL_MEM' and child_.text:
+            sval_ = child_.text
+            try:
+                ival_ = int(sval_)
+            except (TypeError, ValueError) as exp:
+                raise_parse_error(child_, 'requires integer: %s' % exp)
+            ival_ = self.gds_validate_integer(ival_, node, 'TOTAL_MEM')
+            self.TOTAL_MEM = ival_
+        elif nodeName_ == 'TOTAL_CPU' and child_.text:
+            sval_ = child_.text
+            try:
+                ival_ = int(sval_)
+            except (TypeError, ValueError) as exp:
+                raise_parse_error(child_, 'requires integer: %s' % exp)
+            ival_ = self.gds_validate_integer(ival_, node, 'TOTAL_CPU')
+            self.TOTAL_CPU = ival_
+        elif nodeName_ == 'MAX_DISK' and child_.text:
+            sval_ = child_.text
+            try:
+                ival_ = int(sval_)
+            except (TypeError, ValueError) as exp:
+                raise_parse_error(child_, 'requires integer: %s' % exp)
+            ival_ = self.gds_validate_integer(ival_, node, 'MAX_DISK')
+            self.MAX_DISK = ival_
+        elif nodeName_ == 'MAX_MEM' and child_.text:
+            sval_ = child_.text
+            try:
+                ival_ = int(sval_)
+            except (TypeError, ValueError) as exp:
+                raise_parse_error(child_, 'requires integer: %s' % exp)
+            ival_ = self.gds_validate_integer(ival_, node, 'MAX_MEM')
+            self.MAX_MEM = ival_
+        elif nodeName_ == 'MAX_CPU' and child_.text:
+            sval_ = child_.text
+            try:
+                ival_ = int(sval_)
+            except (TypeError, ValueError) as exp:
+                raise_parse_error(child_, 'requires integer: %s' % exp)
+            ival_ = self.gds_validate_integer(ival_, node, 'MAX_CPU')
+            self.MAX_CPU = ival_
+        elif nodeName_ == 'FREE_DISK' and child_.text:
+            sval_ = child_.text
+            try:
+                ival_ = int(sval_)
+            except (TypeError, ValueError) as exp:
+                raise_parse_error(child_, 'requires integer: %s' % exp)
+            ival_ = self.gds_validate_integer(ival_, node, 'FREE_DISK')
+            self.FREE_DISK = ival_
+        elif nodeName_ == 'FREE_MEM' and child_.text:
+            sval_ = child_.text
+            try:
+                ival_ = int(sval_)
+            except (TypeError, ValueError) as exp:
+                raise_parse_error(child_, 'requires integer: %s' % exp)
+            ival_ = self.gds_validate_integer(ival_, node, 'FREE_MEM')
+            self.FREE_MEM = ival_
+        elif nodeName_ == 'FREE_CPU' and child_.text:
+            sval_ = child_.text
+            try:
+                ival_ = int(sval_)
+            except (TypeError, ValueError) as exp:
+                raise_parse_error(child_, 'requires integer: %s' % exp)
+            ival_ = self.gds_validate_integer(ival_, node, 'FREE_CPU')
+            self.FREE_CPU = ival_
+        elif nodeName_ == 'USED_DISK' and child_.text:
+            sval_ = child_.text
+            try:
+                ival_ = int(sval_)
+            except (TypeError, ValueError) as exp:
+                raise_parse_error(child_, 'requires integer: %s' % exp)
+            ival_ = self.gds_validate_integer(ival_, node, 'USED_DISK')
+            self.USED_DISK = ival_
+        elif nodeName_ == 'USED_MEM' and child_.text:
+            sval_ = child_.text
+            try:
+                ival_ = int(sval_)
+            except (TypeError, ValueError) as exp:
+                raise_parse_error(child_, 'requires integer: %s' % exp)
+            ival_ = self.gds_validate_integer(ival_, node, 'USED_MEM')
+            self.USED_MEM = ival_
+        elif nodeName_ == 'USED_CPU' and child_.text:
+            sval_ = child_.text
+            try:
+                ival_ = int(sval_)
+            except (TypeError, ValueError) as exp:
+                raise_parse_error(child_, 'requires integer: %s' % exp)
+            ival_ = self.gds_validate_integer(ival_, node, 'USED_CPU')
+            self.USED_CPU = ival_
+        elif nodeName_ == 'RUNNING_VMS' and child_.text:
+            sval_ = child_.text
+            try:
+                ival_ = int(sval_)
+            except (TypeError, ValueError) as exp:
+                raise_parse_error(child_, 'requires integer: %s' % exp)
+            ival_ = self.gds_validate_integer(ival_, node, 'RUNNING_VMS')
+            self.RUNNING_VMS = ival_
+        elif nodeName_ == 'DATASTORES':
+            obj_ = DATASTORESType30.factory()
+            obj_.build(child_)
+            self.DATASTORES = obj_
+            obj_.original_tagname_ = 'DATASTORES'
+        elif nodeName_ == 'PCI_DEVICES':
+            obj_ = PCI_DEVICESType.factory()
+            obj_.build(child_)
+            self.PCI_DEVICES = obj_
+            obj_.original_tagname_ = 'PCI_DEVICES'
+# end class HOST_SHAREType
+
+
+class DATASTORESType30(GeneratedsSuper):
+    subclass = None
+    superclass = None
+    def __init__(self, DS=None):
+        self.original_tagname_ = None
+        if DS is None:
+            self.DS = []
+        else:
+            self.DS = DS
+    def factory(*args_, **kwargs_):
+        if supermod.CurrentSubclassModule_ is not None:
+            subclass = getSubclassFromModule_(
+                supermod.CurrentSubclassModule_, DATASTORESType30)
+            if subclass is not None:
+                return subclass(*args_, **kwargs_)
+        if DATASTORESType30.subclass:
+            return DATASTORESType30.subclass(*args_, **kwargs_)
+        else:
+            return DATASTORESType30(*args_, **kwargs_)
+    factory = staticmethod(factory)
+    def get_DS(self): return self.DS
+    def set_DS(self, DS): self.DS = DS
+    def add_DS(self, value): self.DS.append(value)
+    def insert_DS_at(self, index, value): self.DS.insert(index, value)
+    def replace_DS_at(self, index, value): self.DS[index] = value
+    def hasContent_(self):
+        if (
+            self.DS
+        ):
+            return True
+        else:
+            return False
+    def export(self, outfile, level, namespaceprefix_='', name_='DATASTORESType30', namespacedef_='', pretty_print=True):
+        imported_ns_def_ = GenerateDSNamespaceDefs_.get('DATASTORESType30')
+        if imported_ns_def_ is not None:
+            namespacedef_ = imported_ns_def_
+        if pretty_print:
+            eol_ = '\n'
+        else:
+            eol_ = ''
+        if self.original_tagname_ is not None:
+            name_ = self.original_tagname_
+        showIndent(outfile, level, pretty_print)
+        outfile.write('<%s%s%s' % (namespaceprefix_, name_, namespacedef_ and ' ' + namespacedef_ or '', ))
+        already_processed = set()
+        self.exportAttributes(outfile, level, already_processed, namespaceprefix_, name_='DATASTORESType30')
+        if self.hasContent_():
+            outfile.write('>%s' % (eol_, ))
+            self.exportChildren(outfile, level + 1, namespaceprefix_='', name_='DATASTORESType30', pretty_print=pretty_print)
+            showIndent(outfile, level, pretty_print)
+            outfile.write('</%s%s>%s' % (namespaceprefix_, name_, eol_))
+        else:
+            outfile.write('/>%s' % (eol_, ))
+    def exportAttributes(self, outfile, level, already_processed, namespaceprefix_='', name_='DATASTORESType30'):
+        pass
+    def exportChildren(self, outfile, level, namespaceprefix_='', name_='DATASTORESType30', fromsubclass_=False, pretty_print=True):
+        if pretty_print:
+            eol_ = '\n'
+        else:
+            eol_ = ''
+        for DS_ in self.DS:
+            DS_.export(outfile, level, namespaceprefix_, name_='DS', pretty_print=pretty_print)
+    def build(self, node):
+        already_processed = set()
+        self.buildAttributes(node, node.attrib, already_processed)
+        for child in node:
+            nodeName_ = Tag_pattern_.match(child.tag).groups()[-1]
+            self.buildChildren(child, node, nodeName_)
+        return self
+    def buildAttributes(self, node, attrs, already_processed):
+        pass
+    def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
+        if nodeName_ == 'DS':
+            obj_ = DSType.factory()
+            obj_.build(child_)
+            self.DS.append(obj_)
+            obj_.original_tagname_ = 'DS'
+# end class DATASTORESType30
+
+
+class DSType(GeneratedsSuper):
+    subclass = None
+    superclass = None
+    def __init__(self, ID=None, FREE_MB=None, TOTAL_MB=None, USED_MB=None):
+        self.original_tagname_ = None
+        self.ID = ID
+        self.FREE_MB = FREE_MB
+        self.TOTAL_MB = TOTAL_MB
+        self.USED_MB = USED_MB
+    def factory(*args_, **kwargs_):
+        if supermod.CurrentSubclassModule_ is not None:
+            subclass = getSubclassFromModule_(
+                supermod.CurrentSubclassModule_, DSType)
+            if subclass is not None:
+                return subclass(*args_, **kwargs_)
+        if DSType.subclass:
+            return DSType.subclass(*args_, **kwargs_)
+        else:
+            return DSType(*args_, **kwargs_)
+    factory = staticmethod(factory)
+    def get_ID(self): return self.ID
+    def set_ID(self, ID): self.ID = ID
+    def get_FREE_MB(self): return self.FREE_MB
+    def set_FREE_MB(self, FREE_MB): self.FREE_MB = FREE_MB
+    def get_TOTAL_MB(self): return self.TOTAL_MB
+    def set_TOTAL_MB(self, TOTAL_MB): self.TOTAL_MB = TOTAL_MB
+    def get_USED_MB(self): return self.USED_MB
+    def set_USED_MB(self, USED_MB): self.USED_MB = USED_MB
+    def hasContent_(self):
+        if (
+            self.ID is not None or
+            self.FREE_MB is not None or
+            self.TOTAL_MB is not None or
+            self.USED_MB is not None
+        ):
+            return True
+        else:
+            return False
+    def export(self, outfile, level, namespaceprefix_='', name_='DSType', namespacedef_='', pretty_print=True):
+        imported_ns_def_ = GenerateDSNamespaceDefs_.get('DSType')
+        if imported_ns_def_ is not None:
+            namespacedef_ = imported_ns_def_
+        if pretty_print:
+            eol_ = '\n'
+        else:
+            eol_ = ''
+        if self.original_tagname_ is not None:
+            name_ = self.original_tagname_
+        showIndent(outfile, level, pretty_print)
+        outfile.write('<%s%s%s' % (namespaceprefix_, name_, namespacedef_ and ' ' + namespacedef_ or '', ))
+        already_processed = set()
+        self.exportAttributes(outfile, level, already_processed, namespaceprefix_, name_='DSType')
+        if self.hasContent_():
+            outfile.write('>%s' % (eol_, ))
+            self.exportChildren(outfile, level + 1, namespaceprefix_='', name_='DSType', pretty_print=pretty_print)
+            showIndent(outfile, level, pretty_print)
+            outfile.write('</%s%s>%s' % (namespaceprefix_, name_, eol_))
+        else:
+            outfile.write('/>%s' % (eol_, ))
+    def exportAttributes(self, outfile, level, already_processed, namespaceprefix_='', name_='DSType'):
+        pass
+    def exportChildren(self, outfile, level, namespaceprefix_='', name_='DSType', fromsubclass_=False, pretty_print=True):
+        if pretty_print:
+            eol_ = '\n'
+        else:
+            eol_ = ''
+        if self.ID is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<ID>%s</ID>%s' % (self.gds_format_integer(self.ID, input_name='ID'), eol_))
+        if self.FREE_MB is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<FREE_MB>%s</FREE_MB>%s' % (self.gds_format_integer(self.FREE_MB, input_name='FREE_MB'), eol_))
+        if self.TOTAL_MB is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<TOTAL_MB>%s</TOTAL_MB>%s' % (self.gds_format_integer(self.TOTAL_MB, input_name='TOTAL_MB'), eol_))
+        if self.USED_MB is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<USED_MB>%s</USED_MB>%s' % (self.gds_format_integer(self.USED_MB, input_name='USED_MB'), eol_))
+    def build(self, node):
+        already_processed = set()
+        self.buildAttributes(node, node.attrib, already_processed)
+        for child in node:
+            nodeName_ = Tag_pattern_.match(child.tag).groups()[-1]
+            self.buildChildren(child, node, nodeName_)
+        return self
+    def buildAttributes(self, node, attrs, already_processed):
+        pass
+    def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
+        if nodeName_ == 'ID' and child_.text:
+            sval_ = child_.text
+            try:
+                ival_ = int(sval_)
+            except (TypeError, ValueError) as exp:
+                raise_parse_error(child_, 'requires integer: %s' % exp)
+            ival_ = self.gds_validate_integer(ival_, node, 'ID')
+            self.ID = ival_
+        elif nodeName_ == 'FREE_MB' and child_.text:
+            sval_ = child_.text
+            try:
+                ival_ = int(sval_)
+            except (TypeError, ValueError) as exp:
+                raise_parse_error(child_, 'requires integer: %s' % exp)
+            ival_ = self.gds_validate_integer(ival_, node, 'FREE_MB')
+            self.FREE_MB = ival_
+        elif nodeName_ == 'TOTAL_MB' and child_.text:
+            sval_ = child_.text
+            try:
+                ival_ = int(sval_)
+            except (TypeError, ValueError) as exp:
+                raise_parse_error(child_, 'requires integer: %s' % exp)
+            ival_ = self.gds_validate_integer(ival_, node, 'TOTAL_MB')
+            self.TOTAL_MB = ival_
+        elif nodeName_ == 'USED_MB' and child_.text:
+            sval_ = child_.text
+            try:
+                ival_ = int(sval_)
+            except (TypeError, ValueError) as exp:
+                raise_parse_error(child_, 'requires integer: %s' % exp)
+            ival_ = self.gds_validate_integer(ival_, node, 'USED_MB')
+            self.USED_MB = ival_
+# end class DSType
+
+
+class PCI_DEVICESType(GeneratedsSuper):
+    subclass = None
+    superclass = None
+    def __init__(self, PCI=None):
+        self.original_tagname_ = None
+        if PCI is None:
+            self.PCI = []
+        else:
+            self.PCI = PCI
+    def factory(*args_, **kwargs_):
+        if supermod.CurrentSubclassModule_ is not None:
+            subclass = getSubclassFromModule_(
+                supermod.CurrentSubclassModule_, PCI_DEVICESType)
+            if subclass is not None:
+                return subclass(*args_, **kwargs_)
+        if PCI_DEVICESType.subclass:
+            return PCI_DEVICESType.subclass(*args_, **kwargs_)
+        else:
+            return PCI_DEVICESType(*args_, **kwargs_)
+    factory = staticmethod(factory)
+    def get_PCI(self): return self.PCI
+    def set_PCI(self, PCI): self.PCI = PCI
+    def add_PCI(self, value): self.PCI.append(value)
+    def insert_PCI_at(self, index, value): self.PCI.insert(index, value)
+    def replace_PCI_at(self, index, value): self.PCI[index] = value
+    def hasContent_(self):
+        if (
+            self.PCI
+        ):
+            return True
+        else:
+            return False
+    def export(self, outfile, level, namespaceprefix_='', name_='PCI_DEVICESType', namespacedef_='', pretty_print=True):
+        imported_ns_def_ = GenerateDSNamespaceDefs_.get('PCI_DEVICESType')
+        if imported_ns_def_ is not None:
+            namespacedef_ = imported_ns_def_
+        if pretty_print:
+            eol_ = '\n'
+        else:
+            eol_ = ''
+        if self.original_tagname_ is not None:
+            name_ = self.original_tagname_
+        showIndent(outfile, level, pretty_print)
+        outfile.write('<%s%s%s' % (namespaceprefix_, name_, namespacedef_ and ' ' + namespacedef_ or '', ))
+        already_processed = set()
+        self.exportAttributes(outfile, level, already_processed, namespaceprefix_, name_='PCI_DEVICESType')
+        if self.hasContent_():
+            outfile.write('>%s' % (eol_, ))
+            self.exportChildren(outfile, level + 1, namespaceprefix_='', name_='PCI_DEVICESType', pretty_print=pretty_print)
+            showIndent(outfile, level, pretty_print)
+            outfile.write('</%s%s>%s' % (namespaceprefix_, name_, eol_))
+        else:
+            outfile.write('/>%s' % (eol_, ))
+    def exportAttributes(self, outfile, level, already_processed, namespaceprefix_='', name_='PCI_DEVICESType'):
+        pass
+    def exportChildren(self, outfile, level, namespaceprefix_='', name_='PCI_DEVICESType', fromsubclass_=False, pretty_print=True):
+        if pretty_print:
+            eol_ = '\n'
+        else:
+            eol_ = ''
+        for PCI_ in self.PCI:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<PCI>%s</PCI>%s' % (self.gds_encode(self.gds_format_string(quote_xml(PCI_), input_name='PCI')), eol_))
+    def build(self, node):
+        already_processed = set()
+        self.buildAttributes(node, node.attrib, already_processed)
+        for child in node:
+            nodeName_ = Tag_pattern_.match(child.tag).groups()[-1]
+            self.buildChildren(child, node, nodeName_)
+        return self
+    def buildAttributes(self, node, attrs, already_processed):
+        pass
+    def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
+        if nodeName_ == 'PCI':
+            PCI_ = child_.text
+            PCI_ = self.gds_validate_string(PCI_, node, 'PCI')
+            self.PCI.append(PCI_)
+# end class PCI_DEVICESType
+
+
+class VMSType(GeneratedsSuper):
+    subclass = None
+    superclass = None
+    def __init__(self, ID=None):
+        self.original_tagname_ = None
+        if ID is None:
+            self.ID = []
+        else:
+            self.ID = ID
+    def factory(*args_, **kwargs_):
+        if supermod.CurrentSubclassModule_ is not None:
+            subclass = getSubclassFromModule_(
+                supermod.CurrentSubclassModule_, VMSType)
+            if subclass is not None:
+                return subclass(*args_, **kwargs_)
+        if VMSType.subclass:
+            return VMSType.subclass(*args_, **kwargs_)
+        else:
+            return VMSType(*args_, **kwargs_)
+    factory = staticmethod(factory)
+    def get_ID(self): return self.ID
+    def set_ID(self, ID): self.ID = ID
+    def add_ID(self, value): self.ID.append(value)
+    def insert_ID_at(self, index, value): self.ID.insert(index, value)
+    def replace_ID_at(self, index, value): self.ID[index] = value
+    def hasContent_(self):
+        if (
+            self.ID
+        ):
+            return True
+        else:
+            return False
+    def export(self, outfile, level, namespaceprefix_='', name_='VMSType', namespacedef_='', pretty_print=True):
+        imported_ns_def_ = GenerateDSNamespaceDefs_.get('VMSType')
+        if imported_ns_def_ is not None:
+            namespacedef_ = imported_ns_def_
+        if pretty_print:
+            eol_ = '\n'
+        else:
+            eol_ = ''
+        if self.original_tagname_ is not None:
+            name_ = self.original_tagname_
+        showIndent(outfile, level, pretty_print)
+        outfile.write('<%s%s%s' % (namespaceprefix_, name_, namespacedef_ and ' ' + namespacedef_ or '', ))
+        already_processed = set()
+        self.exportAttributes(outfile, level, already_processed, namespaceprefix_, name_='VMSType')
+        if self.hasContent_():
+            outfile.write('>%s' % (eol_, ))
+            self.exportChildren(outfile, level + 1, namespaceprefix_='', name_='VMSType', pretty_print=pretty_print)
+            showIndent(outfile, level, pretty_print)
+            outfile.write('</%s%s>%s' % (namespaceprefix_, name_, eol_))
+        else:
+            outfile.write('/>%s' % (eol_, ))
+    def exportAttributes(self, outfile, level, already_processed, namespaceprefix_='', name_='VMSType'):
+        pass
+    def exportChildren(self, outfile, level, namespaceprefix_='', name_='VMSType', fromsubclass_=False, pretty_print=True):
+        if pretty_print:
+            eol_ = '\n'
+        else:
+            eol_ = ''
+        for ID_ in self.ID:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<ID>%s</ID>%s' % (self.gds_format_integer(ID_, input_name='ID'), eol_))
+    def build(self, node):
+        already_processed = set()
+        self.buildAttributes(node, node.attrib, already_processed)
+        for child in node:
+            nodeName_ = Tag_pattern_.match(child.tag).groups()[-1]
+            self.buildChildren(child, node, nodeName_)
+        return self
+    def buildAttributes(self, node, attrs, already_processed):
+        pass
+    def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
+        if nodeName_ == 'ID' and child_.text:
+            sval_ = child_.text
+            try:
+                ival_ = int(sval_)
+            except (TypeError, ValueError) as exp:
+                raise_parse_error(child_, 'requires integer: %s' % exp)
+            ival_ = self.gds_validate_integer(ival_, node, 'ID')
+            self.ID.append(ival_)
+# end class VMSType
+
+
+class HOST_POOLSub(TemplatedType, HOST_POOL):
+    def __init__(self, HOST=None):
+        super(HOST_POOLSub, self).__init__(HOST, )
+HOST_POOL.subclass = HOST_POOLSub
+# end class HOST_POOLSub
+
+
+class HOSTSub(TemplatedType, HOST):
+    def __init__(self, ID=None, NAME=None, STATE=None, IM_MAD=None, VM_MAD=None, LAST_MON_TIME=None, CLUSTER_ID=None, CLUSTER=None, HOST_SHARE=None, VMS=None, TEMPLATE=None):
+        super(HOSTSub, self).__init__(ID, NAME, STATE, IM_MAD, VM_MAD, LAST_MON_TIME, CLUSTER_ID, CLUSTER, HOST_SHARE, VMS, TEMPLATE, )
+HOST.subclass = HOSTSub
+# end class HOSTSub
+
+
+class HOST_SHARETypeSub(TemplatedType, HOST_SHAREType):
+    def __init__(self, DISK_USAGE=None, MEM_USAGE=None, CPU_USAGE=None, TOTAL_MEM=None, TOTAL_CPU=None, MAX_DISK=None, MAX_MEM=None, MAX_CPU=None, FREE_DISK=None, FREE_MEM=None, FREE_CPU=None, USED_DISK=None, USED_MEM=None, USED_CPU=None, RUNNING_VMS=None, DATASTORES=None, PCI_DEVICES=None):
+        super(HOST_SHARETypeSub, self).__init__(DISK_USAGE, MEM_USAGE, CPU_USAGE, TOTAL_MEM, TOTAL_CPU, MAX_DISK, MAX_MEM, MAX_CPU, FREE_DISK, FREE_MEM, FREE_CPU, USED_DISK, USED_MEM, USED_CPU, RUNNING_VMS, DATASTORES, PCI_DEVICES, )
+HOST_SHAREType.subclass = HOST_SHARETypeSub
+# end class HOST_SHARETypeSub
+
+
+class DATASTORESType30Sub(TemplatedType, DATASTORESType30):
+    def __init__(self, DS=None):
+        super(DATASTORESType30Sub, self).__init__(DS, )
+DATASTORESType30.subclass = DATASTORESType30Sub
+# end class DATASTORESType30Sub
+
+
+class DSTypeSub(TemplatedType, DSType):
+    def __init__(self, ID=None, FREE_MB=None, TOTAL_MB=None, USED_MB=None):
+        super(DSTypeSub, self).__init__(ID, FREE_MB, TOTAL_MB, USED_MB, )
+DSType.subclass = DSTypeSub
+# end class DSTypeSub
+
+
+class PCI_DEVICESTypeSub(TemplatedType, PCI_DEVICESType):
+    def __init__(self, PCI=None):
+        super(PCI_DEVICESTypeSub, self).__init__(PCI, )
+PCI_DEVICESType.subclass = PCI_DEVICESTypeSub
+# end class PCI_DEVICESTypeSub
+
+
+class VMSTypeSub(TemplatedType, VMSType):
+    def __init__(self, ID=None):
+        super(VMSTypeSub, self).__init__(ID, )
+VMSType.subclass = VMSTypeSub
+# end class VMSTypeSub
+
+
@@ -0,0 +1,1277 @@
+#!/usr/bin/env python
+
+#
+# Bindings of IMAGE_POOL, IMAGE, generated by generateDS.py and split from supbind by src/split_bindings.py
+#
+
+import sys
+import re as re_
+import base64
+import datetime as datetime_
+import warnings as warnings_
+try:
+    from lxml import etree as etree_
+except ImportError:
+    from xml.etree import ElementTree as etree_
+from pyone.util import TemplatedType
+from . import supbind as supermod
+from .supbind import (
+    GenerateDSNamespaceDefs_,
+    GeneratedsSuper,
+    Tag_pattern_,
+    getSubclassFromModule_,
+    quote_xml,
+    raise_parse_error,
+    showIndent,
+)
+
+
+class IMAGE_POOL(GeneratedsSuper):
+    subclass = None
+    superclass = None
+    def __init__(self, IMAGE=None):
+        self.original_tagname_ = None
+        if IMAGE is None:
+            self.IMAGE = []
+        else:
+            self.IMAGE = IMAGE
+    def factory(*args_, **kwargs_):
+        if supermod.CurrentSubclassModule_ is not None:
+            subclass = getSubclassFromModule_(
+                supermod.CurrentSubclassModule_, IMAGE_POOL)
+            if subclass is not None:
+                return subclass(*args_, **kwargs_)
+        if IMAGE_POOL.subclass:
+            return IMAGE_POOL.subclass(*args_, **kwargs_)
+        else:
+            return IMAGE_POOL(*args_, **kwargs_)
+    factory = staticmethod(factory)
+    def get_IMAGE(self): return self.IMAGE
+    def set_IMAGE(self, IMAGE): self.IMAGE = IMAGE
+    def add_IMAGE(self, value): self.IMAGE.append(value)
+    def insert_IMAGE_at(self, index, value): self.IMAGE.insert(index, value)
+    def replace_IMAGE_at(self, index, value): self.IMAGE[index] = value
+    def hasContent_(self):
+        if (
+            self.IMAGE
+        ):
+            return True
+        else:
+            return False
+    def export(self, outfile, level, namespaceprefix_='', name_='IMAGE_POOL', namespacedef_='', pretty_print=True):
+        imported_ns_def_ = GenerateDSNamespaceDefs_.get('IMAGE_POOL')
+        if imported_ns_def_ is not None:
+            namespacedef_ = imported_ns_def_
+        if pretty_print:
+            eol_ = '\n'
+        else:
+            eol_ = ''
+        if self.original_tagname_ is not None:
+            name_ = self.original_tagname_
+        showIndent(outfile, level, pretty_print)
+        outfile.write('<%s%s%s' % (namespaceprefix_, name_, namespacedef_ and ' ' + namespacedef_ or '', ))
+        already_processed = set()
+        self.exportAttributes(outfile, level, already_processed, namespaceprefix_, name_='IMAGE_POOL')
+        if self.hasContent_():
+            outfile.write('>%s' % (eol_, ))
+            self.exportChildren(outfile, level + 1, namespaceprefix_='', name_='IMAGE_POOL', pretty_print=pretty_print)
+            showIndent(outfile, level, pretty_print)
+            outfile.write('</%s%s>%s' % (namespaceprefix_, name_, eol_))
+        else:
+            outfile.write('/>%s' % (eol_, ))
+    def exportAttributes(self, outfile, level, already_processed, namespaceprefix_='', name_='IMAGE_POOL'):
+        pass
+    def exportChildren(self, outfile, level, namespaceprefix_='', name_='IMAGE_POOL', fromsubclass_=False, pretty_print=True):
+        if pretty_print:
+            eol_ = '\n'
+        else:
+            eol_ = ''
+        for IMAGE_ in self.IMAGE:
+            IMAGE_.export(outfile, level, namespaceprefix_, name_='IMAGE', pretty_print=pretty_print)
+    def build(self, node):
+        already_processed = set()
+        self.buildAttributes(node, node.attrib, already_processed)
+        for child in node:
+            nodeName_ = Tag_pattern_.match(child.tag).groups()[-1]
+            self.buildChildren(child, node, nodeName_)
+        return self
+    def buildAttributes(self, node, attrs, already_processed):
+        pass
+    def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
+        if nodeName_ == 'IMAGE':
+            obj_ = IMAGE.factory()
+            obj_.build(child_)
+            self.IMAGE.append(obj_)
+            obj_.original_tagname_ = 'IMAGE'
+# end class IMAGE_POOL
+
+
+class IMAGE(GeneratedsSuper):
+    subclass = None
+    superclass = None
+    def __init__(self, ID=None, UID=None, GID=None, UNAME=None, GNAME=None, NAME=None, PERMISSIONS=None, TYPE=None, DISK_TYPE=None, PERSISTENT=None, REGTIME=None, SOURCE=None, PATH=None, FSTYPE=None, SIZE=None, STATE=None, RUNNING_VMS=None, CLONING_OPS=None, CLONING_ID=None, TARGET_SNAPSHOT=None, DATASTORE_ID=None, DATASTORE=None, VMS=None, CLONES=None, APP_CLONES=None, TEMPLATE=None, SNAPSHOTS=None):
+        self.original_tagname_ = None
+        self.ID = ID
+        self.UID = UID
+        self.GID = GID
+        self.UNAME = UNAME
+        self.GNAME = GNAME
+        self.NAME = NAME
+        self.PERMISSIONS = PERMISSIONS
+        self.TYPE = TYPE
+        self.DISK_TYPE = DISK_TYPE
+        self.PERSISTENT = PERSISTENT
+        self.REGTIME = REGTIME
+        self.SOURCE = SOURCE
+        self.PATH = PATH
+        self.FSTYPE = FSTYPE
+        self.SIZE = SIZE
+        self.STATE = STATE
+        self.RUNNING_VMS = RUNNING_VMS
+        self.CLONING_OPS = CLONING_OPS
+        self.CLONING_ID = CLONING_ID
+        self.TARGET_SNAPSHOT = TARGET_SNAPSHOT
+        self.DATASTORE_ID = DATASTORE_ID
+        self.DATASTORE = DATASTORE
+        self.VMS = VMS
+        self.CLONES = CLONES
+        self.APP_CLONES = APP_CLONES
+        self.TEMPLATE = TEMPLATE
+        self.SNAPSHOTS = SNAPSHOTS
+    def factory(*args_, **kwargs_):
+        if supermod.CurrentSubclassModule_ is not None:
+            subclass = getSubclassFromModule_(
+                supermod.CurrentSubclassModule_, IMAGE)
+            if subclass is not None:
+                return subclass(*args_, **kwargs_)
+        if IMAGE.subclass:
+            return IMAGE.subclass(*args_, **kwargs_)
+        else:
+            return IMAGE(*args_, **kwargs_)
+    factory = staticmethod(factory)
+    def get_ID(self): return self.ID
+    def set_ID(self, ID): self.ID = ID
+    def get_UID(self): return self.UID
+    def set_UID(self, UID): self.UID = UID
+    def get_GID(self): return self.GID
+    def set_GID(self, GID): self.GID = GID
+    def get_UNAME(self): return self.UNAME
+    def set_UNAME(self, UNAME): self.UNAME = UNAME
+    def get_GNAME(self): return self.GNAME
+    def set_GNAME(self, GNAME): self.GNAME = GNAME
+    def get_NAME(self): return self.NAME
+    def set_NAME(self, NAME): self.NAME = NAME
+    def get_PERMISSIONS(self): return self.PERMISSIONS
+    def set_PERMISSIONS(self, PERMISSIONS): self.PERMISSIONS = PERMISSIONS
+    def get_TYPE(self): return self.TYPE
+    def set_TYPE(self, TYPE): self.TYPE = TYPE
+    def get_DISK_TYPE(self): return self.DISK_TYPE
+    def set_DISK_TYPE(self, DISK_TYPE): self.DISK_TYPE = DISK_TYPE
+    def get_PERSISTENT(self): return self.PERSISTENT
+    def set_PERSISTENT(self, PERSISTENT): self.PERSISTENT = PERSISTENT
+    def get_REGTIME(self): return self.REGTIME
+    def set_REGTIME(self, REGTIME): self.REGTIME = REGTIME
+    def get_SOURCE(self): return self.SOURCE
+    def set_SOURCE(self, SOURCE): self.SOURCE = SOURCE
+    def get_PATH(self): return self.PATH
+    def set_PATH(self, PATH): self.PATH = PATH
+    def get_FSTYPE(self): return self.FSTYPE
+    def set_FSTYPE(self, FSTYPE): self.FSTYPE = FSTYPE
+    def get_SIZE(self): return self.SIZE
+    def set_SIZE(self, SIZE): self.SIZE = SIZE
+    def get_STATE(self): return self.STATE
+    def set_STATE(self, STATE): self.STATE = STATE
+    def get_RUNNING_VMS(self): return self.RUNNING_VMS
+    def set_RUNNING_VMS(self, RUNNING_VMS): self.RUNNING_VMS = RUNNING_VMS
+    def get_CLONING_OPS(self): return self.CLONING_OPS
+    def set_CLONING_OPS(self, CLONING_OPS): self.CLONING_OPS = CLONING_OPS
+    def get_CLONING_ID(self): return self.CLONING_ID
+    def set_CLONING_ID(self, CLONING_ID): self.CLONING_ID = CLONING_ID
+    def get_TARGET_SNAPSHOT(self): return self.TARGET_SNAPSHOT
+    def set_TARGET_SNAPSHOT(self, TARGET_SNAPSHOT): self.TARGET_SNAPSHOT = TARGET_SNAPSHOT
+    def get_DATASTORE_ID(self): return self.DATASTORE_ID
+    def set_DATASTORE_ID(self, DATASTORE_ID): self.DATASTORE_ID = DATASTORE_ID
+    def get_DATASTORE(self): return self.DATASTORE
+    def set_DATASTORE(self, DATASTORE): self.DATASTORE = DATASTORE
+    def get_VMS(self): return self.VMS
+    def set_VMS(self, VMS): self.VMS = VMS
+    def get_CLONES(self): return self.CLONES
+    def set_CLONES(self, CLONES): self.CLONES = CLONES
+    def get_APP_CLONES(self): return self.APP_CLONES
+    def set_APP_CLONES(self, APP_CLONES): self.APP_CLONES = APP_CLONES
+    def get_TEMPLATE(self): return self.TEMPLATE
+    def set_TEMPLATE(self, TEMPLATE): self.TEMPLATE = TEMPLATE
+    def get_SNAPSHOTS(self): return self.SNAPSHOTS
+    def set_SNAPSHOTS(self, SNAPSHOTS): self.SNAPSHOTS = SNAPSHOTS
+    def hasContent_(self):
+        if (
+            self.ID is not None or
+            self.UID is not None or
+            self.GID is not None or
+            self.UNAME is not None or
+            self.GNAME is not None or
+            self.NAME is not None or
+            self.PERMISSIONS is not None or
+            self.TYPE is not None or
+            self.DISK_TYPE is not None or
+            self.PERSISTENT is not None or
+            self.REGTIME is not None or
+            self.SOURCE is not None or
+            self.PATH is not None or
+            self.FSTYPE is not None or
+            self.SIZE is not None or
+            self.STATE is not None or
+            self.RUNNING_VMS is not None or
+            self.CLONING_OPS is not None or
+            self.CLONING_ID is not None or
+            self.TARGET_SNAPSHOT is not None or
+            self.DATASTORE_ID is not None or
+            self.DATASTORE is not None or
+            self.VMS is not None or
+            self.CLONES is not None or
+            self.APP_CLONES is not None or
+            self.TEMPLATE is not None or
+            self.SNAPSHOTS is not None
+        ):
+            return True
+        else:
+            return False
+    def export(self, outfile, level, namespaceprefix_='', name_='IMAGE', namespacedef_='', pretty_print=True):
+        imported_ns_def_ = GenerateDSNamespaceDefs_.get('IMAGE')
+        if imported_ns_def_ is not None:
+            namespacedef_ = imported_ns_def_
+        if pretty_print:
+            eol_ = '\n'
+        else:
+            eol_ = ''
+        if self.original_tagname_ is not None:
+            name_ = self.original_tagname_
+        showIndent(outfile, level, pretty_print)
+        outfile.write('<%s%s%s' % (namespaceprefix_, name_, namespacedef_ and ' ' + namespacedef_ or '', ))
+        already_processed = set()
+        self.exportAttributes(outfile, level, already_processed, namespaceprefix_, name_='IMAGE')
+        if self.hasContent_():
+            outfile.write('>%s' % (eol_, ))
+            self.exportChildren(outfile, level + 1, namespaceprefix_='', name_='IMAGE', pretty_print=pretty_print)
+            showIndent(outfile, level, pretty_print)
+            outfile.write('</%s%s>%s' % (namespaceprefix_, name_, eol_))
+        else:
+            outfile.write('/>%s' % (eol_, ))
+    def exportAttributes(self, outfile, level, already_processed, namespaceprefix_='', name_='IMAGE'):
+        pass
+    def exportChildren(self, outfile, level, namespaceprefix_='', name_='IMAGE', fromsubclass_=False, pretty_print=True):
+        if pretty_print:
+            eol_ = '\n'
+        else:
+            eol_ = ''
+        if self.ID is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<ID>%s</ID>%s' % (self.gds_format_integer(self.ID, input_name='ID'), eol_))
+        if self.UID is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<UID>%s</UID>%s' % (self.gds_format_integer(self.UID, input_name='UID'), eol_))
+        if self.GID is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<GID>%s</GID>%s' % (self.gds_format_integer(self.GID, input_name='GID'), eol_))
+        if self.UNAME is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<UNAME>%s</UNAME>%s' % (self.gds_encode(self.gds_format_string(quote_xml(self.UNAME), input_name='UNAME')), eol_))
+        if self.GNAME is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<GNAME>%s</GNAME>%s' % (self.gds_encode(self.gds_format_string(quote_xml(self.GNAME), input_name='GNAME')), eol_))
+        if self.NAME is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<NAME>%s</NAME>%s' % (self.gds_encode(self.gds_format_string(quote_xml(self.NAME), input_name='NAME')), eol_))
+        if self.PERMISSIONS is not None:
+            self.PERMISSIONS.export(outfile, level, namespaceprefix_, name_='PERMISSIONS', pretty_print=pretty_print)
+        if self.TYPE is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<TYPE>%s</TYPE>%s' % (self.gds_format_integer(self.TYPE, input_name='TYPE'), eol_))
+        if self.DISK_TYPE is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<DISK_TYPE>%s</DISK_TYPE>%s' % (self.gds_format_integer(self.DISK_TYPE, input_name='DISK_TYPE'), eol_))
+        if self.PERSISTENT is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<PERSISTENT>%s</PERSISTENT>%s' % (self.gds_format_integer(self.PERSISTENT, input_name='PERSISTENT'), eol_))
+        if self.REGTIME is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<REGTIME>%s</REGTIME>%s' % (self.gds_format_integer(self.REGTIME, input_name='REGTIME'), eol_))
+        if self.SOURCE is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<SOURCE>%s</SOURCE>%s' % (self.gds_encode(self.gds_format_string(quote_xml(self.SOURCE), input_name='SOURCE')), eol_))
+        if self.PATH is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<PATH>%s</PATH>%s' % (self.gds_encode(self.gds_format_string(quote_xml(self.PATH), input_name='PATH')), eol_))
+        if self.FSTYPE is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<FSTYPE>%s</FSTYPE>%s' % (self.gds_encode(self.gds_format_string(quote_xml(self.FSTYPE), input_name='FSTYPE')), eol_))
+        if self.SIZE is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<SIZE>%s</SIZE>%s' % (self.gds_format_integer(self.SIZE, input_name='SIZE'), eol_))
+        if self.STATE is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<STATE>%s</STATE>%s' % (self.gds_format_integer(self.STATE, input_name='STATE'), eol_))
+        if self.RUNNING_VMS is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<RUNNING_VMS>%s</RUNNING_VMS>%s' % (self.gds_format_integer(self.RUNNING_VMS, input_name='RUNNING_VMS'), eol_))
+        if self.CLONING_OPS is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<CLONING_OPS>%s</CLONING_OPS>%s' % (self.gds_format_integer(self.CLONING_OPS, input_name='CLONING_OPS'), eol_))
+        if self.CLONING_ID is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<CLONING_ID>%s</CLONING_ID>%s' % (self.gds_format_integer(self.CLONING_ID, input_name='CLONING_ID'), eol_))
+        if self.TARGET_SNAPSHOT is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<TARGET_SNAPSHOT>%s</TARGET_SNAPSHOT>%s' % (self.gds_format_integer(self.TARGET_SNAPSHOT, input_name='TARGET_SNAPSHOT'), eol_))
+        if self.DATASTORE_ID is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<DATASTORE_ID>%s</DATASTORE_ID>%s' % (self.gds_format_integer(self.DATASTORE_ID, input_name='DATASTORE_ID'), eol_))
+        if self.DATASTORE is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<DATASTORE>%s</DATASTORE>%s' % (self.gds_encode(self.gds_format_string(quote_xml(self.DATASTORE), input_name='DATASTORE')), eol_))
+        if self.VMS is not None:
+            self.VMS.export(outfile, level, namespaceprefix_, name_='VMS', pretty_print=pretty_print)
+        if self.CLONES is not None:
+            self.CLONES.export(outfile, level, namespaceprefix_, name_='CLONES', pretty_print=pretty_print)
+        if self.APP_CLONES is not None:
+            self.APP_CLONES.export(outfile, level, namespaceprefix_, name_='APP_CLONES', pretty_print=pretty_print)
+        if self.TEMPLATE is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<TEMPLATE>%s</TEMPLATE>%s' % (self.gds_encode(self.gds_format_string(quote_xml(self.TEMPLATE), input_name='TEMPLATE')), eol_))
+        if self.SNAPSHOTS is not None:
+            self.SNAPSHOTS.export(outfile, level, namespaceprefix_, name_='SNAPSHOTS', pretty_print=pretty_print)
+    def build(self, node):
+        already_processed = set()
+        self.buildAttributes(node, node.attrib, already_processed)
+        for child in node:
+            nodeName_ = Tag_pattern_.match(child.tag).groups()[-1]
+            self.buildChildren(child, node, nodeName_)
+        return self
+    def buildAttributes(self, node, attrs, already_processed):
+        pass
+    def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
+        if nodeName_ == 'ID' and child_.text:
+            sval_ = child_.text
+            try:
+                ival_ = int(sval_)
+            except (TypeError, ValueError) as exp:
+                raise_parse_error(child_, 'requires integer: %s' % exp)
+            ival_ = self.gds_validate_integer(ival_, node, 'ID')
+            self.ID = ival_
+        elif nodeName_ == 'UID' and child_.text:
+            sval_ = child_.text
+            try:
+                ival_ = int(sval_)
+            except (TypeError, ValueError) as exp:
+                raise_parse_error(child_, 'requires integer: %s' % exp)
+            ival_ = self.gds_validate_integer(ival_, node, 'UID')
+            self.UID = ival_
+        elif nodeName_ == 'GID' and child_.text:
+            sval_ = child_.text
+            try:
+                ival_ = int(sval_)
+            except (TypeError, ValueError) as exp:
+                raise_parse_error(child_, 'requires integer: %s' % exp)
+            ival_ = self.gds_validate_integer(ival_, node, 'GID')
+            self.GID = ival_
+        elif nodeName_ == 'UNAME':
+            UNAME_ = child_.text
+            UNAME_ = self.gds_validate_string(UNAME_, node, 'UNAME')
+            self.UNAME = UNAME_
+        elif nodeName_ == 'GNAME':
+            GNAME_ = child_.text
+            GNAME_ = self.gds_validate_string(GNAME_, node, 'GNAME')
+            self.GNAME = GNAME_
+        elif nodeName_ == 'NAME':
+            NAME_ = child_.text
+            NAME_ = self.gds_validate_string(NAME_, node, 'NAME')
+            self.NAME = NAME_
+        elif nodeName_ == 'PERMISSIONS':
+            obj_ = PERMISSIONSType31.factory()
+            obj_.build(child_)
+            self.PERMISSIONS = obj_
+            obj_.original_tagname_ = 'PERMISSIONS'
+        elif nodeName_ == 'TYPE' and child_.text:
+            sval_ = child_.text
+            try:
+                ival_ = int(sval_)
+            except (TypeError, ValueError) as exp:
+                raise_parse_error(child_, 'requires integer: %s' % exp)
+            ival_ = self.gds_validate_integer(ival_, node, 'TYPE')
+            self.TYPE = ival_
+        elif nodeName_ == 'DISK_TYPE' and child_.text:
+            sval_ = child_.text
+            try:
+                ival_ = int(sval_)
+            except (TypeError, ValueError) as exp:
+                raise_parse_error(child_, 'requires integer: %s' % exp)
+            ival_ = self.gds_validate_integer(ival_, node, 'DISK_TYPE')
+            self.DISK_TYPE = ival_
+        elif nodeName_ == 'PERSISTENT' and child_.text:
+            sval_ = child_.text
+            try:
+                ival_ = int(sval_)
+            except (TypeError, ValueError) as exp:
+                raise_parse_error(child_, 'requires integer: %s' % exp)
+            ival_ = self.gds_validate_integer(ival_, node, 'PERSISTENT')
+            self.PERSISTENT = ival_
+        elif nodeName_ == 'REGTIME' and child_.text:
+            sval_ = child_.text
+            try:
+                ival_ = int(sval_)
+            except (TypeError, ValueError) as exp:
+                raise_parse_error(child_, 'requires integer: %s' % exp)
+            ival_ = self.gds_validate_integer(ival_, node, 'REGTIME')
+            self.REGTIME = ival_
+        elif nodeName_ == 'SOURCE':
+            SOURCE_ = child_.text
+            SOURCE_ = self.gds_validate_string(SOURCE_, node, 'SOURCE')
+            self.SOURCE = SOURCE_
+        elif nodeName_ == 'PATH':
+            PATH_ = child_.text
+            PATH_ = self.gds_validate_string(PATH_, node, 'PATH')
+            self.PATH = PATH_
+        elif nodeName_ == 'FSTYPE':
+            FSTYPE_ = child_.text
+            FSTYPE_ = self.gds_validate_string(FSTYPE_, node, 'FSTYPE')
+            self.FSTYPE = FSTYPE_
+        elif nodeName_ == 'SIZE' and child_.text:
+            sval_ = child_.text
+            try:
+                ival_ = int(sval_)
+            except (TypeError, ValueError) as exp:
+                raise_parse_error(child_, 'requires integer: %s' % exp)
+            ival_ = self.gds_validate_integer(ival_, node, 'SIZE')
+            self.SIZE = ival_
+        elif nodeName_ == 'STATE' and child_.text:
+            sval_ = child_.text
+            try:
+                ival_ = int(sval_)
+            except (TypeError, ValueError) as exp:
+                raise_parse_error(child_, 'requires integer: %s' % exp)
+            ival_ = self.gds_validate_integer(ival_, node, 'STATE')
+            self.STATE = ival_
+        elif nodeName_ == 'RUNNING_VMS' and child_.text:
+            sval_ = child_.text
+            try:
+                ival_ = int(sval_)
+            except (TypeError, ValueError) as exp:
+                raise_parse_error(child_, 'requires integer: %s' % exp)
+            ival_ = self.gds_validate_integer(ival_, node, 'RUNNING_VMS')
+            self.RUNNING_VMS = ival_
+        elif nodeName_ == 'CLONING_OPS' and child_.text:
+            sval_ = child_.text
+            try:
+                ival_ = int(sval_)
+            except (TypeError, ValueError) as exp:
+                raise_parse_error(child_, 'requires integer: %s' % exp)
+            ival_ = self.gds_validate_integer(ival_, node, 'CLONING_OPS')
+            self.CLONING_OPS = ival_
+        elif nodeName_ == 'CLONING_ID' and child_.text:
+            sval_ = child_.text
+            try:
+                ival_ = int(sval_)
+            except (TypeError, ValueError) as exp:
+                raise_parse_error(child_, 'requires integer: %s' % exp)
+            ival_ = self.gds_validate_integer(ival_, node, 'CLONING_ID')
+            self.CLONING_ID = ival_
+        elif nodeName_ == 'TARGET_SNAPSHOT' and child_.text:
+            sval_ = child_.text
+            try:
+                ival_ = int(sval_)
+            except (TypeError, ValueError) as exp:
+                raise_parse_error(child_, 'requires integer: %s' % exp)
+            ival_ = self.gds_validate_integer(ival_, node, 'TARGET_SNAPSHOT')
+            self.TARGET_SNAPSHOT = ival_
+        elif nodeName_ == 'DATASTORE_ID' and child_.text:
+            sval_ = child_.text
+            try:
+                ival_ = int(sval_)
+            except (TypeError, ValueError) as exp:
+                raise_parse_error(child_, 'requires integer: %s' % exp)
+            ival_ = self.gds_validate_integer(ival_, node, 'DATASTORE_ID')
+            self.DATASTORE_ID = ival_
+        elif nodeName_ == 'DATASTORE':
+            DATASTORE_ = child_.text
+            DATASTORE_ = self.gds_validate_string(DATASTORE_, node, 'DATASTORE')
+            self.DATASTORE = DATASTORE_
+        elif nodeName_ == 'VMS':
+            obj_ = VMSType32.factory()
+            obj_.build(child_)
+            self.VMS = obj_
+            obj_.original_tagname_ = 'VMS'
+        elif nodeName_ == 'CLONES':
+            obj_ = CLONESType.factory()
+            obj_.build(child_)
+            self.CLONES = obj_
+            obj_.original_tagname_ = 'CLONES'
+        elif nodeName_ == 'APP_CLONES':
+            obj_ = APP_CLONESType.factory()
+            obj_.build(child_)
+            self.APP_CLONES = obj_
+            obj_.original_tagname_ = 'APP_CLONES'
+        elif nodeName_ == 'TEMPLATE':
+            TEMPLATE_ = child_.text
+            TEMPLATE_ = self.gds_validate_string(TEMPLATE_, node, 'TEMPLATE')
+            self.TEMPLATE = TEMPLATE_
+        elif nodeName_ == 'SNAPSHOTS':
+            obj_ = SNAPSHOTSType33.factory()
+            obj_.build(child_)
+            self.SNAPSHOTS = obj_
+            obj_.original_tagname_ = 'SNAPSHOTS'
+# end class IMAGE
+
+
+class PERMISSIONSType31(GeneratedsSuper):
+    subclass = None
+    superclass = None
+    def __init__(self, OWNER_U=None, OWNER_M=None, OWNER_A=None, GROUP_U=None, GROUP_M=None, GROUP_A=None, OTHER_U=None, OTHER_M=None, OTHER_A=None):
+        self.original_tagname_ = None
+        self.OWNER_U = OWNER_U
+        self.OWNER_M = OWNER_M
+        self.OWNER_A = OWNER_A
+        self.GROUP_U = GROUP_U
+        self.GROUP_M = GROUP_M
+        self.GROUP_A = GROUP_A
+        self.OTHER_U = OTHER_U
+        self.OTHER_M = OTHER_M
+        self.OTHER_A = OTHER_A
+    def factory(*args_, **kwargs_):
+        if supermod.CurrentSubclassModule_ is not None:
+            subclass = getSubclassFromModule_(
+                supermod.CurrentSubclassModule_, PERMISSIONSType31)
+            if subclass is not None:
+                return subclass(*args_, **kwargs_)
+        if PERMISSIONSType31.subclass:
+            return PERMISSIONSType31.subclass(*args_, **kwargs_)
+        else:
+            return PERMISSIONSType31(*args_, **kwargs_)
+    factory = staticmethod(factory)
+    def get_OWNER_U(self): return self.OWNER_U
+    def set_OWNER_U(self, OWNER_U): self.OWNER_U = OWNER_U
+    def get_OWNER_M(self): return self.OWNER_M
+    def set_OWNER_M(self, OWNER_M): self.OWNER_M = OWNER_M
+    def get_OWNER_A(self): return self.OWNER_A
+    def set_OWNER_A(self, OWNER_A): self.OWNER_A = OWNER_A
+    def get_GROUP_U(self): return self.GROUP_U
+    def set_GROUP_U(self, GROUP_U): self.GROUP_U = GROUP_U
+    def get_GROUP_M(self): return self.GROUP_M
+    def set_GROUP_M(self, GROUP_M): self.GROUP_M = GROUP_M
+    def get_GROUP_A(self): return self.GROUP_A
+    def set_GROUP_A(self, GROUP_A): self.GROUP_A = GROUP_A
+    def get_OTHER_U(self): return self.OTHER_U
+    def set_OTHER_U(self, OTHER_U): self.OTHER_U = OTHER_U
+    def get_OTHER_M(self): return self.OTHER_M
+    def set_OTHER_M(self, OTHER_M): self.OTHER_M = OTHER_M
+    def get_OTHER_A(self): return self.OTHER_A
+    def set_OTHER_A(self, OTHER_A): self.OTHER_A = OTHER_A
+    def hasContent_(self):
+        if (
+            self.OWNER_U is not None or
+            self.OWNER_M is not None or
+            self.OWNER_A is not None or
+            self.GROUP_U is not None or
+            self.GROUP_M is not None or
+            self.GROUP_A is not None or
+            self.OTHER_U is not None or
+            self.OTHER_M is not None or
+            self.OTHER_A is not None
+        ):
+            return True
+        else:
+            return False
+    def export(self, outfile, level, namespaceprefix_='', name_='PERMISSIONSType31', namespacedef_='', pretty_print=True):
+        imported_ns_def_ = GenerateDSNamespaceDefs_.get('PERMISSIONSType31')
+        if imported_ns_def_ is not None:
+            namespacedef_ = imported_ns_def_
+        if pretty_print:
+            eol_ = '\n'
+        else:
+            eol_ = ''
+        if self.original_tagname_ is not None:
+            name_ = self.original_tagname_
+        showIndent(outfile, level, pretty_print)
+        outfile.write('<%s%s%s' % (namespaceprefix_, name_, namespacedef_ and ' ' + namespacedef_ or '', ))
+        already_processed = set()
+        self.exportAttributes(outfile, level, already_processed, namespaceprefix_, name_='PERMISSIONSType31')
+        if self.hasContent_():
+            outfile.write('>%s' % (eol_, ))
+            self.exportChildren(outfile, level + 1, namespaceprefix_='', name_='PERMISSIONSType31', pretty_print=pretty_print)
+            showIndent(outfile, level, pretty_print)
+            outfile.write('</%s%s>%s' % (namespaceprefix_, name_, eol_))
+        else:
+            outfile.write('/>%s' % (eol_, ))
+    def exportAttributes(self, outfile, level, already_processed, namespaceprefix_='', name_='PERMISSIONSType31'):
+        pass
+    def exportChildren(self, outfile, level, namespaceprefix_='', name_='PERMISSIONSType31', fromsubclass_=False, pretty_print=True):
+        if pretty_print:
+            eol_ = '\n'
+        else:
+            eol_ = ''
+        if self.OWNER_U is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<OWNER_U>%s</OWNER_U>%s' % (self.gds_format_integer(self.OWNER_U, input_name='OWNER_U'), eol_))
+        if self.OWNER_M is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<OWNER_M>%s</OWNER_M>%s' % (self.gds_format_integer(self.OWNER_M, input_name='OWNER_M'), eol_))
+        if self.OWNER_A is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<OWNER_A>%s</OWNER_A>%s' % (self.gds_format_integer(self.OWNER_A, input_name='OWNER_A'), eol_))
+        if self.GROUP_U is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<GROUP_U>%s</GROUP_U>%s' % (self.gds_format_integer(self.GROUP_U, input_name='GROUP_U'), eol_))
+        if self.GROUP_M is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<GROUP_M>%s</GROUP_M>%s' % (self.gds_format_integer(self.GROUP_M, input_name='GROUP_M'), eol_))
+        if self.GROUP_A is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<GROUP_A>%s</GROUP_A>%s' % (self.gds_format_integer(self.GROUP_A, input_name='GROUP_A'), eol_))
+        if self.OTHER_U is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<OTHER_U>%s</OTHER_U>%s' % (self.gds_format_integer(self.OTHER_U, input_name='OTHER_U'), eol_))
+        if self.OTHER_M is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<OTHER_M>%s</OTHER_M>%s' % (self.gds_format_integer(self.OTHER_M, input_name='OTHER_M'), eol_))
+        if self.OTHER_A is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<OTHER_A>%s</OTHER_A>%s' % (self.gds_format_integer(self.OTHER_A, input_name='OTHER_A'), eol_))
+    def build(self, node):
+        already_processed = set()
+        self.buildAttributes(node, node.attrib, already_processed)
+        for child in node:
+            nodeName_ = Tag_pattern_.match(child.tag).groups()[-1]
+            self.buildChildren(child, node, nodeName_)
+        return self
+    def buildAttributes(self, node, attrs, already_processed):
+        pass
+    def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
+        if nodeName_ == 'OWNER_U' and child_.text:
+            sval_ = child_.text
+            try:
+                ival_ = int(sval_)
+            except (TypeError, ValueError) as exp:
+                raise_parse_error(child_, 'requires integer: %s' % exp)
+            ival_ = self.gds_validate_integer(ival_, node, 'OWNER_U')
+            self.OWNER_U = ival_
+        elif nodeName_ == 'OWNER_M' and child_.text:
+            sval_ = child_.text
+            try:
+                ival_ = int(sval_)
+            except (TypeError, ValueError) as exp:
+                raise_parse_error(child_, 'requires integer: %s' % exp)
+            ival_ = self.gds_validate_integer(ival_, node, 'OWNER_M')
+            self.OWNER_M = ival_
+        elif nodeName_ == 'OWNER_A' and child_.text:
+            sval_ = child_.text
+            try:
+                ival_ = int(sval_)
+            except (TypeError, ValueError) as exp:
+                raise_parse_error(child_, 'requires integer: %s' % exp)
+            ival_ = self.gds_validate_integer(ival_, node, 'OWNER_A')
+            self.OWNER_A = ival_
+        elif nodeName_ == 'GROUP_U' and child_.text:
+            sval_ = child_.text
+            try:
+                ival_ = int(sval_)
+            except (TypeError, ValueError) as exp:
+                raise_parse_error(child_, 'requires integer: %s' % exp)
+            ival_ = self.gds_validate_integer(ival_, node, 'GROUP_U')
+            self.GROUP_U = ival_
+        elif nodeName_ == 'GROUP_M' and child_.text:
+            sval_ = child_.text
+            try:
+                ival_ = int(sval_)
+            except (TypeError, ValueError) as exp:
+                raise_parse_error(child_, 'requires integer: %s' % exp)
+            ival_ = self.gds_validate_integer(ival_, node, 'GROUP_M')
+            self.GROUP_M = ival_
+        elif nodeName_ == 'GROUP_A' and child_.text:
+            sval_ = child_.text
+            try:
+                ival_ = int(sval_)
+            except (TypeError, ValueError) as exp:
+                raise_parse_error(child_, 'requires integer: %s' % exp)
+            ival_ = self.gds_validate_integer(ival_, node, 'GROUP_A')
+            self.GROUP_A = ival_
+        elif nodeName_ == 'OTHER_U' and child_.text:
+            sval_ = child_.text
+            try:
+                ival_ = int(sval_)
+            except (TypeError, ValueError) as exp:
+                raise_parse_error(child_, 'requires integer: %s' % exp)
+            ival_ = self.gds_validate_integer(ival_, node, 'OTHER_U')
+            self.OTHER_U = ival_
+        elif nodeName_ == 'OTHER_M' and child_.text:
+            sval_ = child_.text
+            try:
+                ival_ = int(sval_)
+            except (TypeError, ValueError) as exp:
+                raise_parse_error(child_, 'requires integer: %s' % exp)
+            ival_ = self.gds_validate_integer(ival_, node, 'OTHER_M')
+            self.OTHER_M = ival_
+        elif nodeName_ == 'OTHER_A' and child_.text:
+            sval_ = child_.text
+            try:
+                ival_ = int(sval_)
+            except (TypeError, ValueError) as exp:
+                raise_parse_error(child_, 'requires integer: %s' % exp)
+            ival_ = self.gds_validate_integer(ival_, node, 'OTHER_A')
+            self.OTHER_A = ival_
+# end class PERMISSIONSType31
+
+
+class VMSType32(GeneratedsSuper):
+    subclass = None
+    superclass = None
+    def __init__(self, ID=None):
+        self.original_tagname_ = None
+        if ID is None:
+            self.ID = []
+        else:
+            self.ID = ID
+    def factory(*args_, **kwargs_):
+        if supermod.CurrentSubclassModule_ is not None:
+            subclass = getSubclassFromModule_(
+                supermod.CurrentSubclassModule_, VMSType32)
+            if subclass is not None:
+                return subclass(*args_, **kwargs_)
+        if VMSType32.subclass:
+            return VMSType32.subclass(*args_, **kwargs_)
+        else:
+            return VMSType32(*args_, **kwargs_)
+    factory = staticmethod(factory)
+    def get_ID(self): return self.ID
+    def set_ID(self, ID): self.ID = ID
+    def add_ID(self, value): self.ID.append(value)
+    def insert_ID_at(self, index, value): self.ID.insert(index, value)
+    def replace_ID_at(self, index, value): self.ID[index] = value
+    def hasContent_(self):
+        if (
+            self.ID
+        ):
+            return True
+        else:
+            return False
+    def export(self, outfile, level, namespaceprefix_='', name_='VMSType32', namespacedef_='', pretty_print=True):
+        imported_ns_def_ = GenerateDSNamespaceDefs_.get('VMSType32')
+        if imported_ns_def_ is not None:
+            namespacedef_ = imported_ns_def_
+        if pretty_print:
+            eol_ = '\n'
+        else:
+            eol_ = ''
+        if self.original_tagname_ is not None:
+            name_ = self.original_tagname_
+        showIndent(outfile, level, pretty_print)
+        outfile.write('<%s%s%s' % (namespaceprefix_, name_, namespacedef_ and ' ' + namespacedef_ or '', ))
+        already_processed = set()
+        self.exportAttributes(outfile, level, already_processed, namespaceprefix_, name_='VMSType32')
+        if self.hasContent_():
+            outfile.write('>%s' % (eol_, ))
+            self.exportChildren(outfile, level + 1, namespaceprefix_='', name_='VMSType32', pretty_print=pretty_print)
+            showIndent(outfile, level, pretty_print)
+            outfile.write('</%s%s>%s' % (namespaceprefix_, name_, eol_))
+        else:
+            outfile.write('/>%s' % (eol_, ))
+    def exportAttributes(self, outfile, level, already_processed, namespaceprefix_='', name_='VMSType32'):
+        pass
+    def exportChildren(self, outfile, level, namespaceprefix_='', name_='VMSType32', fromsubclass_=False, pretty_print=True):
+        if pretty_print:
+            eol_ = '\n'
+        else:
+            eol_ = ''
+        for ID_ in self.ID:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<ID>%s</ID>%s' % (self.gds_format_integer(ID_, input_name='ID'), eol_))
+    def build(self, node):
+        already_processed = set()
+        self.buildAttributes(node, node.attrib, already_processed)
+        for child in node:
+            nodeName_ = Tag_pattern_.match(child.tag).groups()[-1]
+            self.buildChildren(child, node, nodeName_)
+        return self
+    def buildAttributes(self, node, attrs, already_processed):
+        pass
+    def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
+        if nodeName_ == 'ID' and child_.text:
+            sval_ = child_.text
+            try:
+                ival_ = int(sval_)
+            except (TypeError, ValueError) as exp:
+                raise_parse_error(child_, 'requires integer: %s' % exp)
+            ival_ = self.gds_validate_integer(ival_, node, 'ID')
+            self.ID.append(ival_)
+# end class VMSType32
+
+
+class CLONESType(GeneratedsSuper):
+    subclass = None
+    superclass = None
+    def __init__(self, ID=None):
+        self.original_tagname_ = None
+        if ID is None:
+            self.ID = []
+        else:
+            self.ID = ID
+    def factory(*args_, **kwargs_):
+        if supermod.CurrentSubclassModule_ is not None:
+            subclass = getSubclassFromModule_(
+                supermod.CurrentSubclassModule_, CLONESType)
+            if subclass is not None:
+                return subclass(*args_, **kwargs_)
+        if CLONESType.subclass:
+            return CLONESType.subclass(*args_, **kwargs_)
+        else:
+            return CLONESType(*args_, **kwargs_)
+    factory = staticmethod(factory)
+    def get_ID(self): return self.ID
+    def set_ID(self, ID): self.ID = ID
+    def add_ID(self, value): self.ID.append(value)
+    def insert_ID_at(self, index, value): self.ID.insert(index, value)
+    def replace_ID_at(self, index, value): self.ID[index] = value
+    def hasContent_(self):
+        if (
+            self.ID
+        ):
+            return True
+        else:
+            return False
+    def export(self, outfile, level, namespaceprefix_='', name_='CLONESType', namespacedef_='', pretty_print=True):
+        imported_ns_def_ = GenerateDSNamespaceDefs_.get('CLONESType')
+        if imported_ns_def_ is not None:
+            namespacedef_ = imported_ns_def_
+        if pretty_print:
+            eol_ = '\n'
+        else:
+            eol_ = ''
+        if self.original_tagname_ is not None:
+            name_ = self.original_tagname_
+        showIndent(outfile, level, pretty_print)
+        outfile.write('<%s%s%s' % (namespaceprefix_, name_, namespacedef_ and ' ' + namespacedef_ or '', ))
+        already_processed = set()
+        self.exportAttributes(outfile, level, already_processed, namespaceprefix_, name_='CLONESType')
+        if self.hasContent_():
+            outfile.write('>%s' % (eol_, ))
+            self.exportChildren(outfile, level + 1, namespaceprefix_='', name_='CLONESType', pretty_print=pretty_print)
+            showIndent(outfile, level, pretty_print)
+            outfile.write('</%s%s>%s' % (namespaceprefix_, name_, eol_))
+        else:
+            outfile.write('/>%s' % (eol_, ))
+    def exportAttributes(self, outfile, level, already_processed, namespaceprefix_='', name_='CLONESType'):
+        pass
+    def exportChildren(self, outfile, level, namespaceprefix_='', name_='CLONESType', fromsubclass_=False, pretty_print=True):
+        if pretty_print:
+            eol_ = '\n'
+        else:
+            eol_ = ''
+        for ID_ in self.ID:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<ID>%s</ID>%s' % (self.gds_format_integer(ID_, input_name='ID'), eol_))
+    def build(self, node):
+        already_processed = set()
+        self.buildAttributes(node, node.attrib, already_processed)
+        for child in node:
+            nodeName_ = Tag_pattern_.match(child.tag).groups()[-1]
+            self.buildChildren(child, node, nodeName_)
+        return self
+    def buildAttributes(self, node, attrs, already_processed):
+        pass
+    def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
+        if nodeName_ == 'ID' and child_.text:
+            sval_ = child_.text
+            try:
+                ival_ = int(sval_)
+            except (TypeError, ValueError) as exp:
+                raise_parse_error(child_, 'requires integer: %s' % exp)
+            ival_ = self.gds_validate_integer(ival_, node, 'ID')
+            self.ID.append(ival_)
+# end class CLONESType
+
+
+class APP_CLONESType(GeneratedsSuper):
+    subclass = None
+    superclass = None
+    def __init__(self, ID=None):
+        self.original_tagname_ = None
+        if ID is None:
+            self.ID = []
+        else:
+            self.ID = ID
+    def factory(*args_, **kwargs_):
+        if supermod.CurrentSubclassModule_ is not None:
+            subclass = getSubclassFromModule_(
+                supermod.CurrentSubclassModule_, APP_CLONESType)
+            if subclass is not None:
+                return subclass(*args_, **kwargs_)
+        if APP_CLONESType.subclass:
+            return APP_CLONESType.subclass(*args_, **kwargs_)
+        else:
+            return APP_CLONESType(*args_, **kwargs_)
+    factory = staticmethod(factory)
+    def get_ID(self): return self.ID
+    def set_ID(self, ID): self.ID = ID
+    def add_ID(self, value): self.ID.append(value)
+    def insert_ID_at(self, index, value): self.ID.insert(index, value)
+    def replace_ID_at(self, index, value): self.ID[index] = value
+    def hasContent_(self):
+        if (
+            self.ID
+        ):
+            return True
+        else:
+            return False
+    def export(self, outfile, level, namespaceprefix_='', name_='APP_CLONESType', namespacedef_='', pretty_print=True):
+        imported_ns_def_ = GenerateDSNamespaceDefs_.get('APP_CLONESType')
+        if imported_ns_def_ is not None:
+            namespacedef_ = imported_ns_def_
+        if pretty_print:
+            eol_ = '\n'
+        else:
+            eol_ = ''
+        if self.original_tagname_ is not None:
+            name_ = self.original_tagname_
+        showIndent(outfile, level, pretty_print)
+        outfile.write('<%s%s%s' % (namespaceprefix_, name_, namespacedef_ and ' ' + namespacedef_ or '', ))
+        already_processed = set()
+        self.exportAttributes(outfile, level, already_processed, namespaceprefix_, name_='APP_CLONESType')
+        if self.hasContent_():
+            outfile.write('>%s' % (eol_, ))
+            self.exportChildren(outfile, level + 1, namespaceprefix_='', name_='APP_CLONESType', pretty_print=pretty_print)
+            showIndent(outfile, level, pretty_print)
+            outfile.write('</%s%s>%s' % (namespaceprefix_, name_, eol_))
+        else:
+            outfile.write('/>%s' % (eol_, ))
+    def exportAttributes(self, outfile, level, already_processed, namespaceprefix_='', name_='APP_CLONESType'):
+        pass
+    def exportChildren(self, outfile, level, namespaceprefix_='', name_='APP_CLONESType', fromsubclass_=False, pretty_print=True):
+        if pretty_print:
+            eol_ = '\n'
+        else:
+            eol_ = ''
+        for ID_ in self.ID:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<ID>%s</ID>%s' % (self.gds_format_integer(ID_, input_name='ID'), eol_))
+    def build(self, node):
+        already_processed = set()
+        self.buildAttributes(node, node.attrib, already_processed)
+        for child in node:
+            nodeName_ = Tag_pattern_.match(child.tag).groups()[-1]
+            self.buildChildren(child, node, nodeName_)
+        return self
+    def buildAttributes(self, node, attrs, already_processed):
+        pass
+    def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
+        if nodeName_ == 'ID' and child_.text:
+            sval_ = child_.text
+            try:
+                ival_ = int(sval_)
+            except (TypeError, ValueError) as exp:
+                raise_parse_error(child_, 'requires integer: %s' % exp)
+            ival_ = self.gds_validate_integer(ival_, node, 'ID')
+            self.ID.append(ival_)
+# end class APP_CLONESType
+
+
+class SNAPSHOTSType33(GeneratedsSuper):
+    subclass = None
+    superclass = None
+    def __init__(self, ALLOW_ORPHANS=None, SNAPSHOT=None):
+        self.original_tagname_ = None
+        self.ALLOW_ORPHANS = ALLOW_ORPHANS
+        if SNAPSHOT is None:
+            self.SNAPSHOT = []
+        else:
+            self.SNAPSHOT = SNAPSHOT
+    def factory(*args_, **kwargs_):
+        if supermod.CurrentSubclassModule_ is not None:
+            subclass = getSubclassFromModule_(
+                supermod.CurrentSubclassModule_, SNAPSHOTSType33)
+            if subclass is not None:
+                return subclass(*args_, **kwargs_)
+        if SNAPSHOTSType33.subclass:
+            return SNAPSHOTSType33.subclass(*args_, **kwargs_)
+        else:
+            return SNAPSHOTSType33(*args_, **kwargs_)
+    factory = staticmethod(factory)
+    def get_ALLOW_ORPHANS(self): return self.ALLOW_ORPHANS
+    def set_ALLOW_ORPHANS(self, ALLOW_ORPHANS): self.ALLOW_ORPHANS = ALLOW_ORPHANS
+    def get_SNAPSHOT(self): return self.SNAPSHOT
+    def set_SNAPSHOT(self, SNAPSHOT): self.SNAPSHOT = SNAPSHOT
+    def add_SNAPSHOT(self, value): self.SNAPSHOT.append(value)
+    def insert_SNAPSHOT_at(self, index, value): self.SNAPSHOT.insert(index, value)
+    def replace_SNAPSHOT_at(self, index, value): self.SNAPSHOT[index] = value
+    def hasContent_(self):
+        if (
+            self.ALLOW_ORPHANS is not None or
+            self.SNAPSHOT
+        ):
+            return True
+        else:
+            return False
+    def export(self, outfile, level, namespaceprefix_='', name_='SNAPSHOTSType33', namespacedef_='', pretty_print=True):
+        imported_ns_def_ = GenerateDSNamespaceDefs_.get('SNAPSHOTSType33')
+        if imported_ns_def_ is not None:
+            namespacedef_ = imported_ns_def_
+        if pretty_print:
+            eol_ = '\n'
+        else:
+            eol_ = ''
+        if self.original_tagname_ is not None:
+            name_ = self.original_tagname_
+        showIndent(outfile, level, pretty_print)
+        outfile.write('<%s%s%s' % (namespaceprefix_, name_, namespacedef_ and ' ' + namespacedef_ or '', ))
+        already_processed = set()
+        self.exportAttributes(outfile, level, already_processed, namespaceprefix_, name_='SNAPSHOTSType33')
+        if self.hasContent_():
+            outfile.write('>%s' % (eol_, ))
+            self.exportChildren(outfile, level + 1, namespaceprefix_='', name_='SNAPSHOTSType33', pretty_print=pretty_print)
+            showIndent(outfile, level, pretty_print)
+            outfile.write('</%s%s>%s' % (namespaceprefix_, name_, eol_))
+        else:
+            outfile.write('/>%s' % (eol_, ))
+    def exportAttributes(self, outfile, level, already_processed, namespaceprefix_='', name_='SNAPSHOTSType33'):
+        pass
+    def exportChildren(self, outfile, level, namespaceprefix_='', name_='SNAPSHOTSType33', fromsubclass_=False, pretty_print=True):
+        if pretty_print:
+            eol_ = '\n'
+        else:
+            eol_ = ''
+        if self.ALLOW_ORPHANS is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<ALLOW_ORPHANS>%s</ALLOW_ORPHANS>%s' % (self.gds_encode(self.gds_format_string(quote_xml(self.ALLOW_ORPHANS), input_name='ALLOW_ORPHANS')), eol_))
+        for SNAPSHOT_ in self.SNAPSHOT:
+            SNAPSHOT_.export(outfile, level, namespaceprefix_, name_='SNAPSHOT', pretty_print=pretty_print)
+    def build(self, node):
+        already_processed = set()
+        self.buildAttributes(node, node.attrib, already_processed)
+        for child in node:
+            nodeName_ = Tag_pattern_.match(child.tag).groups()[-1]
+            self.buildChildren(child, node, nodeName_)
+        return self
+    def buildAttributes(self, node, attrs, already_processed):
+        pass
+    def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
+        if nodeName_ == 'ALLOW_ORPHANS':
+            ALLOW_ORPHANS_ = child_.text
+            ALLOW_ORPHANS_ = self.gds_validate_string(ALLOW_ORPHANS_, node, 'ALLOW_ORPHANS')
+            self.ALLOW_ORPHANS = ALLOW_ORPHANS_
+        elif nodeName_ == 'SNAPSHOT':
+            obj_ = SNAPSHOTType34.factory()
+            obj_.build(child_)
+            self.SNAPSHOT.append(obj_)
+            obj_.original_tagname_ = 'SNAPSHOT'
+# end class SNAPSHOTSType33
+
+
+class SNAPSHOTType34(GeneratedsSuper):
+    subclass = None
+    superclass = None
+    def __init__(self, CHILDREN=None, ACTIVE=None, DATE=None, ID=None, NAME=None, PARENT=None, SIZE=None):
+        self.original_tagname_ = None
+        self.CHILDREN = CHILDREN
+        self.ACTIVE = ACTIVE
+        self.DATE = DATE
+        self.ID = ID
+        self.NAME = NAME
+        self.PARENT = PARENT
+        self.SIZE = SIZE
+    def factory(*args_, **kwargs_):
+        if supermod.CurrentSubclassModule_ is not None:
+            subclass = getSubclassFromModule_(
+                supermod.CurrentSubclassModule_, SNAPSHOTType34)
+            if subclass is not None:
+                return subclass(*args_, **kwargs_)
+        if SNAPSHOTType34.subclass:
+            return SNAPSHOTType34.subclass(*args_, **kwargs_)
+        else:
+            return SNAPSHOTType34(*args_, **kwargs_)
+    factory = staticmethod(factory)
+    def get_CHILDREN(self): return self.CHILDREN
+    def set_CHILDREN(self, CHILDREN): self.CHILDREN = CHILDREN
+    def get_ACTIVE(self): return self.ACTIVE
+    def set_ACTIVE(self, ACTIVE): self.ACTIVE = ACTIVE
+    def get_DATE(self): return self.DATE
+    def set_DATE(self, DATE): self.DATE = DATE
+    def get_ID(self): return self.ID
+    def set_ID(self, ID): self.ID = ID
+    def get_NAME(self): return self.NAME
+    def set_NAME(self, NAME): self.NAME = NAME
+    def get_PARENT(self): return self.PARENT
+    def set_PARENT(self, PARENT): self.PARENT = PARENT
+    def get_SIZE(self): return self.SIZE
+    def set_SIZE(self, SIZE): self.SIZE = SIZE
+    def hasContent_(self):
+        if (
+            self.CHILDREN is not None or
+            self.ACTIVE is not None or
+            self.DATE is not None or
+            self.ID is not None or
+            self.NAME is not None or
+            self.PARENT is not None or
+            self.SIZE is not None
+        ):
+            return True
+        else:
+            return False
+    def export(self, outfile, level, namespaceprefix_='', name_='SNAPSHOTType34', namespacedef_='', pretty_print=True):
+        imported_ns_def_ = GenerateDSNamespaceDefs_.get('SNAPSHOTType34')
+        if imported_ns_def_ is not None:
+            namespacedef_ = imported_ns_def_
+        if pretty_print:
+            eol_ = '\n'
+        else:
+            eol_ = ''
+        if self.original_tagname_ is not None:
+            name_ = self.original_tagname_
+        showIndent(outfile, level, pretty_print)
+        outfile.write('<%s%s%s' % (namespaceprefix_, name_, namespacedef_ and ' ' + namespacedef_ or '', ))
+        already_processed = set()
+        self.exportAttributes(outfile, level, already_processed, namespaceprefix_, name_='SNAPSHOTType34')
+        if self.hasContent_():
+            outfile.write('>%s' % (eol_, ))
+            self.exportChildren(outfile, level + 1, namespaceprefix_='', name_='SNAPSHOTType34', pretty_print=pretty_print)
+            showIndent(outfile, level, pretty_print)
+            outfile.write('</%s%s>%s' % (namespaceprefix_, name_, eol_))
+        else:
+            outfile.write('/>%s' % (eol_, ))
+    def exportAttributes(self, outfile, level, already_processed, namespaceprefix_='', name_='SNAPSHOTType34'):
+        pass
+    def exportChildren(self, outfile, level, namespaceprefix_='', name_='SNAPSHOTType34', fromsubclass_=False, pretty_print=True):
+        if pretty_print:
+            eol_ = '\n'
+        else:
+            eol_ = ''
+        if self.CHILDREN is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<CHILDREN>%s</CHILDREN>%s' % (self.gds_encode(self.gds_format_string(quote_xml(self.CHILDREN), input_name='CHILDREN')), eol_))
+        if self.ACTIVE is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<ACTIVE>%s</ACTIVE>%s' % (self.gds_encode(self.gds_format_string(quote_xml(self.ACTIVE), input_name='ACTIVE')), eol_))
+        if self.DATE is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<DATE>%s</DATE>%s' % (self.gds_format_integer(self.DATE, input_name='DATE'), eol_))
+        if self.ID is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<ID>%s</ID>%s' % (self.gds_format_integer(self.ID, input_name='ID'), eol_))
+        if self.NAME is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<NAME>%s</NAME>%s' % (self.gds_encode(self.gds_format_string(quote_xml(self.NAME), input_name='NAME')), eol_))
+        if self.PARENT is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<PARENT>%s</PARENT>%s' % (self.gds_format_integer(self.PARENT, input_name='PARENT'), eol_))
+        if self.SIZE is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<SIZE>%s</SIZE>%s' % (self.gds_format_integer(self.SIZE, input_name='SIZE'), eol_))
+    def build(self, node):
+        already_processed = set()
+        self.buildAttributes(node, node.attrib, already_processed)
+        for child in node:
+            nodeName_ = Tag_pattern_.match(child.tag).groups()[-1]
+            self.buildChildren(child, node, nodeName_)
+        return self
+    def buildAttributes(self, node, attrs, already_processed):
+        pass
+    def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
+        if nodeName_ == 'CHILDREN':
+            CHILDREN_ = child_.text
+            CHILDREN_ = self.gds_validate_string(CHILDREN_, node, 'CHILDREN')
+            self.CHILDREN = CHILDREN_
+        elif nodeName_ == 'ACTIVE':
+            ACTIVE_ = child_.text
+            ACTIVE_ = self.gds_validate_string(ACTIVE_, node, 'ACTIVE')
+            self.ACTIVE = ACTIVE_
+        elif nodeName_ == 'DATE' and child_.text:
+            sval_ = child_.text
+            try:
+                ival_ = int(sval_)
+            except (TypeError, ValueError) as exp:
+                raise_parse_error(child_, 'requires integer: %s' % exp)
+            ival_ = self.gds_validate_integer(ival_, node, 'DATE')
+            self.DATE = ival_
+        elif nodeName_ == 'ID' and child_.text:
+            sval_ = child_.text
+            try:
+                ival_ = int(sval_)
+            except (TypeError, ValueError) as exp:
+                raise_parse_error(child_, 'requires integer: %s' % exp)
+            ival_ = self.gds_validate_integer(ival_, node, 'ID')
+            self.ID = ival_
+        elif nodeName_ == 'NAME':
+            NAME_ = child_.text
+            NAME_ = self.gds_validate_string(NAME_, node, 'NAME')
+            self.NAME = NAME_
+        elif nodeName_ == 'PARENT' and child_.text:
+            sval_ = child_.text
+            try:
+                ival_ = int(sval_)
+            except (TypeError, ValueError) as exp:
+                raise_parse_error(child_, 'requires integer: %s' % exp)
+            ival_ = self.gds_validate_integer(ival_, node, 'PARENT')
+            self.PARENT = ival_
+        elif nodeName_ == 'SIZE' and child_.text:
+            sval_ = child_.text
+            try:
+                ival_ = int(sval_)
+            except (TypeError, ValueError) as exp:
+                raise_parse_error(child_, 'requires integer: %s' % exp)
+            ival_ = self.gds_validate_integer(ival_, node, 'SIZE')
+            self.SIZE = ival_
+# end class SNAPSHOTType34
+
+
+class IMAGE_POOLSub(TemplatedType, IMAGE_POOL):
+    def __init__(self, IMAGE=None):
+        super(IMAGE_POOLSub, self).__init__(IMAGE, )
+IMAGE_POOL.subclass = IMAGE_POOLSub
+# end class IMAGE_POOLSub
+
+
+class IMAGESub(TemplatedType, IMAGE):
+    def __init__(self, ID=None, UID=None, GID=None, UNAME=None, GNAME=None, NAME=None, PERMISSIONS=None, TYPE=None, DISK_TYPE=None, PERSISTENT=None, REGTIME=None, SOURCE=None, PATH=None, FSTYPE=None, SIZE=None, STATE=None, RUNNING_VMS=None, CLONING_OPS=None, CLONING_ID=None, TARGET_SNAPSHOT=None, DATASTORE_ID=None, DATASTORE=None, VMS=None, CLONES=None, APP_CLONES=None, TEMPLATE=None, SNAPSHOTS=None):
+        super(IMAGESub, self).__init__(ID, UID, GID, UNAME, GNAME, NAME, PERMISSIONS, TYPE, DISK_TYPE, PERSISTENT, REGTIME, SOURCE, PATH, FSTYPE, SIZE, STATE, RUNNING_VMS, CLONING_OPS, CLONING_ID, TARGET_SNAPSHOT, DATASTORE_ID, DATASTORE, VMS, CLONES, APP_CLONES, TEMPLATE, SNAPSHOTS, )
+IMAGE.subclass = IMAGESub
+# end class IMAGESub
+
+
+class PERMISSIONSType31Sub(TemplatedType, PERMISSIONSType31):
+    def __init__(self, OWNER_U=None, OWNER_M=None, OWNER_A=None, GROUP_U=None, GROUP_M=None, GROUP_A=None, OTHER_U=None, OTHER_M=None, OTHER_A=None):
+        super(PERMISSIONSType31Sub, self).__init__(OWNER_U, OWNER_M, OWNER_A, GROUP_U, GROUP_M, GROUP_A, OTHER_U, OTHER_M, OTHER_A, )
+PERMISSIONSType31.subclass = PERMISSIONSType31Sub
+# end class PERMISSIONSType31Sub
+
+
+class VMSType32Sub(TemplatedType, VMSType32):
+    def __init__(self, ID=None):
+        super(VMSType32Sub, self).__init__(ID, )
+VMSType32.subclass = VMSType32Sub
+# end class VMSType32Sub
+
+
+class CLONESTypeSub(TemplatedType, CLONESType):
+    def __init__(self, ID=None):
+        super(CLONESTypeSub, self).__init__(ID, )
+CLONESType.subclass = CLONESTypeSub
+# end class CLONESTypeSub
+
+
+class APP_CLONESTypeSub(TemplatedType, APP_CLONESType):
+    def __init__(self, ID=None):
+        super(APP_CLONESTypeSub, self).__init__(ID, )
+APP_CLONESType.subclass = APP_CLONESTypeSub
+# end class APP_CLONESTypeSub
+
+
+class SNAPSHOTSType33Sub(TemplatedType, SNAPSHOTSType33):
+    def __init__(self, ALLOW_ORPHANS=None, SNAPSHOT=None):
+        super(SNAPSHOTSType33Sub, self).__init__(ALLOW_ORPHANS, SNAPSHOT, )
+SNAPSHOTSType33.subclass = SNAPSHOTSType33Sub
+# end class SNAPSHOTSType33Sub
+
+
+class SNAPSHOTType34Sub(TemplatedType, SNAPSHOTType34):
+    def __init__(self, CHILDREN=None, ACTIVE=None, DATE=None, ID=None, NAME=None, PARENT=None, SIZE=None):
+        super(SNAPSHOTType34Sub, self).__init__(CHILDREN, ACTIVE, DATE, ID, NAME, PARENT, SIZE, )
+SNAPSHOTType34.subclass = SNAPSHOTType34Sub
+# end class SNAPSHOTType34Sub
+
+
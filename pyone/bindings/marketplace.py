@@ -0,0 +1,659 @@
+#!/usr/bin/env python
+
+#
+# Bindings of MARKETPLACE_POOL, MARKETPLACE, generated by generateDS.py and split from supbind by src/split_bindings.py
+#
+
+import sys
+import re as re_
+import base64
+import datetime as datetime_
+import warnings as warnings_
+try:
+    from lxml import etree as etree_
+except ImportError:
+    from xml.etree import ElementTree as etree_
+from pyone.util import TemplatedType
+from . import supbind as supermod
+from .supbind import (
+    GenerateDSNamespaceDefs_,
+    GeneratedsSuper,
+    Tag_pattern_,
+    getSubclassFromModule_,
+    quote_xml,
+    raise_parse_error,
+    showIndent,
+)
+
+
+class MARKETPLACE_POOL(GeneratedsSuper):
+    subclass = None
+    superclass = None
+    def __init__(self, MARKETPLACE=None):
+        self.original_tagname_ = None
+        if MARKETPLACE is None:
+            self.MARKETPLACE = []
+        else:
+            self.MARKETPLACE = MARKETPLACE
+    def factory(*args_, **kwargs_):
+        if supermod.CurrentSubclassModule_ is not None:
+            subclass = getSubclassFromModule_(
+                supermod.CurrentSubclassModule_, MARKETPLACE_POOL)
+            if subclass is not None:
+                return subclass(*args_, **kwargs_)
+        if MARKETPLACE_POOL.subclass:
+            return MARKETPLACE_POOL.subclass(*args_, **kwargs_)
+        else:
+            return MARKETPLACE_POOL(*args_, **kwargs_)
+    factory = staticmethod(factory)
+    def get_MARKETPLACE(self): return self.MARKETPLACE
+    def set_MARKETPLACE(self, MARKETPLACE): self.MARKETPLACE = MARKETPLACE
+    def add_MARKETPLACE(self, value): self.MARKETPLACE.append(value)
+    def insert_MARKETPLACE_at(self, index, value): self.MARKETPLACE.insert(index, value)
+    def replace_MARKETPLACE_at(self, index, value): self.MARKETPLACE[index] = value
+    def hasContent_(self):
+        if (
+            self.MARKETPLACE
+        ):
+            return True
+        else:
+            return False
+    def export(self, outfile, level, namespaceprefix_='', name_='MARKETPLACE_POOL', namespacedef_='', pretty_print=True):
+        imported_ns_def_ = GenerateDSNamespaceDefs_.get('MARKETPLACE_POOL')
+        if imported_ns_def_ is not None:
+            namespacedef_ = imported_ns_def_
+        if pretty_print:
+            eol_ = '\n'
+        else:
+            eol_ = ''
+        if self.original_tagname_ is not None:
+            name_ = self.original_tagname_
+        showIndent(outfile, level, pretty_print)
+        outfile.write('<%s%s%s' % (namespaceprefix_, name_, namespacedef_ and ' ' + namespacedef_ or '', ))
+        already_processed = set()
+        self.exportAttributes(outfile, level, already_processed, namespaceprefix_, name_='MARKETPLACE_POOL')
+        if self.hasContent_():
+            outfile.write('>%s' % (eol_, ))
+            self.exportChildren(outfile, level + 1, namespaceprefix_='', name_='MARKETPLACE_POOL', pretty_print=pretty_print)
+            showIndent(outfile, level, pretty_print)
+            outfile.write('</%s%s>%s' % (namespaceprefix_, name_, eol_))
+        else:
+            outfile.write('/>%s' % (eol_, ))
+    def exportAttributes(self, outfile, level, already_processed, namespaceprefix_='', name_='MARKETPLACE_POOL'):
+        pass
+    def exportChildren(self, outfile, level, namespaceprefix_='', name_='MARKETPLACE_POOL', fromsubclass_=False, pretty_print=True):
+        if pretty_print:
+            eol_ = '\n'
+        else:
+            eol_ = ''
+        for MARKETPLACE_ in self.MARKETPLACE:
+            MARKETPLACE_.export(outfile, level, namespaceprefix_, name_='MARKETPLACE', pretty_print=pretty_print)
+    def build(self, node):
+        already_processed = set()
+        self.buildAttributes(node, node.attrib, already_processed)
+        for child in node:
+            nodeName_ = Tag_pattern_.match(child.tag).groups()[-1]
+            self.buildChildren(child, node, nodeName_)
+        return self
+    def buildAttributes(self, node, attrs, already_processed):
+        pass
+    def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
+        if nodeName_ == 'MARKETPLACE':
+            obj_ = MARKETPLACE.factory()
+            obj_.build(child_)
+            self.MARKETPLACE.append(obj_)
+            obj_.original_tagname_ = 'MARKETPLACE'
+# end class MARKETPLACE_POOL
+
+
+class MARKETPLACE(GeneratedsSuper):
+    subclass = None
+    superclass = None
+    def __init__(self, ID=None, UID=None, GID=None, UNAME=None, GNAME=None, NAME=None, MARKET_MAD=None, ZONE_ID=None, TOTAL_MB=None, FREE_MB=None, USED_MB=None, MARKETPLACEAPPS=None, PERMISSIONS=None, TEMPLATE=None):
+        self.original_tagname_ = None
+        self.ID = ID
+        self.UID = UID
+        self.GID = GID
+        self.UNAME = UNAME
+        self.GNAME = GNAME
+        self.NAME = NAME
+        self.MARKET_MAD = MARKET_MAD
+        self.ZONE_ID = ZONE_ID
+        self.TOTAL_MB = TOTAL_MB
+        self.FREE_MB = FREE_MB
+        self.USED_MB = USED_MB
+        self.MARKETPLACEAPPS = MARKETPLACEAPPS
+        self.PERMISSIONS = PERMISSIONS
+        self.TEMPLATE = TEMPLATE
+    def factory(*args_, **kwargs_):
+        if supermod.CurrentSubclassModule_ is not None:
+            subclass = getSubclassFromModule_(
+                supermod.CurrentSubclassModule_, MARKETPLACE)
+            if subclass is not None:
+                return subclass(*args_, **kwargs_)
+        if MARKETPLACE.subclass:
+            return MARKETPLACE.subclass(*args_, **kwargs_)
+        else:
+            return MARKETPLACE(*args_, **kwargs_)
+    factory = staticmethod(factory)
+    def get_ID(self): return self.ID
+    def set_ID(self, ID): self.ID = ID
+    def get_UID(self): return self.UID
+    def set_UID(self, UID): self.UID = UID
+    def get_GID(self): return self.GID
+    def set_GID(self, GID): self.GID = GID
+    def get_UNAME(self): return self.UNAME
+    def set_UNAME(self, UNAME): self.UNAME = UNAME
+    def get_GNAME(self): return self.GNAME
+    def set_GNAME(self, GNAME): self.GNAME = GNAME
+    def get_NAME(self): return self.NAME
+    def set_NAME(self, NAME): self.NAME = NAME
+    def get_MARKET_MAD(self): return self.MARKET_MAD
+    def set_MARKET_MAD(self, MARKET_MAD): self.MARKET_MAD = MARKET_MAD
+    def get_ZONE_ID(self): return self.ZONE_ID
+    def set_ZONE_ID(self, ZONE_ID): self.ZONE_ID = ZONE_ID
+    def get_TOTAL_MB(self): return self.TOTAL_MB
+    def set_TOTAL_MB(self, TOTAL_MB): self.TOTAL_MB = TOTAL_MB
+    def get_FREE_MB(self): return self.FREE_MB
+    def set_FREE_MB(self, FREE_MB): self.FREE_MB = FREE_MB
+    def get_USED_MB(self): return self.USED_MB
+    def set_USED_MB(self, USED_MB): self.USED_MB = USED_MB
+    def get_MARKETPLACEAPPS(self): return self.MARKETPLACEAPPS
+    def set_MARKETPLACEAPPS(self, MARKETPLACEAPPS): self.MARKETPLACEAPPS = MARKETPLACEAPPS
+    def get_PERMISSIONS(self): return self.PERMISSIONS
+    def set_PERMISSIONS(self, PERMISSIONS): self.PERMISSIONS = PERMISSIONS
+    def get_TEMPLATE(self): return self.TEMPLATE
+    def set_TEMPLATE(self, TEMPLATE): self.TEMPLATE = TEMPLATE
+    def hasContent_(self):
+        if (
+            self.ID is not None or
+            self.UID is not None or
+            self.GID is not None or
+            self.UNAME is not None or
+            self.GNAME is not None or
+            self.NAME is not None or
+            self.MARKET_MAD is not None or
+            self.ZONE_ID is not None or
+            self.TOTAL_MB is not None or
+            self.FREE_MB is not None or
+            self.USED_MB is not None or
+            self.MARKETPLACEAPPS is not None or
+            self.PERMISSIONS is not None or
+            self.TEMPLATE is not None
+        ):
+            return True
+        else:
+            return False
+    def export(self, outfile, level, namespaceprefix_='', name_='MARKETPLACE', namespacedef_='', pretty_print=True):
+        imported_ns_def_ = GenerateDSNamespaceDefs_.get('MARKETPLACE')
+        if imported_ns_def_ is not None:
+            namespacedef_ = imported_ns_def_
+        if pretty_print:
+            eol_ = '\n'
+        else:
+            eol_ = ''
+        if self.original_tagname_ is not None:
+            name_ = self.original_tagname_
+        showIndent(outfile, level, pretty_print)
+        outfile.write('<%s%s%s' % (namespaceprefix_, name_, namespacedef_ and ' ' + namespacedef_ or '', ))
+        already_processed = set()
+        self.exportAttributes(outfile, level, already_processed, namespaceprefix_, name_='MARKETPLACE')
+        if self.hasContent_():
+            outfile.write('>%s' % (eol_, ))
+            self.exportChildren(outfile, level + 1, namespaceprefix_='', name_='MARKETPLACE', pretty_print=pretty_print)
+            showIndent(outfile, level, pretty_print)
+            outfile.write('</%s%s>%s' % (namespaceprefix_, name_, eol_))
+        else:
+            outfile.write('/>%s' % (eol_, ))
+    def exportAttributes(self, outfile, level, already_processed, namespaceprefix_='', name_='MARKETPLACE'):
+        pass
+    def exportChildren(self, outfile, level, namespaceprefix_='', name_='MARKETPLACE', fromsubclass_=False, pretty_print=True):
+        if pretty_print:
+            eol_ = '\n'
+        else:
+            eol_ = ''
+        if self.ID is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<ID>%s</ID>%s' % (self.gds_format_integer(self.ID, input_name='ID'), eol_))
+        if self.UID is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<UID>%s</UID>%s' % (self.gds_format_integer(self.UID, input_name='UID'), eol_))
+        if self.GID is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<GID>%s</GID>%s' % (self.gds_format_integer(self.GID, input_name='GID'), eol_))
+        if self.UNAME is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<UNAME>%s</UNAME>%s' % (self.gds_encode(self.gds_format_string(quote_xml(self.UNAME), input_name='UNAME')), eol_))
+        if self.GNAME is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<GNAME>%s</GNAME>%s' % (self.gds_encode(self.gds_format_string(quote_xml(self.GNAME), input_name='GNAME')), eol_))
+        if self.NAME is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<NAME>%s</NAME>%s' % (self.gds_encode(self.gds_format_string(quote_xml(self.NAME), input_name='NAME')), eol_))
+        if self.MARKET_MAD is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<MARKET_MAD>%s</MARKET_MAD>%s' % (self.gds_encode(self.gds_format_string(quote_xml(self.MARKET_MAD), input_name='MARKET_MAD')), eol_))
+        if self.ZONE_ID is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<ZONE_ID>%s</ZONE_ID>%s' % (self.gds_encode(self.gds_format_string(quote_xml(self.ZONE_ID), input_name='ZONE_ID')), eol_))
+        if self.TOTAL_MB is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<TOTAL_MB>%s</TOTAL_MB>%s' % (self.gds_format_integer(self.TOTAL_MB, input_name='TOTAL_MB'), eol_))
+        if self.FREE_MB is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<FREE_MB>%s</FREE_MB>%s' % (self.gds_format_integer(self.FREE_MB, input_name='FREE_MB'), eol_))
+        if self.USED_MB is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<USED_MB>%s</USED_MB>%s' % (self.gds_format_integer(self.USED_MB, input_name='USED_MB'), eol_))
+        if self.MARKETPLACEAPPS is not None:
+            self.MARKETPLACEAPPS.export(outfile, level, namespaceprefix_, name_='MARKETPLACEAPPS', pretty_print=pretty_print)
+        if self.PERMISSIONS is not None:
+            self.PERMISSIONS.export(outfile, level, namespaceprefix_, name_='PERMISSIONS', pretty_print=pretty_print)
+        if self.TEMPLATE is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<TEMPLATE>%s</TEMPLATE>%s' % (self.gds_encode(self.gds_format_string(quote_xml(self.TEMPLATE), input_name='TEMPLATE')), eol_))
+    def build(self, node):
+        already_processed = set()
+        self.buildAttributes(node, node.attrib, already_processed)
+        for child in node:
+            nodeName_ = Tag_pattern_.match(child.tag).groups()[-1]
+            self.buildChildren(child, node, nodeName_)
+        return self
+    def buildAttributes(self, node, attrs, already_processed):
+        pass
+    def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
+        if nodeName_ == 'ID' and child_.text:
+            sval_ = child_.text
+            try:
+                ival_ = int(sval_)
+            except (TypeError, ValueError) as exp:
+                raise_parse_error(child_, 'requires integer: %s' % exp)
+            ival_ = self.gds_validate_integer(ival_, node, 'ID')
+            self.ID = ival_
+        elif nodeName_ == 'UID' and child_.text:
+            sval_ = child_.text
+            try:
+                ival_ = int(sval_)
+            except (TypeError, ValueError) as exp:
+                raise_parse_error(child_, 'requires integer: %s' % exp)
+            ival_ = self.gds_validate_integer(ival_, node, 'UID')
+            self.UID = ival_
+        elif nodeName_ == 'GID' and child_.text:
+            sval_ = child_.text
+            try:
+                ival_ = int(sval_)
+            except (TypeError, ValueError) as exp:
+                raise_parse_error(child_, 'requires integer: %s' % exp)
+            ival_ = self.gds_validate_integer(ival_, node, 'GID')
+            self.GID = ival_
+        elif nodeName_ == 'UNAME':
+            UNAME_ = child_.text
+            UNAME_ = self.gds_validate_string(UNAME_, node, 'UNAME')
+            self.UNAME = UNAME_
+        elif nodeName_ == 'GNAME':
+            GNAME_ = child_.text
+            GNAME_ = self.gds_validate_string(GNAME_, node, 'GNAME')
+            self.GNAME = GNAME_
+        elif nodeName_ == 'NAME':
+            NAME_ = child_.text
+            NAME_ = self.gds_validate_string(NAME_, node, 'NAME')
+            self.NAME = NAME_
+        elif nodeName_ == 'MARKET_MAD':
+            MARKET_MAD_ = child_.text
+            MARKET_MAD_ = self.gds_validate_string(MARKET_MAD_, node, 'MARKET_MAD')
+            self.MARKET_MAD = MARKET_MAD_
+        elif nodeName_ == 'ZONE_ID':
+            ZONE_ID_ = child_.text
+            ZONE_ID_ = self.gds_validate_string(ZONE_ID_, node, 'ZONE_ID')
+            self.ZONE_ID = ZONE_ID_
+        elif nodeName_ == 'TOTAL_MB' and child_.text:
+            sval_ = child_.text
+            try:
+                ival_ = int(sval_)
+            except (TypeError, ValueError) as exp:
+                raise_parse_error(child_, 'requires integer: %s' % exp)
+            ival_ = self.gds_validate_integer(ival_, node, 'TOTAL_MB')
+            self.TOTAL_MB = ival_
+        elif nodeName_ == 'FREE_MB' and child_.text:
+            sval_ = child_.text
+            try:
+                ival_ = int(sval_)
+            except (TypeError, ValueError) as exp:
+                raise_parse_error(child_, 'requires integer: %s' % exp)
+            ival_ = self.gds_validate_integer(ival_, node, 'FREE_MB')
+            self.FREE_MB = ival_
+        elif nodeName_ == 'USED_MB' and child_.text:
+            sval_ = child_.text
+            try:
+                ival_ = int(sval_)
+            except (TypeError, ValueError) as exp:
+                raise_parse_error(child_, 'requires integer: %s' % exp)
+            ival_ = self.gds_validate_integer(ival_, node, 'USED_MB')
+            self.USED_MB = ival_
+        elif nodeName_ == 'MARKETPLACEAPPS':
+            obj_ = MARKETPLACEAPPSType.factory()
+            obj_.build(child_)
+            self.MARKETPLACEAPPS = obj_
+            obj_.original_tagname_ = 'MARKETPLACEAPPS'
+        elif nodeName_ == 'PERMISSIONS':
+            obj_ = PERMISSIONSType36.factory()
+            obj_.build(child_)
+            self.PERMISSIONS = obj_
+            obj_.original_tagname_ = 'PERMISSIONS'
+        elif nodeName_ == 'TEMPLATE':
+            TEMPLATE_ = child_.text
+            TEMPLATE_ = self.gds_validate_string(TEMPLATE_, node, 'TEMPLATE')
+            self.TEMPLATE = TEMPLATE_
+# end class MARKETPLACE
+
+
+class MARKETPLACEAPPSType(GeneratedsSuper):
+    subclass = None
+    superclass = None
+    def __init__(self, ID=None):
+        self.original_tagname_ = None
+        if ID is None:
+            self.ID = []
+        else:
+            self.ID = ID
+    def factory(*args_, **kwargs_):
+        if supermod.CurrentSubclassModule_ is not None:
+            subclass = getSubclassFromModule_(
+                supermod.CurrentSubclassModule_, MARKETPLACEAPPSType)
+            if subclass is not None:
+                return subclass(*args_, **kwargs_)
+        if MARKETPLACEAPPSType.subclass:
+            return MARKETPLACEAPPSType.subclass(*args_, **kwargs_)
+        else:
+            return MARKETPLACEAPPSType(*args_, **kwargs_)
+    factory = staticmethod(factory)
+    def get_ID(self): return self.ID
+    def set_ID(self, ID): self.ID = ID
+    def add_ID(self, value): self.ID.append(value)
+    def insert_ID_at(self, index, value): self.ID.insert(index, value)
+    def replace_ID_at(self, index, value): self.ID[index] = value
+    def hasContent_(self):
+        if (
+            self.ID
+        ):
+            return True
+        else:
+            return False
+    def export(self, outfile, level, namespaceprefix_='', name_='MARKETPLACEAPPSType', namespacedef_='', pretty_print=True):
+        imported_ns_def_ = GenerateDSNamespaceDefs_.get('MARKETPLACEAPPSType')
+        if imported_ns_def_ is not None:
+            namespacedef_ = imported_ns_def_
+        if pretty_print:
+            eol_ = '\n'
+        else:
+            eol_ = ''
+        if self.original_tagname_ is not None:
+            name_ = self.original_tagname_
+        showIndent(outfile, level, pretty_print)
+        outfile.write('<%s%s%s' % (namespaceprefix_, name_, namespacedef_ and ' ' + namespacedef_ or '', ))
+        already_processed = set()
+        self.exportAttributes(outfile, level, already_processed, namespaceprefix_, name_='MARKETPLACEAPPSType')
+        if self.hasContent_():
+            outfile.write('>%s' % (eol_, ))
+            self.exportChildren(outfile, level + 1, namespaceprefix_='', name_='MARKETPLACEAPPSType', pretty_print=pretty_print)
+            showIndent(outfile, level, pretty_print)
+            outfile.write('</%s%s>%s' % (namespaceprefix_, name_, eol_))
+        else:
+            outfile.write('/>%s' % (eol_, ))
+    def exportAttributes(self, outfile, level, already_processed, namespaceprefix_='', name_='MARKETPLACEAPPSType'):
+        pass
+    def exportChildren(self, outfile, level, namespaceprefix_='', name_='MARKETPLACEAPPSType', fromsubclass_=False, pretty_print=True):
+        if pretty_print:
+            eol_ = '\n'
+        else:
+            eol_ = ''
+        for ID_ in self.ID:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<ID>%s</ID>%s' % (self.gds_format_integer(ID_, input_name='ID'), eol_))
+    def build(self, node):
+        already_processed = set()
+        self.buildAttributes(node, node.attrib, already_processed)
+        for child in node:
+            nodeName_ = Tag_pattern_.match(child.tag).groups()[-1]
+            self.buildChildren(child, node, nodeName_)
+        return self
+    def buildAttributes(self, node, attrs, already_processed):
+        pass
+    def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
+        if nodeName_ == 'ID' and child_.text:
+            sval_ = child_.text
+            try:
+                ival_ = int(sval_)
+            except (TypeError, ValueError) as exp:
+                raise_parse_error(child_, 'requires integer: %s' % exp)
+            ival_ = self.gds_validate_integer(ival_, node, 'ID')
+            self.ID.append(ival_)
+# end class MARKETPLACEAPPSType
+
+
+class PERMISSIONSType36(GeneratedsSuper):
+    subclass = None
+    superclass = None
+    def __init__(self, OWNER_U=None, OWNER_M=None, OWNER_A=None, GROUP_U=None, GROUP_M=None, GROUP_A=None, OTHER_U=None, OTHER_M=None, OTHER_A=None):
+        self.original_tagname_ = None
+        self.OWNER_U = OWNER_U
+        self.OWNER_M = OWNER_M
+        self.OWNER_A = OWNER_A
+        self.GROUP_U = GROUP_U
+        self.GROUP_M = GROUP_M
+        self.GROUP_A = GROUP_A
+        self.OTHER_U = OTHER_U
+        self.OTHER_M = OTHER_M
+        self.OTHER_A = OTHER_A
+    def factory(*args_, **kwargs_):
+        if supermod.CurrentSubclassModule_ is not None:
+            subclass = getSubclassFromModule_(
+                supermod.CurrentSubclassModule_, PERMISSIONSType36)
+            if subclass is not None:
+                return subclass(*args_, **kwargs_)
+        if PERMISSIONSType36.subclass:
+            return PERMISSIONSType36.subclass(*args_, **kwargs_)
+        else:
+            return PERMISSIONSType36(*args_, **kwargs_)
+    factory = staticmethod(factory)
+    def get_OWNER_U(self): return self.OWNER_U
+    def set_OWNER_U(self, OWNER_U): self.OWNER_U = OWNER_U
+    def get_OWNER_M(self): return self.OWNER_M
+    def set_OWNER_M(self, OWNER_M): self.OWNER_M = OWNER_M
+    def get_OWNER_A(self): return self.OWNER_A
+    def set_OWNER_A(self, OWNER_A): self.OWNER_A = OWNER_A
+    def get_GROUP_U(self): return self.GROUP_U
+    def set_GROUP_U(self, GROUP_U): self.GROUP_U = GROUP_U
+    def get_GROUP_M(self): return self.GROUP_M
+    def set_GROUP_M(self, GROUP_M): self.GROUP_M = GROUP_M
+    def get_GROUP_A(self): return self.GROUP_A
+    def set_GROUP_A(self, GROUP_A): self.GROUP_A = GROUP_A
+    def get_OTHER_U(self): return self.OTHER_U
+    def set_OTHER_U(self, OTHER_U): self.OTHER_U = OTHER_U
+    def get_OTHER_M(self): return self.OTHER_M
+    def set_OTHER_M(self, OTHER_M): self.OTHER_M = OTHER_M
+    def get_OTHER_A(self): return self.OTHER_A
+    def set_OTHER_A(self, OTHER_A): self.OTHER_A = OTHER_A
+    def hasContent_(self):
+        if (
+            self.OWNER_U is not None or
+            self.OWNER_M is not None or
+            self.OWNER_A is not None or
+            self.GROUP_U is not None or
+            self.GROUP_M is not None or
+            self.GROUP_A is not None or
+            self.OTHER_U is not None or
+            self.OTHER_M is not None or
+            self.OTHER_A is not None
+        ):
+            return True
+        else:
+            return False
+    def export(self, outfile, level, namespaceprefix_='', name_='PERMISSIONSType36', namespacedef_='', pretty_print=True):
+        imported_ns_def_ = GenerateDSNamespaceDefs_.get('PERMISSIONSType36')
+        if imported_ns_def_ is not None:
+            namespacedef_ = imported_ns_def_
+        if pretty_print:
+            eol_ = '\n'
+        else:
+            eol_ = ''
+        if self.original_tagname_ is not None:
+            name_ = self.original_tagname_
+        showIndent(outfile, level, pretty_print)
+        outfile.write('<%s%s%s' % (namespaceprefix_, name_, namespacedef_ and ' ' + namespacedef_ or '', ))
+        already_processed = set()
+        self.exportAttributes(outfile, level, already_processed, namespaceprefix_, name_='PERMISSIONSType36')
+        if self.hasContent_():
+            outfile.write('>%s' % (eol_, ))
+            self.exportChildren(outfile, level + 1, namespaceprefix_='', name_='PERMISSIONSType36', pretty_print=pretty_print)
+            showIndent(outfile, level, pretty_print)
+            outfile.write('</%s%s>%s' % (namespaceprefix_, name_, eol_))
+        else:
+            outfile.write('/>%s' % (eol_, ))
+    def exportAttributes(self, outfile, level, already_processed, namespaceprefix_='', name_='PERMISSIONSType36'):
+        pass
+    def exportChildren(self, outfile, level, namespaceprefix_='', name_='PERMISSIONSType36', fromsubclass_=False, pretty_print=True):
+        if pretty_print:
+            eol_ = '\n'
+        else:
+            eol_ = ''
+        if self.OWNER_U is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<OWNER_U>%s</OWNER_U>%s' % (self.gds_format_integer(self.OWNER_U, input_name='OWNER_U'), eol_))
+        if self.OWNER_M is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<OWNER_M>%s</OWNER_M>%s' % (self.gds_format_integer(self.OWNER_M, input_name='OWNER_M'), eol_))
+        if self.OWNER_A is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<OWNER_A>%s</OWNER_A>%s' % (self.gds_format_integer(self.OWNER_A, input_name='OWNER_A'), eol_))
+        if self.GROUP_U is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<GROUP_U>%s</GROUP_U>%s' % (self.gds_format_integer(self.GROUP_U, input_name='GROUP_U'), eol_))
+        if self.GROUP_M is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<GROUP_M>%s</GROUP_M>%s' % (self.gds_format_integer(self.GROUP_M, input_name='GROUP_M'), eol_))
+        if self.GROUP_A is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<GROUP_A>%s</GROUP_A>%s' % (self.gds_format_integer(self.GROUP_A, input_name='GROUP_A'), eol_))
+        if self.OTHER_U is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<OTHER_U>%s</OTHER_U>%s' % (self.gds_format_integer(self.OTHER_U, input_name='OTHER_U'), eol_))
+        if self.OTHER_M is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<OTHER_M>%s</OTHER_M>%s' % (self.gds_format_integer(self.OTHER_M, input_name='OTHER_M'), eol_))
+        if self.OTHER_A is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<OTHER_A>%s</OTHER_A>%s' % (self.gds_format_integer(self.OTHER_A, input_name='OTHER_A'), eol_))
+    def build(self, node):
+        already_processed = set()
+        self.buildAttributes(node, node.attrib, already_processed)
+        for child in node:
+            nodeName_ = Tag_pattern_.match(child.tag).groups()[-1]
+            self.buildChildren(child, node, nodeName_)
+        return self
+    def buildAttributes(self, node, attrs, already_processed):
+        pass
+    def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
+        if nodeName_ == 'OWNER_U' and child_.text:
+            sval_ = child_.text
+            try:
+                ival_ = int(sval_)
+            except (TypeError, ValueError) as exp:
+                raise_parse_error(child_, 'requires integer: %s' % exp)
+            ival_ = self.gds_validate_integer(ival_, node, 'OWNER_U')
+            self.OWNER_U = ival_
+        elif nodeName_ == 'OWNER_M' and child_.text:
+            sval_ = child_.text
+            try:
+                ival_ = int(sval_)
+            except (TypeError, ValueError) as exp:
+                raise_parse_error(child_, 'requires integer: %s' % exp)
+            ival_ = self.gds_validate_integer(ival_, node, 'OWNER_M')
+            self.OWNER_M = ival_
+        elif nodeName_ == 'OWNER_A' and child_.text:
+            sval_ = child_.text
+            try:
+                ival_ = int(sval_)
+            except (TypeError, ValueError) as exp:
+                raise_parse_error(child_, 'requires integer: %s' % exp)
+            ival_ = self.gds_validate_integer(ival_, node, 'OWNER_A')
+            self.OWNER_A = ival_
+        elif nodeName_ == 'GROUP_U' and child_.text:
+            sval_ = child_.text
+            try:
+                ival_ = int(sval_)
+            except (TypeError, ValueError) as exp:
+                raise_parse_error(child_, 'requires integer: %s' % exp)
+            ival_ = self.gds_validate_integer(ival_, node, 'GROUP_U')
+            self.GROUP_U = ival_
+        elif nodeName_ == 'GROUP_M' and child_.text:
+            sval_ = child_.text
+            try:
+                ival_ = int(sval_)
+            except (TypeError, ValueError) as exp:
+                raise_parse_error(child_, 'requires integer: %s' % exp)
+            ival_ = self.gds_validate_integer(ival_, node, 'GROUP_M')
+            self.GROUP_M = ival_
+        elif nodeName_ == 'GROUP_A' and child_.text:
+            sval_ = child_.text
+            try:
+                ival_ = int(sval_)
+            except (TypeError, ValueError) as exp:
+                raise_parse_error(child_, 'requires integer: %s' % exp)
+            ival_ = self.gds_validate_integer(ival_, node, 'GROUP_A')
+            self.GROUP_A = ival_
+        elif nodeName_ == 'OTHER_U' and child_.text:
+            sval_ = child_.text
+            try:
+                ival_ = int(sval_)
+            except (TypeError, ValueError) as exp:
+                raise_parse_error(child_, 'requires integer: %s' % exp)
+            ival_ = self.gds_validate_integer(ival_, node, 'OTHER_U')
+            self.OTHER_U = ival_
+        elif nodeName_ == 'OTHER_M' and child_.text:
+            sval_ = child_.text
+            try:
+                ival_ = int(sval_)
+            except (TypeError, ValueError) as exp:
+                raise_parse_error(child_, 'requires integer: %s' % exp)
+            ival_ = self.gds_validate_integer(ival_, node, 'OTHER_M')
+            self.OTHER_M = ival_
+        elif nodeName_ == 'OTHER_A' and child_.text:
+            sval_ = child_.text
+            try:
+                ival_ = int(sval_)
+            except (TypeError, ValueError) as exp:
+                raise_parse_error(child_, 'requires integer: %s' % exp)
+            ival_ = self.gds_validate_integer(ival_, node, 'OTHER_A')
+            self.OTHER_A = ival_
+# end class PERMISSIONSType36
+
+
+class MARKETPLACE_POOLSub(TemplatedType, MARKETPLACE_POOL):
+    def __init__(self, MARKETPLACE=None):
+        super(MARKETPLACE_POOLSub, self).__init__(MARKETPLACE, )
+MARKETPLACE_POOL.subclass = MARKETPLACE_POOLSub
+# end class MARKETPLACE_POOLSub
+
+
+class MARKETPLACESub(TemplatedType, MARKETPLACE):
+    def __init__(self, ID=None, UID=None, GID=None, UNAME=None, GNAME=None, NAME=None, MARKET_MAD=None, ZONE_ID=None, TOTAL_MB=None, FREE_MB=None, USED_MB=None, MARKETPLACEAPPS=None, PERMISSIONS=None, TEMPLATE=None):
+        super(MARKETPLACESub, self).__init__(ID, UID, GID, UNAME, GNAME, NAME, MARKET_MAD, ZONE_ID, TOTAL_MB, FREE_MB, USED_MB, MARKETPLACEAPPS, PERMISSIONS, TEMPLATE, )
+MARKETPLACE.subclass = MARKETPLACESub
+# end class MARKETPLACESub
+
+
+class MARKETPLACEAPPSTypeSub(TemplatedType, MARKETPLACEAPPSType):
+    def __init__(self, ID=None):
+        super(MARKETPLACEAPPSTypeSub, self).__init__(ID, )
+MARKETPLACEAPPSType.subclass = MARKETPLACEAPPSTypeSub
+# end class MARKETPLACEAPPSTypeSub
+
+
+class PERMISSIONSType36Sub(TemplatedType, PERMISSIONSType36):
+    def __init__(self, OWNER_U=None, OWNER_M=None, OWNER_A=None, GROUP_U=None, GROUP_M=None, GROUP_A=None, OTHER_U=None, OTHER_M=None, OTHER_A=None):
+        super(PERMISSIONSType36Sub, self).__init__(OWNER_U, OWNER_M, OWNER_A, GROUP_U, GROUP_M, GROUP_A, OTHER_U, OTHER_M, OTHER_A, )
+PERMISSIONSType36.subclass = PERMISSIONSType36Sub
+# end class PERMISSIONSType36Sub
+
+
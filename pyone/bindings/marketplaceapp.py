@@ -0,0 +1,664 @@
+#!/usr/bin/env python
+
+#
+# Bindings of MARKETPLACEAPP_POOL, MARKETPLACEAPP, generated by generateDS.py and split from supbind by src/split_bindings.py
+#
+
+import sys
+import re as re_
+import base64
+import datetime as datetime_
+import warnings as warnings_
+try:
+    from lxml import etree as etree_
+except ImportError:
+    from xml.etree import ElementTree as etree_
+from pyone.util import TemplatedType
+from . import supbind as supermod
+from .supbind import (
+    GenerateDSNamespaceDefs_,
+    GeneratedsSuper,
+    Tag_pattern_,
+    getSubclassFromModule_,
+    quote_xml,
+    raise_parse_error,
+    showIndent,
+)
+
+
+class MARKETPLACEAPP_POOL(GeneratedsSuper):
+    subclass = None
+    superclass = None
+    def __init__(self, MARKETPLACEAPP=None):
+        self.original_tagname_ = None
+        if MARKETPLACEAPP is None:
+            self.MARKETPLACEAPP = []
+        else:
+            self.MARKETPLACEAPP = MARKETPLACEAPP
+    def factory(*args_, **kwargs_):
+        if supermod.CurrentSubclassModule_ is not None:
+            subclass = getSubclassFromModule_(
+                supermod.CurrentSubclassModule_, MARKETPLACEAPP_POOL)
+            if subclass is not None:
+                return subclass(*args_, **kwargs_)
+        if MARKETPLACEAPP_POOL.subclass:
+            return MARKETPLACEAPP_POOL.subclass(*args_, **kwargs_)
+        else:
+            return MARKETPLACEAPP_POOL(*args_, **kwargs_)
+    factory = staticmethod(factory)
+    def get_MARKETPLACEAPP(self): return self.MARKETPLACEAPP
+    def set_MARKETPLACEAPP(self, MARKETPLACEAPP): self.MARKETPLACEAPP = MARKETPLACEAPP
+    def add_MARKETPLACEAPP(self, value): self.MARKETPLACEAPP.append(value)
+    def insert_MARKETPLACEAPP_at(self, index, value): self.MARKETPLACEAPP.insert(index, value)
+    def replace_MARKETPLACEAPP_at(self, index, value): self.MARKETPLACEAPP[index] = value
+    def hasContent_(self):
+        if (
+            self.MARKETPLACEAPP
+        ):
+            return True
+        else:
+            return False
+    def export(self, outfile, level, namespaceprefix_='', name_='MARKETPLACEAPP_POOL', namespacedef_='', pretty_print=True):
+        imported_ns_def_ = GenerateDSNamespaceDefs_.get('MARKETPLACEAPP_POOL')
+        if imported_ns_def_ is not None:
+            namespacedef_ = imported_ns_def_
+        if pretty_print:
+            eol_ = '\n'
+        else:
+            eol_ = ''
+        if self.original_tagname_ is not None:
+            name_ = self.original_tagname_
+        showIndent(outfile, level, pretty_print)
+        outfile.write('<%s%s%s' % (namespaceprefix_, name_, namespacedef_ and ' ' + namespacedef_ or '', ))
+        already_processed = set()
+        self.exportAttributes(outfile, level, already_processed, namespaceprefix_, name_='MARKETPLACEAPP_POOL')
+        if self.hasContent_():
+            outfile.write('>%s' % (eol_, ))
+            self.exportChildren(outfile, level + 1, namespaceprefix_='', name_='MARKETPLACEAPP_POOL', pretty_print=pretty_print)
+            showIndent(outfile, level, pretty_print)
+            outfile.write('</%s%s>%s' % (namespaceprefix_, name_, eol_))
+        else:
+            outfile.write('/>%s' % (eol_, ))
+    def exportAttributes(self, outfile, level, already_processed, namespaceprefix_='', name_='MARKETPLACEAPP_POOL'):
+        pass
+    def exportChildren(self, outfile, level, namespaceprefix_='', name_='MARKETPLACEAPP_POOL', fromsubclass_=False, pretty_print=True):
+        if pretty_print:
+            eol_ = '\n'
+        else:
+            eol_ = ''
+        for MARKETPLACEAPP_ in self.MARKETPLACEAPP:
+            MARKETPLACEAPP_.export(outfile, level, namespaceprefix_, name_='MARKETPLACEAPP', pretty_print=pretty_print)
+    def build(self, node):
+        already_processed = set()
+        self.buildAttributes(node, node.attrib, already_processed)
+        for child in node:
+            nodeName_ = Tag_pattern_.match(child.tag).groups()[-1]
+            self.buildChildren(child, node, nodeName_)
+        return self
+    def buildAttributes(self, node, attrs, already_processed):
+        pass
+    def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
+        if nodeName_ == 'MARKETPLACEAPP':
+            obj_ = MARKETPLACEAPP.factory()
+            obj_.build(child_)
+            self.MARKETPLACEAPP.append(obj_)
+            obj_.original_tagname_ = 'MARKETPLACEAPP'
+# end class MARKETPLACEAPP_POOL
+
+
+class MARKETPLACEAPP(GeneratedsSuper):
+    subclass = None
+    superclass = None
+    def __init__(self, ID=None, UID=None, GID=None, UNAME=None, GNAME=None, REGTIME=None, NAME=None, ZONE_ID=None, ORIGIN_ID=None, SOURCE=None, MD5=None, SIZE=None, DESCRIPTION=None, VERSION=None, FORMAT=None, APPTEMPLATE64=None, MARKETPLACE_ID=None, MARKETPLACE=None, STATE=None, TYPE=None, PERMISSIONS=None, TEMPLATE=None):
+        self.original_tagname_ = None
+        self.ID = ID
+        self.UID = UID
+        self.GID = GID
+        self.UNAME = UNAME
+        self.GNAME = GNAME
+        self.REGTIME = REGTIME
+        self.NAME = NAME
+        self.ZONE_ID = ZONE_ID
+        self.ORIGIN_ID = ORIGIN_ID
+        self.SOURCE = SOURCE
+        self.MD5 = MD5
+        self.SIZE = SIZE
+        self.DESCRIPTION = DESCRIPTION
+        self.VERSION = VERSION
+        self.FORMAT = FORMAT
+        self.APPTEMPLATE64 = APPTEMPLATE64
+        self.MARKETPLACE_ID = MARKETPLACE_ID
+        self.MARKETPLACE = MARKETPLACE
+        self.STATE = STATE
+        self.TYPE = TYPE
+        self.PERMISSIONS = PERMISSIONS
+        self.TEMPLATE = TEMPLATE
+    def factory(*args_, **kwargs_):
+        if supermod.CurrentSubclassModule_ is not None:
+            subclass = getSubclassFromModule_(
+                supermod.CurrentSubclassModule_, MARKETPLACEAPP)
+            if subclass is not None:
+                return subclass(*args_, **kwargs_)
+        if MARKETPLACEAPP.subclass:
+            return MARKETPLACEAPP.subclass(*args_, **kwargs_)
+        else:
+            return MARKETPLACEAPP(*args_, **kwargs_)
+    factory = staticmethod(factory)
+    def get_ID(self): return self.ID
+    def set_ID(self, ID): self.ID = ID
+    def get_UID(self): return self.UID
+    def set_UID(self, UID): self.UID = UID
+    def get_GID(self): return self.GID
+    def set_GID(self, GID): self.GID = GID
+    def get_UNAME(self): return self.UNAME
+    def set_UNAME(self, UNAME): self.UNAME = UNAME
+    def get_GNAME(self): return self.GNAME
+    def set_GNAME(self, GNAME): self.GNAME = GNAME
+    def get_REGTIME(self): return self.REGTIME
+    def set_REGTIME(self, REGTIME): self.REGTIME = REGTIME
+    def get_NAME(self): return self.NAME
+    def set_NAME(self, NAME): self.NAME = NAME
+    def get_ZONE_ID(self): return self.ZONE_ID
+    def set_ZONE_ID(self, ZONE_ID): self.ZONE_ID = ZONE_ID
+    def get_ORIGIN_ID(self): return self.ORIGIN_ID
+    def set_ORIGIN_ID(self, ORIGIN_ID): self.ORIGIN_ID = ORIGIN_ID
+    def get_SOURCE(self): return self.SOURCE
+    def set_SOURCE(self, SOURCE): self.SOURCE = SOURCE
+    def get_MD5(self): return self.MD5
+    def set_MD5(self, MD5): self.MD5 = MD5
+    def get_SIZE(self): return self.SIZE
+    def set_SIZE(self, SIZE): self.SIZE = SIZE
+    def get_DESCRIPTION(self): return self.DESCRIPTION
+    def set_DESCRIPTION(self, DESCRIPTION): self.DESCRIPTION = DESCRIPTION
+    def get_VERSION(self): return self.VERSION
+    def set_VERSION(self, VERSION): self.VERSION = VERSION
+    def get_FORMAT(self): return self.FORMAT
+    def set_FORMAT(self, FORMAT): self.FORMAT = FORMAT
+    def get_APPTEMPLATE64(self): return self.APPTEMPLATE64
+    def set_APPTEMPLATE64(self, APPTEMPLATE64): self.APPTEMPLATE64 = APPTEMPLATE64
+    def get_MARKETPLACE_ID(self): return self.MARKETPLACE_ID
+    def set_MARKETPLACE_ID(self, MARKETPLACE_ID): self.MARKETPLACE_ID = MARKETPLACE_ID
+    def get_MARKETPLACE(self): return self.MARKETPLACE
+    def set_MARKETPLACE(self, MARKETPLACE): self.MARKETPLACE = MARKETPLACE
+    def get_STATE(self): return self.STATE
+    def set_STATE(self, STATE): self.STATE = STATE
+    def get_TYPE(self): return self.TYPE
+    def set_TYPE(self, TYPE): self.TYPE = TYPE
+    def get_PERMISSIONS(self): return self.PERMISSIONS
+    def set_PERMISSIONS(self, PERMISSIONS): self.PERMISSIONS = PERMISSIONS
+    def get_TEMPLATE(self): return self.TEMPLATE
+    def set_TEMPLATE(self, TEMPLATE): self.TEMPLATE = TEMPLATE
+    def hasContent_(self):
+        if (
+            self.ID is not None or
+            self.UID is not None or
+            self.GID is not None or
+            self.UNAME is not None or
+            self.GNAME is not None or
+            self.REGTIME is not None or
+            self.NAME is not None or
+            self.ZONE_ID is not None or
+            self.ORIGIN_ID is not None or
+            self.SOURCE is not None or
+            self.MD5 is not None or
+            self.SIZE is not None or
+            self.DESCRIPTION is not None or
+            self.VERSION is not None or
+            self.FORMAT is not None or
+            self.APPTEMPLATE64 is not None or
+            self.MARKETPLACE_ID is not None or
+            self.MARKETPLACE is not None or
+            self.STATE is not None or
+            self.TYPE is not None or
+            self.PERMISSIONS is not None or
+            self.TEMPLATE is not None
+        ):
+            return True
+        else:
+            return False
+    def export(self, outfile, level, namespaceprefix_='', name_='MARKETPLACEAPP', namespacedef_='', pretty_print=True):
+        imported_ns_def_ = GenerateDSNamespaceDefs_.get('MARKETPLACEAPP')
+        if imported_ns_def_ is not None:
+            namespacedef_ = imported_ns_def_
+        if pretty_print:
+            eol_ = '\n'
+        else:
+            eol_ = ''
+        if self.original_tagname_ is not None:
+            name_ = self.original_tagname_
+        showIndent(outfile, level, pretty_print)
+        outfile.write('<%s%s%s' % (namespaceprefix_, name_, namespacedef_ and ' ' + namespacedef_ or '', ))
+        already_processed = set()
+        self.exportAttributes(outfile, level, already_processed, namespaceprefix_, name_='MARKETPLACEAPP')
+        if self.hasContent_():
+            outfile.write('>%s' % (eol_, ))
+            self.exportChildren(outfile, level + 1, namespaceprefix_='', name_='MARKETPLACEAPP', pretty_print=pretty_print)
+            showIndent(outfile, level, pretty_print)
+            outfile.write('</%s%s>%s' % (namespaceprefix_, name_, eol_))
+        else:
+            outfile.write('/>%s' % (eol_, ))
+    def exportAttributes(self, outfile, level, already_processed, namespaceprefix_='', name_='MARKETPLACEAPP'):
+        pass
+    def exportChildren(self, outfile, level, namespaceprefix_='', name_='MARKETPLACEAPP', fromsubclass_=False, pretty_print=True):
+        if pretty_print:
+            eol_ = '\n'
+        else:
+            eol_ = ''
+        if self.ID is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<ID>%s</ID>%s' % (self.gds_format_integer(self.ID, input_name='ID'), eol_))
+        if self.UID is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<UID>%s</UID>%s' % (self.gds_format_integer(self.UID, input_name='UID'), eol_))
+        if self.GID is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<GID>%s</GID>%s' % (self.gds_format_integer(self.GID, input_name='GID'), eol_))
+        if self.UNAME is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<UNAME>%s</UNAME>%s' % (self.gds_encode(self.gds_format_string(quote_xml(self.UNAME), input_name='UNAME')), eol_))
+        if self.GNAME is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<GNAME>%s</GNAME>%s' % (self.gds_encode(self.gds_format_string(quote_xml(self.GNAME), input_name='GNAME')), eol_))
+        if self.REGTIME is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<REGTIME>%s</REGTIME>%s' % (self.gds_format_integer(self.REGTIME, input_name='REGTIME'), eol_))
+        if self.NAME is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<NAME>%s</NAME>%s' % (self.gds_encode(self.gds_format_string(quote_xml(self.NAME), input_name='NAME')), eol_))
+        if self.ZONE_ID is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<ZONE_ID>%s</ZONE_ID>%s' % (self.gds_encode(self.gds_format_string(quote_xml(self.ZONE_ID), input_name='ZONE_ID')), eol_))
+        if self.ORIGIN_ID is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<ORIGIN_ID>%s</ORIGIN_ID>%s' % (self.gds_encode(self.gds_format_string(quote_xml(self.ORIGIN_ID), input_name='ORIGIN_ID')), eol_))
+        if self.SOURCE is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<SOURCE>%s</SOURCE>%s' % (self.gds_encode(self.gds_format_string(quote_xml(self.SOURCE), input_name='SOURCE')), eol_))
+        if self.MD5 is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<MD5>%s</MD5>%s' % (self.gds_encode(self.gds_format_string(quote_xml(self.MD5), input_name='MD5')), eol_))
+        if self.SIZE is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<SIZE>%s</SIZE>%s' % (self.gds_format_integer(self.SIZE, input_name='SIZE'), eol_))
+        if self.DESCRIPTION is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<DESCRIPTION>%s</DESCRIPTION>%s' % (self.gds_encode(self.gds_format_string(quote_xml(self.DESCRIPTION), input_name='DESCRIPTION')), eol_))
+        if self.VERSION is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<VERSION>%s</VERSION>%s' % (self.gds_encode(self.gds_format_string(quote_xml(self.VERSION), input_name='VERSION')), eol_))
+        if self.FORMAT is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<FORMAT>%s</FORMAT>%s' % (self.gds_encode(self.gds_format_string(quote_xml(self.FORMAT), input_name='FORMAT')), eol_))
+        if self.APPTEMPLATE64 is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<APPTEMPLATE64>%s</APPTEMPLATE64>%s' % (self.gds_encode(self.gds_format_string(quote_xml(self.APPTEMPLATE64), input_name='APPTEMPLATE64')), eol_))
+        if self.MARKETPLACE_ID is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<MARKETPLACE_ID>%s</MARKETPLACE_ID>%s' % (self.gds_format_integer(self.MARKETPLACE_ID, input_name='MARKETPLACE_ID'), eol_))
+        if self.MARKETPLACE is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<MARKETPLACE>%s</MARKETPLACE>%s' % (self.gds_encode(self.gds_format_string(quote_xml(self.MARKETPLACE), input_name='MARKETPLACE')), eol_))
+        if self.STATE is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<STATE>%s</STATE>%s' % (self.gds_format_integer(self.STATE, input_name='STATE'), eol_))
+        if self.TYPE is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<TYPE>%s</TYPE>%s' % (self.gds_format_integer(self.TYPE, input_name='TYPE'), eol_))
+        if self.PERMISSIONS is not None:
+            self.PERMISSIONS.export(outfile, level, namespaceprefix_, name_='PERMISSIONS', pretty_print=pretty_print)
+        if self.TEMPLATE is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<TEMPLATE>%s</TEMPLATE>%s' % (self.gds_encode(self.gds_format_string(quote_xml(self.TEMPLATE), input_name='TEMPLATE')), eol_))
+    def build(self, node):
+        already_processed = set()
+        self.buildAttributes(node, node.attrib, already_processed)
+        for child in node:
+            nodeName_ = Tag_pattern_.match(child.tag).groups()[-1]
+            self.buildChildren(child, node, nodeName_)
+        return self
+    def buildAttributes(self, node, attrs, already_processed):
+        pass
+    def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
+        if nodeName_ == 'ID' and child_.text:
+            sval_ = child_.text
+            try:
+                ival_ = int(sval_)
+            except (TypeError, ValueError) as exp:
+                raise_parse_error(child_, 'requires integer: %s' % exp)
+            ival_ = self.gds_validate_integer(ival_, node, 'ID')
+            self.ID = ival_
+        elif nodeName_ == 'UID' and child_.text:
+            sval_ = child_.text
+            try:
+                ival_ = int(sval_)
+            except (TypeError, ValueError) as exp:
+                raise_parse_error(child_, 'requires integer: %s' % exp)
+            ival_ = self.gds_validate_integer(ival_, node, 'UID')
+            self.UID = ival_
+        elif nodeName_ == 'GID' and child_.text:
+            sval_ = child_.text
+            try:
+                ival_ = int(sval_)
+            except (TypeError, ValueError) as exp:
+                raise_parse_error(child_, 'requires integer: %s' % exp)
+            ival_ = self.gds_validate_integer(ival_, node, 'GID')
+            self.GID = ival_
+        elif nodeName_ == 'UNAME':
+            UNAME_ = child_.text
+            UNAME_ = self.gds_validate_string(UNAME_, node, 'UNAME')
+            self.UNAME = UNAME_
+        elif nodeName_ == 'GNAME':
+            GNAME_ = child_.text
+            GNAME_ = self.gds_validate_string(GNAME_, node, 'GNAME')
+            self.GNAME = GNAME_
+        elif nodeName_ == 'REGTIME' and child_.text:
+            sval_ = child_.text
+            try:
+                ival_ = int(sval_)
+            except (TypeError, ValueError) as exp:
+                raise_parse_error(child_, 'requires integer: %s' % exp)
+            ival_ = self.gds_validate_integer(ival_, node, 'REGTIME')
+            self.REGTIME = ival_
+        elif nodeName_ == 'NAME':
+            NAME_ = child_.text
+            NAME_ = self.gds_validate_string(NAME_, node, 'NAME')
+            self.NAME = NAME_
+        elif nodeName_ == 'ZONE_ID':
+            ZONE_ID_ = child_.text
+            ZONE_ID_ = self.gds_validate_string(ZONE_ID_, node, 'ZONE_ID')
+            self.ZONE_ID = ZONE_ID_
+        elif nodeName_ == 'ORIGIN_ID':
+            ORIGIN_ID_ = child_.text
+            ORIGIN_ID_ = self.gds_validate_string(ORIGIN_ID_, node, 'ORIGIN_ID')
+            self.ORIGIN_ID = ORIGIN_ID_
+        elif nodeName_ == 'SOURCE':
+            SOURCE_ = child_.text
+            SOURCE_ = self.gds_validate_string(SOURCE_, node, 'SOURCE')
+            self.SOURCE = SOURCE_
+        elif nodeName_ == 'MD5':
+            MD5_ = child_.text
+            MD5_ = self.gds_validate_string(MD5_, node, 'MD5')
+            self.MD5 = MD5_
+        elif nodeName_ == 'SIZE' and child_.text:
+            sval_ = child_.text
+            try:
+                ival_ = int(sval_)
+            except (TypeError, ValueError) as exp:
+                raise_parse_error(child_, 'requires integer: %s' % exp)
+            ival_ = self.gds_validate_integer(ival_, node, 'SIZE')
+            self.SIZE = ival_
+        elif nodeName_ == 'DESCRIPTION':
+            DESCRIPTION_ = child_.text
+            DESCRIPTION_ = self.gds_validate_string(DESCRIPTION_, node, 'DESCRIPTION')
+            self.DESCRIPTION = DESCRIPTION_
+        elif nodeName_ == 'VERSION':
+            VERSION_ = child_.text
+            VERSION_ = self.gds_validate_string(VERSION_, node, 'VERSION')
+            self.VERSION = VERSION_
+        elif nodeName_ == 'FORMAT':
+            FORMAT_ = child_.text
+            FORMAT_ = self.gds_validate_string(FORMAT_, node, 'FORMAT')
+            self.FORMAT = FORMAT_
+        elif nodeName_ == 'APPTEMPLATE64':
+            APPTEMPLATE64_ = child_.text
+            APPTEMPLATE64_ = self.gds_validate_string(APPTEMPLATE64_, node, 'APPTEMPLATE64')
+            self.APPTEMPLATE64 = APPTEMPLATE64_
+        elif nodeName_ == 'MARKETPLACE_ID' and child_.text:
+            sval_ = child_.text
+            try:
+                ival_ = int(sval_)
+            except (TypeError, ValueError) as exp:
+                raise_parse_error(child_, 'requires integer: %s' % exp)
+            ival_ = self.gds_validate_integer(ival_, node, 'MARKETPLACE_ID')
+            self.MARKETPLACE_ID = ival_
+        elif nodeName_ == 'MARKETPLACE':
+            MARKETPLACE_ = child_.text
+            MARKETPLACE_ = self.gds_validate_string(MARKETPLACE_, node, 'MARKETPLACE')
+            self.MARKETPLACE = MARKETPLACE_
+        elif nodeName_ == 'STATE' and child_.text:
+            sval_ = child_.text
+            try:
+                ival_ = int(sval_)
+            except (TypeError, ValueError) as exp:
+                raise_parse_error(child_, 'requires integer: %s' % exp)
+            ival_ = self.gds_validate_integer(ival_, node, 'STATE')
+            self.STATE = ival_
+        elif nodeName_ == 'TYPE' and child_.text:
+            sval_ = child_.text
+            try:
+                ival_ = int(sval_)
+            except (TypeError, ValueError) as exp:
+                raise_parse_error(child_, 'requires integer: %s' % exp)
+            ival_ = self.gds_validate_integer(ival_, node, 'TYPE')
+            self.TYPE = ival_
+        elif nodeName_ == 'PERMISSIONS':
+            obj_ = PERMISSIONSType35.factory()
+            obj_.build(child_)
+            self.PERMISSIONS = obj_
+            obj_.original_tagname_ = 'PERMISSIONS'
+        elif nodeName_ == 'TEMPLATE':
+            TEMPLATE_ = child_.text
+            TEMPLATE_ = self.gds_validate_string(TEMPLATE_, node, 'TEMPLATE')
+            self.TEMPLATE = TEMPLATE_
+# end class MARKETPLACEAPP
+
+
+class PERMISSIONSType35(GeneratedsSuper):
+    subclass = None
+    superclass = None
+    def __init__(self, OWNER_U=None, OWNER_M=None, OWNER_A=None, GROUP_U=None, GROUP_M=None, GROUP_A=None, OTHER_U=None, OTHER_M=None, OTHER_A=None):
+        self.original_tagname_ = None
+        self.OWNER_U = OWNER_U
+        self.OWNER_M = OWNER_M
+        self.OWNER_A = OWNER_A
+        self.GROUP_U = GROUP_U
+        self.GROUP_M = GROUP_M
+        self.GROUP_A = GROUP_A
+        self.OTHER_U = OTHER_U
+        self.OTHER_M = OTHER_M
+        self.OTHER_A = OTHER_A
+    def factory(*args_, **kwargs_):
+        if supermod.CurrentSubclassModule_ is not None:
+            subclass = getSubclassFromModule_(
+                supermod.CurrentSubclassModule_, PERMISSIONSType35)
+            if subclass is not None:
+                return subclass(*args_, **kwargs_)
+        if PERMISSIONSType35.subclass:
+            return PERMISSIONSType35.subclass(*args_, **kwargs_)
+        else:
+            return PERMISSIONSType35(*args_, **kwargs_)
+    factory = staticmethod(factory)
+    def get_OWNER_U(self): return self.OWNER_U
+    def set_OWNER_U(self, OWNER_U): self.OWNER_U = OWNER_U
+    def get_OWNER_M(self): return self.OWNER_M
+    def set_OWNER_M(self, OWNER_M): self.OWNER_M = OWNER_M
+    def get_OWNER_A(self): return self.OWNER_A
+    def set_OWNER_A(self, OWNER_A): self.OWNER_A = OWNER_A
+    def get_GROUP_U(self): return self.GROUP_U
+    def set_GROUP_U(self, GROUP_U): self.GROUP_U = GROUP_U
+    def get_GROUP_M(self): return self.GROUP_M
+    def set_GROUP_M(self, GROUP_M): self.GROUP_M = GROUP_M
+    def get_GROUP_A(self): return self.GROUP_A
+    def set_GROUP_A(self, GROUP_A): self.GROUP_A = GROUP_A
+    def get_OTHER_U(self): return self.OTHER_U
+    def set_OTHER_U(self, OTHER_U): self.OTHER_U = OTHER_U
+    def get_OTHER_M(self): return self.OTHER_M
+    def set_OTHER_M(self, OTHER_M): self.OTHER_M = OTHER_M
+    def get_OTHER_A(self): return self.OTHER_A
+    def set_OTHER_A(self, OTHER_A): self.OTHER_A = OTHER_A
+    def hasContent_(self):
+        if (
+            self.OWNER_U is not None or
+            self.OWNER_M is not None or
+            self.OWNER_A is not None or
+            self.GROUP_U is not None or
+            self.GROUP_M is not None or
+            self.GROUP_A is not None or
+            self.OTHER_U is not None or
+            self.OTHER_M is not None or
+            self.OTHER_A is not None
+        ):
+            return True
+        else:
+            return False
+    def export(self, outfile, level, namespaceprefix_='', name_='PERMISSIONSType35', namespacedef_='', pretty_print=True):
+        imported_ns_def_ = GenerateDSNamespaceDefs_.get('PERMISSIONSType35')
+        if imported_ns_def_ is not None:
+            namespacedef_ = imported_ns_def_
+        if pretty_print:
+            eol_ = '\n'
+        else:
+            eol_ = ''
+        if self.original_tagname_ is not None:
+            name_ = self.original_tagname_
+        showIndent(outfile, level, pretty_print)
+        outfile.write('<%s%s%s' % (namespaceprefix_, name_, namespacedef_ and ' ' + namespacedef_ or '', ))
+        already_processed = set()
+        self.exportAttributes(outfile, level, already_processed, namespaceprefix_, name_='PERMISSIONSType35')
+        if self.hasContent_():
+            outfile.write('>%s' % (eol_, ))
+            self.exportChildren(outfile, level + 1, namespaceprefix_='', name_='PERMISSIONSType35', pretty_print=pretty_print)
+            showIndent(outfile, level, pretty_print)
+            outfile.write('</%s%s>%s' % (namespaceprefix_, name_, eol_))
+        else:
+            outfile.write('/>%s' % (eol_, ))
+    def exportAttributes(self, outfile, level, already_processed, namespaceprefix_='', name_='PERMISSIONSType35'):
+        pass
+    def exportChildren(self, outfile, level, namespaceprefix_='', name_='PERMISSIONSType35', fromsubclass_=False, pretty_print=True):
+        if pretty_print:
+            eol_ = '\n'
+        else:
+            eol_ = ''
+        if self.OWNER_U is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<OWNER_U>%s</OWNER_U>%s' % (self.gds_format_integer(self.OWNER_U, input_name='OWNER_U'), eol_))
+        if self.OWNER_M is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<OWNER_M>%s</OWNER_M>%s' % (self.gds_format_integer(self.OWNER_M, input_name='OWNER_M'), eol_))
+        if self.OWNER_A is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<OWNER_A>%s</OWNER_A>%s' % (self.gds_format_integer(self.OWNER_A, input_name='OWNER_A'), eol_))
+        if self.GROUP_U is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<GROUP_U>%s</GROUP_U>%s' % (self.gds_format_integer(self.GROUP_U, input_name='GROUP_U'), eol_))
+        if self.GROUP_M is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<GROUP_M>%s</GROUP_M>%s' % (self.gds_format_integer(self.GROUP_M, input_name='GROUP_M'), eol_))
+        if self.GROUP_A is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<GROUP_A>%s</GROUP_A>%s' % (self.gds_format_integer(self.GROUP_A, input_name='GROUP_A'), eol_))
+        if self.OTHER_U is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<OTHER_U>%s</OTHER_U>%s' % (self.gds_format_integer(self.OTHER_U, input_name='OTHER_U'), eol_))
+        if self.OTHER_M is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<OTHER_M>%s</OTHER_M>%s' % (self.gds_format_integer(self.OTHER_M, input_name='OTHER_M'), eol_))
+        if self.OTHER_A is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<OTHER_A>%s</OTHER_A>%s' % (self.gds_format_integer(self.OTHER_A, input_name='OTHER_A'), eol_))
+    def build(self, node):
+        already_processed = set()
+        self.buildAttributes(node, node.attrib, already_processed)
+        for child in node:
+            nodeName_ = Tag_pattern_.match(child.tag).groups()[-1]
+            self.buildChildren(child, node, nodeName_)
+        return self
+    def buildAttributes(self, node, attrs, already_processed):
+        pass
+    def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
+        if nodeName_ == 'OWNER_U' and child_.text:
+            sval_ = child_.text
+            try:
+                ival_ = int(sval_)
+            except (TypeError, ValueError) as exp:
+                raise_parse_error(child_, 'requires integer: %s' % exp)
+            ival_ = self.gds_validate_integer(ival_, node, 'OWNER_U')
+            self.OWNER_U = ival_
+        elif nodeName_ == 'OWNER_M' and child_.text:
+            sval_ = child_.text
+            try:
+                ival_ = int(sval_)
+            except (TypeError, ValueError) as exp:
+                raise_parse_error(child_, 'requires integer: %s' % exp)
+            ival_ = self.gds_validate_integer(ival_, node, 'OWNER_M')
+            self.OWNER_M = ival_
+        elif nodeName_ == 'OWNER_A' and child_.text:
+            sval_ = child_.text
+            try:
+                ival_ = int(sval_)
+            except (TypeError, ValueError) as exp:
+                raise_parse_error(child_, 'requires integer: %s' % exp)
+            ival_ = self.gds_validate_integer(ival_, node, 'OWNER_A')
+            self.OWNER_A = ival_
+        elif nodeName_ == 'GROUP_U' and child_.text:
+            sval_ = child_.text
+            try:
+                ival_ = int(sval_)
+            except (TypeError, ValueError) as exp:
+                raise_parse_error(child_, 'requires integer: %s' % exp)
+            ival_ = self.gds_validate_integer(ival_, node, 'GROUP_U')
+            self.GROUP_U = ival_
+        elif nodeName_ == 'GROUP_M' and child_.text:
+            sval_ = child_.text
+            try:
+                ival_ = int(sval_)
+            except (TypeError, ValueError) as exp:
+                raise_parse_error(child_, 'requires integer: %s' % exp)
+            ival_ = self.gds_validate_integer(ival_, node, 'GROUP_M')
+            self.GROUP_M = ival_
+        elif nodeName_ == 'GROUP_A' and child_.text:
+            sval_ = child_.text
+            try:
+                ival_ = int(sval_)
+            except (TypeError, ValueError) as exp:
+                raise_parse_error(child_, 'requires integer: %s' % exp)
+            ival_ = self.gds_validate_integer(ival_, node, 'GROUP_A')
+            self.GROUP_A = ival_
+        elif nodeName_ == 'OTHER_U' and child_.text:
+            sval_ = child_.text
+            try:
+                ival_ = int(sval_)
+            except (TypeError, ValueError) as exp:
+                raise_parse_error(child_, 'requires integer: %s' % exp)
+            ival_ = self.gds_validate_integer(ival_, node, 'OTHER_U')
+            self.OTHER_U = ival_
+        elif nodeName_ == 'OTHER_M' and child_.text:
+            sval_ = child_.text
+            try:
+                ival_ = int(sval_)
+            except (TypeError, ValueError) as exp:
+                raise_parse_error(child_, 'requires integer: %s' % exp)
+            ival_ = self.gds_validate_integer(ival_, node, 'OTHER_M')
+            self.OTHER_M = ival_
+        elif nodeName_ == 'OTHER_A' and child_.text:
+            sval_ = child_.text
+            try:
+                ival_ = int(sval_)
+            except (TypeError, ValueError) as exp:
+                raise_parse_error(child_, 'requires integer: %s' % exp)
+            ival_ = self.gds_validate_integer(ival_, node, 'OTHER_A')
+            self.OTHER_A = ival_
+# end class PERMISSIONSType35
+
+
+class MARKETPLACEAPP_POOLSub(TemplatedType, MARKETPLACEAPP_POOL):
+    def __init__(self, MARKETPLACEAPP=None):
+        super(MARKETPLACEAPP_POOLSub, self).__init__(MARKETPLACEAPP, )
+MARKETPLACEAPP_POOL.subclass = MARKETPLACEAPP_POOLSub
+# end class MARKETPLACEAPP_POOLSub
+
+
+class MARKETPLACEAPPSub(TemplatedType, MARKETPLACEAPP):
+    def __init__(self, ID=None, UID=None, GID=None, UNAME=None, GNAME=None, REGTIME=None, NAME=None, ZONE_ID=None, ORIGIN_ID=None, SOURCE=None, MD5=None, SIZE=None, DESCRIPTION=None, VERSION=None, FORMAT=None, APPTEMPLATE64=None, MARKETPLACE_ID=None, MARKETPLACE=None, STATE=None, TYPE=None, PERMISSIONS=None, TEMPLATE=None):
+        super(MARKETPLACEAPPSub, self).__init__(ID, UID, GID, UNAME, GNAME, REGTIME, NAME, ZONE_ID, ORIGIN_ID, SOURCE, MD5, SIZE, DESCRIPTION, VERSION, FORMAT, APPTEMPLATE64, MARKETPLACE_ID, MARKETPLACE, STATE, TYPE, PERMISSIONS, TEMPLATE, )
+MARKETPLACEAPP.subclass = MARKETPLACEAPPSub
+# end class MARKETPLACEAPPSub
+
+
+class PERMISSIONSType35Sub(TemplatedType, PERMISSIONSType35):
+    def __init__(self, OWNER_U=None, OWNER_M=None, OWNER_A=None, GROUP_U=None, GROUP_M=None, GROUP_A=None, OTHER_U=None, OTHER_M=None, OTHER_A=None):
+        super(PERMISSIONSType35Sub, self).__init__(OWNER_U, OWNER_M, OWNER_A, GROUP_U, GROUP_M, GROUP_A, OTHER_U, OTHER_M, OTHER_A, )
+PERMISSIONSType35.subclass = PERMISSIONSType35Sub
+# end class PERMISSIONSType35Sub
+
+
@@ -0,0 +1,2259 @@
+#!/usr/bin/env python
+
+#
+# Bindings of USER, generated by generateDS.py and split from supbind by src/split_bindings.py
+#
+
+import sys
+import re as re_
+import base64
+import datetime as datetime_
+import warnings as warnings_
+try:
+    from lxml import etree as etree_
+except ImportError:
+    from xml.etree import ElementTree as etree_
+from pyone.util import TemplatedType
+from . import supbind as supermod
+from .supbind import (
+    GenerateDSNamespaceDefs_,
+    GeneratedsSuper,
+    Tag_pattern_,
+    getSubclassFromModule_,
+    quote_xml,
+    raise_parse_error,
+    showIndent,
+)
+
+
+class USER(GeneratedsSuper):
+    subclass = None
+    superclass = None
+    def __init__(self, ID=None, GID=None, GROUPS=None, GNAME=None, NAME=None, PASSWORD=None, AUTH_DRIVER=None, ENABLED=None, LOGIN_TOKEN=None, TEMPLATE=None, DATASTORE_QUOTA=None, NETWORK_QUOTA=None, VM_QUOTA=None, IMAGE_QUOTA=None, DEFAULT_USER_QUOTAS=None):
+        self.original_tagname_ = None
+        self.ID = ID
+        self.GID = GID
+        self.GROUPS = GROUPS
+        self.GNAME = GNAME
+        self.NAME = NAME
+        self.PASSWORD = PASSWORD
+        self.AUTH_DRIVER = AUTH_DRIVER
+        self.ENABLED = ENABLED
+        if LOGIN_TOKEN is None:
+            self.LOGIN_TOKEN = []
+        else:
+            self.LOGIN_TOKEN = LOGIN_TOKEN
+        self.TEMPLATE = TEMPLATE
+        self.DATASTORE_QUOTA = DATASTORE_QUOTA
+        self.NETWORK_QUOTA = NETWORK_QUOTA
+        self.VM_QUOTA = VM_QUOTA
+        self.IMAGE_QUOTA = IMAGE_QUOTA
+        self.DEFAULT_USER_QUOTAS = DEFAULT_USER_QUOTAS
+    def factory(*args_, **kwargs_):
+        if supermod.CurrentSubclassModule_ is not None:
+            subclass = getSubclassFromModule_(
+                supermod.CurrentSubclassModule_, USER)
+            if subclass is not None:
+                return subclass(*args_, **kwargs_)
+        if USER.subclass:
+            return USER.subclass(*args_, **kwargs_)
+        else:
+            return USER(*args_, **kwargs_)
+    factory = staticmethod(factory)
+    def get_ID(self): return self.ID
+    def set_ID(self, ID): self.ID = ID
+    def get_GID(self): return self.GID
+    def set_GID(self, GID): self.GID = GID
+    def get_GROUPS(self): return self.GROUPS
+    def set_GROUPS(self, GROUPS): self.GROUPS = GROUPS
+    def get_GNAME(self): return self.GNAME
+    def set_GNAME(self, GNAME): self.GNAME = GNAME
+    def get_NAME(self): return self.NAME
+    def set_NAME(self, NAME): self.NAME = NAME
+    def get_PASSWORD(self): return self.PASSWORD
+    def set_PASSWORD(self, PASSWORD): self.PASSWORD = PASSWORD
+    def get_AUTH_DRIVER(self): return self.AUTH_DRIVER
+    def set_AUTH_DRIVER(self, AUTH_DRIVER): self.AUTH_DRIVER = AUTH_DRIVER
+    def get_ENABLED(self): return self.ENABLED
+    def set_ENABLED(self, ENABLED): self.ENABLED = ENABLED
+    def get_LOGIN_TOKEN(self): return self.LOGIN_TOKEN
+    def set_LOGIN_TOKEN(self, LOGIN_TOKEN): self.LOGIN_TOKEN = LOGIN_TOKEN
+    def add_LOGIN_TOKEN(self, value): self.LOGIN_TOKEN.append(value)
+    def insert_LOGIN_TOKEN_at(self, index, value): self.LOGIN_TOKEN.insert(index, value)
+    def replace_LOGIN_TOKEN_at(self, index, value): self.LOGIN_TOKEN[index] = value
+    def get_TEMPLATE(self): return self.TEMPLATE
+    def set_TEMPLATE(self, TEMPLATE): self.TEMPLATE = TEMPLATE
+    def get_DATASTORE_QUOTA(self): return self.DATASTORE_QUOTA
+    def set_DATASTORE_QUOTA(self, DATASTORE_QUOTA): self.DATASTORE_QUOTA = DATASTORE_QUOTA
+    def get_NETWORK_QUOTA(self): return self.NETWORK_QUOTA
+    def set_NETWORK_QUOTA(self, NETWORK_QUOTA): self.NETWORK_QUOTA = NETWORK_QUOTA
+    def get_VM_QUOTA(self): return self.VM_QUOTA
+    def set_VM_QUOTA(self, VM_QUOTA): self.VM_QUOTA = VM_QUOTA
+    def get_IMAGE_QUOTA(self): return self.IMAGE_QUOTA
+    def set_IMAGE_QUOTA(self, IMAGE_QUOTA): self.IMAGE_QUOTA = IMAGE_QUOTA
+    def get_DEFAULT_USER_QUOTAS(self): return self.DEFAULT_USER_QUOTAS
+    def set_DEFAULT_USER_QUOTAS(self, DEFAULT_USER_QUOTAS): self.DEFAULT_USER_QUOTAS = DEFAULT_USER_QUOTAS
+    def hasContent_(self):
+        if (
+            self.ID is not None or
+            self.GID is not None or
+            self.GROUPS is not None or
+            self.GNAME is not None or
+            self.NAME is not None or
+            self.PASSWORD is not None or
+            self.AUTH_DRIVER is not None or
+            self.ENABLED is not None or
+            self.LOGIN_TOKEN or
+            self.TEMPLATE is not None or
+            self.DATASTORE_QUOTA is not None or
+            self.NETWORK_QUOTA is not None or
+            self.VM_QUOTA is not None or
+            self.IMAGE_QUOTA is not None or
+            self.DEFAULT_USER_QUOTAS is not None
+        ):
+            return True
+        else:
+            return False
+    def export(self, outfile, level, namespaceprefix_='', name_='USER', namespacedef_='', pretty_print=True):
+        imported_ns_def_ = GenerateDSNamespaceDefs_.get('USER')
+        if imported_ns_def_ is not None:
+            namespacedef_ = imported_ns_def_
+        if pretty_print:
+            eol_ = '\n'
+        else:
+            eol_ = ''
+        if self.original_tagname_ is not None:
+            name_ = self.original_tagname_
+        showIndent(outfile, level, pretty_print)
+        outfile.write('<%s%s%s' % (namespaceprefix_, name_, namespacedef_ and ' ' + namespacedef_ or '', ))
+        already_processed = set()
+        self.exportAttributes(outfile, level, already_processed, namespaceprefix_, name_='USER')
+        if self.hasContent_():
+            outfile.write('>%s' % (eol_, ))
+            self.exportChildren(outfile, level + 1, namespaceprefix_='', name_='USER', pretty_print=pretty_print)
+            showIndent(outfile, level, pretty_print)
+            outfile.write('</%s%s>%s' % (namespaceprefix_, name_, eol_))
+        else:
+            outfile.write('/>%s' % (eol_, ))
+    def exportAttributes(self, outfile, level, already_processed, namespaceprefix_='', name_='USER'):
+        pass
+    def exportChildren(self, outfile, level, namespaceprefix_='', name_='USER', fromsubclass_=False, pretty_print=True):
+        if pretty_print:
+            eol_ = '\n'
+        else:
+            eol_ = ''
+        if self.ID is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<ID>%s</ID>%s' % (self.gds_format_integer(self.ID, input_name='ID'), eol_))
+        if self.GID is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<GID>%s</GID>%s' % (self.gds_format_integer(self.GID, input_name='GID'), eol_))
+        if self.GROUPS is not None:
+            self.GROUPS.export(outfile, level, namespaceprefix_, name_='GROUPS', pretty_print=pretty_print)
+        if self.GNAME is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<GNAME>%s</GNAME>%s' % (self.gds_encode(self.gds_format_string(quote_xml(self.GNAME), input_name='GNAME')), eol_))
+        if self.NAME is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<NAME>%s</NAME>%s' % (self.gds_encode(self.gds_format_string(quote_xml(self.NAME), input_name='NAME')), eol_))
+        if self.PASSWORD is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<PASSWORD>%s</PASSWORD>%s' % (self.gds_encode(self.gds_format_string(quote_xml(self.PASSWORD), input_name='PASSWORD')), eol_))
+        if self.AUTH_DRIVER is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<AUTH_DRIVER>%s</AUTH_DRIVER>%s' % (self.gds_encode(self.gds_format_string(quote_xml(self.AUTH_DRIVER), input_name='AUTH_DRIVER')), eol_))
+        if self.ENABLED is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<ENABLED>%s</ENABLED>%s' % (self.gds_format_integer(self.ENABLED, input_name='ENABLED'), eol_))
+        for LOGIN_TOKEN_ in self.LOGIN_TOKEN:
+            LOGIN_TOKEN_.export(outfile, level, namespaceprefix_, name_='LOGIN_TOKEN', pretty_print=pretty_print)
+        if self.TEMPLATE is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<TEMPLATE>%s</TEMPLATE>%s' % (self.gds_encode(self.gds_format_string(quote_xml(self.TEMPLATE), input_name='TEMPLATE')), eol_))
+        if self.DATASTORE_QUOTA is not None:
+            self.DATASTORE_QUOTA.export(outfile, level, namespaceprefix_, name_='DATASTORE_QUOTA', pretty_print=pretty_print)
+        if self.NETWORK_QUOTA is not None:
+            self.NETWORK_QUOTA.export(outfile, level, namespaceprefix_, name_='NETWORK_QUOTA', pretty_print=pretty_print)
+        if self.VM_QUOTA is not None:
+            self.VM_QUOTA.export(outfile, level, namespaceprefix_, name_='VM_QUOTA', pretty_print=pretty_print)
+        if self.IMAGE_QUOTA is not None:
+            self.IMAGE_QUOTA.export(outfile, level, namespaceprefix_, name_='IMAGE_QUOTA', pretty_print=pretty_print)
+        if self.DEFAULT_USER_QUOTAS is not None:
+            self.DEFAULT_USER_QUOTAS.export(outfile, level, namespaceprefix_, name_='DEFAULT_USER_QUOTAS', pretty_print=pretty_print)
+    def build(self, node):
+        already_processed = set()
+        self.buildAttributes(node, node.attrib, already_processed)
+        for child in node:
+            nodeName_ = Tag_pattern_.match(child.tag).groups()[-1]
+            self.buildChildren(child, node, nodeName_)
+        return self
+    def buildAttributes(self, node, attrs, already_processed):
+        pass
+    def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
+        if nodeName_ == 'ID' and child_.text:
+            sval_ = child_.text
+            try:
+                ival_ = int(sval_)
+            except (TypeError, ValueError) as exp:
+                raise_parse_error(child_, 'requires integer: %s' % exp)
+            ival_ = self.gds_validate_integer(ival_, node, 'ID')
+            self.ID = ival_
+        elif nodeName_ == 'GID' and child_.text:
+            sval_ = child_.text
+            try:
+                ival_ = int(sval_)
+            except (TypeError, ValueError) as exp:
+                raise_parse_error(child_, 'requires integer: %s' % exp)
+            ival_ = self.gds_validate_integer(ival_, node, 'GID')
+            self.GID = ival_
+        elif nodeName_ == 'GROUPS':
+            obj_ = GROUPSType54.factory()
+            obj_.build(child_)
+            self.GROUPS = obj_
+            obj_.original_tagname_ = 'GROUPS'
+        elif nodeName_ == 'GNAME':
+            GNAME_ = child_.text
+            GNAME_ = self.gds_validate_string(GNAME_, node, 'GNAME')
+            self.GNAME = GNAME_
+        elif nodeName_ == 'NAME':
+            NAME_ = child_.text
+            NAME_ = self.gds_validate_string(NAME_, node, 'NAME')
+            self.NAME = NAME_
+        elif nodeName_ == 'PASSWORD':
+            PASSWORD_ = child_.text
+            PASSWORD_ = self.gds_validate_string(PASSWORD_, node, 'PASSWORD')
+            self.PASSWORD = PASSWORD_
+        elif nodeName_ == 'AUTH_DRIVER':
+            AUTH_DRIVER_ = child_.text
+            AUTH_DRIVER_ = self.gds_validate_string(AUTH_DRIVER_, node, 'AUTH_DRIVER')
+            self.AUTH_DRIVER = AUTH_DRIVER_
+        elif nodeName_ == 'ENABLED' and child_.text:
+            sval_ = child_.text
+            try:
+                ival_ = int(sval_)
+            except (TypeError, ValueError) as exp:
+                raise_parse_error(child_, 'requires integer: %s' % exp)
+            ival_ = self.gds_validate_integer(ival_, node, 'ENABLED')
+            self.ENABLED = ival_
+        elif nodeName_ == 'LOGIN_TOKEN':
+            obj_ = LOGIN_TOKENType55.factory()
+            obj_.build(child_)
+            self.LOGIN_TOKEN.append(obj_)
+            obj_.original_tagname_ = 'LOGIN_TOKEN'
+        elif nodeName_ == 'TEMPLATE':
+            TEMPLATE_ = child_.text
+            TEMPLATE_ = self.gds_validate_string(TEMPLATE_, node, 'TEMPLATE')
+            self.TEMPLATE = TEMPLATE_
+        elif nodeName_ == 'DATASTORE_QUOTA':
+            obj_ = DATASTORE_QUOTAType56.factory()
+            obj_.build(child_)
+            self.DATASTORE_QUOTA = obj_
+            obj_.original_tagname_ = 'DATASTORE_QUOTA'
+        elif nodeName_ == 'NETWORK_QUOTA':
+            obj_ = NETWORK_QUOTAType58.factory()
+            obj_.build(child_)
+            self.NETWORK_QUOTA = obj_
+            obj_.original_tagname_ = 'NETWORK_QUOTA'
+        elif nodeName_ == 'VM_QUOTA':
+            obj_ = VM_QUOTAType60.factory()
+            obj_.build(child_)
+            self.VM_QUOTA = obj_
+            obj_.original_tagname_ = 'VM_QUOTA'
+        elif nodeName_ == 'IMAGE_QUOTA':
+            obj_ = IMAGE_QUOTAType62.factory()
+            obj_.build(child_)
+            self.IMAGE_QUOTA = obj_
+            obj_.original_tagname_ = 'IMAGE_QUOTA'
+        elif nodeName_ == 'DEFAULT_USER_QUOTAS':
+            obj_ = DEFAULT_USER_QUOTASType64.factory()
+            obj_.build(child_)
+            self.DEFAULT_USER_QUOTAS = obj_
+            obj_.original_tagname_ = 'DEFAULT_USER_QUOTAS'
+# end class USER
+
+
+class GROUPSType54(GeneratedsSuper):
+    subclass = None
+    superclass = None
+    def __init__(self, ID=None):
+        self.original_tagname_ = None
+        if ID is None:
+            self.ID = []
+        else:
+            self.ID = ID
+    def factory(*args_, **kwargs_):
+        if supermod.CurrentSubclassModule_ is not None:
+            subclass = getSubclassFromModule_(
+                supermod.CurrentSubclassModule_, GROUPSType54)
+            if subclass is not None:
+                return subclass(*args_, **kwargs_)
+        if GROUPSType54.subclass:
+            return GROUPSType54.subclass(*args_, **kwargs_)
+        else:
+            return GROUPSType54(*args_, **kwargs_)
+    factory = staticmethod(factory)
+    def get_ID(self): return self.ID
+    def set_ID(self, ID): self.ID = ID
+    def add_ID(self, value): self.ID.append(value)
+    def insert_ID_at(self, index, value): self.ID.insert(index, value)
+    def replace_ID_at(self, index, value): self.ID[index] = value
+    def hasContent_(self):
+        if (
+            self.ID
+        ):
+            return True
+        else:
+            return False
+    def export(self, outfile, level, namespaceprefix_='', name_='GROUPSType54', namespacedef_='', pretty_print=True):
+        imported_ns_def_ = GenerateDSNamespaceDefs_.get('GROUPSType54')
+        if imported_ns_def_ is not None:
+            namespacedef_ = imported_ns_def_
+        if pretty_print:
+            eol_ = '\n'
+        else:
+            eol_ = ''
+        if self.original_tagname_ is not None:
+            name_ = self.original_tagname_
+        showIndent(outfile, level, pretty_print)
+        outfile.write('<%s%s%s' % (namespaceprefix_, name_, namespacedef_ and ' ' + namespacedef_ or '', ))
+        already_processed = set()
+        self.exportAttributes(outfile, level, already_processed, namespaceprefix_, name_='GROUPSType54')
+        if self.hasContent_():
+            outfile.write('>%s' % (eol_, ))
+            self.exportChildren(outfile, level + 1, namespaceprefix_='', name_='GROUPSType54', pretty_print=pretty_print)
+            showIndent(outfile, level, pretty_print)
+            outfile.write('</%s%s>%s' % (namespaceprefix_, name_, eol_))
+        else:
+            outfile.write('/>%s' % (eol_, ))
+    def exportAttributes(self, outfile, level, already_processed, namespaceprefix_='', name_='GROUPSType54'):
+        pass
+    def exportChildren(self, outfile, level, namespaceprefix_='', name_='GROUPSType54', fromsubclass_=False, pretty_print=True):
+        if pretty_print:
+            eol_ = '\n'
+        else:
+            eol_ = ''
+        for ID_ in self.ID:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<ID>%s</ID>%s' % (self.gds_format_integer(ID_, input_name='ID'), eol_))
+    def build(self, node):
+        already_processed = set()
+        self.buildAttributes(node, node.attrib, already_processed)
+        for child in node:
+            nodeName_ = Tag_pattern_.match(child.tag).groups()[-1]
+            self.buildChildren(child, node, nodeName_)
+        return self
+    def buildAttributes(self, node, attrs, already_processed):
+        pass
+    def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
+        if nodeName_ == 'ID' and child_.text:
+            sval_ = child_.text
+            try:
+                ival_ = int(sval_)
+            except (TypeError, ValueError) as exp:
+                raise_parse_error(child_, 'requires integer: %s' % exp)
+            ival_ = self.gds_validate_integer(ival_, node, 'ID')
+            self.ID.append(ival_)
+# end class GROUPSType54
+
+
+class LOGIN_TOKENType55(GeneratedsSuper):
+    subclass = None
+    superclass = None
+    def __init__(self, TOKEN=None, EXPIRATION_TIME=None, EGID=None):
+        self.original_tagname_ = None
+        self.TOKEN = TOKEN
+        self.EXPIRATION_TIME = EXPIRATION_TIME
+        self.EGID = EGID
+    def factory(*args_, **kwargs_):
+        if supermod.CurrentSubclassModule_ is not None:
+            subclass = getSubclassFromModule_(
+                supermod.CurrentSubclassModule_, LOGIN_TOKENType55)
+            if subclass is not None:
+                return subclass(*args_, **kwargs_)
+        if LOGIN_TOKENType55.subclass:
+            return LOGIN_TOKENType55.subclass(*args_, **kwargs_)
+        else:
+            return LOGIN_TOKENType55(*args_, **kwargs_)
+    factory = staticmethod(factory)
+    def get_TOKEN(self): return self.TOKEN
+    def set_TOKEN(self, TOKEN): self.TOKEN = TOKEN
+    def get_EXPIRATION_TIME(self): return self.EXPIRATION_TIME
+    def set_EXPIRATION_TIME(self, EXPIRATION_TIME): self.EXPIRATION_TIME = EXPIRATION_TIME
+    def get_EGID(self): return self.EGID
+    def set_EGID(self, EGID): self.EGID = EGID
+    def hasContent_(self):
+        if (
+            self.TOKEN is not None or
+            self.EXPIRATION_TIME is not None or
+            self.EGID is not None
+        ):
+            return True
+        else:
+            return False
+    def export(self, outfile, level, namespaceprefix_='', name_='LOGIN_TOKENType55', namespacedef_='', pretty_print=True):
+        imported_ns_def_ = GenerateDSNamespaceDefs_.get('LOGIN_TOKENType55')
+        if imported_ns_def_ is not None:
+            namespacedef_ = imported_ns_def_
+        if pretty_print:
+            eol_ = '\n'
+        else:
+            eol_ = ''
+        if self.original_tagname_ is not None:
+            name_ = self.original_tagname_
+        showIndent(outfile, level, pretty_print)
+        outfile.write('<%s%s%s' % (namespaceprefix_, name_, namespacedef_ and ' ' + namespacedef_ or '', ))
+        already_processed = set()
+        self.exportAttributes(outfile, level, already_processed, namespaceprefix_, name_='LOGIN_TOKENType55')
+        if self.hasContent_():
+            outfile.write('>%s' % (eol_, ))
+            self.exportChildren(outfile, level + 1, namespaceprefix_='', name_='LOGIN_TOKENType55', pretty_print=pretty_print)
+            showIndent(outfile, level, pretty_print)
+            outfile.write('</%s%s>%s' % (namespaceprefix_, name_, eol_))
+        else:
+            outfile.write('/>%s' % (eol_, ))
+    def exportAttributes(self, outfile, level, already_processed, namespaceprefix_='', name_='LOGIN_TOKENType55'):
+        pass
+    def exportChildren(self, outfile, level, namespaceprefix_='', name_='LOGIN_TOKENType55', fromsubclass_=False, pretty_print=True):
+        if pretty_print:
+            eol_ = '\n'
+        else:
+            eol_ = ''
+        if self.TOKEN is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<TOKEN>%s</TOKEN>%s' % (self.gds_encode(self.gds_format_string(quote_xml(self.TOKEN), input_name='TOKEN')), eol_))
+        if self.EXPIRATION_TIME is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<EXPIRATION_TIME>%s</EXPIRATION_TIME>%s' % (self.gds_format_integer(self.EXPIRATION_TIME, input_name='EXPIRATION_TIME'), eol_))
+        if self.EGID is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<EGID>%s</EGID>%s' % (self.gds_format_integer(self.EGID, input_name='EGID'), eol_))
+    def build(self, node):
+        already_processed = set()
+        self.buildAttributes(node, node.attrib, already_processed)
+        for child in node:
+            nodeName_ = Tag_pattern_.match(child.tag).groups()[-1]
+            self.buildChildren(child, node, nodeName_)
+        return self
+    def buildAttributes(self, node, attrs, already_processed):
+        pass
+    def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
+        if nodeName_ == 'TOKEN':
+            TOKEN_ = child_.text
+            TOKEN_ = self.gds_validate_string(TOKEN_, node, 'TOKEN')
+            self.TOKEN = TOKEN_
+        elif nodeName_ == 'EXPIRATION_TIME' and child_.text:
+            sval_ = child_.text
+            try:
+                ival_ = int(sval_)
+            except (TypeError, ValueError) as exp:
+                raise_parse_error(child_, 'requires integer: %s' % exp)
+            ival_ = self.gds_validate_integer(ival_, node, 'EXPIRATION_TIME')
+            self.EXPIRATION_TIME = ival_
+        elif nodeName_ == 'EGID' and child_.text:
+            sval_ = child_.text
+            try:
+                ival_ = int(sval_)
+            except (TypeError, ValueError) as exp:
+                raise_parse_error(child_, 'requires integer: %s' % exp)
+            ival_ = self.gds_validate_integer(ival_, node, 'EGID')
+            self.EGID = ival_
+# end class LOGIN_TOKENType55
+
+
+class DATASTORE_QUOTAType56(GeneratedsSuper):
+    subclass = None
+    superclass = None
+    def __init__(self, DATASTORE=None):
+        self.original_tagname_ = None
+        if DATASTORE is None:
+            self.DATASTORE = []
+        else:
+            self.DATASTORE = DATASTORE
+    def factory(*args_, **kwargs_):
+        if supermod.CurrentSubclassModule_ is not None:
+            subclass = getSubclassFromModule_(
+                supermod.CurrentSubclassModule_, DATASTORE_QUOTAType56)
+            if subclass is not None:
+                return subclass(*args_, **kwargs_)
+        if DATASTORE_QUOTAType56.subclass:
+            return DATASTORE_QUOTAType56.subclass(*args_, **kwargs_)
+        else:
+            return DATASTORE_QUOTAType56(*args_, **kwargs_)
+    factory = staticmethod(factory)
+    def get_DATASTORE(self): return self.DATASTORE
+    def set_DATASTORE(self, DATASTORE): self.DATASTORE = DATASTORE
+    def add_DATASTORE(self, value): self.DATASTORE.append(value)
+    def insert_DATASTORE_at(self, index, value): self.DATASTORE.insert(index, value)
+    def replace_DATASTORE_at(self, index, value): self.DATASTORE[index] = value
+    def hasContent_(self):
+        if (
+            self.DATASTORE
+        ):
+            return True
+        else:
+            return False
+    def export(self, outfile, level, namespaceprefix_='', name_='DATASTORE_QUOTAType56', namespacedef_='', pretty_print=True):
+        imported_ns_def_ = GenerateDSNamespaceDefs_.get('DATASTORE_QUOTAType56')
+        if imported_ns_def_ is not None:
+            namespacedef_ = imported_ns_def_
+        if pretty_print:
+            eol_ = '\n'
+        else:
+            eol_ = ''
+        if self.original_tagname_ is not None:
+            name_ = self.original_tagname_
+        showIndent(outfile, level, pretty_print)
+        outfile.write('<%s%s%s' % (namespaceprefix_, name_, namespacedef_ and ' ' + namespacedef_ or '', ))
+        already_processed = set()
+        self.exportAttributes(outfile, level, already_processed, namespaceprefix_, name_='DATASTORE_QUOTAType56')
+        if self.hasContent_():
+            outfile.write('>%s' % (eol_, ))
+            self.exportChildren(outfile, level + 1, namespaceprefix_='', name_='DATASTORE_QUOTAType56', pretty_print=pretty_print)
+            showIndent(outfile, level, pretty_print)
+            outfile.write('</%s%s>%s' % (namespaceprefix_, name_, eol_))
+        else:
+            outfile.write('/>%s' % (eol_, ))
+    def exportAttributes(self, outfile, level, already_processed, namespaceprefix_='', name_='DATASTORE_QUOTAType56'):
+        pass
+    def exportChildren(self, outfile, level, namespaceprefix_='', name_='DATASTORE_QUOTAType56', fromsubclass_=False, pretty_print=True):
+        if pretty_print:
+            eol_ = '\n'
+        else:
+            eol_ = ''
+        for DATASTORE_ in self.DATASTORE:
+            DATASTORE_.export(outfile, level, namespaceprefix_, name_='DATASTORE', pretty_print=pretty_print)
+    def build(self, node):
+        already_processed = set()
+        self.buildAttributes(node, node.attrib, already_processed)
+        for child in node:
+            nodeName_ = Tag_pattern_.match(child.tag).groups()[-1]
+            self.buildChildren(child, node, nodeName_)
+        return self
+    def buildAttributes(self, node, attrs, already_processed):
+        pass
+    def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
+        if nodeName_ == 'DATASTORE':
+            obj_ = DATASTOREType57.factory()
+            obj_.build(child_)
+            self.DATASTORE.append(obj_)
+            obj_.original_tagname_ = 'DATASTORE'
+# end class DATASTORE_QUOTAType56
+
+
+class DATASTOREType57(GeneratedsSuper):
+    subclass = None
+    superclass = None
+    def __init__(self, ID=None, IMAGES=None, IMAGES_USED=None, SIZE=None, SIZE_USED=None):
+        self.original_tagname_ = None
+        self.ID = ID
+        self.IMAGES = IMAGES
+        self.IMAGES_USED = IMAGES_USED
+        self.SIZE = SIZE
+        self.SIZE_USED = SIZE_USED
+    def factory(*args_, **kwargs_):
+        if supermod.CurrentSubclassModule_ is not None:
+            subclass = getSubclassFromModule_(
+                supermod.CurrentSubclassModule_, DATASTOREType57)
+            if subclass is not None:
+                return subclass(*args_, **kwargs_)
+        if DATASTOREType57.subclass:
+            return DATASTOREType57.subclass(*args_, **kwargs_)
+        else:
+            return DATASTOREType57(*args_, **kwargs_)
+    factory = staticmethod(factory)
+    def get_ID(self): return self.ID
+    def set_ID(self, ID): self.ID = ID
+    def get_IMAGES(self): return self.IMAGES
+    def set_IMAGES(self, IMAGES): self.IMAGES = IMAGES
+    def get_IMAGES_USED(self): return self.IMAGES_USED
+    def set_IMAGES_USED(self, IMAGES_USED): self.IMAGES_USED = IMAGES_USED
+    def get_SIZE(self): return self.SIZE
+    def set_SIZE(self, SIZE): self.SIZE = SIZE
+    def get_SIZE_USED(self): return self.SIZE_USED
+    def set_SIZE_USED(self, SIZE_USED): self.SIZE_USED = SIZE_USED
+    def hasContent_(self):
+        if (
+            self.ID is not None or
+            self.IMAGES is not None or
+            self.IMAGES_USED is not None or
+            self.SIZE is not None or
+            self.SIZE_USED is not None
+        ):
+            return True
+        else:
+            return False
+    def export(self, outfile, level, namespaceprefix_='', name_='DATASTOREType57', namespacedef_='', pretty_print=True):
+        imported_ns_def_ = GenerateDSNamespaceDefs_.get('DATASTOREType57')
+        if imported_ns_def_ is not None:
+            namespacedef_ = imported_ns_def_
+        if pretty_print:
+            eol_ = '\n'
+        else:
+            eol_ = ''
+        if self.original_tagname_ is not None:
+            name_ = self.original_tagname_
+        showIndent(outfile, level, pretty_print)
+        outfile.write('<%s%s%s' % (namespaceprefix_, name_, namespacedef_ and ' ' + namespacedef_ or '', ))
+        already_processed = set()
+        self.exportAttributes(outfile, level, already_processed, namespaceprefix_, name_='DATASTOREType57')
+        if self.hasContent_():
+            outfile.write('>%s' % (eol_, ))
+            self.exportChildren(outfile, level + 1, namespaceprefix_='', name_='DATASTOREType57', pretty_print=pretty_print)
+            showIndent(outfile, level, pretty_print)
+            outfile.write('</%s%s>%s' % (namespaceprefix_, name_, eol_))
+        else:
+            outfile.write('/>%s' % (eol_, ))
+    def exportAttributes(self, outfile, level, already_processed, namespaceprefix_='', name_='DATASTOREType57'):
+        pass
+    def exportChildren(self, outfile, level, namespaceprefix_='', name_='DATASTOREType57', fromsubclass_=False, pretty_print=True):
+        if pretty_print:
+            eol_ = '\n'
+        else:
+            eol_ = ''
+        if self.ID is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<ID>%s</ID>%s' % (self.gds_encode(self.gds_format_string(quote_xml(self.ID), input_name='ID')), eol_))
+        if self.IMAGES is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<IMAGES>%s</IMAGES>%s' % (self.gds_encode(self.gds_format_string(quote_xml(self.IMAGES), input_name='IMAGES')), eol_))
+        if self.IMAGES_USED is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<IMAGES_USED>%s</IMAGES_USED>%s' % (self.gds_encode(self.gds_format_string(quote_xml(self.IMAGES_USED), input_name='IMAGES_USED')), eol_))
+        if self.SIZE is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<SIZE>%s</SIZE>%s' % (self.gds_encode(self.gds_format_string(quote_xml(self.SIZE), input_name='SIZE')), eol_))
+        if self.SIZE_USED is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<SIZE_USED>%s</SIZE_USED>%s' % (self.gds_encode(self.gds_format_string(quote_xml(self.SIZE_USED), input_name='SIZE_USED')), eol_))
+    def build(self, node):
+        already_processed = set()
+        self.buildAttributes(node, node.attrib, already_processed)
+        for child in node:
+            nodeName_ = Tag_pattern_.match(child.tag).groups()[-1]
+            self.buildChildren(child, node, nodeName_)
+        return self
+    def buildAttributes(self, node, attrs, already_processed):
+        pass
+    def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
+        if nodeName_ == 'ID':
+            ID_ = child_.text
+            ID_ = self.gds_validate_string(ID_, node, 'ID')
+            self.ID = ID_
+        elif nodeName_ == 'IMAGES':
+            IMAGES_ = child_.text
+            IMAGES_ = self.gds_validate_string(IMAGES_, node, 'IMAGES')
+            self.IMAGES = IMAGES_
+        elif nodeName_ == 'IMAGES_USED':
+            IMAGES_USED_ = child_.text
+            IMAGES_USED_ = self.gds_validate_string(IMAGES_USED_, node, 'IMAGES_USED')
+            self.IMAGES_USED = IMAGES_USED_
+        elif nodeName_ == 'SIZE':
+            SIZE_ = child_.text
+            SIZE_ = self.gds_validate_string(SIZE_, node, 'SIZE')
+            self.SIZE = SIZE_
+        elif nodeName_ == 'SIZE_USED':
+            SIZE_USED_ = child_.text
+            SIZE_USED_ = self.gds_validate_string(SIZE_USED_, node, 'SIZE_USED')
+            self.SIZE_USED = SIZE_USED_
+# end class DATASTOREType57
+
+
+class NETWORK_QUOTAType58(GeneratedsSuper):
+    subclass = None
+    superclass = None
+    def __init__(self, NETWORK=None):
+        self.original_tagname_ = None
+        if NETWORK is None:
+            self.NETWORK = []
+        else:
+            self.NETWORK = NETWORK
+    def factory(*args_, **kwargs_):
+        if supermod.CurrentSubclassModule_ is not None:
+            subclass = getSubclassFromModule_(
+                supermod.CurrentSubclassModule_, NETWORK_QUOTAType58)
+            if subclass is not None:
+                return subclass(*args_, **kwargs_)
+        if NETWORK_QUOTAType58.subclass:
+            return NETWORK_QUOTAType58.subclass(*args_, **kwargs_)
+        else:
+            return NETWORK_QUOTAType58(*args_, **kwargs_)
+    factory = staticmethod(factory)
+    def get_NETWORK(self): return self.NETWORK
+    def set_NETWORK(self, NETWORK): self.NETWORK = NETWORK
+    def add_NETWORK(self, value): self.NETWORK.append(value)
+    def insert_NETWORK_at(self, index, value): self.NETWORK.insert(index, value)
+    def replace_NETWORK_at(self, index, value): self.NETWORK[index] = value
+    def hasContent_(self):
+        if (
+            self.NETWORK
+        ):
+            return True
+        else:
+            return False
+    def export(self, outfile, level, namespaceprefix_='', name_='NETWORK_QUOTAType58', namespacedef_='', pretty_print=True):
+        imported_ns_def_ = GenerateDSNamespaceDefs_.get('NETWORK_QUOTAType58')
+        if imported_ns_def_ is not None:
+            namespacedef_ = imported_ns_def_
+        if pretty_print:
+            eol_ = '\n'
+        else:
+            eol_ = ''
+        if self.original_tagname_ is not None:
+            name_ = self.original_tagname_
+        showIndent(outfile, level, pretty_print)
+        outfile.write('<%s%s%s' % (namespaceprefix_, name_, namespacedef_ and ' ' + namespacedef_ or '', ))
+        already_processed = set()
+        self.exportAttributes(outfile, level, already_processed, namespaceprefix_, name_='NETWORK_QUOTAType58')
+        if self.hasContent_():
+            outfile.write('>%s' % (eol_, ))
+            self.exportChildren(outfile, level + 1, namespaceprefix_='', name_='NETWORK_QUOTAType58', pretty_print=pretty_print)
+            showIndent(outfile, level, pretty_print)
+            outfile.write('</%s%s>%s' % (namespaceprefix_, name_, eol_))
+        else:
+            outfile.write('/>%s' % (eol_, ))
+    def exportAttributes(self, outfile, level, already_processed, namespaceprefix_='', name_='NETWORK_QUOTAType58'):
+        pass
+    def exportChildren(self, outfile, level, namespaceprefix_='', name_='NETWORK_QUOTAType58', fromsubclass_=False, pretty_print=True):
+        if pretty_print:
+            eol_ = '\n'
+        else:
+            eol_ = ''
+        for NETWORK_ in self.NETWORK:
+            NETWORK_.export(outfile, level, namespaceprefix_, name_='NETWORK', pretty_print=pretty_print)
+    def build(self, node):
+        already_processed = set()
+        self.buildAttributes(node, node.attrib, already_processed)
+        for child in node:
+            nodeName_ = Tag_pattern_.match(child.tag).groups()[-1]
+            self.buildChildren(child, node, nodeName_)
+        return self
+    def buildAttributes(self, node, attrs, already_processed):
+        pass
+    def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
+        if nodeName_ == 'NETWORK':
+            obj_ = NETWORKType59.factory()
+            obj_.build(child_)
+            self.NETWORK.append(obj_)
+            obj_.original_tagname_ = 'NETWORK'
+# end class NETWORK_QUOTAType58
+
+
+class NETWORKType59(GeneratedsSuper):
+    subclass = None
+    superclass = None
+    def __init__(self, ID=None, LEASES=None, LEASES_USED=None):
+        self.original_tagname_ = None
+        self.ID = ID
+        self.LEASES = LEASES
+        self.LEASES_USED = LEASES_USED
+    def factory(*args_, **kwargs_):
+        if supermod.CurrentSubclassModule_ is not None:
+            subclass = getSubclassFromModule_(
+                supermod.CurrentSubclassModule_, NETWORKType59)
+            if subclass is not None:
+                return subclass(*args_, **kwargs_)
+        if NETWORKType59.subclass:
+            return NETWORKType59.subclass(*args_, **kwargs_)
+        else:
+            return NETWORKType59(*args_, **kwargs_)
+    factory = staticmethod(factory)
+    def get_ID(self): return self.ID
+    def set_ID(self, ID): self.ID = ID
+    def get_LEASES(self): return self.LEASES
+    def set_LEASES(self, LEASES): self.LEASES = LEASES
+    def get_LEASES_USED(self): return self.LEASES_USED
+    def set_LEASES_USED(self, LEASES_USED): self.LEASES_USED = LEASES_USED
+    def hasContent_(self):
+        if (
+            self.ID is not None or
+            self.LEASES is not None or
+            self.LEASES_USED is not None
+        ):
+            return True
+        else:
+            return False
+    def export(self, outfile, level, namespaceprefix_='', name_='NETWORKType59', namespacedef_='', pretty_print=True):
+        imported_ns_def_ = GenerateDSNamespaceDefs_.get('NETWORKType59')
+        if imported_ns_def_ is not None:
+            namespacedef_ = imported_ns_def_
+        if pretty_print:
+            eol_ = '\n'
+        else:
+            eol_ = ''
+        if self.original_tagname_ is not None:
+            name_ = self.original_tagname_
+        showIndent(outfile, level, pretty_print)
+        outfile.write('<%s%s%s' % (namespaceprefix_, name_, namespacedef_ and ' ' + namespacedef_ or '', ))
+        already_processed = set()
+        self.exportAttributes(outfile, level, already_processed, namespaceprefix_, name_='NETWORKType59')
+        if self.hasContent_():
+            outfile.write('>%s' % (eol_, ))
+            self.exportChildren(outfile, level + 1, namespaceprefix_='', name_='NETWORKType59', pretty_print=pretty_print)
+            showIndent(outfile, level, pretty_print)
+            outfile.write('</%s%s>%s' % (namespaceprefix_, name_, eol_))
+        else:
+            outfile.write('/>%s' % (eol_, ))
+    def exportAttributes(self, outfile, level, already_processed, namespaceprefix_='', name_='NETWORKType59'):
+        pass
+    def exportChildren(self, outfile, level, namespaceprefix_='', name_='NETWORKType59', fromsubclass_=False, pretty_print=True):
+        if pretty_print:
+            eol_ = '\n'
+        else:
+            eol_ = ''
+        if self.ID is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<ID>%s</ID>%s' % (self.gds_encode(self.gds_format_string(quote_xml(self.ID), input_name='ID')), eol_))
+        if self.LEASES is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<LEASES>%s</LEASES>%s' % (self.gds_encode(self.gds_format_string(quote_xml(self.LEASES), input_name='LEASES')), eol_))
+        if self.LEASES_USED is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<LEASES_USED>%s</LEASES_USED>%s' % (self.gds_encode(self.gds_format_string(quote_xml(self.LEASES_USED), input_name='LEASES_USED')), eol_))
+    def build(self, node):
+        already_processed = set()
+        self.buildAttributes(node, node.attrib, already_processed)
+        for child in node:
+            nodeName_ = Tag_pattern_.match(child.tag).groups()[-1]
+            self.buildChildren(child, node, nodeName_)
+        return self
+    def buildAttributes(self, node, attrs, already_processed):
+        pass
+    def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
+        if nodeName_ == 'ID':
+            ID_ = child_.text
+            ID_ = self.gds_validate_string(ID_, node, 'ID')
+            self.ID = ID_
+        elif nodeName_ == 'LEASES':
+            LEASES_ = child_.text
+            LEASES_ = self.gds_validate_string(LEASES_, node, 'LEASES')
+            self.LEASES = LEASES_
+        elif nodeName_ == 'LEASES_USED':
+            LEASES_USED_ = child_.text
+            LEASES_USED_ = self.gds_validate_string(LEASES_USED_, node, 'LEASES_USED')
+            self.LEASES_USED = LEASES_USED_
+# end class NETWORKType59
+
+
+class VM_QUOTAType60(GeneratedsSuper):
+    subclass = None
+    superclass = None
+    def __init__(self, VM=None):
+        self.original_tagname_ = None
+        self.VM = VM
+    def factory(*args_, **kwargs_):
+        if supermod.CurrentSubclassModule_ is not None:
+            subclass = getSubclassFromModule_(
+                supermod.CurrentSubclassModule_, VM_QUOTAType60)
+            if subclass is not None:
+                return subclass(*args_, **kwargs_)
+        if VM_QUOTAType60.subclass:
+            return VM_QUOTAType60.subclass(*args_, **kwargs_)
+        else:
+            return VM_QUOTAType60(*args_, **kwargs_)
+    factory = staticmethod(factory)
+    def get_VM(self): return self.VM
+    def set_VM(self, VM): self.VM = VM
+    def hasContent_(self):
+        if (
+            self.VM is not None
+        ):
+            return True
+        else:
+            return False
+    def export(self, outfile, level, namespaceprefix_='', name_='VM_QUOTAType60', namespacedef_='', pretty_print=True):
+        imported_ns_def_ = GenerateDSNamespaceDefs_.get('VM_QUOTAType60')
+        if imported_ns_def_ is not None:
+            namespacedef_ = imported_ns_def_
+        if pretty_print:
+            eol_ = '\n'
+        else:
+            eol_ = ''
+        if self.original_tagname_ is not None:
+            name_ = self.original_tagname_
+        showIndent(outfile, level, pretty_print)
+        outfile.write('<%s%s%s' % (namespaceprefix_, name_, namespacedef_ and ' ' + namespacedef_ or '', ))
+        already_processed = set()
+        self.exportAttributes(outfile, level, already_processed, namespaceprefix_, name_='VM_QUOTAType60')
+        if self.hasContent_():
+            outfile.write('>%s' % (eol_, ))
+            self.exportChildren(outfile, level + 1, namespaceprefix_='', name_='VM_QUOTAType60', pretty_print=pretty_print)
+            showIndent(outfile, level, pretty_print)
+            outfile.write('</%s%s>%s' % (namespaceprefix_, name_, eol_))
+        else:
+            outfile.write('/>%s' % (eol_, ))
+    def exportAttributes(self, outfile, level, already_processed, namespaceprefix_='', name_='VM_QUOTAType60'):
+        pass
+    def exportChildren(self, outfile, level, namespaceprefix_='', name_='VM_QUOTAType60', fromsubclass_=False, pretty_print=True):
+        if pretty_print:
+            eol_ = '\n'
+        else:
+            eol_ = ''
+        if self.VM is not None:
+            self.VM.export(outfile, level, namespaceprefix_, name_='VM', pretty_print=pretty_print)
+    def build(self, node):
+        already_processed = set()
+        self.buildAttributes(node, node.attrib, already_processed)
+        for child in node:
+            nodeName_ = Tag_pattern_.match(child.tag).groups()[-1]
+            self.buildChildren(child, node, nodeName_)
+        return self
+    def buildAttributes(self, node, attrs, already_processed):
+        pass
+    def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
+        if nodeName_ == 'VM':
+            obj_ = VMType61.factory()
+            obj_.build(child_)
+            self.VM = obj_
+            obj_.original_tagname_ = 'VM'
+# end class VM_QUOTAType60
+
+
+class VMType61(GeneratedsSuper):
+    subclass = None
+    superclass = None
+    def __init__(self, CPU=None, CPU_USED=None, MEMORY=None, MEMORY_USED=None, SYSTEM_DISK_SIZE=None, SYSTEM_DISK_SIZE_USED=None, VMS=None, VMS_USED=None):
+        self.original_tagname_ = None
+        self.CPU = CPU
+        self.CPU_USED = CPU_USED
+        self.MEMORY = MEMORY
+        self.MEMORY_USED = MEMORY_USED
+        self.SYSTEM_DISK_SIZE = SYSTEM_DISK_SIZE
+        self.SYSTEM_DISK_SIZE_USED = SYSTEM_DISK_SIZE_USED
+        self.VMS = VMS
+        self.VMS_USED = VMS_USED
+    def factory(*args_, **kwargs_):
+        if supermod.CurrentSubclassModule_ is not None:
+            subclass = getSubclassFromModule_(
+                supermod.CurrentSubclassModule_, VMType61)
+            if subclass is not None:
+                return subclass(*args_, **kwargs_)
+        if VMType61.subclass:
+            return VMType61.subclass(*args_, **kwargs_)
+        else:
+            return VMType61(*args_, **kwargs_)
+    factory = staticmethod(factory)
+    def get_CPU(self): return self.CPU
+    def set_CPU(self, CPU): self.CPU = CPU
+    def get_CPU_USED(self): return self.CPU_USED
+    def set_CPU_USED(self, CPU_USED): self.CPU_USED = CPU_USED
+    def get_MEMORY(self): return self.MEMORY
+    def set_MEMORY(self, MEMORY): self.MEMORY = MEMORY
+    def get_MEMORY_USED(self): return self.MEMORY_USED
+    def set_MEMORY_USED(self, MEMORY_USED): self.MEMORY_USED = MEMORY_USED
+    def get_SYSTEM_DISK_SIZE(self): return self.SYSTEM_DISK_SIZE
+    def set_SYSTEM_DISK_SIZE(self, SYSTEM_DISK_SIZE): self.SYSTEM_DISK_SIZE = SYSTEM_DISK_SIZE
+    def get_SYSTEM_DISK_SIZE_USED(self): return self.SYSTEM_DISK_SIZE_USED
+    def set_SYSTEM_DISK_SIZE_USED(self, SYSTEM_DISK_SIZE_USED): self.SYSTEM_DISK_SIZE_USED = SYSTEM_DISK_SIZE_USED
+    def get_VMS(self): return self.VMS
+    def set_VMS(self, VMS): self.VMS = VMS
+    def get_VMS_USED(self): return self.VMS_USED
+    def set_VMS_USED(self, VMS_USED): self.VMS_USED = VMS_USED
+    def hasContent_(self):
+        if (
+            self.CPU is not None or
+            self.CPU_USED is not None or
+            self.MEMORY is not None or
+            self.MEMORY_USED is not None or
+            self.SYSTEM_DISK_SIZE is not None or
+            self.SYSTEM_DISK_SIZE_USED is not None or
+            self.VMS is not None or
+            self.VMS_USED is not None
+        ):
+            return True
+        else:
+            return False
+    def export(self, outfile, level, namespaceprefix_='', name_='VMType61', namespacedef_='', pretty_print=True):
+        imported_ns_def_ = GenerateDSNamespaceDefs_.get('VMType61')
+        if imported_ns_def_ is not None:
+            namespacedef_ = imported_ns_def_
+        if pretty_print:
+            eol_ = '\n'
+        else:
+            eol_ = ''
+        if self.original_tagname_ is not None:
+            name_ = self.original_tagname_
+        showIndent(outfile, level, pretty_print)
+        outfile.write('<%s%s%s' % (namespaceprefix_, name_, namespacedef_ and ' ' + namespacedef_ or '', ))
+        already_processed = set()
+        self.exportAttributes(outfile, level, already_processed, namespaceprefix_, name_='VMType61')
+        if self.hasContent_():
+            outfile.write('>%s' % (eol_, ))
+            self.exportChildren(outfile, level + 1, namespaceprefix_='', name_='VMType61', pretty_print=pretty_print)
+            showIndent(outfile, level, pretty_print)
+            outfile.write('</%s%s>%s' % (namespaceprefix_, name_, eol_))
+        else:
+            outfile.write('/>%s' % (eol_, ))
+    def exportAttributes(self, outfile, level, already_processed, namespaceprefix_='', name_='VMType61'):
+        pass
+    def exportChildren(self, outfile, level, namespaceprefix_='', name_='VMType61', fromsubclass_=False, pretty_print=True):
+        if pretty_print:
+            eol_ = '\n'
+        else:
+            eol_ = ''
+        if self.CPU is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<CPU>%s</CPU>%s' % (self.gds_encode(self.gds_format_string(quote_xml(self.CPU), input_name='CPU')), eol_))
+        if self.CPU_USED is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<CPU_USED>%s</CPU_USED>%s' % (self.gds_encode(self.gds_format_string(quote_xml(self.CPU_USED), input_name='CPU_USED')), eol_))
+        if self.MEMORY is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<MEMORY>%s</MEMORY>%s' % (self.gds_encode(self.gds_format_string(quote_xml(self.MEMORY), input_name='MEMORY')), eol_))
+        if self.MEMORY_USED is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<MEMORY_USED>%s</MEMORY_USED>%s' % (self.gds_encode(self.gds_format_string(quote_xml(self.MEMORY_USED), input_name='MEMORY_USED')), eol_))
+        if self.SYSTEM_DISK_SIZE is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<SYSTEM_DISK_SIZE>%s</SYSTEM_DISK_SIZE>%s' % (self.gds_encode(self.gds_format_string(quote_xml(self.SYSTEM_DISK_SIZE), input_name='SYSTEM_DISK_SIZE')), eol_))
+        if self.SYSTEM_DISK_SIZE_USED is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<SYSTEM_DISK_SIZE_USED>%s</SYSTEM_DISK_SIZE_USED>%s' % (self.gds_encode(self.gds_format_string(quote_xml(self.SYSTEM_DISK_SIZE_USED), input_name='SYSTEM_DISK_SIZE_USED')), eol_))
+        if self.VMS is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<VMS>%s</VMS>%s' % (self.gds_encode(self.gds_format_string(quote_xml(self.VMS), input_name='VMS')), eol_))
+        if self.VMS_USED is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<VMS_USED>%s</VMS_USED>%s' % (self.gds_encode(self.gds_format_string(quote_xml(self.VMS_USED), input_name='VMS_USED')), eol_))
+    def build(self, node):
+        already_processed = set()
+        self.buildAttributes(node, node.attrib, already_processed)
+        for child in node:
+            nodeName_ = Tag_pattern_.match(child.tag).groups()[-1]
+            self.buildChildren(child, node, nodeName_)
+        return self
+    def buildAttributes(self, node, attrs, already_processed):
+        pass
+    def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
+        if nodeName_ == 'CPU':
+            CPU_ = child_.text
+            CPU_ = self.gds_validate_string(CPU_, node, 'CPU')
+            self.CPU = CPU_
+        elif nodeName_ == 'CPU_USED':
+            CPU_USED_ = child_.text
+            CPU_USED_ = self.gds_validate_string(CPU_USED_, node, 'CPU_USED')
+            self.CPU_USED = CPU_USED_
+        elif nodeName_ == 'MEMORY':
+            MEMORY_ = child_.text
+            MEMORY_ = self.gds_validate_string(MEMORY_, node, 'MEMORY')
+            self.MEMORY = MEMORY_
+        elif nodeName_ == 'MEMORY_USED':
+            MEMORY_USED_ = child_.text
+            MEMORY_USED_ = self.gds_validate_string(MEMORY_USED_, node, 'MEMORY_USED')
+            self.MEMORY_USED = MEMORY_USED_
+        elif nodeName_ == 'SYSTEM_DISK_SIZE':
+            SYSTEM_DISK_SIZE_ = child_.text
+            SYSTEM_DISK_SIZE_ = self.gds_validate_string(SYSTEM_DISK_SIZE_, node, 'SYSTEM_DISK_SIZE')
+            self.SYSTEM_DISK_SIZE = SYSTEM_DISK_SIZE_
+        elif nodeName_ == 'SYSTEM_DISK_SIZE_USED':
+            SYSTEM_DISK_SIZE_USED_ = child_.text
+            SYSTEM_DISK_SIZE_USED_ = self.gds_validate_string(SYSTEM_DISK_SIZE_USED_, node, 'SYSTEM_DISK_SIZE_USED')
+            self.SYSTEM_DISK_SIZE_USED = SYSTEM_DISK_SIZE_USED_
+        elif nodeName_ == 'VMS':
+            VMS_ = child_.text
+            VMS_ = self.gds_validate_string(VMS_, node, 'VMS')
+            self.VMS = VMS_
+        elif nodeName_ == 'VMS_USED':
+            VMS_USED_ = child_.text
+            VMS_USED_ = self.gds_validate_string(VMS_USED_, node, 'VMS_USED')
+            self.VMS_USED = VMS_USED_
+# end class VMType61
+
+
+class IMAGE_QUOTAType62(GeneratedsSuper):
+    subclass = None
+    superclass = None
+    def __init__(self, IMAGE=None):
+        self.original_tagname_ = None
+        if IMAGE is None:
+            self.IMAGE = []
+        else:
+            self.IMAGE = IMAGE
+    def factory(*args_, **kwargs_):
+        if supermod.CurrentSubclassModule_ is not None:
+            subclass = getSubclassFromModule_(
+                supermod.CurrentSubclassModule_, IMAGE_QUOTAType62)
+            if subclass is not None:
+                return subclass(*args_, **kwargs_)
+        if IMAGE_QUOTAType62.subclass:
+            return IMAGE_QUOTAType62.subclass(*args_, **kwargs_)
+        else:
+            return IMAGE_QUOTAType62(*args_, **kwargs_)
+    factory = staticmethod(factory)
+    def get_IMAGE(self): return self.IMAGE
+    def set_IMAGE(self, IMAGE): self.IMAGE = IMAGE
+    def add_IMAGE(self, value): self.IMAGE.append(value)
+    def insert_IMAGE_at(self, index, value): self.IMAGE.insert(index, value)
+    def replace_IMAGE_at(self, index, value): self.IMAGE[index] = value
+    def hasContent_(self):
+        if (
+            self.IMAGE
+        ):
+            return True
+        else:
+            return False
+    def export(self, outfile, level, namespaceprefix_='', name_='IMAGE_QUOTAType62', namespacedef_='', pretty_print=True):
+        imported_ns_def_ = GenerateDSNamespaceDefs_.get('IMAGE_QUOTAType62')
+        if imported_ns_def_ is not None:
+            namespacedef_ = imported_ns_def_
+        if pretty_print:
+            eol_ = '\n'
+        else:
+            eol_ = ''
+        if self.original_tagname_ is not None:
+            name_ = self.original_tagname_
+        showIndent(outfile, level, pretty_print)
+        outfile.write('<%s%s%s' % (namespaceprefix_, name_, namespacedef_ and ' ' + namespacedef_ or '', ))
+        already_processed = set()
+        self.exportAttributes(outfile, level, already_processed, namespaceprefix_, name_='IMAGE_QUOTAType62')
+        if self.hasContent_():
+            outfile.write('>%s' % (eol_, ))
+            self.exportChildren(outfile, level + 1, namespaceprefix_='', name_='IMAGE_QUOTAType62', pretty_print=pretty_print)
+            showIndent(outfile, level, pretty_print)
+            outfile.write('</%s%s>%s' % (namespaceprefix_, name_, eol_))
+        else:
+            outfile.write('/>%s' % (eol_, ))
+    def exportAttributes(self, outfile, level, already_processed, namespaceprefix_='', name_='IMAGE_QUOTAType62'):
+        pass
+    def exportChildren(self, outfile, level, namespaceprefix_='', name_='IMAGE_QUOTAType62', fromsubclass_=False, pretty_print=True):
+        if pretty_print:
+            eol_ = '\n'
+        else:
+            eol_ = ''
+        for IMAGE_ in self.IMAGE:
+            IMAGE_.export(outfile, level, namespaceprefix_, name_='IMAGE', pretty_print=pretty_print)
+    def build(self, node):
+        already_processed = set()
+        self.buildAttributes(node, node.attrib, already_processed)
+        for child in node:
+            nodeName_ = Tag_pattern_.match(child.tag).groups()[-1]
+            self.buildChildren(child, node, nodeName_)
+        return self
+    def buildAttributes(self, node, attrs, already_processed):
+        pass
+    def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
+        if nodeName_ == 'IMAGE':
+            obj_ = IMAGEType63.factory()
+            obj_.build(child_)
+            self.IMAGE.append(obj_)
+            obj_.original_tagname_ = 'IMAGE'
+# end class IMAGE_QUOTAType62
+
+
+class IMAGEType63(GeneratedsSuper):
+    subclass = None
+    superclass = None
+    def __init__(self, ID=None, RVMS=None, RVMS_USED=None):
+        self.original_tagname_ = None
+        self.ID = ID
+        self.RVMS = RVMS
+        self.RVMS_USED = RVMS_USED
+    def factory(*args_, **kwargs_):
+        if supermod.CurrentSubclassModule_ is not None:
+            subclass = getSubclassFromModule_(
+                supermod.CurrentSubclassModule_, IMAGEType63)
+            if subclass is not None:
+                return subclass(*args_, **kwargs_)
+        if IMAGEType63.subclass:
+            return IMAGEType63.subclass(*args_, **kwargs_)
+        else:
+            return IMAGEType63(*args_, **kwargs_)
+    factory = staticmethod(factory)
+    def get_ID(self): return self.ID
+    def set_ID(self, ID): self.ID = ID
+    def get_RVMS(self): return self.RVMS
+    def set_RVMS(self, RVMS): self.RVMS = RVMS
+    def get_RVMS_USED(self): return self.RVMS_USED
+    def set_RVMS_USED(self, RVMS_USED): self.RVMS_USED = RVMS_USED
+    def hasContent_(self):
+        if (
+            self.ID is not None or
+            self.RVMS is not None or
+            self.RVMS_USED is not None
+        ):
+            return True
+        else:
+            return False
+    def export(self, outfile, level, namespaceprefix_='', name_='IMAGEType63', namespacedef_='', pretty_print=True):
+        imported_ns_def_ = GenerateDSNamespaceDefs_.get('IMAGEType63')
+        if imported_ns_def_ is not None:
+            namespacedef_ = imported_ns_def_
+        if pretty_print:
+            eol_ = '\n'
+        else:
+            eol_ = ''
+        if self.original_tagname_ is not None:
+            name_ = self.original_tagname_
+        showIndent(outfile, level, pretty_print)
+        outfile.write('<%s%s%s' % (namespaceprefix_, name_, namespacedef_ and ' ' + namespacedef_ or '', ))
+        already_processed = set()
+        self.exportAttributes(outfile, level, already_processed, namespaceprefix_, name_='IMAGEType63')
+        if self.hasContent_():
+            outfile.write('>%s' % (eol_, ))
+            self.exportChildren(outfile, level + 1, namespaceprefix_='', name_='IMAGEType63', pretty_print=pretty_print)
+            showIndent(outfile, level, pretty_print)
+            outfile.write('</%s%s>%s' % (namespaceprefix_, name_, eol_))
+        else:
+            outfile.write('/>%s' % (eol_, ))
+    def exportAttributes(self, outfile, level, already_processed, namespaceprefix_='', name_='IMAGEType63'):
+        pass
+    def exportChildren(self, outfile, level, namespaceprefix_='', name_='IMAGEType63', fromsubclass_=False, pretty_print=True):
+        if pretty_print:
+            eol_ = '\n'
+        else:
+            eol_ = ''
+        if self.ID is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<ID>%s</ID>%s' % (self.gds_encode(self.gds_format_string(quote_xml(self.ID), input_name='ID')), eol_))
+        if self.RVMS is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<RVMS>%s</RVMS>%s' % (self.gds_encode(self.gds_format_string(quote_xml(self.RVMS), input_name='RVMS')), eol_))
+        if self.RVMS_USED is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<RVMS_USED>%s</RVMS_USED>%s' % (self.gds_encode(self.gds_format_string(quote_xml(self.RVMS_USED), input_name='RVMS_USED')), eol_))
+    def build(self, node):
+        already_processed = set()
+        self.buildAttributes(node, node.attrib, already_processed)
+        for child in node:
+            nodeName_ = Tag_pattern_.match(child.tag).groups()[-1]
+            self.buildChildren(child, node, nodeName_)
+        return self
+    def buildAttributes(self, node, attrs, already_processed):
+        pass
+    def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
+        if nodeName_ == 'ID':
+            ID_ = child_.text
+            ID_ = self.gds_validate_string(ID_, node, 'ID')
+            self.ID = ID_
+        elif nodeName_ == 'RVMS':
+            RVMS_ = child_.text
+            RVMS_ = self.gds_validate_string(RVMS_, node, 'RVMS')
+            self.RVMS = RVMS_
+        elif nodeName_ == 'RVMS_USED':
+            RVMS_USED_ = child_.text
+            RVMS_USED_ = self.gds_validate_string(RVMS_USED_, node, 'RVMS_USED')
+            self.RVMS_USED = RVMS_USED_
+# end class IMAGEType63
+
+
+class DEFAULT_USER_QUOTASType64(GeneratedsSuper):
+    subclass = None
+    superclass = None
+    def __init__(self, DATASTORE_QUOTA=None, NETWORK_QUOTA=None, VM_QUOTA=None, IMAGE_QUOTA=None):
+        self.original_tagname_ = None
+        self.DATASTORE_QUOTA = DATASTORE_QUOTA
+        self.NETWORK_QUOTA = NETWORK_QUOTA
+        self.VM_QUOTA = VM_QUOTA
+        self.IMAGE_QUOTA = IMAGE_QUOTA
+    def factory(*args_, **kwargs_):
+        if supermod.CurrentSubclassModule_ is not None:
+            subclass = getSubclassFromModule_(
+                supermod.CurrentSubclassModule_, DEFAULT_USER_QUOTASType64)
+            if subclass is not None:
+                return subclass(*args_, **kwargs_)
+        if DEFAULT_USER_QUOTASType64.subclass:
+            return DEFAULT_USER_QUOTASType64.subclass(*args_, **kwargs_)
+        else:
+            return DEFAULT_USER_QUOTASType64(*args_, **kwargs_)
+    factory = staticmethod(factory)
+    def get_DATASTORE_QUOTA(self): return self.DATASTORE_QUOTA
+    def set_DATASTORE_QUOTA(self, DATASTORE_QUOTA): self.DATASTORE_QUOTA = DATASTORE_QUOTA
+    def get_NETWORK_QUOTA(self): return self.NETWORK_QUOTA
+    def set_NETWORK_QUOTA(self, NETWORK_QUOTA): self.NETWORK_QUOTA = NETWORK_QUOTA
+    def get_VM_QUOTA(self): return self.VM_QUOTA
+    def set_VM_QUOTA(self, VM_QUOTA): self.VM_QUOTA = VM_QUOTA
+    def get_IMAGE_QUOTA(self): return self.IMAGE_QUOTA
+    def set_IMAGE_QUOTA(self, IMAGE_QUOTA): self.IMAGE_QUOTA = IMAGE_QUOTA
+    def hasContent_(self):
+        if (
+            self.DATASTORE_QUOTA is not None or
+            self.NETWORK_QUOTA is not None or
+            self.VM_QUOTA is not None or
+            self.IMAGE_QUOTA is not None
+        ):
+            return True
+        else:
+            return False
+    def export(self, outfile, level, namespaceprefix_='', name_='DEFAULT_USER_QUOTASType64', namespacedef_='', pretty_print=True):
+        imported_ns_def_ = GenerateDSNamespaceDefs_.get('DEFAULT_USER_QUOTASType64')
+        if imported_ns_def_ is not None:
+            namespacedef_ = imported_ns_def_
+        if pretty_print:
+            eol_ = '\n'
+        else:
+            eol_ = ''
+        if self.original_tagname_ is not None:
+            name_ = self.original_tagname_
+        showIndent(outfile, level, pretty_print)
+        outfile.write('<%s%s%s' % (namespaceprefix_, name_, namespacedef_ and ' ' + namespacedef_ or '', ))
+        already_processed = set()
+        self.exportAttributes(outfile, level, already_processed, namespaceprefix_, name_='DEFAULT_USER_QUOTASType64')
+        if self.hasContent_():
+            outfile.write('>%s' % (eol_, ))
+            self.exportChildren(outfile, level + 1, namespaceprefix_='', name_='DEFAULT_USER_QUOTASType64', pretty_print=pretty_print)
+            showIndent(outfile, level, pretty_print)
+            outfile.write('</%s%s>%s' % (namespaceprefix_, name_, eol_))
+        else:
+            outfile.write('/>%s' % (eol_, ))
+    def exportAttributes(self, outfile, level, already_processed, namespaceprefix_='', name_='DEFAULT_USER_QUOTASType64'):
+        pass
+    def exportChildren(self, outfile, level, namespaceprefix_='', name_='DEFAULT_USER_QUOTASType64', fromsubclass_=False, pretty_print=True):
+        if pretty_print:
+            eol_ = '\n'
+        else:
+            eol_ = ''
+        if self.DATASTORE_QUOTA is not None:
+            self.DATASTORE_QUOTA.export(outfile, level, namespaceprefix_, name_='DATASTORE_QUOTA', pretty_print=pretty_print)
+        if self.NETWORK_QUOTA is not None:
+            self.NETWORK_QUOTA.export(outfile, level, namespaceprefix_, name_='NETWORK_QUOTA', pretty_print=pretty_print)
+        if self.VM_QUOTA is not None:
+            self.VM_QUOTA.export(outfile, level, namespaceprefix_, name_='VM_QUOTA', pretty_print=pretty_print)
+        if self.IMAGE_QUOTA is not None:
+            self.IMAGE_QUOTA.export(outfile, level, namespaceprefix_, name_='IMAGE_QUOTA', pretty_print=pretty_print)
+    def build(self, node):
+        already_processed = set()
+        self.buildAttributes(node, node.attrib, already_processed)
+        for child in node:
+            nodeName_ = Tag_pattern_.match(child.tag).groups()[-1]
+            self.buildChildren(child, node, nodeName_)
+        return self
+    def buildAttributes(self, node, attrs, already_processed):
+        pass
+    def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
+        if nodeName_ == 'DATASTORE_QUOTA':
+            obj_ = DATASTORE_QUOTAType65.factory()
+            obj_.build(child_)
+            self.DATASTORE_QUOTA = obj_
+            obj_.original_tagname_ = 'DATASTORE_QUOTA'
+        elif nodeName_ == 'NETWORK_QUOTA':
+            obj_ = NETWORK_QUOTAType67.factory()
+            obj_.build(child_)
+            self.NETWORK_QUOTA = obj_
+            obj_.original_tagname_ = 'NETWORK_QUOTA'
+        elif nodeName_ == 'VM_QUOTA':
+            obj_ = VM_QUOTAType69.factory()
+            obj_.build(child_)
+            self.VM_QUOTA = obj_
+            obj_.original_tagname_ = 'VM_QUOTA'
+        elif nodeName_ == 'IMAGE_QUOTA':
+            obj_ = IMAGE_QUOTAType71.factory()
+            obj_.build(child_)
+            self.IMAGE_QUOTA = obj_
+            obj_.original_tagname_ = 'IMAGE_QUOTA'
+# end class DEFAULT_USER_QUOTASType64
+
+
+class DATASTORE_QUOTAType65(GeneratedsSuper):
+    subclass = None
+    superclass = None
+    def __init__(self, DATASTORE=None):
+        self.original_tagname_ = None
+        if DATASTORE is None:
+            self.DATASTORE = []
+        else:
+            self.DATASTORE = DATASTORE
+    def factory(*args_, **kwargs_):
+        if supermod.CurrentSubclassModule_ is not None:
+            subclass = getSubclassFromModule_(
+                supermod.CurrentSubclassModule_, DATASTORE_QUOTAType65)
+            if subclass is not None:
+                return subclass(*args_, **kwargs_)
+        if DATASTORE_QUOTAType65.subclass:
+            return DATASTORE_QUOTAType65.subclass(*args_, **kwargs_)
+        else:
+            return DATASTORE_QUOTAType65(*args_, **kwargs_)
+    factory = staticmethod(factory)
+    def get_DATASTORE(self): return self.DATASTORE
+    def set_DATASTORE(self, DATASTORE): self.DATASTORE = DATASTORE
+    def add_DATASTORE(self, value): self.DATASTORE.append(value)
+    def insert_DATASTORE_at(self, index, value): self.DATASTORE.insert(index, value)
+    def replace_DATASTORE_at(self, index, value): self.DATASTORE[index] = value
+    def hasContent_(self):
+        if (
+            self.DATASTORE
+        ):
+            return True
+        else:
+            return False
+    def export(self, outfile, level, namespaceprefix_='', name_='DATASTORE_QUOTAType65', namespacedef_='', pretty_print=True):
+        imported_ns_def_ = GenerateDSNamespaceDefs_.get('DATASTORE_QUOTAType65')
+        if imported_ns_def_ is not None:
+            namespacedef_ = imported_ns_def_
+        if pretty_print:
+            eol_ = '\n'
+        else:
+            eol_ = ''
+        if self.original_tagname_ is not None:
+            name_ = self.original_tagname_
+        showIndent(outfile, level, pretty_print)
+        outfile.write('<%s%s%s' % (namespaceprefix_, name_, namespacedef_ and ' ' + namespacedef_ or '', ))
+        already_processed = set()
+        self.exportAttributes(outfile, level, already_processed, namespaceprefix_, name_='DATASTORE_QUOTAType65')
+        if self.hasContent_():
+            outfile.write('>%s' % (eol_, ))
+            self.exportChildren(outfile, level + 1, namespaceprefix_='', name_='DATASTORE_QUOTAType65', pretty_print=pretty_print)
+            showIndent(outfile, level, pretty_print)
+            outfile.write('</%s%s>%s' % (namespaceprefix_, name_, eol_))
+        else:
+            outfile.write('/>%s' % (eol_, ))
+    def exportAttributes(self, outfile, level, already_processed, namespaceprefix_='', name_='DATASTORE_QUOTAType65'):
+        pass
+    def exportChildren(self, outfile, level, namespaceprefix_='', name_='DATASTORE_QUOTAType65', fromsubclass_=False, pretty_print=True):
+        if pretty_print:
+            eol_ = '\n'
+        else:
+            eol_ = ''
+        for DATASTORE_ in self.DATASTORE:
+            DATASTORE_.export(outfile, level, namespaceprefix_, name_='DATASTORE', pretty_print=pretty_print)
+    def build(self, node):
+        already_processed = set()
+        self.buildAttributes(node, node.attrib, already_processed)
+        for child in node:
+            nodeName_ = Tag_pattern_.match(child.tag).groups()[-1]
+            self.buildChildren(child, node, nodeName_)
+        return self
+    def buildAttributes(self, node, attrs, already_processed):
+        pass
+    def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
+        if nodeName_ == 'DATASTORE':
+            obj_ = DATASTOREType66.factory()
+            obj_.build(child_)
+            self.DATASTORE.append(obj_)
+            obj_.original_tagname_ = 'DATASTORE'
+# end class DATASTORE_QUOTAType65
+
+
+class DATASTOREType66(GeneratedsSuper):
+    subclass = None
+    superclass = None
+    def __init__(self, ID=None, IMAGES=None, IMAGES_USED=None, SIZE=None, SIZE_USED=None):
+        self.original_tagname_ = None
+        self.ID = ID
+        self.IMAGES = IMAGES
+        self.IMAGES_USED = IMAGES_USED
+        self.SIZE = SIZE
+        self.SIZE_USED = SIZE_USED
+    def factory(*args_, **kwargs_):
+        if supermod.CurrentSubclassModule_ is not None:
+            subclass = getSubclassFromModule_(
+                supermod.CurrentSubclassModule_, DATASTOREType66)
+            if subclass is not None:
+                return subclass(*args_, **kwargs_)
+        if DATASTOREType66.subclass:
+            return DATASTOREType66.subclass(*args_, **kwargs_)
+        else:
+            return DATASTOREType66(*args_, **kwargs_)
+    factory = staticmethod(factory)
+    def get_ID(self): return self.ID
+    def set_ID(self, ID): self.ID = ID
+    def get_IMAGES(self): return self.IMAGES
+    def set_IMAGES(self, IMAGES): self.IMAGES = IMAGES
+    def get_IMAGES_USED(self): return self.IMAGES_USED
+    def set_IMAGES_USED(self, IMAGES_USED): self.IMAGES_USED = IMAGES_USED
+    def get_SIZE(self): return self.SIZE
+    def set_SIZE(self, SIZE): self.SIZE = SIZE
+    def get_SIZE_USED(self): return self.SIZE_USED
+    def set_SIZE_USED(self, SIZE_USED): self.SIZE_USED = SIZE_USED
+    def hasContent_(self):
+        if (
+            self.ID is not None or
+            self.IMAGES is not None or
+            self.IMAGES_USED is not None or
+            self.SIZE is not None or
+            self.SIZE_USED is not None
+        ):
+            return True
+        else:
+            return False
+    def export(self, outfile, level, namespaceprefix_='', name_='DATASTOREType66', namespacedef_='', pretty_print=True):
+        imported_ns_def_ = GenerateDSNamespaceDefs_.get('DATASTOREType66')
+        if imported_ns_def_ is not None:
+            namespacedef_ = imported_ns_def_
+        if pretty_print:
+            eol_ = '\n'
+        else:
+            eol_ = ''
+        if self.original_tagname_ is not None:
+            name_ = self.original_tagname_
+        showIndent(outfile, level, pretty_print)
+        outfile.write('<%s%s%s' % (namespaceprefix_, name_, namespacedef_ and ' ' + namespacedef_ or '', ))
+        already_processed = set()
+        self.exportAttributes(outfile, level, already_processed, namespaceprefix_, name_='DATASTOREType66')
+        if self.hasContent_():
+            outfile.write('>%s' % (eol_, ))
+            self.exportChildren(outfile, level + 1, namespaceprefix_='', name_='DATASTOREType66', pretty_print=pretty_print)
+            showIndent(outfile, level, pretty_print)
+            outfile.write('</%s%s>%s' % (namespaceprefix_, name_, eol_))
+        else:
+            outfile.write('/>%s' % (eol_, ))
+    def exportAttributes(self, outfile, level, already_processed, namespaceprefix_='', name_='DATASTOREType66'):
+        pass
+    def exportChildren(self, outfile, level, namespaceprefix_='', name_='DATASTOREType66', fromsubclass_=False, pretty_print=True):
+        if pretty_print:
+            eol_ = '\n'
+        else:
+            eol_ = ''
+        if self.ID is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<ID>%s</ID>%s' % (self.gds_encode(self.gds_format_string(quote_xml(self.ID), input_name='ID')), eol_))
+        if self.IMAGES is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<IMAGES>%s</IMAGES>%s' % (self.gds_encode(self.gds_format_string(quote_xml(self.IMAGES), input_name='IMAGES')), eol_))
+        if self.IMAGES_USED is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<IMAGES_USED>%s</IMAGES_USED>%s' % (self.gds_encode(self.gds_format_string(quote_xml(self.IMAGES_USED), input_name='IMAGES_USED')), eol_))
+        if self.SIZE is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<SIZE>%s</SIZE>%s' % (self.gds_encode(self.gds_format_string(quote_xml(self.SIZE), input_name='SIZE')), eol_))
+        if self.SIZE_USED is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<SIZE_USED>%s</SIZE_USED>%s' % (self.gds_encode(self.gds_format_string(quote_xml(self.SIZE_USED), input_name='SIZE_USED')), eol_))
+    def build(self, node):
+        already_processed = set()
+        self.buildAttributes(node, node.attrib, already_processed)
+        for child in node:
+            nodeName_ = Tag_pattern_.match(child.tag).groups()[-1]
+            self.buildChildren(child, node, nodeName_)
+        return self
+    def buildAttributes(self, node, attrs, already_processed):
+        pass
+    def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
+        if nodeName_ == 'ID':
+            ID_ = child_.text
+            ID_ = self.gds_validate_string(ID_, node, 'ID')
+            self.ID = ID_
+        elif nodeName_ == 'IMAGES':
+            IMAGES_ = child_.text
+            IMAGES_ = self.gds_validate_string(IMAGES_, node, 'IMAGES')
+            self.IMAGES = IMAGES_
+        elif nodeName_ == 'IMAGES_USED':
+            IMAGES_USED_ = child_.text
+            IMAGES_USED_ = self.gds_validate_string(IMAGES_USED_, node, 'IMAGES_USED')
+            self.IMAGES_USED = IMAGES_USED_
+        elif nodeName_ == 'SIZE':
+            SIZE_ = child_.text
+            SIZE_ = self.gds_validate_string(SIZE_, node, 'SIZE')
+            self.SIZE = SIZE_
+        elif nodeName_ == 'SIZE_USED':
+            SIZE_USED_ = child_.text
+            SIZE_USED_ = self.gds_validate_string(SIZE_USED_, node, 'SIZE_USED')
+            self.SIZE_USED = SIZE_USED_
+# end class DATASTOREType66
+
+
+class NETWORK_QUOTAType67(GeneratedsSuper):
+    subclass = None
+    superclass = None
+    def __init__(self, NETWORK=None):
+        self.original_tagname_ = None
+        if NETWORK is None:
+            self.NETWORK = []
+        else:
+            self.NETWORK = NETWORK
+    def factory(*args_, **kwargs_):
+        if supermod.CurrentSubclassModule_ is not None:
+            subclass = getSubclassFromModule_(
+                supermod.CurrentSubclassModule_, NETWORK_QUOTAType67)
+            if subclass is not None:
+                return subclass(*args_, **kwargs_)
+        if NETWORK_QUOTAType67.subclass:
+            return NETWORK_QUOTAType67.subclass(*args_, **kwargs_)
+        else:
+            return NETWORK_QUOTAType67(*args_, **kwargs_)
+    factory = staticmethod(factory)
+    def get_NETWORK(self): return self.NETWORK
+    def set_NETWORK(self, NETWORK): self.NETWORK = NETWORK
+    def add_NETWORK(self, value): self.NETWORK.append(value)
+    def insert_NETWORK_at(self, index, value): self.NETWORK.insert(index, value)
+    def replace_NETWORK_at(self, index, value): self.NETWORK[index] = value
+    def hasContent_(self):
+        if (
+            self.NETWORK
+        ):
+            return True
+        else:
+            return False
+    def export(self, outfile, level, namespaceprefix_='', name_='NETWORK_QUOTAType67', namespacedef_='', pretty_print=True):
+        imported_ns_def_ = GenerateDSNamespaceDefs_.get('NETWORK_QUOTAType67')
+        if imported_ns_def_ is not None:
+            namespacedef_ = imported_ns_def_
+        if pretty_print:
+            eol_ = '\n'
+        else:
+            eol_ = ''
+        if self.original_tagname_ is not None:
+            name_ = self.original_tagname_
+        showIndent(outfile, level, pretty_print)
+        outfile.write('<%s%s%s' % (namespaceprefix_, name_, namespacedef_ and ' ' + namespacedef_ or '', ))
+        already_processed = set()
+        self.exportAttributes(outfile, level, already_processed, namespaceprefix_, name_='NETWORK_QUOTAType67')
+        if self.hasContent_():
+            outfile.write('>%s' % (eol_, ))
+            self.exportChildren(outfile, level + 1, namespaceprefix_='', name_='NETWORK_QUOTAType67', pretty_print=pretty_print)
+            showIndent(outfile, level, pretty_print)
+            outfile.write('</%s%s>%s' % (namespaceprefix_, name_, eol_))
+        else:
+            outfile.write('/>%s' % (eol_, ))
+    def exportAttributes(self, outfile, level, already_processed, namespaceprefix_='', name_='NETWORK_QUOTAType67'):
+        pass
+    def exportChildren(self, outfile, level, namespaceprefix_='', name_='NETWORK_QUOTAType67', fromsubclass_=False, pretty_print=True):
+        if pretty_print:
+            eol_ = '\n'
+        else:
+            eol_ = ''
+        for NETWORK_ in self.NETWORK:
+            NETWORK_.export(outfile, level, namespaceprefix_, name_='NETWORK', pretty_print=pretty_print)
+    def build(self, node):
+        already_processed = set()
+        self.buildAttributes(node, node.attrib, already_processed)
+        for child in node:
+            nodeName_ = Tag_pattern_.match(child.tag).groups()[-1]
+            self.buildChildren(child, node, nodeName_)
+        return self
+    def buildAttributes(self, node, attrs, already_processed):
+        pass
+    def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
+        if nodeName_ == 'NETWORK':
+            obj_ = NETWORKType68.factory()
+            obj_.build(child_)
+            self.NETWORK.append(obj_)
+            obj_.original_tagname_ = 'NETWORK'
+# end class NETWORK_QUOTAType67
+
+
+class NETWORKType68(GeneratedsSuper):
+    subclass = None
+    superclass = None
+    def __init__(self, ID=None, LEASES=None, LEASES_USED=None):
+        self.original_tagname_ = None
+        self.ID = ID
+        self.LEASES = LEASES
+        self.LEASES_USED = LEASES_USED
+    def factory(*args_, **kwargs_):
+        if supermod.CurrentSubclassModule_ is not None:
+            subclass = getSubclassFromModule_(
+                supermod.CurrentSubclassModule_, NETWORKType68)
+            if subclass is not None:
+                return subclass(*args_, **kwargs_)
+        if NETWORKType68.subclass:
+            return NETWORKType68.subclass(*args_, **kwargs_)
+        else:
+            return NETWORKType68(*args_, **kwargs_)
+    factory = staticmethod(factory)
+    def get_ID(self): return self.ID
+    def set_ID(self, ID): self.ID = ID
+    def get_LEASES(self): return self.LEASES
+    def set_LEASES(self, LEASES): self.LEASES = LEASES
+    def get_LEASES_USED(self): return self.LEASES_USED
+    def set_LEASES_USED(self, LEASES_USED): self.LEASES_USED = LEASES_USED
+    def hasContent_(self):
+        if (
+            self.ID is not None or
+            self.LEASES is not None or
+            self.LEASES_USED is not None
+        ):
+            return True
+        else:
+            return False
+    def export(self, outfile, level, namespaceprefix_='', name_='NETWORKType68', namespacedef_='', pretty_print=True):
+        imported_ns_def_ = GenerateDSNamespaceDefs_.get('NETWORKType68')
+        if imported_ns_def_ is not None:
+            namespacedef_ = imported_ns_def_
+        if pretty_print:
+            eol_ = '\n'
+        else:
+            eol_ = ''
+        if self.original_tagname_ is not None:
+            name_ = self.original_tagname_
+        showIndent(outfile, level, pretty_print)
+        outfile.write('<%s%s%s' % (namespaceprefix_, name_, namespacedef_ and ' ' + namespacedef_ or '', ))
+        already_processed = set()
+        self.exportAttributes(outfile, level, already_processed, namespaceprefix_, name_='NETWORKType68')
+        if self.hasContent_():
+            outfile.write('>%s' % (eol_, ))
+            self.exportChildren(outfile, level + 1, namespaceprefix_='', name_='NETWORKType68', pretty_print=pretty_print)
+            showIndent(outfile, level, pretty_print)
+            outfile.write('</%s%s>%s' % (namespaceprefix_, name_, eol_))
+        else:
+            outfile.write('/>%s' % (eol_, ))
+    def exportAttributes(self, outfile, level, already_processed, namespaceprefix_='', name_='NETWORKType68'):
+        pass
+    def exportChildren(self, outfile, level, namespaceprefix_='', name_='NETWORKType68', fromsubclass_=False, pretty_print=True):
+        if pretty_print:
+            eol_ = '\n'
+        else:
+            eol_ = ''
+        if self.ID is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<ID>%s</ID>%s' % (self.gds_encode(self.gds_format_string(quote_xml(self.ID), input_name='ID')), eol_))
+        if self.LEASES is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<LEASES>%s</LEASES>%s' % (self.gds_encode(self.gds_format_string(quote_xml(self.LEASES), input_name='LEASES')), eol_))
+        if self.LEASES_USED is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<LEASES_USED>%s</LEASES_USED>%s' % (self.gds_encode(self.gds_format_string(quote_xml(self.LEASES_USED), input_name='LEASES_USED')), eol_))
+    def build(self, node):
+        already_processed = set()
+        self.buildAttributes(node, node.attrib, already_processed)
+        for child in node:
+            nodeName_ = Tag_pattern_.match(child.tag).groups()[-1]
+            self.buildChildren(child, node, nodeName_)
+        return self
+    def buildAttributes(self, node, attrs, already_processed):
+        pass
+    def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
+        if nodeName_ == 'ID':
+            ID_ = child_.text
+            ID_ = self.gds_validate_string(ID_, node, 'ID')
+            self.ID = ID_
+        elif nodeName_ == 'LEASES':
+            LEASES_ = child_.text
+            LEASES_ = self.gds_validate_string(LEASES_, node, 'LEASES')
+            self.LEASES = LEASES_
+        elif nodeName_ == 'LEASES_USED':
+            LEASES_USED_ = child_.text
+            LEASES_USED_ = self.gds_validate_string(LEASES_USED_, node, 'LEASES_USED')
+            self.LEASES_USED = LEASES_USED_
+# end class NETWORKType68
+
+
+class VM_QUOTAType69(GeneratedsSuper):
+    subclass = None
+    superclass = None
+    def __init__(self, VM=None):
+        self.original_tagname_ = None
+        self.VM = VM
+    def factory(*args_, **kwargs_):
+        if supermod.CurrentSubclassModule_ is not None:
+            subclass = getSubclassFromModule_(
+                supermod.CurrentSubclassModule_, VM_QUOTAType69)
+            if subclass is not None:
+                return subclass(*args_, **kwargs_)
+        if VM_QUOTAType69.subclass:
+            return VM_QUOTAType69.subclass(*args_, **kwargs_)
+        else:
+            return VM_QUOTAType69(*args_, **kwargs_)
+    factory = staticmethod(factory)
+    def get_VM(self): return self.VM
+    def set_VM(self, VM): self.VM = VM
+    def hasContent_(self):
+        if (
+            self.VM is not None
+        ):
+            return True
+        else:
+            return False
+    def export(self, outfile, level, namespaceprefix_='', name_='VM_QUOTAType69', namespacedef_='', pretty_print=True):
+        imported_ns_def_ = GenerateDSNamespaceDefs_.get('VM_QUOTAType69')
+        if imported_ns_def_ is not None:
+            namespacedef_ = imported_ns_def_
+        if pretty_print:
+            eol_ = '\n'
+        else:
+            eol_ = ''
+        if self.original_tagname_ is not None:
+            name_ = self.original_tagname_
+        showIndent(outfile, level, pretty_print)
+        outfile.write('<%s%s%s' % (namespaceprefix_, name_, namespacedef_ and ' ' + namespacedef_ or '', ))
+        already_processed = set()
+        self.exportAttributes(outfile, level, already_processed, namespaceprefix_, name_='VM_QUOTAType69')
+        if self.hasContent_():
+            outfile.write('>%s' % (eol_, ))
+            self.exportChildren(outfile, level + 1, namespaceprefix_='', name_='VM_QUOTAType69', pretty_print=pretty_print)
+            showIndent(outfile, level, pretty_print)
+            outfile.write('</%s%s>%s' % (namespaceprefix_, name_, eol_))
+        else:
+            outfile.write('/>%s' % (eol_, ))
+    def exportAttributes(self, outfile, level, already_processed, namespaceprefix_='', name_='VM_QUOTAType69'):
+        pass
+    def exportChildren(self, outfile, level, namespaceprefix_='', name_='VM_QUOTAType69', fromsubclass_=False, pretty_print=True):
+        if pretty_print:
+            eol_ = '\n'
+        else:
+            eol_ = ''
+        if self.VM is not None:
+            self.VM.export(outfile, level, namespaceprefix_, name_='VM', pretty_print=pretty_print)
+    def build(self, node):
+        already_processed = set()
+        self.buildAttributes(node, node.attrib, already_processed)
+        for child in node:
+            nodeName_ = Tag_pattern_.match(child.tag).groups()[-1]
+            self.buildChildren(child, node, nodeName_)
+        return self
+    def buildAttributes(self, node, attrs, already_processed):
+        pass
+    def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
+        if nodeName_ == 'VM':
+            obj_ = VMType70.factory()
+            obj_.build(child_)
+            self.VM = obj_
+            obj_.original_tagname_ = 'VM'
+# end class VM_QUOTAType69
+
+
+class VMType70(GeneratedsSuper):
+    subclass = None
+    superclass = None
+    def __init__(self, CPU=None, CPU_USED=None, MEMORY=None, MEMORY_USED=None, SYSTEM_DISK_SIZE=None, SYSTEM_DISK_SIZE_USED=None, VMS=None, VMS_USED=None):
+        self.original_tagname_ = None
+        self.CPU = CPU
+        self.CPU_USED = CPU_USED
+        self.MEMORY = MEMORY
+        self.MEMORY_USED = MEMORY_USED
+        self.SYSTEM_DISK_SIZE = SYSTEM_DISK_SIZE
+        self.SYSTEM_DISK_SIZE_USED = SYSTEM_DISK_SIZE_USED
+        self.VMS = VMS
+        self.VMS_USED = VMS_USED
+    def factory(*args_, **kwargs_):
+        if supermod.CurrentSubclassModule_ is not None:
+            subclass = getSubclassFromModule_(
+                supermod.CurrentSubclassModule_, VMType70)
+            if subclass is not None:
+                return subclass(*args_, **kwargs_)
+        if VMType70.subclass:
+            return VMType70.subclass(*args_, **kwargs_)
+        else:
+            return VMType70(*args_, **kwargs_)
+    factory = staticmethod(factory)
+    def get_CPU(self): return self.CPU
+    def set_CPU(self, CPU): self.CPU = CPU
+    def get_CPU_USED(self): return self.CPU_USED
+    def set_CPU_USED(self, CPU_USED): self.CPU_USED = CPU_USED
+    def get_MEMORY(self): return self.MEMORY
+    def set_MEMORY(self, MEMORY): self.MEMORY = MEMORY
+    def get_MEMORY_USED(self): return self.MEMORY_USED
+    def set_MEMORY_USED(self, MEMORY_USED): self.MEMORY_USED = MEMORY_USED
+    def get_SYSTEM_DISK_SIZE(self): return self.SYSTEM_DISK_SIZE
+    def set_SYSTEM_DISK_SIZE(self, SYSTEM_DISK_SIZE): self.SYSTEM_DISK_SIZE = SYSTEM_DISK_SIZE
+    def get_SYSTEM_DISK_SIZE_USED(self): return self.SYSTEM_DISK_SIZE_USED
+    def set_SYSTEM_DISK_SIZE_USED(self, SYSTEM_DISK_SIZE_USED): self.SYSTEM_DISK_SIZE_USED = SYSTEM_DISK_SIZE_USED
+    def get_VMS(self): return self.VMS
+    def set_VMS(self, VMS): self.VMS = VMS
+    def get_VMS_USED(self): return self.VMS_USED
+    def set_VMS_USED(self, VMS_USED): self.VMS_USED = VMS_USED
+    def hasContent_(self):
+        if (
+            self.CPU is not None or
+            self.CPU_USED is not None or
+            self.MEMORY is not None or
+            self.MEMORY_USED is not None or
+            self.SYSTEM_DISK_SIZE is not None or
+            self.SYSTEM_DISK_SIZE_USED is not None or
+            self.VMS is not None or
+            self.VMS_USED is not None
+        ):
+            return True
+        else:
+            return False
+    def export(self, outfile, level, namespaceprefix_='', name_='VMType70', namespacedef_='', pretty_print=True):
+        imported_ns_def_ = GenerateDSNamespaceDefs_.get('VMType70')
+        if imported_ns_def_ is not None:
+            namespacedef_ = imported_ns_def_
+        if pretty_print:
+            eol_ = '\n'
+        else:
+            eol_ = ''
+        if self.original_tagname_ is not None:
+            name_ = self.original_tagname_
+        showIndent(outfile, level, pretty_print)
+        outfile.write('<%s%s%s' % (namespaceprefix_, name_, namespacedef_ and ' ' + namespacedef_ or '', ))
+        already_processed = set()
+        self.exportAttributes(outfile, level, already_processed, namespaceprefix_, name_='VMType70')
+        if self.hasContent_():
+            outfile.write('>%s' % (eol_, ))
+            self.exportChildren(outfile, level + 1, namespaceprefix_='', name_='VMType70', pretty_print=pretty_print)
+            showIndent(outfile, level, pretty_print)
+            outfile.write('</%s%s>%s' % (namespaceprefix_, name_, eol_))
+        else:
+            outfile.write('/>%s' % (eol_, ))
+    def exportAttributes(self, outfile, level, already_processed, namespaceprefix_='', name_='VMType70'):
+        pass
+    def exportChildren(self, outfile, level, namespaceprefix_='', name_='VMType70', fromsubclass_=False, pretty_print=True):
+        if pretty_print:
+            eol_ = '\n'
+        else:
+            eol_ = ''
+        if self.CPU is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<CPU>%s</CPU>%s' % (self.gds_encode(self.gds_format_string(quote_xml(self.CPU), input_name='CPU')), eol_))
+        if self.CPU_USED is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<CPU_USED>%s</CPU_USED>%s' % (self.gds_encode(self.gds_format_string(quote_xml(self.CPU_USED), input_name='CPU_USED')), eol_))
+        if self.MEMORY is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<MEMORY>%s</MEMORY>%s' % (self.gds_encode(self.gds_format_string(quote_xml(self.MEMORY), input_name='MEMORY')), eol_))
+        if self.MEMORY_USED is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<MEMORY_USED>%s</MEMORY_USED>%s' % (self.gds_encode(self.gds_format_string(quote_xml(self.MEMORY_USED), input_name='MEMORY_USED')), eol_))
+        if self.SYSTEM_DISK_SIZE is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<SYSTEM_DISK_SIZE>%s</SYSTEM_DISK_SIZE>%s' % (self.gds_encode(self.gds_format_string(quote_xml(self.SYSTEM_DISK_SIZE), input_name='SYSTEM_DISK_SIZE')), eol_))
+        if self.SYSTEM_DISK_SIZE_USED is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<SYSTEM_DISK_SIZE_USED>%s</SYSTEM_DISK_SIZE_USED>%s' % (self.gds_encode(self.gds_format_string(quote_xml(self.SYSTEM_DISK_SIZE_USED), input_name='SYSTEM_DISK_SIZE_USED')), eol_))
+        if self.VMS is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<VMS>%s</VMS>%s' % (self.gds_encode(self.gds_format_string(quote_xml(self.VMS), input_name='VMS')), eol_))
+        if self.VMS_USED is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<VMS_USED>%s</VMS_USED>%s' % (self.gds_encode(self.gds_format_string(quote_xml(self.VMS_USED), input_name='VMS_USED')), eol_))
+    def build(self, node):
+        already_processed = set()
+        self.buildAttributes(node, node.attrib, already_processed)
+        for child in node:
+            nodeName_ = Tag_pattern_.match(child.tag).groups()[-1]
+            self.buildChildren(child, node, nodeName_)
+        return self
+    def buildAttributes(self, node, attrs, already_processed):
+        pass
+    def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
+        if nodeName_ == 'CPU':
+            CPU_ = child_.text
+            CPU_ = self.gds_validate_string(CPU_, node, 'CPU')
+            self.CPU = CPU_
+        elif nodeName_ == 'CPU_USED':
+            CPU_USED_ = child_.text
+            CPU_USED_ = self.gds_validate_string(CPU_USED_, node, 'CPU_USED')
+            self.CPU_USED = CPU_USED_
+        elif nodeName_ == 'MEMORY':
+            MEMORY_ = child_.text
+            MEMORY_ = self.gds_validate_string(MEMORY_, node, 'MEMORY')
+            self.MEMORY = MEMORY_
+        elif nodeName_ == 'MEMORY_USED':
+            MEMORY_USED_ = child_.text
+            MEMORY_USED_ = self.gds_validate_string(MEMORY_USED_, node, 'MEMORY_USED')
+            self.MEMORY_USED = MEMORY_USED_
+        elif nodeName_ == 'SYSTEM_DISK_SIZE':
+            SYSTEM_DISK_SIZE_ = child_.text
+            SYSTEM_DISK_SIZE_ = self.gds_validate_string(SYSTEM_DISK_SIZE_, node, 'SYSTEM_DISK_SIZE')
+            self.SYSTEM_DISK_SIZE = SYSTEM_DISK_SIZE_
+        elif nodeName_ == 'SYSTEM_DISK_SIZE_USED':
+            SYSTEM_DISK_SIZE_USED_ = child_.text
+            SYSTEM_DISK_SIZE_USED_ = self.gds_validate_string(SYSTEM_DISK_SIZE_USED_, node, 'SYSTEM_DISK_SIZE_USED')
+            self.SYSTEM_DISK_SIZE_USED = SYSTEM_DISK_SIZE_USED_
+        elif nodeName_ == 'VMS':
+            VMS_ = child_.text
+            VMS_ = self.gds_validate_string(VMS_, node, 'VMS')
+            self.VMS = VMS_
+        elif nodeName_ == 'VMS_USED':
+            VMS_USED_ = child_.text
+            VMS_USED_ = self.gds_validate_string(VMS_USED_, node, 'VMS_USED')
+            self.VMS_USED = VMS_USED_
+# end class VMType70
+
+
+class IMAGE_QUOTAType71(GeneratedsSuper):
+    subclass = None
+    superclass = None
+    def __init__(self, IMAGE=None):
+        self.original_tagname_ = None
+        if IMAGE is None:
+            self.IMAGE = []
+        else:
+            self.IMAGE = IMAGE
+    def factory(*args_, **kwargs_):
+        if supermod.CurrentSubclassModule_ is not None:
+            subclass = getSubclassFromModule_(
+                supermod.CurrentSubclassModule_, IMAGE_QUOTAType71)
+            if subclass is not None:
+                return subclass(*args_, **kwargs_)
+        if IMAGE_QUOTAType71.subclass:
+            return IMAGE_QUOTAType71.subclass(*args_, **kwargs_)
+        else:
+            return IMAGE_QUOTAType71(*args_, **kwargs_)
+    factory = staticmethod(factory)
+    def get_IMAGE(self): return self.IMAGE
+    def set_IMAGE(self, IMAGE): self.IMAGE = IMAGE
+    def add_IMAGE(self, value): self.IMAGE.append(value)
+    def insert_IMAGE_at(self, index, value): self.IMAGE.insert(index, value)
+    def replace_IMAGE_at(self, index, value): self.IMAGE[index] = value
+    def hasContent_(self):
+        if (
+            self.IMAGE
+        ):
+            return True
+        else:
+            return False
+    def export(self, outfile, level, namespaceprefix_='', name_='IMAGE_QUOTAType71', namespacedef_='', pretty_print=True):
+        imported_ns_def_ = GenerateDSNamespaceDefs_.get('IMAGE_QUOTAType71')
+        if imported_ns_def_ is not None:
+            namespacedef_ = imported_ns_def_
+        if pretty_print:
+            eol_ = '\n'
+        else:
+            eol_ = ''
+        if self.original_tagname_ is not None:
+            name_ = self.original_tagname_
+        showIndent(outfile, level, pretty_print)
+        outfile.write('<%s%s%s' % (namespaceprefix_, name_, namespacedef_ and ' ' + namespacedef_ or '', ))
+        already_processed = set()
+        self.exportAttributes(outfile, level, already_processed, namespaceprefix_, name_='IMAGE_QUOTAType71')
+        if self.hasContent_():
+            outfile.write('>%s' % (eol_, ))
+            self.exportChildren(outfile, level + 1, namespaceprefix_='', name_='IMAGE_QUOTAType71', pretty_print=pretty_print)
+            showIndent(outfile, level, pretty_print)
+            outfile.write('</%s%s>%s' % (namespaceprefix_, name_, eol_))
+        else:
+            outfile.write('/>%s' % (eol_, ))
+    def exportAttributes(self, outfile, level, already_processed, namespaceprefix_='', name_='IMAGE_QUOTAType71'):
+        pass
+    def exportChildren(self, outfile, level, namespaceprefix_='', name_='IMAGE_QUOTAType71', fromsubclass_=False, pretty_print=True):
+        if pretty_print:
+            eol_ = '\n'
+        else:
+            eol_ = ''
+        for IMAGE_ in self.IMAGE:
+            IMAGE_.export(outfile, level, namespaceprefix_, name_='IMAGE', pretty_print=pretty_print)
+    def build(self, node):
+        already_processed = set()
+        self.buildAttributes(node, node.attrib, already_processed)
+        for child in node:
+            nodeName_ = Tag_pattern_.match(child.tag).groups()[-1]
+            self.buildChildren(child, node, nodeName_)
+        return self
+    def buildAttributes(self, node, attrs, already_processed):
+        pass
+    def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
+        if nodeName_ == 'IMAGE':
+            obj_ = IMAGEType72.factory()
+            obj_.build(child_)
+            self.IMAGE.append(obj_)
+            obj_.original_tagname_ = 'IMAGE'
+# end class IMAGE_QUOTAType71
+
+
+class IMAGEType72(GeneratedsSuper):
+    subclass = None
+    superclass = None
+    def __init__(self, ID=None, RVMS=None, RVMS_USED=None):
+        self.original_tagname_ = None
+        self.ID = ID
+        self.RVMS = RVMS
+        self.RVMS_USED = RVMS_USED
+    def factory(*args_, **kwargs_):
+        if supermod.CurrentSubclassModule_ is not None:
+            subclass = getSubclassFromModule_(
+                supermod.CurrentSubclassModule_, IMAGEType72)
+            if subclass is not None:
+                return subclass(*args_, **kwargs_)
+        if IMAGEType72.subclass:
+            return IMAGEType72.subclass(*args_, **kwargs_)
+        else:
+            return IMAGEType72(*args_, **kwargs_)
+    factory = staticmethod(factory)
+    def get_ID(self): return self.ID
+    def set_ID(self, ID): self.ID = ID
+    def get_RVMS(self): return self.RVMS
+    def set_RVMS(self, RVMS): self.RVMS = RVMS
+    def get_RVMS_USED(self): return self.RVMS_USED
+    def set_RVMS_USED(self, RVMS_USED): self.RVMS_USED = RVMS_USED
+    def hasContent_(self):
+        if (
+            self.ID is not None or
+            self.RVMS is not None or
+            self.RVMS_USED is not None
+        ):
+            return True
+        else:
+            return False
+    def export(self, outfile, level, namespaceprefix_='', name_='IMAGEType72', namespacedef_='', pretty_print=True):
+        imported_ns_def_ = GenerateDSNamespaceDefs_.get('IMAGEType72')
+        if imported_ns_def_ is not None:
+            namespacedef_ = imported_ns_def_
+        if pretty_print:
+            eol_ = '\n'
+        else:
+            eol_ = ''
+        if self.original_tagname_ is not None:
+            name_ = self.original_tagname_
+        showIndent(outfile, level, pretty_print)
+        outfile.write('<%s%s%s' % (namespaceprefix_, name_, namespacedef_ and ' ' + namespacedef_ or '', ))
+        already_processed = set()
+        self.exportAttributes(outfile, level, already_processed, namespaceprefix_, name_='IMAGEType72')
+        if self.hasContent_():
+            outfile.write('>%s' % (eol_, ))
+            self.exportChildren(outfile, level + 1, namespaceprefix_='', name_='IMAGEType72', pretty_print=pretty_print)
+            showIndent(outfile, level, pretty_print)
+            outfile.write('</%s%s>%s' % (namespaceprefix_, name_, eol_))
+        else:
+            outfile.write('/>%s' % (eol_, ))
+    def exportAttributes(self, outfile, level, already_processed, namespaceprefix_='', name_='IMAGEType72'):
+        pass
+    def exportChildren(self, outfile, level, namespaceprefix_='', name_='IMAGEType72', fromsubclass_=False, pretty_print=True):
+        if pretty_print:
+            eol_ = '\n'
+        else:
+            eol_ = ''
+        if self.ID is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<ID>%s</ID>%s' % (self.gds_encode(self.gds_format_string(quote_xml(self.ID), input_name='ID')), eol_))
+        if self.RVMS is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<RVMS>%s</RVMS>%s' % (self.gds_encode(self.gds_format_string(quote_xml(self.RVMS), input_name='RVMS')), eol_))
+        if self.RVMS_USED is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<RVMS_USED>%s</RVMS_USED>%s' % (self.gds_encode(self.gds_format_string(quote_xml(self.RVMS_USED), input_name='RVMS_USED')), eol_))
+    def build(self, node):
+        already_processed = set()
+        self.buildAttributes(node, node.attrib, already_processed)
+        for child in node:
+            nodeName_ = Tag_pattern_.match(child.tag).groups()[-1]
+            self.buildChildren(child, node, nodeName_)
+        return self
+    def buildAttributes(self, node, attrs, already_processed):
+        pass
+    def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
+        if nodeName_ == 'ID':
+            ID_ = child_.text
+            ID_ = self.gds_validate_string(ID_, node, 'ID')
+            self.ID = ID_
+        elif nodeName_ == 'RVMS':
+            RVMS_ = child_.text
+            RVMS_ = self.gds_validate_string(RVMS_, node, 'RVMS')
+            self.RVMS = RVMS_
+        elif nodeName_ == 'RVMS_USED':
+            RVMS_USED_ = child_.text
+            RVMS_USED_ = self.gds_validate_string(RVMS_USED_, node, 'RVMS_USED')
+            self.RVMS_USED = RVMS_USED_
+# end class IMAGEType72
+
+
+class USERSub(TemplatedType, USER):
+    def __init__(self, ID=None, GID=None, GROUPS=None, GNAME=None, NAME=None, PASSWORD=None, AUTH_DRIVER=None, ENABLED=None, LOGIN_TOKEN=None, TEMPLATE=None, DATASTORE_QUOTA=None, NETWORK_QUOTA=None, VM_QUOTA=None, IMAGE_QUOTA=None, DEFAULT_USER_QUOTAS=None):
+        super(USERSub, self).__init__(ID, GID, GROUPS, GNAME, NAME, PASSWORD, AUTH_DRIVER, ENABLED, LOGIN_TOKEN, TEMPLATE, DATASTORE_QUOTA, NETWORK_QUOTA, VM_QUOTA, IMAGE_QUOTA, DEFAULT_USER_QUOTAS, )
+USER.subclass = USERSub
+# end class USERSub
+
+
+class GROUPSType54Sub(TemplatedType, GROUPSType54):
+    def __init__(self, ID=None):
+        super(GROUPSType54Sub, self).__init__(ID, )
+GROUPSType54.subclass = GROUPSType54Sub
+# end class GROUPSType54Sub
+
+
+class LOGIN_TOKENType55Sub(TemplatedType, LOGIN_TOKENType55):
+    def __init__(self, TOKEN=None, EXPIRATION_TIME=None, EGID=None):
+        super(LOGIN_TOKENType55Sub, self).__init__(TOKEN, EXPIRATION_TIME, EGID, )
+LOGIN_TOKENType55.subclass = LOGIN_TOKENType55Sub
+# end class LOGIN_TOKENType55Sub
+
+
+class DATASTORE_QUOTAType56Sub(TemplatedType, DATASTORE_QUOTAType56):
+    def __init__(self, DATASTORE=None):
+        super(DATASTORE_QUOTAType56Sub, self).__init__(DATASTORE, )
+DATASTORE_QUOTAType56.subclass = DATASTORE_QUOTAType56Sub
+# end class DATASTORE_QUOTAType56Sub
+
+
+class DATASTOREType57Sub(TemplatedType, DATASTOREType57):
+    def __init__(self, ID=None, IMAGES=None, IMAGES_USED=None, SIZE=None, SIZE_USED=None):
+        super(DATASTOREType57Sub, self).__init__(ID, IMAGES, IMAGES_USED, SIZE, SIZE_USED, )
+DATASTOREType57.subclass = DATASTOREType57Sub
+# end class DATASTOREType57Sub
+
+
+class NETWORK_QUOTAType58Sub(TemplatedType, NETWORK_QUOTAType58):
+    def __init__(self, NETWORK=None):
+        super(NETWORK_QUOTAType58Sub, self).__init__(NETWORK, )
+NETWORK_QUOTAType58.subclass = NETWORK_QUOTAType58Sub
+# end class NETWORK_QUOTAType58Sub
+
+
+class NETWORKType59Sub(TemplatedType, NETWORKType59):
+    def __init__(self, ID=None, LEASES=None, LEASES_USED=None):
+        super(NETWORKType59Sub, self).__init__(ID, LEASES, LEASES_USED, )
+NETWORKType59.subclass = NETWORKType59Sub
+# end class NETWORKType59Sub
+
+
+class VM_QUOTAType60Sub(TemplatedType, VM_QUOTAType60):
+    def __init__(self, VM=None):
+        super(VM_QUOTAType60Sub, self).__init__(VM, )
+VM_QUOTAType60.subclass = VM_QUOTAType60Sub
+# end class VM_QUOTAType60Sub
+
+
+class VMType61Sub(TemplatedType, VMType61):
+    def __init__(self, CPU=None, CPU_USED=None, MEMORY=None, MEMORY_USED=None, SYSTEM_DISK_SIZE=None, SYSTEM_DISK_SIZE_USED=None, VMS=None, VMS_USED=None):
+        super(VMType61Sub, self).__init__(CPU, CPU_USED, MEMORY, MEMORY_USED, SYSTEM_DISK_SIZE, SYSTEM_DISK_SIZE_USED, VMS, VMS_USED, )
+VMType61.subclass = VMType61Sub
+# end class VMType61Sub
+
+
+class IMAGE_QUOTAType62Sub(TemplatedType, IMAGE_QUOTAType62):
+    def __init__(self, IMAGE=None):
+        super(IMAGE_QUOTAType62Sub, self).__init__(IMAGE, )
+IMAGE_QUOTAType62.subclass = IMAGE_QUOTAType62Sub
+# end class IMAGE_QUOTAType62Sub
+
+
+class IMAGEType63Sub(TemplatedType, IMAGEType63):
+    def __init__(self, ID=None, RVMS=None, RVMS_USED=None):
+        super(IMAGEType63Sub, self).__init__(ID, RVMS, RVMS_USED, )
+IMAGEType63.subclass = IMAGEType63Sub
+# end class IMAGEType63Sub
+
+
+class DEFAULT_USER_QUOTASType64Sub(TemplatedType, DEFAULT_USER_QUOTASType64):
+    def __init__(self, DATASTORE_QUOTA=None, NETWORK_QUOTA=None, VM_QUOTA=None, IMAGE_QUOTA=None):
+        super(DEFAULT_USER_QUOTASType64Sub, self).__init__(DATASTORE_QUOTA, NETWORK_QUOTA, VM_QUOTA, IMAGE_QUOTA, )
+DEFAULT_USER_QUOTASType64.subclass = DEFAULT_USER_QUOTASType64Sub
+# end class DEFAULT_USER_QUOTASType64Sub
+
+
+class DATASTORE_QUOTAType65Sub(TemplatedType, DATASTORE_QUOTAType65):
+    def __init__(self, DATASTORE=None):
+        super(DATASTORE_QUOTAType65Sub, self).__init__(DATASTORE, )
+DATASTORE_QUOTAType65.subclass = DATASTORE_QUOTAType65Sub
+# end class DATASTORE_QUOTAType65Sub
+
+
+class DATASTOREType66Sub(TemplatedType, DATASTOREType66):
+    def __init__(self, ID=None, IMAGES=None, IMAGES_USED=None, SIZE=None, SIZE_USED=None):
+        super(DATASTOREType66Sub, self).__init__(ID, IMAGES, IMAGES_USED, SIZE, SIZE_USED, )
+DATASTOREType66.subclass = DATASTOREType66Sub
+# end class DATASTOREType66Sub
+
+
+class NETWORK_QUOTAType67Sub(TemplatedType, NETWORK_QUOTAType67):
+    def __init__(self, NETWORK=None):
+        super(NETWORK_QUOTAType67Sub, self).__init__(NETWORK, )
+NETWORK_QUOTAType67.subclass = NETWORK_QUOTAType67Sub
+# end class NETWORK_QUOTAType67Sub
+
+
+class NETWORKType68Sub(TemplatedType, NETWORKType68):
+    def __init__(self, ID=None, LEASES=None, LEASES_USED=None):
+        super(NETWORKType68Sub, self).__init__(ID, LEASES, LEASES_USED, )
+NETWORKType68.subclass = NETWORKType68Sub
+# end class NETWORKType68Sub
+
+
+class VM_QUOTAType69Sub(TemplatedType, VM_QUOTAType69):
+    def __init__(self, VM=None):
+        super(VM_QUOTAType69Sub, self).__init__(VM, )
+VM_QUOTAType69.subclass = VM_QUOTAType69Sub
+# end class VM_QUOTAType69Sub
+
+
+class VMType70Sub(TemplatedType, VMType70):
+    def __init__(self, CPU=None, CPU_USED=None, MEMORY=None, MEMORY_USED=None, SYSTEM_DISK_SIZE=None, SYSTEM_DISK_SIZE_USED=None, VMS=None, VMS_USED=None):
+        super(VMType70Sub, self).__init__(CPU, CPU_USED, MEMORY, MEMORY_USED, SYSTEM_DISK_SIZE, SYSTEM_DISK_SIZE_USED, VMS, VMS_USED, )
+VMType70.subclass = VMType70Sub
+# end class VMType70Sub
+
+
+class IMAGE_QUOTAType71Sub(TemplatedType, IMAGE_QUOTAType71):
+    def __init__(self, IMAGE=None):
+        super(IMAGE_QUOTAType71Sub, self).__init__(IMAGE, )
+IMAGE_QUOTAType71.subclass = IMAGE_QUOTAType71Sub
+# end class IMAGE_QUOTAType71Sub
+
+
+class IMAGEType72Sub(TemplatedType, IMAGEType72):
+    def __init__(self, ID=None, RVMS=None, RVMS_USED=None):
+        super(IMAGEType72Sub, self).__init__(ID, RVMS, RVMS_USED, )
+IMAGEType72.subclass = IMAGEType72Sub
+# end class IMAGEType72Sub
+
+
@@ -0,0 +1,2448 @@
+#!/usr/bin/env python
+
+#
+# Bindings of USER_POOL, generated by generateDS.py and split from supbind by src/split_bindings.py
+#
+
+import sys
+import re as re_
+import base64
+import datetime as datetime_
+import warnings as warnings_
+try:
+    from lxml import etree as etree_
+except ImportError:
+    from xml.etree import ElementTree as etree_
+from pyone.util import TemplatedType
+from . import supbind as supermod
+from .supbind import (
+    GenerateDSNamespaceDefs_,
+    GeneratedsSuper,
+    Tag_pattern_,
+    getSubclassFromModule_,
+    quote_xml,
+    raise_parse_error,
+    showIndent,
+)
+
+
+class USER_POOL(GeneratedsSuper):
+    subclass = None
+    superclass = None
+    def __init__(self, USER=None, QUOTAS=None, DEFAULT_USER_QUOTAS=None):
+        self.original_tagname_ = None
+        if USER is None:
+            self.USER = []
+        else:
+            self.USER = USER
+        if QUOTAS is None:
+            self.QUOTAS = []
+        else:
+            self.QUOTAS = QUOTAS
+        self.DEFAULT_USER_QUOTAS = DEFAULT_USER_QUOTAS
+    def factory(*args_, **kwargs_):
+        if supermod.CurrentSubclassModule_ is not None:
+            subclass = getSubclassFromModule_(
+                supermod.CurrentSubclassModule_, USER_POOL)
+            if subclass is not None:
+                return subclass(*args_, **kwargs_)
+        if USER_POOL.subclass:
+            return USER_POOL.subclass(*args_, **kwargs_)
+        else:
+            return USER_POOL(*args_, **kwargs_)
+    factory = staticmethod(factory)
+    def get_USER(self): return self.USER
+    def set_USER(self, USER): self.USER = USER
+    def add_USER(self, value): self.USER.append(value)
+    def insert_USER_at(self, index, value): self.USER.insert(index, value)
+    def replace_USER_at(self, index, value): self.USER[index] = value
+    def get_QUOTAS(self): return self.QUOTAS
+    def set_QUOTAS(self, QUOTAS): self.QUOTAS = QUOTAS
+    def add_QUOTAS(self, value): self.QUOTAS.append(value)
+    def insert_QUOTAS_at(self, index, value): self.QUOTAS.insert(index, value)
+    def replace_QUOTAS_at(self, index, value): self.QUOTAS[index] = value
+    def get_DEFAULT_USER_QUOTAS(self): return self.DEFAULT_USER_QUOTAS
+    def set_DEFAULT_USER_QUOTAS(self, DEFAULT_USER_QUOTAS): self.DEFAULT_USER_QUOTAS = DEFAULT_USER_QUOTAS
+    def hasContent_(self):
+        if (
+            self.USER or
+            self.QUOTAS or
+            self.DEFAULT_USER_QUOTAS is not None
+        ):
+            return True
+        else:
+            return False
+    def export(self, outfile, level, namespaceprefix_='', name_='USER_POOL', namespacedef_='', pretty_print=True):
+        imported_ns_def_ = GenerateDSNamespaceDefs_.get('USER_POOL')
+        if imported_ns_def_ is not None:
+            namespacedef_ = imported_ns_def_
+        if pretty_print:
+            eol_ = '\n'
+        else:
+            eol_ = ''
+        if self.original_tagname_ is not None:
+            name_ = self.original_tagname_
+        showIndent(outfile, level, pretty_print)
+        outfile.write('<%s%s%s' % (namespaceprefix_, name_, namespacedef_ and ' ' + namespacedef_ or '', ))
+        already_processed = set()
+        self.exportAttributes(outfile, level, already_processed, namespaceprefix_, name_='USER_POOL')
+        if self.hasContent_():
+            outfile.write('>%s' % (eol_, ))
+            self.exportChildren(outfile, level + 1, namespaceprefix_='', name_='USER_POOL', pretty_print=pretty_print)
+            showIndent(outfile, level, pretty_print)
+            outfile.write('</%s%s>%s' % (namespaceprefix_, name_, eol_))
+        else:
+            outfile.write('/>%s' % (eol_, ))
+    def exportAttributes(self, outfile, level, already_processed, namespaceprefix_='', name_='USER_POOL'):
+        pass
+    def exportChildren(self, outfile, level, namespaceprefix_='', name_='USER_POOL', fromsubclass_=False, pretty_print=True):
+        if pretty_print:
+            eol_ = '\n'
+        else:
+            eol_ = ''
+        for USER_ in self.USER:
+            USER_.export(outfile, level, namespaceprefix_, name_='USER', pretty_print=pretty_print)
+        for QUOTAS_ in self.QUOTAS:
+            QUOTAS_.export(outfile, level, namespaceprefix_, name_='QUOTAS', pretty_print=pretty_print)
+        if self.DEFAULT_USER_QUOTAS is not None:
+            self.DEFAULT_USER_QUOTAS.export(outfile, level, namespaceprefix_, name_='DEFAULT_USER_QUOTAS', pretty_print=pretty_print)
+    def build(self, node):
+        already_processed = set()
+        self.buildAttributes(node, node.attrib, already_processed)
+        for child in node:
+            nodeName_ = Tag_pattern_.match(child.tag).groups()[-1]
+            self.buildChildren(child, node, nodeName_)
+        return self
+    def buildAttributes(self, node, attrs, already_processed):
+        pass
+    def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
+        if nodeName_ == 'USER':
+            obj_ = USERType.factory()
+            obj_.build(child_)
+            self.USER.append(obj_)
+            obj_.original_tagname_ = 'USER'
+        elif nodeName_ == 'QUOTAS':
+            obj_ = QUOTASType37.factory()
+            obj_.build(child_)
+            self.QUOTAS.append(obj_)
+            obj_.original_tagname_ = 'QUOTAS'
+        elif nodeName_ == 'DEFAULT_USER_QUOTAS':
+            obj_ = DEFAULT_USER_QUOTASType.factory()
+            obj_.build(child_)
+            self.DEFAULT_USER_QUOTAS = obj_
+            obj_.original_tagname_ = 'DEFAULT_USER_QUOTAS'
+# end class USER_POOL
+
+
+class USERType(GeneratedsSuper):
+    subclass = None
+    superclass = None
+    def __init__(self, ID=None, GID=None, GROUPS=None, GNAME=None, NAME=None, PASSWORD=None, AUTH_DRIVER=None, ENABLED=None, LOGIN_TOKEN=None, TEMPLATE=None):
+        self.original_tagname_ = None
+        self.ID = ID
+        self.GID = GID
+        self.GROUPS = GROUPS
+        self.GNAME = GNAME
+        self.NAME = NAME
+        self.PASSWORD = PASSWORD
+        self.AUTH_DRIVER = AUTH_DRIVER
+        self.ENABLED = ENABLED
+        if LOGIN_TOKEN is None:
+            self.LOGIN_TOKEN = []
+        else:
+            self.LOGIN_TOKEN = LOGIN_TOKEN
+        self.TEMPLATE = TEMPLATE
+    def factory(*args_, **kwargs_):
+        if supermod.CurrentSubclassModule_ is not None:
+            subclass = getSubclassFromModule_(
+                supermod.CurrentSubclassModule_, USERType)
+            if subclass is not None:
+                return subclass(*args_, **kwargs_)
+        if USERType.subclass:
+            return USERType.subclass(*args_, **kwargs_)
+        else:
+            return USERType(*args_, **kwargs_)
+    factory = staticmethod(factory)
+    def get_ID(self): return self.ID
+    def set_ID(self, ID): self.ID = ID
+    def get_GID(self): return self.GID
+    def set_GID(self, GID): self.GID = GID
+    def get_GROUPS(self): return self.GROUPS
+    def set_GROUPS(self, GROUPS): self.GROUPS = GROUPS
+    def get_GNAME(self): return self.GNAME
+    def set_GNAME(self, GNAME): self.GNAME = GNAME
+    def get_NAME(self): return self.NAME
+    def set_NAME(self, NAME): self.NAME = NAME
+    def get_PASSWORD(self): return self.PASSWORD
+    def set_PASSWORD(self, PASSWORD): self.PASSWORD = PASSWORD
+    def get_AUTH_DRIVER(self): return self.AUTH_DRIVER
+    def set_AUTH_DRIVER(self, AUTH_DRIVER): self.AUTH_DRIVER = AUTH_DRIVER
+    def get_ENABLED(self): return self.ENABLED
+    def set_ENABLED(self, ENABLED): self.ENABLED = ENABLED
+    def get_LOGIN_TOKEN(self): return self.LOGIN_TOKEN
+    def set_LOGIN_TOKEN(self, LOGIN_TOKEN): self.LOGIN_TOKEN = LOGIN_TOKEN
+    def add_LOGIN_TOKEN(self, value): self.LOGIN_TOKEN.append(value)
+    def insert_LOGIN_TOKEN_at(self, index, value): self.LOGIN_TOKEN.insert(index, value)
+    def replace_LOGIN_TOKEN_at(self, index, value): self.LOGIN_TOKEN[index] = value
+    def get_TEMPLATE(self): return self.TEMPLATE
+    def set_TEMPLATE(self, TEMPLATE): self.TEMPLATE = TEMPLATE
+    def hasContent_(self):
+        if (
+            self.ID is not None or
+            self.GID is not None or
+            self.GROUPS is not None or
+            self.GNAME is not None or
+            self.NAME is not None or
+            self.PASSWORD is not None or
+            self.AUTH_DRIVER is not None or
+            self.ENABLED is not None or
+            self.LOGIN_TOKEN or
+            self.TEMPLATE is not None
+        ):
+            return True
+        else:
+            return False
+    def export(self, outfile, level, namespaceprefix_='', name_='USERType', namespacedef_='', pretty_print=True):
+        imported_ns_def_ = GenerateDSNamespaceDefs_.get('USERType')
+        if imported_ns_def_ is not None:
+            namespacedef_ = imported_ns_def_
+        if pretty_print:
+            eol_ = '\n'
+        else:
+            eol_ = ''
+        if self.original_tagname_ is not None:
+            name_ = self.original_tagname_
+        showIndent(outfile, level, pretty_print)
+        outfile.write('<%s%s%s' % (namespaceprefix_, name_, namespacedef_ and ' ' + namespacedef_ or '', ))
+        already_processed = set()
+        self.exportAttributes(outfile, level, already_processed, namespaceprefix_, name_='USERType')
+        if self.hasContent_():
+            outfile.write('>%s' % (eol_, ))
+            self.exportChildren(outfile, level + 1, namespaceprefix_='', name_='USERType', pretty_print=pretty_print)
+            showIndent(outfile, level, pretty_print)
+            outfile.write('</%s%s>%s' % (namespaceprefix_, name_, eol_))
+        else:
+            outfile.write('/>%s' % (eol_, ))
+    def exportAttributes(self, outfile, level, already_processed, namespaceprefix_='', name_='USERType'):
+        pass
+    def exportChildren(self, outfile, level, namespaceprefix_='', name_='USERType', fromsubclass_=False, pretty_print=True):
+        if pretty_print:
+            eol_ = '\n'
+        else:
+            eol_ = ''
+        if self.ID is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<ID>%s</ID>%s' % (self.gds_format_integer(self.ID, input_name='ID'), eol_))
+        if self.GID is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<GID>%s</GID>%s' % (self.gds_format_integer(self.GID, input_name='GID'), eol_))
+        if self.GROUPS is not None:
+            self.GROUPS.export(outfile, level, namespaceprefix_, name_='GROUPS', pretty_print=pretty_print)
+        if self.GNAME is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<GNAME>%s</GNAME>%s' % (self.gds_encode(self.gds_format_string(quote_xml(self.GNAME), input_name='GNAME')), eol_))
+        if self.NAME is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<NAME>%s</NAME>%s' % (self.gds_encode(self.gds_format_string(quote_xml(self.NAME), input_name='NAME')), eol_))
+        if self.PASSWORD is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<PASSWORD>%s</PASSWORD>%s' % (self.gds_encode(self.gds_format_string(quote_xml(self.PASSWORD), input_name='PASSWORD')), eol_))
+        if self.AUTH_DRIVER is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<AUTH_DRIVER>%s</AUTH_DRIVER>%s' % (self.gds_encode(self.gds_format_string(quote_xml(self.AUTH_DRIVER), input_name='AUTH_DRIVER')), eol_))
+        if self.ENABLED is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<ENABLED>%s</ENABLED>%s' % (self.gds_format_integer(self.ENABLED, input_name='ENABLED'), eol_))
+        for LOGIN_TOKEN_ in self.LOGIN_TOKEN:
+            LOGIN_TOKEN_.export(outfile, level, namespaceprefix_, name_='LOGIN_TOKEN', pretty_print=pretty_print)
+        if self.TEMPLATE is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<TEMPLATE>%s</TEMPLATE>%s' % (self.gds_encode(self.gds_format_string(quote_xml(self.TEMPLATE), input_name='TEMPLATE')), eol_))
+    def build(self, node):
+        already_processed = set()
+        self.buildAttributes(node, node.attrib, already_processed)
+        for child in node:
+            nodeName_ = Tag_pattern_.match(child.tag).groups()[-1]
+            self.buildChildren(child, node, nodeName_)
+        return self
+    def buildAttributes(self, node, attrs, already_processed):
+        pass
+    def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
+        if nodeName_ == 'ID' and child_.text:
+            sval_ = child_.text
+            try:
+                ival_ = int(sval_)
+            except (TypeError, ValueError) as exp:
+                raise_parse_error(child_, 'requires integer: %s' % exp)
+            ival_ = self.gds_validate_integer(ival_, node, 'ID')
+            self.ID = ival_
+        elif nodeName_ == 'GID' and child_.text:
+            sval_ = child_.text
+            try:
+                ival_ = int(sval_)
+            except (TypeError, ValueError) as exp:
+                raise_parse_error(child_, 'requires integer: %s' % exp)
+            ival_ = self.gds_validate_integer(ival_, node, 'GID')
+            self.GID = ival_
+        elif nodeName_ == 'GROUPS':
+            obj_ = GROUPSType.factory()
+            obj_.build(child_)
+            self.GROUPS = obj_
+            obj_.original_tagname_ = 'GROUPS'
+        elif nodeName_ == 'GNAME':
+            GNAME_ = child_.text
+            GNAME_ = self.gds_validate_string(GNAME_, node, 'GNAME')
+            self.GNAME = GNAME_
+        elif nodeName_ == 'NAME':
+            NAME_ = child_.text
+            NAME_ = self.gds_validate_string(NAME_, node, 'NAME')
+            self.NAME = NAME_
+        elif nodeName_ == 'PASSWORD':
+            PASSWORD_ = child_.text
+            PASSWORD_ = self.gds_validate_string(PASSWORD_, node, 'PASSWORD')
+            self.PASSWORD = PASSWORD_
+        elif nodeName_ == 'AUTH_DRIVER':
+            AUTH_DRIVER_ = child_.text
+            AUTH_DRIVER_ = self.gds_validate_string(AUTH_DRIVER_, node, 'AUTH_DRIVER')
+            self.AUTH_DRIVER = AUTH_DRIVER_
+        elif nodeName_ == 'ENABLED' and child_.text:
+            sval_ = child_.text
+            try:
+                ival_ = int(sval_)
+            except (TypeError, ValueError) as exp:
+                raise_parse_error(child_, 'requires integer: %s' % exp)
+            ival_ = self.gds_validate_integer(ival_, node, 'ENABLED')
+            self.ENABLED = ival_
+        elif nodeName_ == 'LOGIN_TOKEN':
+            obj_ = LOGIN_TOKENType.factory()
+            obj_.build(child_)
+            self.LOGIN_TOKEN.append(obj_)
+            obj_.original_tagname_ = 'LOGIN_TOKEN'
+        elif nodeName_ == 'TEMPLATE':
+            TEMPLATE_ = child_.text
+            TEMPLATE_ = self.gds_validate_string(TEMPLATE_, node, 'TEMPLATE')
+            self.TEMPLATE = TEMPLATE_
+# end class USERType
+
+
+class GROUPSType(GeneratedsSuper):
+    subclass = None
+    superclass = None
+    def __init__(self, ID=None):
+        self.original_tagname_ = None
+        if ID is None:
+            self.ID = []
+        else:
+            self.ID = ID
+    def factory(*args_, **kwargs_):
+        if supermod.CurrentSubclassModule_ is not None:
+            subclass = getSubclassFromModule_(
+                supermod.CurrentSubclassModule_, GROUPSType)
+            if subclass is not None:
+                return subclass(*args_, **kwargs_)
+        if GROUPSType.subclass:
+            return GROUPSType.subclass(*args_, **kwargs_)
+        else:
+            return GROUPSType(*args_, **kwargs_)
+    factory = staticmethod(factory)
+    def get_ID(self): return self.ID
+    def set_ID(self, ID): self.ID = ID
+    def add_ID(self, value): self.ID.append(value)
+    def insert_ID_at(self, index, value): self.ID.insert(index, value)
+    def replace_ID_at(self, index, value): self.ID[index] = value
+    def hasContent_(self):
+        if (
+            self.ID
+        ):
+            return True
+        else:
+            return False
+    def export(self, outfile, level, namespaceprefix_='', name_='GROUPSType', namespacedef_='', pretty_print=True):
+        imported_ns_def_ = GenerateDSNamespaceDefs_.get('GROUPSType')
+        if imported_ns_def_ is not None:
+            namespacedef_ = imported_ns_def_
+        if pretty_print:
+            eol_ = '\n'
+        else:
+            eol_ = ''
+        if self.original_tagname_ is not None:
+            name_ = self.original_tagname_
+        showIndent(outfile, level, pretty_print)
+        outfile.write('<%s%s%s' % (namespaceprefix_, name_, namespacedef_ and ' ' + namespacedef_ or '', ))
+        already_processed = set()
+        self.exportAttributes(outfile, level, already_processed, namespaceprefix_, name_='GROUPSType')
+        if self.hasContent_():
+            outfile.write('>%s' % (eol_, ))
+            self.exportChildren(outfile, level + 1, namespaceprefix_='', name_='GROUPSType', pretty_print=pretty_print)
+            showIndent(outfile, level, pretty_print)
+            outfile.write('</%s%s>%s' % (namespaceprefix_, name_, eol_))
+        else:
+            outfile.write('/>%s' % (eol_, ))
+    def exportAttributes(self, outfile, level, already_processed, namespaceprefix_='', name_='GROUPSType'):
+        pass
+    def exportChildren(self, outfile, level, namespaceprefix_='', name_='GROUPSType', fromsubclass_=False, pretty_print=True):
+        if pretty_print:
+            eol_ = '\n'
+        else:
+            eol_ = ''
+        for ID_ in self.ID:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<ID>%s</ID>%s' % (self.gds_format_integer(ID_, input_name='ID'), eol_))
+    def build(self, node):
+        already_processed = set()
+        self.buildAttributes(node, node.attrib, already_processed)
+        for child in node:
+            nodeName_ = Tag_pattern_.match(child.tag).groups()[-1]
+            self.buildChildren(child, node, nodeName_)
+        return self
+    def buildAttributes(self, node, attrs, already_processed):
+        pass
+    def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
+        if nodeName_ == 'ID' and child_.text:
+            sval_ = child_.text
+            try:
+                ival_ = int(sval_)
+            except (TypeError, ValueError) as exp:
+                raise_parse_error(child_, 'requires integer: %s' % exp)
+            ival_ = self.gds_validate_integer(ival_, node, 'ID')
+            self.ID.append(ival_)
+# end class GROUPSType
+
+
+class LOGIN_TOKENType(GeneratedsSuper):
+    subclass = None
+    superclass = None
+    def __init__(self, TOKEN=None, EXPIRATION_TIME=None, EGID=None):
+        self.original_tagname_ = None
+        self.TOKEN = TOKEN
+        self.EXPIRATION_TIME = EXPIRATION_TIME
+        self.EGID = EGID
+    def factory(*args_, **kwargs_):
+        if supermod.CurrentSubclassModule_ is not None:
+            subclass = getSubclassFromModule_(
+                supermod.CurrentSubclassModule_, LOGIN_TOKENType)
+            if subclass is not None:
+                return subclass(*args_, **kwargs_)
+        if LOGIN_TOKENType.subclass:
+            return LOGIN_TOKENType.subclass(*args_, **kwargs_)
+        else:
+            return LOGIN_TOKENType(*args_, **kwargs_)
+    factory = staticmethod(factory)
+    def get_TOKEN(self): return self.TOKEN
+    def set_TOKEN(self, TOKEN): self.TOKEN = TOKEN
+    def get_EXPIRATION_TIME(self): return self.EXPIRATION_TIME
+    def set_EXPIRATION_TIME(self, EXPIRATION_TIME): self.EXPIRATION_TIME = EXPIRATION_TIME
+    def get_EGID(self): return self.EGID
+    def set_EGID(self, EGID): self.EGID = EGID
+    def hasContent_(self):
+        if (
+            self.TOKEN is not None or
+            self.EXPIRATION_TIME is not None or
+            self.EGID is not None
+        ):
+            return True
+        else:
+            return False
+    def export(self, outfile, level, namespaceprefix_='', name_='LOGIN_TOKENType', namespacedef_='', pretty_print=True):
+        imported_ns_def_ = GenerateDSNamespaceDefs_.get('LOGIN_TOKENType')
+        if imported_ns_def_ is not None:
+            namespacedef_ = imported_ns_def_
+        if pretty_print:
+            eol_ = '\n'
+        else:
+            eol_ = ''
+        if self.original_tagname_ is not None:
+            name_ = self.original_tagname_
+        showIndent(outfile, level, pretty_print)
+        outfile.write('<%s%s%s' % (namespaceprefix_, name_, namespacedef_ and ' ' + namespacedef_ or '', ))
+        already_processed = set()
+        self.exportAttributes(outfile, level, already_processed, namespaceprefix_, name_='LOGIN_TOKENType')
+        if self.hasContent_():
+            outfile.write('>%s' % (eol_, ))
+            self.exportChildren(outfile, level + 1, namespaceprefix_='', name_='LOGIN_TOKENType', pretty_print=pretty_print)
+            showIndent(outfile, level, pretty_print)
+            outfile.write('</%s%s>%s' % (namespaceprefix_, name_, eol_))
+        else:
+            outfile.write('/>%s' % (eol_, ))
+    def exportAttributes(self, outfile, level, already_processed, namespaceprefix_='', name_='LOGIN_TOKENType'):
+        pass
+    def exportChildren(self, outfile, level, namespaceprefix_='', name_='LOGIN_TOKENType', fromsubclass_=False, pretty_print=True):
+        if pretty_print:
+            eol_ = '\n'
+        else:
+            eol_ = ''
+        if self.TOKEN is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<TOKEN>%s</TOKEN>%s' % (self.gds_encode(self.gds_format_string(quote_xml(self.TOKEN), input_name='TOKEN')), eol_))
+        if self.EXPIRATION_TIME is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<EXPIRATION_TIME>%s</EXPIRATION_TIME>%s' % (self.gds_format_integer(self.EXPIRATION_TIME, input_name='EXPIRATION_TIME'), eol_))
+        if self.EGID is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<EGID>%s</EGID>%s' % (self.gds_format_integer(self.EGID, input_name='EGID'), eol_))
+    def build(self, node):
+        already_processed = set()
+        self.buildAttributes(node, node.attrib, already_processed)
+        for child in node:
+            nodeName_ = Tag_pattern_.match(child.tag).groups()[-1]
+            self.buildChildren(child, node, nodeName_)
+        return self
+    def buildAttributes(self, node, attrs, already_processed):
+        pass
+    def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
+        if nodeName_ == 'TOKEN':
+            TOKEN_ = child_.text
+            TOKEN_ = self.gds_validate_string(TOKEN_, node, 'TOKEN')
+            self.TOKEN = TOKEN_
+        elif nodeName_ == 'EXPIRATION_TIME' and child_.text:
+            sval_ = child_.text
+            try:
+                ival_ = int(sval_)
+            except (TypeError, ValueError) as exp:
+                raise_parse_error(child_, 'requires integer: %s' % exp)
+            ival_ = self.gds_validate_integer(ival_, node, 'EXPIRATION_TIME')
+            self.EXPIRATION_TIME = ival_
+        elif nodeName_ == 'EGID' and child_.text:
+            sval_ = child_.text
+            try:
+                ival_ = int(sval_)
+            except (TypeError, ValueError) as exp:
+                raise_parse_error(child_, 'requires integer: %s' % exp)
+            ival_ = self.gds_validate_integer(ival_, node, 'EGID')
+            self.EGID = ival_
+# end class LOGIN_TOKENType
+
+
+class QUOTASType37(GeneratedsSuper):
+    subclass = None
+    superclass = None
+    def __init__(self, ID=None, DATASTORE_QUOTA=None, NETWORK_QUOTA=None, VM_QUOTA=None, IMAGE_QUOTA=None):
+        self.original_tagname_ = None
+        self.ID = ID
+        self.DATASTORE_QUOTA = DATASTORE_QUOTA
+        self.NETWORK_QUOTA = NETWORK_QUOTA
+        self.VM_QUOTA = VM_QUOTA
+        self.IMAGE_QUOTA = IMAGE_QUOTA
+    def factory(*args_, **kwargs_):
+        if supermod.CurrentSubclassModule_ is not None:
+            subclass = getSubclassFromModule_(
+                supermod.CurrentSubclassModule_, QUOTASType37)
+            if subclass is not None:
+                return subclass(*args_, **kwargs_)
+        if QUOTASType37.subclass:
+            return QUOTASType37.subclass(*args_, **kwargs_)
+        else:
+            return QUOTASType37(*args_, **kwargs_)
+    factory = staticmethod(factory)
+    def get_ID(self): return self.ID
+    def set_ID(self, ID): self.ID = ID
+    def get_DATASTORE_QUOTA(self): return self.DATASTORE_QUOTA
+    def set_DATASTORE_QUOTA(self, DATASTORE_QUOTA): self.DATASTORE_QUOTA = DATASTORE_QUOTA
+    def get_NETWORK_QUOTA(self): return self.NETWORK_QUOTA
+    def set_NETWORK_QUOTA(self, NETWORK_QUOTA): self.NETWORK_QUOTA = NETWORK_QUOTA
+    def get_VM_QUOTA(self): return self.VM_QUOTA
+    def set_VM_QUOTA(self, VM_QUOTA): self.VM_QUOTA = VM_QUOTA
+    def get_IMAGE_QUOTA(self): return self.IMAGE_QUOTA
+    def set_IMAGE_QUOTA(self, IMAGE_QUOTA): self.IMAGE_QUOTA = IMAGE_QUOTA
+    def hasContent_(self):
+        if (
+            self.ID is not None or
+            self.DATASTORE_QUOTA is not None or
+            self.NETWORK_QUOTA is not None or
+            self.VM_QUOTA is not None or
+            self.IMAGE_QUOTA is not None
+        ):
+            return True
+        else:
+            return False
+    def export(self, outfile, level, namespaceprefix_='', name_='QUOTASType37', namespacedef_='', pretty_print=True):
+        imported_ns_def_ = GenerateDSNamespaceDefs_.get('QUOTASType37')
+        if imported_ns_def_ is not None:
+            namespacedef_ = imported_ns_def_
+        if pretty_print:
+            eol_ = '\n'
+        else:
+            eol_ = ''
+        if self.original_tagname_ is not None:
+            name_ = self.original_tagname_
+        showIndent(outfile, level, pretty_print)
+        outfile.write('<%s%s%s' % (namespaceprefix_, name_, namespacedef_ and ' ' + namespacedef_ or '', ))
+        already_processed = set()
+        self.exportAttributes(outfile, level, already_processed, namespaceprefix_, name_='QUOTASType37')
+        if self.hasContent_():
+            outfile.write('>%s' % (eol_, ))
+            self.exportChildren(outfile, level + 1, namespaceprefix_='', name_='QUOTASType37', pretty_print=pretty_print)
+            showIndent(outfile, level, pretty_print)
+            outfile.write('</%s%s>%s' % (namespaceprefix_, name_, eol_))
+        else:
+            outfile.write('/>%s' % (eol_, ))
+    def exportAttributes(self, outfile, level, already_processed, namespaceprefix_='', name_='QUOTASType37'):
+        pass
+    def exportChildren(self, outfile, level, namespaceprefix_='', name_='QUOTASType37', fromsubclass_=False, pretty_print=True):
+        if pretty_print:
+            eol_ = '\n'
+        else:
+            eol_ = ''
+        if self.ID is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<ID>%s</ID>%s' % (self.gds_format_integer(self.ID, input_name='ID'), eol_))
+        if self.DATASTORE_QUOTA is not None:
+            self.DATASTORE_QUOTA.export(outfile, level, namespaceprefix_, name_='DATASTORE_QUOTA', pretty_print=pretty_print)
+        if self.NETWORK_QUOTA is not None:
+            self.NETWORK_QUOTA.export(outfile, level, namespaceprefix_, name_='NETWORK_QUOTA', pretty_print=pretty_print)
+        if self.VM_QUOTA is not None:
+            self.VM_QUOTA.export(outfile, level, namespaceprefix_, name_='VM_QUOTA', pretty_print=pretty_print)
+        if self.IMAGE_QUOTA is not None:
+            self.IMAGE_QUOTA.export(outfile, level, namespaceprefix_, name_='IMAGE_QUOTA', pretty_print=pretty_print)
+    def build(self, node):
+        already_processed = set()
+        self.buildAttributes(node, node.attrib, already_processed)
+        for child in node:
+            nodeName_ = Tag_pattern_.match(child.tag).groups()[-1]
+            self.buildChildren(child, node, nodeName_)
+        return self
+    def buildAttributes(self, node, attrs, already_processed):
+        pass
+    def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
+        if nodeName_ == 'ID' and child_.text:
+            sval_ = child_.text
+            try:
+                ival_ = int(sval_)
+            except (TypeError, ValueError) as exp:
+                raise_parse_error(child_, 'requires integer: %s' % exp)
+            ival_ = self.gds_validate_integer(ival_, node, 'ID')
+            self.ID = ival_
+        elif nodeName_ == 'DATASTORE_QUOTA':
+            obj_ = DATASTORE_QUOTAType38.factory()
+            obj_.build(child_)
+            self.DATASTORE_QUOTA = obj_
+            obj_.original_tagname_ = 'DATASTORE_QUOTA'
+        elif nodeName_ == 'NETWORK_QUOTA':
+            obj_ = NETWORK_QUOTAType40.factory()
+            obj_.build(child_)
+            self.NETWORK_QUOTA = obj_
+            obj_.original_tagname_ = 'NETWORK_QUOTA'
+        elif nodeName_ == 'VM_QUOTA':
+            obj_ = VM_QUOTAType42.factory()
+            obj_.build(child_)
+            self.VM_QUOTA = obj_
+            obj_.original_tagname_ = 'VM_QUOTA'
+        elif nodeName_ == 'IMAGE_QUOTA':
+            obj_ = IMAGE_QUOTAType44.factory()
+            obj_.build(child_)
+            self.IMAGE_QUOTA = obj_
+            obj_.original_tagname_ = 'IMAGE_QUOTA'
+# end class QUOTASType37
+
+
+class DATASTORE_QUOTAType38(GeneratedsSuper):
+    subclass = None
+    superclass = None
+    def __init__(self, DATASTORE=None):
+        self.original_tagname_ = None
+        if DATASTORE is None:
+            self.DATASTORE = []
+        else:
+            self.DATASTORE = DATASTORE
+    def factory(*args_, **kwargs_):
+        if supermod.CurrentSubclassModule_ is not None:
+            subclass = getSubclassFromModule_(
+                supermod.CurrentSubclassModule_, DATASTORE_QUOTAType38)
+            if subclass is not None:
+                return subclass(*args_, **kwargs_)
+        if DATASTORE_QUOTAType38.subclass:
+            return DATASTORE_QUOTAType38.subclass(*args_, **kwargs_)
+        else:
+            return DATASTORE_QUOTAType38(*args_, **kwargs_)
+    factory = staticmethod(factory)
+    def get_DATASTORE(self): return self.DATASTORE
+    def set_DATASTORE(self, DATASTORE): self.DATASTORE = DATASTORE
+    def add_DATASTORE(self, value): self.DATASTORE.append(value)
+    def insert_DATASTORE_at(self, index, value): self.DATASTORE.insert(index, value)
+    def replace_DATASTORE_at(self, index, value): self.DATASTORE[index] = value
+    def hasContent_(self):
+        if (
+            self.DATASTORE
+        ):
+            return True
+        else:
+            return False
+    def export(self, outfile, level, namespaceprefix_='', name_='DATASTORE_QUOTAType38', namespacedef_='', pretty_print=True):
+        imported_ns_def_ = GenerateDSNamespaceDefs_.get('DATASTORE_QUOTAType38')
+        if imported_ns_def_ is not None:
+            namespacedef_ = imported_ns_def_
+        if pretty_print:
+            eol_ = '\n'
+        else:
+            eol_ = ''
+        if self.original_tagname_ is not None:
+            name_ = self.original_tagname_
+        showIndent(outfile, level, pretty_print)
+        outfile.write('<%s%s%s' % (namespaceprefix_, name_, namespacedef_ and ' ' + namespacedef_ or '', ))
+        already_processed = set()
+        self.exportAttributes(outfile, level, already_processed, namespaceprefix_, name_='DATASTORE_QUOTAType38')
+        if self.hasContent_():
+            outfile.write('>%s' % (eol_, ))
+            self.exportChildren(outfile, level + 1, namespaceprefix_='', name_='DATASTORE_QUOTAType38', pretty_print=pretty_print)
+            showIndent(outfile, level, pretty_print)
+            outfile.write('</%s%s>%s' % (namespaceprefix_, name_, eol_))
+        else:
+            outfile.write('/>%s' % (eol_, ))
+    def exportAttributes(self, outfile, level, already_processed, namespaceprefix_='', name_='DATASTORE_QUOTAType38'):
+        pass
+    def exportChildren(self, outfile, level, namespaceprefix_='', name_='DATASTORE_QUOTAType38', fromsubclass_=False, pretty_print=True):
+        if pretty_print:
+            eol_ = '\n'
+        else:
+            eol_ = ''
+        for DATASTORE_ in self.DATASTORE:
+            DATASTORE_.export(outfile, level, namespaceprefix_, name_='DATASTORE', pretty_print=pretty_print)
+    def build(self, node):
+        already_processed = set()
+        self.buildAttributes(node, node.attrib, already_processed)
+        for child in node:
+            nodeName_ = Tag_pattern_.match(child.tag).groups()[-1]
+            self.buildChildren(child, node, nodeName_)
+        return self
+    def buildAttributes(self, node, attrs, already_processed):
+        pass
+    def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
+        if nodeName_ == 'DATASTORE':
+            obj_ = DATASTOREType39.factory()
+            obj_.build(child_)
+            self.DATASTORE.append(obj_)
+            obj_.original_tagname_ = 'DATASTORE'
+# end class DATASTORE_QUOTAType38
+
+
+class DATASTOREType39(GeneratedsSuper):
+    subclass = None
+    superclass = None
+    def __init__(self, ID=None, IMAGES=None, IMAGES_USED=None, SIZE=None, SIZE_USED=None):
+        self.original_tagname_ = None
+        self.ID = ID
+        self.IMAGES = IMAGES
+        self.IMAGES_USED = IMAGES_USED
+        self.SIZE = SIZE
+        self.SIZE_USED = SIZE_USED
+    def factory(*args_, **kwargs_):
+        if supermod.CurrentSubclassModule_ is not None:
+            subclass = getSubclassFromModule_(
+                supermod.CurrentSubclassModule_, DATASTOREType39)
+            if subclass is not None:
+                return subclass(*args_, **kwargs_)
+        if DATASTOREType39.subclass:
+            return DATASTOREType39.subclass(*args_, **kwargs_)
+        else:
+            return DATASTOREType39(*args_, **kwargs_)
+    factory = staticmethod(factory)
+    def get_ID(self): return self.ID
+    def set_ID(self, ID): self.ID = ID
+    def get_IMAGES(self): return self.IMAGES
+    def set_IMAGES(self, IMAGES): self.IMAGES = IMAGES
+    def get_IMAGES_USED(self): return self.IMAGES_USED
+    def set_IMAGES_USED(self, IMAGES_USED): self.IMAGES_USED = IMAGES_USED
+    def get_SIZE(self): return self.SIZE
+    def set_SIZE(self, SIZE): self.SIZE = SIZE
+    def get_SIZE_USED(self): return self.SIZE_USED
+    def set_SIZE_USED(self, SIZE_USED): self.SIZE_USED = SIZE_USED
+    def hasContent_(self):
+        if (
+            self.ID is not None or
+            self.IMAGES is not None or
+            self.IMAGES_USED is not None or
+            self.SIZE is not None or
+            self.SIZE_USED is not None
+        ):
+            return True
+        else:
+            return False
+    def export(self, outfile, level, namespaceprefix_='', name_='DATASTOREType39', namespacedef_='', pretty_print=True):
+        imported_ns_def_ = GenerateDSNamespaceDefs_.get('DATASTOREType39')
+        if imported_ns_def_ is not None:
+            namespacedef_ = imported_ns_def_
+        if pretty_print:
+            eol_ = '\n'
+        else:
+            eol_ = ''
+        if self.original_tagname_ is not None:
+            name_ = self.original_tagname_
+        showIndent(outfile, level, pretty_print)
+        outfile.write('<%s%s%s' % (namespaceprefix_, name_, namespacedef_ and ' ' + namespacedef_ or '', ))
+        already_processed = set()
+        self.exportAttributes(outfile, level, already_processed, namespaceprefix_, name_='DATASTOREType39')
+        if self.hasContent_():
+            outfile.write('>%s' % (eol_, ))
+            self.exportChildren(outfile, level + 1, namespaceprefix_='', name_='DATASTOREType39', pretty_print=pretty_print)
+            showIndent(outfile, level, pretty_print)
+            outfile.write('</%s%s>%s' % (namespaceprefix_, name_, eol_))
+        else:
+            outfile.write('/>%s' % (eol_, ))
+    def exportAttributes(self, outfile, level, already_processed, namespaceprefix_='', name_='DATASTOREType39'):
+        pass
+    def exportChildren(self, outfile, level, namespaceprefix_='', name_='DATASTOREType39', fromsubclass_=False, pretty_print=True):
+        if pretty_print:
+            eol_ = '\n'
+        else:
+            eol_ = ''
+        if self.ID is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<ID>%s</ID>%s' % (self.gds_encode(self.gds_format_string(quote_xml(self.ID), input_name='ID')), eol_))
+        if self.IMAGES is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<IMAGES>%s</IMAGES>%s' % (self.gds_encode(self.gds_format_string(quote_xml(self.IMAGES), input_name='IMAGES')), eol_))
+        if self.IMAGES_USED is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<IMAGES_USED>%s</IMAGES_USED>%s' % (self.gds_encode(self.gds_format_string(quote_xml(self.IMAGES_USED), input_name='IMAGES_USED')), eol_))
+        if self.SIZE is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<SIZE>%s</SIZE>%s' % (self.gds_encode(self.gds_format_string(quote_xml(self.SIZE), input_name='SIZE')), eol_))
+        if self.SIZE_USED is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<SIZE_USED>%s</SIZE_USED>%s' % (self.gds_encode(self.gds_format_string(quote_xml(self.SIZE_USED), input_name='SIZE_USED')), eol_))
+    def build(self, node):
+        already_processed = set()
+        self.buildAttributes(node, node.attrib, already_processed)
+        for child in node:
+            nodeName_ = Tag_pattern_.match(child.tag).groups()[-1]
+            self.buildChildren(child, node, nodeName_)
+        return self
+    def buildAttributes(self, node, attrs, already_processed):
+        pass
+    def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
+        if nodeName_ == 'ID':
+            ID_ = child_.text
+            ID_ = self.gds_validate_string(ID_, node, 'ID')
+            self.ID = ID_
+        elif nodeName_ == 'IMAGES':
+            IMAGES_ = child_.text
+            IMAGES_ = self.gds_validate_string(IMAGES_, node, 'IMAGES')
+            self.IMAGES = IMAGES_
+        elif nodeName_ == 'IMAGES_USED':
+            IMAGES_USED_ = child_.text
+            IMAGES_USED_ = self.gds_validate_string(IMAGES_USED_, node, 'IMAGES_USED')
+            self.IMAGES_USED = IMAGES_USED_
+        elif nodeName_ == 'SIZE':
+            SIZE_ = child_.text
+            SIZE_ = self.gds_validate_string(SIZE_, node, 'SIZE')
+            self.SIZE = SIZE_
+        elif nodeName_ == 'SIZE_USED':
+            SIZE_USED_ = child_.text
+            SIZE_USED_ = self.gds_validate_string(SIZE_USED_, node, 'SIZE_USED')
+            self.SIZE_USED = SIZE_USED_
+# end class DATASTOREType39
+
+
+class NETWORK_QUOTAType40(GeneratedsSuper):
+    subclass = None
+    superclass = None
+    def __init__(self, NETWORK=None):
+        self.original_tagname_ = None
+        if NETWORK is None:
+            self.NETWORK = []
+        else:
+            self.NETWORK = NETWORK
+    def factory(*args_, **kwargs_):
+        if supermod.CurrentSubclassModule_ is not None:
+            subclass = getSubclassFromModule_(
+                supermod.CurrentSubclassModule_, NETWORK_QUOTAType40)
+            if subclass is not None:
+                return subclass(*args_, **kwargs_)
+        if NETWORK_QUOTAType40.subclass:
+            return NETWORK_QUOTAType40.subclass(*args_, **kwargs_)
+        else:
+            return NETWORK_QUOTAType40(*args_, **kwargs_)
+    factory = staticmethod(factory)
+    def get_NETWORK(self): return self.NETWORK
+    def set_NETWORK(self, NETWORK): self.NETWORK = NETWORK
+    def add_NETWORK(self, value): self.NETWORK.append(value)
+    def insert_NETWORK_at(self, index, value): self.NETWORK.insert(index, value)
+    def replace_NETWORK_at(self, index, value): self.NETWORK[index] = value
+    def hasContent_(self):
+        if (
+            self.NETWORK
+        ):
+            return True
+        else:
+            return False
+    def export(self, outfile, level, namespaceprefix_='', name_='NETWORK_QUOTAType40', namespacedef_='', pretty_print=True):
+        imported_ns_def_ = GenerateDSNamespaceDefs_.get('NETWORK_QUOTAType40')
+        if imported_ns_def_ is not None:
+            namespacedef_ = imported_ns_def_
+        if pretty_print:
+            eol_ = '\n'
+        else:
+            eol_ = ''
+        if self.original_tagname_ is not None:
+            name_ = self.original_tagname_
+        showIndent(outfile, level, pretty_print)
+        outfile.write('<%s%s%s' % (namespaceprefix_, name_, namespacedef_ and ' ' + namespacedef_ or '', ))
+        already_processed = set()
+        self.exportAttributes(outfile, level, already_processed, namespaceprefix_, name_='NETWORK_QUOTAType40')
+        if self.hasContent_():
+            outfile.write('>%s' % (eol_, ))
+            self.exportChildren(outfile, level + 1, namespaceprefix_='', name_='NETWORK_QUOTAType40', pretty_print=pretty_print)
+            showIndent(outfile, level, pretty_print)
+            outfile.write('</%s%s>%s' % (namespaceprefix_, name_, eol_))
+        else:
+            outfile.write('/>%s' % (eol_, ))
+    def exportAttributes(self, outfile, level, already_processed, namespaceprefix_='', name_='NETWORK_QUOTAType40'):
+        pass
+    def exportChildren(self, outfile, level, namespaceprefix_='', name_='NETWORK_QUOTAType40', fromsubclass_=False, pretty_print=True):
+        if pretty_print:
+            eol_ = '\n'
+        else:
+            eol_ = ''
+        for NETWORK_ in self.NETWORK:
+            NETWORK_.export(outfile, level, namespaceprefix_, name_='NETWORK', pretty_print=pretty_print)
+    def build(self, node):
+        already_processed = set()
+        self.buildAttributes(node, node.attrib, already_processed)
+        for child in node:
+            nodeName_ = Tag_pattern_.match(child.tag).groups()[-1]
+            self.buildChildren(child, node, nodeName_)
+        return self
+    def buildAttributes(self, node, attrs, already_processed):
+        pass
+    def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
+        if nodeName_ == 'NETWORK':
+            obj_ = NETWORKType41.factory()
+            obj_.build(child_)
+            self.NETWORK.append(obj_)
+            obj_.original_tagname_ = 'NETWORK'
+# end class NETWORK_QUOTAType40
+
+
+class NETWORKType41(GeneratedsSuper):
+    subclass = None
+    superclass = None
+    def __init__(self, ID=None, LEASES=None, LEASES_USED=None):
+        self.original_tagname_ = None
+        self.ID = ID
+        self.LEASES = LEASES
+        self.LEASES_USED = LEASES_USED
+    def factory(*args_, **kwargs_):
+        if supermod.CurrentSubclassModule_ is not None:
+            subclass = getSubclassFromModule_(
+                supermod.CurrentSubclassModule_, NETWORKType41)
+            if subclass is not None:
+                return subclass(*args_, **kwargs_)
+        if NETWORKType41.subclass:
+            return NETWORKType41.subclass(*args_, **kwargs_)
+        else:
+            return NETWORKType41(*args_, **kwargs_)
+    factory = staticmethod(factory)
+    def get_ID(self): return self.ID
+    def set_ID(self, ID): self.ID = ID
+    def get_LEASES(self): return self.LEASES
+    def set_LEASES(self, LEASES): self.LEASES = LEASES
+    def get_LEASES_USED(self): return self.LEASES_USED
+    def set_LEASES_USED(self, LEASES_USED): self.LEASES_USED = LEASES_USED
+    def hasContent_(self):
+        if (
+            self.ID is not None or
+            self.LEASES is not None or
+            self.LEASES_USED is not None
+        ):
+            return True
+        else:
+            return False
+    def export(self, outfile, level, namespaceprefix_='', name_='NETWORKType41', namespacedef_='', pretty_print=True):
+        imported_ns_def_ = GenerateDSNamespaceDefs_.get('NETWORKType41')
+        if imported_ns_def_ is not None:
+            namespacedef_ = imported_ns_def_
+        if pretty_print:
+            eol_ = '\n'
+        else:
+            eol_ = ''
+        if self.original_tagname_ is not None:
+            name_ = self.original_tagname_
+        showIndent(outfile, level, pretty_print)
+        outfile.write('<%s%s%s' % (namespaceprefix_, name_, namespacedef_ and ' ' + namespacedef_ or '', ))
+        already_processed = set()
+        self.exportAttributes(outfile, level, already_processed, namespaceprefix_, name_='NETWORKType41')
+        if self.hasContent_():
+            outfile.write('>%s' % (eol_, ))
+            self.exportChildren(outfile, level + 1, namespaceprefix_='', name_='NETWORKType41', pretty_print=pretty_print)
+            showIndent(outfile, level, pretty_print)
+            outfile.write('</%s%s>%s' % (namespaceprefix_, name_, eol_))
+        else:
+            outfile.write('/>%s' % (eol_, ))
+    def exportAttributes(self, outfile, level, already_processed, namespaceprefix_='', name_='NETWORKType41'):
+        pass
+    def exportChildren(self, outfile, level, namespaceprefix_='', name_='NETWORKType41', fromsubclass_=False, pretty_print=True):
+        if pretty_print:
+            eol_ = '\n'
+        else:
+            eol_ = ''
+        if self.ID is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<ID>%s</ID>%s' % (self.gds_encode(self.gds_format_string(quote_xml(self.ID), input_name='ID')), eol_))
+        if self.LEASES is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<LEASES>%s</LEASES>%s' % (self.gds_encode(self.gds_format_string(quote_xml(self.LEASES), input_name='LEASES')), eol_))
+        if self.LEASES_USED is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<LEASES_USED>%s</LEASES_USED>%s' % (self.gds_encode(self.gds_format_string(quote_xml(self.LEASES_USED), input_name='LEASES_USED')), eol_))
+    def build(self, node):
+        already_processed = set()
+        self.buildAttributes(node, node.attrib, already_processed)
+        for child in node:
+            nodeName_ = Tag_pattern_.match(child.tag).groups()[-1]
+            self.buildChildren(child, node, nodeName_)
+        return self
+    def buildAttributes(self, node, attrs, already_processed):
+        pass
+    def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
+        if nodeName_ == 'ID':
+            ID_ = child_.text
+            ID_ = self.gds_validate_string(ID_, node, 'ID')
+            self.ID = ID_
+        elif nodeName_ == 'LEASES':
+            LEASES_ = child_.text
+            LEASES_ = self.gds_validate_string(LEASES_, node, 'LEASES')
+            self.LEASES = LEASES_
+        elif nodeName_ == 'LEASES_USED':
+            LEASES_USED_ = child_.text
+            LEASES_USED_ = self.gds_validate_string(LEASES_USED_, node, 'LEASES_USED')
+            self.LEASES_USED = LEASES_USED_
+# end class NETWORKType41
+
+
+class VM_QUOTAType42(GeneratedsSuper):
+    subclass = None
+    superclass = None
+    def __init__(self, VM=None):
+        self.original_tagname_ = None
+        self.VM = VM
+    def factory(*args_, **kwargs_):
+        if supermod.CurrentSubclassModule_ is not None:
+            subclass = getSubclassFromModule_(
+                supermod.CurrentSubclassModule_, VM_QUOTAType42)
+            if subclass is not None:
+                return subclass(*args_, **kwargs_)
+        if VM_QUOTAType42.subclass:
+            return VM_QUOTAType42.subclass(*args_, **kwargs_)
+        else:
+            return VM_QUOTAType42(*args_, **kwargs_)
+    factory = staticmethod(factory)
+    def get_VM(self): return self.VM
+    def set_VM(self, VM): self.VM = VM
+    def hasContent_(self):
+        if (
+            self.VM is not None
+        ):
+            return True
+        else:
+            return False
+    def export(self, outfile, level, namespaceprefix_='', name_='VM_QUOTAType42', namespacedef_='', pretty_print=True):
+        imported_ns_def_ = GenerateDSNamespaceDefs_.get('VM_QUOTAType42')
+        if imported_ns_def_ is not None:
+            namespacedef_ = imported_ns_def_
+        if pretty_print:
+            eol_ = '\n'
+        else:
+            eol_ = ''
+        if self.original_tagname_ is not None:
+            name_ = self.original_tagname_
+        showIndent(outfile, level, pretty_print)
+        outfile.write('<%s%s%s' % (namespaceprefix_, name_, namespacedef_ and ' ' + namespacedef_ or '', ))
+        already_processed = set()
+        self.exportAttributes(outfile, level, already_processed, namespaceprefix_, name_='VM_QUOTAType42')
+        if self.hasContent_():
+            outfile.write('>%s' % (eol_, ))
+            self.exportChildren(outfile, level + 1, namespaceprefix_='', name_='VM_QUOTAType42', pretty_print=pretty_print)
+            showIndent(outfile, level, pretty_print)
+            outfile.write('</%s%s>%s' % (namespaceprefix_, name_, eol_))
+        else:
+            outfile.write('/>%s' % (eol_, ))
+    def exportAttributes(self, outfile, level, already_processed, namespaceprefix_='', name_='VM_QUOTAType42'):
+        pass
+    def exportChildren(self, outfile, level, namespaceprefix_='', name_='VM_QUOTAType42', fromsubclass_=False, pretty_print=True):
+        if pretty_print:
+            eol_ = '\n'
+        else:
+            eol_ = ''
+        if self.VM is not None:
+            self.VM.export(outfile, level, namespaceprefix_, name_='VM', pretty_print=pretty_print)
+    def build(self, node):
+        already_processed = set()
+        self.buildAttributes(node, node.attrib, already_processed)
+        for child in node:
+            nodeName_ = Tag_pattern_.match(child.tag).groups()[-1]
+            self.buildChildren(child, node, nodeName_)
+        return self
+    def buildAttributes(self, node, attrs, already_processed):
+        pass
+    def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
+        if nodeName_ == 'VM':
+            obj_ = VMType43.factory()
+            obj_.build(child_)
+            self.VM = obj_
+            obj_.original_tagname_ = 'VM'
+# end class VM_QUOTAType42
+
+
+class VMType43(GeneratedsSuper):
+    subclass = None
+    superclass = None
+    def __init__(self, CPU=None, CPU_USED=None, MEMORY=None, MEMORY_USED=None, SYSTEM_DISK_SIZE=None, SYSTEM_DISK_SIZE_USED=None, VMS=None, VMS_USED=None):
+        self.original_tagname_ = None
+        self.CPU = CPU
+        self.CPU_USED = CPU_USED
+        self.MEMORY = MEMORY
+        self.MEMORY_USED = MEMORY_USED
+        self.SYSTEM_DISK_SIZE = SYSTEM_DISK_SIZE
+        self.SYSTEM_DISK_SIZE_USED = SYSTEM_DISK_SIZE_USED
+        self.VMS = VMS
+        self.VMS_USED = VMS_USED
+    def factory(*args_, **kwargs_):
+        if supermod.CurrentSubclassModule_ is not None:
+            subclass = getSubclassFromModule_(
+                supermod.CurrentSubclassModule_, VMType43)
+            if subclass is not None:
+                return subclass(*args_, **kwargs_)
+        if VMType43.subclass:
+            return VMType43.subclass(*args_, **kwargs_)
+        else:
+            return VMType43(*args_, **kwargs_)
+    factory = staticmethod(factory)
+    def get_CPU(self): return self.CPU
+    def set_CPU(self, CPU): self.CPU = CPU
+    def get_CPU_USED(self): return self.CPU_USED
+    def set_CPU_USED(self, CPU_USED): self.CPU_USED = CPU_USED
+    def get_MEMORY(self): return self.MEMORY
+    def set_MEMORY(self, MEMORY): self.MEMORY = MEMORY
+    def get_MEMORY_USED(self): return self.MEMORY_USED
+    def set_MEMORY_USED(self, MEMORY_USED): self.MEMORY_USED = MEMORY_USED
+    def get_SYSTEM_DISK_SIZE(self): return self.SYSTEM_DISK_SIZE
+    def set_SYSTEM_DISK_SIZE(self, SYSTEM_DISK_SIZE): self.SYSTEM_DISK_SIZE = SYSTEM_DISK_SIZE
+    def get_SYSTEM_DISK_SIZE_USED(self): return self.SYSTEM_DISK_SIZE_USED
+    def set_SYSTEM_DISK_SIZE_USED(self, SYSTEM_DISK_SIZE_USED): self.SYSTEM_DISK_SIZE_USED = SYSTEM_DISK_SIZE_USED
+    def get_VMS(self): return self.VMS
+    def set_VMS(self, VMS): self.VMS = VMS
+    def get_VMS_USED(self): return self.VMS_USED
+    def set_VMS_USED(self, VMS_USED): self.VMS_USED = VMS_USED
+    def hasContent_(self):
+        if (
+            self.CPU is not None or
+            self.CPU_USED is not None or
+            self.MEMORY is not None or
+            self.MEMORY_USED is not None or
+            self.SYSTEM_DISK_SIZE is not None or
+            self.SYSTEM_DISK_SIZE_USED is not None or
+            self.VMS is not None or
+            self.VMS_USED is not None
+        ):
+            return True
+        else:
+            return False
+    def export(self, outfile, level, namespaceprefix_='', name_='VMType43', namespacedef_='', pretty_print=True):
+        imported_ns_def_ = GenerateDSNamespaceDefs_.get('VMType43')
+        if imported_ns_def_ is not None:
+            namespacedef_ = imported_ns_def_
+        if pretty_print:
+            eol_ = '\n'
+        else:
+            eol_ = ''
+        if self.original_tagname_ is not None:
+            name_ = self.original_tagname_
+        showIndent(outfile, level, pretty_print)
+        outfile.write('<%s%s%s' % (namespaceprefix_, name_, namespacedef_ and ' ' + namespacedef_ or '', ))
+        already_processed = set()
+        self.exportAttributes(outfile, level, already_processed, namespaceprefix_, name_='VMType43')
+        if self.hasContent_():
+            outfile.write('>%s' % (eol_, ))
+            self.exportChildren(outfile, level + 1, namespaceprefix_='', name_='VMType43', pretty_print=pretty_print)
+            showIndent(outfile, level, pretty_print)
+            outfile.write('</%s%s>%s' % (namespaceprefix_, name_, eol_))
+        else:
+            outfile.write('/>%s' % (eol_, ))
+    def exportAttributes(self, outfile, level, already_processed, namespaceprefix_='', name_='VMType43'):
+        pass
+    def exportChildren(self, outfile, level, namespaceprefix_='', name_='VMType43', fromsubclass_=False, pretty_print=True):
+        if pretty_print:
+            eol_ = '\n'
+        else:
+            eol_ = ''
+        if self.CPU is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<CPU>%s</CPU>%s' % (self.gds_encode(self.gds_format_string(quote_xml(self.CPU), input_name='CPU')), eol_))
+        if self.CPU_USED is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<CPU_USED>%s</CPU_USED>%s' % (self.gds_encode(self.gds_format_string(quote_xml(self.CPU_USED), input_name='CPU_USED')), eol_))
+        if self.MEMORY is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<MEMORY>%s</MEMORY>%s' % (self.gds_encode(self.gds_format_string(quote_xml(self.MEMORY), input_name='MEMORY')), eol_))
+        if self.MEMORY_USED is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<MEMORY_USED>%s</MEMORY_USED>%s' % (self.gds_encode(self.gds_format_string(quote_xml(self.MEMORY_USED), input_name='MEMORY_USED')), eol_))
+        if self.SYSTEM_DISK_SIZE is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<SYSTEM_DISK_SIZE>%s</SYSTEM_DISK_SIZE>%s' % (self.gds_encode(self.gds_format_string(quote_xml(self.SYSTEM_DISK_SIZE), input_name='SYSTEM_DISK_SIZE')), eol_))
+        if self.SYSTEM_DISK_SIZE_USED is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<SYSTEM_DISK_SIZE_USED>%s</SYSTEM_DISK_SIZE_USED>%s' % (self.gds_encode(self.gds_format_string(quote_xml(self.SYSTEM_DISK_SIZE_USED), input_name='SYSTEM_DISK_SIZE_USED')), eol_))
+        if self.VMS is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<VMS>%s</VMS>%s' % (self.gds_encode(self.gds_format_string(quote_xml(self.VMS), input_name='VMS')), eol_))
+        if self.VMS_USED is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<VMS_USED>%s</VMS_USED>%s' % (self.gds_encode(self.gds_format_string(quote_xml(self.VMS_USED), input_name='VMS_USED')), eol_))
+    def build(self, node):
+        already_processed = set()
+        self.buildAttributes(node, node.attrib, already_processed)
+        for child in node:
+            nodeName_ = Tag_pattern_.match(child.tag).groups()[-1]
+            self.buildChildren(child, node, nodeName_)
+        return self
+    def buildAttributes(self, node, attrs, already_processed):
+        pass
+    def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
+        if nodeName_ == 'CPU':
+            CPU_ = child_.text
+            CPU_ = self.gds_validate_string(CPU_, node, 'CPU')
+            self.CPU = CPU_
+        elif nodeName_ == 'CPU_USED':
+            CPU_USED_ = child_.text
+            CPU_USED_ = self.gds_validate_string(CPU_USED_, node, 'CPU_USED')
+            self.CPU_USED = CPU_USED_
+        elif nodeName_ == 'MEMORY':
+            MEMORY_ = child_.text
+            MEMORY_ = self.gds_validate_string(MEMORY_, node, 'MEMORY')
+            self.MEMORY = MEMORY_
+        elif nodeName_ == 'MEMORY_USED':
+            MEMORY_USED_ = child_.text
+            MEMORY_USED_ = self.gds_validate_string(MEMORY_USED_, node, 'MEMORY_USED')
+            self.MEMORY_USED = MEMORY_USED_
+        elif nodeName_ == 'SYSTEM_DISK_SIZE':
+            SYSTEM_DISK_SIZE_ = child_.text
+            SYSTEM_DISK_SIZE_ = self.gds_validate_string(SYSTEM_DISK_SIZE_, node, 'SYSTEM_DISK_SIZE')
+            self.SYSTEM_DISK_SIZE = SYSTEM_DISK_SIZE_
+        elif nodeName_ == 'SYSTEM_DISK_SIZE_USED':
+            SYSTEM_DISK_SIZE_USED_ = child_.text
+            SYSTEM_DISK_SIZE_USED_ = self.gds_validate_string(SYSTEM_DISK_SIZE_USED_, node, 'SYSTEM_DISK_SIZE_USED')
+            self.SYSTEM_DISK_SIZE_USED = SYSTEM_DISK_SIZE_USED_
+        elif nodeName_ == 'VMS':
+            VMS_ = child_.text
+            VMS_ = self.gds_validate_string(VMS_, node, 'VMS')
+            self.VMS = VMS_
+        elif nodeName_ == 'VMS_USED':
+            VMS_USED_ = child_.text
+            VMS_USED_ = self.gds_validate_string(VMS_USED_, node, 'VMS_USED')
+            self.VMS_USED = VMS_USED_
+# end class VMType43
+
+
+class IMAGE_QUOTAType44(GeneratedsSuper):
+    subclass = None
+    superclass = None
+    def __init__(self, IMAGE=None):
+        self.original_tagname_ = None
+        if IMAGE is None:
+            self.IMAGE = []
+        else:
+            self.IMAGE = IMAGE
+    def factory(*args_, **kwargs_):
+        if supermod.CurrentSubclassModule_ is not None:
+            subclass = getSubclassFromModule_(
+                supermod.CurrentSubclassModule_, IMAGE_QUOTAType44)
+            if subclass is not None:
+                return subclass(*args_, **kwargs_)
+        if IMAGE_QUOTAType44.subclass:
+            return IMAGE_QUOTAType44.subclass(*args_, **kwargs_)
+        else:
+            return IMAGE_QUOTAType44(*args_, **kwargs_)
+    factory = staticmethod(factory)
+    def get_IMAGE(self): return self.IMAGE
+    def set_IMAGE(self, IMAGE): self.IMAGE = IMAGE
+    def add_IMAGE(self, value): self.IMAGE.append(value)
+    def insert_IMAGE_at(self, index, value): self.IMAGE.insert(index, value)
+    def replace_IMAGE_at(self, index, value): self.IMAGE[index] = value
+    def hasContent_(self):
+        if (
+            self.IMAGE
+        ):
+            return True
+        else:
+            return False
+    def export(self, outfile, level, namespaceprefix_='', name_='IMAGE_QUOTAType44', namespacedef_='', pretty_print=True):
+        imported_ns_def_ = GenerateDSNamespaceDefs_.get('IMAGE_QUOTAType44')
+        if imported_ns_def_ is not None:
+            namespacedef_ = imported_ns_def_
+        if pretty_print:
+            eol_ = '\n'
+        else:
+            eol_ = ''
+        if self.original_tagname_ is not None:
+            name_ = self.original_tagname_
+        showIndent(outfile, level, pretty_print)
+        outfile.write('<%s%s%s' % (namespaceprefix_, name_, namespacedef_ and ' ' + namespacedef_ or '', ))
+        already_processed = set()
+        self.exportAttributes(outfile, level, already_processed, namespaceprefix_, name_='IMAGE_QUOTAType44')
+        if self.hasContent_():
+            outfile.write('>%s' % (eol_, ))
+            self.exportChildren(outfile, level + 1, namespaceprefix_='', name_='IMAGE_QUOTAType44', pretty_print=pretty_print)
+            showIndent(outfile, level, pretty_print)
+            outfile.write('</%s%s>%s' % (namespaceprefix_, name_, eol_))
+        else:
+            outfile.write('/>%s' % (eol_, ))
+    def exportAttributes(self, outfile, level, already_processed, namespaceprefix_='', name_='IMAGE_QUOTAType44'):
+        pass
+    def exportChildren(self, outfile, level, namespaceprefix_='', name_='IMAGE_QUOTAType44', fromsubclass_=False, pretty_print=True):
+        if pretty_print:
+            eol_ = '\n'
+        else:
+            eol_ = ''
+        for IMAGE_ in self.IMAGE:
+            IMAGE_.export(outfile, level, namespaceprefix_, name_='IMAGE', pretty_print=pretty_print)
+    def build(self, node):
+        already_processed = set()
+        self.buildAttributes(node, node.attrib, already_processed)
+        for child in node:
+            nodeName_ = Tag_pattern_.match(child.tag).groups()[-1]
+            self.buildChildren(child, node, nodeName_)
+        return self
+    def buildAttributes(self, node, attrs, already_processed):
+        pass
+    def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
+        if nodeName_ == 'IMAGE':
+            obj_ = IMAGEType45.factory()
+            obj_.build(child_)
+            self.IMAGE.append(obj_)
+            obj_.original_tagname_ = 'IMAGE'
+# end class IMAGE_QUOTAType44
+
+
+class IMAGEType45(GeneratedsSuper):
+    subclass = None
+    superclass = None
+    def __init__(self, ID=None, RVMS=None, RVMS_USED=None):
+        self.original_tagname_ = None
+        self.ID = ID
+        self.RVMS = RVMS
+        self.RVMS_USED = RVMS_USED
+    def factory(*args_, **kwargs_):
+        if supermod.CurrentSubclassModule_ is not None:
+            subclass = getSubclassFromModule_(
+                supermod.CurrentSubclassModule_, IMAGEType45)
+            if subclass is not None:
+                return subclass(*args_, **kwargs_)
+        if IMAGEType45.subclass:
+            return IMAGEType45.subclass(*args_, **kwargs_)
+        else:
+            return IMAGEType45(*args_, **kwargs_)
+    factory = staticmethod(factory)
+    def get_ID(self): return self.ID
+    def set_ID(self, ID): self.ID = ID
+    def get_RVMS(self): return self.RVMS
+    def set_RVMS(self, RVMS): self.RVMS = RVMS
+    def get_RVMS_USED(self): return self.RVMS_USED
+    def set_RVMS_USED(self, RVMS_USED): self.RVMS_USED = RVMS_USED
+    def hasContent_(self):
+        if (
+            self.ID is not None or
+            self.RVMS is not None or
+            self.RVMS_USED is not None
+        ):
+            return True
+        else:
+            return False
+    def export(self, outfile, level, namespaceprefix_='', name_='IMAGEType45', namespacedef_='', pretty_print=True):
+        imported_ns_def_ = GenerateDSNamespaceDefs_.get('IMAGEType45')
+        if imported_ns_def_ is not None:
+            namespacedef_ = imported_ns_def_
+        if pretty_print:
+            eol_ = '\n'
+        else:
+            eol_ = ''
+        if self.original_tagname_ is not None:
+            name_ = self.original_tagname_
+        showIndent(outfile, level, pretty_print)
+        outfile.write('<%s%s%s' % (namespaceprefix_, name_, namespacedef_ and ' ' + namespacedef_ or '', ))
+        already_processed = set()
+        self.exportAttributes(outfile, level, already_processed, namespaceprefix_, name_='IMAGEType45')
+        if self.hasContent_():
+            outfile.write('>%s' % (eol_, ))
+            self.exportChildren(outfile, level + 1, namespaceprefix_='', name_='IMAGEType45', pretty_print=pretty_print)
+            showIndent(outfile, level, pretty_print)
+            outfile.write('</%s%s>%s' % (namespaceprefix_, name_, eol_))
+        else:
+            outfile.write('/>%s' % (eol_, ))
+    def exportAttributes(self, outfile, level, already_processed, namespaceprefix_='', name_='IMAGEType45'):
+        pass
+    def exportChildren(self, outfile, level, namespaceprefix_='', name_='IMAGEType45', fromsubclass_=False, pretty_print=True):
+        if pretty_print:
+            eol_ = '\n'
+        else:
+            eol_ = ''
+        if self.ID is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<ID>%s</ID>%s' % (self.gds_encode(self.gds_format_string(quote_xml(self.ID), input_name='ID')), eol_))
+        if self.RVMS is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<RVMS>%s</RVMS>%s' % (self.gds_encode(self.gds_format_string(quote_xml(self.RVMS), input_name='RVMS')), eol_))
+        if self.RVMS_USED is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<RVMS_USED>%s</RVMS_USED>%s' % (self.gds_encode(self.gds_format_string(quote_xml(self.RVMS_USED), input_name='RVMS_USED')), eol_))
+    def build(self, node):
+        already_processed = set()
+        self.buildAttributes(node, node.attrib, already_processed)
+        for child in node:
+            nodeName_ = Tag_pattern_.match(child.tag).groups()[-1]
+            self.buildChildren(child, node, nodeName_)
+        return self
+    def buildAttributes(self, node, attrs, already_processed):
+        pass
+    def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
+        if nodeName_ == 'ID':
+            ID_ = child_.text
+            ID_ = self.gds_validate_string(ID_, node, 'ID')
+            self.ID = ID_
+        elif nodeName_ == 'RVMS':
+            RVMS_ = child_.text
+            RVMS_ = self.gds_validate_string(RVMS_, node, 'RVMS')
+            self.RVMS = RVMS_
+        elif nodeName_ == 'RVMS_USED':
+            RVMS_USED_ = child_.text
+            RVMS_USED_ = self.gds_validate_string(RVMS_USED_, node, 'RVMS_USED')
+            self.RVMS_USED = RVMS_USED_
+# end class IMAGEType45
+
+
+class DEFAULT_USER_QUOTASType(GeneratedsSuper):
+    subclass = None
+    superclass = None
+    def __init__(self, DATASTORE_QUOTA=None, NETWORK_QUOTA=None, VM_QUOTA=None, IMAGE_QUOTA=None):
+        self.original_tagname_ = None
+        self.DATASTORE_QUOTA = DATASTORE_QUOTA
+        self.NETWORK_QUOTA = NETWORK_QUOTA
+        self.VM_QUOTA = VM_QUOTA
+        self.IMAGE_QUOTA = IMAGE_QUOTA
+    def factory(*args_, **kwargs_):
+        if supermod.CurrentSubclassModule_ is not None:
+            subclass = getSubclassFromModule_(
+                supermod.CurrentSubclassModule_, DEFAULT_USER_QUOTASType)
+            if subclass is not None:
+                return subclass(*args_, **kwargs_)
+        if DEFAULT_USER_QUOTASType.subclass:
+            return DEFAULT_USER_QUOTASType.subclass(*args_, **kwargs_)
+        else:
+            return DEFAULT_USER_QUOTASType(*args_, **kwargs_)
+    factory = staticmethod(factory)
+    def get_DATASTORE_QUOTA(self): return self.DATASTORE_QUOTA
+    def set_DATASTORE_QUOTA(self, DATASTORE_QUOTA): self.DATASTORE_QUOTA = DATASTORE_QUOTA
+    def get_NETWORK_QUOTA(self): return self.NETWORK_QUOTA
+    def set_NETWORK_QUOTA(self, NETWORK_QUOTA): self.NETWORK_QUOTA = NETWORK_QUOTA
+    def get_VM_QUOTA(self): return self.VM_QUOTA
+    def set_VM_QUOTA(self, VM_QUOTA): self.VM_QUOTA = VM_QUOTA
+    def get_IMAGE_QUOTA(self): return self.IMAGE_QUOTA
+    def set_IMAGE_QUOTA(self, IMAGE_QUOTA): self.IMAGE_QUOTA = IMAGE_QUOTA
+    def hasContent_(self):
+        if (
+            self.DATASTORE_QUOTA is not None or
+            self.NETWORK_QUOTA is not None or
+            self.VM_QUOTA is not None or
+            self.IMAGE_QUOTA is not None
+        ):
+            return True
+        else:
+            return False
+    def export(self, outfile, level, namespaceprefix_='', name_='DEFAULT_USER_QUOTASType', namespacedef_='', pretty_print=True):
+        imported_ns_def_ = GenerateDSNamespaceDefs_.get('DEFAULT_USER_QUOTASType')
+        if imported_ns_def_ is not None:
+            namespacedef_ = imported_ns_def_
+        if pretty_print:
+            eol_ = '\n'
+        else:
+            eol_ = ''
+        if self.original_tagname_ is not None:
+            name_ = self.original_tagname_
+        showIndent(outfile, level, pretty_print)
+        outfile.write('<%s%s%s' % (namespaceprefix_, name_, namespacedef_ and ' ' + namespacedef_ or '', ))
+        already_processed = set()
+        self.exportAttributes(outfile, level, already_processed, namespaceprefix_, name_='DEFAULT_USER_QUOTASType')
+        if self.hasContent_():
+            outfile.write('>%s' % (eol_, ))
+            self.exportChildren(outfile, level + 1, namespaceprefix_='', name_='DEFAULT_USER_QUOTASType', pretty_print=pretty_print)
+            showIndent(outfile, level, pretty_print)
+            outfile.write('</%s%s>%s' % (namespaceprefix_, name_, eol_))
+        else:
+            outfile.write('/>%s' % (eol_, ))
+    def exportAttributes(self, outfile, level, already_processed, namespaceprefix_='', name_='DEFAULT_USER_QUOTASType'):
+        pass
+    def exportChildren(self, outfile, level, namespaceprefix_='', name_='DEFAULT_USER_QUOTASType', fromsubclass_=False, pretty_print=True):
+        if pretty_print:
+            eol_ = '\n'
+        else:
+            eol_ = ''
+        if self.DATASTORE_QUOTA is not None:
+            self.DATASTORE_QUOTA.export(outfile, level, namespaceprefix_, name_='DATASTORE_QUOTA', pretty_print=pretty_print)
+        if self.NETWORK_QUOTA is not None:
+            self.NETWORK_QUOTA.export(outfile, level, namespaceprefix_, name_='NETWORK_QUOTA', pretty_print=pretty_print)
+        if self.VM_QUOTA is not None:
+            self.VM_QUOTA.export(outfile, level, namespaceprefix_, name_='VM_QUOTA', pretty_print=pretty_print)
+        if self.IMAGE_QUOTA is not None:
+            self.IMAGE_QUOTA.export(outfile, level, namespaceprefix_, name_='IMAGE_QUOTA', pretty_print=pretty_print)
+    def build(self, node):
+        already_processed = set()
+        self.buildAttributes(node, node.attrib, already_processed)
+        for child in node:
+            nodeName_ = Tag_pattern_.match(child.tag).groups()[-1]
+            self.buildChildren(child, node, nodeName_)
+        return self
+    def buildAttributes(self, node, attrs, already_processed):
+        pass
+    def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
+        if nodeName_ == 'DATASTORE_QUOTA':
+            obj_ = DATASTORE_QUOTAType46.factory()
+            obj_.build(child_)
+            self.DATASTORE_QUOTA = obj_
+            obj_.original_tagname_ = 'DATASTORE_QUOTA'
+        elif nodeName_ == 'NETWORK_QUOTA':
+            obj_ = NETWORK_QUOTAType48.factory()
+            obj_.build(child_)
+            self.NETWORK_QUOTA = obj_
+            obj_.original_tagname_ = 'NETWORK_QUOTA'
+        elif nodeName_ == 'VM_QUOTA':
+            obj_ = VM_QUOTAType50.factory()
+            obj_.build(child_)
+            self.VM_QUOTA = obj_
+            obj_.original_tagname_ = 'VM_QUOTA'
+        elif nodeName_ == 'IMAGE_QUOTA':
+            obj_ = IMAGE_QUOTAType52.factory()
+            obj_.build(child_)
+            self.IMAGE_QUOTA = obj_
+            obj_.original_tagname_ = 'IMAGE_QUOTA'
+# end class DEFAULT_USER_QUOTASType
+
+
+class DATASTORE_QUOTAType46(GeneratedsSuper):
+    subclass = None
+    superclass = None
+    def __init__(self, DATASTORE=None):
+        self.original_tagname_ = None
+        if DATASTORE is None:
+            self.DATASTORE = []
+        else:
+            self.DATASTORE = DATASTORE
+    def factory(*args_, **kwargs_):
+        if supermod.CurrentSubclassModule_ is not None:
+            subclass = getSubclassFromModule_(
+                supermod.CurrentSubclassModule_, DATASTORE_QUOTAType46)
+            if subclass is not None:
+                return subclass(*args_, **kwargs_)
+        if DATASTORE_QUOTAType46.subclass:
+            return DATASTORE_QUOTAType46.subclass(*args_, **kwargs_)
+        else:
+            return DATASTORE_QUOTAType46(*args_, **kwargs_)
+    factory = staticmethod(factory)
+    def get_DATASTORE(self): return self.DATASTORE
+    def set_DATASTORE(self, DATASTORE): self.DATASTORE = DATASTORE
+    def add_DATASTORE(self, value): self.DATASTORE.append(value)
+    def insert_DATASTORE_at(self, index, value): self.DATASTORE.insert(index, value)
+    def replace_DATASTORE_at(self, index, value): self.DATASTORE[index] = value
+    def hasContent_(self):
+        if (
+            self.DATASTORE
+        ):
+            return True
+        else:
+            return False
+    def export(self, outfile, level, namespaceprefix_='', name_='DATASTORE_QUOTAType46', namespacedef_='', pretty_print=True):
+        imported_ns_def_ = GenerateDSNamespaceDefs_.get('DATASTORE_QUOTAType46')
+        if imported_ns_def_ is not None:
+            namespacedef_ = imported_ns_def_
+        if pretty_print:
+            eol_ = '\n'
+        else:
+            eol_ = ''
+        if self.original_tagname_ is not None:
+            name_ = self.original_tagname_
+        showIndent(outfile, level, pretty_print)
+        outfile.write('<%s%s%s' % (namespaceprefix_, name_, namespacedef_ and ' ' + namespacedef_ or '', ))
+        already_processed = set()
+        self.exportAttributes(outfile, level, already_processed, namespaceprefix_, name_='DATASTORE_QUOTAType46')
+        if self.hasContent_():
+            outfile.write('>%s' % (eol_, ))
+            self.exportChildren(outfile, level + 1, namespaceprefix_='', name_='DATASTORE_QUOTAType46', pretty_print=pretty_print)
+            showIndent(outfile, level, pretty_print)
+            outfile.write('</%s%s>%s' % (namespaceprefix_, name_, eol_))
+        else:
+            outfile.write('/>%s' % (eol_, ))
+    def exportAttributes(self, outfile, level, already_processed, namespaceprefix_='', name_='DATASTORE_QUOTAType46'):
+        pass
+    def exportChildren(self, outfile, level, namespaceprefix_='', name_='DATASTORE_QUOTAType46', fromsubclass_=False, pretty_print=True):
+        if pretty_print:
+            eol_ = '\n'
+        else:
+            eol_ = ''
+        for DATASTORE_ in self.DATASTORE:
+            DATASTORE_.export(outfile, level, namespaceprefix_, name_='DATASTORE', pretty_print=pretty_print)
+    def build(self, node):
+        already_processed = set()
+        self.buildAttributes(node, node.attrib, already_processed)
+        for child in node:
+            nodeName_ = Tag_pattern_.match(child.tag).groups()[-1]
+            self.buildChildren(child, node, nodeName_)
+        return self
+    def buildAttributes(self, node, attrs, already_processed):
+        pass
+    def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
+        if nodeName_ == 'DATASTORE':
+            obj_ = DATASTOREType47.factory()
+            obj_.build(child_)
+            self.DATASTORE.append(obj_)
+            obj_.original_tagname_ = 'DATASTORE'
+# end class DATASTORE_QUOTAType46
+
+
+class DATASTOREType47(GeneratedsSuper):
+    subclass = None
+    superclass = None
+    def __init__(self, ID=None, IMAGES=None, IMAGES_USED=None, SIZE=None, SIZE_USED=None):
+        self.original_tagname_ = None
+        self.ID = ID
+        self.IMAGES = IMAGES
+        self.IMAGES_USED = IMAGES_USED
+        self.SIZE = SIZE
+        self.SIZE_USED = SIZE_USED
+    def factory(*args_, **kwargs_):
+        if supermod.CurrentSubclassModule_ is not None:
+            subclass = getSubclassFromModule_(
+                supermod.CurrentSubclassModule_, DATASTOREType47)
+            if subclass is not None:
+                return subclass(*args_, **kwargs_)
+        if DATASTOREType47.subclass:
+            return DATASTOREType47.subclass(*args_, **kwargs_)
+        else:
+            return DATASTOREType47(*args_, **kwargs_)
+    factory = staticmethod(factory)
+    def get_ID(self): return self.ID
+    def set_ID(self, ID): self.ID = ID
+    def get_IMAGES(self): return self.IMAGES
+    def set_IMAGES(self, IMAGES): self.IMAGES = IMAGES
+    def get_IMAGES_USED(self): return self.IMAGES_USED
+    def set_IMAGES_USED(self, IMAGES_USED): self.IMAGES_USED = IMAGES_USED
+    def get_SIZE(self): return self.SIZE
+    def set_SIZE(self, SIZE): self.SIZE = SIZE
+    def get_SIZE_USED(self): return self.SIZE_USED
+    def set_SIZE_USED(self, SIZE_USED): self.SIZE_USED = SIZE_USED
+    def hasContent_(self):
+        if (
+            self.ID is not None or
+            self.IMAGES is not None or
+            self.IMAGES_USED is not None or
+            self.SIZE is not None or
+            self.SIZE_USED is not None
+        ):
+            return True
+        else:
+            return False
+    def export(self, outfile, level, namespaceprefix_='', name_='DATASTOREType47', namespacedef_='', pretty_print=True):
+        imported_ns_def_ = GenerateDSNamespaceDefs_.get('DATASTOREType47')
+        if imported_ns_def_ is not None:
+            namespacedef_ = imported_ns_def_
+        if pretty_print:
+            eol_ = '\n'
+        else:
+            eol_ = ''
+        if self.original_tagname_ is not None:
+            name_ = self.original_tagname_
+        showIndent(outfile, level, pretty_print)
+        outfile.write('<%s%s%s' % (namespaceprefix_, name_, namespacedef_ and ' ' + namespacedef_ or '', ))
+        already_processed = set()
+        self.exportAttributes(outfile, level, already_processed, namespaceprefix_, name_='DATASTOREType47')
+        if self.hasContent_():
+            outfile.write('>%s' % (eol_, ))
+            self.exportChildren(outfile, level + 1, namespaceprefix_='', name_='DATASTOREType47', pretty_print=pretty_print)
+            showIndent(outfile, level, pretty_print)
+            outfile.write('</%s%s>%s' % (namespaceprefix_, name_, eol_))
+        else:
+            outfile.write('/>%s' % (eol_, ))
+    def exportAttributes(self, outfile, level, already_processed, namespaceprefix_='', name_='DATASTOREType47'):
+        pass
+    def exportChildren(self, outfile, level, namespaceprefix_='', name_='DATASTOREType47', fromsubclass_=False, pretty_print=True):
+        if pretty_print:
+            eol_ = '\n'
+        else:
+            eol_ = ''
+        if self.ID is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<ID>%s</ID>%s' % (self.gds_encode(self.gds_format_string(quote_xml(self.ID), input_name='ID')), eol_))
+        if self.IMAGES is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<IMAGES>%s</IMAGES>%s' % (self.gds_encode(self.gds_format_string(quote_xml(self.IMAGES), input_name='IMAGES')), eol_))
+        if self.IMAGES_USED is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<IMAGES_USED>%s</IMAGES_USED>%s' % (self.gds_encode(self.gds_format_string(quote_xml(self.IMAGES_USED), input_name='IMAGES_USED')), eol_))
+        if self.SIZE is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<SIZE>%s</SIZE>%s' % (self.gds_encode(self.gds_format_string(quote_xml(self.SIZE), input_name='SIZE')), eol_))
+        if self.SIZE_USED is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<SIZE_USED>%s</SIZE_USED>%s' % (self.gds_encode(self.gds_format_string(quote_xml(self.SIZE_USED), input_name='SIZE_USED')), eol_))
+    def build(self, node):
+        already_processed = set()
+        self.buildAttributes(node, node.attrib, already_processed)
+        for child in node:
+            nodeName_ = Tag_pattern_.match(child.tag).groups()[-1]
+            self.buildChildren(child, node, nodeName_)
+        return self
+    def buildAttributes(self, node, attrs, already_processed):
+        pass
+    def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
+        if nodeName_ == 'ID':
+            ID_ = child_.text
+            ID_ = self.gds_validate_string(ID_, node, 'ID')
+            self.ID = ID_
+        elif nodeName_ == 'IMAGES':
+            IMAGES_ = child_.text
+            IMAGES_ = self.gds_validate_string(IMAGES_, node, 'IMAGES')
+            self.IMAGES = IMAGES_
+        elif nodeName_ == 'IMAGES_USED':
+            IMAGES_USED_ = child_.text
+            IMAGES_USED_ = self.gds_validate_string(IMAGES_USED_, node, 'IMAGES_USED')
+            self.IMAGES_USED = IMAGES_USED_
+        elif nodeName_ == 'SIZE':
+            SIZE_ = child_.text
+            SIZE_ = self.gds_validate_string(SIZE_, node, 'SIZE')
+            self.SIZE = SIZE_
+        elif nodeName_ == 'SIZE_USED':
+            SIZE_USED_ = child_.text
+            SIZE_USED_ = self.gds_validate_string(SIZE_USED_, node, 'SIZE_USED')
+            self.SIZE_USED = SIZE_USED_
+# end class DATASTOREType47
+
+
+class NETWORK_QUOTAType48(GeneratedsSuper):
+    subclass = None
+    superclass = None
+    def __init__(self, NETWORK=None):
+        self.original_tagname_ = None
+        if NETWORK is None:
+            self.NETWORK = []
+        else:
+            self.NETWORK = NETWORK
+    def factory(*args_, **kwargs_):
+        if supermod.CurrentSubclassModule_ is not None:
+            subclass = getSubclassFromModule_(
+                supermod.CurrentSubclassModule_, NETWORK_QUOTAType48)
+            if subclass is not None:
+                return subclass(*args_, **kwargs_)
+        if NETWORK_QUOTAType48.subclass:
+            return NETWORK_QUOTAType48.subclass(*args_, **kwargs_)
+        else:
+            return NETWORK_QUOTAType48(*args_, **kwargs_)
+    factory = staticmethod(factory)
+    def get_NETWORK(self): return self.NETWORK
+    def set_NETWORK(self, NETWORK): self.NETWORK = NETWORK
+    def add_NETWORK(self, value): self.NETWORK.append(value)
+    def insert_NETWORK_at(self, index, value): self.NETWORK.insert(index, value)
+    def replace_NETWORK_at(self, index, value): self.NETWORK[index] = value
+    def hasContent_(self):
+        if (
+            self.NETWORK
+        ):
+            return True
+        else:
+            return False
+    def export(self, outfile, level, namespaceprefix_='', name_='NETWORK_QUOTAType48', namespacedef_='', pretty_print=True):
+        imported_ns_def_ = GenerateDSNamespaceDefs_.get('NETWORK_QUOTAType48')
+        if imported_ns_def_ is not None:
+            namespacedef_ = imported_ns_def_
+        if pretty_print:
+            eol_ = '\n'
+        else:
+            eol_ = ''
+        if self.original_tagname_ is not None:
+            name_ = self.original_tagname_
+        showIndent(outfile, level, pretty_print)
+        outfile.write('<%s%s%s' % (namespaceprefix_, name_, namespacedef_ and ' ' + namespacedef_ or '', ))
+        already_processed = set()
+        self.exportAttributes(outfile, level, already_processed, namespaceprefix_, name_='NETWORK_QUOTAType48')
+        if self.hasContent_():
+            outfile.write('>%s' % (eol_, ))
+            self.exportChildren(outfile, level + 1, namespaceprefix_='', name_='NETWORK_QUOTAType48', pretty_print=pretty_print)
+            showIndent(outfile, level, pretty_print)
+            outfile.write('</%s%s>%s' % (namespaceprefix_, name_, eol_))
+        else:
+            outfile.write('/>%s' % (eol_, ))
+    def exportAttributes(self, outfile, level, already_processed, namespaceprefix_='', name_='NETWORK_QUOTAType48'):
+        pass
+    def exportChildren(self, outfile, level, namespaceprefix_='', name_='NETWORK_QUOTAType48', fromsubclass_=False, pretty_print=True):
+        if pretty_print:
+            eol_ = '\n'
+        else:
+            eol_ = ''
+        for NETWORK_ in self.NETWORK:
+            NETWORK_.export(outfile, level, namespaceprefix_, name_='NETWORK', pretty_print=pretty_print)
+    def build(self, node):
+        already_processed = set()
+        self.buildAttributes(node, node.attrib, already_processed)
+        for child in node:
+            nodeName_ = Tag_pattern_.match(child.tag).groups()[-1]
+            self.buildChildren(child, node, nodeName_)
+        return self
+    def buildAttributes(self, node, attrs, already_processed):
+        pass
+    def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
+        if nodeName_ == 'NETWORK':
+            obj_ = NETWORKType49.factory()
+            obj_.build(child_)
+            self.NETWORK.append(obj_)
+            obj_.original_tagname_ = 'NETWORK'
+# end class NETWORK_QUOTAType48
+
+
+class NETWORKType49(GeneratedsSuper):
+    subclass = None
+    superclass = None
+    def __init__(self, ID=None, LEASES=None, LEASES_USED=None):
+        self.original_tagname_ = None
+        self.ID = ID
+        self.LEASES = LEASES
+        self.LEASES_USED = LEASES_USED
+    def factory(*args_, **kwargs_):
+        if supermod.CurrentSubclassModule_ is not None:
+            subclass = getSubclassFromModule_(
+                supermod.CurrentSubclassModule_, NETWORKType49)
+            if subclass is not None:
+                return subclass(*args_, **kwargs_)
+        if NETWORKType49.subclass:
+            return NETWORKType49.subclass(*args_, **kwargs_)
+        else:
+            return NETWORKType49(*args_, **kwargs_)
+    factory = staticmethod(factory)
+    def get_ID(self): return self.ID
+    def set_ID(self, ID): self.ID = ID
+    def get_LEASES(self): return self.LEASES
+    def set_LEASES(self, LEASES): self.LEASES = LEASES
+    def get_LEASES_USED(self): return self.LEASES_USED
+    def set_LEASES_USED(self, LEASES_USED): self.LEASES_USED = LEASES_USED
+    def hasContent_(self):
+        if (
+            self.ID is not None or
+            self.LEASES is not None or
+            self.LEASES_USED is not None
+        ):
+            return True
+        else:
+            return False
+    def export(self, outfile, level, namespaceprefix_='', name_='NETWORKType49', namespacedef_='', pretty_print=True):
+        imported_ns_def_ = GenerateDSNamespaceDefs_.get('NETWORKType49')
+        if imported_ns_def_ is not None:
+            namespacedef_ = imported_ns_def_
+        if pretty_print:
+            eol_ = '\n'
+        else:
+            eol_ = ''
+        if self.original_tagname_ is not None:
+            name_ = self.original_tagname_
+        showIndent(outfile, level, pretty_print)
+        outfile.write('<%s%s%s' % (namespaceprefix_, name_, namespacedef_ and ' ' + namespacedef_ or '', ))
+        already_processed = set()
+        self.exportAttributes(outfile, level, already_processed, namespaceprefix_, name_='NETWORKType49')
+        if self.hasContent_():
+            outfile.write('>%s' % (eol_, ))
+            self.exportChildren(outfile, level + 1, namespaceprefix_='', name_='NETWORKType49', pretty_print=pretty_print)
+            showIndent(outfile, level, pretty_print)
+            outfile.write('</%s%s>%s' % (namespaceprefix_, name_, eol_))
+        else:
+            outfile.write('/>%s' % (eol_, ))
+    def exportAttributes(self, outfile, level, already_processed, namespaceprefix_='', name_='NETWORKType49'):
+        pass
+    def exportChildren(self, outfile, level, namespaceprefix_='', name_='NETWORKType49', fromsubclass_=False, pretty_print=True):
+        if pretty_print:
+            eol_ = '\n'
+        else:
+            eol_ = ''
+        if self.ID is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<ID>%s</ID>%s' % (self.gds_encode(self.gds_format_string(quote_xml(self.ID), input_name='ID')), eol_))
+        if self.LEASES is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<LEASES>%s</LEASES>%s' % (self.gds_encode(self.gds_format_string(quote_xml(self.LEASES), input_name='LEASES')), eol_))
+        if self.LEASES_USED is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<LEASES_USED>%s</LEASES_USED>%s' % (self.gds_encode(self.gds_format_string(quote_xml(self.LEASES_USED), input_name='LEASES_USED')), eol_))
+    def build(self, node):
+        already_processed = set()
+        self.buildAttributes(node, node.attrib, already_processed)
+        for child in node:
+            nodeName_ = Tag_pattern_.match(child.tag).groups()[-1]
+            self.buildChildren(child, node, nodeName_)
+        return self
+    def buildAttributes(self, node, attrs, already_processed):
+        pass
+    def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
+        if nodeName_ == 'ID':
+            ID_ = child_.text
+            ID_ = self.gds_validate_string(ID_, node, 'ID')
+            self.ID = ID_
+        elif nodeName_ == 'LEASES':
+            LEASES_ = child_.text
+            LEASES_ = self.gds_validate_string(LEASES_, node, 'LEASES')
+            self.LEASES = LEASES_
+        elif nodeName_ == 'LEASES_USED':
+            LEASES_USED_ = child_.text
+            LEASES_USED_ = self.gds_validate_string(LEASES_USED_, node, 'LEASES_USED')
+            self.LEASES_USED = LEASES_USED_
+# end class NETWORKType49
+
+
+class VM_QUOTAType50(GeneratedsSuper):
+    subclass = None
+    superclass = None
+    def __init__(self, VM=None):
+        self.original_tagname_ = None
+        self.VM = VM
+    def factory(*args_, **kwargs_):
+        if supermod.CurrentSubclassModule_ is not None:
+            subclass = getSubclassFromModule_(
+                supermod.CurrentSubclassModule_, VM_QUOTAType50)
+            if subclass is not None:
+                return subclass(*args_, **kwargs_)
+        if VM_QUOTAType50.subclass:
+            return VM_QUOTAType50.subclass(*args_, **kwargs_)
+        else:
+            return VM_QUOTAType50(*args_, **kwargs_)
+    factory = staticmethod(factory)
+    def get_VM(self): return self.VM
+    def set_VM(self, VM): self.VM = VM
+    def hasContent_(self):
+        if (
+            self.VM is not None
+        ):
+            return True
+        else:
+            return False
+    def export(self, outfile, level, namespaceprefix_='', name_='VM_QUOTAType50', namespacedef_='', pretty_print=True):
+        imported_ns_def_ = GenerateDSNamespaceDefs_.get('VM_QUOTAType50')
+        if imported_ns_def_ is not None:
+            namespacedef_ = imported_ns_def_
+        if pretty_print:
+            eol_ = '\n'
+        else:
+            eol_ = ''
+        if self.original_tagname_ is not None:
+            name_ = self.original_tagname_
+        showIndent(outfile, level, pretty_print)
+        outfile.write('<%s%s%s' % (namespaceprefix_, name_, namespacedef_ and ' ' + namespacedef_ or '', ))
+        already_processed = set()
+        self.exportAttributes(outfile, level, already_processed, namespaceprefix_, name_='VM_QUOTAType50')
+        if self.hasContent_():
+            outfile.write('>%s' % (eol_, ))
+            self.exportChildren(outfile, level + 1, namespaceprefix_='', name_='VM_QUOTAType50', pretty_print=pretty_print)
+            showIndent(outfile, level, pretty_print)
+            outfile.write('</%s%s>%s' % (namespaceprefix_, name_, eol_))
+        else:
+            outfile.write('/>%s' % (eol_, ))
+    def exportAttributes(self, outfile, level, already_processed, namespaceprefix_='', name_='VM_QUOTAType50'):
+        pass
+    def exportChildren(self, outfile, level, namespaceprefix_='', name_='VM_QUOTAType50', fromsubclass_=False, pretty_print=True):
+        if pretty_print:
+            eol_ = '\n'
+        else:
+            eol_ = ''
+        if self.VM is not None:
+            self.VM.export(outfile, level, namespaceprefix_, name_='VM', pretty_print=pretty_print)
+    def build(self, node):
+        already_processed = set()
+        self.buildAttributes(node, node.attrib, already_processed)
+        for child in node:
+            nodeName_ = Tag_pattern_.match(child.tag).groups()[-1]
+            self.buildChildren(child, node, nodeName_)
+        return self
+    def buildAttributes(self, node, attrs, already_processed):
+        pass
+    def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
+        if nodeName_ == 'VM':
+            obj_ = VMType51.factory()
+            obj_.build(child_)
+            self.VM = obj_
+            obj_.original_tagname_ = 'VM'
+# end class VM_QUOTAType50
+
+
+class VMType51(GeneratedsSuper):
+    subclass = None
+    superclass = None
+    def __init__(self, CPU=None, CPU_USED=None, MEMORY=None, MEMORY_USED=None, SYSTEM_DISK_SIZE=None, SYSTEM_DISK_SIZE_USED=None, VMS=None, VMS_USED=None):
+        self.original_tagname_ = None
+        self.CPU = CPU
+        self.CPU_USED = CPU_USED
+        self.MEMORY = MEMORY
+        self.MEMORY_USED = MEMORY_USED
+        self.SYSTEM_DISK_SIZE = SYSTEM_DISK_SIZE
+        self.SYSTEM_DISK_SIZE_USED = SYSTEM_DISK_SIZE_USED
+        self.VMS = VMS
+        self.VMS_USED = VMS_USED
+    def factory(*args_, **kwargs_):
+        if supermod.CurrentSubclassModule_ is not None:
+            subclass = getSubclassFromModule_(
+                supermod.CurrentSubclassModule_, VMType51)
+            if subclass is not None:
+                return subclass(*args_, **kwargs_)
+        if VMType51.subclass:
+            return VMType51.subclass(*args_, **kwargs_)
+        else:
+            return VMType51(*args_, **kwargs_)
+    factory = staticmethod(factory)
+    def get_CPU(self): return self.CPU
+    def set_CPU(self, CPU): self.CPU = CPU
+    def get_CPU_USED(self): return self.CPU_USED
+    def set_CPU_USED(self, CPU_USED): self.CPU_USED = CPU_USED
+    def get_MEMORY(self): return self.MEMORY
+    def set_MEMORY(self, MEMORY): self.MEMORY = MEMORY
+    def get_MEMORY_USED(self): return self.MEMORY_USED
+    def set_MEMORY_USED(self, MEMORY_USED): self.MEMORY_USED = MEMORY_USED
+    def get_SYSTEM_DISK_SIZE(self): return self.SYSTEM_DISK_SIZE
+    def set_SYSTEM_DISK_SIZE(self, SYSTEM_DISK_SIZE): self.SYSTEM_DISK_SIZE = SYSTEM_DISK_SIZE
+    def get_SYSTEM_DISK_SIZE_USED(self): return self.SYSTEM_DISK_SIZE_USED
+    def set_SYSTEM_DISK_SIZE_USED(self, SYSTEM_DISK_SIZE_USED): self.SYSTEM_DISK_SIZE_USED = SYSTEM_DISK_SIZE_USED
+    def get_VMS(self): return self.VMS
+    def set_VMS(self, VMS): self.VMS = VMS
+    def get_VMS_USED(self): return self.VMS_USED
+    def set_VMS_USED(self, VMS_USED): self.VMS_USED = VMS_USED
+    def hasContent_(self):
+        if (
+            self.CPU is not None or
+            self.CPU_USED is not None or
+            self.MEMORY is not None or
+            self.MEMORY_USED is not None or
+            self.SYSTEM_DISK_SIZE is not None or
+            self.SYSTEM_DISK_SIZE_USED is not None or
+            self.VMS is not None or
+            self.VMS_USED is not None
+        ):
+            return True
+        else:
+            return False
+    def export(self, outfile, level, namespaceprefix_='', name_='VMType51', namespacedef_='', pretty_print=True):
+        imported_ns_def_ = GenerateDSNamespaceDefs_.get('VMType51')
+        if imported_ns_def_ is not None:
+            namespacedef_ = imported_ns_def_
+        if pretty_print:
+            eol_ = '\n'
+        else:
+            eol_ = ''
+        if self.original_tagname_ is not None:
+            name_ = self.original_tagname_
+        showIndent(outfile, level, pretty_print)
+        outfile.write('<%s%s%s' % (namespaceprefix_, name_, namespacedef_ and ' ' + namespacedef_ or '', ))
+        already_processed = set()
+        self.exportAttributes(outfile, level, already_processed, namespaceprefix_, name_='VMType51')
+        if self.hasContent_():
+            outfile.write('>%s' % (eol_, ))
+            self.exportChildren(outfile, level + 1, namespaceprefix_='', name_='VMType51', pretty_print=pretty_print)
+            showIndent(outfile, level, pretty_print)
+            outfile.write('</%s%s>%s' % (namespaceprefix_, name_, eol_))
+        else:
+            outfile.write('/>%s' % (eol_, ))
+    def exportAttributes(self, outfile, level, already_processed, namespaceprefix_='', name_='VMType51'):
+        pass
+    def exportChildren(self, outfile, level, namespaceprefix_='', name_='VMType51', fromsubclass_=False, pretty_print=True):
+        if pretty_print:
+            eol_ = '\n'
+        else:
+            eol_ = ''
+        if self.CPU is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<CPU>%s</CPU>%s' % (self.gds_encode(self.gds_format_string(quote_xml(self.CPU), input_name='CPU')), eol_))
+        if self.CPU_USED is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<CPU_USED>%s</CPU_USED>%s' % (self.gds_encode(self.gds_format_string(quote_xml(self.CPU_USED), input_name='CPU_USED')), eol_))
+        if self.MEMORY is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<MEMORY>%s</MEMORY>%s' % (self.gds_encode(self.gds_format_string(quote_xml(self.MEMORY), input_name='MEMORY')), eol_))
+        if self.MEMORY_USED is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<MEMORY_USED>%s</MEMORY_USED>%s' % (self.gds_encode(self.gds_format_string(quote_xml(self.MEMORY_USED), input_name='MEMORY_USED')), eol_))
+        if self.SYSTEM_DISK_SIZE is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<SYSTEM_DISK_SIZE>%s</SYSTEM_DISK_SIZE>%s' % (self.gds_encode(self.gds_format_string(quote_xml(self.SYSTEM_DISK_SIZE), input_name='SYSTEM_DISK_SIZE')), eol_))
+        if self.SYSTEM_DISK_SIZE_USED is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<SYSTEM_DISK_SIZE_USED>%s</SYSTEM_DISK_SIZE_USED>%s' % (self.gds_encode(self.gds_format_string(quote_xml(self.SYSTEM_DISK_SIZE_USED), input_name='SYSTEM_DISK_SIZE_USED')), eol_))
+        if self.VMS is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<VMS>%s</VMS>%s' % (self.gds_encode(self.gds_format_string(quote_xml(self.VMS), input_name='VMS')), eol_))
+        if self.VMS_USED is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<VMS_USED>%s</VMS_USED>%s' % (self.gds_encode(self.gds_format_string(quote_xml(self.VMS_USED), input_name='VMS_USED')), eol_))
+    def build(self, node):
+        already_processed = set()
+        self.buildAttributes(node, node.attrib, already_processed)
+        for child in node:
+            nodeName_ = Tag_pattern_.match(child.tag).groups()[-1]
+            self.buildChildren(child, node, nodeName_)
+        return self
+    def buildAttributes(self, node, attrs, already_processed):
+        pass
+    def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
+        if nodeName_ == 'CPU':
+            CPU_ = child_.text
+            CPU_ = self.gds_validate_string(CPU_, node, 'CPU')
+            self.CPU = CPU_
+        elif nodeName_ == 'CPU_USED':
+            CPU_USED_ = child_.text
+            CPU_USED_ = self.gds_validate_string(CPU_USED_, node, 'CPU_USED')
+            self.CPU_USED = CPU_USED_
+        elif nodeName_ == 'MEMORY':
+            MEMORY_ = child_.text
+            MEMORY_ = self.gds_validate_string(MEMORY_, node, 'MEMORY')
+            self.MEMORY = MEMORY_
+        elif nodeName_ == 'MEMORY_USED':
+            MEMORY_USED_ = child_.text
+            MEMORY_USED_ = self.gds_validate_string(MEMORY_USED_, node, 'MEMORY_USED')
+            self.MEMORY_USED = MEMORY_USED_
+        elif nodeName_ == 'SYSTEM_DISK_SIZE':
+            SYSTEM_DISK_SIZE_ = child_.text
+            SYSTEM_DISK_SIZE_ = self.gds_validate_string(SYSTEM_DISK_SIZE_, node, 'SYSTEM_DISK_SIZE')
+            self.SYSTEM_DISK_SIZE = SYSTEM_DISK_SIZE_
+        elif nodeName_ == 'SYSTEM_DISK_SIZE_USED':
+            SYSTEM_DISK_SIZE_USED_ = child_.text
+            SYSTEM_DISK_SIZE_USED_ = self.gds_validate_string(SYSTEM_DISK_SIZE_USED_, node, 'SYSTEM_DISK_SIZE_USED')
+            self.SYSTEM_DISK_SIZE_USED = SYSTEM_DISK_SIZE_USED_
+        elif nodeName_ == 'VMS':
+            VMS_ = child_.text
+            VMS_ = self.gds_validate_string(VMS_, node, 'VMS')
+            self.VMS = VMS_
+        elif nodeName_ == 'VMS_USED':
+            VMS_USED_ = child_.text
+            VMS_USED_ = self.gds_validate_string(VMS_USED_, node, 'VMS_USED')
+            self.VMS_USED = VMS_USED_
+# end class VMType51
+
+
+class IMAGE_QUOTAType52(GeneratedsSuper):
+    subclass = None
+    superclass = None
+    def __init__(self, IMAGE=None):
+        self.original_tagname_ = None
+        if IMAGE is None:
+            self.IMAGE = []
+        else:
+            self.IMAGE = IMAGE
+    def factory(*args_, **kwargs_):
+        if supermod.CurrentSubclassModule_ is not None:
+            subclass = getSubclassFromModule_(
+                supermod.CurrentSubclassModule_, IMAGE_QUOTAType52)
+            if subclass is not None:
+                return subclass(*args_, **kwargs_)
+        if IMAGE_QUOTAType52.subclass:
+            return IMAGE_QUOTAType52.subclass(*args_, **kwargs_)
+        else:
+            return IMAGE_QUOTAType52(*args_, **kwargs_)
+    factory = staticmethod(factory)
+    def get_IMAGE(self): return self.IMAGE
+    def set_IMAGE(self, IMAGE): self.IMAGE = IMAGE
+    def add_IMAGE(self, value): self.IMAGE.append(value)
+    def insert_IMAGE_at(self, index, value): self.IMAGE.insert(index, value)
+    def replace_IMAGE_at(self, index, value): self.IMAGE[index] = value
+    def hasContent_(self):
+        if (
+            self.IMAGE
+        ):
+            return True
+        else:
+            return False
+    def export(self, outfile, level, namespaceprefix_='', name_='IMAGE_QUOTAType52', namespacedef_='', pretty_print=True):
+        imported_ns_def_ = GenerateDSNamespaceDefs_.get('IMAGE_QUOTAType52')
+        if imported_ns_def_ is not None:
+            namespacedef_ = imported_ns_def_
+        if pretty_print:
+            eol_ = '\n'
+        else:
+            eol_ = ''
+        if self.original_tagname_ is not None:
+            name_ = self.original_tagname_
+        showIndent(outfile, level, pretty_print)
+        outfile.write('<%s%s%s' % (namespaceprefix_, name_, namespacedef_ and ' ' + namespacedef_ or '', ))
+        already_processed = set()
+        self.exportAttributes(outfile, level, already_processed, namespaceprefix_, name_='IMAGE_QUOTAType52')
+        if self.hasContent_():
+            outfile.write('>%s' % (eol_, ))
+            self.exportChildren(outfile, level + 1, namespaceprefix_='', name_='IMAGE_QUOTAType52', pretty_print=pretty_print)
+            showIndent(outfile, level, pretty_print)
+            outfile.write('</%s%s>%s' % (namespaceprefix_, name_, eol_))
+        else:
+            outfile.write('/>%s' % (eol_, ))
+    def exportAttributes(self, outfile, level, already_processed, namespaceprefix_='', name_='IMAGE_QUOTAType52'):
+        pass
+    def exportChildren(self, outfile, level, namespaceprefix_='', name_='IMAGE_QUOTAType52', fromsubclass_=False, pretty_print=True):
+        if pretty_print:
+            eol_ = '\n'
+        else:
+            eol_ = ''
+        for IMAGE_ in self.IMAGE:
+            IMAGE_.export(outfile, level, namespaceprefix_, name_='IMAGE', pretty_print=pretty_print)
+    def build(self, node):
+        already_processed = set()
+        self.buildAttributes(node, node.attrib, already_processed)
+        for child in node:
+            nodeName_ = Tag_pattern_.match(child.tag).groups()[-1]
+            self.buildChildren(child, node, nodeName_)
+        return self
+    def buildAttributes(self, node, attrs, already_processed):
+        pass
+    def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
+        if nodeName_ == 'IMAGE':
+            obj_ = IMAGEType53.factory()
+            obj_.build(child_)
+            self.IMAGE.append(obj_)
+            obj_.original_tagname_ = 'IMAGE'
+# end class IMAGE_QUOTAType52
+
+
+class IMAGEType53(GeneratedsSuper):
+    subclass = None
+    superclass = None
+    def __init__(self, ID=None, RVMS=None, RVMS_USED=None):
+        self.original_tagname_ = None
+        self.ID = ID
+        self.RVMS = RVMS
+        self.RVMS_USED = RVMS_USED
+    def factory(*args_, **kwargs_):
+        if supermod.CurrentSubclassModule_ is not None:
+            subclass = getSubclassFromModule_(
+                supermod.CurrentSubclassModule_, IMAGEType53)
+            if subclass is not None:
+                return subclass(*args_, **kwargs_)
+        if IMAGEType53.subclass:
+            return IMAGEType53.subclass(*args_, **kwargs_)
+        else:
+            return IMAGEType53(*args_, **kwargs_)
+    factory = staticmethod(factory)
+    def get_ID(self): return self.ID
+    def set_ID(self, ID): self.ID = ID
+    def get_RVMS(self): return self.RVMS
+    def set_RVMS(self, RVMS): self.RVMS = RVMS
+    def get_RVMS_USED(self): return self.RVMS_USED
+    def set_RVMS_USED(self, RVMS_USED): self.RVMS_USED = RVMS_USED
+    def hasContent_(self):
+        if (
+            self.ID is not None or
+            self.RVMS is not None or
+            self.RVMS_USED is not None
+        ):
+            return True
+        else:
+            return False
+    def export(self, outfile, level, namespaceprefix_='', name_='IMAGEType53', namespacedef_='', pretty_print=True):
+        imported_ns_def_ = GenerateDSNamespaceDefs_.get('IMAGEType53')
+        if imported_ns_def_ is not None:
+            namespacedef_ = imported_ns_def_
+        if pretty_print:
+            eol_ = '\n'
+        else:
+            eol_ = ''
+        if self.original_tagname_ is not None:
+            name_ = self.original_tagname_
+        showIndent(outfile, level, pretty_print)
+        outfile.write('<%s%s%s' % (namespaceprefix_, name_, namespacedef_ and ' ' + namespacedef_ or '', ))
+        already_processed = set()
+        self.exportAttributes(outfile, level, already_processed, namespaceprefix_, name_='IMAGEType53')
+        if self.hasContent_():
+            outfile.write('>%s' % (eol_, ))
+            self.exportChildren(outfile, level + 1, namespaceprefix_='', name_='IMAGEType53', pretty_print=pretty_print)
+            showIndent(outfile, level, pretty_print)
+            outfile.write('</%s%s>%s' % (namespaceprefix_, name_, eol_))
+        else:
+            outfile.write('/>%s' % (eol_, ))
+    def exportAttributes(self, outfile, level, already_processed, namespaceprefix_='', name_='IMAGEType53'):
+        pass
+    def exportChildren(self, outfile, level, namespaceprefix_='', name_='IMAGEType53', fromsubclass_=False, pretty_print=True):
+        if pretty_print:
+            eol_ = '\n'
+        else:
+            eol_ = ''
+        if self.ID is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<ID>%s</ID>%s' % (self.gds_encode(self.gds_format_string(quote_xml(self.ID), input_name='ID')), eol_))
+        if self.RVMS is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<RVMS>%s</RVMS>%s' % (self.gds_encode(self.gds_format_string(quote_xml(self.RVMS), input_name='RVMS')), eol_))
+        if self.RVMS_USED is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<RVMS_USED>%s</RVMS_USED>%s' % (self.gds_encode(self.gds_format_string(quote_xml(self.RVMS_USED), input_name='RVMS_USED')), eol_))
+    def build(self, node):
+        already_processed = set()
+        self.buildAttributes(node, node.attrib, already_processed)
+        for child in node:
+            nodeName_ = Tag_pattern_.match(child.tag).groups()[-1]
+            self.buildChildren(child, node, nodeName_)
+        return self
+    def buildAttributes(self, node, attrs, already_processed):
+        pass
+    def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
+        if nodeName_ == 'ID':
+            ID_ = child_.text
+            ID_ = self.gds_validate_string(ID_, node, 'ID')
+            self.ID = ID_
+        elif nodeName_ == 'RVMS':
+            RVMS_ = child_.text
+            RVMS_ = self.gds_validate_string(RVMS_, node, 'RVMS')
+            self.RVMS = RVMS_
+        elif nodeName_ == 'RVMS_USED':
+            RVMS_USED_ = child_.text
+            RVMS_USED_ = self.gds_validate_string(RVMS_USED_, node, 'RVMS_USED')
+            self.RVMS_USED = RVMS_USED_
+# end class IMAGEType53
+
+
+class USER_POOLSub(TemplatedType, USER_POOL):
+    def __init__(self, USER=None, QUOTAS=None, DEFAULT_USER_QUOTAS=None):
+        super(USER_POOLSub, self).__init__(USER, QUOTAS, DEFAULT_USER_QUOTAS, )
+USER_POOL.subclass = USER_POOLSub
+# end class USER_POOLSub
+
+
+class USERTypeSub(TemplatedType, USERType):
+    def __init__(self, ID=None, GID=None, GROUPS=None, GNAME=None, NAME=None, PASSWORD=None, AUTH_DRIVER=None, ENABLED=None, LOGIN_TOKEN=None, TEMPLATE=None):
+        super(USERTypeSub, self).__init__(ID, GID, GROUPS, GNAME, NAME, PASSWORD, AUTH_DRIVER, ENABLED, LOGIN_TOKEN, TEMPLATE, )
+USERType.subclass = USERTypeSub
+# end class USERTypeSub
+
+
+class GROUPSTypeSub(TemplatedType, GROUPSType):
+    def __init__(self, ID=None):
+        super(GROUPSTypeSub, self).__init__(ID, )
+GROUPSType.subclass = GROUPSTypeSub
+# end class GROUPSTypeSub
+
+
+class LOGIN_TOKENTypeSub(TemplatedType, LOGIN_TOKENType):
+    def __init__(self, TOKEN=None, EXPIRATION_TIME=None, EGID=None):
+        super(LOGIN_TOKENTypeSub, self).__init__(TOKEN, EXPIRATION_TIME, EGID, )
+LOGIN_TOKENType.subclass = LOGIN_TOKENTypeSub
+# end class LOGIN_TOKENTypeSub
+
+
+class QUOTASType37Sub(TemplatedType, QUOTASType37):
+    def __init__(self, ID=None, DATASTORE_QUOTA=None, NETWORK_QUOTA=None, VM_QUOTA=None, IMAGE_QUOTA=None):
+        super(QUOTASType37Sub, self).__init__(ID, DATASTORE_QUOTA, NETWORK_QUOTA, VM_QUOTA, IMAGE_QUOTA, )
+QUOTASType37.subclass = QUOTASType37Sub
+# end class QUOTASType37Sub
+
+
+class DATASTORE_QUOTAType38Sub(TemplatedType, DATASTORE_QUOTAType38):
+    def __init__(self, DATASTORE=None):
+        super(DATASTORE_QUOTAType38Sub, self).__init__(DATASTORE, )
+DATASTORE_QUOTAType38.subclass = DATASTORE_QUOTAType38Sub
+# end class DATASTORE_QUOTAType38Sub
+
+
+class DATASTOREType39Sub(TemplatedType, DATASTOREType39):
+    def __init__(self, ID=None, IMAGES=None, IMAGES_USED=None, SIZE=None, SIZE_USED=None):
+        super(DATASTOREType39Sub, self).__init__(ID, IMAGES, IMAGES_USED, SIZE, SIZE_USED, )
+DATASTOREType39.subclass = DATASTOREType39Sub
+# end class DATASTOREType39Sub
+
+
+class NETWORK_QUOTAType40Sub(TemplatedType, NETWORK_QUOTAType40):
+    def __init__(self, NETWORK=None):
+        super(NETWORK_QUOTAType40Sub, self).__init__(NETWORK, )
+NETWORK_QUOTAType40.subclass = NETWORK_QUOTAType40Sub
+# end class NETWORK_QUOTAType40Sub
+
+
+class NETWORKType41Sub(TemplatedType, NETWORKType41):
+    def __init__(self, ID=None, LEASES=None, LEASES_USED=None):
+        super(NETWORKType41Sub, self).__init__(ID, LEASES, LEASES_USED, )
+NETWORKType41.subclass = NETWORKType41Sub
+# end class NETWORKType41Sub
+
+
+class VM_QUOTAType42Sub(TemplatedType, VM_QUOTAType42):
+    def __init__(self, VM=None):
+        super(VM_QUOTAType42Sub, self).__init__(VM, )
+VM_QUOTAType42.subclass = VM_QUOTAType42Sub
+# end class VM_QUOTAType42Sub
+
+
+class VMType43Sub(TemplatedType, VMType43):
+    def __init__(self, CPU=None, CPU_USED=None, MEMORY=None, MEMORY_USED=None, SYSTEM_DISK_SIZE=None, SYSTEM_DISK_SIZE_USED=None, VMS=None, VMS_USED=None):
+        super(VMType43Sub, self).__init__(CPU, CPU_USED, MEMORY, MEMORY_USED, SYSTEM_DISK_SIZE, SYSTEM_DISK_SIZE_USED, VMS, VMS_USED, )
+VMType43.subclass = VMType43Sub
+# end class VMType43Sub
+
+
+class IMAGE_QUOTAType44Sub(TemplatedType, IMAGE_QUOTAType44):
+    def __init__(self, IMAGE=None):
+        super(IMAGE_QUOTAType44Sub, self).__init__(IMAGE, )
+IMAGE_QUOTAType44.subclass = IMAGE_QUOTAType44Sub
+# end class IMAGE_QUOTAType44Sub
+
+
+class IMAGEType45Sub(TemplatedType, IMAGEType45):
+    def __init__(self, ID=None, RVMS=None, RVMS_USED=None):
+        super(IMAGEType45Sub, self).__init__(ID, RVMS, RVMS_USED, )
+IMAGEType45.subclass = IMAGEType45Sub
+# end class IMAGEType45Sub
+
+
+class DEFAULT_USER_QUOTASTypeSub(TemplatedType, DEFAULT_USER_QUOTASType):
+    def __init__(self, DATASTORE_QUOTA=None, NETWORK_QUOTA=None, VM_QUOTA=None, IMAGE_QUOTA=None):
+        super(DEFAULT_USER_QUOTASTypeSub, self).__init__(DATASTORE_QUOTA, NETWORK_QUOTA, VM_QUOTA, IMAGE_QUOTA, )
+DEFAULT_USER_QUOTASType.subclass = DEFAULT_USER_QUOTASTypeSub
+# end class DEFAULT_USER_QUOTASTypeSub
+
+
+class DATASTORE_QUOTAType46Sub(TemplatedType, DATASTORE_QUOTAType46):
+    def __init__(self, DATASTORE=None):
+        super(DATASTORE_QUOTAType46Sub, self).__init__(DATASTORE, )
+DATASTORE_QUOTAType46.subclass = DATASTORE_QUOTAType46Sub
+# end class DATASTORE_QUOTAType46Sub
+
+
+class DATASTOREType47Sub(TemplatedType, DATASTOREType47):
+    def __init__(self, ID=None, IMAGES=None, IMAGES_USED=None, SIZE=None, SIZE_USED=None):
+        super(DATASTOREType47Sub, self).__init__(ID, IMAGES, IMAGES_USED, SIZE, SIZE_USED, )
+DATASTOREType47.subclass = DATASTOREType47Sub
+# end class DATASTOREType47Sub
+
+
+class NETWORK_QUOTAType48Sub(TemplatedType, NETWORK_QUOTAType48):
+    def __init__(self, NETWORK=None):
+        super(NETWORK_QUOTAType48Sub, self).__init__(NETWORK, )
+NETWORK_QUOTAType48.subclass = NETWORK_QUOTAType48Sub
+# end class NETWORK_QUOTAType48Sub
+
+
+class NETWORKType49Sub(TemplatedType, NETWORKType49):
+    def __init__(self, ID=None, LEASES=None, LEASES_USED=None):
+        super(NETWORKType49Sub, self).__init__(ID, LEASES, LEASES_USED, )
+NETWORKType49.subclass = NETWORKType49Sub
+# end class NETWORKType49Sub
+
+
+class VM_QUOTAType50Sub(TemplatedType, VM_QUOTAType50):
+    def __init__(self, VM=None):
+        super(VM_QUOTAType50Sub, self).__init__(VM, )
+VM_QUOTAType50.subclass = VM_QUOTAType50Sub
+# end class VM_QUOTAType50Sub
+
+
+class VMType51Sub(TemplatedType, VMType51):
+    def __init__(self, CPU=None, CPU_USED=None, MEMORY=None, MEMORY_USED=None, SYSTEM_DISK_SIZE=None, SYSTEM_DISK_SIZE_USED=None, VMS=None, VMS_USED=None):
+        super(VMType51Sub, self).__init__(CPU, CPU_USED, MEMORY, MEMORY_USED, SYSTEM_DISK_SIZE, SYSTEM_DISK_SIZE_USED, VMS, VMS_USED, )
+VMType51.subclass = VMType51Sub
+# end class VMType51Sub
+
+
+class IMAGE_QUOTAType52Sub(TemplatedType, IMAGE_QUOTAType52):
+    def __init__(self, IMAGE=None):
+        super(IMAGE_QUOTAType52Sub, self).__init__(IMAGE, )
+IMAGE_QUOTAType52.subclass = IMAGE_QUOTAType52Sub
+# end class IMAGE_QUOTAType52Sub
+
+
+class IMAGEType53Sub(TemplatedType, IMAGEType53):
+    def __init__(self, ID=None, RVMS=None, RVMS_USED=None):
+        super(IMAGEType53Sub, self).__init__(ID, RVMS, RVMS_USED, )
+IMAGEType53.subclass = IMAGEType53Sub
+# end class IMAGEType53Sub
+
+
@@ -0,0 +1,1116 @@
+#!/usr/bin/env python
+
+#
+# Bindings of VDC_POOL, VDC, generated by generateDS.py and split from supbind by src/split_bindings.py
+#
+
+import sys
+import re as re_
+import base64
+import datetime as datetime_
+import warnings as warnings_
+try:
+    from lxml import etree as etree_
+except ImportError:
+    from xml.etree import ElementTree as etree_
+from pyone.util import TemplatedType
+from . import supbind as supermod
+from .supbind import (
+    GenerateDSNamespaceDefs_,
+    GeneratedsSuper,
+    Tag_pattern_,
+    getSubclassFromModule_,
+    quote_xml,
+    raise_parse_error,
+    showIndent,
+)
+
+
+class VDC_POOL(GeneratedsSuper):
+    subclass = None
+    superclass = None
+    def __init__(self, VDC=None):
+        self.original_tagname_ = None
+        if VDC is None:
+            self.VDC = []
+        else:
+            self.VDC = VDC
+    def factory(*args_, **kwargs_):
+        if supermod.CurrentSubclassModule_ is not None:
+            subclass = getSubclassFromModule_(
+                supermod.CurrentSubclassModule_, VDC_POOL)
+            if subclass is not None:
+                return subclass(*args_, **kwargs_)
+        if VDC_POOL.subclass:
+            return VDC_POOL.subclass(*args_, **kwargs_)
+        else:
+            return VDC_POOL(*args_, **kwargs_)
+    factory = staticmethod(factory)
+    def get_VDC(self): return self.VDC
+    def set_VDC(self, VDC): self.VDC = VDC
+    def add_VDC(self, value): self.VDC.append(value)
+    def insert_VDC_at(self, index, value): self.VDC.insert(index, value)
+    def replace_VDC_at(self, index, value): self.VDC[index] = value
+    def hasContent_(self):
+        if (
+            self.VDC
+        ):
+            return True
+        else:
+            return False
+    def export(self, outfile, level, namespaceprefix_='', name_='VDC_POOL', namespacedef_='', pretty_print=True):
+        imported_ns_def_ = GenerateDSNamespaceDefs_.get('VDC_POOL')
+        if imported_ns_def_ is not None:
+            namespacedef_ = imported_ns_def_
+        if pretty_print:
+            eol_ = '\n'
+        else:
+            eol_ = ''
+        if self.original_tagname_ is not None:
+            name_ = self.original_tagname_
+        showIndent(outfile, level, pretty_print)
+        outfile.write('<%s%s%s' % (namespaceprefix_, name_, namespacedef_ and ' ' + namespacedef_ or '', ))
+        already_processed = set()
+        self.exportAttributes(outfile, level, already_processed, namespaceprefix_, name_='VDC_POOL')
+        if self.hasContent_():
+            outfile.write('>%s' % (eol_, ))
+            self.exportChildren(outfile, level + 1, namespaceprefix_='', name_='VDC_POOL', pretty_print=pretty_print)
+            showIndent(outfile, level, pretty_print)
+            outfile.write('</%s%s>%s' % (namespaceprefix_, name_, eol_))
+        else:
+            outfile.write('/>%s' % (eol_, ))
+    def exportAttributes(self, outfile, level, already_processed, namespaceprefix_='', name_='VDC_POOL'):
+        pass
+    def exportChildren(self, outfile, level, namespaceprefix_='', name_='VDC_POOL', fromsubclass_=False, pretty_print=True):
+        if pretty_print:
+            eol_ = '\n'
+        else:
+            eol_ = ''
+        for VDC_ in self.VDC:
+            VDC_.export(outfile, level, namespaceprefix_, name_='VDC', pretty_print=pretty_print)
+    def build(self, node):
+        already_processed = set()
+        self.buildAttributes(node, node.attrib, already_processed)
+        for child in node:
+            nodeName_ = Tag_pattern_.match(child.tag).groups()[-1]
+            self.buildChildren(child, node, nodeName_)
+        return self
+    def buildAttributes(self, node, attrs, already_processed):
+        pass
+    def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
+        if nodeName_ == 'VDC':
+            obj_ = VDC.factory()
+            obj_.build(child_)
+            self.VDC.append(obj_)
+            obj_.original_tagname_ = 'VDC'
+# end class VDC_POOL
+
+
+class VDC(GeneratedsSuper):
+    subclass = None
+    superclass = None
+    def __init__(self, ID=None, NAME=None, GROUPS=None, CLUSTERS=None, HOSTS=None, DATASTORES=None, VNETS=None, TEMPLATE=None):
+        self.original_tagname_ = None
+        self.ID = ID
+        self.NAME = NAME
+        self.GROUPS = GROUPS
+        self.CLUSTERS = CLUSTERS
+        self.HOSTS = HOSTS
+        self.DATASTORES = DATASTORES
+        self.VNETS = VNETS
+        self.TEMPLATE = TEMPLATE
+    def factory(*args_, **kwargs_):
+        if supermod.CurrentSubclassModule_ is not None:
+            subclass = getSubclassFromModule_(
+                supermod.CurrentSubclassModule_, VDC)
+            if subclass is not None:
+                return subclass(*args_, **kwargs_)
+        if VDC.subclass:
+            return VDC.subclass(*args_, **kwargs_)
+        else:
+            return VDC(*args_, **kwargs_)
+    factory = staticmethod(factory)
+    def get_ID(self): return self.ID
+    def set_ID(self, ID): self.ID = ID
+    def get_NAME(self): return self.NAME
+    def set_NAME(self, NAME): self.NAME = NAME
+    def get_GROUPS(self): return self.GROUPS
+    def set_GROUPS(self, GROUPS): self.GROUPS = GROUPS
+    def get_CLUSTERS(self): return self.CLUSTERS
+    def set_CLUSTERS(self, CLUSTERS): self.CLUSTERS = CLUSTERS
+    def get_HOSTS(self): return self.HOSTS
+    def set_HOSTS(self, HOSTS): self.HOSTS = HOSTS
+    def get_DATASTORES(self): return self.DATASTORES
+    def set_DATASTORES(self, DATASTORES): self.DATASTORES = DATASTORES
+    def get_VNETS(self): return self.VNETS
+    def set_VNETS(self, VNETS): self.VNETS = VNETS
+    def get_TEMPLATE(self): return self.TEMPLATE
+    def set_TEMPLATE(self, TEMPLATE): self.TEMPLATE = TEMPLATE
+    def hasContent_(self):
+        if (
+            self.ID is not None or
+            self.NAME is not None or
+            self.GROUPS is not None or
+            self.CLUSTERS is not None or
+            self.HOSTS is not None or
+            self.DATASTORES is not None or
+            self.VNETS is not None or
+            self.TEMPLATE is not None
+        ):
+            return True
+        else:
+            return False
+    def export(self, outfile, level, namespaceprefix_='', name_='VDC', namespacedef_='', pretty_print=True):
+        imported_ns_def_ = GenerateDSNamespaceDefs_.get('VDC')
+        if imported_ns_def_ is not None:
+            namespacedef_ = imported_ns_def_
+        if pretty_print:
+            eol_ = '\n'
+        else:
+            eol_ = ''
+        if self.original_tagname_ is not None:
+            name_ = self.original_tagname_
+        showIndent(outfile, level, pretty_print)
+        outfile.write('<%s%s%s' % (namespaceprefix_, name_, namespacedef_ and ' ' + namespacedef_ or '', ))
+        already_processed = set()
+        self.exportAttributes(outfile, level, already_processed, namespaceprefix_, name_='VDC')
+        if self.hasContent_():
+            outfile.write('>%s' % (eol_, ))
+            self.exportChildren(outfile, level + 1, namespaceprefix_='', name_='VDC', pretty_print=pretty_print)
+            showIndent(outfile, level, pretty_print)
+            outfile.write('</%s%s>%s' % (namespaceprefix_, name_, eol_))
+        else:
+            outfile.write('/>%s' % (eol_, ))
+    def exportAttributes(self, outfile, level, already_processed, namespaceprefix_='', name_='VDC'):
+        pass
+    def exportChildren(self, outfile, level, namespaceprefix_='', name_='VDC', fromsubclass_=False, pretty_print=True):
+        if pretty_print:
+            eol_ = '\n'
+        else:
+            eol_ = ''
+        if self.ID is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<ID>%s</ID>%s' % (self.gds_format_integer(self.ID, input_name='ID'), eol_))
+        if self.NAME is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<NAME>%s</NAME>%s' % (self.gds_encode(self.gds_format_string(quote_xml(self.NAME), input_name='NAME')), eol_))
+        if self.GROUPS is not None:
+            self.GROUPS.export(outfile, level, namespaceprefix_, name_='GROUPS', pretty_print=pretty_print)
+        if self.CLUSTERS is not None:
+            self.CLUSTERS.export(outfile, level, namespaceprefix_, name_='CLUSTERS', pretty_print=pretty_print)
+        if self.HOSTS is not None:
+            self.HOSTS.export(outfile, level, namespaceprefix_, name_='HOSTS', pretty_print=pretty_print)
+        if self.DATASTORES is not None:
+            self.DATASTORES.export(outfile, level, namespaceprefix_, name_='DATASTORES', pretty_print=pretty_print)
+        if self.VNETS is not None:
+            self.VNETS.export(outfile, level, namespaceprefix_, name_='VNETS', pretty_print=pretty_print)
+        if self.TEMPLATE is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<TEMPLATE>%s</TEMPLATE>%s' % (self.gds_encode(self.gds_format_string(quote_xml(self.TEMPLATE), input_name='TEMPLATE')), eol_))
+    def build(self, node):
+        already_processed = set()
+        self.buildAttributes(node, node.attrib, already_processed)
+        for child in node:
+            nodeName_ = Tag_pattern_.match(child.tag).groups()[-1]
+            self.buildChildren(child, node, nodeName_)
+        return self
+    def buildAttributes(self, node, attrs, already_processed):
+        pass
+    def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
+        if nodeName_ == 'ID' and child_.text:
+            sval_ = child_.text
+            try:
+                ival_ = int(sval_)
+            except (TypeError, ValueError) as exp:
+                raise_parse_error(child_, 'requires integer: %s' % exp)
+            ival_ = self.gds_validate_integer(ival_, node, 'ID')
+            self.ID = ival_
+        elif nodeName_ == 'NAME':
+            NAME_ = child_.text
+            NAME_ = self.gds_validate_string(NAME_, node, 'NAME')
+            self.NAME = NAME_
+        elif nodeName_ == 'GROUPS':
+            obj_ = GROUPSType73.factory()
+            obj_.build(child_)
+            self.GROUPS = obj_
+            obj_.original_tagname_ = 'GROUPS'
+        elif nodeName_ == 'CLUSTERS':
+            obj_ = CLUSTERSType74.factory()
+            obj_.build(child_)
+            self.CLUSTERS = obj_
+            obj_.original_tagname_ = 'CLUSTERS'
+        elif nodeName_ == 'HOSTS':
+            obj_ = HOSTSType75.factory()
+            obj_.build(child_)
+            self.HOSTS = obj_
+            obj_.original_tagname_ = 'HOSTS'
+        elif nodeName_ == 'DATASTORES':
+            obj_ = DATASTORESType76.factory()
+            obj_.build(child_)
+            self.DATASTORES = obj_
+            obj_.original_tagname_ = 'DATASTORES'
+        elif nodeName_ == 'VNETS':
+            obj_ = VNETSType78.factory()
+            obj_.build(child_)
+            self.VNETS = obj_
+            obj_.original_tagname_ = 'VNETS'
+        elif nodeName_ == 'TEMPLATE':
+            TEMPLATE_ = child_.text
+            TEMPLATE_ = self.gds_validate_string(TEMPLATE_, node, 'TEMPLATE')
+            self.TEMPLATE = TEMPLATE_
+# end class VDC
+
+
+class GROUPSType73(GeneratedsSuper):
+    subclass = None
+    superclass = None
+    def __init__(self, ID=None):
+        self.original_tagname_ = None
+        if ID is None:
+            self.ID = []
+        else:
+            self.ID = ID
+    def factory(*args_, **kwargs_):
+        if supermod.CurrentSubclassModule_ is not None:
+            subclass = getSubclassFromModule_(
+                supermod.CurrentSubclassModule_, GROUPSType73)
+            if subclass is not None:
+                return subclass(*args_, **kwargs_)
+        if GROUPSType73.subclass:
+            return GROUPSType73.subclass(*args_, **kwargs_)
+        else:
+            return GROUPSType73(*args_, **kwargs_)
+    factory = staticmethod(factory)
+    def get_ID(self): return self.ID
+    def set_ID(self, ID): self.ID = ID
+    def add_ID(self, value): self.ID.append(value)
+    def insert_ID_at(self, index, value): self.ID.insert(index, value)
+    def replace_ID_at(self, index, value): self.ID[index] = value
+    def hasContent_(self):
+        if (
+            self.ID
+        ):
+            return True
+        else:
+            return False
+    def export(self, outfile, level, namespaceprefix_='', name_='GROUPSType73', namespacedef_='', pretty_print=True):
+        imported_ns_def_ = GenerateDSNamespaceDefs_.get('GROUPSType73')
+        if imported_ns_def_ is not None:
+            namespacedef_ = imported_ns_def_
+        if pretty_print:
+            eol_ = '\n'
+        else:
+            eol_ = ''
+        if self.original_tagname_ is not None:
+            name_ = self.original_tagname_
+        showIndent(outfile, level, pretty_print)
+        outfile.write('<%s%s%s' % (namespaceprefix_, name_, namespacedef_ and ' ' + namespacedef_ or '', ))
+        already_processed = set()
+        self.exportAttributes(outfile, level, already_processed, namespaceprefix_, name_='GROUPSType73')
+        if self.hasContent_():
+            outfile.write('>%s' % (eol_, ))
+            self.exportChildren(outfile, level + 1, namespaceprefix_='', name_='GROUPSType73', pretty_print=pretty_print)
+            showIndent(outfile, level, pretty_print)
+            outfile.write('</%s%s>%s' % (namespaceprefix_, name_, eol_))
+        else:
+            outfile.write('/>%s' % (eol_, ))
+    def exportAttributes(self, outfile, level, already_processed, namespaceprefix_='', name_='GROUPSType73'):
+        pass
+    def exportChildren(self, outfile, level, namespaceprefix_='', name_='GROUPSType73', fromsubclass_=False, pretty_print=True):
+        if pretty_print:
+            eol_ = '\n'
+        else:
+            eol_ = ''
+        for ID_ in self.ID:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<ID>%s</ID>%s' % (self.gds_format_integer(ID_, input_name='ID'), eol_))
+    def build(self, node):
+        already_processed = set()
+        self.buildAttributes(node, node.attrib, already_processed)
+        for child in node:
+            nodeName_ = Tag_pattern_.match(child.tag).groups()[-1]
+            self.buildChildren(child, node, nodeName_)
+        return self
+    def buildAttributes(self, node, attrs, already_processed):
+        pass
+    def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
+        if nodeName_ == 'ID' and child_.text:
+            sval_ = child_.text
+            try:
+                ival_ = int(sval_)
+            except (TypeError, ValueError) as exp:
+                raise_parse_error(child_, 'requires integer: %s' % exp)
+            ival_ = self.gds_validate_integer(ival_, node, 'ID')
+            self.ID.append(ival_)
+# end class GROUPSType73
+
+
+class CLUSTERSType74(GeneratedsSuper):
+    subclass = None
+    superclass = None
+    def __init__(self, CLUSTER=None):
+        self.original_tagname_ = None
+        if CLUSTER is None:
+            self.CLUSTER = []
+        else:
+            self.CLUSTER = CLUSTER
+    def factory(*args_, **kwargs_):
+        if supermod.CurrentSubclassModule_ is not None:
+            subclass = getSubclassFromModule_(
+                supermod.CurrentSubclassModule_, CLUSTERSType74)
+            if subclass is not None:
+                return subclass(*args_, **kwargs_)
+        if CLUSTERSType74.subclass:
+            return CLUSTERSType74.subclass(*args_, **kwargs_)
+        else:
+            return CLUSTERSType74(*args_, **kwargs_)
+    factory = staticmethod(factory)
+    def get_CLUSTER(self): return self.CLUSTER
+    def set_CLUSTER(self, CLUSTER): self.CLUSTER = CLUSTER
+    def add_CLUSTER(self, value): self.CLUSTER.append(value)
+    def insert_CLUSTER_at(self, index, value): self.CLUSTER.insert(index, value)
+    def replace_CLUSTER_at(self, index, value): self.CLUSTER[index] = value
+    def hasContent_(self):
+        if (
+            self.CLUSTER
+        ):
+            return True
+        else:
+            return False
+    def export(self, outfile, level, namespaceprefix_='', name_='CLUSTERSType74', namespacedef_='', pretty_print=True):
+        imported_ns_def_ = GenerateDSNamespaceDefs_.get('CLUSTERSType74')
+        if imported_ns_def_ is not None:
+            namespacedef_ = imported_ns_def_
+        if pretty_print:
+            eol_ = '\n'
+        else:
+            eol_ = ''
+        if self.original_tagname_ is not None:
+            name_ = self.original_tagname_
+        showIndent(outfile, level, pretty_print)
+        outfile.write('<%s%s%s' % (namespaceprefix_, name_, namespacedef_ and ' ' + namespacedef_ or '', ))
+        already_processed = set()
+        self.exportAttributes(outfile, level, already_processed, namespaceprefix_, name_='CLUSTERSType74')
+        if self.hasContent_():
+            outfile.write('>%s' % (eol_, ))
+            self.exportChildren(outfile, level + 1, namespaceprefix_='', name_='CLUSTERSType74', pretty_print=pretty_print)
+            showIndent(outfile, level, pretty_print)
+            outfile.write('</%s%s>%s' % (namespaceprefix_, name_, eol_))
+        else:
+            outfile.write('/>%s' % (eol_, ))
+    def exportAttributes(self, outfile, level, already_processed, namespaceprefix_='', name_='CLUSTERSType74'):
+        pass
+    def exportChildren(self, outfile, level, namespaceprefix_='', name_='CLUSTERSType74', fromsubclass_=False, pretty_print=True):
+        if pretty_print:
+            eol_ = '\n'
+        else:
+            eol_ = ''
+        for CLUSTER_ in self.CLUSTER:
+            CLUSTER_.export(outfile, level, namespaceprefix_, name_='CLUSTER', pretty_print=pretty_print)
+    def build(self, node):
+        already_processed = set()
+        self.buildAttributes(node, node.attrib, already_processed)
+        for child in node:
+            nodeName_ = Tag_pattern_.match(child.tag).groups()[-1]
+            self.buildChildren(child, node, nodeName_)
+        return self
+    def buildAttributes(self, node, attrs, already_processed):
+        pass
+    def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
+        if nodeName_ == 'CLUSTER':
+            obj_ = CLUSTERType.factory()
+            obj_.build(child_)
+            self.CLUSTER.append(obj_)
+            obj_.original_tagname_ = 'CLUSTER'
+# end class CLUSTERSType74
+
+
+class CLUSTERType(GeneratedsSuper):
+    subclass = None
+    superclass = None
+    def __init__(self, ZONE_ID=None, CLUSTER_ID=None):
+        self.original_tagname_ = None
+        self.ZONE_ID = ZONE_ID
+        self.CLUSTER_ID = CLUSTER_ID
+    def factory(*args_, **kwargs_):
+        if supermod.CurrentSubclassModule_ is not None:
+            subclass = getSubclassFromModule_(
+                supermod.CurrentSubclassModule_, CLUSTERType)
+            if subclass is not None:
+                return subclass(*args_, **kwargs_)
+        if CLUSTERType.subclass:
+            return CLUSTERType.subclass(*args_, **kwargs_)
+        else:
+            return CLUSTERType(*args_, **kwargs_)
+    factory = staticmethod(factory)
+    def get_ZONE_ID(self): return self.ZONE_ID
+    def set_ZONE_ID(self, ZONE_ID): self.ZONE_ID = ZONE_ID
+    def get_CLUSTER_ID(self): return self.CLUSTER_ID
+    def set_CLUSTER_ID(self, CLUSTER_ID): self.CLUSTER_ID = CLUSTER_ID
+    def hasContent_(self):
+        if (
+            self.ZONE_ID is not None or
+            self.CLUSTER_ID is not None
+        ):
+            return True
+        else:
+            return False
+    def export(self, outfile, level, namespaceprefix_='', name_='CLUSTERType', namespacedef_='', pretty_print=True):
+        imported_ns_def_ = GenerateDSNamespaceDefs_.get('CLUSTERType')
+        if imported_ns_def_ is not None:
+            namespacedef_ = imported_ns_def_
+        if pretty_print:
+            eol_ = '\n'
+        else:
+            eol_ = ''
+        if self.original_tagname_ is not None:
+            name_ = self.original_tagname_
+        showIndent(outfile, level, pretty_print)
+        outfile.write('<%s%s%s' % (namespaceprefix_, name_, namespacedef_ and ' ' + namespacedef_ or '', ))
+        already_processed = set()
+        self.exportAttributes(outfile, level, already_processed, namespaceprefix_, name_='CLUSTERType')
+        if self.hasContent_():
+            outfile.write('>%s' % (eol_, ))
+            self.exportChildren(outfile, level + 1, namespaceprefix_='', name_='CLUSTERType', pretty_print=pretty_print)
+            showIndent(outfile, level, pretty_print)
+            outfile.write('</%s%s>%s' % (namespaceprefix_, name_, eol_))
+        else:
+            outfile.write('/>%s' % (eol_, ))
+    def exportAttributes(self, outfile, level, already_processed, namespaceprefix_='', name_='CLUSTERType'):
+        pass
+    def exportChildren(self, outfile, level, namespaceprefix_='', name_='CLUSTERType', fromsubclass_=False, pretty_print=True):
+        if pretty_print:
+            eol_ = '\n'
+        else:
+            eol_ = ''
+        if self.ZONE_ID is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<ZONE_ID>%s</ZONE_ID>%s' % (self.gds_format_integer(self.ZONE_ID, input_name='ZONE_ID'), eol_))
+        if self.CLUSTER_ID is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<CLUSTER_ID>%s</CLUSTER_ID>%s' % (self.gds_format_integer(self.CLUSTER_ID, input_name='CLUSTER_ID'), eol_))
+    def build(self, node):
+        already_processed = set()
+        self.buildAttributes(node, node.attrib, already_processed)
+        for child in node:
+            nodeName_ = Tag_pattern_.match(child.tag).groups()[-1]
+            self.buildChildren(child, node, nodeName_)
+        return self
+    def buildAttributes(self, node, attrs, already_processed):
+        pass
+    def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
+        if nodeName_ == 'ZONE_ID' and child_.text:
+            sval_ = child_.text
+            try:
+                ival_ = int(sval_)
+            except (TypeError, ValueError) as exp:
+                raise_parse_error(child_, 'requires integer: %s' % exp)
+            ival_ = self.gds_validate_integer(ival_, node, 'ZONE_ID')
+            self.ZONE_ID = ival_
+        elif nodeName_ == 'CLUSTER_ID' and child_.text:
+            sval_ = child_.text
+            try:
+                ival_ = int(sval_)
+            except (TypeError, ValueError) as exp:
+                raise_parse_error(child_, 'requires integer: %s' % exp)
+            ival_ = self.gds_validate_integer(ival_, node, 'CLUSTER_ID')
+            self.CLUSTER_ID = ival_
+# end class CLUSTERType
+
+
+class HOSTSType75(GeneratedsSuper):
+    subclass = None
+    superclass = None
+    def __init__(self, HOST=None):
+        self.original_tagname_ = None
+        if HOST is None:
+            self.HOST = []
+        else:
+            self.HOST = HOST
+    def factory(*args_, **kwargs_):
+        if supermod.CurrentSubclassModule_ is not None:
+            subclass = getSubclassFromModule_(
+                supermod.CurrentSubclassModule_, HOSTSType75)
+            if subclass is not None:
+                return subclass(*args_, **kwargs_)
+        if HOSTSType75.subclass:
+            return HOSTSType75.subclass(*args_, **kwargs_)
+        else:
+            return HOSTSType75(*args_, **kwargs_)
+    factory = staticmethod(factory)
+    def get_HOST(self): return self.HOST
+    def set_HOST(self, HOST): self.HOST = HOST
+    def add_HOST(self, value): self.HOST.append(value)
+    def insert_HOST_at(self, index, value): self.HOST.insert(index, value)
+    def replace_HOST_at(self, index, value): self.HOST[index] = value
+    def hasContent_(self):
+        if (
+            self.HOST
+        ):
+            return True
+        else:
+            return False
+    def export(self, outfile, level, namespaceprefix_='', name_='HOSTSType75', namespacedef_='', pretty_print=True):
+        imported_ns_def_ = GenerateDSNamespaceDefs_.get('HOSTSType75')
+        if imported_ns_def_ is not None:
+            namespacedef_ = imported_ns_def_
+        if pretty_print:
+            eol_ = '\n'
+        else:
+            eol_ = ''
+        if self.original_tagname_ is not None:
+            name_ = self.original_tagname_
+        showIndent(outfile, level, pretty_print)
+        outfile.write('<%s%s%s' % (namespaceprefix_, name_, namespacedef_ and ' ' + namespacedef_ or '', ))
+        already_processed = set()
+        self.exportAttributes(outfile, level, already_processed, namespaceprefix_, name_='HOSTSType75')
+        if self.hasContent_():
+            outfile.write('>%s' % (eol_, ))
+            self.exportChildren(outfile, level + 1, namespaceprefix_='', name_='HOSTSType75', pretty_print=pretty_print)
+            showIndent(outfile, level, pretty_print)
+            outfile.write('</%s%s>%s' % (namespaceprefix_, name_, eol_))
+        else:
+            outfile.write('/>%s' % (eol_, ))
+    def exportAttributes(self, outfile, level, already_processed, namespaceprefix_='', name_='HOSTSType75'):
+        pass
+    def exportChildren(self, outfile, level, namespaceprefix_='', name_='HOSTSType75', fromsubclass_=False, pretty_print=True):
+        if pretty_print:
+            eol_ = '\n'
+        else:
+            eol_ = ''
+        for HOST_ in self.HOST:
+            HOST_.export(outfile, level, namespaceprefix_, name_='HOST', pretty_print=pretty_print)
+    def build(self, node):
+        already_processed = set()
+        self.buildAttributes(node, node.attrib, already_processed)
+        for child in node:
+            nodeName_ = Tag_pattern_.match(child.tag).groups()[-1]
+            self.buildChildren(child, node, nodeName_)
+        return self
+    def buildAttributes(self, node, attrs, already_processed):
+        pass
+    def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
+        if nodeName_ == 'HOST':
+            obj_ = HOSTType.factory()
+            obj_.build(child_)
+            self.HOST.append(obj_)
+            obj_.original_tagname_ = 'HOST'
+# end class HOSTSType75
+
+
+class HOSTType(GeneratedsSuper):
+    subclass = None
+    superclass = None
+    def __init__(self, ZONE_ID=None, HOST_ID=None):
+        self.original_tagname_ = None
+        self.ZONE_ID = ZONE_ID
+        self.HOST_ID = HOST_ID
+    def factory(*args_, **kwargs_):
+        if supermod.CurrentSubclassModule_ is not None:
+            subclass = getSubclassFromModule_(
+                supermod.CurrentSubclassModule_, HOSTType)
+            if subclass is not None:
+                return subclass(*args_, **kwargs_)
+        if HOSTType.subclass:
+            return HOSTType.subclass(*args_, **kwargs_)
+        else:
+            return HOSTType(*args_, **kwargs_)
+    factory = staticmethod(factory)
+    def get_ZONE_ID(self): return self.ZONE_ID
+    def set_ZONE_ID(self, ZONE_ID): self.ZONE_ID = ZONE_ID
+    def get_HOST_ID(self): return self.HOST_ID
+    def set_HOST_ID(self, HOST_ID): self.HOST_ID = HOST_ID
+    def hasContent_(self):
+        if (
+            self.ZONE_ID is not None or
+            self.HOST_ID is not None
+        ):
+            return True
+        else:
+            return False
+    def export(self, outfile, level, namespaceprefix_='', name_='HOSTType', namespacedef_='', pretty_print=True):
+        imported_ns_def_ = GenerateDSNamespaceDefs_.get('HOSTType')
+        if imported_ns_def_ is not None:
+            namespacedef_ = imported_ns_def_
+        if pretty_print:
+            eol_ = '\n'
+        else:
+            eol_ = ''
+        if self.original_tagname_ is not None:
+            name_ = self.original_tagname_
+        showIndent(outfile, level, pretty_print)
+        outfile.write('<%s%s%s' % (namespaceprefix_, name_, namespacedef_ and ' ' + namespacedef_ or '', ))
+        already_processed = set()
+        self.exportAttributes(outfile, level, already_processed, namespaceprefix_, name_='HOSTType')
+        if self.hasContent_():
+            outfile.write('>%s' % (eol_, ))
+            self.exportChildren(outfile, level + 1, namespaceprefix_='', name_='HOSTType', pretty_print=pretty_print)
+            showIndent(outfile, level, pretty_print)
+            outfile.write('</%s%s>%s' % (namespaceprefix_, name_, eol_))
+        else:
+            outfile.write('/>%s' % (eol_, ))
+    def exportAttributes(self, outfile, level, already_processed, namespaceprefix_='', name_='HOSTType'):
+        pass
+    def exportChildren(self, outfile, level, namespaceprefix_='', name_='HOSTType', fromsubclass_=False, pretty_print=True):
+        if pretty_print:
+            eol_ = '\n'
+        else:
+            eol_ = ''
+        if self.ZONE_ID is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<ZONE_ID>%s</ZONE_ID>%s' % (self.gds_format_integer(self.ZONE_ID, input_name='ZONE_ID'), eol_))
+        if self.HOST_ID is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<HOST_ID>%s</HOST_ID>%s' % (self.gds_format_integer(self.HOST_ID, input_name='HOST_ID'), eol_))
+    def build(self, node):
+        already_processed = set()
+        self.buildAttributes(node, node.attrib, already_processed)
+        for child in node:
+            nodeName_ = Tag_pattern_.match(child.tag).groups()[-1]
+            self.buildChildren(child, node, nodeName_)
+        return self
+    def buildAttributes(self, node, attrs, already_processed):
+        pass
+    def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
+        if nodeName_ == 'ZONE_ID' and child_.text:
+            sval_ = child_.text
+            try:
+                ival_ = int(sval_)
+            except (TypeError, ValueError) as exp:
+                raise_parse_error(child_, 'requires integer: %s' % exp)
+            ival_ = self.gds_validate_integer(ival_, node, 'ZONE_ID')
+            self.ZONE_ID = ival_
+        elif nodeName_ == 'HOST_ID' and child_.text:
+            sval_ = child_.text
+            try:
+                ival_ = int(sval_)
+            except (TypeError, ValueError) as exp:
+                raise_parse_error(child_, 'requires integer: %s' % exp)
+            ival_ = self.gds_validate_integer(ival_, node, 'HOST_ID')
+            self.HOST_ID = ival_
+# end class HOSTType
+
+
+class DATASTORESType76(GeneratedsSuper):
+    subclass = None
+    superclass = None
+    def __init__(self, DATASTORE=None):
+        self.original_tagname_ = None
+        if DATASTORE is None:
+            self.DATASTORE = []
+        else:
+            self.DATASTORE = DATASTORE
+    def factory(*args_, **kwargs_):
+        if supermod.CurrentSubclassModule_ is not None:
+            subclass = getSubclassFromModule_(
+                supermod.CurrentSubclassModule_, DATASTORESType76)
+            if subclass is not None:
+                return subclass(*args_, **kwargs_)
+        if DATASTORESType76.subclass:
+            return DATASTORESType76.subclass(*args_, **kwargs_)
+        else:
+            return DATASTORESType76(*args_, **kwargs_)
+    factory = staticmethod(factory)
+    def get_DATASTORE(self): return self.DATASTORE
+    def set_DATASTORE(self, DATASTORE): self.DATASTORE = DATASTORE
+    def add_DATASTORE(self, value): self.DATASTORE.append(value)
+    def insert_DATASTORE_at(self, index, value): self.DATASTORE.insert(index, value)
+    def replace_DATASTORE_at(self, index, value): self.DATASTORE[index] = value
+    def hasContent_(self):
+        if (
+            self.DATASTORE
+        ):
+            return True
+        else:
+            return False
+    def export(self, outfile, level, namespaceprefix_='', name_='DATASTORESType76', namespacedef_='', pretty_print=True):
+        imported_ns_def_ = GenerateDSNamespaceDefs_.get('DATASTORESType76')
+        if imported_ns_def_ is not None:
+            namespacedef_ = imported_ns_def_
+        if pretty_print:
+            eol_ = '\n'
+        else:
+            eol_ = ''
+        if self.original_tagname_ is not None:
+            name_ = self.original_tagname_
+        showIndent(outfile, level, pretty_print)
+        outfile.write('<%s%s%s' % (namespaceprefix_, name_, namespacedef_ and ' ' + namespacedef_ or '', ))
+        already_processed = set()
+        self.exportAttributes(outfile, level, already_processed, namespaceprefix_, name_='DATASTORESType76')
+        if self.hasContent_():
+            outfile.write('>%s' % (eol_, ))
+            self.exportChildren(outfile, level + 1, namespaceprefix_='', name_='DATASTORESType76', pretty_print=pretty_print)
+            showIndent(outfile, level, pretty_print)
+            outfile.write('</%s%s>%s' % (namespaceprefix_, name_, eol_))
+        else:
+            outfile.write('/>%s' % (eol_, ))
+    def exportAttributes(self, outfile, level, already_processed, namespaceprefix_='', name_='DATASTORESType76'):
+        pass
+    def exportChildren(self, outfile, level, namespaceprefix_='', name_='DATASTORESType76', fromsubclass_=False, pretty_print=True):
+        if pretty_print:
+            eol_ = '\n'
+        else:
+            eol_ = ''
+        for DATASTORE_ in self.DATASTORE:
+            DATASTORE_.export(outfile, level, namespaceprefix_, name_='DATASTORE', pretty_print=pretty_print)
+    def build(self, node):
+        already_processed = set()
+        self.buildAttributes(node, node.attrib, already_processed)
+        for child in node:
+            nodeName_ = Tag_pattern_.match(child.tag).groups()[-1]
+            self.buildChildren(child, node, nodeName_)
+        return self
+    def buildAttributes(self, node, attrs, already_processed):
+        pass
+    def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
+        if nodeName_ == 'DATASTORE':
+            obj_ = DATASTOREType77.factory()
+            obj_.build(child_)
+            self.DATASTORE.append(obj_)
+            obj_.original_tagname_ = 'DATASTORE'
+# end class DATASTORESType76
+
+
+class DATASTOREType77(GeneratedsSuper):
+    subclass = None
+    superclass = None
+    def __init__(self, ZONE_ID=None, DATASTORE_ID=None):
+        self.original_tagname_ = None
+        self.ZONE_ID = ZONE_ID
+        self.DATASTORE_ID = DATASTORE_ID
+    def factory(*args_, **kwargs_):
+        if supermod.CurrentSubclassModule_ is not None:
+            subclass = getSubclassFromModule_(
+                supermod.CurrentSubclassModule_, DATASTOREType77)
+            if subclass is not None:
+                return subclass(*args_, **kwargs_)
+        if DATASTOREType77.subclass:
+            return DATASTOREType77.subclass(*args_, **kwargs_)
+        else:
+            return DATASTOREType77(*args_, **kwargs_)
+    factory = staticmethod(factory)
+    def get_ZONE_ID(self): return self.ZONE_ID
+    def set_ZONE_ID(self, ZONE_ID): self.ZONE_ID = ZONE_ID
+    def get_DATASTORE_ID(self): return self.DATASTORE_ID
+    def set_DATASTORE_ID(self, DATASTORE_ID): self.DATASTORE_ID = DATASTORE_ID
+    def hasContent_(self):
+        if (
+            self.ZONE_ID is not None or
+            self.DATASTORE_ID is not None
+        ):
+            return True
+        else:
+            return False
+    def export(self, outfile, level, namespaceprefix_='', name_='DATASTOREType77', namespacedef_='', pretty_print=True):
+        imported_ns_def_ = GenerateDSNamespaceDefs_.get('DATASTOREType77')
+        if imported_ns_def_ is not None:
+            namespacedef_ = imported_ns_def_
+        if pretty_print:
+            eol_ = '\n'
+        else:
+            eol_ = ''
+        if self.original_tagname_ is not None:
+            name_ = self.original_tagname_
+        showIndent(outfile, level, pretty_print)
+        outfile.write('<%s%s%s' % (namespaceprefix_, name_, namespacedef_ and ' ' + namespacedef_ or '', ))
+        already_processed = set()
+        self.exportAttributes(outfile, level, already_processed, namespaceprefix_, name_='DATASTOREType77')
+        if self.hasContent_():
+            outfile.write('>%s' % (eol_, ))
+            self.exportChildren(outfile, level + 1, namespaceprefix_='', name_='DATASTOREType77', pretty_print=pretty_print)
+            showIndent(outfile, level, pretty_print)
+            outfile.write('</%s%s>%s' % (namespaceprefix_, name_, eol_))
+        else:
+            outfile.write('/>%s' % (eol_, ))
+    def exportAttributes(self, outfile, level, already_processed, namespaceprefix_='', name_='DATASTOREType77'):
+        pass
+    def exportChildren(self, outfile, level, namespaceprefix_='', name_='DATASTOREType77', fromsubclass_=False, pretty_print=True):
+        if pretty_print:
+            eol_ = '\n'
+        else:
+            eol_ = ''
+        if self.ZONE_ID is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<ZONE_ID>%s</ZONE_ID>%s' % (self.gds_format_integer(self.ZONE_ID, input_name='ZONE_ID'), eol_))
+        if self.DATASTORE_ID is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<DATASTORE_ID>%s</DATASTORE_ID>%s' % (self.gds_format_integer(self.DATASTORE_ID, input_name='DATASTORE_ID'), eol_))
+    def build(self, node):
+        already_processed = set()
+        self.buildAttributes(node, node.attrib, already_processed)
+        for child in node:
+            nodeName_ = Tag_pattern_.match(child.tag).groups()[-1]
+            self.buildChildren(child, node, nodeName_)
+        return self
+    def buildAttributes(self, node, attrs, already_processed):
+        pass
+    def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
+        if nodeName_ == 'ZONE_ID' and child_.text:
+            sval_ = child_.text
+            try:
+                ival_ = int(sval_)
+            except (TypeError, ValueError) as exp:
+                raise_parse_error(child_, 'requires integer: %s' % exp)
+            ival_ = self.gds_validate_integer(ival_, node, 'ZONE_ID')
+            self.ZONE_ID = ival_
+        elif nodeName_ == 'DATASTORE_ID' and child_.text:
+            sval_ = child_.text
+            try:
+                ival_ = int(sval_)
+            except (TypeError, ValueError) as exp:
+                raise_parse_error(child_, 'requires integer: %s' % exp)
+            ival_ = self.gds_validate_integer(ival_, node, 'DATASTORE_ID')
+            self.DATASTORE_ID = ival_
+# end class DATASTOREType77
+
+
+class VNETSType78(GeneratedsSuper):
+    subclass = None
+    superclass = None
+    def __init__(self, VNET=None):
+        self.original_tagname_ = None
+        if VNET is None:
+            self.VNET = []
+        else:
+            self.VNET = VNET
+    def factory(*args_, **kwargs_):
+        if supermod.CurrentSubclassModule_ is not None:
+            subclass = getSubclassFromModule_(
+                supermod.CurrentSubclassModule_, VNETSType78)
+            if subclass is not None:
+                return subclass(*args_, **kwargs_)
+        if VNETSType78.subclass:
+            return VNETSType78.subclass(*args_, **kwargs_)
+        else:
+            return VNETSType78(*args_, **kwargs_)
+    factory = staticmethod(factory)
+    def get_VNET(self): return self.VNET
+    def set_VNET(self, VNET): self.VNET = VNET
+    def add_VNET(self, value): self.VNET.append(value)
+    def insert_VNET_at(self, index, value): self.VNET.insert(index, value)
+    def replace_VNET_at(self, index, value): self.VNET[index] = value
+    def hasContent_(self):
+        if (
+            self.VNET
+        ):
+            return True
+        else:
+            return False
+    def export(self, outfile, level, namespaceprefix_='', name_='VNETSType78', namespacedef_='', pretty_print=True):
+        imported_ns_def_ = GenerateDSNamespaceDefs_.get('VNETSType78')
+        if imported_ns_def_ is not None:
+            namespacedef_ = imported_ns_def_
+        if pretty_print:
+            eol_ = '\n'
+        else:
+            eol_ = ''
+        if self.original_tagname_ is not None:
+            name_ = self.original_tagname_
+        showIndent(outfile, level, pretty_print)
+        outfile.write('<%s%s%s' % (namespaceprefix_, name_, namespacedef_ and ' ' + namespacedef_ or '', ))
+        already_processed = set()
+        self.exportAttributes(outfile, level, already_processed, namespaceprefix_, name_='VNETSType78')
+        if self.hasContent_():
+            outfile.write('>%s' % (eol_, ))
+            self.exportChildren(outfile, level + 1, namespaceprefix_='', name_='VNETSType78', pretty_print=pretty_print)
+            showIndent(outfile, level, pretty_print)
+            outfile.write('</%s%s>%s' % (namespaceprefix_, name_, eol_))
+        else:
+            outfile.write('/>%s' % (eol_, ))
+    def exportAttributes(self, outfile, level, already_processed, namespaceprefix_='', name_='VNETSType78'):
+        pass
+    def exportChildren(self, outfile, level, namespaceprefix_='', name_='VNETSType78', fromsubclass_=False, pretty_print=True):
+        if pretty_print:
+            eol_ = '\n'
+        else:
+            eol_ = ''
+        for VNET_ in self.VNET:
+            VNET_.export(outfile, level, namespaceprefix_, name_='VNET', pretty_print=pretty_print)
+    def build(self, node):
+        already_processed = set()
+        self.buildAttributes(node, node.attrib, already_processed)
+        for child in node:
+            nodeName_ = Tag_pattern_.match(child.tag).groups()[-1]
+            self.buildChildren(child, node, nodeName_)
+        return self
+    def buildAttributes(self, node, attrs, already_processed):
+        pass
+    def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
+        if nodeName_ == 'VNET':
+            obj_ = VNETType.factory()
+            obj_.build(child_)
+            self.VNET.append(obj_)
+            obj_.original_tagname_ = 'VNET'
+# end class VNETSType78
+
+
+class VNETType(GeneratedsSuper):
+    subclass = None
+    superclass = None
+    def __init__(self, ZONE_ID=None, VNET_ID=None):
+        self.original_tagname_ = None
+        self.ZONE_ID = ZONE_ID
+        self.VNET_ID = VNET_ID
+    def factory(*args_, **kwargs_):
+        if supermod.CurrentSubclassModule_ is not None:
+            subclass = getSubclassFromModule_(
+                supermod.CurrentSubclassModule_, VNETType)
+            if subclass is not None:
+                return subclass(*args_, **kwargs_)
+        if VNETType.subclass:
+            return VNETType.subclass(*args_, **kwargs_)
+        else:
+            return VNETType(*args_, **kwargs_)
+    factory = staticmethod(factory)
+    def get_ZONE_ID(self): return self.ZONE_ID
+    def set_ZONE_ID(self, ZONE_ID): self.ZONE_ID = ZONE_ID
+    def get_VNET_ID(self): return self.VNET_ID
+    def set_VNET_ID(self, VNET_ID): self.VNET_ID = VNET_ID
+    def hasContent_(self):
+        if (
+            self.ZONE_ID is not None or
+            self.VNET_ID is not None
+        ):
+            return True
+        else:
+            return False
+    def export(self, outfile, level, namespaceprefix_='', name_='VNETType', namespacedef_='', pretty_print=True):
+        imported_ns_def_ = GenerateDSNamespaceDefs_.get('VNETType')
+        if imported_ns_def_ is not None:
+            namespacedef_ = imported_ns_def_
+        if pretty_print:
+            eol_ = '\n'
+        else:
+            eol_ = ''
+        if self.original_tagname_ is not None:
+            name_ = self.original_tagname_
+        showIndent(outfile, level, pretty_print)
+        outfile.write('<%s%s%s' % (namespaceprefix_, name_, namespacedef_ and ' ' + namespacedef_ or '', ))
+        already_processed = set()
+        self.exportAttributes(outfile, level, already_processed, namespaceprefix_, name_='VNETType')
+        if self.hasContent_():
+            outfile.write('>%s' % (eol_, ))
+            self.exportChildren(outfile, level + 1, namespaceprefix_='', name_='VNETType', pretty_print=pretty_print)
+            showIndent(outfile, level, pretty_print)
+            outfile.write('</%s%s>%s' % (namespaceprefix_, name_, eol_))
+        else:
+            outfile.write('/>%s' % (eol_, ))
+    def exportAttributes(self, outfile, level, already_processed, namespaceprefix_='', name_='VNETType'):
+        pass
+    def exportChildren(self, outfile, level, namespaceprefix_='', name_='VNETType', fromsubclass_=False, pretty_print=True):
+        if pretty_print:
+            eol_ = '\n'
+        else:
+            eol_ = ''
+        if self.ZONE_ID is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<ZONE_ID>%s</ZONE_ID>%s' % (self.gds_format_integer(self.ZONE_ID, input_name='ZONE_ID'), eol_))
+        if self.VNET_ID is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<VNET_ID>%s</VNET_ID>%s' % (self.gds_format_integer(self.VNET_ID, input_name='VNET_ID'), eol_))
+    def build(self, node):
+        already_processed = set()
+        self.buildAttributes(node, node.attrib, already_processed)
+        for child in node:
+            nodeName_ = Tag_pattern_.match(child.tag).groups()[-1]
+            self.buildChildren(child, node, nodeName_)
+        return self
+    def buildAttributes(self, node, attrs, already_processed):
+        pass
+    def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
+        if nodeName_ == 'ZONE_ID' and child_.text:
+            sval_ = child_.text
+            try:
+                ival_ = int(sval_)
+            except (TypeError, ValueError) as exp:
+                raise_parse_error(child_, 'requires integer: %s' % exp)
+            ival_ = self.gds_validate_integer(ival_, node, 'ZONE_ID')
+            self.ZONE_ID = ival_
+        elif nodeName_ == 'VNET_ID' and child_.text:
+            sval_ = child_.text
+            try:
+                ival_ = int(sval_)
+            except (TypeError, ValueError) as exp:
+                raise_parse_error(child_, 'requires integer: %s' % exp)
+            ival_ = self.gds_validate_integer(ival_, node, 'VNET_ID')
+            self.VNET_ID = ival_
+# end class VNETType
+
+
+class VDC_POOLSub(TemplatedType, VDC_POOL):
+    def __init__(self, VDC=None):
+        super(VDC_POOLSub, self).__init__(VDC, )
+VDC_POOL.subclass = VDC_POOLSub
+# end class VDC_POOLSub
+
+
+class VDCSub(TemplatedType, VDC):
+    def __init__(self, ID=None, NAME=None, GROUPS=None, CLUSTERS=None, HOSTS=None, DATASTORES=None, VNETS=None, TEMPLATE=None):
+        super(VDCSub, self).__init__(ID, NAME, GROUPS, CLUSTERS, HOSTS, DATASTORES, VNETS, TEMPLATE, )
+VDC.subclass = VDCSub
+# end class VDCSub
+
+
+class GROUPSType73Sub(TemplatedType, GROUPSType73):
+    def __init__(self, ID=None):
+        super(GROUPSType73Sub, self).__init__(ID, )
+GROUPSType73.subclass = GROUPSType73Sub
+# end class GROUPSType73Sub
+
+
+class CLUSTERSType74Sub(TemplatedType, CLUSTERSType74):
+    def __init__(self, CLUSTER=None):
+        super(CLUSTERSType74Sub, self).__init__(CLUSTER, )
+CLUSTERSType74.subclass = CLUSTERSType74Sub
+# end class CLUSTERSType74Sub
+
+
+class CLUSTERTypeSub(TemplatedType, CLUSTERType):
+    def __init__(self, ZONE_ID=None, CLUSTER_ID=None):
+        super(CLUSTERTypeSub, self).__init__(ZONE_ID, CLUSTER_ID, )
+CLUSTERType.subclass = CLUSTERTypeSub
+# end class CLUSTERTypeSub
+
+
+class HOSTSType75Sub(TemplatedType, HOSTSType75):
+    def __init__(self, HOST=None):
+        super(HOSTSType75Sub, self).__init__(HOST, )
+HOSTSType75.subclass = HOSTSType75Sub
+# end class HOSTSType75Sub
+
+
+class HOSTTypeSub(TemplatedType, HOSTType):
+    def __init__(self, ZONE_ID=None, HOST_ID=None):
+        super(HOSTTypeSub, self).__init__(ZONE_ID, HOST_ID, )
+HOSTType.subclass = HOSTTypeSub
+# end class HOSTTypeSub
+
+
+class DATASTORESType76Sub(TemplatedType, DATASTORESType76):
+    def __init__(self, DATASTORE=None):
+        super(DATASTORESType76Sub, self).__init__(DATASTORE, )
+DATASTORESType76.subclass = DATASTORESType76Sub
+# end class DATASTORESType76Sub
+
+
+class DATASTOREType77Sub(TemplatedType, DATASTOREType77):
+    def __init__(self, ZONE_ID=None, DATASTORE_ID=None):
+        super(DATASTOREType77Sub, self).__init__(ZONE_ID, DATASTORE_ID, )
+DATASTOREType77.subclass = DATASTOREType77Sub
+# end class DATASTOREType77Sub
+
+
+class VNETSType78Sub(TemplatedType, VNETSType78):
+    def __init__(self, VNET=None):
+        super(VNETSType78Sub, self).__init__(VNET, )
+VNETSType78.subclass = VNETSType78Sub
+# end class VNETSType78Sub
+
+
+class VNETTypeSub(TemplatedType, VNETType):
+    def __init__(self, ZONE_ID=None, VNET_ID=None):
+        super(VNETTypeSub, self).__init__(ZONE_ID, VNET_ID, )
+VNETType.subclass = VNETTypeSub
+# end class VNETTypeSub
+
+
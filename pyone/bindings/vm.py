@@ -0,0 +1,1377 @@
+#!/usr/bin/env python
+
+#
+# Bindings of VM_POOL, VM, generated by generateDS.py and split from supbind by src/split_bindings.py
+#
+
+import sys
+import re as re_
+import base64
+import datetime as datetime_
+import warnings as warnings_
+try:
+    from lxml import etree as etree_
+except ImportError:
+    from xml.etree import ElementTree as etree_
+from pyone.util import TemplatedType
+from . import supbind as supermod
+from .supbind import (
+    GenerateDSNamespaceDefs_,
+    GeneratedsSuper,
+    Tag_pattern_,
+    getSubclassFromModule_,
+    quote_xml,
+    raise_parse_error,
+    showIndent,
+)
+
+
+class VM_POOL(GeneratedsSuper):
+    subclass = None
+    superclass = None
+    def __init__(self, VM=None):
+        self.original_tagname_ = None
+        if VM is None:
+            self.VM = []
+        else:
+            self.VM = VM
+    def factory(*args_, **kwargs_):
+        if supermod.CurrentSubclassModule_ is not None:
+            subclass = getSubclassFromModule_(
+                supermod.CurrentSubclassModule_, VM_POOL)
+            if subclass is not None:
+                return subclass(*args_, **kwargs_)
+        if VM_POOL.subclass:
+            return VM_POOL.subclass(*args_, **kwargs_)
+        else:
+            return VM_POOL(*args_, **kwargs_)
+    factory = staticmethod(factory)
+    def get_VM(self): return self.VM
+    def set_VM(self, VM): self.VM = VM
+    def add_VM(self, value): self.VM.append(value)
+    def insert_VM_at(self, index, value): self.VM.insert(index, value)
+    def replace_VM_at(self, index, value): self.VM[index] = value
+    def hasContent_(self):
+        if (
+            self.VM
+        ):
+            return True
+        else:
+            return False
+    def export(self, outfile, level, namespaceprefix_='', name_='VM_POOL', namespacedef_='', pretty_print=True):
+        imported_ns_def_ = GenerateDSNamespaceDefs_.get('VM_POOL')
+        if imported_ns_def_ is not None:
+            namespacedef_ = imported_ns_def_
+        if pretty_print:
+            eol_ = '\n'
+        else:
+            eol_ = ''
+        if self.original_tagname_ is not None:
+            name_ = self.original_tagname_
+        showIndent(outfile, level, pretty_print)
+        outfile.write('<%s%s%s' % (namespaceprefix_, name_, namespacedef_ and ' ' + namespacedef_ or '', ))
+        already_processed = set()
+        self.exportAttributes(outfile, level, already_processed, namespaceprefix_, name_='VM_POOL')
+        if self.hasContent_():
+            outfile.write('>%s' % (eol_, ))
+            self.exportChildren(outfile, level + 1, namespaceprefix_='', name_='VM_POOL', pretty_print=pretty_print)
+            showIndent(outfile, level, pretty_print)
+            outfile.write('</%s%s>%s' % (namespaceprefix_, name_, eol_))
+        else:
+            outfile.write('/>%s' % (eol_, ))
+    def exportAttributes(self, outfile, level, already_processed, namespaceprefix_='', name_='VM_POOL'):
+        pass
+    def exportChildren(self, outfile, level, namespaceprefix_='', name_='VM_POOL', fromsubclass_=False, pretty_print=True):
+        if pretty_print:
+            eol_ = '\n'
+        else:
+            eol_ = ''
+        for VM_ in self.VM:
+            VM_.export(outfile, level, namespaceprefix_, name_='VM', pretty_print=pretty_print)
+    def build(self, node):
+        already_processed = set()
+        self.buildAttributes(node, node.attrib, already_processed)
+        for child in node:
+            nodeName_ = Tag_pattern_.match(child.tag).groups()[-1]
+            self.buildChildren(child, node, nodeName_)
+        return self
+    def buildAttributes(self, node, attrs, already_processed):
+        pass
+    def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
+        if nodeName_ == 'VM':
+            obj_ = VM.factory()
+            obj_.build(child_)
+            self.VM.append(obj_)
+            obj_.original_tagname_ = 'VM'
+# end class VM_POOL
+
+
+class VM(GeneratedsSuper):
+    subclass = None
+    superclass = None
+    def __init__(self, ID=None, UID=None, GID=None, UNAME=None, GNAME=None, NAME=None, PERMISSIONS=None, LAST_POLL=None, STATE=None, LCM_STATE=None, PREV_STATE=None, PREV_LCM_STATE=None, RESCHED=None, STIME=None, ETIME=None, DEPLOY_ID=None, MONITORING=None, TEMPLATE=None, USER_TEMPLATE=None, HISTORY_RECORDS=None, SNAPSHOTS=None):
+        self.original_tagname_ = None
+        self.ID = ID
+        self.UID = UID
+        self.GID = GID
+        self.UNAME = UNAME
+        self.GNAME = GNAME
+        self.NAME = NAME
+        self.PERMISSIONS = PERMISSIONS
+        self.LAST_POLL = LAST_POLL
+        self.STATE = STATE
+        self.LCM_STATE = LCM_STATE
+        self.PREV_STATE = PREV_STATE
+        self.PREV_LCM_STATE = PREV_LCM_STATE
+        self.RESCHED = RESCHED
+        self.STIME = STIME
+        self.ETIME = ETIME
+        self.DEPLOY_ID = DEPLOY_ID
+        self.MONITORING = MONITORING
+        self.TEMPLATE = TEMPLATE
+        self.USER_TEMPLATE = USER_TEMPLATE
+        self.HISTORY_RECORDS = HISTORY_RECORDS
+        if SNAPSHOTS is None:
+            self.SNAPSHOTS = []
+        else:
+            self.SNAPSHOTS = SNAPSHOTS
+    def factory(*args_, **kwargs_):
+        if supermod.CurrentSubclassModule_ is not None:
+            subclass = getSubclassFromModule_(
+                supermod.CurrentSubclassModule_, VM)
+            if subclass is not None:
+                return subclass(*args_, **kwargs_)
+        if VM.subclass:
+            return VM.subclass(*args_, **kwargs_)
+        else:
+            return VM(*args_, **kwargs_)
+    factory = staticmethod(factory)
+    def get_ID(self): return self.ID
+    def set_ID(self, ID): self.ID = ID
+    def get_UID(self): return self.UID
+    def set_UID(self, UID): self.UID = UID
+    def get_GID(self): return self.GID
+    def set_GID(self, GID): self.GID = GID
+    def get_UNAME(self): return self.UNAME
+    def set_UNAME(self, UNAME): self.UNAME = UNAME
+    def get_GNAME(self): return self.GNAME
+    def set_GNAME(self, GNAME): self.GNAME = GNAME
+    def get_NAME(self): return self.NAME
+    def set_NAME(self, NAME): self.NAME = NAME
+    def get_PERMISSIONS(self): return self.PERMISSIONS
+    def set_PERMISSIONS(self, PERMISSIONS): self.PERMISSIONS = PERMISSIONS
+    def get_LAST_POLL(self): return self.LAST_POLL
+    def set_LAST_POLL(self, LAST_POLL): self.LAST_POLL = LAST_POLL
+    def get_STATE(self): return self.STATE
+    def set_STATE(self, STATE): self.STATE = STATE
+    def get_LCM_STATE(self): return self.LCM_STATE
+    def set_LCM_STATE(self, LCM_STATE): self.LCM_STATE = LCM_STATE
+    def get_PREV_STATE(self): return self.PREV_STATE
+    def set_PREV_STATE(self, PREV_STATE): self.PREV_STATE = PREV_STATE
+    def get_PREV_LCM_STATE(self): return self.PREV_LCM_STATE
+    def set_PREV_LCM_STATE(self, PREV_LCM_STATE): self.PREV_LCM_STATE = PREV_LCM_STATE
+    def get_RESCHED(self): return self.RESCHED
+    def set_RESCHED(self, RESCHED): self.RESCHED = RESCHED
+    def get_STIME(self): return self.STIME
+    def set_STIME(self, STIME): self.STIME = STIME
+    def get_ETIME(self): return self.ETIME
+    def set_ETIME(self, ETIME): self.ETIME = ETIME
+    def get_DEPLOY_ID(self): return self.DEPLOY_ID
+    def set_DEPLOY_ID(self, DEPLOY_ID): self.DEPLOY_ID = DEPLOY_ID
+    def get_MONITORING(self): return self.MONITORING
+    def set_MONITORING(self, MONITORING): self.MONITORING = MONITORING
+    def get_TEMPLATE(self): return self.TEMPLATE
+    def set_TEMPLATE(self, TEMPLATE): self.TEMPLATE = TEMPLATE
+    def get_USER_TEMPLATE(self): return self.USER_TEMPLATE
+    def set_USER_TEMPLATE(self, USER_TEMPLATE): self.USER_TEMPLATE = USER_TEMPLATE
+    def get_HISTORY_RECORDS(self): return self.HISTORY_RECORDS
+    def set_HISTORY_RECORDS(self, HISTORY_RECORDS): self.HISTORY_RECORDS = HISTORY_RECORDS
+    def get_SNAPSHOTS(self): return self.SNAPSHOTS
+    def set_SNAPSHOTS(self, SNAPSHOTS): self.SNAPSHOTS = SNAPSHOTS
+    def add_SNAPSHOTS(self, value): self.SNAPSHOTS.append(value)
+    def insert_SNAPSHOTS_at(self, index, value): self.SNAPSHOTS.insert(index, value)
+    def replace_SNAPSHOTS_at(self, index, value): self.SNAPSHOTS[index] = value
+    def hasContent_(self):
+        if (
+            self.ID is not None or
+            self.UID is not None or
+            self.GID is not None or
+            self.UNAME is not None or
+            self.GNAME is not None or
+            self.NAME is not None or
+            self.PERMISSIONS is not None or
+            self.LAST_POLL is not None or
+            self.STATE is not None or
+            self.LCM_STATE is not None or
+            self.PREV_STATE is not None or
+            self.PREV_LCM_STATE is not None or
+            self.RESCHED is not None or
+            self.STIME is not None or
+            self.ETIME is not None or
+            self.DEPLOY_ID is not None or
+            self.MONITORING is not None or
+            self.TEMPLATE is not None or
+            self.USER_TEMPLATE is not None or
+            self.HISTORY_RECORDS is not None or
+            self.SNAPSHOTS
+        ):
+            return True
+        else:
+            return False
+    def export(self, outfile, level, namespaceprefix_='', name_='VM', namespacedef_='', pretty_print=True):
+        imported_ns_def_ = GenerateDSNamespaceDefs_.get('VM')
+        if imported_ns_def_ is not None:
+            namespacedef_ = imported_ns_def_
+        if pretty_print:
+            eol_ = '\n'
+        else:
+            eol_ = ''
+        if self.original_tagname_ is not None:
+            name_ = self.original_tagname_
+        showIndent(outfile, level, pretty_print)
+        outfile.write('<%s%s%s' % (namespaceprefix_, name_, namespacedef_ and ' ' + namespacedef_ or '', ))
+        already_processed = set()
+        self.exportAttributes(outfile, level, already_processed, namespaceprefix_, name_='VM')
+        if self.hasContent_():
+            outfile.write('>%s' % (eol_, ))
+            self.exportChildren(outfile, level + 1, namespaceprefix_='', name_='VM', pretty_print=pretty_print)
+            showIndent(outfile, level, pretty_print)
+            outfile.write('</%s%s>%s' % (namespaceprefix_, name_, eol_))
+        else:
+            outfile.write('/>%s' % (eol_, ))
+    def exportAttributes(self, outfile, level, already_processed, namespaceprefix_='', name_='VM'):
+        pass
+    def exportChildren(self, outfile, level, namespaceprefix_='', name_='VM', fromsubclass_=False, pretty_print=True):
+        if pretty_print:
+            eol_ = '\n'
+        else:
+            eol_ = ''
+        if self.ID is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<ID>%s</ID>%s' % (self.gds_format_integer(self.ID, input_name='ID'), eol_))
+        if self.UID is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<UID>%s</UID>%s' % (self.gds_format_integer(self.UID, input_name='UID'), eol_))
+        if self.GID is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<GID>%s</GID>%s' % (self.gds_format_integer(self.GID, input_name='GID'), eol_))
+        if self.UNAME is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<UNAME>%s</UNAME>%s' % (self.gds_encode(self.gds_format_string(quote_xml(self.UNAME), input_name='UNAME')), eol_))
+        if self.GNAME is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<GNAME>%s</GNAME>%s' % (self.gds_encode(self.gds_format_string(quote_xml(self.GNAME), input_name='GNAME')), eol_))
+        if self.NAME is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<NAME>%s</NAME>%s' % (self.gds_encode(self.gds_format_string(quote_xml(self.NAME), input_name='NAME')), eol_))
+        if self.PERMISSIONS is not None:
+            self.PERMISSIONS.export(outfile, level, namespaceprefix_, name_='PERMISSIONS', pretty_print=pretty_print)
+        if self.LAST_POLL is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<LAST_POLL>%s</LAST_POLL>%s' % (self.gds_format_integer(self.LAST_POLL, input_name='LAST_POLL'), eol_))
+        if self.STATE is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<STATE>%s</STATE>%s' % (self.gds_format_integer(self.STATE, input_name='STATE'), eol_))
+        if self.LCM_STATE is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<LCM_STATE>%s</LCM_STATE>%s' % (self.gds_format_integer(self.LCM_STATE, input_name='LCM_STATE'), eol_))
+        if self.PREV_STATE is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<PREV_STATE>%s</PREV_STATE>%s' % (self.gds_format_integer(self.PREV_STATE, input_name='PREV_STATE'), eol_))
+        if self.PREV_LCM_STATE is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<PREV_LCM_STATE>%s</PREV_LCM_STATE>%s' % (self.gds_format_integer(self.PREV_LCM_STATE, input_name='PREV_LCM_STATE'), eol_))
+        if self.RESCHED is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<RESCHED>%s</RESCHED>%s' % (self.gds_format_integer(self.RESCHED, input_name='RESCHED'), eol_))
+        if self.STIME is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<STIME>%s</STIME>%s' % (self.gds_format_integer(self.STIME, input_name='STIME'), eol_))
+        if self.ETIME is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<ETIME>%s</ETIME>%s' % (self.gds_format_integer(self.ETIME, input_name='ETIME'), eol_))
+        if self.DEPLOY_ID is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<DEPLOY_ID>%s</DEPLOY_ID>%s' % (self.gds_encode(self.gds_format_string(quote_xml(self.DEPLOY_ID), input_name='DEPLOY_ID')), eol_))
+        if self.MONITORING is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<MONITORING>%s</MONITORING>%s' % (self.gds_encode(self.gds_format_string(quote_xml(self.MONITORING), input_name='MONITORING')), eol_))
+        if self.TEMPLATE is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<TEMPLATE>%s</TEMPLATE>%s' % (self.gds_encode(self.gds_format_string(quote_xml(self.TEMPLATE), input_name='TEMPLATE')), eol_))
+        if self.USER_TEMPLATE is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<USER_TEMPLATE>%s</USER_TEMPLATE>%s' % (self.gds_encode(self.gds_format_string(quote_xml(self.USER_TEMPLATE), input_name='USER_TEMPLATE')), eol_))
+        if self.HISTORY_RECORDS is not None:
+            self.HISTORY_RECORDS.export(outfile, level, namespaceprefix_, name_='HISTORY_RECORDS', pretty_print=pretty_print)
+        for SNAPSHOTS_ in self.SNAPSHOTS:
+            SNAPSHOTS_.export(outfile, level, namespaceprefix_, name_='SNAPSHOTS', pretty_print=pretty_print)
+    def build(self, node):
+        already_processed = set()
+        self.buildAttributes(node, node.attrib, already_processed)
+        for child in node:
+            nodeName_ = Tag_pattern_.match(child.tag).groups()[-1]
+            self.buildChildren(child, node, nodeName_)
+        return self
+    def buildAttributes(self, node, attrs, already_processed):
+        pass
+    def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
+        if nodeName_ == 'ID' and child_.text:
+            sval_ = child_.text
+            try:
+                ival_ = int(sval_)
+            except (TypeError, ValueError) as exp:
+                raise_parse_error(child_, 'requires integer: %s' % exp)
+            ival_ = self.gds_validate_integer(ival_, node, 'ID')
+            self.ID = ival_
+        elif nodeName_ == 'UID' and child_.text:
+            sval_ = child_.text
+            try:
+                ival_ = int(sval_)
+            except (TypeError, ValueError) as exp:
+                raise_parse_error(child_, 'requires integer: %s' % exp)
+            ival_ = self.gds_validate_integer(ival_, node, 'UID')
+            self.UID = ival_
+        elif nodeName_ == 'GID' and child_.text:
+            sval_ = child_.text
+            try:
+                ival_ = int(sval_)
+            except (TypeError, ValueError) as exp:
+                raise_parse_error(child_, 'requires integer: %s' % exp)
+            ival_ = self.gds_validate_integer(ival_, node, 'GID')
+            self.GID = ival_
+        elif nodeName_ == 'UNAME':
+            UNAME_ = child_.text
+            UNAME_ = self.gds_validate_string(UNAME_, node, 'UNAME')
+            self.UNAME = UNAME_
+        elif nodeName_ == 'GNAME':
+            GNAME_ = child_.text
+            GNAME_ = self.gds_validate_string(GNAME_, node, 'GNAME')
+            self.GNAME = GNAME_
+        elif nodeName_ == 'NAME':
+            NAME_ = child_.text
+            NAME_ = self.gds_validate_string(NAME_, node, 'NAME')
+            self.NAME = NAME_
+        elif nodeName_ == 'PERMISSIONS':
+            obj_ = PERMISSIONSType79.factory()
+            obj_.build(child_)
+            self.PERMISSIONS = obj_
+            obj_.original_tagname_ = 'PERMISSIONS'
+        elif nodeName_ == 'LAST_POLL' and child_.text:
+            sval_ = child_.text
+            try:
+                ival_ = int(sval_)
+            except (TypeError, ValueError) as exp:
+                raise_parse_error(child_, 'requires integer: %s' % exp)
+            ival_ = self.gds_validate_integer(ival_, node, 'LAST_POLL')
+            self.LAST_POLL = ival_
+        elif nodeName_ == 'STATE' and child_.text:
+            sval_ = child_.text
+            try:
+                ival_ = int(sval_)
+            except (TypeError, ValueError) as exp:
+                raise_parse_error(child_, 'requires integer: %s' % exp)
+            ival_ = self.gds_validate_integer(ival_, node, 'STATE')
+            self.STATE = ival_
+        elif nodeName_ == 'LCM_STATE' and child_.text:
+            sval_ = child_.text
+            try:
+                ival_ = int(sval_)
+            except (TypeError, ValueError) as exp:
+                raise_parse_error(child_, 'requires integer: %s' % exp)
+            ival_ = self.gds_validate_integer(ival_, node, 'LCM_STATE')
+            self.LCM_STATE = ival_
+        elif nodeName_ == 'PREV_STATE' and child_.text:
+            sval_ = child_.text
+            try:
+                ival_ = int(sval_)
+            except (TypeError, ValueError) as exp:
+                raise_parse_error(child_, 'requires integer: %s' % exp)
+            ival_ = self.gds_validate_integer(ival_, node, 'PREV_STATE')
+            self.PREV_STATE = ival_
+        elif nodeName_ == 'PREV_LCM_STATE' and child_.text:
+            sval_ = child_.text
+            try:
+                ival_ = int(sval_)
+            except (TypeError, ValueError) as exp:
+                raise_parse_error(child_, 'requires integer: %s' % exp)
+            ival_ = self.gds_validate_integer(ival_, node, 'PREV_LCM_STATE')
+            self.PREV_LCM_STATE = ival_
+        elif nodeName_ == 'RESCHED' and child_.text:
+            sval_ = child_.text
+            try:
+                ival_ = int(sval_)
+            except (TypeError, ValueError) as exp:
+                raise_parse_error(child_, 'requires integer: %s' % exp)
+            ival_ = self.gds_validate_integer(ival_, node, 'RESCHED')
+            self.RESCHED = ival_
+        elif nodeName_ == 'STIME' and child_.text:
+            sval_ = child_.text
+            try:
+                ival_ = int(sval_)
+            except (TypeError, ValueError) as exp:
+                raise_parse_error(child_, 'requires integer: %s' % exp)
+            ival_ = self.gds_validate_integer(ival_, node, 'STIME')
+            self.STIME = ival_
+        elif nodeName_ == 'ETIME' and child_.text:
+            sval_ = child_.text
+            try:
+                ival_ = int(sval_)
+            except (TypeError, ValueError) as exp:
+                raise_parse_error(child_, 'requires integer: %s' % exp)
+            ival_ = self.gds_validate_integer(ival_, node, 'ETIME')
+            self.ETIME = ival_
+        elif nodeName_ == 'DEPLOY_ID':
+            DEPLOY_ID_ = child_.text
+            DEPLOY_ID_ = self.gds_validate_string(DEPLOY_ID_, node, 'DEPLOY_ID')
+            self.DEPLOY_ID = DEPLOY_ID_
+        elif nodeName_ == 'MONITORING':
+            MONITORING_ = child_.text
+            MONITORING_ = self.gds_validate_string(MONITORING_, node, 'MONITORING')
+            self.MONITORING = MONITORING_
+        elif nodeName_ == 'TEMPLATE':
+            TEMPLATE_ = child_.text
+            TEMPLATE_ = self.gds_validate_string(TEMPLATE_, node, 'TEMPLATE')
+            self.TEMPLATE = TEMPLATE_
+        elif nodeName_ == 'USER_TEMPLATE':
+            USER_TEMPLATE_ = child_.text
+            USER_TEMPLATE_ = self.gds_validate_string(USER_TEMPLATE_, node, 'USER_TEMPLATE')
+            self.USER_TEMPLATE = USER_TEMPLATE_
+        elif nodeName_ == 'HISTORY_RECORDS':
+            obj_ = HISTORY_RECORDSType.factory()
+            obj_.build(child_)
+            self.HISTORY_RECORDS = obj_
+            obj_.original_tagname_ = 'HISTORY_RECORDS'
+        elif nodeName_ == 'SNAPSHOTS':
+            obj_ = SNAPSHOTSType80.factory()
+            obj_.build(child_)
+            self.SNAPSHOTS.append(obj_)
+            obj_.original_tagname_ = 'SNAPSHOTS'
+# end class VM
+
+
+class PERMISSIONSType79(GeneratedsSuper):
+    subclass = None
+    superclass = None
+    def __init__(self, OWNER_U=None, OWNER_M=None, OWNER_A=None, GROUP_U=None, GROUP_M=None, GROUP_A=None, OTHER_U=None, OTHER_M=None, OTHER_A=None):
+        self.original_tagname_ = None
+        self.OWNER_U = OWNER_U
+        self.OWNER_M = OWNER_M
+        self.OWNER_A = OWNER_A
+        self.GROUP_U = GROUP_U
+        self.GROUP_M = GROUP_M
+        self.GROUP_A = GROUP_A
+        self.OTHER_U = OTHER_U
+        self.OTHER_M = OTHER_M
+        self.OTHER_A = OTHER_A
+    def factory(*args_, **kwargs_):
+        if supermod.CurrentSubclassModule_ is not None:
+            subclass = getSubclassFromModule_(
+                supermod.CurrentSubclassModule_, PERMISSIONSType79)
+            if subclass is not None:
+                return subclass(*args_, **kwargs_)
+        if PERMISSIONSType79.subclass:
+            return PERMISSIONSType79.subclass(*args_, **kwargs_)
+        else:
+            return PERMISSIONSType79(*args_, **kwargs_)
+    factory = staticmethod(factory)
+    def get_OWNER_U(self): return self.OWNER_U
+    def set_OWNER_U(self, OWNER_U): self.OWNER_U = OWNER_U
+    def get_OWNER_M(self): return self.OWNER_M
+    def set_OWNER_M(self, OWNER_M): self.OWNER_M = OWNER_M
+    def get_OWNER_A(self): return self.OWNER_A
+    def set_OWNER_A(self, OWNER_A): self.OWNER_A = OWNER_A
+    def get_GROUP_U(self): return self.GROUP_U
+    def set_GROUP_U(self, GROUP_U): self.GROUP_U = GROUP_U
+    def get_GROUP_M(self): return self.GROUP_M
+    def set_GROUP_M(self, GROUP_M): self.GROUP_M = GROUP_M
+    def get_GROUP_A(self): return self.GROUP_A
+    def set_GROUP_A(self, GROUP_A): self.GROUP_A = GROUP_A
+    def get_OTHER_U(self): return self.OTHER_U
+    def set_OTHER_U(self, OTHER_U): self.OTHER_U = OTHER_U
+    def get_OTHER_M(self): return self.OTHER_M
+    def set_OTHER_M(self, OTHER_M): self.OTHER_M = OTHER_M
+    def get_OTHER_A(self): return self.OTHER_A
+    def set_OTHER_A(self, OTHER_A): self.OTHER_A = OTHER_A
+    def hasContent_(self):
+        if (
+            self.OWNER_U is not None or
+            self.OWNER_M is not None or
+            self.OWNER_A is not None or
+            self.GROUP_U is not None or
+            self.GROUP_M is not None or
+            self.GROUP_A is not None or
+            self.OTHER_U is not None or
+            self.OTHER_M is not None or
+            self.OTHER_A is not None
+        ):
+            return True
+        else:
+            return False
+    def export(self, outfile, level, namespaceprefix_='', name_='PERMISSIONSType79', namespacedef_='', pretty_print=True):
+        imported_ns_def_ = GenerateDSNamespaceDefs_.get('PERMISSIONSType79')
+        if imported_ns_def_ is not None:
+            namespacedef_ = imported_ns_def_
+        if pretty_print:
+            eol_ = '\n'
+        else:
+            eol_ = ''
+        if self.original_tagname_ is not None:
+            name_ = self.original_tagname_
+        showIndent(outfile, level, pretty_print)
+        outfile.write('<%s%s%s' % (namespaceprefix_, name_, namespacedef_ and ' ' + namespacedef_ or '', ))
+        already_processed = set()
+        self.exportAttributes(outfile, level, already_processed, namespaceprefix_, name_='PERMISSIONSType79')
+        if self.hasContent_():
+            outfile.write('>%s' % (eol_, ))
+            self.exportChildren(outfile, level + 1, namespaceprefix_='', name_='PERMISSIONSType79', pretty_print=pretty_print)
+            showIndent(outfile, level, pretty_print)
+            outfile.write('</%s%s>%s' % (namespaceprefix_, name_, eol_))
+        else:
+            outfile.write('/>%s' % (eol_, ))
+    def exportAttributes(self, outfile, level, already_processed, namespaceprefix_='', name_='PERMISSIONSType79'):
+        pass
+    def exportChildren(self, outfile, level, namespaceprefix_='', name_='PERMISSIONSType79', fromsubclass_=False, pretty_print=True):
+        if pretty_print:
+            eol_ = '\n'
+        else:
+            eol_ = ''
+        if self.OWNER_U is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<OWNER_U>%s</OWNER_U>%s' % (self.gds_format_integer(self.OWNER_U, input_name='OWNER_U'), eol_))
+        if self.OWNER_M is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<OWNER_M>%s</OWNER_M>%s' % (self.gds_format_integer(self.OWNER_M, input_name='OWNER_M'), eol_))
+        if self.OWNER_A is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<OWNER_A>%s</OWNER_A>%s' % (self.gds_format_integer(self.OWNER_A, input_name='OWNER_A'), eol_))
+        if self.GROUP_U is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<GROUP_U>%s</GROUP_U>%s' % (self.gds_format_integer(self.GROUP_U, input_name='GROUP_U'), eol_))
+        if self.GROUP_M is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<GROUP_M>%s</GROUP_M>%s' % (self.gds_format_integer(self.GROUP_M, input_name='GROUP_M'), eol_))
+        if self.GROUP_A is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<GROUP_A>%s</GROUP_A>%s' % (self.gds_format_integer(self.GROUP_A, input_name='GROUP_A'), eol_))
+        if self.OTHER_U is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<OTHER_U>%s</OTHER_U>%s' % (self.gds_format_integer(self.OTHER_U, input_name='OTHER_U'), eol_))
+        if self.OTHER_M is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<OTHER_M>%s</OTHER_M>%s' % (self.gds_format_integer(self.OTHER_M, input_name='OTHER_M'), eol_))
+        if self.OTHER_A is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<OTHER_A>%s</OTHER_A>%s' % (self.gds_format_integer(self.OTHER_A, input_name='OTHER_A'), eol_))
+    def build(self, node):
+        already_processed = set()
+        self.buildAttributes(node, node.attrib, already_processed)
+        for child in node:
+            nodeName_ = Tag_pattern_.match(child.tag).groups()[-1]
+            self.buildChildren(child, node, nodeName_)
+        return self
+    def buildAttributes(self, node, attrs, already_processed):
+        pass
+    def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
+        if nodeName_ == 'OWNER_U' and child_.text:
+            sval_ = child_.text
+            try:
+                ival_ = int(sval_)
+            except (TypeError, ValueError) as exp:
+                raise_parse_error(child_, 'requires integer: %s' % exp)
+            ival_ = self.gds_validate_integer(ival_, node, 'OWNER_U')
+            self.OWNER_U = ival_
+        elif nodeName_ == 'OWNER_M' and child_.text:
+            sval_ = child_.text
+            try:
+                ival_ = int(sval_)
+            except (TypeError, ValueError) as exp:
+                raise_parse_error(child_, 'requires integer: %s' % exp)
+            ival_ = self.gds_validate_integer(ival_, node, 'OWNER_M')
+            self.OWNER_M = ival_
+        elif nodeName_ == 'OWNER_A' and child_.text:
+            sval_ = child_.text
+            try:
+                ival_ = int(sval_)
+            except (TypeError, ValueError) as exp:
+                raise_parse_error(child_, 'requires integer: %s' % exp)
+            ival_ = self.gds_validate_integer(ival_, node, 'OWNER_A')
+            self.OWNER_A = ival_
+        elif nodeName_ == 'GROUP_U' and child_.text:
+            sval_ = child_.text
+            try:
+                ival_ = int(sval_)
+            except (TypeError, ValueError) as exp:
+                raise_parse_error(child_, 'requires integer: %s' % exp)
+            ival_ = self.gds_validate_integer(ival_, node, 'GROUP_U')
+            self.GROUP_U = ival_
+        elif nodeName_ == 'GROUP_M' and child_.text:
+            sval_ = child_.text
+            try:
+                ival_ = int(sval_)
+            except (TypeError, ValueError) as exp:
+                raise_parse_error(child_, 'requires integer: %s' % exp)
+            ival_ = self.gds_validate_integer(ival_, node, 'GROUP_M')
+            self.GROUP_M = ival_
+        elif nodeName_ == 'GROUP_A' and child_.text:
+            sval_ = child_.text
+            try:
+                ival_ = int(sval_)
+            except (TypeError, ValueError) as exp:
+                raise_parse_error(child_, 'requires integer: %s' % exp)
+            ival_ = self.gds_validate_integer(ival_, node, 'GROUP_A')
+            self.GROUP_A = ival_
+        elif nodeName_ == 'OTHER_U' and child_.text:
+            sval_ = child_.text
+            try:
+                ival_ = int(sval_)
+            except (TypeError, ValueError) as exp:
+                raise_parse_error(child_, 'requires integer: %s' % exp)
+            ival_ = self.gds_validate_integer(ival_, node, 'OTHER_U')
+            self.OTHER_U = ival_
+        elif nodeName_ == 'OTHER_M' and child_.text:
+            sval_ = child_.text
+            try:
+                ival_ = int(sval_)
+            except (TypeError, ValueError) as exp:
+                raise_parse_error(child_, 'requires integer: %s' % exp)
+            ival_ = self.gds_validate_integer(ival_, node, 'OTHER_M')
+            self.OTHER_M = ival_
+        elif nodeName_ == 'OTHER_A' and child_.text:
+            sval_ = child_.text
+            try:
+                ival_ = int(sval_)
+            except (TypeError, ValueError) as exp:
+                raise_parse_error(child_, 'requires integer: %s' % exp)
+            ival_ = self.gds_validate_integer(ival_, node, 'OTHER_A')
+            self.OTHER_A = ival_
+# end class PERMISSIONSType79
+
+
+class HISTORY_RECORDSType(GeneratedsSuper):
+    subclass = None
+    superclass = None
+    def __init__(self, HISTORY=None):
+        self.original_tagname_ = None
+        if HISTORY is None:
+            self.HISTORY = []
+        else:
+            self.HISTORY = HISTORY
+    def factory(*args_, **kwargs_):
+        if supermod.CurrentSubclassModule_ is not None:
+            subclass = getSubclassFromModule_(
+                supermod.CurrentSubclassModule_, HISTORY_RECORDSType)
+            if subclass is not None:
+                return subclass(*args_, **kwargs_)
+        if HISTORY_RECORDSType.subclass:
+            return HISTORY_RECORDSType.subclass(*args_, **kwargs_)
+        else:
+            return HISTORY_RECORDSType(*args_, **kwargs_)
+    factory = staticmethod(factory)
+    def get_HISTORY(self): return self.HISTORY
+    def set_HISTORY(self, HISTORY): self.HISTORY = HISTORY
+    def add_HISTORY(self, value): self.HISTORY.append(value)
+    def insert_HISTORY_at(self, index, value): self.HISTORY.insert(index, value)
+    def replace_HISTORY_at(self, index, value): self.HISTORY[index] = value
+    def hasContent_(self):
+        if (
+            self.HISTORY
+        ):
+            return True
+        else:
+            return False
+    def export(self, outfile, level, namespaceprefix_='', name_='HISTORY_RECORDSType', namespacedef_='', pretty_print=True):
+        imported_ns_def_ = GenerateDSNamespaceDefs_.get('HISTORY_RECORDSType')
+        if imported_ns_def_ is not None:
+            namespacedef_ = imported_ns_def_
+        if pretty_print:
+            eol_ = '\n'
+        else:
+            eol_ = ''
+        if self.original_tagname_ is not None:
+            name_ = self.original_tagname_
+        showIndent(outfile, level, pretty_print)
+        outfile.write('<%s%s%s' % (namespaceprefix_, name_, namespacedef_ and ' ' + namespacedef_ or '', ))
+        already_processed = set()
+        self.exportAttributes(outfile, level, already_processed, namespaceprefix_, name_='HISTORY_RECORDSType')
+        if self.hasContent_():
+            outfile.write('>%s' % (eol_, ))
+            self.exportChildren(outfile, level + 1, namespaceprefix_='', name_='HISTORY_RECORDSType', pretty_print=pretty_print)
+            showIndent(outfile, level, pretty_print)
+            outfile.write('</%s%s>%s' % (namespaceprefix_, name_, eol_))
+        else:
+            outfile.write('/>%s' % (eol_, ))
+    def exportAttributes(self, outfile, level, already_processed, namespaceprefix_='', name_='HISTORY_RECORDSType'):
+        pass
+    def exportChildren(self, outfile, level, namespaceprefix_='', name_='HISTORY_RECORDSType', fromsubclass_=False, pretty_print=True):
+        if pretty_print:
+            eol_ = '\n'
+        else:
+            eol_ = ''
+        for HISTORY_ in self.HISTORY:
+            HISTORY_.export(outfile, level, namespaceprefix_, name_='HISTORY', pretty_print=pretty_print)
+    def build(self, node):
+        already_processed = set()
+        self.buildAttributes(node, node.attrib, already_processed)
+        for child in node:
+            nodeName_ = Tag_pattern_.match(child.tag).groups()[-1]
+            self.buildChildren(child, node, nodeName_)
+        return self
+    def buildAttributes(self, node, attrs, already_processed):
+        pass
+    def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
+        if nodeName_ == 'HISTORY':
+            obj_ = HISTORYType.factory()
+            obj_.build(child_)
+            self.HISTORY.append(obj_)
+            obj_.original_tagname_ = 'HISTORY'
+# end class HISTORY_RECORDSType
+
+
+class HISTORYType(GeneratedsSuper):
+    subclass = None
+    superclass = None
+    def __init__(self, OID=None, SEQ=None, HOSTNAME=None, HID=None, CID=None, STIME=None, ETIME=None, VM_MAD=None, TM_MAD=None, DS_ID=None, PSTIME=None, PETIME=None, RSTIME=None, RETIME=None, ESTIME=None, EETIME=None, ACTION=None, UID=None, GID=None, REQUEST_ID=None):
+        self.original_tagname_ = None
+        self.OID = OID
+        self.SEQ = SEQ
+        self.HOSTNAME = HOSTNAME
+        self.HID = HID
+        self.CID = CID
+        self.STIME = STIME
+        self.ETIME = ETIME
+        self.VM_MAD = VM_MAD
+        self.TM_MAD = TM_MAD
+        self.DS_ID = DS_ID
+        self.PSTIME = PSTIME
+        self.PETIME = PETIME
+        self.RSTIME = RSTIME
+        self.RETIME = RETIME
+        self.ESTIME = ESTIME
+        self.EETIME = EETIME
+        self.ACTION = ACTION
+        self.UID = UID
+        self.GID = GID
+        self.REQUEST_ID = REQUEST_ID
+    def factory(*args_, **kwargs_):
+        if supermod.CurrentSubclassModule_ is not None:
+            subclass = getSubclassFromModule_(
+                supermod.CurrentSubclassModule_, HISTORYType)
+            if subclass is not None:
+                return subclass(*args_, **kwargs_)
+        if HISTORYType.subclass:
+            return HISTORYType.subclass(*args_, **kwargs_)
+        else:
+            return HISTORYType(*args_, **kwargs_)
+    factory = staticmethod(factory)
+    def get_OID(self): return self.OID
+    def set_OID(self, OID): self.OID = OID
+    def get_SEQ(self): return self.SEQ
+    def set_SEQ(self, SEQ): self.SEQ = SEQ
+    def get_HOSTNAME(self): return self.HOSTNAME
+    def set_HOSTNAME(self, HOSTNAME): self.HOSTNAME = HOSTNAME
+    def get_HID(self): return self.HID
+    def set_HID(self, HID): self.HID = HID
+    def get_CID(self): return self.CID
+    def set_CID(self, CID): self.CID = CID
+    def get_STIME(self): return self.STIME
+    def set_STIME(self, STIME): self.STIME = STIME
+    def get_ETIME(self): return self.ETIME
+    def set_ETIME(self, ETIME): self.ETIME = ETIME
+    def get_VM_MAD(self): return self.VM_MAD
+    def set_VM_MAD(self, VM_MAD): self.VM_MAD = VM_MAD
+    def get_TM_MAD(self): return self.TM_MAD
+    def set_TM_MAD(self, TM_MAD): self.TM_MAD = TM_MAD
+    def get_DS_ID(self): return self.DS_ID
+    def set_DS_ID(self, DS_ID): self.DS_ID = DS_ID
+    def get_PSTIME(self): return self.PSTIME
+    def set_PSTIME(self, PSTIME): self.PSTIME = PSTIME
+    def get_PETIME(self): return self.PETIME
+    def set_PETIME(self, PETIME): self.PETIME = PETIME
+    def get_RSTIME(self): return self.RSTIME
+    def set_RSTIME(self, RSTIME): self.RSTIME = RSTIME
+    def get_RETIME(self): return self.RETIME
+    def set_RETIME(self, RETIME): self.RETIME = RETIME
+    def get_ESTIME(self): return self.ESTIME
+    def set_ESTIME(self, ESTIME): self.ESTIME = ESTIME
+    def get_EETIME(self): return self.EETIME
+    def set_EETIME(self, EETIME): self.EETIME = EETIME
+    def get_ACTION(self): return self.ACTION
+    def set_ACTION(self, ACTION): self.ACTION = ACTION
+    def get_UID(self): return self.UID
+    def set_UID(self, UID): self.UID = UID
+    def get_GID(self): return self.GID
+    def set_GID(self, GID): self.GID = GID
+    def get_REQUEST_ID(self): return self.REQUEST_ID
+    def set_REQUEST_ID(self, REQUEST_ID): self.REQUEST_ID = REQUEST_ID
+    def hasContent_(self):
+        if (
+            self.OID is not None or
+            self.SEQ is not None or
+            self.HOSTNAME is not None or
+            self.HID is not None or
+            self.CID is not None or
+            self.STIME is not None or
+            self.ETIME is not None or
+            self.VM_MAD is not None or
+            self.TM_MAD is not None or
+            self.DS_ID is not None or
+            self.PSTIME is not None or
+            self.PETIME is not None or
+            self.RSTIME is not None or
+            self.RETIME is not None or
+            self.ESTIME is not None or
+            self.EETIME is not None or
+            self.ACTION is not None or
+            self.UID is not None or
+            self.GID is not None or
+            self.REQUEST_ID is not None
+        ):
+            return True
+        else:
+            return False
+    def export(self, outfile, level, namespaceprefix_='', name_='HISTORYType', namespacedef_='', pretty_print=True):
+        imported_ns_def_ = GenerateDSNamespaceDefs_.get('HISTORYType')
+        if imported_ns_def_ is not None:
+            namespacedef_ = imported_ns_def_
+        if pretty_print:
+            eol_ = '\n'
+        else:
+            eol_ = ''
+        if self.original_tagname_ is not None:
+            name_ = self.original_tagname_
+        showIndent(outfile, level, pretty_print)
+        outfile.write('<%s%s%s' % (namespaceprefix_, name_, namespacedef_ and ' ' + namespacedef_ or '', ))
+        already_processed = set()
+        self.exportAttributes(outfile, level, already_processed, namespaceprefix_, name_='HISTORYType')
+        if self.hasContent_():
+            outfile.write('>%s' % (eol_, ))
+            self.exportChildren(outfile, level + 1, namespaceprefix_='', name_='HISTORYType', pretty_print=pretty_print)
+            showIndent(outfile, level, pretty_print)
+            outfile.write('</%s%s>%s' % (namespaceprefix_, name_, eol_))
+        else:
+            outfile.write('/>%s' % (eol_, ))
+    def exportAttributes(self, outfile, level, already_processed, namespaceprefix_='', name_='HISTORYType'):
+        pass
+    def exportChildren(self, outfile, level, namespaceprefix_='', name_='HISTORYType', fromsubclass_=False, pretty_print=True):
+        if pretty_print:
+            eol_ = '\n'
+        else:
+            eol_ = ''
+        if self.OID is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<OID>%s</OID>%s' % (self.gds_format_integer(self.OID, input_name='OID'), eol_))
+        if self.SEQ is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<SEQ>%s</SEQ>%s' % (self.gds_format_integer(self.SEQ, input_name='SEQ'), eol_))
+        if self.HOSTNAME is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<HOSTNAME>%s</HOSTNAME>%s' % (self.gds_encode(self.gds_format_string(quote_xml(self.HOSTNAME), input_name='HOSTNAME')), eol_))
+        if self.HID is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<HID>%s</HID>%s' % (self.gds_format_integer(self.HID, input_name='HID'), eol_))
+        if self.CID is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<CID>%s</CID>%s' % (self.gds_format_integer(self.CID, input_name='CID'), eol_))
+        if self.STIME is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<STIME>%s</STIME>%s' % (self.gds_format_integer(self.STIME, input_name='STIME'), eol_))
+        if self.ETIME is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<ETIME>%s</ETIME>%s' % (self.gds_format_integer(self.ETIME, input_name='ETIME'), eol_))
+        if self.VM_MAD is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<VM_MAD>%s</VM_MAD>%s' % (self.gds_encode(self.gds_format_string(quote_xml(self.VM_MAD), input_name='VM_MAD')), eol_))
+        if self.TM_MAD is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<TM_MAD>%s</TM_MAD>%s' % (self.gds_encode(self.gds_format_string(quote_xml(self.TM_MAD), input_name='TM_MAD')), eol_))
+        if self.DS_ID is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<DS_ID>%s</DS_ID>%s' % (self.gds_format_integer(self.DS_ID, input_name='DS_ID'), eol_))
+        if self.PSTIME is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<PSTIME>%s</PSTIME>%s' % (self.gds_format_integer(self.PSTIME, input_name='PSTIME'), eol_))
+        if self.PETIME is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<PETIME>%s</PETIME>%s' % (self.gds_format_integer(self.PETIME, input_name='PETIME'), eol_))
+        if self.RSTIME is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<RSTIME>%s</RSTIME>%s' % (self.gds_format_integer(self.RSTIME, input_name='RSTIME'), eol_))
+        if self.RETIME is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<RETIME>%s</RETIME>%s' % (self.gds_format_integer(self.RETIME, input_name='RETIME'), eol_))
+        if self.ESTIME is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<ESTIME>%s</ESTIME>%s' % (self.gds_format_integer(self.ESTIME, input_name='ESTIME'), eol_))
+        if self.EETIME is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<EETIME>%s</EETIME>%s' % (self.gds_format_integer(self.EETIME, input_name='EETIME'), eol_))
+        if self.ACTION is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<ACTION>%s</ACTION>%s' % (self.gds_format_integer(self.ACTION, input_name='ACTION'), eol_))
+        if self.UID is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<UID>%s</UID>%s' % (self.gds_format_integer(self.UID, input_name='UID'), eol_))
+        if self.GID is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<GID>%s</GID>%s' % (self.gds_format_integer(self.GID, input_name='GID'), eol_))
+        if self.REQUEST_ID is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<REQUEST_ID>%s</REQUEST_ID>%s' % (self.gds_encode(self.gds_format_string(quote_xml(self.REQUEST_ID), input_name='REQUEST_ID')), eol_))
+    def build(self, node):
+        already_processed = set()
+        self.buildAttributes(node, node.attrib, already_processed)
+        for child in node:
+            nodeName_ = Tag_pattern_.match(child.tag).groups()[-1]
+            self.buildChildren(child, node, nodeName_)
+        return self
+    def buildAttributes(self, node, attrs, already_processed):
+        pass
+    def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
+        if nodeName_ == 'OID' and child_.text:
+            sval_ = child_.text
+            try:
+                ival_ = int(sval_)
+            except (TypeError, ValueError) as exp:
+                raise_parse_error(child_, 'requires integer: %s' % exp)
+            ival_ = self.gds_validate_integer(ival_, node, 'OID')
+            self.OID = ival_
+        elif nodeName_ == 'SEQ' and child_.text:
+            sval_ = child_.text
+            try:
+                ival_ = int(sval_)
+            except (TypeError, ValueError) as exp:
+                raise_parse_error(child_, 'requires integer: %s' % exp)
+            ival_ = self.gds_validate_integer(ival_, node, 'SEQ')
+            self.SEQ = ival_
+        elif nodeName_ == 'HOSTNAME':
+            HOSTNAME_ = child_.text
+            HOSTNAME_ = self.gds_validate_string(HOSTNAME_, node, 'HOSTNAME')
+            self.HOSTNAME = HOSTNAME_
+        elif nodeName_ == 'HID' and child_.text:
+            sval_ = child_.text
+            try:
+                ival_ = int(sval_)
+            except (TypeError, ValueError) as exp:
+                raise_parse_error(child_, 'requires integer: %s' % exp)
+            ival_ = self.gds_validate_integer(ival_, node, 'HID')
+            self.HID = ival_
+        elif nodeName_ == 'CID' and child_.text:
+            sval_ = child_.text
+            try:
+                ival_ = int(sval_)
+            except (TypeError, ValueError) as exp:
+                raise_parse_error(child_, 'requires integer: %s' % exp)
+            ival_ = self.gds_validate_integer(ival_, node, 'CID')
+            self.CID = ival_
+        elif nodeName_ == 'STIME' and child_.text:
+            sval_ = child_.text
+            try:
+                ival_ = int(sval_)
+            except (TypeError, ValueError) as exp:
+                raise_parse_error(child_, 'requires integer: %s' % exp)
+            ival_ = self.gds_validate_integer(ival_, node, 'STIME')
+            self.STIME = ival_
+        elif nodeName_ == 'ETIME' and child_.text:
+            sval_ = child_.text
+            try:
+                ival_ = int(sval_)
+            except (TypeError, ValueError) as exp:
+                raise_parse_error(child_, 'requires integer: %s' % exp)
+            ival_ = self.gds_validate_integer(ival_, node, 'ETIME')
+            self.ETIME = ival_
+        elif nodeName_ == 'VM_MAD':
+            VM_MAD_ = child_.text
+            VM_MAD_ = self.gds_validate_string(VM_MAD_, node, 'VM_MAD')
+            self.VM_MAD = VM_MAD_
+        elif nodeName_ == 'TM_MAD':
+            TM_MAD_ = child_.text
+            TM_MAD_ = self.gds_validate_string(TM_MAD_, node, 'TM_MAD')
+            self.TM_MAD = TM_MAD_
+        elif nodeName_ == 'DS_ID' and child_.text:
+            sval_ = child_.text
+            try:
+                ival_ = int(sval_)
+            except (TypeError, ValueError) as exp:
+                raise_parse_error(child_, 'requires integer: %s' % exp)
+            ival_ = self.gds_validate_integer(ival_, node, 'DS_ID')
+            self.DS_ID = ival_
+        elif nodeName_ == 'PSTIME' and child_.text:
+            sval_ = child_.text
+            try:
+                ival_ = int(sval_)
+            except (TypeError, ValueError) as exp:
+                raise_parse_error(child_, 'requires integer: %s' % exp)
+            ival_ = self.gds_validate_integer(ival_, node, 'PSTIME')
+            self.PSTIME = ival_
+        elif nodeName_ == 'PETIME' and child_.text:
+            sval_ = child_.text
+            try:
+                ival_ = int(sval_)
+            except (TypeError, ValueError) as exp:
+                raise_parse_error(child_, 'requires integer: %s' % exp)
+            ival_ = self.gds_validate_integer(ival_, node, 'PETIME')
+            self.PETIME = ival_
+        elif nodeName_ == 'RSTIME' and child_.text:
+            sval_ = child_.text
+            try:
+                ival_ = int(sval_)
+            except (TypeError, ValueError) as exp:
+                raise_parse_error(child_, 'requires integer: %s' % exp)
+            ival_ = self.gds_validate_integer(ival_, node, 'RSTIME')
+            self.RSTIME = ival_
+        elif nodeName_ == 'RETIME' and child_.text:
+            sval_ = child_.text
+            try:
+                ival_ = int(sval_)
+            except (TypeError, ValueError) as exp:
+                raise_parse_error(child_, 'requires integer: %s' % exp)
+            ival_ = self.gds_validate_integer(ival_, node, 'RETIME')
+            self.RETIME = ival_
+        elif nodeName_ == 'ESTIME' and child_.text:
+            sval_ = child_.text
+            try:
+                ival_ = int(sval_)
+            except (TypeError, ValueError) as exp:
+                raise_parse_error(child_, 'requires integer: %s' % exp)
+            ival_ = self.gds_validate_integer(ival_, node, 'ESTIME')
+            self.ESTIME = ival_
+        elif nodeName_ == 'EETIME' and child_.text:
+            sval_ = child_.text
+            try:
+                ival_ = int(sval_)
+            except (TypeError, ValueError) as exp:
+                raise_parse_error(child_, 'requires integer: %s' % exp)
+            ival_ = self.gds_validate_integer(ival_, node, 'EETIME')
+            self.EETIME = ival_
+        elif nodeName_ == 'ACTION' and child_.text:
+            sval_ = child_.text
+            try:
+                ival_ = int(sval_)
+            except (TypeError, ValueError) as exp:
+                raise_parse_error(child_, 'requires integer: %s' % exp)
+            ival_ = self.gds_validate_integer(ival_, node, 'ACTION')
+            self.ACTION = ival_
+        elif nodeName_ == 'UID' and child_.text:
+            sval_ = child_.text
+            try:
+                ival_ = int(sval_)
+            except (TypeError, ValueError) as exp:
+                raise_parse_error(child_, 'requires integer: %s' % exp)
+            ival_ = self.gds_validate_integer(ival_, node, 'UID')
+            self.UID = ival_
+        elif nodeName_ == 'GID' and child_.text:
+            sval_ = child_.text
+            try:
+                ival_ = int(sval_)
+            except (TypeError, ValueError) as exp:
+                raise_parse_error(child_, 'requires integer: %s' % exp)
+            ival_ = self.gds_validate_integer(ival_, node, 'GID')
+            self.GID = ival_
+        elif nodeName_ == 'REQUEST_ID':
+            REQUEST_ID_ = child_.text
+            REQUEST_ID_ = self.gds_validate_string(REQUEST_ID_, node, 'REQUEST_ID')
+            self.REQUEST_ID = REQUEST_ID_
+# end class HISTORYType
+
+
+class SNAPSHOTSType80(GeneratedsSuper):
+    subclass = None
+    superclass = None
+    def __init__(self, DISK_ID=None, SNAPSHOT=None):
+        self.original_tagname_ = None
+        self.DISK_ID = DISK_ID
+        if SNAPSHOT is None:
+            self.SNAPSHOT = []
+        else:
+            self.SNAPSHOT = SNAPSHOT
+    def factory(*args_, **kwargs_):
+        if supermod.CurrentSubclassModule_ is not None:
+            subclass = getSubclassFromModule_(
+                supermod.CurrentSubclassModule_, SNAPSHOTSType80)
+            if subclass is not None:
+                return subclass(*args_, **kwargs_)
+        if SNAPSHOTSType80.subclass:
+            return SNAPSHOTSType80.subclass(*args_, **kwargs_)
+        else:
+            return SNAPSHOTSType80(*args_, **kwargs_)
+    factory = staticmethod(factory)
+    def get_DISK_ID(self): return self.DISK_ID
+    def set_DISK_ID(self, DISK_ID): self.DISK_ID = DISK_ID
+    def get_SNAPSHOT(self): return self.SNAPSHOT
+    def set_SNAPSHOT(self, SNAPSHOT): self.SNAPSHOT = SNAPSHOT
+    def add_SNAPSHOT(self, value): self.SNAPSHOT.append(value)
+    def insert_SNAPSHOT_at(self, index, value): self.SNAPSHOT.insert(index, value)
+    def replace_SNAPSHOT_at(self, index, value): self.SNAPSHOT[index] = value
+    def hasContent_(self):
+        if (
+            self.DISK_ID is not None or
+            self.SNAPSHOT
+        ):
+            return True
+        else:
+            return False
+    def export(self, outfile, level, namespaceprefix_='', name_='SNAPSHOTSType80', namespacedef_='', pretty_print=True):
+        imported_ns_def_ = GenerateDSNamespaceDefs_.get('SNAPSHOTSType80')
+        if imported_ns_def_ is not None:
+            namespacedef_ = imported_ns_def_
+        if pretty_print:
+            eol_ = '\n'
+        else:
+            eol_ = ''
+        if self.original_tagname_ is not None:
+            name_ = self.original_tagname_
+        showIndent(outfile, level, pretty_print)
+        outfile.write('<%s%s%s' % (namespaceprefix_, name_, namespacedef_ and ' ' + namespacedef_ or '', ))
+        already_processed = set()
+        self.exportAttributes(outfile, level, already_processed, namespaceprefix_, name_='SNAPSHOTSType80')
+        if self.hasContent_():
+            outfile.write('>%s' % (eol_, ))
+            self.exportChildren(outfile, level + 1, namespaceprefix_='', name_='SNAPSHOTSType80', pretty_print=pretty_print)
+            showIndent(outfile, level, pretty_print)
+            outfile.write('</%s%s>%s' % (namespaceprefix_, name_, eol_))
+        else:
+            outfile.write('/>%s' % (eol_, ))
+    def exportAttributes(self, outfile, level, already_processed, namespaceprefix_='', name_='SNAPSHOTSType80'):
+        pass
+    def exportChildren(self, outfile, level, namespaceprefix_='', name_='SNAPSHOTSType80', fromsubclass_=False, pretty_print=True):
+        if pretty_print:
+            eol_ = '\n'
+        else:
+            eol_ = ''
+        if self.DISK_ID is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<DISK_ID>%s</DISK_ID>%s' % (self.gds_format_integer(self.DISK_ID, input_name='DISK_ID'), eol_))
+        for SNAPSHOT_ in self.SNAPSHOT:
+            SNAPSHOT_.export(outfile, level, namespaceprefix_, name_='SNAPSHOT', pretty_print=pretty_print)
+    def build(self, node):
+        already_processed = set()
+        self.buildAttributes(node, node.attrib, already_processed)
+        for child in node:
+            nodeName_ = Tag_pattern_.match(child.tag).groups()[-1]
+            self.buildChildren(child, node, nodeName_)
+        return self
+    def buildAttributes(self, node, attrs, already_processed):
+        pass
+    def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
+        if nodeName_ == 'DISK_ID' and child_.text:
+            sval_ = child_.text
+            try:
+                ival_ = int(sval_)
+            except (TypeError, ValueError) as exp:
+                raise_parse_error(child_, 'requires integer: %s' % exp)
+            ival_ = self.gds_validate_integer(ival_, node, 'DISK_ID')
+            self.DISK_ID = ival_
+        elif nodeName_ == 'SNAPSHOT':
+            obj_ = SNAPSHOTType81.factory()
+            obj_.build(child_)
+            self.SNAPSHOT.append(obj_)
+            obj_.original_tagname_ = 'SNAPSHOT'
+# end class SNAPSHOTSType80
+
+
+class SNAPSHOTType81(GeneratedsSuper):
+    subclass = None
+    superclass = None
+    def __init__(self, ACTIVE=None, CHILDREN=None, DATE=None, ID=None, NAME=None, PARENT=None, SIZE=None):
+        self.original_tagname_ = None
+        self.ACTIVE = ACTIVE
+        self.CHILDREN = CHILDREN
+        self.DATE = DATE
+        self.ID = ID
+        self.NAME = NAME
+        self.PARENT = PARENT
+        self.SIZE = SIZE
+    def factory(*args_, **kwargs_):
+        if supermod.CurrentSubclassModule_ is not None:
+            subclass = getSubclassFromModule_(
+                supermod.CurrentSubclassModule_, SNAPSHOTType81)
+            if subclass is not None:
+                return subclass(*args_, **kwargs_)
+        if SNAPSHOTType81.subclass:
+            return SNAPSHOTType81.subclass(*args_, **kwargs_)
+        else:
+            return SNAPSHOTType81(*args_, **kwargs_)
+    factory = staticmethod(factory)
+    def get_ACTIVE(self): return self.ACTIVE
+    def set_ACTIVE(self, ACTIVE): self.ACTIVE = ACTIVE
+    def get_CHILDREN(self): return self.CHILDREN
+    def set_CHILDREN(self, CHILDREN): self.CHILDREN = CHILDREN
+    def get_DATE(self): return self.DATE
+    def set_DATE(self, DATE): self.DATE = DATE
+    def get_ID(self): return self.ID
+    def set_ID(self, ID): self.ID = ID
+    def get_NAME(self): return self.NAME
+    def set_NAME(self, NAME): self.NAME = NAME
+    def get_PARENT(self): return self.PARENT
+    def set_PARENT(self, PARENT): self.PARENT = PARENT
+    def get_SIZE(self): return self.SIZE
+    def set_SIZE(self, SIZE): self.SIZE = SIZE
+    def hasContent_(self):
+        if (
+            self.ACTIVE is not None or
+            self.CHILDREN is not None or
+            self.DATE is not None or
+            self.ID is not None or
+            self.NAME is not None or
+            self.PARENT is not None or
+            self.SIZE is not None
+        ):
+            return True
+        else:
+            return False
+    def export(self, outfile, level, namespaceprefix_='', name_='SNAPSHOTType81', namespacedef_='', pretty_print=True):
+        imported_ns_def_ = GenerateDSNamespaceDefs_.get('SNAPSHOTType81')
+        if imported_ns_def_ is not None:
+            namespacedef_ = imported_ns_def_
+        if pretty_print:
+            eol_ = '\n'
+        else:
+            eol_ = ''
+        if self.original_tagname_ is not None:
+            name_ = self.original_tagname_
+        showIndent(outfile, level, pretty_print)
+        outfile.write('<%s%s%s' % (namespaceprefix_, name_, namespacedef_ and ' ' + namespacedef_ or '', ))
+        already_processed = set()
+        self.exportAttributes(outfile, level, already_processed, namespaceprefix_, name_='SNAPSHOTType81')
+        if self.hasContent_():
+            outfile.write('>%s' % (eol_, ))
+            self.exportChildren(outfile, level + 1, namespaceprefix_='', name_='SNAPSHOTType81', pretty_print=pretty_print)
+            showIndent(outfile, level, pretty_print)
+            outfile.write('</%s%s>%s' % (namespaceprefix_, name_, eol_))
+        else:
+            outfile.write('/>%s' % (eol_, ))
+    def exportAttributes(self, outfile, level, already_processed, namespaceprefix_='', name_='SNAPSHOTType81'):
+        pass
+    def exportChildren(self, outfile, level, namespaceprefix_='', name_='SNAPSHOTType81', fromsubclass_=False, pretty_print=True):
+        if pretty_print:
+            eol_ = '\n'
+        else:
+            eol_ = ''
+        if self.ACTIVE is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<ACTIVE>%s</ACTIVE>%s' % (self.gds_encode(self.gds_format_string(quote_xml(self.ACTIVE), input_name='ACTIVE')), eol_))
+        if self.CHILDREN is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<CHILDREN>%s</CHILDREN>%s' % (self.gds_encode(self.gds_format_string(quote_xml(self.CHILDREN), input_name='CHILDREN')), eol_))
+        if self.DATE is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<DATE>%s</DATE>%s' % (self.gds_format_integer(self.DATE, input_name='DATE'), eol_))
+        if self.ID is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<ID>%s</ID>%s' % (self.gds_format_integer(self.ID, input_name='ID'), eol_))
+        if self.NAME is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<NAME>%s</NAME>%s' % (self.gds_encode(self.gds_format_string(quote_xml(self.NAME), input_name='NAME')), eol_))
+        if self.PARENT is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<PARENT>%s</PARENT>%s' % (self.gds_format_integer(self.PARENT, input_name='PARENT'), eol_))
+        if self.SIZE is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<SIZE>%s</SIZE>%s' % (self.gds_format_integer(self.SIZE, input_name='SIZE'), eol_))
+    def build(self, node):
+        already_processed = set()
+        self.buildAttributes(node, node.attrib, already_processed)
+        for child in node:
+            nodeName_ = Tag_pattern_.match(child.tag).groups()[-1]
+            self.buildChildren(child, node, nodeName_)
+        return self
+    def buildAttributes(self, node, attrs, already_processed):
+        pass
+    def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
+        if nodeName_ == 'ACTIVE':
+            ACTIVE_ = child_.text
+            ACTIVE_ = self.gds_validate_string(ACTIVE_, node, 'ACTIVE')
+            self.ACTIVE = ACTIVE_
+        elif nodeName_ == 'CHILDREN':
+            CHILDREN_ = child_.text
+            CHILDREN_ = self.gds_validate_string(CHILDREN_, node, 'CHILDREN')
+            self.CHILDREN = CHILDREN_
+        elif nodeName_ == 'DATE' and child_.text:
+            sval_ = child_.text
+            try:
+                ival_ = int(sval_)
+            except (TypeError, ValueError) as exp:
+                raise_parse_error(child_, 'requires integer: %s' % exp)
+            ival_ = self.gds_validate_integer(ival_, node, 'DATE')
+            self.DATE = ival_
+        elif nodeName_ == 'ID' and child_.text:
+            sval_ = child_.text
+            try:
+                ival_ = int(sval_)
+            except (TypeError, ValueError) as exp:
+                raise_parse_error(child_, 'requires integer: %s' % exp)
+            ival_ = self.gds_validate_integer(ival_, node, 'ID')
+            self.ID = ival_
+        elif nodeName_ == 'NAME':
+            NAME_ = child_.text
+            NAME_ = self.gds_validate_string(NAME_, node, 'NAME')
+            self.NAME = NAME_
+        elif nodeName_ == 'PARENT' and child_.text:
+            sval_ = child_.text
+            try:
+                ival_ = int(sval_)
+            except (TypeError, ValueError) as exp:
+                raise_parse_error(child_, 'requires integer: %s' % exp)
+            ival_ = self.gds_validate_integer(ival_, node, 'PARENT')
+            self.PARENT = ival_
+        elif nodeName_ == 'SIZE' and child_.text:
+            sval_ = child_.text
+            try:
+                ival_ = int(sval_)
+            except (TypeError, ValueError) as exp:
+                raise_parse_error(child_, 'requires integer: %s' % exp)
+            ival_ = self.gds_validate_integer(ival_, node, 'SIZE')
+            self.SIZE = ival_
+# end class SNAPSHOTType81
+
+
+class VM_POOLSub(TemplatedType, VM_POOL):
+    def __init__(self, VM=None):
+        super(VM_POOLSub, self).__init__(VM, )
+VM_POOL.subclass = VM_POOLSub
+# end class VM_POOLSub
+
+
+class VMSub(TemplatedType, VM):
+    def __init__(self, ID=None, UID=None, GID=None, UNAME=None, GNAME=None, NAME=None, PERMISSIONS=None, LAST_POLL=None, STATE=None, LCM_STATE=None, PREV_STATE=None, PREV_LCM_STATE=None, RESCHED=None, STIME=None, ETIME=None, DEPLOY_ID=None, MONITORING=None, TEMPLATE=None, USER_TEMPLATE=None, HISTORY_RECORDS=None, SNAPSHOTS=None):
+        super(VMSub, self).__init__(ID, UID, GID, UNAME, GNAME, NAME, PERMISSIONS, LAST_POLL, STATE, LCM_STATE, PREV_STATE, PREV_LCM_STATE, RESCHED, STIME, ETIME, DEPLOY_ID, MONITORING, TEMPLATE, USER_TEMPLATE, HISTORY_RECORDS, SNAPSHOTS, )
+VM.subclass = VMSub
+# end class VMSub
+
+
+class PERMISSIONSType79Sub(TemplatedType, PERMISSIONSType79):
+    def __init__(self, OWNER_U=None, OWNER_M=None, OWNER_A=None, GROUP_U=None, GROUP_M=None, GROUP_A=None, OTHER_U=None, OTHER_M=None, OTHER_A=None):
+        super(PERMISSIONSType79Sub, self).__init__(OWNER_U, OWNER_M, OWNER_A, GROUP_U, GROUP_M, GROUP_A, OTHER_U, OTHER_M, OTHER_A, )
+PERMISSIONSType79.subclass = PERMISSIONSType79Sub
+# end class PERMISSIONSType79Sub
+
+
+class HISTORY_RECORDSTypeSub(TemplatedType, HISTORY_RECORDSType):
+    def __init__(self, HISTORY=None):
+        super(HISTORY_RECORDSTypeSub, self).__init__(HISTORY, )
+HISTORY_RECORDSType.subclass = HISTORY_RECORDSTypeSub
+# end class HISTORY_RECORDSTypeSub
+
+
+class HISTORYTypeSub(TemplatedType, HISTORYType):
+    def __init__(self, OID=None, SEQ=None, HOSTNAME=None, HID=None, CID=None, STIME=None, ETIME=None, VM_MAD=None, TM_MAD=None, DS_ID=None, PSTIME=None, PETIME=None, RSTIME=None, RETIME=None, ESTIME=None, EETIME=None, ACTION=None, UID=None, GID=None, REQUEST_ID=None):
+        super(HISTORYTypeSub, self).__init__(OID, SEQ, HOSTNAME, HID, CID, STIME, ETIME, VM_MAD, TM_MAD, DS_ID, PSTIME, PETIME, RSTIME, RETIME, ESTIME, EETIME, ACTION, UID, GID, REQUEST_ID, )
+HISTORYType.subclass = HISTORYTypeSub
+# end class HISTORYTypeSub
+
+
+class SNAPSHOTSType80Sub(TemplatedType, SNAPSHOTSType80):
+    def __init__(self, DISK_ID=None, SNAPSHOT=None):
+        super(SNAPSHOTSType80Sub, self).__init__(DISK_ID, SNAPSHOT, )
+SNAPSHOTSType80.subclass = SNAPSHOTSType80Sub
+# end class SNAPSHOTSType80Sub
+
+
+class SNAPSHOTType81Sub(TemplatedType, SNAPSHOTType81):
+    def __init__(self, ACTIVE=None, CHILDREN=None, DATE=None, ID=None, NAME=None, PARENT=None, SIZE=None):
+        super(SNAPSHOTType81Sub, self).__init__(ACTIVE, CHILDREN, DATE, ID, NAME, PARENT, SIZE, )
+SNAPSHOTType81.subclass = SNAPSHOTType81Sub
+# end class SNAPSHOTType81Sub
+
+
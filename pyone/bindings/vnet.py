@@ -0,0 +1,1337 @@
+#!/usr/bin/env python
+
+#
+# Bindings of VNET, generated by generateDS.py and split from supbind by src/split_bindings.py
+#
+
+import sys
+import re as re_
+import base64
+import datetime as datetime_
+import warnings as warnings_
+try:
+    from lxml import etree as etree_
+except ImportError:
+    from xml.etree import ElementTree as etree_
+from pyone.util import TemplatedType
+from . import supbind as supermod
+from .supbind import (
+    GenerateDSNamespaceDefs_,
+    GeneratedsSuper,
+    Tag_pattern_,
+    getSubclassFromModule_,
+    quote_xml,
+    raise_parse_error,
+    showIndent,
+)
+
+
+class VNET(GeneratedsSuper):
+    subclass = None
+    superclass = None
+    def __init__(self, ID=None, UID=None, GID=None, UNAME=None, GNAME=None, NAME=None, PERMISSIONS=None, CLUSTERS=None, BRIDGE=None, PARENT_NETWORK_ID=None, VN_MAD=None, PHYDEV=None, VLAN_ID=None, VLAN_ID_AUTOMATIC=None, USED_LEASES=None, VROUTERS=None, TEMPLATE=None, AR_POOL=None):
+        self.original_tagname_ = None
+        self.ID = ID
+        self.UID = UID
+        self.GID = GID
+        self.UNAME = UNAME
+        self.GNAME = GNAME
+        self.NAME = NAME
+        self.PERMISSIONS = PERMISSIONS
+        self.CLUSTERS = CLUSTERS
+        self.BRIDGE = BRIDGE
+        self.PARENT_NETWORK_ID = PARENT_NETWORK_ID
+        self.VN_MAD = VN_MAD
+        self.PHYDEV = PHYDEV
+        self.VLAN_ID = VLAN_ID
+        self.VLAN_ID_AUTOMATIC = VLAN_ID_AUTOMATIC
+        self.USED_LEASES = USED_LEASES
+        self.VROUTERS = VROUTERS
+        self.TEMPLATE = TEMPLATE
+        self.AR_POOL = AR_POOL
+    def factory(*args_, **kwargs_):
+        if supermod.CurrentSubclassModule_ is not None:
+            subclass = getSubclassFromModule_(
+                supermod.CurrentSubclassModule_, VNET)
+            if subclass is not None:
+                return subclass(*args_, **kwargs_)
+        if VNET.subclass:
+            return VNET.subclass(*args_, **kwargs_)
+        else:
+            return VNET(*args_, **kwargs_)
+    factory = staticmethod(factory)
+    def get_ID(self): return self.ID
+    def set_ID(self, ID): self.ID = ID
+    def get_UID(self): return self.UID
+    def set_UID(self, UID): self.UID = UID
+    def get_GID(self): return self.GID
+    def set_GID(self, GID): self.GID = GID
+    def get_UNAME(self): return self.UNAME
+    def set_UNAME(self, UNAME): self.UNAME = UNAME
+    def get_GNAME(self): return self.GNAME
+    def set_GNAME(self, GNAME): self.GNAME = GNAME
+    def get_NAME(self): return self.NAME
+    def set_NAME(self, NAME): self.NAME = NAME
+    def get_PERMISSIONS(self): return self.PERMISSIONS
+    def set_PERMISSIONS(self, PERMISSIONS): self.PERMISSIONS = PERMISSIONS
+    def get_CLUSTERS(self): return self.CLUSTERS
+    def set_CLUSTERS(self, CLUSTERS): self.CLUSTERS = CLUSTERS
+    def get_BRIDGE(self): return self.BRIDGE
+    def set_BRIDGE(self, BRIDGE): self.BRIDGE = BRIDGE
+    def get_PARENT_NETWORK_ID(self): return self.PARENT_NETWORK_ID
+    def set_PARENT_NETWORK_ID(self, PARENT_NETWORK_ID): self.PARENT_NETWORK_ID = PARENT_NETWORK_ID
+    def get_VN_MAD(self): return self.VN_MAD
+    def set_VN_MAD(self, VN_MAD): self.VN_MAD = VN_MAD
+    def get_PHYDEV(self): return self.PHYDEV
+    def set_PHYDEV(self, PHYDEV): self.PHYDEV = PHYDEV
+    def get_VLAN_ID(self): return self.VLAN_ID
+    def set_VLAN_ID(self, VLAN_ID): self.VLAN_ID = VLAN_ID
+    def get_VLAN_ID_AUTOMATIC(self): return self.VLAN_ID_AUTOMATIC
+    def set_VLAN_ID_AUTOMATIC(self, VLAN_ID_AUTOMATIC): self.VLAN_ID_AUTOMATIC = VLAN_ID_AUTOMATIC
+    def get_USED_LEASES(self): return self.USED_LEASES
+    def set_USED_LEASES(self, USED_LEASES): self.USED_LEASES = USED_LEASES
+    def get_VROUTERS(self): return self.VROUTERS
+    def set_VROUTERS(self, VROUTERS): self.VROUTERS = VROUTERS
+    def get_TEMPLATE(self): return self.TEMPLATE
+    def set_TEMPLATE(self, TEMPLATE): self.TEMPLATE = TEMPLATE
+    def get_AR_POOL(self): return self.AR_POOL
+    def set_AR_POOL(self, AR_POOL): self.AR_POOL = AR_POOL
+    def hasContent_(self):
+        if (
+            self.ID is not None or
+            self.UID is not None or
+            self.GID is not None or
+            self.UNAME is not None or
+            self.GNAME is not None or
+            self.NAME is not None or
+            self.PERMISSIONS is not None or
+            self.CLUSTERS is not None or
+            self.BRIDGE is not None or
+            self.PARENT_NETWORK_ID is not None or
+            self.VN_MAD is not None or
+            self.PHYDEV is not None or
+            self.VLAN_ID is not None or
+            self.VLAN_ID_AUTOMATIC is not None or
+            self.USED_LEASES is not None or
+            self.VROUTERS is not None or
+            self.TEMPLATE is not None or
+            self.AR_POOL is not None
+        ):
+            return True
+        else:
+            return False
+    def export(self, outfile, level, namespaceprefix_='', name_='VNET', namespacedef_='', pretty_print=True):
+        imported_ns_def_ = GenerateDSNamespaceDefs_.get('VNET')
+        if imported_ns_def_ is not None:
+            namespacedef_ = imported_ns_def_
+        if pretty_print:
+            eol_ = '\n'
+        else:
+            eol_ = ''
+        if self.original_tagname_ is not None:
+            name_ = self.original_tagname_
+        showIndent(outfile, level, pretty_print)
+        outfile.write('<%s%s%s' % (namespaceprefix_, name_, namespacedef_ and ' ' + namespacedef_ or '', ))
+        already_processed = set()
+        self.exportAttributes(outfile, level, already_processed, namespaceprefix_, name_='VNET')
+        if self.hasContent_():
+            outfile.write('>%s' % (eol_, ))
+            self.exportChildren(outfile, level + 1, namespaceprefix_='', name_='VNET', pretty_print=pretty_print)
+            showIndent(outfile, level, pretty_print)
+            outfile.write('</%s%s>%s' % (namespaceprefix_, name_, eol_))
+        else:
+            outfile.write('/>%s' % (eol_, ))
+    def exportAttributes(self, outfile, level, already_processed, namespaceprefix_='', name_='VNET'):
+        pass
+    def exportChildren(self, outfile, level, namespaceprefix_='', name_='VNET', fromsubclass_=False, pretty_print=True):
+        if pretty_print:
+            eol_ = '\n'
+        else:
+            eol_ = ''
+        if self.ID is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<ID>%s</ID>%s' % (self.gds_format_integer(self.ID, input_name='ID'), eol_))
+        if self.UID is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<UID>%s</UID>%s' % (self.gds_format_integer(self.UID, input_name='UID'), eol_))
+        if self.GID is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<GID>%s</GID>%s' % (self.gds_format_integer(self.GID, input_name='GID'), eol_))
+        if self.UNAME is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<UNAME>%s</UNAME>%s' % (self.gds_encode(self.gds_format_string(quote_xml(self.UNAME), input_name='UNAME')), eol_))
+        if self.GNAME is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<GNAME>%s</GNAME>%s' % (self.gds_encode(self.gds_format_string(quote_xml(self.GNAME), input_name='GNAME')), eol_))
+        if self.NAME is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<NAME>%s</NAME>%s' % (self.gds_encode(self.gds_format_string(quote_xml(self.NAME), input_name='NAME')), eol_))
+        if self.PERMISSIONS is not None:
+            self.PERMISSIONS.export(outfile, level, namespaceprefix_, name_='PERMISSIONS', pretty_print=pretty_print)
+        if self.CLUSTERS is not None:
+            self.CLUSTERS.export(outfile, level, namespaceprefix_, name_='CLUSTERS', pretty_print=pretty_print)
+        if self.BRIDGE is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<BRIDGE>%s</BRIDGE>%s' % (self.gds_encode(self.gds_format_string(quote_xml(self.BRIDGE), input_name='BRIDGE')), eol_))
+        if self.PARENT_NETWORK_ID is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<PARENT_NETWORK_ID>%s</PARENT_NETWORK_ID>%s' % (self.gds_encode(self.gds_format_string(quote_xml(self.PARENT_NETWORK_ID), input_name='PARENT_NETWORK_ID')), eol_))
+        if self.VN_MAD is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<VN_MAD>%s</VN_MAD>%s' % (self.gds_encode(self.gds_format_string(quote_xml(self.VN_MAD), input_name='VN_MAD')), eol_))
+        if self.PHYDEV is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<PHYDEV>%s</PHYDEV>%s' % (self.gds_encode(self.gds_format_string(quote_xml(self.PHYDEV), input_name='PHYDEV')), eol_))
+        if self.VLAN_ID is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<VLAN_ID>%s</VLAN_ID>%s' % (self.gds_encode(self.gds_format_string(quote_xml(self.VLAN_ID), input_name='VLAN_ID')), eol_))
+        if self.VLAN_ID_AUTOMATIC is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<VLAN_ID_AUTOMATIC>%s</VLAN_ID_AUTOMATIC>%s' % (self.gds_encode(self.gds_format_string(quote_xml(self.VLAN_ID_AUTOMATIC), input_name='VLAN_ID_AUTOMATIC')), eol_))
+        if self.USED_LEASES is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<USED_LEASES>%s</USED_LEASES>%s' % (self.gds_format_integer(self.USED_LEASES, input_name='USED_LEASES'), eol_))
+        if self.VROUTERS is not None:
+            self.VROUTERS.export(outfile, level, namespaceprefix_, name_='VROUTERS', pretty_print=pretty_print)
+        if self.TEMPLATE is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<TEMPLATE>%s</TEMPLATE>%s' % (self.gds_encode(self.gds_format_string(quote_xml(self.TEMPLATE), input_name='TEMPLATE')), eol_))
+        if self.AR_POOL is not None:
+            self.AR_POOL.export(outfile, level, namespaceprefix_, name_='AR_POOL', pretty_print=pretty_print)
+    def build(self, node):
+        already_processed = set()
+        self.buildAttributes(node, node.attrib, already_processed)
+        for child in node:
+            nodeName_ = Tag_pattern_.match(child.tag).groups()[-1]
+            self.buildChildren(child, node, nodeName_)
+        return self
+    def buildAttributes(self, node, attrs, already_processed):
+        pass
+    def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
+        if nodeName_ == 'ID' and child_.text:
+            sval_ = child_.text
+            try:
+                ival_ = int(sval_)
+            except (TypeError, ValueError) as exp:
+                raise_parse_error(child_, 'requires integer: %s' % exp)
+            ival_ = self.gds_validate_integer(ival_, node, 'ID')
+            self.ID = ival_
+        elif nodeName_ == 'UID' and child_.text:
+            sval_ = child_.text
+            try:
+                ival_ = int(sval_)
+            except (TypeError, ValueError) as exp:
+                raise_parse_error(child_, 'requires integer: %s' % exp)
+            ival_ = self.gds_validate_integer(ival_, node, 'UID')
+            self.UID = ival_
+        elif nodeName_ == 'GID' and child_.text:
+            sval_ = child_.text
+            try:
+                ival_ = int(sval_)
+            except (TypeError, ValueError) as exp:
+                raise_parse_error(child_, 'requires integer: %s' % exp)
+            ival_ = self.gds_validate_integer(ival_, node, 'GID')
+            self.GID = ival_
+        elif nodeName_ == 'UNAME':
+            UNAME_ = child_.text
+            UNAME_ = self.gds_validate_string(UNAME_, node, 'UNAME')
+            self.UNAME = UNAME_
+        elif nodeName_ == 'GNAME':
+            GNAME_ = child_.text
+            GNAME_ = self.gds_validate_string(GNAME_, node, 'GNAME')
+            self.GNAME = GNAME_
+        elif nodeName_ == 'NAME':
+            NAME_ = child_.text
+            NAME_ = self.gds_validate_string(NAME_, node, 'NAME')
+            self.NAME = NAME_
+        elif nodeName_ == 'PERMISSIONS':
+            obj_ = PERMISSIONSType86.factory()
+            obj_.build(child_)
+            self.PERMISSIONS = obj_
+            obj_.original_tagname_ = 'PERMISSIONS'
+        elif nodeName_ == 'CLUSTERS':
+            obj_ = CLUSTERSType87.factory()
+            obj_.build(child_)
+            self.CLUSTERS = obj_
+            obj_.original_tagname_ = 'CLUSTERS'
+        elif nodeName_ == 'BRIDGE':
+            BRIDGE_ = child_.text
+            BRIDGE_ = self.gds_validate_string(BRIDGE_, node, 'BRIDGE')
+            self.BRIDGE = BRIDGE_
+        elif nodeName_ == 'PARENT_NETWORK_ID':
+            PARENT_NETWORK_ID_ = child_.text
+            PARENT_NETWORK_ID_ = self.gds_validate_string(PARENT_NETWORK_ID_, node, 'PARENT_NETWORK_ID')
+            self.PARENT_NETWORK_ID = PARENT_NETWORK_ID_
+        elif nodeName_ == 'VN_MAD':
+            VN_MAD_ = child_.text
+            VN_MAD_ = self.gds_validate_string(VN_MAD_, node, 'VN_MAD')
+            self.VN_MAD = VN_MAD_
+        elif nodeName_ == 'PHYDEV':
+            PHYDEV_ = child_.text
+            PHYDEV_ = self.gds_validate_string(PHYDEV_, node, 'PHYDEV')
+            self.PHYDEV = PHYDEV_
+        elif nodeName_ == 'VLAN_ID':
+            VLAN_ID_ = child_.text
+            VLAN_ID_ = self.gds_validate_string(VLAN_ID_, node, 'VLAN_ID')
+            self.VLAN_ID = VLAN_ID_
+        elif nodeName_ == 'VLAN_ID_AUTOMATIC':
+            VLAN_ID_AUTOMATIC_ = child_.text
+            VLAN_ID_AUTOMATIC_ = self.gds_validate_string(VLAN_ID_AUTOMATIC_, node, 'VLAN_ID_AUTOMATIC')
+            self.VLAN_ID_AUTOMATIC = VLAN_ID_AUTOMATIC_
+        elif nodeName_ == 'USED_LEASES' and child_.text:
+            sval_ = child_.text
+            try:
+                ival_ = int(sval_)
+            except (TypeError, ValueError) as exp:
+                raise_parse_error(child_, 'requires integer: %s' % exp)
+            ival_ = self.gds_validate_integer(ival_, node, 'USED_LEASES')
+            self.USED_LEASES = ival_
+        elif nodeName_ == 'VROUTERS':
+            obj_ = VROUTERSType88.factory()
+            obj_.build(child_)
+            self.VROUTERS = obj_
+            obj_.original_tagname_ = 'VROUTERS'
+        elif nodeName_ == 'TEMPLATE':
+            TEMPLATE_ = child_.text
+            TEMPLATE_ = self.gds_validate_string(TEMPLATE_, node, 'TEMPLATE')
+            self.TEMPLATE = TEMPLATE_
+        elif nodeName_ == 'AR_POOL':
+            obj_ = AR_POOLType89.factory()
+            obj_.build(child_)
+            self.AR_POOL = obj_
+            obj_.original_tagname_ = 'AR_POOL'
+# end class VNET
+
+
+class PERMISSIONSType86(GeneratedsSuper):
+    subclass = None
+    superclass = None
+    def __init__(self, OWNER_U=None, OWNER_M=None, OWNER_A=None, GROUP_U=None, GROUP_M=None, GROUP_A=None, OTHER_U=None, OTHER_M=None, OTHER_A=None):
+        self.original_tagname_ = None
+        self.OWNER_U = OWNER_U
+        self.OWNER_M = OWNER_M
+        self.OWNER_A = OWNER_A
+        self.GROUP_U = GROUP_U
+        self.GROUP_M = GROUP_M
+        self.GROUP_A = GROUP_A
+        self.OTHER_U = OTHER_U
+        self.OTHER_M = OTHER_M
+        self.OTHER_A = OTHER_A
+    def factory(*args_, **kwargs_):
+        if supermod.CurrentSubclassModule_ is not None:
+            subclass = getSubclassFromModule_(
+                supermod.CurrentSubclassModule_, PERMISSIONSType86)
+            if subclass is not None:
+                return subclass(*args_, **kwargs_)
+        if PERMISSIONSType86.subclass:
+            return PERMISSIONSType86.subclass(*args_, **kwargs_)
+        else:
+            return PERMISSIONSType86(*args_, **kwargs_)
+    factory = staticmethod(factory)
+    def get_OWNER_U(self): return self.OWNER_U
+    def set_OWNER_U(self, OWNER_U): self.OWNER_U = OWNER_U
+    def get_OWNER_M(self): return self.OWNER_M
+    def set_OWNER_M(self, OWNER_M): self.OWNER_M = OWNER_M
+    def get_OWNER_A(self): return self.OWNER_A
+    def set_OWNER_A(self, OWNER_A): self.OWNER_A = OWNER_A
+    def get_GROUP_U(self): return self.GROUP_U
+    def set_GROUP_U(self, GROUP_U): self.GROUP_U = GROUP_U
+    def get_GROUP_M(self): return self.GROUP_M
+    def set_GROUP_M(self, GROUP_M): self.GROUP_M = GROUP_M
+    def get_GROUP_A(self): return self.GROUP_A
+    def set_GROUP_A(self, GROUP_A): self.GROUP_A = GROUP_A
+    def get_OTHER_U(self): return self.OTHER_U
+    def set_OTHER_U(self, OTHER_U): self.OTHER_U = OTHER_U
+    def get_OTHER_M(self): return self.OTHER_M
+    def set_OTHER_M(self, OTHER_M): self.OTHER_M = OTHER_M
+    def get_OTHER_A(self): return self.OTHER_A
+    def set_OTHER_A(self, OTHER_A): self.OTHER_A = OTHER_A
+    def hasContent_(self):
+        if (
+            self.OWNER_U is not None or
+            self.OWNER_M is not None or
+            self.OWNER_A is not None or
+            self.GROUP_U is not None or
+            self.GROUP_M is not None or
+            self.GROUP_A is not None or
+            self.OTHER_U is not None or
+            self.OTHER_M is not None or
+            self.OTHER_A is not None
+        ):
+            return True
+        else:
+            return False
+    def export(self, outfile, level, namespaceprefix_='', name_='PERMISSIONSType86', namespacedef_='', pretty_print=True):
+        imported_ns_def_ = GenerateDSNamespaceDefs_.get('PERMISSIONSType86')
+        if imported_ns_def_ is not None:
+            namespacedef_ = imported_ns_def_
+        if pretty_print:
+            eol_ = '\n'
+        else:
+            eol_ = ''
+        if self.original_tagname_ is not None:
+            name_ = self.original_tagname_
+        showIndent(outfile, level, pretty_print)
+        outfile.write('<%s%s%s' % (namespaceprefix_, name_, namespacedef_ and ' ' + namespacedef_ or '', ))
+        already_processed = set()
+        self.exportAttributes(outfile, level, already_processed, namespaceprefix_, name_='PERMISSIONSType86')
+        if self.hasContent_():
+            outfile.write('>%s' % (eol_, ))
+            self.exportChildren(outfile, level + 1, namespaceprefix_='', name_='PERMISSIONSType86', pretty_print=pretty_print)
+            showIndent(outfile, level, pretty_print)
+            outfile.write('</%s%s>%s' % (namespaceprefix_, name_, eol_))
+        else:
+            outfile.write('/>%s' % (eol_, ))
+    def exportAttributes(self, outfile, level, already_processed, namespaceprefix_='', name_='PERMISSIONSType86'):
+        pass
+    def exportChildren(self, outfile, level, namespaceprefix_='', name_='PERMISSIONSType86', fromsubclass_=False, pretty_print=True):
+        if pretty_print:
+            eol_ = '\n'
+        else:
+            eol_ = ''
+        if self.OWNER_U is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<OWNER_U>%s</OWNER_U>%s' % (self.gds_format_integer(self.OWNER_U, input_name='OWNER_U'), eol_))
+        if self.OWNER_M is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<OWNER_M>%s</OWNER_M>%s' % (self.gds_format_integer(self.OWNER_M, input_name='OWNER_M'), eol_))
+        if self.OWNER_A is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<OWNER_A>%s</OWNER_A>%s' % (self.gds_format_integer(self.OWNER_A, input_name='OWNER_A'), eol_))
+        if self.GROUP_U is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<GROUP_U>%s</GROUP_U>%s' % (self.gds_format_integer(self.GROUP_U, input_name='GROUP_U'), eol_))
+        if self.GROUP_M is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<GROUP_M>%s</GROUP_M>%s' % (self.gds_format_integer(self.GROUP_M, input_name='GROUP_M'), eol_))
+        if self.GROUP_A is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<GROUP_A>%s</GROUP_A>%s' % (self.gds_format_integer(self.GROUP_A, input_name='GROUP_A'), eol_))
+        if self.OTHER_U is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<OTHER_U>%s</OTHER_U>%s' % (self.gds_format_integer(self.OTHER_U, input_name='OTHER_U'), eol_))
+        if self.OTHER_M is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<OTHER_M>%s</OTHER_M>%s' % (self.gds_format_integer(self.OTHER_M, input_name='OTHER_M'), eol_))
+        if self.OTHER_A is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<OTHER_A>%s</OTHER_A>%s' % (self.gds_format_integer(self.OTHER_A, input_name='OTHER_A'), eol_))
+    def build(self, node):
+        already_processed = set()
+        self.buildAttributes(node, node.attrib, already_processed)
+        for child in node:
+            nodeName_ = Tag_pattern_.match(child.tag).groups()[-1]
+            self.buildChildren(child, node, nodeName_)
+        return self
+    def buildAttributes(self, node, attrs, already_processed):
+        pass
+    def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
+        if nodeName_ == 'OWNER_U' and child_.text:
+            sval_ = child_.text
+            try:
+                ival_ = int(sval_)
+            except (TypeError, ValueError) as exp:
+                raise_parse_error(child_, 'requires integer: %s' % exp)
+            ival_ = self.gds_validate_integer(ival_, node, 'OWNER_U')
+            self.OWNER_U = ival_
+        elif nodeName_ == 'OWNER_M' and child_.text:
+            sval_ = child_.text
+            try:
+                ival_ = int(sval_)
+            except (TypeError, ValueError) as exp:
+                raise_parse_error(child_, 'requires integer: %s' % exp)
+            ival_ = self.gds_validate_integer(ival_, node, 'OWNER_M')
+            self.OWNER_M = ival_
+        elif nodeName_ == 'OWNER_A' and child_.text:
+            sval_ = child_.text
+            try:
+                ival_ = int(sval_)
+            except (TypeError, ValueError) as exp:
+                raise_parse_error(child_, 'requires integer: %s' % exp)
+            ival_ = self.gds_validate_integer(ival_, node, 'OWNER_A')
+            self.OWNER_A = ival_
+        elif nodeName_ == 'GROUP_U' and child_.text:
+            sval_ = child_.text
+            try:
+                ival_ = int(sval_)
+            except (TypeError, ValueError) as exp:
+                raise_parse_error(child_, 'requires integer: %s' % exp)
+            ival_ = self.gds_validate_integer(ival_, node, 'GROUP_U')
+            self.GROUP_U = ival_
+        elif nodeName_ == 'GROUP_M' and child_.text:
+            sval_ = child_.text
+            try:
+                ival_ = int(sval_)
+            except (TypeError, ValueError) as exp:
+                raise_parse_error(child_, 'requires integer: %s' % exp)
+            ival_ = self.gds_validate_integer(ival_, node, 'GROUP_M')
+            self.GROUP_M = ival_
+        elif nodeName_ == 'GROUP_A' and child_.text:
+            sval_ = child_.text
+            try:
+                ival_ = int(sval_)
+            except (TypeError, ValueError) as exp:
+                raise_parse_error(child_, 'requires integer: %s' % exp)
+            ival_ = self.gds_validate_integer(ival_, node, 'GROUP_A')
+            self.GROUP_A = ival_
+        elif nodeName_ == 'OTHER_U' and child_.text:
+            sval_ = child_.text
+            try:
+                ival_ = int(sval_)
+            except (TypeError, ValueError) as exp:
+                raise_parse_error(child_, 'requires integer: %s' % exp)
+            ival_ = self.gds_validate_integer(ival_, node, 'OTHER_U')
+            self.OTHER_U = ival_
+        elif nodeName_ == 'OTHER_M' and child_.text:
+            sval_ = child_.text
+            try:
+                ival_ = int(sval_)
+            except (TypeError, ValueError) as exp:
+                raise_parse_error(child_, 'requires integer: %s' % exp)
+            ival_ = self.gds_validate_integer(ival_, node, 'OTHER_M')
+            self.OTHER_M = ival_
+        elif nodeName_ == 'OTHER_A' and child_.text:
+            sval_ = child_.text
+            try:
+                ival_ = int(sval_)
+            except (TypeError, ValueError) as exp:
+                raise_parse_error(child_, 'requires integer: %s' % exp)
+            ival_ = self.gds_validate_integer(ival_, node, 'OTHER_A')
+            self.OTHER_A = ival_
+# end class PERMISSIONSType86
+
+
+class CLUSTERSType87(GeneratedsSuper):
+    subclass = None
+    superclass = None
+    def __init__(self, ID=None):
+        self.original_tagname_ = None
+        if ID is None:
+            self.ID = []
+        else:
+            self.ID = ID
+    def factory(*args_, **kwargs_):
+        if supermod.CurrentSubclassModule_ is not None:
+            subclass = getSubclassFromModule_(
+                supermod.CurrentSubclassModule_, CLUSTERSType87)
+            if subclass is not None:
+                return subclass(*args_, **kwargs_)
+        if CLUSTERSType87.subclass:
+            return CLUSTERSType87.subclass(*args_, **kwargs_)
+        else:
+            return CLUSTERSType87(*args_, **kwargs_)
+    factory = staticmethod(factory)
+    def get_ID(self): return self.ID
+    def set_ID(self, ID): self.ID = ID
+    def add_ID(self, value): self.ID.append(value)
+    def insert_ID_at(self, index, value): self.ID.insert(index, value)
+    def replace_ID_at(self, index, value): self.ID[index] = value
+    def hasContent_(self):
+        if (
+            self.ID
+        ):
+            return True
+        else:
+            return False
+    def export(self, outfile, level, namespaceprefix_='', name_='CLUSTERSType87', namespacedef_='', pretty_print=True):
+        imported_ns_def_ = GenerateDSNamespaceDefs_.get('CLUSTERSType87')
+        if imported_ns_def_ is not None:
+            namespacedef_ = imported_ns_def_
+        if pretty_print:
+            eol_ = '\n'
+        else:
+            eol_ = ''
+        if self.original_tagname_ is not None:
+            name_ = self.original_tagname_
+        showIndent(outfile, level, pretty_print)
+        outfile.write('<%s%s%s' % (namespaceprefix_, name_, namespacedef_ and ' ' + namespacedef_ or '', ))
+        already_processed = set()
+        self.exportAttributes(outfile, level, already_processed, namespaceprefix_, name_='CLUSTERSType87')
+        if self.hasContent_():
+            outfile.write('>%s' % (eol_, ))
+            self.exportChildren(outfile, level + 1, namespaceprefix_='', name_='CLUSTERSType87', pretty_print=pretty_print)
+            showIndent(outfile, level, pretty_print)
+            outfile.write('</%s%s>%s' % (namespaceprefix_, name_, eol_))
+        else:
+            outfile.write('/>%s' % (eol_, ))
+    def exportAttributes(self, outfile, level, already_processed, namespaceprefix_='', name_='CLUSTERSType87'):
+        pass
+    def exportChildren(self, outfile, level, namespaceprefix_='', name_='CLUSTERSType87', fromsubclass_=False, pretty_print=True):
+        if pretty_print:
+            eol_ = '\n'
+        else:
+            eol_ = ''
+        for ID_ in self.ID:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<ID>%s</ID>%s' % (self.gds_format_integer(ID_, input_name='ID'), eol_))
+    def build(self, node):
+        already_processed = set()
+        self.buildAttributes(node, node.attrib, already_processed)
+        for child in node:
+            nodeName_ = Tag_pattern_.match(child.tag).groups()[-1]
+            self.buildChildren(child, node, nodeName_)
+        return self
+    def buildAttributes(self, node, attrs, already_processed):
+        pass
+    def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
+        if nodeName_ == 'ID' and child_.text:
+            sval_ = child_.text
+            try:
+                ival_ = int(sval_)
+            except (TypeError, ValueError) as exp:
+                raise_parse_error(child_, 'requires integer: %s' % exp)
+            ival_ = self.gds_validate_integer(ival_, node, 'ID')
+            self.ID.append(ival_)
+# end class CLUSTERSType87
+
+
+class VROUTERSType88(GeneratedsSuper):
+    subclass = None
+    superclass = None
+    def __init__(self, ID=None):
+        self.original_tagname_ = None
+        if ID is None:
+            self.ID = []
+        else:
+            self.ID = ID
+    def factory(*args_, **kwargs_):
+        if supermod.CurrentSubclassModule_ is not None:
+            subclass = getSubclassFromModule_(
+                supermod.CurrentSubclassModule_, VROUTERSType88)
+            if subclass is not None:
+                return subclass(*args_, **kwargs_)
+        if VROUTERSType88.subclass:
+            return VROUTERSType88.subclass(*args_, **kwargs_)
+        else:
+            return VROUTERSType88(*args_, **kwargs_)
+    factory = staticmethod(factory)
+    def get_ID(self): return self.ID
+    def set_ID(self, ID): self.ID = ID
+    def add_ID(self, value): self.ID.append(value)
+    def insert_ID_at(self, index, value): self.ID.insert(index, value)
+    def replace_ID_at(self, index, value): self.ID[index] = value
+    def hasContent_(self):
+        if (
+            self.ID
+        ):
+            return True
+        else:
+            return False
+    def export(self, outfile, level, namespaceprefix_='', name_='VROUTERSType88', namespacedef_='', pretty_print=True):
+        imported_ns_def_ = GenerateDSNamespaceDefs_.get('VROUTERSType88')
+        if imported_ns_def_ is not None:
+            namespacedef_ = imported_ns_def_
+        if pretty_print:
+            eol_ = '\n'
+        else:
+            eol_ = ''
+        if self.original_tagname_ is not None:
+            name_ = self.original_tagname_
+        showIndent(outfile, level, pretty_print)
+        outfile.write('<%s%s%s' % (namespaceprefix_, name_, namespacedef_ and ' ' + namespacedef_ or '', ))
+        already_processed = set()
+        self.exportAttributes(outfile, level, already_processed, namespaceprefix_, name_='VROUTERSType88')
+        if self.hasContent_():
+            outfile.write('>%s' % (eol_, ))
+            self.exportChildren(outfile, level + 1, namespaceprefix_='', name_='VROUTERSType88', pretty_print=pretty_print)
+            showIndent(outfile, level, pretty_print)
+            outfile.write('</%s%s>%s' % (namespaceprefix_, name_, eol_))
+        else:
+            outfile.write('/>%s' % (eol_, ))
+    def exportAttributes(self, outfile, level, already_processed, namespaceprefix_='', name_='VROUTERSType88'):
+        pass
+    def exportChildren(self, outfile, level, namespaceprefix_='', name_='VROUTERSType88', fromsubclass_=False, pretty_print=True):
+        if pretty_print:
+            eol_ = '\n'
+        else:
+            eol_ = ''
+        for ID_ in self.ID:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<ID>%s</ID>%s' % (self.gds_format_integer(ID_, input_name='ID'), eol_))
+    def build(self, node):
+        already_processed = set()
+        self.buildAttributes(node, node.attrib, already_processed)
+        for child in node:
+            nodeName_ = Tag_pattern_.match(child.tag).groups()[-1]
+            self.buildChildren(child, node, nodeName_)
+        return self
+    def buildAttributes(self, node, attrs, already_processed):
+        pass
+    def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
+        if nodeName_ == 'ID' and child_.text:
+            sval_ = child_.text
+            try:
+                ival_ = int(sval_)
+            except (TypeError, ValueError) as exp:
+                raise_parse_error(child_, 'requires integer: %s' % exp)
+            ival_ = self.gds_validate_integer(ival_, node, 'ID')
+            self.ID.append(ival_)
+# end class VROUTERSType88
+
+
+class AR_POOLType89(GeneratedsSuper):
+    subclass = None
+    superclass = None
+    def __init__(self, AR=None):
+        self.original_tagname_ = None
+        if AR is None:
+            self.AR = []
+        else:
+            self.AR = AR
+    def factory(*args_, **kwargs_):
+        if supermod.CurrentSubclassModule_ is not None:
+            subclass = getSubclassFromModule_(
+                supermod.CurrentSubclassModule_, AR_POOLType89)
+            if subclass is not None:
+                return subclass(*args_, **kwargs_)
+        if AR_POOLType89.subclass:
+            return AR_POOLType89.subclass(*args_, **kwargs_)
+        else:
+            return AR_POOLType89(*args_, **kwargs_)
+    factory = staticmethod(factory)
+    def get_AR(self): return self.AR
+    def set_AR(self, AR): self.AR = AR
+    def add_AR(self, value): self.AR.append(value)
+    def insert_AR_at(self, index, value): self.AR.insert(index, value)
+    def replace_AR_at(self, index, value): self.AR[index] = value
+    def hasContent_(self):
+        if (
+            self.AR
+        ):
+            return True
+        else:
+            return False
+    def export(self, outfile, level, namespaceprefix_='', name_='AR_POOLType89', namespacedef_='', pretty_print=True):
+        imported_ns_def_ = GenerateDSNamespaceDefs_.get('AR_POOLType89')
+        if imported_ns_def_ is not None:
+            namespacedef_ = imported_ns_def_
+        if pretty_print:
+            eol_ = '\n'
+        else:
+            eol_ = ''
+        if self.original_tagname_ is not None:
+            name_ = self.original_tagname_
+        showIndent(outfile, level, pretty_print)
+        outfile.write('<%s%s%s' % (namespaceprefix_, name_, namespacedef_ and ' ' + namespacedef_ or '', ))
+        already_processed = set()
+        self.exportAttributes(outfile, level, already_processed, namespaceprefix_, name_='AR_POOLType89')
+        if self.hasContent_():
+            outfile.write('>%s' % (eol_, ))
+            self.exportChildren(outfile, level + 1, namespaceprefix_='', name_='AR_POOLType89', pretty_print=pretty_print)
+            showIndent(outfile, level, pretty_print)
+            outfile.write('</%s%s>%s' % (namespaceprefix_, name_, eol_))
+        else:
+            outfile.write('/>%s' % (eol_, ))
+    def exportAttributes(self, outfile, level, already_processed, namespaceprefix_='', name_='AR_POOLType89'):
+        pass
+    def exportChildren(self, outfile, level, namespaceprefix_='', name_='AR_POOLType89', fromsubclass_=False, pretty_print=True):
+        if pretty_print:
+            eol_ = '\n'
+        else:
+            eol_ = ''
+        for AR_ in self.AR:
+            AR_.export(outfile, level, namespaceprefix_, name_='AR', pretty_print=pretty_print)
+    def build(self, node):
+        already_processed = set()
+        self.buildAttributes(node, node.attrib, already_processed)
+        for child in node:
+            nodeName_ = Tag_pattern_.match(child.tag).groups()[-1]
+            self.buildChildren(child, node, nodeName_)
+        return self
+    def buildAttributes(self, node, attrs, already_processed):
+        pass
+    def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
+        if nodeName_ == 'AR':
+            obj_ = ARType90.factory()
+            obj_.build(child_)
+            self.AR.append(obj_)
+            obj_.original_tagname_ = 'AR'
+# end class AR_POOLType89
+
+
+class ARType90(GeneratedsSuper):
+    subclass = None
+    superclass = None
+    def __init__(self, AR_ID=None, GLOBAL_PREFIX=None, IP=None, MAC=None, PARENT_NETWORK_AR_ID=None, SIZE=None, TYPE=None, ULA_PREFIX=None, VN_MAD=None, MAC_END=None, IP_END=None, IP6_ULA=None, IP6_ULA_END=None, IP6_GLOBAL=None, IP6_GLOBAL_END=None, IP6=None, IP6_END=None, USED_LEASES=None, LEASES=None):
+        self.original_tagname_ = None
+        self.AR_ID = AR_ID
+        self.GLOBAL_PREFIX = GLOBAL_PREFIX
+        self.IP = IP
+        self.MAC = MAC
+        self.PARENT_NETWORK_AR_ID = PARENT_NETWORK_AR_ID
+        self.SIZE = SIZE
+        self.TYPE = TYPE
+        self.ULA_PREFIX = ULA_PREFIX
+        self.VN_MAD = VN_MAD
+        self.MAC_END = MAC_END
+        self.IP_END = IP_END
+        self.IP6_ULA = IP6_ULA
+        self.IP6_ULA_END = IP6_ULA_END
+        self.IP6_GLOBAL = IP6_GLOBAL
+        self.IP6_GLOBAL_END = IP6_GLOBAL_END
+        self.IP6 = IP6
+        self.IP6_END = IP6_END
+        self.USED_LEASES = USED_LEASES
+        self.LEASES = LEASES
+    def factory(*args_, **kwargs_):
+        if supermod.CurrentSubclassModule_ is not None:
+            subclass = getSubclassFromModule_(
+                supermod.CurrentSubclassModule_, ARType90)
+            if subclass is not None:
+                return subclass(*args_, **kwargs_)
+        if ARType90.subclass:
+            return ARType90.subclass(*args_, **kwargs_)
+        else:
+            return ARType90(*args_, **kwargs_)
+    factory = staticmethod(factory)
+    def get_AR_ID(self): return self.AR_ID
+    def set_AR_ID(self, AR_ID): self.AR_ID = AR_ID
+    def get_GLOBAL_PREFIX(self): return self.GLOBAL_PREFIX
+    def set_GLOBAL_PREFIX(self, GLOBAL_PREFIX): self.GLOBAL_PREFIX = GLOBAL_PREFIX
+    def get_IP(self): return self.IP
+    def set_IP(self, IP): self.IP = IP
+    def get_MAC(self): return self.MAC
+    def set_MAC(self, MAC): self.MAC = MAC
+    def get_PARENT_NETWORK_AR_ID(self): return self.PARENT_NETWORK_AR_ID
+    def set_PARENT_NETWORK_AR_ID(self, PARENT_NETWORK_AR_ID): self.PARENT_NETWORK_AR_ID = PARENT_NETWORK_AR_ID
+    def get_SIZE(self): return self.SIZE
+    def set_SIZE(self, SIZE): self.SIZE = SIZE
+    def get_TYPE(self): return self.TYPE
+    def set_TYPE(self, TYPE): self.TYPE = TYPE
+    def get_ULA_PREFIX(self): return self.ULA_PREFIX
+    def set_ULA_PREFIX(self, ULA_PREFIX): self.ULA_PREFIX = ULA_PREFIX
+    def get_VN_MAD(self): return self.VN_MAD
+    def set_VN_MAD(self, VN_MAD): self.VN_MAD = VN_MAD
+    def get_MAC_END(self): return self.MAC_END
+    def set_MAC_END(self, MAC_END): self.MAC_END = MAC_END
+    def get_IP_END(self): return self.IP_END
+    def set_IP_END(self, IP_END): self.IP_END = IP_END
+    def get_IP6_ULA(self): return self.IP6_ULA
+    def set_IP6_ULA(self, IP6_ULA): self.IP6_ULA = IP6_ULA
+    def get_IP6_ULA_END(self): return self.IP6_ULA_END
+    def set_IP6_ULA_END(self, IP6_ULA_END): self.IP6_ULA_END = IP6_ULA_END
+    def get_IP6_GLOBAL(self): return self.IP6_GLOBAL
+    def set_IP6_GLOBAL(self, IP6_GLOBAL): self.IP6_GLOBAL = IP6_GLOBAL
+    def get_IP6_GLOBAL_END(self): return self.IP6_GLOBAL_END
+    def set_IP6_GLOBAL_END(self, IP6_GLOBAL_END): self.IP6_GLOBAL_END = IP6_GLOBAL_END
+    def get_IP6(self): return self.IP6
+    def set_IP6(self, IP6): self.IP6 = IP6
+    def get_IP6_END(self): return self.IP6_END
+    def set_IP6_END(self, IP6_END): self.IP6_END = IP6_END
+    def get_USED_LEASES(self): return self.USED_LEASES
+    def set_USED_LEASES(self, USED_LEASES): self.USED_LEASES = USED_LEASES
+    def get_LEASES(self): return self.LEASES
+    def set_LEASES(self, LEASES): self.LEASES = LEASES
+    def hasContent_(self):
+        if (
+            self.AR_ID is not None or
+            self.GLOBAL_PREFIX is not None or
+            self.IP is not None or
+            self.MAC is not None or
+            self.PARENT_NETWORK_AR_ID is not None or
+            self.SIZE is not None or
+            self.TYPE is not None or
+            self.ULA_PREFIX is not None or
+            self.VN_MAD is not None or
+            self.MAC_END is not None or
+            self.IP_END is not None or
+            self.IP6_ULA is not None or
+            self.IP6_ULA_END is not None or
+            self.IP6_GLOBAL is not None or
+            self.IP6_GLOBAL_END is not None or
+            self.IP6 is not None or
+            self.IP6_END is not None or
+            self.USED_LEASES is not None or
+            self.LEASES is not None
+        ):
+            return True
+        else:
+            return False
+    def export(self, outfile, level, namespaceprefix_='', name_='ARType90', namespacedef_='', pretty_print=True):
+        imported_ns_def_ = GenerateDSNamespaceDefs_.get('ARType90')
+        if imported_ns_def_ is not None:
+            namespacedef_ = imported_ns_def_
+        if pretty_print:
+            eol_ = '\n'
+        else:
+            eol_ = ''
+        if self.original_tagname_ is not None:
+            name_ = self.original_tagname_
+        showIndent(outfile, level, pretty_print)
+        outfile.write('<%s%s%s' % (namespaceprefix_, name_, namespacedef_ and ' ' + namespacedef_ or '', ))
+        already_processed = set()
+        self.exportAttributes(outfile, level, already_processed, namespaceprefix_, name_='ARType90')
+        if self.hasContent_():
+            outfile.write('>%s' % (eol_, ))
+            self.exportChildren(outfile, level + 1, namespaceprefix_='', name_='ARType90', pretty_print=pretty_print)
+            showIndent(outfile, level, pretty_print)
+            outfile.write('</%s%s>%s' % (namespaceprefix_, name_, eol_))
+        else:
+            outfile.write('/>%s' % (eol_, ))
+    def exportAttributes(self, outfile, level, already_processed, namespaceprefix_='', name_='ARType90'):
+        pass
+    def exportChildren(self, outfile, level, namespaceprefix_='', name_='ARType90', fromsubclass_=False, pretty_print=True):
+        if pretty_print:
+            eol_ = '\n'
+        else:
+            eol_ = ''
+        if self.AR_ID is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<AR_ID>%s</AR_ID>%s' % (self.gds_encode(self.gds_format_string(quote_xml(self.AR_ID), input_name='AR_ID')), eol_))
+        if self.GLOBAL_PREFIX is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<GLOBAL_PREFIX>%s</GLOBAL_PREFIX>%s' % (self.gds_encode(self.gds_format_string(quote_xml(self.GLOBAL_PREFIX), input_name='GLOBAL_PREFIX')), eol_))
+        if self.IP is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<IP>%s</IP>%s' % (self.gds_encode(self.gds_format_string(quote_xml(self.IP), input_name='IP')), eol_))
+        if self.MAC is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<MAC>%s</MAC>%s' % (self.gds_encode(self.gds_format_string(quote_xml(self.MAC), input_name='MAC')), eol_))
+        if self.PARENT_NETWORK_AR_ID is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<PARENT_NETWORK_AR_ID>%s</PARENT_NETWORK_AR_ID>%s' % (self.gds_encode(self.gds_format_string(quote_xml(self.PARENT_NETWORK_AR_ID), input_name='PARENT_NETWORK_AR_ID')), eol_))
+        if self.SIZE is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<SIZE>%s</SIZE>%s' % (self.gds_format_integer(self.SIZE, input_name='SIZE'), eol_))
+        if self.TYPE is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<TYPE>%s</TYPE>%s' % (self.gds_encode(self.gds_format_string(quote_xml(self.TYPE), input_name='TYPE')), eol_))
+        if self.ULA_PREFIX is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<ULA_PREFIX>%s</ULA_PREFIX>%s' % (self.gds_encode(self.gds_format_string(quote_xml(self.ULA_PREFIX), input_name='ULA_PREFIX')), eol_))
+        if self.VN_MAD is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<VN_MAD>%s</VN_MAD>%s' % (self.gds_encode(self.gds_format_string(quote_xml(self.VN_MAD), input_name='VN_MAD')), eol_))
+        if self.MAC_END is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<MAC_END>%s</MAC_END>%s' % (self.gds_encode(self.gds_format_string(quote_xml(self.MAC_END), input_name='MAC_END')), eol_))
+        if self.IP_END is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<IP_END>%s</IP_END>%s' % (self.gds_encode(self.gds_format_string(quote_xml(self.IP_END), input_name='IP_END')), eol_))
+        if self.IP6_ULA is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<IP6_ULA>%s</IP6_ULA>%s' % (self.gds_encode(self.gds_format_string(quote_xml(self.IP6_ULA), input_name='IP6_ULA')), eol_))
+        if self.IP6_ULA_END is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<IP6_ULA_END>%s</IP6_ULA_END>%s' % (self.gds_encode(self.gds_format_string(quote_xml(self.IP6_ULA_END), input_name='IP6_ULA_END')), eol_))
+        if self.IP6_GLOBAL is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<IP6_GLOBAL>%s</IP6_GLOBAL>%s' % (self.gds_encode(self.gds_format_string(quote_xml(self.IP6_GLOBAL), input_name='IP6_GLOBAL')), eol_))
+        if self.IP6_GLOBAL_END is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<IP6_GLOBAL_END>%s</IP6_GLOBAL_END>%s' % (self.gds_encode(self.gds_format_string(quote_xml(self.IP6_GLOBAL_END), input_name='IP6_GLOBAL_END')), eol_))
+        if self.IP6 is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<IP6>%s</IP6>%s' % (self.gds_encode(self.gds_format_string(quote_xml(self.IP6), input_name='IP6')), eol_))
+        if self.IP6_END is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<IP6_END>%s</IP6_END>%s' % (self.gds_encode(self.gds_format_string(quote_xml(self.IP6_END), input_name='IP6_END')), eol_))
+        if self.USED_LEASES is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<USED_LEASES>%s</USED_LEASES>%s' % (self.gds_encode(self.gds_format_string(quote_xml(self.USED_LEASES), input_name='USED_LEASES')), eol_))
+        if self.LEASES is not None:
+            self.LEASES.export(outfile, level, namespaceprefix_, name_='LEASES', pretty_print=pretty_print)
+    def build(self, node):
+        already_processed = set()
+        self.buildAttributes(node, node.attrib, already_processed)
+        for child in node:
+            nodeName_ = Tag_pattern_.match(child.tag).groups()[-1]
+            self.buildChildren(child, node, nodeName_)
+        return self
+    def buildAttributes(self, node, attrs, already_processed):
+        pass
+    def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
+        if nodeName_ == 'AR_ID':
+            AR_ID_ = child_.text
+            AR_ID_ = self.gds_validate_string(AR_ID_, node, 'AR_ID')
+            self.AR_ID = AR_ID_
+        elif nodeName_ == 'GLOBAL_PREFIX':
+            GLOBAL_PREFIX_ = child_.text
+            GLOBAL_PREFIX_ = self.gds_validate_string(GLOBAL_PREFIX_, node, 'GLOBAL_PREFIX')
+            self.GLOBAL_PREFIX = GLOBAL_PREFIX_
+        elif nodeName_ == 'IP':
+            IP_ = child_.text
+            IP_ = self.gds_validate_string(IP_, node, 'IP')
+            self.IP = IP_
+        elif nodeName_ == 'MAC':
+            MAC_ = child_.text
+            MAC_ = self.gds_validate_string(MAC_, node, 'MAC')
+            self.MAC = MAC_
+        elif nodeName_ == 'PARENT_NETWORK_AR_ID':
+            PARENT_NETWORK_AR_ID_ = child_.text
+            PARENT_NETWORK_AR_ID_ = self.gds_validate_string(PARENT_NETWORK_AR_ID_, node, 'PARENT_NETWORK_AR_ID')
+            self.PARENT_NETWORK_AR_ID = PARENT_NETWORK_AR_ID_
+        elif nodeName_ == 'SIZE' and child_.text:
+            sval_ = child_.text
+            try:
+                ival_ = int(sval_)
+            except (TypeError, ValueError) as exp:
+                raise_parse_error(child_, 'requires integer: %s' % exp)
+            ival_ = self.gds_validate_integer(ival_, node, 'SIZE')
+            self.SIZE = ival_
+        elif nodeName_ == 'TYPE':
+            TYPE_ = child_.text
+            TYPE_ = self.gds_validate_string(TYPE_, node, 'TYPE')
+            self.TYPE = TYPE_
+        elif nodeName_ == 'ULA_PREFIX':
+            ULA_PREFIX_ = child_.text
+            ULA_PREFIX_ = self.gds_validate_string(ULA_PREFIX_, node, 'ULA_PREFIX')
+            self.ULA_PREFIX = ULA_PREFIX_
+        elif nodeName_ == 'VN_MAD':
+            VN_MAD_ = child_.text
+            VN_MAD_ = self.gds_validate_string(VN_MAD_, node, 'VN_MAD')
+            self.VN_MAD = VN_MAD_
+        elif nodeName_ == 'MAC_END':
+            MAC_END_ = child_.text
+            MAC_END_ = self.gds_validate_string(MAC_END_, node, 'MAC_END')
+            self.MAC_END = MAC_END_
+        elif nodeName_ == 'IP_END':
+            IP_END_ = child_.text
+            IP_END_ = self.gds_validate_string(IP_END_, node, 'IP_END')
+            self.IP_END = IP_END_
+        elif nodeName_ == 'IP6_ULA':
+            IP6_ULA_ = child_.text
+            IP6_ULA_ = self.gds_validate_string(IP6_ULA_, node, 'IP6_ULA')
+            self.IP6_ULA = IP6_ULA_
+        elif nodeName_ == 'IP6_ULA_END':
+            IP6_ULA_END_ = child_.text
+            IP6_ULA_END_ = self.gds_validate_string(IP6_ULA_END_, node, 'IP6_ULA_END')
+            self.IP6_ULA_END = IP6_ULA_END_
+        elif nodeName_ == 'IP6_GLOBAL':
+            IP6_GLOBAL_ = child_.text
+            IP6_GLOBAL_ = self.gds_validate_string(IP6_GLOBAL_, node, 'IP6_GLOBAL')
+            self.IP6_GLOBAL = IP6_GLOBAL_
+        elif nodeName_ == 'IP6_GLOBAL_END':
+            IP6_GLOBAL_END_ = child_.text
+            IP6_GLOBAL_END_ = self.gds_validate_string(IP6_GLOBAL_END_, node, 'IP6_GLOBAL_END')
+            self.IP6_GLOBAL_END = IP6_GLOBAL_END_
+        elif nodeName_ == 'IP6':
+            IP6_ = child_.text
+            IP6_ = self.gds_validate_string(IP6_, node, 'IP6')
+            self.IP6 = IP6_
+        elif nodeName_ == 'IP6_END':
+            IP6_END_ = child_.text
+            IP6_END_ = self.gds_validate_string(IP6_END_, node, 'IP6_END')
+            self.IP6_END = IP6_END_
+        elif nodeName_ == 'USED_LEASES':
+            USED_LEASES_ = child_.text
+            USED_LEASES_ = self.gds_validate_string(USED_LEASES_, node, 'USED_LEASES')
+            self.USED_LEASES = USED_LEASES_
+        elif nodeName_ == 'LEASES':
+            obj_ = LEASESType.factory()
+            obj_.build(child_)
+            self.LEASES = obj_
+            obj_.original_tagname_ = 'LEASES'
+# end class ARType90
+
+
+class LEASESType(GeneratedsSuper):
+    subclass = None
+    superclass = None
+    def __init__(self, LEASE=None):
+        self.original_tagname_ = None
+        if LEASE is None:
+            self.LEASE = []
+        else:
+            self.LEASE = LEASE
+    def factory(*args_, **kwargs_):
+        if supermod.CurrentSubclassModule_ is not None:
+            subclass = getSubclassFromModule_(
+                supermod.CurrentSubclassModule_, LEASESType)
+            if subclass is not None:
+                return subclass(*args_, **kwargs_)
+        if LEASESType.subclass:
+            return LEASESType.subclass(*args_, **kwargs_)
+        else:
+            return LEASESType(*args_, **kwargs_)
+    factory = staticmethod(factory)
+    def get_LEASE(self): return self.LEASE
+    def set_LEASE(self, LEASE): self.LEASE = LEASE
+    def add_LEASE(self, value): self.LEASE.append(value)
+    def insert_LEASE_at(self, index, value): self.LEASE.insert(index, value)
+    def replace_LEASE_at(self, index, value): self.LEASE[index] = value
+    def hasContent_(self):
+        if (
+            self.LEASE
+        ):
+            return True
+        else:
+            return False
+    def export(self, outfile, level, namespaceprefix_='', name_='LEASESType', namespacedef_='', pretty_print=True):
+        imported_ns_def_ = GenerateDSNamespaceDefs_.get('LEASESType')
+        if imported_ns_def_ is not None:
+            namespacedef_ = imported_ns_def_
+        if pretty_print:
+            eol_ = '\n'
+        else:
+            eol_ = ''
+        if self.original_tagname_ is not None:
+            name_ = self.original_tagname_
+        showIndent(outfile, level, pretty_print)
+        outfile.write('<%s%s%s' % (namespaceprefix_, name_, namespacedef_ and ' ' + namespacedef_ or '', ))
+        already_processed = set()
+        self.exportAttributes(outfile, level, already_processed, namespaceprefix_, name_='LEASESType')
+        if self.hasContent_():
+            outfile.write('>%s' % (eol_, ))
+            self.exportChildren(outfile, level + 1, namespaceprefix_='', name_='LEASESType', pretty_print=pretty_print)
+            showIndent(outfile, level, pretty_print)
+            outfile.write('</%s%s>%s' % (namespaceprefix_, name_, eol_))
+        else:
+            outfile.write('/>%s' % (eol_, ))
+    def exportAttributes(self, outfile, level, already_processed, namespaceprefix_='', name_='LEASESType'):
+        pass
+    def exportChildren(self, outfile, level, namespaceprefix_='', name_='LEASESType', fromsubclass_=False, pretty_print=True):
+        if pretty_print:
+            eol_ = '\n'
+        else:
+            eol_ = ''
+        for LEASE_ in self.LEASE:
+            LEASE_.export(outfile, level, namespaceprefix_, name_='LEASE', pretty_print=pretty_print)
+    def build(self, node):
+        already_processed = set()
+        self.buildAttributes(node, node.attrib, already_processed)
+        for child in node:
+            nodeName_ = Tag_pattern_.match(child.tag).groups()[-1]
+            self.buildChildren(child, node, nodeName_)
+        return self
+    def buildAttributes(self, node, attrs, already_processed):
+        pass
+    def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
+        if nodeName_ == 'LEASE':
+            obj_ = LEASEType.factory()
+            obj_.build(child_)
+            self.LEASE.append(obj_)
+            obj_.original_tagname_ = 'LEASE'
+# end class LEASESType
+
+
+class LEASEType(GeneratedsSuper):
+    subclass = None
+    superclass = None
+    def __init__(self, IP=None, IP6=None, IP6_GLOBAL=None, IP6_LINK=None, IP6_ULA=None, MAC=None, VM=None, VNET=None, VROUTER=None):
+        self.original_tagname_ = None
+        self.IP = IP
+        self.IP6 = IP6
+        self.IP6_GLOBAL = IP6_GLOBAL
+        self.IP6_LINK = IP6_LINK
+        self.IP6_ULA = IP6_ULA
+        self.MAC = MAC
+        self.VM = VM
+        self.VNET = VNET
+        self.VROUTER = VROUTER
+    def factory(*args_, **kwargs_):
+        if supermod.CurrentSubclassModule_ is not None:
+            subclass = getSubclassFromModule_(
+                supermod.CurrentSubclassModule_, LEASEType)
+            if subclass is not None:
+                return subclass(*args_, **kwargs_)
+        if LEASEType.subclass:
+            return LEASEType.subclass(*args_, **kwargs_)
+        else:
+            return LEASEType(*args_, **kwargs_)
+    factory = staticmethod(factory)
+    def get_IP(self): return self.IP
+    def set_IP(self, IP): self.IP = IP
+    def get_IP6(self): return self.IP6
+    def set_IP6(self, IP6): self.IP6 = IP6
+    def get_IP6_GLOBAL(self): return self.IP6_GLOBAL
+    def set_IP6_GLOBAL(self, IP6_GLOBAL): self.IP6_GLOBAL = IP6_GLOBAL
+    def get_IP6_LINK(self): return self.IP6_LINK
+    def set_IP6_LINK(self, IP6_LINK): self.IP6_LINK = IP6_LINK
+    def get_IP6_ULA(self): return self.IP6_ULA
+    def set_IP6_ULA(self, IP6_ULA): self.IP6_ULA = IP6_ULA
+    def get_MAC(self): return self.MAC
+    def set_MAC(self, MAC): self.MAC = MAC
+    def get_VM(self): return self.VM
+    def set_VM(self, VM): self.VM = VM
+    def get_VNET(self): return self.VNET
+    def set_VNET(self, VNET): self.VNET = VNET
+    def get_VROUTER(self): return self.VROUTER
+    def set_VROUTER(self, VROUTER): self.VROUTER = VROUTER
+    def hasContent_(self):
+        if (
+            self.IP is not None or
+            self.IP6 is not None or
+            self.IP6_GLOBAL is not None or
+            self.IP6_LINK is not None or
+            self.IP6_ULA is not None or
+            self.MAC is not None or
+            self.VM is not None or
+            self.VNET is not None or
+            self.VROUTER is not None
+        ):
+            return True
+        else:
+            return False
+    def export(self, outfile, level, namespaceprefix_='', name_='LEASEType', namespacedef_='', pretty_print=True):
+        imported_ns_def_ = GenerateDSNamespaceDefs_.get('LEASEType')
+        if imported_ns_def_ is not None:
+            namespacedef_ = imported_ns_def_
+        if pretty_print:
+            eol_ = '\n'
+        else:
+            eol_ = ''
+        if self.original_tagname_ is not None:
+            name_ = self.original_tagname_
+        showIndent(outfile, level, pretty_print)
+        outfile.write('<%s%s%s' % (namespaceprefix_, name_, namespacedef_ and ' ' + namespacedef_ or '', ))
+        already_processed = set()
+        self.exportAttributes(outfile, level, already_processed, namespaceprefix_, name_='LEASEType')
+        if self.hasContent_():
+            outfile.write('>%s' % (eol_, ))
+            self.exportChildren(outfile, level + 1, namespaceprefix_='', name_='LEASEType', pretty_print=pretty_print)
+            showIndent(outfile, level, pretty_print)
+            outfile.write('</%s%s>%s' % (namespaceprefix_, name_, eol_))
+        else:
+            outfile.write('/>%s' % (eol_, ))
+    def exportAttributes(self, outfile, level, already_processed, namespaceprefix_='', name_='LEASEType'):
+        pass
+    def exportChildren(self, outfile, level, namespaceprefix_='', name_='LEASEType', fromsubclass_=False, pretty_print=True):
+        if pretty_print:
+            eol_ = '\n'
+        else:
+            eol_ = ''
+        if self.IP is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<IP>%s</IP>%s' % (self.gds_encode(self.gds_format_string(quote_xml(self.IP), input_name='IP')), eol_))
+        if self.IP6 is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<IP6>%s</IP6>%s' % (self.gds_encode(self.gds_format_string(quote_xml(self.IP6), input_name='IP6')), eol_))
+        if self.IP6_GLOBAL is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<IP6_GLOBAL>%s</IP6_GLOBAL>%s' % (self.gds_encode(self.gds_format_string(quote_xml(self.IP6_GLOBAL), input_name='IP6_GLOBAL')), eol_))
+        if self.IP6_LINK is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<IP6_LINK>%s</IP6_LINK>%s' % (self.gds_encode(self.gds_format_string(quote_xml(self.IP6_LINK), input_name='IP6_LINK')), eol_))
+        if self.IP6_ULA is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<IP6_ULA>%s</IP6_ULA>%s' % (self.gds_encode(self.gds_format_string(quote_xml(self.IP6_ULA), input_name='IP6_ULA')), eol_))
+        if self.MAC is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<MAC>%s</MAC>%s' % (self.gds_encode(self.gds_format_string(quote_xml(self.MAC), input_name='MAC')), eol_))
+        if self.VM is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<VM>%s</VM>%s' % (self.gds_format_integer(self.VM, input_name='VM'), eol_))
+        if self.VNET is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<VNET>%s</VNET>%s' % (self.gds_format_integer(self.VNET, input_name='VNET'), eol_))
+        if self.VROUTER is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<VROUTER>%s</VROUTER>%s' % (self.gds_format_integer(self.VROUTER, input_name='VROUTER'), eol_))
+    def build(self, node):
+        already_processed = set()
+        self.buildAttributes(node, node.attrib, already_processed)
+        for child in node:
+            nodeName_ = Tag_pattern_.match(child.tag).groups()[-1]
+            self.buildChildren(child, node, nodeName_)
+        return self
+    def buildAttributes(self, node, attrs, already_processed):
+        pass
+    def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
+        if nodeName_ == 'IP':
+            IP_ = child_.text
+            IP_ = self.gds_validate_string(IP_, node, 'IP')
+            self.IP = IP_
+        elif nodeName_ == 'IP6':
+            IP6_ = child_.text
+            IP6_ = self.gds_validate_string(IP6_, node, 'IP6')
+            self.IP6 = IP6_
+        elif nodeName_ == 'IP6_GLOBAL':
+            IP6_GLOBAL_ = child_.text
+            IP6_GLOBAL_ = self.gds_validate_string(IP6_GLOBAL_, node, 'IP6_GLOBAL')
+            self.IP6_GLOBAL = IP6_GLOBAL_
+        elif nodeName_ == 'IP6_LINK':
+            IP6_LINK_ = child_.text
+            IP6_LINK_ = self.gds_validate_string(IP6_LINK_, node, 'IP6_LINK')
+            self.IP6_LINK = IP6_LINK_
+        elif nodeName_ == 'IP6_ULA':
+            IP6_ULA_ = child_.text
+            IP6_ULA_ = self.gds_validate_string(IP6_ULA_, node, 'IP6_ULA')
+            self.IP6_ULA = IP6_ULA_
+        elif nodeName_ == 'MAC':
+            MAC_ = child_.text
+            MAC_ = self.gds_validate_string(MAC_, node, 'MAC')
+            self.MAC = MAC_
+        elif nodeName_ == 'VM' and child_.text:
+            sval_ = child_.text
+            try:
+                ival_ = int(sval_)
+            except (TypeError, ValueError) as exp:
+                raise_parse_error(child_, 'requires integer: %s' % exp)
+            ival_ = self.gds_validate_integer(ival_, node, 'VM')
+            self.VM = ival_
+        elif nodeName_ == 'VNET' and child_.text:
+            sval_ = child_.text
+            try:
+                ival_ = int(sval_)
+            except (TypeError, ValueError) as exp:
+                raise_parse_error(child_, 'requires integer: %s' % exp)
+            ival_ = self.gds_validate_integer(ival_, node, 'VNET')
+            self.VNET = ival_
+        elif nodeName_ == 'VROUTER' and child_.text:
+            sval_ = child_.text
+            try:
+                ival_ = int(sval_)
+            except (TypeError, ValueError) as exp:
+                raise_parse_error(child_, 'requires integer: %s' % exp)
+            ival_ = self.gds_validate_integer(ival_, node, 'VROUTER')
+            self.VROUTER = ival_
+# end class LEASEType
+
+
+class VNETSub(TemplatedType, VNET):
+    def __init__(self, ID=None, UID=None, GID=None, UNAME=None, GNAME=None, NAME=None, PERMISSIONS=None, CLUSTERS=None, BRIDGE=None, PARENT_NETWORK_ID=None, VN_MAD=None, PHYDEV=None, VLAN_ID=None, VLAN_ID_AUTOMATIC=None, USED_LEASES=None, VROUTERS=None, TEMPLATE=None, AR_POOL=None):
+        super(VNETSub, self).__init__(ID, UID, GID, UNAME, GNAME, NAME, PERMISSIONS, CLUSTERS, BRIDGE, PARENT_NETWORK_ID, VN_MAD, PHYDEV, VLAN_ID, VLAN_ID_AUTOMATIC, USED_LEASES, VROUTERS, TEMPLATE, AR_POOL, )
+VNET.subclass = VNETSub
+# end class VNETSub
+
+
+class PERMISSIONSType86Sub(TemplatedType, PERMISSIONSType86):
+    def __init__(self, OWNER_U=None, OWNER_M=None, OWNER_A=None, GROUP_U=None, GROUP_M=None, GROUP_A=None, OTHER_U=None, OTHER_M=None, OTHER_A=None):
+        super(PERMISSIONSType86Sub, self).__init__(OWNER_U, OWNER_M, OWNER_A, GROUP_U, GROUP_M, GROUP_A, OTHER_U, OTHER_M, OTHER_A, )
+PERMISSIONSType86.subclass = PERMISSIONSType86Sub
+# end class PERMISSIONSType86Sub
+
+
+class CLUSTERSType87Sub(TemplatedType, CLUSTERSType87):
+    def __init__(self, ID=None):
+        super(CLUSTERSType87Sub, self).__init__(ID, )
+CLUSTERSType87.subclass = CLUSTERSType87Sub
+# end class CLUSTERSType87Sub
+
+
+class VROUTERSType88Sub(TemplatedType, VROUTERSType88):
+    def __init__(self, ID=None):
+        super(VROUTERSType88Sub, self).__init__(ID, )
+VROUTERSType88.subclass = VROUTERSType88Sub
+# end class VROUTERSType88Sub
+
+
+class AR_POOLType89Sub(TemplatedType, AR_POOLType89):
+    def __init__(self, AR=None):
+        super(AR_POOLType89Sub, self).__init__(AR, )
+AR_POOLType89.subclass = AR_POOLType89Sub
+# end class AR_POOLType89Sub
+
+
+class ARType90Sub(TemplatedType, ARType90):
+    def __init__(self, AR_ID=None, GLOBAL_PREFIX=None, IP=None, MAC=None, PARENT_NETWORK_AR_ID=None, SIZE=None, TYPE=None, ULA_PREFIX=None, VN_MAD=None, MAC_END=None, IP_END=None, IP6_ULA=None, IP6_ULA_END=None, IP6_GLOBAL=None, IP6_GLOBAL_END=None, IP6=None, IP6_END=None, USED_LEASES=None, LEASES=None):
+        super(ARType90Sub, self).__init__(AR_ID, GLOBAL_PREFIX, IP, MAC, PARENT_NETWORK_AR_ID, SIZE, TYPE, ULA_PREFIX, VN_MAD, MAC_END, IP_END, IP6_ULA, IP6_ULA_END, IP6_GLOBAL, IP6_GLOBAL_END, IP6, IP6_END, USED_LEASES, LEASES, )
+ARType90.subclass = ARType90Sub
+# end class ARType90Sub
+
+
+class LEASESTypeSub(TemplatedType, LEASESType):
+    def __init__(self, LEASE=None):
+        super(LEASESTypeSub, self).__init__(LEASE, )
+LEASESType.subclass = LEASESTypeSub
+# end class LEASESTypeSub
+
+
+class LEASETypeSub(TemplatedType, LEASEType):
+    def __init__(self, IP=None, IP6=None, IP6_GLOBAL=None, IP6_LINK=None, IP6_ULA=None, MAC=None, VM=None, VNET=None, VROUTER=None):
+        super(LEASETypeSub, self).__init__(IP, IP6, IP6_GLOBAL, IP6_LINK, IP6_ULA, MAC, VM, VNET, VROUTER, )
+LEASEType.subclass = LEASETypeSub
+# end class LEASETypeSub
+
+
@@ -0,0 +1,1057 @@
+#!/usr/bin/env python
+
+#
+# Bindings of VNET_POOL, generated by generateDS.py and split from supbind by src/split_bindings.py
+#
+
+import sys
+import re as re_
+import base64
+import datetime as datetime_
+import warnings as warnings_
+try:
+    from lxml import etree as etree_
+except ImportError:
+    from xml.etree import ElementTree as etree_
+from pyone.util import TemplatedType
+from . import supbind as supermod
+from .supbind import (
+    GenerateDSNamespaceDefs_,
+    GeneratedsSuper,
+    Tag_pattern_,
+    getSubclassFromModule_,
+    quote_xml,
+    raise_parse_error,
+    showIndent,
+)
+
+
+class VNET_POOL(GeneratedsSuper):
+    subclass = None
+    superclass = None
+    def __init__(self, VNET=None):
+        self.original_tagname_ = None
+        if VNET is None:
+            self.VNET = []
+        else:
+            self.VNET = VNET
+    def factory(*args_, **kwargs_):
+        if supermod.CurrentSubclassModule_ is not None:
+            subclass = getSubclassFromModule_(
+                supermod.CurrentSubclassModule_, VNET_POOL)
+            if subclass is not None:
+                return subclass(*args_, **kwargs_)
+        if VNET_POOL.subclass:
+            return VNET_POOL.subclass(*args_, **kwargs_)
+        else:
+            return VNET_POOL(*args_, **kwargs_)
+    factory = staticmethod(factory)
+    def get_VNET(self): return self.VNET
+    def set_VNET(self, VNET): self.VNET = VNET
+    def add_VNET(self, value): self.VNET.append(value)
+    def insert_VNET_at(self, index, value): self.VNET.insert(index, value)
+    def replace_VNET_at(self, index, value): self.VNET[index] = value
+    def hasContent_(self):
+        if (
+            self.VNET
+        ):
+            return True
+        else:
+            return False
+    def export(self, outfile, level, namespaceprefix_='', name_='VNET_POOL', namespacedef_='', pretty_print=True):
+        imported_ns_def_ = GenerateDSNamespaceDefs_.get('VNET_POOL')
+        if imported_ns_def_ is not None:
+            namespacedef_ = imported_ns_def_
+        if pretty_print:
+            eol_ = '\n'
+        else:
+            eol_ = ''
+        if self.original_tagname_ is not None:
+            name_ = self.original_tagname_
+        showIndent(outfile, level, pretty_print)
+        outfile.write('<%s%s%s' % (namespaceprefix_, name_, namespacedef_ and ' ' + namespacedef_ or '', ))
+        already_processed = set()
+        self.exportAttributes(outfile, level, already_processed, namespaceprefix_, name_='VNET_POOL')
+        if self.hasContent_():
+            outfile.write('>%s' % (eol_, ))
+            self.exportChildren(outfile, level + 1, namespaceprefix_='', name_='VNET_POOL', pretty_print=pretty_print)
+            showIndent(outfile, level, pretty_print)
+            outfile.write('</%s%s>%s' % (namespaceprefix_, name_, eol_))
+        else:
+            outfile.write('/>%s' % (eol_, ))
+    def exportAttributes(self, outfile, level, already_processed, namespaceprefix_='', name_='VNET_POOL'):
+        pass
+    def exportChildren(self, outfile, level, namespaceprefix_='', name_='VNET_POOL', fromsubclass_=False, pretty_print=True):
+        if pretty_print:
+            eol_ = '\n'
+        else:
+            eol_ = ''
+        for VNET_ in self.VNET:
+            VNET_.export(outfile, level, namespaceprefix_, name_='VNET', pretty_print=pretty_print)
+    def build(self, node):
+        already_processed = set()
+        self.buildAttributes(node, node.attrib, already_processed)
+        for child in node:
+            nodeName_ = Tag_pattern_.match(child.tag).groups()[-1]
+            self.buildChildren(child, node, nodeName_)
+        return self
+    def buildAttributes(self, node, attrs, already_processed):
+        pass
+    def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
+        if nodeName_ == 'VNET':
+            obj_ = VNETType83.factory()
+            obj_.build(child_)
+            self.VNET.append(obj_)
+            obj_.original_tagname_ = 'VNET'
+# end class VNET_POOL
+
+
+class VNETType83(GeneratedsSuper):
+    subclass = None
+    superclass = None
+    def __init__(self, ID=None, UID=None, GID=None, UNAME=None, GNAME=None, NAME=None, PERMISSIONS=None, CLUSTERS=None, BRIDGE=None, PARENT_NETWORK_ID=None, VN_MAD=None, PHYDEV=None, VLAN_ID=None, VLAN_ID_AUTOMATIC=None, USED_LEASES=None, VROUTERS=None, TEMPLATE=None, AR_POOL=None):
+        self.original_tagname_ = None
+        self.ID = ID
+        self.UID = UID
+        self.GID = GID
+        self.UNAME = UNAME
+        self.GNAME = GNAME
+        self.NAME = NAME
+        self.PERMISSIONS = PERMISSIONS
+        self.CLUSTERS = CLUSTERS
+        self.BRIDGE = BRIDGE
+        self.PARENT_NETWORK_ID = PARENT_NETWORK_ID
+        self.VN_MAD = VN_MAD
+        self.PHYDEV = PHYDEV
+        self.VLAN_ID = VLAN_ID
+        self.VLAN_ID_AUTOMATIC = VLAN_ID_AUTOMATIC
+        self.USED_LEASES = USED_LEASES
+        self.VROUTERS = VROUTERS
+        self.TEMPLATE = TEMPLATE
+        self.AR_POOL = AR_POOL
+    def factory(*args_, **kwargs_):
+        if supermod.CurrentSubclassModule_ is not None:
+            subclass = getSubclassFromModule_(
+                supermod.CurrentSubclassModule_, VNETType83)
+            if subclass is not None:
+                return subclass(*args_, **kwargs_)
+        if VNETType83.subclass:
+            return VNETType83.subclass(*args_, **kwargs_)
+        else:
+            return VNETType83(*args_, **kwargs_)
+    factory = staticmethod(factory)
+    def get_ID(self): return self.ID
+    def set_ID(self, ID): self.ID = ID
+    def get_UID(self): return self.UID
+    def set_UID(self, UID): self.UID = UID
+    def get_GID(self): return self.GID
+    def set_GID(self, GID): self.GID = GID
+    def get_UNAME(self): return self.UNAME
+    def set_UNAME(self, UNAME): self.UNAME = UNAME
+    def get_GNAME(self): return self.GNAME
+    def set_GNAME(self, GNAME): self.GNAME = GNAME
+    def get_NAME(self): return self.NAME
+    def set_NAME(self, NAME): self.NAME = NAME
+    def get_PERMISSIONS(self): return self.PERMISSIONS
+    def set_PERMISSIONS(self, PERMISSIONS): self.PERMISSIONS = PERMISSIONS
+    def get_CLUSTERS(self): return self.CLUSTERS
+    def set_CLUSTERS(self, CLUSTERS): self.CLUSTERS = CLUSTERS
+    def get_BRIDGE(self): return self.BRIDGE
+    def set_BRIDGE(self, BRIDGE): self.BRIDGE = BRIDGE
+    def get_PARENT_NETWORK_ID(self): return self.PARENT_NETWORK_ID
+    def set_PARENT_NETWORK_ID(self, PARENT_NETWORK_ID): self.PARENT_NETWORK_ID = PARENT_NETWORK_ID
+    def get_VN_MAD(self): return self.VN_MAD
+    def set_VN_MAD(self, VN_MAD): self.VN_MAD = VN_MAD
+    def get_PHYDEV(self): return self.PHYDEV
+    def set_PHYDEV(self, PHYDEV): self.PHYDEV = PHYDEV
+    def get_VLAN_ID(self): return self.VLAN_ID
+    def set_VLAN_ID(self, VLAN_ID): self.VLAN_ID = VLAN_ID
+    def get_VLAN_ID_AUTOMATIC(self): return self.VLAN_ID_AUTOMATIC
+    def set_VLAN_ID_AUTOMATIC(self, VLAN_ID_AUTOMATIC): self.VLAN_ID_AUTOMATIC = VLAN_ID_AUTOMATIC
+    def get_USED_LEASES(self): return self.USED_LEASES
+    def set_USED_LEASES(self, USED_LEASES): self.USED_LEASES = USED_LEASES
+    def get_VROUTERS(self): return self.VROUTERS
+    def set_VROUTERS(self, VROUTERS): self.VROUTERS = VROUTERS
+    def get_TEMPLATE(self): return self.TEMPLATE
+    def set_TEMPLATE(self, TEMPLATE): self.TEMPLATE = TEMPLATE
+    def get_AR_POOL(self): return self.AR_POOL
+    def set_AR_POOL(self, AR_POOL): self.AR_POOL = AR_POOL
+    def hasContent_(self):
+        if (
+            self.ID is not None or
+            self.UID is not None or
+            self.GID is not None or
+            self.UNAME is not None or
+            self.GNAME is not None or
+            self.NAME is not None or
+            self.PERMISSIONS is not None or
+            self.CLUSTERS is not None or
+            self.BRIDGE is not None or
+            self.PARENT_NETWORK_ID is not None or
+            self.VN_MAD is not None or
+            self.PHYDEV is not None or
+            self.VLAN_ID is not None or
+            self.VLAN_ID_AUTOMATIC is not None or
+            self.USED_LEASES is not None or
+            self.VROUTERS is not None or
+            self.TEMPLATE is not None or
+            self.AR_POOL is not None
+        ):
+            return True
+        else:
+            return False
+    def export(self, outfile, level, namespaceprefix_='', name_='VNETType83', namespacedef_='', pretty_print=True):
+        imported_ns_def_ = GenerateDSNamespaceDefs_.get('VNETType83')
+        if imported_ns_def_ is not None:
+            namespacedef_ = imported_ns_def_
+        if pretty_print:
+            eol_ = '\n'
+        else:
+            eol_ = ''
+        if self.original_tagname_ is not None:
+            name_ = self.original_tagname_
+        showIndent(outfile, level, pretty_print)
+        outfile.write('<%s%s%s' % (namespaceprefix_, name_, namespacedef_ and ' ' + namespacedef_ or '', ))
+        already_processed = set()
+        self.exportAttributes(outfile, level, already_processed, namespaceprefix_, name_='VNETType83')
+        if self.hasContent_():
+            outfile.write('>%s' % (eol_, ))
+            self.exportChildren(outfile, level + 1, namespaceprefix_='', name_='VNETType83', pretty_print=pretty_print)
+            showIndent(outfile, level, pretty_print)
+            outfile.write('</%s%s>%s' % (namespaceprefix_, name_, eol_))
+        else:
+            outfile.write('/>%s' % (eol_, ))
+    def exportAttributes(self, outfile, level, already_processed, namespaceprefix_='', name_='VNETType83'):
+        pass
+    def exportChildren(self, outfile, level, namespaceprefix_='', name_='VNETType83', fromsubclass_=False, pretty_print=True):
+        if pretty_print:
+            eol_ = '\n'
+        else:
+            eol_ = ''
+        if self.ID is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<ID>%s</ID>%s' % (self.gds_format_integer(self.ID, input_name='ID'), eol_))
+        if self.UID is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<UID>%s</UID>%s' % (self.gds_format_integer(self.UID, input_name='UID'), eol_))
+        if self.GID is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<GID>%s</GID>%s' % (self.gds_format_integer(self.GID, input_name='GID'), eol_))
+        if self.UNAME is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<UNAME>%s</UNAME>%s' % (self.gds_encode(self.gds_format_string(quote_xml(self.UNAME), input_name='UNAME')), eol_))
+        if self.GNAME is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<GNAME>%s</GNAME>%s' % (self.gds_encode(self.gds_format_string(quote_xml(self.GNAME), input_name='GNAME')), eol_))
+        if self.NAME is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<NAME>%s</NAME>%s' % (self.gds_encode(self.gds_format_string(quote_xml(self.NAME), input_name='NAME')), eol_))
+        if self.PERMISSIONS is not None:
+            self.PERMISSIONS.export(outfile, level, namespaceprefix_, name_='PERMISSIONS', pretty_print=pretty_print)
+        if self.CLUSTERS is not None:
+            self.CLUSTERS.export(outfile, level, namespaceprefix_, name_='CLUSTERS', pretty_print=pretty_print)
+        if self.BRIDGE is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<BRIDGE>%s</BRIDGE>%s' % (self.gds_encode(self.gds_format_string(quote_xml(self.BRIDGE), input_name='BRIDGE')), eol_))
+        if self.PARENT_NETWORK_ID is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<PARENT_NETWORK_ID>%s</PARENT_NETWORK_ID>%s' % (self.gds_encode(self.gds_format_string(quote_xml(self.PARENT_NETWORK_ID), input_name='PARENT_NETWORK_ID')), eol_))
+        if self.VN_MAD is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<VN_MAD>%s</VN_MAD>%s' % (self.gds_encode(self.gds_format_string(quote_xml(self.VN_MAD), input_name='VN_MAD')), eol_))
+        if self.PHYDEV is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<PHYDEV>%s</PHYDEV>%s' % (self.gds_encode(self.gds_format_string(quote_xml(self.PHYDEV), input_name='PHYDEV')), eol_))
+        if self.VLAN_ID is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<VLAN_ID>%s</VLAN_ID>%s' % (self.gds_encode(self.gds_format_string(quote_xml(self.VLAN_ID), input_name='VLAN_ID')), eol_))
+        if self.VLAN_ID_AUTOMATIC is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<VLAN_ID_AUTOMATIC>%s</VLAN_ID_AUTOMATIC>%s' % (self.gds_encode(self.gds_format_string(quote_xml(self.VLAN_ID_AUTOMATIC), input_name='VLAN_ID_AUTOMATIC')), eol_))
+        if self.USED_LEASES is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<USED_LEASES>%s</USED_LEASES>%s' % (self.gds_format_integer(self.USED_LEASES, input_name='USED_LEASES'), eol_))
+        if self.VROUTERS is not None:
+            self.VROUTERS.export(outfile, level, namespaceprefix_, name_='VROUTERS', pretty_print=pretty_print)
+        if self.TEMPLATE is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<TEMPLATE>%s</TEMPLATE>%s' % (self.gds_encode(self.gds_format_string(quote_xml(self.TEMPLATE), input_name='TEMPLATE')), eol_))
+        if self.AR_POOL is not None:
+            self.AR_POOL.export(outfile, level, namespaceprefix_, name_='AR_POOL', pretty_print=pretty_print)
+    def build(self, node):
+        already_processed = set()
+        self.buildAttributes(node, node.attrib, already_processed)
+        for child in node:
+            nodeName_ = Tag_pattern_.match(child.tag).groups()[-1]
+            self.buildChildren(child, node, nodeName_)
+        return self
+    def buildAttributes(self, node, attrs, already_processed):
+        pass
+    def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
+        if nodeName_ == 'ID' and child_.text:
+            sval_ = child_.text
+            try:
+                ival_ = int(sval_)
+            except (TypeError, ValueError) as exp:
+                raise_parse_error(child_, 'requires integer: %s' % exp)
+            ival_ = self.gds_validate_integer(ival_, node, 'ID')
+            self.ID = ival_
+        elif nodeName_ == 'UID' and child_.text:
+            sval_ = child_.text
+            try:
+                ival_ = int(sval_)
+            except (TypeError, ValueError) as exp:
+                raise_parse_error(child_, 'requires integer: %s' % exp)
+            ival_ = self.gds_validate_integer(ival_, node, 'UID')
+            self.UID = ival_
+        elif nodeName_ == 'GID' and child_.text:
+            sval_ = child_.text
+            try:
+                ival_ = int(sval_)
+            except (TypeError, ValueError) as exp:
+                raise_parse_error(child_, 'requires integer: %s' % exp)
+            ival_ = self.gds_validate_integer(ival_, node, 'GID')
+            self.GID = ival_
+        elif nodeName_ == 'UNAME':
+            UNAME_ = child_.text
+            UNAME_ = self.gds_validate_string(UNAME_, node, 'UNAME')
+            self.UNAME = UNAME_
+        elif nodeName_ == 'GNAME':
+            GNAME_ = child_.text
+            GNAME_ = self.gds_validate_string(GNAME_, node, 'GNAME')
+            self.GNAME = GNAME_
+        elif nodeName_ == 'NAME':
+            NAME_ = child_.text
+            NAME_ = self.gds_validate_string(NAME_, node, 'NAME')
+            self.NAME = NAME_
+        elif nodeName_ == 'PERMISSIONS':
+            obj_ = PERMISSIONSType84.factory()
+            obj_.build(child_)
+            self.PERMISSIONS = obj_
+            obj_.original_tagname_ = 'PERMISSIONS'
+        elif nodeName_ == 'CLUSTERS':
+            obj_ = CLUSTERSType85.factory()
+            obj_.build(child_)
+            self.CLUSTERS = obj_
+            obj_.original_tagname_ = 'CLUSTERS'
+        elif nodeName_ == 'BRIDGE':
+            BRIDGE_ = child_.text
+            BRIDGE_ = self.gds_validate_string(BRIDGE_, node, 'BRIDGE')
+            self.BRIDGE = BRIDGE_
+        elif nodeName_ == 'PARENT_NETWORK_ID':
+            PARENT_NETWORK_ID_ = child_.text
+            PARENT_NETWORK_ID_ = self.gds_validate_string(PARENT_NETWORK_ID_, node, 'PARENT_NETWORK_ID')
+            self.PARENT_NETWORK_ID = PARENT_NETWORK_ID_
+        elif nodeName_ == 'VN_MAD':
+            VN_MAD_ = child_.text
+            VN_MAD_ = self.gds_validate_string(VN_MAD_, node, 'VN_MAD')
+            self.VN_MAD = VN_MAD_
+        elif nodeName_ == 'PHYDEV':
+            PHYDEV_ = child_.text
+            PHYDEV_ = self.gds_validate_string(PHYDEV_, node, 'PHYDEV')
+            self.PHYDEV = PHYDEV_
+        elif nodeName_ == 'VLAN_ID':
+            VLAN_ID_ = child_.text
+            VLAN_ID_ = self.gds_validate_string(VLAN_ID_, node, 'VLAN_ID')
+            self.VLAN_ID = VLAN_ID_
+        elif nodeName_ == 'VLAN_ID_AUTOMATIC':
+            VLAN_ID_AUTOMATIC_ = child_.text
+            VLAN_ID_AUTOMATIC_ = self.gds_validate_string(VLAN_ID_AUTOMATIC_, node, 'VLAN_ID_AUTOMATIC')
+            self.VLAN_ID_AUTOMATIC = VLAN_ID_AUTOMATIC_
+        elif nodeName_ == 'USED_LEASES' and child_.text:
+            sval_ = child_.text
+            try:
+                ival_ = int(sval_)
+            except (TypeError, ValueError) as exp:
+                raise_parse_error(child_, 'requires integer: %s' % exp)
+            ival_ = self.gds_validate_integer(ival_, node, 'USED_LEASES')
+            self.USED_LEASES = ival_
+        elif nodeName_ == 'VROUTERS':
+            obj_ = VROUTERSType.factory()
+            obj_.build(child_)
+            self.VROUTERS = obj_
+            obj_.original_tagname_ = 'VROUTERS'
+        elif nodeName_ == 'TEMPLATE':
+            TEMPLATE_ = child_.text
+            TEMPLATE_ = self.gds_validate_string(TEMPLATE_, node, 'TEMPLATE')
+            self.TEMPLATE = TEMPLATE_
+        elif nodeName_ == 'AR_POOL':
+            obj_ = AR_POOLType.factory()
+            obj_.build(child_)
+            self.AR_POOL = obj_
+            obj_.original_tagname_ = 'AR_POOL'
+# end class VNETType83
+
+
+class PERMISSIONSType84(GeneratedsSuper):
+    subclass = None
+    superclass = None
+    def __init__(self, OWNER_U=None, OWNER_M=None, OWNER_A=None, GROUP_U=None, GROUP_M=None, GROUP_A=None, OTHER_U=None, OTHER_M=None, OTHER_A=None):
+        self.original_tagname_ = None
+        self.OWNER_U = OWNER_U
+        self.OWNER_M = OWNER_M
+        self.OWNER_A = OWNER_A
+        self.GROUP_U = GROUP_U
+        self.GROUP_M = GROUP_M
+        self.GROUP_A = GROUP_A
+        self.OTHER_U = OTHER_U
+        self.OTHER_M = OTHER_M
+        self.OTHER_A = OTHER_A
+    def factory(*args_, **kwargs_):
+        if supermod.CurrentSubclassModule_ is not None:
+            subclass = getSubclassFromModule_(
+                supermod.CurrentSubclassModule_, PERMISSIONSType84)
+            if subclass is not None:
+                return subclass(*args_, **kwargs_)
+        if PERMISSIONSType84.subclass:
+            return PERMISSIONSType84.subclass(*args_, **kwargs_)
+        else:
+            return PERMISSIONSType84(*args_, **kwargs_)
+    factory = staticmethod(factory)
+    def get_OWNER_U(self): return self.OWNER_U
+    def set_OWNER_U(self, OWNER_U): self.OWNER_U = OWNER_U
+    def get_OWNER_M(self): return self.OWNER_M
+    def set_OWNER_M(self, OWNER_M): self.OWNER_M = OWNER_M
+    def get_OWNER_A(self): return self.OWNER_A
+    def set_OWNER_A(self, OWNER_A): self.OWNER_A = OWNER_A
+    def get_GROUP_U(self): return self.GROUP_U
+    def set_GROUP_U(self, GROUP_U): self.GROUP_U = GROUP_U
+    def get_GROUP_M(self): return self.GROUP_M
+    def set_GROUP_M(self, GROUP_M): self.GROUP_M = GROUP_M
+    def get_GROUP_A(self): return self.GROUP_A
+    def set_GROUP_A(self, GROUP_A): self.GROUP_A = GROUP_A
+    def get_OTHER_U(self): return self.OTHER_U
+    def set_OTHER_U(self, OTHER_U): self.OTHER_U = OTHER_U
+    def get_OTHER_M(self): return self.OTHER_M
+    def set_OTHER_M(self, OTHER_M): self.OTHER_M = OTHER_M
+    def get_OTHER_A(self): return self.OTHER_A
+    def set_OTHER_A(self, OTHER_A): self.OTHER_A = OTHER_A
+    def hasContent_(self):
+        if (
+            self.OWNER_U is not None or
+            self.OWNER_M is not None or
+            self.OWNER_A is not None or
+            self.GROUP_U is not None or
+            self.GROUP_M is not None or
+            self.GROUP_A is not None or
+            self.OTHER_U is not None or
+            self.OTHER_M is not None or
+            self.OTHER_A is not None
+        ):
+            return True
+        else:
+            return False
+    def export(self, outfile, level, namespaceprefix_='', name_='PERMISSIONSType84', namespacedef_='', pretty_print=True):
+        imported_ns_def_ = GenerateDSNamespaceDefs_.get('PERMISSIONSType84')
+        if imported_ns_def_ is not None:
+            namespacedef_ = imported_ns_def_
+        if pretty_print:
+            eol_ = '\n'
+        else:
+            eol_ = ''
+        if self.original_tagname_ is not None:
+            name_ = self.original_tagname_
+        showIndent(outfile, level, pretty_print)
+        outfile.write('<%s%s%s' % (namespaceprefix_, name_, namespacedef_ and ' ' + namespacedef_ or '', ))
+        already_processed = set()
+        self.exportAttributes(outfile, level, already_processed, namespaceprefix_, name_='PERMISSIONSType84')
+        if self.hasContent_():
+            outfile.write('>%s' % (eol_, ))
+            self.exportChildren(outfile, level + 1, namespaceprefix_='', name_='PERMISSIONSType84', pretty_print=pretty_print)
+            showIndent(outfile, level, pretty_print)
+            outfile.write('</%s%s>%s' % (namespaceprefix_, name_, eol_))
+        else:
+            outfile.write('/>%s' % (eol_, ))
+    def exportAttributes(self, outfile, level, already_processed, namespaceprefix_='', name_='PERMISSIONSType84'):
+        pass
+    def exportChildren(self, outfile, level, namespaceprefix_='', name_='PERMISSIONSType84', fromsubclass_=False, pretty_print=True):
+        if pretty_print:
+            eol_ = '\n'
+        else:
+            eol_ = ''
+        if self.OWNER_U is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<OWNER_U>%s</OWNER_U>%s' % (self.gds_format_integer(self.OWNER_U, input_name='OWNER_U'), eol_))
+        if self.OWNER_M is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<OWNER_M>%s</OWNER_M>%s' % (self.gds_format_integer(self.OWNER_M, input_name='OWNER_M'), eol_))
+        if self.OWNER_A is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<OWNER_A>%s</OWNER_A>%s' % (self.gds_format_integer(self.OWNER_A, input_name='OWNER_A'), eol_))
+        if self.GROUP_U is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<GROUP_U>%s</GROUP_U>%s' % (self.gds_format_integer(self.GROUP_U, input_name='GROUP_U'), eol_))
+        if self.GROUP_M is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<GROUP_M>%s</GROUP_M>%s' % (self.gds_format_integer(self.GROUP_M, input_name='GROUP_M'), eol_))
+        if self.GROUP_A is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<GROUP_A>%s</GROUP_A>%s' % (self.gds_format_integer(self.GROUP_A, input_name='GROUP_A'), eol_))
+        if self.OTHER_U is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<OTHER_U>%s</OTHER_U>%s' % (self.gds_format_integer(self.OTHER_U, input_name='OTHER_U'), eol_))
+        if self.OTHER_M is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<OTHER_M>%s</OTHER_M>%s' % (self.gds_format_integer(self.OTHER_M, input_name='OTHER_M'), eol_))
+        if self.OTHER_A is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<OTHER_A>%s</OTHER_A>%s' % (self.gds_format_integer(self.OTHER_A, input_name='OTHER_A'), eol_))
+    def build(self, node):
+        already_processed = set()
+        self.buildAttributes(node, node.attrib, already_processed)
+        for child in node:
+            nodeName_ = Tag_pattern_.match(child.tag).groups()[-1]
+            self.buildChildren(child, node, nodeName_)
+        return self
+    def buildAttributes(self, node, attrs, already_processed):
+        pass
+    def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
+        if nodeName_ == 'OWNER_U' and child_.text:
+            sval_ = child_.text
+            try:
+                ival_ = int(sval_)
+            except (TypeError, ValueError) as exp:
+                raise_parse_error(child_, 'requires integer: %s' % exp)
+            ival_ = self.gds_validate_integer(ival_, node, 'OWNER_U')
+            self.OWNER_U = ival_
+        elif nodeName_ == 'OWNER_M' and child_.text:
+            sval_ = child_.text
+            try:
+                ival_ = int(sval_)
+            except (TypeError, ValueError) as exp:
+                raise_parse_error(child_, 'requires integer: %s' % exp)
+            ival_ = self.gds_validate_integer(ival_, node, 'OWNER_M')
+            self.OWNER_M = ival_
+        elif nodeName_ == 'OWNER_A' and child_.text:
+            sval_ = child_.text
+            try:
+                ival_ = int(sval_)
+            except (TypeError, ValueError) as exp:
+                raise_parse_error(child_, 'requires integer: %s' % exp)
+            ival_ = self.gds_validate_integer(ival_, node, 'OWNER_A')
+            self.OWNER_A = ival_
+        elif nodeName_ == 'GROUP_U' and child_.text:
+            sval_ = child_.text
+            try:
+                ival_ = int(sval_)
+            except (TypeError, ValueError) as exp:
+                raise_parse_error(child_, 'requires integer: %s' % exp)
+            ival_ = self.gds_validate_integer(ival_, node, 'GROUP_U')
+            self.GROUP_U = ival_
+        elif nodeName_ == 'GROUP_M' and child_.text:
+            sval_ = child_.text
+            try:
+                ival_ = int(sval_)
+            except (TypeError, ValueError) as exp:
+                raise_parse_error(child_, 'requires integer: %s' % exp)
+            ival_ = self.gds_validate_integer(ival_, node, 'GROUP_M')
+            self.GROUP_M = ival_
+        elif nodeName_ == 'GROUP_A' and child_.text:
+            sval_ = child_.text
+            try:
+                ival_ = int(sval_)
+            except (TypeError, ValueError) as exp:
+                raise_parse_error(child_, 'requires integer: %s' % exp)
+            ival_ = self.gds_validate_integer(ival_, node, 'GROUP_A')
+            self.GROUP_A = ival_
+        elif nodeName_ == 'OTHER_U' and child_.text:
+            sval_ = child_.text
+            try:
+                ival_ = int(sval_)
+            except (TypeError, ValueError) as exp:
+                raise_parse_error(child_, 'requires integer: %s' % exp)
+            ival_ = self.gds_validate_integer(ival_, node, 'OTHER_U')
+            self.OTHER_U = ival_
+        elif nodeName_ == 'OTHER_M' and child_.text:
+            sval_ = child_.text
+            try:
+                ival_ = int(sval_)
+            except (TypeError, ValueError) as exp:
+                raise_parse_error(child_, 'requires integer: %s' % exp)
+            ival_ = self.gds_validate_integer(ival_, node, 'OTHER_M')
+            self.OTHER_M = ival_
+        elif nodeName_ == 'OTHER_A' and child_.text:
+            sval_ = child_.text
+            try:
+                ival_ = int(sval_)
+            except (TypeError, ValueError) as exp:
+                raise_parse_error(child_, 'requires integer: %s' % exp)
+            ival_ = self.gds_validate_integer(ival_, node, 'OTHER_A')
+            self.OTHER_A = ival_
+# end class PERMISSIONSType84
+
+
+class CLUSTERSType85(GeneratedsSuper):
+    subclass = None
+    superclass = None
+    def __init__(self, ID=None):
+        self.original_tagname_ = None
+        if ID is None:
+            self.ID = []
+        else:
+            self.ID = ID
+    def factory(*args_, **kwargs_):
+        if supermod.CurrentSubclassModule_ is not None:
+            subclass = getSubclassFromModule_(
+                supermod.CurrentSubclassModule_, CLUSTERSType85)
+            if subclass is not None:
+                return subclass(*args_, **kwargs_)
+        if CLUSTERSType85.subclass:
+            return CLUSTERSType85.subclass(*args_, **kwargs_)
+        else:
+            return CLUSTERSType85(*args_, **kwargs_)
+    factory = staticmethod(factory)
+    def get_ID(self): return self.ID
+    def set_ID(self, ID): self.ID = ID
+    def add_ID(self, value): self.ID.append(value)
+    def insert_ID_at(self, index, value): self.ID.insert(index, value)
+    def replace_ID_at(self, index, value): self.ID[index] = value
+    def hasContent_(self):
+        if (
+            self.ID
+        ):
+            return True
+        else:
+            return False
+    def export(self, outfile, level, namespaceprefix_='', name_='CLUSTERSType85', namespacedef_='', pretty_print=True):
+        imported_ns_def_ = GenerateDSNamespaceDefs_.get('CLUSTERSType85')
+        if imported_ns_def_ is not None:
+            namespacedef_ = imported_ns_def_
+        if pretty_print:
+            eol_ = '\n'
+        else:
+            eol_ = ''
+        if self.original_tagname_ is not None:
+            name_ = self.original_tagname_
+        showIndent(outfile, level, pretty_print)
+        outfile.write('<%s%s%s' % (namespaceprefix_, name_, namespacedef_ and ' ' + namespacedef_ or '', ))
+        already_processed = set()
+        self.exportAttributes(outfile, level, already_processed, namespaceprefix_, name_='CLUSTERSType85')
+        if self.hasContent_():
+            outfile.write('>%s' % (eol_, ))
+            self.exportChildren(outfile, level + 1, namespaceprefix_='', name_='CLUSTERSType85', pretty_print=pretty_print)
+            showIndent(outfile, level, pretty_print)
+            outfile.write('</%s%s>%s' % (namespaceprefix_, name_, eol_))
+        else:
+            outfile.write('/>%s' % (eol_, ))
+    def exportAttributes(self, outfile, level, already_processed, namespaceprefix_='', name_='CLUSTERSType85'):
+        pass
+    def exportChildren(self, outfile, level, namespaceprefix_='', name_='CLUSTERSType85', fromsubclass_=False, pretty_print=True):
+        if pretty_print:
+            eol_ = '\n'
+        else:
+            eol_ = ''
+        for ID_ in self.ID:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<ID>%s</ID>%s' % (self.gds_format_integer(ID_, input_name='ID'), eol_))
+    def build(self, node):
+        already_processed = set()
+        self.buildAttributes(node, node.attrib, already_processed)
+        for child in node:
+            nodeName_ = Tag_pattern_.match(child.tag).groups()[-1]
+            self.buildChildren(child, node, nodeName_)
+        return self
+    def buildAttributes(self, node, attrs, already_processed):
+        pass
+    def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
+        if nodeName_ == 'ID' and child_.text:
+            sval_ = child_.text
+            try:
+                ival_ = int(sval_)
+            except (TypeError, ValueError) as exp:
+                raise_parse_error(child_, 'requires integer: %s' % exp)
+            ival_ = self.gds_validate_integer(ival_, node, 'ID')
+            self.ID.append(ival_)
+# end class CLUSTERSType85
+
+
+class VROUTERSType(GeneratedsSuper):
+    subclass = None
+    superclass = None
+    def __init__(self, ID=None):
+        self.original_tagname_ = None
+        if ID is None:
+            self.ID = []
+        else:
+            self.ID = ID
+    def factory(*args_, **kwargs_):
+        if supermod.CurrentSubclassModule_ is not None:
+            subclass = getSubclassFromModule_(
+                supermod.CurrentSubclassModule_, VROUTERSType)
+            if subclass is not None:
+                return subclass(*args_, **kwargs_)
+        if VROUTERSType.subclass:
+            return VROUTERSType.subclass(*args_, **kwargs_)
+        else:
+            return VROUTERSType(*args_, **kwargs_)
+    factory = staticmethod(factory)
+    def get_ID(self): return self.ID
+    def set_ID(self, ID): self.ID = ID
+    def add_ID(self, value): self.ID.append(value)
+    def insert_ID_at(self, index, value): self.ID.insert(index, value)
+    def replace_ID_at(self, index, value): self.ID[index] = value
+    def hasContent_(self):
+        if (
+            self.ID
+        ):
+            return True
+        else:
+            return False
+    def export(self, outfile, level, namespaceprefix_='', name_='VROUTERSType', namespacedef_='', pretty_print=True):
+        imported_ns_def_ = GenerateDSNamespaceDefs_.get('VROUTERSType')
+        if imported_ns_def_ is not None:
+            namespacedef_ = imported_ns_def_
+        if pretty_print:
+            eol_ = '\n'
+        else:
+            eol_ = ''
+        if self.original_tagname_ is not None:
+            name_ = self.original_tagname_
+        showIndent(outfile, level, pretty_print)
+        outfile.write('<%s%s%s' % (namespaceprefix_, name_, namespacedef_ and ' ' + namespacedef_ or '', ))
+        already_processed = set()
+        self.exportAttributes(outfile, level, already_processed, namespaceprefix_, name_='VROUTERSType')
+        if self.hasContent_():
+            outfile.write('>%s' % (eol_, ))
+            self.exportChildren(outfile, level + 1, namespaceprefix_='', name_='VROUTERSType', pretty_print=pretty_print)
+            showIndent(outfile, level, pretty_print)
+            outfile.write('</%s%s>%s' % (namespaceprefix_, name_, eol_))
+        else:
+            outfile.write('/>%s' % (eol_, ))
+    def exportAttributes(self, outfile, level, already_processed, namespaceprefix_='', name_='VROUTERSType'):
+        pass
+    def exportChildren(self, outfile, level, namespaceprefix_='', name_='VROUTERSType', fromsubclass_=False, pretty_print=True):
+        if pretty_print:
+            eol_ = '\n'
+        else:
+            eol_ = ''
+        for ID_ in self.ID:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<ID>%s</ID>%s' % (self.gds_format_integer(ID_, input_name='ID'), eol_))
+    def build(self, node):
+        already_processed = set()
+        self.buildAttributes(node, node.attrib, already_processed)
+        for child in node:
+            nodeName_ = Tag_pattern_.match(child.tag).groups()[-1]
+            self.buildChildren(child, node, nodeName_)
+        return self
+    def buildAttributes(self, node, attrs, already_processed):
+        pass
+    def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
+        if nodeName_ == 'ID' and child_.text:
+            sval_ = child_.text
+            try:
+                ival_ = int(sval_)
+            except (TypeError, ValueError) as exp:
+                raise_parse_error(child_, 'requires integer: %s' % exp)
+            ival_ = self.gds_validate_integer(ival_, node, 'ID')
+            self.ID.append(ival_)
+# end class VROUTERSType
+
+
+class AR_POOLType(GeneratedsSuper):
+    subclass = None
+    superclass = None
+    def __init__(self, AR=None):
+        self.original_tagname_ = None
+        if AR is None:
+            self.AR = []
+        else:
+            self.AR = AR
+    def factory(*args_, **kwargs_):
+        if supermod.CurrentSubclassModule_ is not None:
+            subclass = getSubclassFromModule_(
+                supermod.CurrentSubclassModule_, AR_POOLType)
+            if subclass is not None:
+                return subclass(*args_, **kwargs_)
+        if AR_POOLType.subclass:
+            return AR_POOLType.subclass(*args_, **kwargs_)
+        else:
+            return AR_POOLType(*args_, **kwargs_)
+    factory = staticmethod(factory)
+    def get_AR(self): return self.AR
+    def set_AR(self, AR): self.AR = AR
+    def add_AR(self, value): self.AR.append(value)
+    def insert_AR_at(self, index, value): self.AR.insert(index, value)
+    def replace_AR_at(self, index, value): self.AR[index] = value
+    def hasContent_(self):
+        if (
+            self.AR
+        ):
+            return True
+        else:
+            return False
+    def export(self, outfile, level, namespaceprefix_='', name_='AR_POOLType', namespacedef_='', pretty_print=True):
+        imported_ns_def_ = GenerateDSNamespaceDefs_.get('AR_POOLType')
+        if imported_ns_def_ is not None:
+            namespacedef_ = imported_ns_def_
+        if pretty_print:
+            eol_ = '\n'
+        else:
+            eol_ = ''
+        if self.original_tagname_ is not None:
+            name_ = self.original_tagname_
+        showIndent(outfile, level, pretty_print)
+        outfile.write('<%s%s%s' % (namespaceprefix_, name_, namespacedef_ and ' ' + namespacedef_ or '', ))
+        already_processed = set()
+        self.exportAttributes(outfile, level, already_processed, namespaceprefix_, name_='AR_POOLType')
+        if self.hasContent_():
+            outfile.write('>%s' % (eol_, ))
+            self.exportChildren(outfile, level + 1, namespaceprefix_='', name_='AR_POOLType', pretty_print=pretty_print)
+            showIndent(outfile, level, pretty_print)
+            outfile.write('</%s%s>%s' % (namespaceprefix_, name_, eol_))
+        else:
+            outfile.write('/>%s' % (eol_, ))
+    def exportAttributes(self, outfile, level, already_processed, namespaceprefix_='', name_='AR_POOLType'):
+        pass
+    def exportChildren(self, outfile, level, namespaceprefix_='', name_='AR_POOLType', fromsubclass_=False, pretty_print=True):
+        if pretty_print:
+            eol_ = '\n'
+        else:
+            eol_ = ''
+        for AR_ in self.AR:
+            AR_.export(outfile, level, namespaceprefix_, name_='AR', pretty_print=pretty_print)
+    def build(self, node):
+        already_processed = set()
+        self.buildAttributes(node, node.attrib, already_processed)
+        for child in node:
+            nodeName_ = Tag_pattern_.match(child.tag).groups()[-1]
+            self.buildChildren(child, node, nodeName_)
+        return self
+    def buildAttributes(self, node, attrs, already_processed):
+        pass
+    def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
+        if nodeName_ == 'AR':
+            obj_ = ARType.factory()
+            obj_.build(child_)
+            self.AR.append(obj_)
+            obj_.original_tagname_ = 'AR'
+# end class AR_POOLType
+
+
+class ARType(GeneratedsSuper):
+    subclass = None
+    superclass = None
+    def __init__(self, ALLOCATED=None, AR_ID=None, GLOBAL_PREFIX=None, IP=None, MAC=None, PARENT_NETWORK_AR_ID=None, SIZE=None, TYPE=None, ULA_PREFIX=None, VN_MAD=None):
+        self.original_tagname_ = None
+        self.ALLOCATED = ALLOCATED
+        self.AR_ID = AR_ID
+        self.GLOBAL_PREFIX = GLOBAL_PREFIX
+        self.IP = IP
+        self.MAC = MAC
+        self.PARENT_NETWORK_AR_ID = PARENT_NETWORK_AR_ID
+        self.SIZE = SIZE
+        self.TYPE = TYPE
+        self.ULA_PREFIX = ULA_PREFIX
+        self.VN_MAD = VN_MAD
+    def factory(*args_, **kwargs_):
+        if supermod.CurrentSubclassModule_ is not None:
+            subclass = getSubclassFromModule_(
+                supermod.CurrentSubclassModule_, ARType)
+            if subclass is not None:
+                return subclass(*args_, **kwargs_)
+        if ARType.subclass:
+            return ARType.subclass(*args_, **kwargs_)
+        else:
+            return ARType(*args_, **kwargs_)
+    factory = staticmethod(factory)
+    def get_ALLOCATED(self): return self.ALLOCATED
+    def set_ALLOCATED(self, ALLOCATED): self.ALLOCATED = ALLOCATED
+    def get_AR_ID(self): return self.AR_ID
+    def set_AR_ID(self, AR_ID): self.AR_ID = AR_ID
+    def get_GLOBAL_PREFIX(self): return self.GLOBAL_PREFIX
+    def set_GLOBAL_PREFIX(self, GLOBAL_PREFIX): self.GLOBAL_PREFIX = GLOBAL_PREFIX
+    def get_IP(self): return self.IP
+    def set_IP(self, IP): self.IP = IP
+    def get_MAC(self): return self.MAC
+    def set_MAC(self, MAC): self.MAC = MAC
+    def get_PARENT_NETWORK_AR_ID(self): return self.PARENT_NETWORK_AR_ID
+    def set_PARENT_NETWORK_AR_ID(self, PARENT_NETWORK_AR_ID): self.PARENT_NETWORK_AR_ID = PARENT_NETWORK_AR_ID
+    def get_SIZE(self): return self.SIZE
+    def set_SIZE(self, SIZE): self.SIZE = SIZE
+    def get_TYPE(self): return self.TYPE
+    def set_TYPE(self, TYPE): self.TYPE = TYPE
+    def get_ULA_PREFIX(self): return self.ULA_PREFIX
+    def set_ULA_PREFIX(self, ULA_PREFIX): self.ULA_PREFIX = ULA_PREFIX
+    def get_VN_MAD(self): return self.VN_MAD
+    def set_VN_MAD(self, VN_MAD): self.VN_MAD = VN_MAD
+    def hasContent_(self):
+        if (
+            self.ALLOCATED is not None or
+            self.AR_ID is not None or
+            self.GLOBAL_PREFIX is not None or
+            self.IP is not None or
+            self.MAC is not None or
+            self.PARENT_NETWORK_AR_ID is not None or
+            self.SIZE is not None or
+            self.TYPE is not None or
+            self.ULA_PREFIX is not None or
+            self.VN_MAD is not None
+        ):
+            return True
+        else:
+            return False
+    def export(self, outfile, level, namespaceprefix_='', name_='ARType', namespacedef_='', pretty_print=True):
+        imported_ns_def_ = GenerateDSNamespaceDefs_.get('ARType')
+        if imported_ns_def_ is not None:
+            namespacedef_ = imported_ns_def_
+        if pretty_print:
+            eol_ = '\n'
+        else:
+            eol_ = ''
+        if self.original_tagname_ is not None:
+            name_ = self.original_tagname_
+        showIndent(outfile, level, pretty_print)
+        outfile.write('<%s%s%s' % (namespaceprefix_, name_, namespacedef_ and ' ' + namespacedef_ or '', ))
+        already_processed = set()
+        self.exportAttributes(outfile, level, already_processed, namespaceprefix_, name_='ARType')
+        if self.hasContent_():
+            outfile.write('>%s' % (eol_, ))
+            self.exportChildren(outfile, level + 1, namespaceprefix_='', name_='ARType', pretty_print=pretty_print)
+            showIndent(outfile, level, pretty_print)
+            outfile.write('</%s%s>%s' % (namespaceprefix_, name_, eol_))
+        else:
+            outfile.write('/>%s' % (eol_, ))
+    def exportAttributes(self, outfile, level, already_processed, namespaceprefix_='', name_='ARType'):
+        pass
+    def exportChildren(self, outfile, level, namespaceprefix_='', name_='ARType', fromsubclass_=False, pretty_print=True):
+        if pretty_print:
+            eol_ = '\n'
+        else:
+            eol_ = ''
+        if self.ALLOCATED is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<ALLOCATED>%s</ALLOCATED>%s' % (self.gds_encode(self.gds_format_string(quote_xml(self.ALLOCATED), input_name='ALLOCATED')), eol_))
+        if self.AR_ID is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<AR_ID>%s</AR_ID>%s' % (self.gds_encode(self.gds_format_string(quote_xml(self.AR_ID), input_name='AR_ID')), eol_))
+        if self.GLOBAL_PREFIX is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<GLOBAL_PREFIX>%s</GLOBAL_PREFIX>%s' % (self.gds_encode(self.gds_format_string(quote_xml(self.GLOBAL_PREFIX), input_name='GLOBAL_PREFIX')), eol_))
+        if self.IP is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<IP>%s</IP>%s' % (self.gds_encode(self.gds_format_string(quote_xml(self.IP), input_name='IP')), eol_))
+        if self.MAC is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<MAC>%s</MAC>%s' % (self.gds_encode(self.gds_format_string(quote_xml(self.MAC), input_name='MAC')), eol_))
+        if self.PARENT_NETWORK_AR_ID is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<PARENT_NETWORK_AR_ID>%s</PARENT_NETWORK_AR_ID>%s' % (self.gds_encode(self.gds_format_string(quote_xml(self.PARENT_NETWORK_AR_ID), input_name='PARENT_NETWORK_AR_ID')), eol_))
+        if self.SIZE is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<SIZE>%s</SIZE>%s' % (self.gds_format_integer(self.SIZE, input_name='SIZE'), eol_))
+        if self.TYPE is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<TYPE>%s</TYPE>%s' % (self.gds_encode(self.gds_format_string(quote_xml(self.TYPE), input_name='TYPE')), eol_))
+        if self.ULA_PREFIX is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<ULA_PREFIX>%s</ULA_PREFIX>%s' % (self.gds_encode(self.gds_format_string(quote_xml(self.ULA_PREFIX), input_name='ULA_PREFIX')), eol_))
+        if self.VN_MAD is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<VN_MAD>%s</VN_MAD>%s' % (self.gds_encode(self.gds_format_string(quote_xml(self.VN_MAD), input_name='VN_MAD')), eol_))
+    def build(self, node):
+        already_processed = set()
+        self.buildAttributes(node, node.attrib, already_processed)
+        for child in node:
+            nodeName_ = Tag_pattern_.match(child.tag).groups()[-1]
+            self.buildChildren(child, node, nodeName_)
+        return self
+    def buildAttributes(self, node, attrs, already_processed):
+        pass
+    def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
+        if nodeName_ == 'ALLOCATED':
+            ALLOCATED_ = child_.text
+            ALLOCATED_ = self.gds_validate_string(ALLOCATED_, node, 'ALLOCATED')
+            self.ALLOCATED = ALLOCATED_
+        elif nodeName_ == 'AR_ID':
+            AR_ID_ = child_.text
+            AR_ID_ = self.gds_validate_string(AR_ID_, node, 'AR_ID')
+            self.AR_ID = AR_ID_
+        elif nodeName_ == 'GLOBAL_PREFIX':
+            GLOBAL_PREFIX_ = child_.text
+            GLOBAL_PREFIX_ = self.gds_validate_string(GLOBAL_PREFIX_, node, 'GLOBAL_PREFIX')
+            self.GLOBAL_PREFIX = GLOBAL_PREFIX_
+        elif nodeName_ == 'IP':
+            IP_ = child_.text
+            IP_ = self.gds_validate_string(IP_, node, 'IP')
+            self.IP = IP_
+        elif nodeName_ == 'MAC':
+            MAC_ = child_.text
+            MAC_ = self.gds_validate_string(MAC_, node, 'MAC')
+            self.MAC = MAC_
+        elif nodeName_ == 'PARENT_NETWORK_AR_ID':
+            PARENT_NETWORK_AR_ID_ = child_.text
+            PARENT_NETWORK_AR_ID_ = self.gds_validate_string(PARENT_NETWORK_AR_ID_, node, 'PARENT_NETWORK_AR_ID')
+            self.PARENT_NETWORK_AR_ID = PARENT_NETWORK_AR_ID_
+        elif nodeName_ == 'SIZE' and child_.text:
+            sval_ = child_.text
+            try:
+                ival_ = int(sval_)
+            except (TypeError, ValueError) as exp:
+                raise_parse_error(child_, 'requires integer: %s' % exp)
+            ival_ = self.gds_validate_integer(ival_, node, 'SIZE')
+            self.SIZE = ival_
+        elif nodeName_ == 'TYPE':
+            TYPE_ = child_.text
+            TYPE_ = self.gds_validate_string(TYPE_, node, 'TYPE')
+            self.TYPE = TYPE_
+        elif nodeName_ == 'ULA_PREFIX':
+            ULA_PREFIX_ = child_.text
+            ULA_PREFIX_ = self.gds_validate_string(ULA_PREFIX_, node, 'ULA_PREFIX')
+            self.ULA_PREFIX = ULA_PREFIX_
+        elif nodeName_ == 'VN_MAD':
+            VN_MAD_ = child_.text
+            VN_MAD_ = self.gds_validate_string(VN_MAD_, node, 'VN_MAD')
+            self.VN_MAD = VN_MAD_
+# end class ARType
+
+
+class VNET_POOLSub(TemplatedType, VNET_POOL):
+    def __init__(self, VNET=None):
+        super(VNET_POOLSub, self).__init__(VNET, )
+VNET_POOL.subclass = VNET_POOLSub
+# end class VNET_POOLSub
+
+
+class VNETType83Sub(TemplatedType, VNETType83):
+    def __init__(self, ID=None, UID=None, GID=None, UNAME=None, GNAME=None, NAME=None, PERMISSIONS=None, CLUSTERS=None, BRIDGE=None, PARENT_NETWORK_ID=None, VN_MAD=None, PHYDEV=None, VLAN_ID=None, VLAN_ID_AUTOMATIC=None, USED_LEASES=None, VROUTERS=None, TEMPLATE=None, AR_POOL=None):
+        super(VNETType83Sub, self).__init__(ID, UID, GID, UNAME, GNAME, NAME, PERMISSIONS, CLUSTERS, BRIDGE, PARENT_NETWORK_ID, VN_MAD, PHYDEV, VLAN_ID, VLAN_ID_AUTOMATIC, USED_LEASES, VROUTERS, TEMPLATE, AR_POOL, )
+VNETType83.subclass = VNETType83Sub
+# end class VNETType83Sub
+
+
+class PERMISSIONSType84Sub(TemplatedType, PERMISSIONSType84):
+    def __init__(self, OWNER_U=None, OWNER_M=None, OWNER_A=None, GROUP_U=None, GROUP_M=None, GROUP_A=None, OTHER_U=None, OTHER_M=None, OTHER_A=None):
+        super(PERMISSIONSType84Sub, self).__init__(OWNER_U, OWNER_M, OWNER_A, GROUP_U, GROUP_M, GROUP_A, OTHER_U, OTHER_M, OTHER_A, )
+PERMISSIONSType84.subclass = PERMISSIONSType84Sub
+# end class PERMISSIONSType84Sub
+
+
+class CLUSTERSType85Sub(TemplatedType, CLUSTERSType85):
+    def __init__(self, ID=None):
+        super(CLUSTERSType85Sub, self).__init__(ID, )
+CLUSTERSType85.subclass = CLUSTERSType85Sub
+# end class CLUSTERSType85Sub
+
+
+class VROUTERSTypeSub(TemplatedType, VROUTERSType):
+    def __init__(self, ID=None):
+        super(VROUTERSTypeSub, self).__init__(ID, )
+VROUTERSType.subclass = VROUTERSTypeSub
+# end class VROUTERSTypeSub
+
+
+class AR_POOLTypeSub(TemplatedType, AR_POOLType):
+    def __init__(self, AR=None):
+        super(AR_POOLTypeSub, self).__init__(AR, )
+AR_POOLType.subclass = AR_POOLTypeSub
+# end class AR_POOLTypeSub
+
+
+class ARTypeSub(TemplatedType, ARType):
+    def __init__(self, ALLOCATED=None, AR_ID=None, GLOBAL_PREFIX=None, IP=None, MAC=None, PARENT_NETWORK_AR_ID=None, SIZE=None, TYPE=None, ULA_PREFIX=None, VN_MAD=None):
+        super(ARTypeSub, self).__init__(ALLOCATED, AR_ID, GLOBAL_PREFIX, IP, MAC, PARENT_NETWORK_AR_ID, SIZE, TYPE, ULA_PREFIX, VN_MAD, )
+ARType.subclass = ARTypeSub
+# end class ARTypeSub
+
+
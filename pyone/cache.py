@@ -0,0 +1,148 @@
+# Copyright 2018 www.privaz.io Valletech AB
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import threading
+import time
+from collections import OrderedDict
+
+# last component of the read only methods, cached unless their TTL is 0, calls to any other method
+# change objects and invalidate the cached responses of their kind
+READ_ONLY_METHODS = ("info", "infoextended", "accounting", "showback", "monitoring", "version", "config",
+                     "raftstatus")
+
+
+def method_kind(methodname):
+    '''
+    :param methodname: XMLRPC method name, e.g. hostpool.info
+    :return: the kind of object the method works on, e.g. host
+    '''
+    kind = methodname.split(".", 1)[0]
+    if kind.endswith("pool"):
+        kind = kind[:-len("pool")]
+    return kind
+
+
+class ResponseCache(object):
+    '''
+    LRU cache of the responses of read only calls, keyed by method and casted parameters.
+    Entries expire after a per method TTL, and calls to any other method of the same kind of object,
+    e.g. host.update, invalidate the entries for that kind, e.g. host.info and hostpool.info.
+    Only successful responses are cached. The cache is thread safe and can be shared by servers.
+    '''
+
+    def __init__(self, ttl=5, ttls=None, max_size=1024):
+        '''
+        :param ttl: seconds responses are kept by default
+        :param ttls: TTL per method, overriding the default, e.g. {"hostpool.info": 30, "vm.info": 0}.
+                     A TTL of 0 disables caching for the method, methods listed here are cached even if
+                     not considered read only.
+        :param max_size: maximum number of responses kept, the least recently used are evicted first
+        '''
+        self.ttl = ttl
+        self.ttls = dict(ttls or {})
+        self.max_size = max_size
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+
+    def read_only(self, methodname):
+        '''
+        :return: True if the method does not change objects, read only methods and those given a TTL
+        '''
+        return methodname.rsplit(".", 1)[-1] in READ_ONLY_METHODS or bool(self.ttls.get(methodname))
+
+    def method_ttl(self, methodname):
+        '''
+        :return: seconds the responses of a method are kept, 0 if it is not cached
+        '''
+        if methodname in self.ttls:
+            return self.ttls[methodname]
+        if methodname.rsplit(".", 1)[-1] in READ_ONLY_METHODS:
+            return self.ttl
+        return 0
+
+    def get(self, methodname, params):
+        '''
+        :param methodname: XMLRPC method name, without the "one." prefix
+        :param params: casted parameters
+        :return: the cached response, or None
+        '''
+        if not self.method_ttl(methodname):
+            return None
+        key = (methodname, repr(params))
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                expires, response = entry
+                if expires > time.time():
+                    # most recently used last
+                    self._entries[key] = self._entries.pop(key)
+                    self.hits += 1
+                    return response
+                del self._entries[key]
+            self.misses += 1
+        return None
+
+    def put(self, methodname, params, response):
+        '''
+        Records the response of a call, caching it if the method is read only and its TTL is not 0.
+        Calls to other methods invalidate the entries of the same kind of object.
+        :param methodname: XMLRPC method name, without the "one." prefix
+        :param params: casted parameters
+        :param response: the OpenNebula response [success, value, code], None if the call failed
+        '''
+        if not self.read_only(methodname):
+            self.invalidate(method_kind(methodname))
+            return
+        ttl = self.method_ttl(methodname)
+        if not ttl or not response or not response[0]:
+            return
+        key = (methodname, repr(params))
+        with self._lock:
+            self._entries.pop(key, None)
+            self._entries[key] = (time.time() + ttl, response)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def invalidate(self, kind=None):
+        '''
+        Drops cached responses
+        :param kind: kind of object, e.g. host for host.info and hostpool.info, all responses if None
+        '''
+        with self._lock:
+            if kind is None:
+                keys = list(self._entries)
+            else:
+                keys = [key for key in self._entries if method_kind(key[0]) == kind]
+            for key in keys:
+                del self._entries[key]
+            self.invalidations += len(keys)
+
+    def stats(self):
+        '''
+        :return: a dictionary with the cache counters
+        '''
+        with self._lock:
+            return {
+                "size": len(self._entries),
+                "max_size": self.max_size,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "invalidations": self.invalidations
+            }
@@ -0,0 +1,294 @@
+# Copyright 2018 www.privaz.io Valletech AB
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+# Index of the free capacity of hosts (host.xsd) and system datastores (datastore.xsd), for placement.
+
+import heapq
+import threading
+from bisect import bisect_left, insort
+from collections import namedtuple
+from . import OneException, HOST_STATES, DATASTORE_TYPES
+
+# free capacity of a host: CPU in hundredths of a core, memory in KB, and the largest free system datastore in MB,
+# None if no system datastore of the host is indexed
+HostCapacity = namedtuple("HostCapacity", ["id", "name", "cluster", "state", "free_cpu", "free_memory",
+                                           "free_disk", "running_vms"])
+
+# states of the hosts VMs can be placed in
+SCHEDULABLE_STATES = (HOST_STATES.MONITORED, HOST_STATES.MONITORING_MONITORED)
+
+# resources hosts can be ranked by, most free first
+RANKS = ("FREE_CPU", "FREE_MEMORY")
+
+
+def _int(value, default=0):
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return default
+
+
+def _number(value):
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return 0.0
+
+
+def requirements(template):
+    '''
+    Capacity required by a VM template, in the units of HOST_SHARE
+    :param template: VM or VM template TEMPLATE dictionary, e.g. from one.template.info(id).TEMPLATE,
+                     with CPU in cores, MEMORY in MB and the SIZE of the DISKs in MB
+    :return: CPU in hundredths of a core, memory in KB and disk in MB
+    '''
+    disks = template.get("DISK") or []
+    if isinstance(disks, dict):
+        disks = [disks]
+    disk = sum(_number(disk.get("SIZE")) for disk in disks)
+    return int(round(_number(template.get("CPU")) * 100)), int(_number(template.get("MEMORY")) * 1024), int(disk)
+
+
+class _Host(object):
+    # indexed capacity of a host
+    __slots__ = ("id", "name", "cluster", "state", "free_cpu", "free_memory", "datastores", "running_vms")
+
+    def __init__(self, host):
+        share = host.HOST_SHARE
+        self.id = host.ID
+        self.name = host.NAME
+        self.cluster = host.CLUSTER_ID
+        self.state = host.STATE
+        # allocated capacity, as the scheduler, rather than the monitored one
+        self.free_cpu = _int(share.MAX_CPU) - _int(share.CPU_USAGE)
+        self.free_memory = _int(share.MAX_MEM) - _int(share.MEM_USAGE)
+        self.running_vms = _int(share.RUNNING_VMS)
+        # free MB of the local system datastores
+        self.datastores = {}
+        datastores = getattr(share.DATASTORES, "DS", None) if share.DATASTORES is not None else None
+        for ds in datastores or []:
+            self.datastores[ds.ID] = _int(ds.FREE_MB)
+
+    def value(self, rank):
+        return self.free_cpu if rank == "FREE_CPU" else self.free_memory
+
+
+class CapacityIndex(object):
+    '''
+    Index of the free capacity of hosts, fed from host.info and hostpool.info responses, and of the free
+    space of the system datastores, from datastore.info and datastorepool.info ones.
+    Hosts are grouped by cluster and state, each group sorted by free CPU and by free memory. Finding the hosts
+    a VM fits in merges the groups of the requested clusters and states only, and stops after k hosts: it costs
+    about the hosts returned plus those skipped for lacking the other resource or disk, rather than the pool size:
+
+        index = CapacityIndex()
+        index.update(one.hostpool.info())
+        index.update(one.datastorepool.info())
+        index.fit(one.template.info(7).TEMPLATE, k=3)
+
+    Free capacity is the allocated one, MAX_CPU - CPU_USAGE and MAX_MEM - MEM_USAGE, as the scheduler does.
+    The index is thread safe.
+    '''
+
+    def __init__(self):
+        self._lock = threading.RLock()
+        # host ID: _Host
+        self._hosts = {}
+        # (cluster ID, state): {rank: sorted list of (free, host ID)}
+        self._groups = {}
+        # datastore ID: (free MB, cluster IDs) of the shared system datastores
+        self._datastores = {}
+        # cluster ID: {datastore ID: free MB}
+        self._cluster_datastores = {}
+
+    def update(self, response):
+        '''
+        Adds or replaces hosts or system datastores
+        :param response: a host or datastore, as returned by host.info or datastore.info, a pool
+                         of those, as returned by hostpool.info or datastorepool.info, or an iterable of hosts
+        :return: number of objects updated
+        '''
+        from pyone.bindings import supermod
+        if isinstance(response, supermod.DATASTORE_POOL):
+            return self._update_datastores(response.DATASTORE or [])
+        if isinstance(response, supermod.DATASTORE):
+            return self._update_datastores([response])
+        if isinstance(response, supermod.HOST_POOL):
+            hosts = response.HOST or []
+        elif isinstance(response, supermod.HOST):
+            hosts = [response]
+        else:
+            hosts = response
+
+        count = 0
+        with self._lock:
+            for host in hosts:
+                self._remove(host.ID)
+                self._add(_Host(host))
+                count += 1
+        return count
+
+    def _update_datastores(self, datastores):
+        with self._lock:
+            for datastore in datastores:
+                self._remove_datastore(datastore.ID)
+                if datastore.TYPE != DATASTORE_TYPES.SYSTEM:
+                    continue
+                clusters = datastore.CLUSTERS.ID if datastore.CLUSTERS is not None else None
+                clusters = clusters if isinstance(clusters, list) else [clusters] if clusters is not None else []
+                free = _int(datastore.FREE_MB)
+                self._datastores[datastore.ID] = (free, clusters)
+                for cluster in clusters:
+                    self._cluster_datastores.setdefault(cluster, {})[datastore.ID] = free
+        return len(datastores)
+
+    def _remove_datastore(self, id):
+        entry = self._datastores.pop(id, None)
+        if entry is not None:
+            for cluster in entry[1]:
+                self._cluster_datastores[cluster].pop(id, None)
+
+    def remove(self, id):
+        '''
+        Removes a host, e.g. after deleting it
+        :param id: host ID
+        :return: True if the host was indexed
+        '''
+        with self._lock:
+            return self._remove(id) is not None
+
+    def allocate(self, id, cpu=0, memory=0):
+        '''
+        Subtracts the capacity of a VM placed in a host, until the next update of the host
+        :param id: host ID
+        :param cpu: CPU in hundredths of a core
+        :param memory: memory in KB
+        '''
+        with self._lock:
+            host = self._remove(id)
+            if host is None:
+                raise OneException("Host %s is not indexed" % id)
+            host.free_cpu -= cpu
+            host.free_memory -= memory
+            host.running_vms += 1
+            self._add(host)
+
+    def _add(self, host):
+        self._hosts[host.id] = host
+        lists = self._groups.setdefault((host.cluster, host.state), dict((rank, []) for rank in RANKS))
+        for rank in RANKS:
+            insort(lists[rank], (host.value(rank), host.id))
+
+    def _remove(self, id):
+        host = self._hosts.pop(id, None)
+        if host is None:
+            return None
+        key = (host.cluster, host.state)
+        lists = self._groups[key]
+        for rank in RANKS:
+            entries = lists[rank]
+            del entries[bisect_left(entries, (host.value(rank), id))]
+        if not lists[RANKS[0]]:
+            del self._groups[key]
+        return host
+
+    def _free_disk(self, host):
+        free = list(host.datastores.values()) + list(self._cluster_datastores.get(host.cluster, {}).values())
+        return max(free) if free else None
+
+    def _capacity(self, host):
+        return HostCapacity(host.id, host.name, host.cluster, host.state, host.free_cpu, host.free_memory,
+                            self._free_disk(host), host.running_vms)
+
+    def get(self, id):
+        '''
+        :return: the HostCapacity of a host, or None if not indexed
+        '''
+        with self._lock:
+            host = self._hosts.get(id)
+            return self._capacity(host) if host is not None else None
+
+    def hosts(self, cluster=None, state=None):
+        '''
+        :param cluster: cluster ID, None for all
+        :param state: HOST_STATES value, None for all
+        :return: sorted list of the IDs of the hosts in the cluster and state
+        '''
+        with self._lock:
+            return sorted(id for (group_cluster, group_state), lists in self._groups.items()
+                          for _, id in lists[RANKS[0]]
+                          if (cluster is None or group_cluster == cluster) and (state is None or group_state == state))
+
+    def fit(self, template=None, cpu=0, memory=0, disk=0, k=1, clusters=None, rank="FREE_CPU", packing=False,
+            states=SCHEDULABLE_STATES):
+        '''
+        Finds the hosts with capacity for a VM
+        :param template: VM template dictionary, see requirements, overrides cpu, memory and disk
+        :param cpu: CPU in hundredths of a core
+        :param memory: memory in KB
+        :param disk: disk in MB, checked against the free space of the system datastores of the hosts
+                     if any is indexed
+        :param k: maximum number of hosts
+        :param clusters: list of cluster IDs the hosts must belong to, None for any
+        :param rank: FREE_CPU or FREE_MEMORY, the resource hosts are sorted by
+        :param packing: return the hosts with the least free capacity first instead of the most
+        :param states: host states VMs can be placed in
+        :return: list of up to k HostCapacity
+        '''
+        if rank not in RANKS:
+            raise OneException("Unknown rank %s, use one of %s" % (rank, ", ".join(RANKS)))
+        if template is not None:
+            cpu, memory, disk = requirements(template)
+        needed = cpu if rank == "FREE_CPU" else memory
+
+        with self._lock:
+            lists = [self._groups[(cluster, state)][rank]
+                     for cluster, state in self._keys(clusters, states) if (cluster, state) in self._groups]
+            found = []
+            for _, id in self._candidates(lists, needed, packing):
+                host = self._hosts[id]
+                if host.free_cpu < cpu or host.free_memory < memory:
+                    continue
+                free_disk = self._free_disk(host)
+                if disk and free_disk is not None and free_disk < disk:
+                    continue
+                found.append(self._capacity(host))
+                if len(found) >= k:
+                    break
+            return found
+
+    def _keys(self, clusters, states):
+        # groups of the requested clusters and states, of any cluster if none is requested
+        if not clusters:
+            return [key for key in self._groups if key[1] in states]
+        return [(cluster, state) for cluster in set(clusters) for state in set(states)]
+
+    @staticmethod
+    def _candidates(lists, needed, packing):
+        # entries with enough of the ranked resource, from the least or the most free
+        def ascending(entries):
+            for i in range(bisect_left(entries, (needed,)), len(entries)):
+                yield entries[i]
+
+        def descending(entries):
+            for i in range(len(entries) - 1, bisect_left(entries, (needed,)) - 1, -1):
+                free, id = entries[i]
+                yield -free, -id
+
+        if packing:
+            return heapq.merge(*[ascending(entries) for entries in lists])
+        return ((-free, -id) for free, id in heapq.merge(*[descending(entries) for entries in lists]))
+
+    def __len__(self):
+        return len(self._hosts)
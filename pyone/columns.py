@@ -0,0 +1,224 @@
+# Copyright 2018 www.privaz.io Valletech AB
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+# Columnar extraction of pool documents, for analytics.
+# This module is imported by the bindings package, it must not import it at module level.
+
+import array
+import os
+from collections import OrderedDict
+from io import BytesIO
+from lxml import etree
+from six import text_type
+
+from .util import _localname, INT64_TYPECODE
+from .parsing import is_collection
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+XSD_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "xsd")
+XS = "{http://www.w3.org/2001/XMLSchema}"
+
+# array.array type codes of the numeric XSD types, other types are kept as strings
+ARRAY_TYPES = {"integer": INT64_TYPECODE, "decimal": "d"}
+
+# top level element declarations of the schemas, loaded on first use
+_declarations = {}
+
+
+def _declaration(name):
+    if not _declarations:
+        for xsd in sorted(os.listdir(XSD_DIR)):
+            if xsd.endswith(".xsd"):
+                for node in etree.parse(os.path.join(XSD_DIR, xsd)).getroot().iterchildren(XS + "element"):
+                    _declarations.setdefault(node.get("name"), node)
+    return _declarations.get(name)
+
+
+def _child(declaration, name):
+    # element declarations of a complex type, not those of its children
+    pending = list(declaration.iterchildren(etree.Element)) if declaration is not None else []
+    while pending:
+        node = pending.pop(0)
+        if node.tag == XS + "element":
+            if node.get("name") == name:
+                return node
+            if node.get("ref") == name:
+                return _declaration(name)
+        else:
+            pending.extend(node.iterchildren(etree.Element))
+    return None
+
+
+def _object_element(root):
+    # name of the objects of a collection, e.g. HOST for HOST_POOL
+    declaration = _declaration(root)
+    if declaration is not None:
+        for node in declaration.iterdescendants(XS + "element"):
+            return node.get("name") or node.get("ref")
+    return None
+
+
+def _path_declarations(root, path):
+    declarations = []
+    declaration = _declaration(root)
+    for part in path:
+        declaration = _child(declaration, part)
+        if declaration is None:
+            return None
+        declarations.append(declaration)
+    return declarations
+
+
+def field_type(root, path):
+    '''
+    Looks up the XSD type of an element
+    :param root: document root element name, e.g. HOST_POOL
+    :param path: path of the element from the root, e.g. HOST/HOST_SHARE/USED_CPU
+    :return: XSD type, e.g. integer, decimal or string, None if it is not declared
+    '''
+    declarations = _path_declarations(root, path.split("/"))
+    xsd_type = declarations[-1].get("type") if declarations else None
+    return xsd_type.split(":")[-1] if xsd_type else None
+
+
+def _single(root, path):
+    # whether objects have at most one element at the path
+    declarations = _path_declarations(root, path)
+    return declarations is not None and all(d.get("maxOccurs", "1") == "1" for d in declarations[1:])
+
+
+def _state_enums(element):
+    # imported here, pyone imports the bindings that import this module
+    import pyone
+    return {
+        "VM": {"STATE": pyone.VM_STATE, "LCM_STATE": pyone.LCM_STATE},
+        "HOST": {"STATE": pyone.HOST_STATES},
+        "IMAGE": {"STATE": pyone.IMAGE_STATES},
+        "DATASTORE": {"STATE": pyone.DATASTORE_STATES},
+        "MARKETPLACEAPP": {"STATE": pyone.MARKETPLACEAPP_STATES}
+    }.get(element, {})
+
+
+def _xml_texts(root, objects, element, path):
+    if root is not None and _single(_localname(root.tag), [element] + path):
+        # one pass over the whole document, aligned with the objects unless some lack the element
+        texts = [node.text for node in root.iterfind("/".join("{*}" + part for part in [element] + path))]
+        if len(texts) == len(objects):
+            return texts
+    path = "/".join("{*}" + part for part in path)
+    return [obj.findtext(path) for obj in objects]
+
+
+def _binding_values(objects, path):
+    values = []
+    for obj in objects:
+        for part in path:
+            if isinstance(obj, list):
+                obj = obj[0] if obj else None
+            obj = getattr(obj, part, None)
+            if obj is None:
+                break
+        values.append(obj)
+    return values
+
+
+def _column(values, xsd_type, missing):
+    code = ARRAY_TYPES.get(xsd_type)
+    if code is None:
+        values = [value if value != "" else None for value in values]
+        return numpy.array(values, dtype=object) if numpy is not None else values
+    if code == "d":
+        missing = float("nan")
+    if any(value is None or value == "" for value in values):
+        values = [missing if value is None or value == "" else value for value in values]
+    if numpy is not None:
+        return numpy.array(values, dtype=numpy.float64 if code == "d" else numpy.int64)
+    convert = float if code == "d" else int
+    return array.array(code, [convert(value) for value in values])
+
+
+def _decode(column, enum):
+    members = dict((member.value, member) for member in enum)
+    decoded = [members.get(value, value) for value in column]
+    return numpy.array(decoded, dtype=object) if numpy is not None else decoded
+
+
+def to_columns(pool, fields, states=False, missing=-1):
+    '''
+    Extracts fields of the objects of a pool as typed columns, one array per field:
+
+        columns = bindings.to_columns(xml, ['ID', 'STATE', 'HOST_SHARE/USED_CPU'])
+        columns['HOST_SHARE/USED_CPU'].sum()
+
+    Columns of xs:integer elements are int64 and those of xs:decimal float64, according to the XSDs,
+    as NumPy arrays if NumPy is installed, array.array otherwise. Other elements are kept as strings,
+    in object arrays or lists.
+
+    :param pool: pool document, as bytes, text or parsed element, or pool binding object.
+                 The document is read directly, for bindings their attributes are walked instead.
+                 A single object gives one row.
+    :param fields: paths of the fields relative to each object, e.g. HISTORY_RECORDS/HISTORY/HOSTNAME.
+                   The first element is taken for repeated elements.
+    :param states: decode STATE and LCM_STATE columns to the IntEnums, e.g. VM_STATE
+    :param missing: value of missing integer fields, missing decimals are NaN and strings None
+    :return: ordered dictionary with the column of each field
+    '''
+    if isinstance(pool, text_type):
+        pool = pool.encode("utf-8")
+    if isinstance(pool, bytes):
+        pool = etree.parse(BytesIO(pool), parser=etree.ETCompatXMLParser()).getroot()
+
+    root = None
+    if isinstance(pool, etree._Element):
+        rootname = _localname(pool.tag)
+        if is_collection(pool.tag):
+            root = pool
+            objects = list(pool.iterchildren(etree.Element))
+            element = _localname(objects[0].tag) if objects else _object_element(rootname)
+        else:
+            objects = [pool]
+            element = rootname
+    else:
+        rootname = next((cls.__name__ for cls in type(pool).__mro__ if _declaration(cls.__name__) is not None),
+                        None)
+        if rootname is None:
+            raise ValueError("%s is not a binding of a declared element" % type(pool).__name__)
+        if is_collection(rootname):
+            element = _object_element(rootname)
+            objects = getattr(pool, element, None) or []
+        else:
+            objects = [pool]
+            element = rootname
+
+    enums = _state_enums(element) if states else {}
+    columns = OrderedDict()
+    for field in fields:
+        path = [part for part in field.split("/") if part]
+        if rootname == element:
+            xsd_type = field_type(rootname, "/".join(path))
+        else:
+            xsd_type = field_type(rootname, "/".join([element] + path))
+        if isinstance(pool, etree._Element):
+            values = _xml_texts(root, objects, element, path)
+        else:
+            values = _binding_values(objects, path)
+        column = _column(values, xsd_type, missing)
+        if field in enums:
+            column = _decode(column, enums[field])
+        columns[field] = column
+    return columns
@@ -13,8 +13,9 @@
 # limitations under the License.
 
 from . import OneException
-from . import MARKETPLACEAPP_STATES, MARKETPLACEAPP_TYPES
+from .util import cast2one, dict2template
 from base64 import b64decode
+from functools import reduce
 
 class OneHelperException(OneException):
     pass
@@ -36,6 +37,7 @@ def marketapp_export(one, appid, dsid=None, name=None, vmtemplate_name=None):
     :param vmtemplate_name: name for the VM Template, if the app has one.
     :return: a dictionary with the ID of the new Image as image and the ID of the new associated template as vmtemplate. If no template has been defined, it will return -1.
     '''
+    from . import MARKETPLACEAPP_STATES, MARKETPLACEAPP_TYPES
 
     ret= {
         "image": -1,
@@ -85,4 +87,25 @@ def marketapp_export(one, appid, dsid=None, name=None, vmtemplate_name=None):
     else:
         raise OneHelperException('App type %s not supported' % MARKETPLACEAPP_TYPES(app.TYPE).name)
 
-    return ret
\ No newline at end of file
+    return ret
+
+def update_template(one, method, id, template):
+    '''
+    Sends the changes of a TrackedTemplate: the changed attributes in merge mode, or the whole template
+    in replace mode when attributes were deleted, as merges cannot remove them.
+    The changes are committed once the call succeeds.
+    :param one: the XMLRPC server
+    :param method: update method, e.g. vm.update or host.update
+    :param id: object ID
+    :param template: TrackedTemplate
+    :return: the result of the call, None if nothing changed
+    '''
+    if not template.modified:
+        return None
+    call = reduce(getattr, method.split("."), one)
+    if template.deleted:
+        ret = call(id, cast2one(template) if getattr(template, "_root", None) else dict2template(template), 0)
+    else:
+        ret = call(id, template.delta(), 1)
+    template.commit()
+    return ret
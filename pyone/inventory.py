@@ -0,0 +1,200 @@
+# Copyright 2018 www.privaz.io Valletech AB
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import threading
+from . import OneException
+from .watcher import REMOVED
+
+
+def _attribute(name):
+    def values(obj):
+        return [getattr(obj, name, None)]
+    return values
+
+
+def _last_history(name):
+    # the current placement of a VM is its last history record
+    def values(obj):
+        records = obj.HISTORY_RECORDS
+        if records is None or not records.HISTORY:
+            return []
+        return [getattr(records.HISTORY[-1], name)]
+    return values
+
+
+def _clusters(obj):
+    clusters = obj.CLUSTERS
+    if clusters is None or clusters.ID is None:
+        return []
+    return clusters.ID if isinstance(clusters.ID, list) else [clusters.ID]
+
+
+_OWNED = {"NAME": _attribute("NAME"), "UID": _attribute("UID"), "GID": _attribute("GID"),
+          "STATE": _attribute("STATE")}
+
+# secondary indexes of each kind of object, a function returns the keys of an object in each index
+INDEXES = {
+    "VM": dict(_OWNED, LCM_STATE=_attribute("LCM_STATE"), HOST=_last_history("HOSTNAME"),
+               HID=_last_history("HID"), CLUSTER=_last_history("CID")),
+    "HOST": {"NAME": _attribute("NAME"), "STATE": _attribute("STATE"), "CLUSTER": _attribute("CLUSTER_ID")},
+    "IMAGE": dict(_OWNED, DATASTORE=_attribute("DATASTORE_ID")),
+    "VNET": {"NAME": _attribute("NAME"), "UID": _attribute("UID"), "GID": _attribute("GID"),
+             "CLUSTER": _clusters},
+    "DATASTORE": dict(_OWNED, CLUSTER=_clusters)
+}
+
+
+def _kind(obj):
+    # the pool or the object element name, from the generated super class
+    from pyone.bindings import supermod
+    for kind in INDEXES:
+        if isinstance(obj, getattr(supermod, kind + "_POOL")):
+            return kind, True
+        if isinstance(obj, getattr(supermod, kind)):
+            return kind, False
+    return None, False
+
+
+class Inventory(object):
+    '''
+    In memory index of OpenNebula objects, fed from pool and info responses.
+    Besides the ID, objects are indexed by NAME, owner (UID, GID), STATE and placement, so that
+    queries cost is proportional to the number of objects found rather than to the pool size:
+
+        inventory = Inventory()
+        inventory.update(one.vmpool.info(-2, -1, -1, -1))
+        inventory.find("VM", HOST="node1", STATE=VM_STATE.POWEROFF, GID=1)
+
+    The indexes of each kind are listed in INDEXES, the inventory is thread safe.
+    '''
+
+    def __init__(self):
+        self._lock = threading.RLock()
+        # kind: {ID: object}
+        self._objects = dict((kind, {}) for kind in INDEXES)
+        # kind: {index: {key: set of IDs}}
+        self._indexes = dict((kind, dict((index, {}) for index in INDEXES[kind])) for kind in INDEXES)
+        # kind: {ID: [(index, key)]}, to remove objects from the indexes
+        self._keys = dict((kind, {}) for kind in INDEXES)
+
+    def update(self, response, kind=None, replace=False):
+        '''
+        Adds or replaces objects
+        :param response: a pool, e.g. the result of vmpool.info, a single object as returned by info,
+                         or an iterable of objects, e.g. from iter_pool
+        :param kind: element name of the objects, VM, HOST, IMAGE, VNET or DATASTORE.
+                     Required for iterables, detected otherwise.
+        :param replace: the response holds all the objects of its kind, remove any other
+        :return: number of objects updated
+        '''
+        detected, pool = _kind(response)
+        kind = kind or detected
+        if kind not in INDEXES:
+            raise OneException("Cannot index %s" % (kind or type(response).__name__))
+        if pool:
+            objects = getattr(response, kind) or []
+        elif detected:
+            objects = [response]
+        else:
+            objects = response
+
+        with self._lock:
+            ids = set()
+            for obj in objects:
+                self._remove(kind, obj.ID)
+                self._add(kind, obj)
+                ids.add(obj.ID)
+            if replace:
+                for id in [id for id in self._objects[kind] if id not in ids]:
+                    self._remove(kind, id)
+        return len(ids)
+
+    def apply(self, events, kind):
+        '''
+        Applies the events of a PoolWatcher
+        :param events: list of PoolEvent
+        :param kind: element name of the watched objects, e.g. VM
+        '''
+        with self._lock:
+            for event in events:
+                self._remove(kind, event.id)
+                if event.type != REMOVED:
+                    self._add(kind, event.object)
+
+    def remove(self, kind, id):
+        '''
+        Removes an object, e.g. after deleting it
+        :param kind: element name of the object, e.g. VM
+        :param id: object ID
+        :return: the removed object, or None if not indexed
+        '''
+        with self._lock:
+            return self._remove(kind, id)
+
+    def _add(self, kind, obj):
+        self._objects[kind][obj.ID] = obj
+        keys = []
+        indexes = self._indexes[kind]
+        for index, values in INDEXES[kind].items():
+            for key in values(obj):
+                if key is not None:
+                    indexes[index].setdefault(key, set()).add(obj.ID)
+                    keys.append((index, key))
+        self._keys[kind][obj.ID] = keys
+
+    def _remove(self, kind, id):
+        obj = self._objects[kind].pop(id, None)
+        indexes = self._indexes[kind]
+        for index, key in self._keys[kind].pop(id, ()):
+            ids = indexes[index][key]
+            ids.discard(id)
+            if not ids:
+                del indexes[index][key]
+        return obj
+
+    def get(self, kind, id):
+        '''
+        :return: the object with the given ID, or None
+        '''
+        return self._objects[kind].get(id)
+
+    def find(self, kind, **criteria):
+        '''
+        Finds the objects matching all the criteria, each on an index of the kind
+        :param kind: element name of the objects, e.g. VM
+        :param criteria: index and value, e.g. HOST="node1", STATE=8
+        :return: list of objects, by ID
+        '''
+        indexes = self._indexes[kind]
+        unknown = [index for index in criteria if index not in indexes]
+        if unknown:
+            raise OneException("%s objects are not indexed by %s" % (kind, ", ".join(sorted(unknown))))
+        with self._lock:
+            objects = self._objects[kind]
+            if not criteria:
+                return [objects[id] for id in sorted(objects)]
+            matches = sorted((indexes[index].get(key, set()) for index, key in criteria.items()), key=len)
+            # intersect starting from the most selective index
+            ids = matches[0].intersection(*matches[1:])
+            return [objects[id] for id in sorted(ids)]
+
+    def keys(self, kind, index):
+        '''
+        :return: the values of an index, e.g. the names of the hosts with VMs for ("VM", "HOST")
+        '''
+        with self._lock:
+            return list(self._indexes[kind][index])
+
+    def __len__(self):
+        return sum(len(objects) for objects in self._objects.values())
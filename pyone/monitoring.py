@@ -0,0 +1,222 @@
+# Copyright 2018 www.privaz.io Valletech AB
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+# Decoding of the VM MONITORING element, opaque in the bindings, as arrays.
+
+import array
+from collections import OrderedDict
+from io import BytesIO
+from lxml import etree
+from six import string_types, text_type
+
+from .util import _localname, INT64_TYPECODE
+from .parsing import is_collection
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+# numeric counters of the VM MONITORING element
+MONITORING_COUNTERS = ("CPU", "MEMORY", "NETRX", "NETTX", "DISKRDBYTES", "DISKWRBYTES", "DISKRDIOPS", "DISKWRIOPS")
+
+# counters that only grow, rates are computed for these
+CUMULATIVE_COUNTERS = ("NETRX", "NETTX", "DISKRDBYTES", "DISKWRBYTES", "DISKRDIOPS", "DISKWRIOPS")
+
+
+def _array(code, values):
+    if numpy is not None:
+        return numpy.array(values, dtype=numpy.float64 if code == "d" else numpy.int64)
+    return array.array(code, values)
+
+
+class VMMonitoring(object):
+    '''
+    Monitoring records of VMs as a struct of arrays, a row per record:
+
+        monitoring = decode_monitoring(one.vmpool.monitoring(-2, raw=True))
+        monitoring.ids, monitoring.timestamps, monitoring["CPU"]
+
+    ids and timestamps are int64 columns and counters float64 ones, missing counters are NaN.
+    Columns are NumPy arrays if NumPy is installed, array.array otherwise.
+    '''
+
+    def __init__(self, ids, timestamps, counters):
+        '''
+        :param ids: VM IDs
+        :param timestamps: time of each record, in seconds since the epoch
+        :param counters: ordered dictionary with the column of each counter
+        '''
+        self.ids = ids
+        self.timestamps = timestamps
+        self.counters = counters
+
+    def __len__(self):
+        return len(self.ids)
+
+    def __getitem__(self, counter):
+        return self.counters[counter]
+
+    def _take(self, rows):
+        if numpy is not None:
+            return VMMonitoring(self.ids[rows], self.timestamps[rows],
+                                OrderedDict((name, column[rows]) for name, column in self.counters.items()))
+        return VMMonitoring(array.array(INT64_TYPECODE, [self.ids[row] for row in rows]),
+                            array.array(INT64_TYPECODE, [self.timestamps[row] for row in rows]),
+                            OrderedDict((name, array.array("d", [column[row] for row in rows]))
+                                        for name, column in self.counters.items()))
+
+    def latest(self):
+        '''
+        :return: VMMonitoring with the most recent record of each VM, by ID
+        '''
+        if numpy is not None:
+            rows = numpy.lexsort((self.timestamps, self.ids))
+            ids = self.ids[rows]
+            last = numpy.ones(len(rows), dtype=bool)
+            last[:-1] = ids[1:] != ids[:-1]
+            return self._take(rows[last])
+        latest = {}
+        for row, (id, timestamp) in enumerate(zip(self.ids, self.timestamps)):
+            if id not in latest or timestamp >= self.timestamps[latest[id]]:
+                latest[id] = row
+        return self._take([latest[id] for id in sorted(latest)])
+
+    def rates(self, previous, counters=CUMULATIVE_COUNTERS):
+        '''
+        Computes the per second rate of the cumulative counters since a previous snapshot
+        :param previous: older VMMonitoring
+        :param counters: counters to compute rates for
+        :return: VMMonitoring for the VMs in both snapshots, by ID, with the time of the current records
+                 and the rates as counters. Rates are NaN when the counter was reset, e.g. the VM
+                 was rebooted, or the record was not updated.
+        '''
+        current = self.latest()
+        previous = previous.latest()
+        if numpy is not None:
+            ids, now, before = numpy.intersect1d(current.ids, previous.ids, assume_unique=True, return_indices=True)
+            elapsed = (current.timestamps[now] - previous.timestamps[before]).astype(numpy.float64)
+            elapsed[elapsed <= 0] = numpy.nan
+            rates = OrderedDict()
+            for counter in counters:
+                delta = current[counter][now] - previous[counter][before]
+                delta[delta < 0] = numpy.nan
+                rates[counter] = delta / elapsed
+            return VMMonitoring(ids, current.timestamps[now], rates)
+
+        before = dict((id, row) for row, id in enumerate(previous.ids))
+        rows = [(row, before[id]) for row, id in enumerate(current.ids) if id in before]
+        rates = OrderedDict()
+        nan = float("nan")
+        for counter in counters:
+            column = []
+            for now, then in rows:
+                elapsed = current.timestamps[now] - previous.timestamps[then]
+                delta = current[counter][now] - previous[counter][then]
+                column.append(delta / float(elapsed) if elapsed > 0 and delta >= 0 else nan)
+            rates[counter] = array.array("d", column)
+        return VMMonitoring(array.array(INT64_TYPECODE, [current.ids[now] for now, _ in rows]),
+                            array.array(INT64_TYPECODE, [current.timestamps[now] for now, _ in rows]), rates)
+
+
+def _column(code, texts, missing):
+    if any(text is None or text == "" for text in texts):
+        texts = [missing if text is None or text == "" else text for text in texts]
+    if numpy is not None:
+        # NumPy parses the numbers in C
+        return _array(code, texts)
+    convert = float if code == "d" else int
+    return array.array(code, [convert(text) for text in texts])
+
+
+def _decode(document, counters):
+    if isinstance(document, text_type):
+        document = document.encode("utf-8")
+    if isinstance(document, bytes):
+        document = etree.parse(BytesIO(document), parser=etree.ETCompatXMLParser()).getroot()
+
+    objects = list(document.iterchildren(etree.Element)) if is_collection(document.tag) else [document]
+    size = len(objects)
+    index = dict((counter, i) for i, counter in enumerate(counters))
+    ids = [None] * size
+    timestamps = [None] * size
+    columns = [[None] * size for _ in counters]
+    namespaced = document.tag.startswith("{")
+    # lxml filters the elements, only those needed reach Python
+    wildcard = "{*}" if namespaced else ""
+    vm_tags = [wildcard + tag for tag in ("ID", "LAST_POLL", "MONITORING")]
+    record_tags = [wildcard + tag for tag in list(counters) + ["TIMESTAMP", "ID"]]
+
+    for row, obj in enumerate(objects):
+        if _localname(obj.tag) == "MONITORING":
+            # MONITORING_DATA of OpenNebula 6, each record has its ID and TIMESTAMP
+            record = obj
+        else:
+            record = None
+            for child in obj.iterchildren(*vm_tags):
+                tag = _localname(child.tag) if namespaced else child.tag
+                if tag == "ID":
+                    ids[row] = child.text
+                elif tag == "LAST_POLL":
+                    # time of the last monitoring in OpenNebula 5
+                    timestamps[row] = child.text
+                elif tag == "MONITORING":
+                    record = child
+            if record is None:
+                continue
+        for child in record.iterchildren(*record_tags):
+            tag = _localname(child.tag) if namespaced else child.tag
+            if tag in index:
+                columns[index[tag]][row] = child.text
+            elif tag == "TIMESTAMP":
+                timestamps[row] = child.text
+            elif tag == "ID" and record is obj:
+                ids[row] = child.text
+
+    return VMMonitoring(_column(INT64_TYPECODE, ids, "-1"), _column(INT64_TYPECODE, timestamps, "0"),
+                        OrderedDict((counter, _column("d", columns[index[counter]], "nan")) for counter in counters))
+
+
+def _concatenate(parts):
+    if len(parts) == 1:
+        return parts[0]
+    if numpy is not None:
+        join = numpy.concatenate
+    else:
+        def join(columns):
+            ret = array.array(columns[0].typecode)
+            for column in columns:
+                ret.extend(column)
+            return ret
+    return VMMonitoring(join([part.ids for part in parts]), join([part.timestamps for part in parts]),
+                        OrderedDict((counter, join([part[counter] for part in parts]))
+                                    for counter in parts[0].counters))
+
+
+def decode_monitoring(source, counters=MONITORING_COUNTERS):
+    '''
+    Decodes the monitoring of VMs as arrays, reading the document directly without building bindings.
+    Get the documents with raw=True, e.g. one.vmpool.monitoring(-2, raw=True) or
+    one.vmpool.info(-2, -1, -1, -1, raw=True).
+    :param source: VM_POOL, MONITORING_DATA or VM document, as text, bytes or parsed element,
+                   or a list or generator of those, e.g. the pages of a pool
+    :param counters: MONITORING elements to decode
+    :return: VMMonitoring
+    '''
+    if isinstance(source, (string_types, bytes, etree._Element)):
+        return _decode(source, counters)
+    parts = [_decode(document, counters) for document in source]
+    if not parts:
+        return _decode(b"<MONITORING_DATA/>", counters)
+    return _concatenate(parts)
@@ -0,0 +1,169 @@
+# Copyright 2018 www.privaz.io Valletech AB
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+# Parsing entry points that replace those generated in pyone.bindings.
+# This module is imported by the bindings package, it must not import it at module level.
+
+from copy import deepcopy
+from io import BytesIO
+from lxml import etree
+from six import PY2, string_types, text_type
+
+from .util import element2binding, _localname
+
+# Roots whose children are the objects a projection applies to, besides the *_POOL documents
+COLLECTIONS = ("HISTORY_RECORDS", "MONITORING_DATA")
+
+
+def compile_fields(fields):
+    '''
+    Builds the tree of the element paths to keep.
+    Each level maps an element name to the tree of its children to keep, or True to keep
+    the whole element.
+    :param fields: list of paths relative to the object, e.g. ['ID', 'HISTORY_RECORDS/HISTORY/HOSTNAME']
+    :return: projection tree
+    '''
+    if isinstance(fields, dict):
+        return fields
+    if isinstance(fields, string_types):
+        fields = [fields]
+    tree = {}
+    for field in fields:
+        parts = [part for part in field.split('/') if part]
+        if not parts:
+            raise ValueError("Empty field in projection")
+        node = tree
+        for part in parts[:-1]:
+            child = node.get(part)
+            if child is True:
+                # an ancestor is already fully kept
+                break
+            if child is None:
+                child = node[part] = {}
+            node = child
+        else:
+            node[parts[-1]] = True
+    return tree
+
+
+def is_collection(tag):
+    name = _localname(tag)
+    return name.endswith("_POOL") or name in COLLECTIONS
+
+
+def project(element, fields):
+    '''
+    Copies the projected elements of a parsed document.
+    For pools and other collections the projection applies to each of the objects in the root element.
+    The children that are not projected are filtered by lxml, and never reach Python.
+    :param element: root element
+    :param fields: list of paths or projection tree, see compile_fields
+    :return: new root element, the original one is not modified
+    '''
+    fields = compile_fields(fields)
+    if not is_collection(element.tag):
+        return _project(element, fields)
+    ret = etree.Element(element.tag, element.attrib)
+    for child in element.iterchildren(etree.Element):
+        ret.append(_project(child, fields))
+    return ret
+
+
+def _project(element, tree):
+    ret = etree.Element(element.tag, element.attrib)
+    ret.text = element.text
+    for child in element.iterchildren(*["{*}" + name for name in tree]):
+        node = tree[_localname(child.tag)]
+        ret.append(deepcopy(child) if node is True else _project(child, node))
+    return ret
+
+
+def parseString(inString, silence=False, fields=None):
+    '''
+    Builds the binding object for an XML document
+    :param inString: document, as bytes
+    :param silence: unused, kept for compatibility with the generated parser
+    :param fields: optional projection, a list of element paths relative to the object, e.g.
+                   ['ID', 'STATE', 'HISTORY_RECORDS/HISTORY/HOSTNAME']. Elements out of the projection
+                   are not bound and their attributes will be None in the returned object.
+    :return: binding object
+    '''
+    rootNode = etree.parse(BytesIO(inString), parser=etree.ETCompatXMLParser()).getroot()
+    if fields is not None:
+        rootNode = project(rootNode, fields)
+    return element2binding(rootNode)
+
+
+def iterparse(source, tag, fields=None):
+    '''
+    Parses a pool document incrementally, yielding the binding of each object as soon as its element
+    has been read. Processed elements are released, so memory is bounded by one object instead of the pool:
+
+        for vm in bindings.iterparse(xml, 'VM'):
+            print(vm.ID)
+
+    :param source: document as bytes or text, file name or file object
+    :param tag: element name of the objects, e.g. VM, HOST or VNET. A document whose root is
+                a single object of that kind yields it.
+    :param fields: optional projection of each object, see parseString
+    :return: generator of binding objects
+    '''
+    from pyone import bindings
+
+    if isinstance(source, text_type) and source.lstrip().startswith(u"<"):
+        source = source.encode("utf-8")
+    if isinstance(source, bytes) and (not PY2 or source.lstrip().startswith(b"<")):
+        # file names are bytes too in Python 2
+        source = BytesIO(source)
+    if fields is not None:
+        fields = compile_fields(fields)
+
+    pool = None
+    for _, element in etree.iterparse(source, events=("end",), tag="{*}" + tag,
+                                      remove_comments=True, remove_pis=True):
+        parent = element.getparent()
+        if parent is None:
+            # the document is a single object
+            yield element2binding(element if fields is None else _project(element, fields))
+            return
+        if parent.getparent() is not None:
+            # nested element with the same name, it is part of the object being read
+            continue
+        if pool is None:
+            rootClass = bindings.get_root_tag(parent)[1] or bindings.supermod.HISTORY_RECORDS
+            pool = rootClass.factory()
+        # the pool binding picks the class of its objects, which may differ from the standalone one
+        pool.buildChildren(element if fields is None else _project(element, fields), parent, tag)
+        objects = getattr(pool, tag, None)
+        if not objects:
+            raise ValueError("There are no bindings for %s elements in %s" % (tag, _localname(parent.tag)))
+        if isinstance(objects, list):
+            obj = objects.pop()
+        else:
+            obj = objects
+            setattr(pool, tag, None)
+        # release the object and anything before it
+        element.clear()
+        while element.getprevious() is not None:
+            del parent[0]
+        yield obj
+
+
+def to_columns(pool, fields, states=False, missing=-1):
+    '''
+    Extracts fields of the objects of a pool as typed columns, see pyone.columns.to_columns.
+    The columns module, and NumPy with it, are imported on first use.
+    '''
+    from .columns import to_columns
+    return to_columns(pool, fields, states, missing)
@@ -0,0 +1,113 @@
+# Copyright 2018 www.privaz.io Valletech AB
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from concurrent.futures import ThreadPoolExecutor
+from six import string_types
+from . import PAGINATED_POOLS, OneException
+
+# XML-RPC method namespace and element name of the objects in each paginated pool
+PAGINATED_POOL_ELEMENTS = {
+    PAGINATED_POOLS.VM_POOL: ("vmpool", "VM"),
+    PAGINATED_POOLS.IMAGE_POOL: ("imagepool", "IMAGE"),
+    PAGINATED_POOLS.TEMPLATE_POOL: ("templatepool", "VMTEMPLATE"),
+    PAGINATED_POOLS.VN_POOL: ("vnpool", "VNET"),
+    PAGINATED_POOLS.DOCUMENT_POOL: ("documentpool", "DOCUMENT"),
+    PAGINATED_POOLS.SECGROUP_POOL: ("secgrouppool", "SECURITY_GROUP")
+}
+
+# largest ID range requested in a single pool call
+MAX_RANGE = 500
+
+
+def id_ranges(ids, max_range=MAX_RANGE):
+    '''
+    Groups object IDs in the start and end of ID ranges, for pool calls on a few objects
+    :param ids: object IDs
+    :param max_range: largest span of a range, ranges are sparse and may cover other objects
+    :return: generator of (start, end) tuples
+    '''
+    ids = sorted(ids)
+    start = end = ids[0]
+    for id in ids[1:]:
+        if id - start >= max_range:
+            yield start, end
+            start = id
+        end = id
+    yield start, end
+
+
+def paginated_pool(pool):
+    '''
+    Resolves a pool given as a PAGINATED_POOLS constant, its name (VM_POOL) or its method namespace (vmpool)
+    :param pool: the pool
+    :return: PAGINATED_POOLS constant
+    '''
+    if isinstance(pool, PAGINATED_POOLS):
+        return pool
+    if isinstance(pool, string_types):
+        for constant, (method, _) in PAGINATED_POOL_ELEMENTS.items():
+            if pool in (constant.name, method):
+                return constant
+    raise OneException("%s is not a paginated pool" % pool)
+
+
+def iter_pool(one, pool, filter=-2, page_size=500, prefetch=False, extra=None):
+    '''
+    Generator walking a paginated pool page by page, only one page (two when prefetching)
+    is held in memory at any time.
+
+    :param one: the XMLRPC server
+    :param pool: PAGINATED_POOLS constant, name or method namespace, e.g. "vmpool"
+    :param filter: ownership filter flag as in pool.info, -2 for all resources
+    :param page_size: number of objects requested per call, at least 2
+    :param prefetch: request the next page in a background thread while the current one is consumed.
+                     Calls issued on the same server while iterating need a thread safe transport (pool_size).
+    :param extra: additional parameters after the range, defaults to any state (-1) for the VM pool
+    :return: generator of the pool objects, e.g. VM bindings
+    '''
+
+    pool = paginated_pool(pool)
+    method, element = PAGINATED_POOL_ELEMENTS[pool]
+    if page_size < 2:
+        # -1 as the end of the range is not a page of one object but all the objects from the start
+        raise ValueError("Page size must be at least 2")
+    if extra is None:
+        extra = (-1,) if pool == PAGINATED_POOLS.VM_POOL else ()
+    info = getattr(one, method).info
+
+    def get_page(offset):
+        # a negative end of range requests a page of -end objects starting at the start offset
+        objects = getattr(info(filter, offset, -page_size, *extra), element, None)
+        if objects is None:
+            raise OneException("There are no bindings for %s objects" % element)
+        return objects
+
+    executor = ThreadPoolExecutor(1) if prefetch else None
+    try:
+        offset = 0
+        page = get_page(offset)
+        while True:
+            offset += page_size
+            last = len(page) < page_size
+            if executor and not last:
+                following = executor.submit(get_page, offset)
+            for obj in page:
+                yield obj
+            if last:
+                break
+            page = None
+            page = following.result() if executor else get_page(offset)
+    finally:
+        if executor:
+            executor.shutdown(wait=True)
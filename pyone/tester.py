@@ -74,6 +74,9 @@ class OneServerTester(OneServer):
         self._fixture_file = fixture_file
         self.set_fixture_unit_test(fixture_unit)
 
+        # fixtures store the unmarshalled response, documents must be returned as strings
+        options.pop("single_pass_decoding", None)
+
         OneServer.__init__(self, uri, session, timeout, **options)
 
     def set_fixture_unit_test(self,name):
@@ -198,3 +201,4 @@ class OneServerTester(OneServer):
         """
         if not self._fixture_replay:
             write_fixture_file(self._fixture_file, self._fixtures)
+        OneServer.server_close(self)
@@ -0,0 +1,518 @@
+# Copyright 2018 www.privaz.io Valletech AB
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import xmlrpc.client
+import http.client
+import socket
+import threading
+import time
+from base64 import b64decode
+from contextlib import contextmanager
+from lxml import etree
+from six import PY2, string_types
+
+
+class HTTPConnection(http.client.HTTPConnection):
+    '''
+    HTTPConnection with separate connect and read timeouts.
+    timeout only bounds establishing the connection, read_timeout applies to the socket afterwards.
+    '''
+    read_timeout = None
+
+    def connect(self):
+        http.client.HTTPConnection.connect(self)
+        self.sock.settimeout(self.read_timeout)
+
+
+class HTTPSConnection(http.client.HTTPSConnection):
+    '''
+    HTTPS version of HTTPConnection, the TLS handshake is bounded by the connect timeout
+    '''
+    read_timeout = None
+
+    def connect(self):
+        http.client.HTTPSConnection.connect(self)
+        self.sock.settimeout(self.read_timeout)
+
+
+def set_timeouts(connection, connect_timeout, read_timeout):
+    '''
+    Configures the timeouts of a connection, including its socket if already connected.
+    None leaves the process wide socket default in place, as http.client does.
+    '''
+    connection.timeout = socket._GLOBAL_DEFAULT_TIMEOUT if connect_timeout is None else connect_timeout
+    connection.read_timeout = socket.getdefaulttimeout() if read_timeout is None else read_timeout
+    if connection.sock is not None:
+        connection.sock.settimeout(connection.read_timeout)
+
+
+class PooledConnection(object):
+    '''
+    A persistent HTTP/1.1 connection owned by a ConnectionPool.
+    Keeps track of how many requests it has served and when it was last used.
+    '''
+
+    def __init__(self, connection):
+        self.connection = connection
+        self.created = time.time()
+        self.last_used = self.created
+        self.requests = 0
+
+    def idle_time(self, now=None):
+        return (now or time.time()) - self.last_used
+
+    def close(self):
+        self.connection.close()
+
+
+class ConnectionPool(object):
+    '''
+    Bounded pool of persistent connections to a single host.
+    At most max_size connections are handed out at any time, further callers
+    will block until one is released. Connections idle for longer than
+    idle_timeout seconds are closed instead of being reused.
+    '''
+
+    def __init__(self, factory, max_size=4, idle_timeout=60):
+        '''
+        :param factory: callable returning a new, unconnected, HTTPConnection
+        :param max_size: maximum number of connections open at the same time
+        :param idle_timeout: seconds after which an idle connection is evicted
+        '''
+        if max_size < 1:
+            raise ValueError("Connection pool size must be at least 1")
+        self._factory = factory
+        self.max_size = max_size
+        self.idle_timeout = idle_timeout
+        self._slots = threading.BoundedSemaphore(max_size)
+        self._lock = threading.Lock()
+        self._idle = []
+        self.closed = False
+        self.created = 0
+        self.reused = 0
+        self.evicted = 0
+
+    def acquire(self):
+        '''
+        Returns an idle connection if there is one, a new one otherwise.
+        Blocks while the pool is exhausted.
+        '''
+        self._slots.acquire()
+        try:
+            with self._lock:
+                self._evict_idle()
+                if self._idle:
+                    # LIFO, the most recently used connection is the most likely to be alive
+                    conn = self._idle.pop()
+                    self.reused += 1
+                    return conn
+                self.created += 1
+            return PooledConnection(self._factory())
+        except Exception:
+            self._slots.release()
+            raise
+
+    def release(self, conn):
+        '''
+        Returns a healthy connection to the pool, closes it if the pool was closed
+        '''
+        conn.last_used = time.time()
+        conn.requests += 1
+        with self._lock:
+            closed = self.closed
+            if not closed:
+                self._idle.append(conn)
+        try:
+            if closed:
+                conn.close()
+        finally:
+            self._slots.release()
+
+    def discard(self, conn):
+        '''
+        Closes a connection that is in an unknown state instead of returning it to the pool
+        '''
+        try:
+            conn.close()
+        finally:
+            self._slots.release()
+
+    def _evict_idle(self):
+        if not self.idle_timeout:
+            return
+        now = time.time()
+        alive = []
+        for conn in self._idle:
+            if conn.idle_time(now) > self.idle_timeout:
+                conn.close()
+                self.evicted += 1
+            else:
+                alive.append(conn)
+        self._idle = alive
+
+    def close(self):
+        '''
+        Closes all idle connections. Connections currently in use are closed on release.
+        '''
+        with self._lock:
+            self.closed = True
+            for conn in self._idle:
+                conn.close()
+            self._idle = []
+
+    def stats(self):
+        '''
+        :return: a dictionary with the pool counters
+        '''
+        with self._lock:
+            return {
+                "max_size": self.max_size,
+                "idle": len(self._idle),
+                "created": self.created,
+                "reused": self.reused,
+                "evicted": self.evicted,
+                "requests": [c.requests for c in self._idle]
+            }
+
+
+class OneResponseParser(object):
+    '''
+    Decodes XML-RPC responses with lxml, to be used in place of xmlrpc.client's parser and Unmarshaller.
+    The document of a successful OpenNebula response, the value of [success, value, code], is returned
+    as its root element. It is escaped text in the response, so it is still parsed twice, once as text of
+    the response and once as a document, what is saved are the unmarshaller callbacks and its re-encoding.
+    Other strings, including those nested in multicall responses, are kept as strings.
+    '''
+
+    scalars = {
+        "int": int, "i1": int, "i2": int, "i4": int, "i8": int, "biginteger": int,
+        "double": float, "float": float, "bigdecimal": float,
+        "boolean": lambda text: text.strip() == "1",
+        "dateTime.iso8601": lambda text: xmlrpc.client.DateTime(text.strip()),
+        "nil": lambda text: None
+    }
+
+    def __init__(self, use_builtin_types=False):
+        self.use_builtin_types = use_builtin_types
+        self._parser = etree.XMLParser(huge_tree=True)
+        self._response = None
+
+    def feed(self, data):
+        self._parser.feed(data)
+
+    def close(self):
+        '''
+        Acts as both the parser and the unmarshaller of the Transport, only decodes on the first call.
+        :return: tuple with the response parameters, raises Fault for fault responses
+        '''
+        if self._response is None:
+            root = self._parser.close()
+            fault = root.find("fault/value")
+            if fault is not None:
+                self._response = xmlrpc.client.Fault(**self._value(fault))
+            else:
+                self._response = tuple(self._top_level(self._value(value))
+                                       for value in root.iterfind("params/param/value"))
+        if isinstance(self._response, xmlrpc.client.Fault):
+            raise self._response
+        return self._response
+
+    def _top_level(self, value):
+        # [True, document, code] as returned by the OpenNebula calls
+        if isinstance(value, list) and len(value) > 1 and value[0] is True and \
+                isinstance(value[1], string_types):
+            value[1] = self._document(value[1])
+        return value
+
+    def _value(self, value):
+        if len(value) == 0:
+            # untyped values are strings
+            return value.text or ""
+        typed = value[0]
+        tag = typed.tag
+        if tag == "string":
+            return typed.text or ""
+        elif tag == "array":
+            return [self._value(v) for v in typed.iterfind("data/value")]
+        elif tag == "struct":
+            return dict((m.findtext("name"), self._value(m.find("value"))) for m in typed.iterfind("member"))
+        elif tag == "base64":
+            data = b64decode((typed.text or "").encode("ascii"))
+            return data if self.use_builtin_types else xmlrpc.client.Binary(data)
+        return self.scalars[tag](typed.text or "")
+
+    @staticmethod
+    def _document(text):
+        if not text.startswith("<"):
+            return text
+        document = text
+        if document.startswith("<?xml"):
+            # lxml refuses text carrying an encoding declaration, which is meaningless once decoded
+            document = document[document.find("?>") + 2:]
+        try:
+            return etree.fromstring(document, etree.ETCompatXMLParser(huge_tree=True))
+        except etree.XMLSyntaxError:
+            # not a document, e.g. a message, keep the string
+            return text
+
+
+class OneTransport(xmlrpc.client.Transport):
+    '''
+    XML-RPC transport with its own connect and read timeouts, which can be overridden for the calls
+    made by a thread. Unlike socket.setdefaulttimeout they do not affect other sockets in the process.
+    '''
+
+    def __init__(self, use_datetime=False, use_builtin_types=False, connect_timeout=None, read_timeout=None,
+                 headers=()):
+        '''
+        :param connect_timeout: seconds to wait for the connection to be established
+        :param read_timeout: seconds to wait for the server on a connected socket
+        :param headers: additional HTTP headers
+        '''
+        if PY2:
+            # xmlrpclib has no builtin types option, responses have the types of use_builtin_types=False
+            xmlrpc.client.Transport.__init__(self, use_datetime=use_datetime)
+            self._use_builtin_types = use_builtin_types
+            self._headers = list(headers)
+        else:
+            kwargs = {"headers": headers} if headers else {}
+            xmlrpc.client.Transport.__init__(self, use_datetime=use_datetime,
+                                             use_builtin_types=use_builtin_types, **kwargs)
+        self.connect_timeout = connect_timeout
+        self.read_timeout = read_timeout
+        self._local = threading.local()
+
+    @contextmanager
+    def timeouts(self, connect_timeout, read_timeout):
+        '''
+        Overrides the timeouts of the requests sent by the current thread
+        :param connect_timeout: seconds to wait for the connection to be established
+        :param read_timeout: seconds to wait for the server on a connected socket
+        '''
+        previous = getattr(self._local, "timeouts", None)
+        self._local.timeouts = (connect_timeout, read_timeout)
+        try:
+            yield
+        finally:
+            self._local.timeouts = previous
+
+    def get_timeouts(self):
+        '''
+        :return: connect and read timeouts for a request sent by the current thread
+        '''
+        return getattr(self._local, "timeouts", None) or (self.connect_timeout, self.read_timeout)
+
+    @contextmanager
+    def own_connection(self):
+        '''
+        Makes the requests sent by the current thread use a connection of their own, closed on exit,
+        so that threads can share a transport that is not pooled
+        '''
+        previous = getattr(self._local, "connection", None)
+        self._local.connection = (None, None)
+        try:
+            yield
+        finally:
+            self.close()
+            self._local.connection = previous
+
+    def send_host(self, connection, host):
+        # only called by Python 2's xmlrpclib, which has no headers option
+        xmlrpc.client.Transport.send_host(self, connection, host)
+        for key, value in self._headers:
+            connection.putheader(key, value)
+
+    def _new_connection(self, host, **x509):
+        return HTTPConnection(host)
+
+    def make_connection(self, host):
+        # same as Transport.make_connection, configuring the timeouts of every request
+        local = getattr(self._local, "connection", None)
+        current = self._connection if local is None else local
+        if not (current and host == current[0]):
+            chost, self._extra_headers, x509 = self.get_host_info(host)
+            current = host, self._new_connection(chost, **(x509 or {}))
+            if local is None:
+                self._connection = current
+            else:
+                self._local.connection = current
+        connection = current[1]
+        set_timeouts(connection, *self.get_timeouts())
+        return connection
+
+    def close(self):
+        local = getattr(self._local, "connection", None)
+        if local is None:
+            xmlrpc.client.Transport.close(self)
+        elif local[1] is not None:
+            self._local.connection = (None, None)
+            local[1].close()
+
+
+class OneSafeTransport(OneTransport):
+    '''
+    HTTPS version of the OneTransport
+    '''
+
+    def __init__(self, use_datetime=False, use_builtin_types=False, connect_timeout=None, read_timeout=None,
+                 headers=(), context=None):
+        OneTransport.__init__(self, use_datetime, use_builtin_types, connect_timeout, read_timeout, headers)
+        self.context = context
+
+    def _new_connection(self, host, **x509):
+        return HTTPSConnection(host, context=self.context, **x509)
+
+
+class PooledTransport(OneTransport):
+    '''
+    XML-RPC transport backed by a pool of persistent HTTP/1.1 connections.
+    Unlike the default Transport it holds no per-request state, so a single
+    instance, and the OneServer using it, can be shared among threads.
+    '''
+
+    def __init__(self, pool_size=4, idle_timeout=60, use_datetime=False, use_builtin_types=False,
+                 single_pass=False, connect_timeout=None, read_timeout=None, headers=()):
+        '''
+        :param pool_size: maximum number of connections per host
+        :param idle_timeout: seconds an unused connection is kept open
+        :param single_pass: decode responses with OneResponseParser, XML documents are returned as lxml elements
+        :param connect_timeout: seconds to wait for a connection to be established
+        :param read_timeout: seconds to wait for the server on a connected socket
+        '''
+        OneTransport.__init__(self, use_datetime, use_builtin_types, connect_timeout, read_timeout, headers)
+        self.pool_size = pool_size
+        self.idle_timeout = idle_timeout
+        self.single_pass = single_pass
+        self._pools = {}
+        self._pools_lock = threading.Lock()
+
+    @contextmanager
+    def own_connection(self):
+        # every request already takes a connection from the pool
+        yield
+
+    def getparser(self):
+        if not self.single_pass:
+            return xmlrpc.client.Transport.getparser(self)
+        parser = OneResponseParser(self._use_builtin_types)
+        return parser, parser
+
+    def get_pool(self, host):
+        '''
+        :param host: host descriptor as passed by ServerProxy
+        :return: the connection pool for the host, created on first use
+        '''
+        with self._pools_lock:
+            pool = self._pools.get(host)
+            if pool is None:
+                chost, _, x509 = self.get_host_info(host)
+                pool = ConnectionPool(lambda: self._new_connection(chost, **(x509 or {})),
+                                      self.pool_size, self.idle_timeout)
+                self._pools[host] = pool
+            return pool
+
+    def single_request(self, host, handler, request_body, verbose=False):
+        pool = self.get_pool(host)
+        conn = pool.acquire()
+        try:
+            set_timeouts(conn.connection, *self.get_timeouts())
+            self._send(conn.connection, host, handler, request_body, verbose)
+            resp = conn.connection.getresponse()
+            if resp.status == 200:
+                ret = self._parse(resp, verbose)
+                pool.release(conn)
+                return ret
+        except xmlrpc.client.Fault:
+            # the HTTP exchange completed, the connection can be reused
+            pool.release(conn)
+            raise
+        except Exception:
+            pool.discard(conn)
+            raise
+
+        # We got an error response, discard the body and the connection
+        if resp.getheader("content-length", ""):
+            resp.read()
+        pool.discard(conn)
+        raise xmlrpc.client.ProtocolError(host + handler, resp.status, resp.reason, dict(resp.getheaders()))
+
+    def _send(self, connection, host, handler, request_body, debug):
+        # same as Transport.send_request, without storing headers in the instance
+        _, extra_headers, _ = self.get_host_info(host)
+        headers = list(self._headers) + list(extra_headers or [])
+        if debug:
+            connection.set_debuglevel(1)
+        if self.accept_gzip_encoding:
+            connection.putrequest("POST", handler, skip_accept_encoding=True)
+            headers.append(("Accept-Encoding", "gzip"))
+        else:
+            connection.putrequest("POST", handler)
+        if not PY2:
+            # sent by send_content in Python 2
+            headers.append(("Content-Type", "text/xml"))
+        headers.append(("User-Agent", self.user_agent))
+        for key, value in headers:
+            connection.putheader(key, value)
+        self.send_content(connection, request_body)
+
+    def _parse(self, response, verbose):
+        if response.getheader("Content-Encoding", "") == "gzip":
+            stream = xmlrpc.client.GzipDecodedResponse(response)
+        else:
+            stream = response
+
+        p, u = self.getparser()
+        while True:
+            data = stream.read(65536)
+            if not data:
+                break
+            if verbose:
+                print("body:", repr(data))
+            p.feed(data)
+
+        if stream is not response:
+            stream.close()
+        p.close()
+        return u.close()
+
+    def stats(self):
+        '''
+        :return: connection pool statistics per host
+        '''
+        with self._pools_lock:
+            pools = dict(self._pools)
+        return dict((host, pool.stats()) for host, pool in pools.items())
+
+    def close(self):
+        # later requests use new pools, as xmlrpc.client.Transport reconnects after close
+        with self._pools_lock:
+            pools = list(self._pools.values())
+            self._pools = {}
+        for pool in pools:
+            pool.close()
+
+
+class PooledSafeTransport(PooledTransport):
+    '''
+    HTTPS version of the PooledTransport
+    '''
+
+    def __init__(self, pool_size=4, idle_timeout=60, use_datetime=False, use_builtin_types=False,
+                 single_pass=False, connect_timeout=None, read_timeout=None, headers=(), context=None):
+        PooledTransport.__init__(self, pool_size, idle_timeout, use_datetime, use_builtin_types, single_pass,
+                                 connect_timeout, read_timeout, headers)
+        self.context = context
+
+    def _new_connection(self, host, **x509):
+        return HTTPSConnection(host, context=self.context, **x509)
@@ -13,11 +13,127 @@
 # limitations under the License.
 
 
-import dicttoxml
-import xmltodict
-from lxml.etree import tostring
+import codecs
+import re
+import sys
+import threading
 from collections import OrderedDict
-from aenum import IntEnum
+from contextlib import contextmanager
+from lxml import etree
+from six import string_types
+
+
+# array.array type code of the 64 bit integer columns, "q" is only available since Python 3.3,
+# Python 2 uses "l", 64 bit on LP64 platforms such as Linux
+INT64_TYPECODE = "q" if sys.version_info >= (3, 3) else "l"
+
+
+def _is_constant(value):
+    # IntEnum constants such as pyone.VM_STATE, there are none before aenum is imported with them
+    aenum = sys.modules.get("aenum")
+    return aenum is not None and isinstance(value, aenum.IntEnum)
+
+
+def _template_value(value):
+    # quoted value of the template syntax, only double quotes are escaped by oned, other characters
+    # including backslashes and new lines are valid inside the quotes. As oned does not unescape \\,
+    # a value ending in a backslash cannot be sent, its closing quote would read as escaped.
+    if value is None:
+        return u'""'
+    if _is_constant(value):
+        value = value.value
+    if not isinstance(value, string_types):
+        value = u"%s" % value
+    if u'"' in value:
+        value = value.replace(u'"', u'\\"')
+    return u'"%s"' % value
+
+
+def _template_lines(key, value, lines):
+    if isinstance(value, (list, tuple)):
+        # repeated attributes
+        for item in value:
+            _template_lines(key, item, lines)
+    elif isinstance(value, dict):
+        attributes = []
+        for name, item in value.items():
+            if isinstance(item, (dict, list, tuple)):
+                raise ValueError("Vector attribute %s cannot hold %s, vectors have a single level" % (key, name))
+            attributes.append(u"  %s=%s" % (name, _template_value(item)))
+        lines.append(u"%s=[\n%s ]\n" % (key, u",\n".join(attributes)))
+    else:
+        lines.append(u"%s=%s\n" % (key, _template_value(value)))
+
+
+def dict2template(param):
+    '''
+    Serializes a dictionary as an OpenNebula template, KEY="value" attributes one per line.
+    Dictionaries are written as vector attributes, e.g. DISK=[ IMAGE_ID="1", SIZE="10" ],
+    and lists as repeated attributes, e.g. one DISK vector per disk.
+    Double quotes are escaped, backslashes are sent as they are, so values cannot end in a backslash.
+
+    :param param: dictionary of attributes
+    :return: template text
+    '''
+    lines = []
+    for key, value in param.items():
+        _template_lines(key, value, lines)
+    return u"".join(lines)
+
+
+def _xml_text(element, value):
+    if value is None:
+        element.text = u""
+    elif isinstance(value, bool):
+        element.text = u"true" if value else u"false"
+    else:
+        if _is_constant(value):
+            value = value.value
+        text = value if isinstance(value, string_types) else u"%s" % value
+        # CDATA sections cannot hold their end marker
+        element.text = etree.CDATA(text) if u"]]>" not in text else text
+
+
+def _xml_element(parent, key, value):
+    if isinstance(value, (list, tuple)):
+        # repeated elements
+        for item in value:
+            _xml_element(parent, key, item)
+        return
+    try:
+        element = etree.SubElement(parent, key.replace(u" ", u"_"))
+    except ValueError:
+        element = etree.SubElement(parent, u"key", name=key)
+    if isinstance(value, dict):
+        _xml_children(element, value)
+    else:
+        _xml_text(element, value)
+
+
+def _xml_children(element, param):
+    for key, value in param.items():
+        if key.startswith(u"@"):
+            # attributes and text of child2dict
+            element.set(key[1:], u"%s" % value)
+        elif key == u"#text":
+            _xml_text(element, value)
+        else:
+            _xml_element(element, key, value)
+
+
+def dict2xml(param):
+    '''
+    Serializes a dictionary with a root element, e.g. {"TEMPLATE": {...}} as returned by one2dict, as XML.
+    Values are written as CDATA sections, nested dictionaries as elements and lists as repeated elements.
+    The @ and #text keys of child2dict are written as attributes and text.
+
+    :param param: dictionary with the root element
+    :return: XML text
+    '''
+    # a placeholder parent, the elements of the dictionary are returned without it
+    parent = etree.Element(u"root")
+    _xml_children(parent, param)
+    return u"".join(etree.tostring(element, encoding=u"unicode") for element in parent)
 
 
 def cast2one(param):
@@ -32,7 +148,7 @@ def cast2one(param):
     :return: casted parameter
     '''
 
-    if isinstance(param, IntEnum):
+    if _is_constant(param):
         # if the param is a constant we return its value
         return param.value
     if isinstance(param, dict):
@@ -45,14 +161,10 @@ def cast2one(param):
             root = list(param.values())[0]
             if isinstance(root, dict):
                 # We return this dictionary as XML
-                return dicttoxml.dicttoxml(param, root=False,attr_type=False,
-                                           cdata=True).decode('utf8')
+                return dict2xml(param)
             else:
                 # We return this dictionary as attribute=value vector
-                ret = u""
-                for (k, v) in param.items():
-                    ret = u'''%s%s="%s"\n''' % (ret, k, v)
-                return ret
+                return dict2template(param)
         else:
             raise Exception("Cannot cast empty dictionary")
     else:
@@ -80,35 +192,480 @@ def none2emptystr(d):
             d[k] = ""
 
 
+def _localname(tag):
+    return tag.rpartition('}')[2]
+
+
+def _element2value(element):
+    '''
+    Converts an element to the value xmltodict would produce for it,
+    with "" instead of None for empty elements.
+    '''
+    if len(element) == 0 and not element.attrib:
+        text = element.text
+        return text.strip() if text else ""
+    return _element2dict(element)
+
+
+def _element2dict(element, ret=None):
+    if ret is None:
+        ret = OrderedDict()
+    for name, value in element.attrib.items():
+        ret['@' + _localname(name)] = value
+
+    text = [element.text] if element.text else []
+    for child in element:
+        if child.tail:
+            text.append(child.tail)
+        tag = child.tag
+        if not isinstance(tag, string_types):
+            # comments and processing instructions
+            continue
+        key = _localname(tag)
+        value = _element2value(child)
+        if key in ret:
+            # repeated elements are returned as a list
+            current = ret[key]
+            if isinstance(current, list):
+                current.append(value)
+            else:
+                ret[key] = [current, value]
+        else:
+            ret[key] = value
+
+    text = "".join(text).strip()
+    if text:
+        ret['#text'] = text
+    return ret
+
+
 def child2dict(element):
     '''
     Creates a dictionary from the documentTree obtained from a binding Element.
+    The structure is the same xmltodict would return: repeated elements as lists, attributes
+    prefixed by @, and empty elements as empty strings.
     :param element:
     :return:
     '''
 
-    xml = tostring(element)
-    ret = xmltodict.parse(xml)
-
-    # get the tag name and remove the ns attribute if present
-    if "}" in element.tag:
-        tagName = element.tag.split('}')[1]
-        del ret[tagName]['@xmlns']
-    else:
-        tagName = element.tag
-
-    # Reemplace no-dictionary with empty dictionary
-    if ret[tagName] == None:
-        ret[tagName] = OrderedDict()
+    # get the tag name without namespace
+    tagName = _localname(element.tag)
 
-    # Replace 'None' values returned by xmltodict by ""
-    none2emptystr(ret)
+    ret = OrderedDict()
+    ret[tagName] = _element2dict(element)
 
     # return the contents dictionary, but save a reference
     ret[tagName]._root = ret
     return ret[tagName]
 
 
+# template syntax, as oned parses it: values are quoted strings, where only \" is an escape and other
+# backslashes are literal, unquoted words or vectors of name=value pairs between brackets.
+# Names are not case sensitive, oned stores them in upper case.
+_QUOTED = r'"([^\\"]*(?:\\(?:"|(?!"))[^\\"]*)*)"'
+_WORD = r'([^\s"\[\],#=]+)'
+_SPACE = re.compile(r'(?:\s+|#[^\n]*)*')
+_BRACKETS = r'\[([^\]"]*(?:"[^\\"]*(?:\\(?:"|(?!"))[^\\"]*)*"[^\]"]*)*)\]'
+_ATTRIBUTE = re.compile(r'(\w+)[ \t]*=[ \t]*(?:%s|%s|%s)?' % (_QUOTED, _BRACKETS, _WORD), re.S)
+_VECTOR_ITEM = re.compile(r'\s*(\w+)\s*=\s*(?:%s|%s)?\s*(?:,|\Z)' % (_QUOTED, _WORD), re.S)
+
+
+def _unquote(value):
+    return value.replace(u'\\"', u'"') if u'\\"' in value else value
+
+
+def _add_attribute(ret, key, value):
+    # repeated attributes are returned as a list, as child2dict does for repeated elements
+    if key in ret:
+        current = ret[key]
+        if isinstance(current, list):
+            current.append(value)
+        else:
+            ret[key] = [current, value]
+    else:
+        ret[key] = value
+
+
+def _vector(text):
+    ret = OrderedDict()
+    pos = 0
+    text = text.strip()
+    while pos < len(text):
+        match = _VECTOR_ITEM.match(text, pos)
+        if match is None:
+            raise ValueError(text[pos:pos + 40])
+        key, quoted, word = match.groups()
+        _add_attribute(ret, key.upper(), _unquote(quoted) if quoted is not None else word or u"")
+        pos = match.end()
+    return ret
+
+
+def iter_template(source, chunk_size=65536):
+    '''
+    Parses an OpenNebula template, KEY="value" and KEY=[ NAME="value", ... ] attributes,
+    yielding the attributes as they are read, so that large templates can be read from files.
+
+    :param source: template text, or file object in text or binary (UTF-8) mode
+    :param chunk_size: characters read from files at a time
+    :return: generator of (name, value) tuples, values are strings and vectors ordered dictionaries
+    '''
+    if isinstance(source, bytes):
+        source = source.decode("utf-8")
+    if isinstance(source, string_types):
+        buffer = source
+        read = None
+    else:
+        buffer = u""
+        decoder = codecs.getincrementaldecoder("utf-8")()
+
+        def read():
+            chunk = source.read(chunk_size)
+            if isinstance(chunk, bytes):
+                chunk = decoder.decode(chunk, final=not chunk)
+            return chunk
+
+    pos = 0
+    line = 1
+    while True:
+        start = pos
+        pos = _SPACE.match(buffer, pos).end()
+        match = _ATTRIBUTE.match(buffer, pos)
+        end = match.end() if match is not None else pos
+        # attributes are followed by spaces, comments or the end of the template
+        complete = match is not None and end < len(buffer) and (buffer[end].isspace() or buffer[end] == u"#")
+        if not complete and read is not None:
+            # the attribute may continue in the next chunk
+            chunk = read()
+            if not chunk:
+                read = None
+            line += buffer.count(u"\n", 0, start)
+            buffer = buffer[start:] + chunk
+            pos = 0
+            continue
+        if pos == len(buffer):
+            return
+        if match is None or (end < len(buffer) and not complete):
+            line += buffer.count(u"\n", 0, pos)
+            raise ValueError("Invalid template syntax at line %d: %s" % (line, buffer[pos:pos + 40]))
+        key, quoted, vector, word = match.groups()
+        if vector is not None:
+            try:
+                # an empty vector is an empty element, as for child2dict
+                value = _vector(vector) or u""
+            except ValueError as e:
+                line += buffer.count(u"\n", 0, pos)
+                raise ValueError("Invalid vector attribute at line %d: %s" % (line, e))
+        elif quoted is not None:
+            value = _unquote(quoted)
+        else:
+            value = word or u""
+        yield key.upper(), value
+        pos = end
+
+
+def template2dict(source, root="TEMPLATE"):
+    '''
+    Parses an OpenNebula template into the dictionary child2dict returns for the same template as XML:
+    vectors as dictionaries, repeated attributes as lists and all values as strings. The dictionary
+    round-trips through cast2one.
+
+    :param source: template text, or file object, see iter_template
+    :param root: name of the template element, e.g. TEMPLATE or USER_TEMPLATE. cast2one serializes
+                 dictionaries with a root as XML, None returns a plain dictionary, serialized as attributes.
+    :return: ordered dictionary
+    '''
+    ret = OrderedDict()
+    for key, value in iter_template(source):
+        _add_attribute(ret, key, value)
+    if root is not None:
+        ret._root = OrderedDict()
+        ret._root[root] = ret
+    return ret
+
+
+def element2binding(element):
+    '''
+    Builds the binding object for an already parsed XML document, as bindings.parseString
+    does for its text.
+    :param element: root element of the document
+    :return: binding object
+    '''
+    from pyone import bindings
+
+    rootTag, rootClass = bindings.get_root_tag(element)
+    if rootClass is None:
+        rootClass = bindings.supermod.HISTORY_RECORDS
+    return rootClass.factory().build(element)
+
+
+# held in the storage of a LazyTemplate until it is built, code reading the storage of dictionaries
+# directly, such as the C JSON encoder, would otherwise take it for an empty one and skip its methods
+_UNBUILT = object()
+
+
+class LazyTemplate(OrderedDict):
+    '''
+    Template dictionary that is only built when it is first used.
+    Until then it just holds the serialized element, so that the parsed document can be released.
+    Once materialized it is the same dictionary child2dict returns, including the _root reference.
+    Copies and pickles are materialized.
+    '''
+
+    def __init__(self, source=None):
+        '''
+        :param source: serialized TEMPLATE or USER_TEMPLATE element
+        '''
+        OrderedDict.__init__(self)
+        self._source = source
+        self._root_dict = None
+        if source is not None:
+            dict.__setitem__(self, _UNBUILT, None)
+
+    def _materialize(self):
+        if self._source is not None:
+            element = etree.fromstring(self._source)
+            self._source = None
+            dict.__delitem__(self, _UNBUILT)
+            _element2dict(element, self)
+            self._root_dict = OrderedDict()
+            self._root_dict[_localname(element.tag)] = self
+
+    @property
+    def materialized(self):
+        return self._source is None
+
+    @property
+    def _root(self):
+        self._materialize()
+        return self._root_dict
+
+    def __reduce__(self):
+        # the state of Python 2's OrderedDict.__reduce__ would be passed to __init__ as the source
+        self._materialize()
+        return self.__class__, (), {"_source": None, "_root_dict": self._root_dict}, None, iter(list(self.items()))
+
+    def __reduce_ex__(self, protocol):
+        # also used by copy.copy and copy.deepcopy
+        return self.__reduce__()
+
+
+def _materializing(name):
+    method = getattr(OrderedDict, name)
+
+    def wrapper(self, *args, **kwargs):
+        self._materialize()
+        for arg in args:
+            # dict comparisons read the storage of the other operand directly
+            if isinstance(arg, LazyTemplate):
+                arg._materialize()
+        return method(self, *args, **kwargs)
+
+    wrapper.__name__ = name
+    wrapper.__doc__ = method.__doc__
+    return wrapper
+
+
+for _name in ('__getitem__', '__setitem__', '__delitem__', '__contains__', '__iter__', '__reversed__',
+              '__len__', '__eq__', '__ne__', '__repr__', 'keys', 'values', 'items', 'get',
+              'pop', 'popitem', 'setdefault', 'update', 'clear', 'copy', 'move_to_end',
+              '__or__', '__ror__', '__ior__', 'iterkeys', 'itervalues', 'iteritems', 'has_key'):
+    if hasattr(OrderedDict, _name):
+        setattr(LazyTemplate, _name, _materializing(_name))
+
+
+def _track(value, owner, key):
+    # wraps the dictionaries of an attribute so that their changes mark it as changed
+    if isinstance(value, dict):
+        return _TrackedVector(value, owner, key)
+    if isinstance(value, list):
+        return [_track(item, owner, key) for item in value]
+    return value
+
+
+class _TrackedVector(OrderedDict):
+    # vector attribute, or nested element, of a TrackedTemplate
+
+    def __init__(self, items, owner, key):
+        self._owner = None
+        OrderedDict.__init__(self)
+        for name, value in items.items():
+            OrderedDict.__setitem__(self, name, _track(value, owner, key))
+        self._owner = (owner, key)
+
+    def _changed(self):
+        if self._owner is not None:
+            self._owner[0]._changed(self._owner[1])
+
+    def __reduce__(self):
+        # copies are plain dictionaries, the template tracks them again
+        return OrderedDict, (list(self.items()),)
+
+
+def _tracking(name):
+    method = getattr(OrderedDict, name)
+
+    def wrapper(self, *args, **kwargs):
+        ret = method(self, *args, **kwargs)
+        self._changed()
+        return ret
+
+    wrapper.__name__ = name
+    wrapper.__doc__ = method.__doc__
+    return wrapper
+
+
+for _name in ('__setitem__', '__delitem__', 'pop', 'popitem', 'setdefault', 'update', 'clear'):
+    setattr(_TrackedVector, _name, _tracking(_name))
+
+
+class TrackedTemplate(OrderedDict):
+    '''
+    Template dictionary that records the attributes set and deleted since it was loaded,
+    so that only those are sent to the server:
+
+        template = TrackedTemplate(one.vm.info(id).USER_TEMPLATE)
+        template["LABELS"] = "SSD,HA"
+        one.vm.update(id, template.delta(), 1)
+        template.commit()
+
+    Changes of vectors, e.g. template["CONTEXT"]["NETWORK"] = "YES", mark the whole vector.
+    Lists of repeated attributes are not tracked when modified in place, assign them again or call touch.
+    Merges cannot remove attributes, templates with deleted attributes must be replaced,
+    see pyone.helpers.update_template.
+    '''
+
+    def __init__(self, template=None):
+        '''
+        :param template: dictionary, e.g. a TEMPLATE or USER_TEMPLATE from the bindings or template2dict
+        '''
+        self._loading = True
+        OrderedDict.__init__(self)
+        root = getattr(template, "_root", None) if template is not None else None
+        if root:
+            # keep the element name, so that cast2one serializes the whole template as before
+            self._root = OrderedDict()
+            self._root[list(root.keys())[0]] = self
+        for key, value in (template or {}).items():
+            OrderedDict.__setitem__(self, key, value)
+        self.commit()
+
+    def commit(self):
+        '''
+        Forgets the changes, e.g. once the server has been updated
+        '''
+        self._loading = True
+        for key, value in list(self.items()):
+            OrderedDict.__setitem__(self, key, _track(value, self, key))
+        self._loading = False
+        self._loaded = set(self.keys())
+        self.changed = set()
+        self.deleted = set()
+
+    def __reduce__(self):
+        # copies keep the changes
+        root = list(self._root.keys())[0] if getattr(self, "_root", None) else None
+        return _tracked_template, (list(self.items()), root, self._loaded, self.changed, self.deleted)
+
+    @property
+    def modified(self):
+        '''
+        :return: True if attributes were set or deleted since loaded or committed
+        '''
+        return bool(self.changed or self.deleted)
+
+    def _changed(self, key):
+        if not self._loading:
+            self.changed.add(key)
+            self.deleted.discard(key)
+
+    def touch(self, key):
+        '''
+        Marks an attribute as changed, e.g. after appending to a list of repeated attributes
+        '''
+        if key not in self:
+            raise KeyError(key)
+        self._changed(key)
+
+    def __setitem__(self, key, value):
+        if not self._loading and key in self and OrderedDict.__getitem__(self, key) == value:
+            # same value, nothing to send
+            return
+        OrderedDict.__setitem__(self, key, value)
+        self._changed(key)
+
+    def __delitem__(self, key):
+        OrderedDict.__delitem__(self, key)
+        self.changed.discard(key)
+        if key in self._loaded:
+            self.deleted.add(key)
+
+    def pop(self, key, *default):
+        if key in self:
+            value = OrderedDict.__getitem__(self, key)
+            del self[key]
+            return value
+        if default:
+            return default[0]
+        raise KeyError(key)
+
+    def popitem(self, last=True):
+        key = next(reversed(self)) if last else next(iter(self))
+        return key, self.pop(key)
+
+    def setdefault(self, key, default=None):
+        if key not in self:
+            self[key] = default
+        return OrderedDict.__getitem__(self, key)
+
+    def update(self, *args, **kwargs):
+        for key, value in OrderedDict(*args, **kwargs).items():
+            self[key] = value
+
+    def clear(self):
+        for key in list(self.keys()):
+            del self[key]
+
+    def delta(self):
+        '''
+        :return: the changed attributes as an attribute=value vector, to be sent in merge mode (type 1),
+                 empty if none changed. Deleted attributes are not included.
+        '''
+        return dict2template(OrderedDict((key, value) for key, value in self.items() if key in self.changed))
+
+
+def _tracked_template(items, root, loaded, changed, deleted):
+    template = TrackedTemplate(OrderedDict(items))
+    if root is not None:
+        template._root = OrderedDict()
+        template._root[root] = template
+    template._loaded = set(loaded)
+    template.changed = set(changed)
+    template.deleted = set(deleted)
+    return template
+
+
+_template_options = threading.local()
+
+
+@contextmanager
+def lazy_templates(enabled=True):
+    '''
+    Context manager to build TEMPLATE and USER_TEMPLATE nodes as LazyTemplate dictionaries
+    for the bindings parsed in the current thread:
+
+        with lazy_templates():
+            pool = bindings.parseString(xml)
+
+    :param enabled: False restores the default, eager, behavior
+    '''
+    previous = getattr(_template_options, "lazy", False)
+    _template_options.lazy = enabled
+    try:
+        yield
+    finally:
+        _template_options.lazy = previous
+
+
 def build_template_node(obj,nodeName,child):
     '''
     Utility function to build an anyType element that can be accessed as a dictionary
@@ -117,11 +674,12 @@ def build_template_node(obj,nodeName,child):
     :param child:
     :return:
     '''
-    if nodeName == "TEMPLATE":
-        obj.TEMPLATE = child2dict(child)
-        return True
-    elif nodeName == "USER_TEMPLATE":
-        obj.USER_TEMPLATE = child2dict(child)
+    if nodeName == "TEMPLATE" or nodeName == "USER_TEMPLATE":
+        if getattr(_template_options, "lazy", False):
+            template = LazyTemplate(etree.tostring(child))
+        else:
+            template = child2dict(child)
+        setattr(obj, nodeName, template)
         return True
     else:
         return False
@@ -131,6 +689,9 @@ class TemplatedType(object):
     '''
     Mixin class for Templated bindings
     '''
+    # no instance dictionary in bindings generated with __slots__, see "make slots"
+    __slots__ = ()
+
     def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
         if not build_template_node(self, nodeName_, child_):
             super(TemplatedType, self).buildChildren(child_,node,nodeName_,fromsubclass_)
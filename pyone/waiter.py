@@ -0,0 +1,149 @@
+# Copyright 2018 www.privaz.io Valletech AB
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import random
+import time
+from six import integer_types
+from . import OneException, OneNoExistsException, VM_STATE, LCM_STATE, IMAGE_STATES, HOST_STATES, \
+    MARKETPLACEAPP_STATES
+from .pools import id_ranges
+
+
+class OneWaitTimeout(OneException):
+    pass
+
+
+class OneWaitFailure(OneException):
+    pass
+
+
+# elements needed to check the state of the objects
+WAIT_FIELDS = ("ID", "STATE", "LCM_STATE")
+
+VM_FAILURE_STATES = frozenset([VM_STATE.FAILED, VM_STATE.CLONING_FAILURE])
+LCM_FAILURE_STATES = frozenset(state for state in LCM_STATE if state.name.endswith("FAILURE"))
+
+# pool method, object element, whether the pool takes an ID range, and failure states of each kind of object
+WAITABLE = {
+    "vm": ("vmpool", "VM", True, VM_FAILURE_STATES),
+    "image": ("imagepool", "IMAGE", True, frozenset([IMAGE_STATES.ERROR])),
+    "host": ("hostpool", "HOST", False, frozenset([HOST_STATES.ERROR, HOST_STATES.MONITORING_ERROR])),
+    "marketapp": ("marketapppool", "MARKETPLACEAPP", True, frozenset([MARKETPLACEAPP_STATES.ERROR]))
+}
+
+
+def _matches(value, expected):
+    if expected is None:
+        return True
+    if isinstance(expected, (list, tuple, set, frozenset)):
+        return value in expected
+    return value == expected
+
+
+def _poll(one, kind, ids, any_state, fields):
+    method, element, ranged, _ = WAITABLE[kind]
+    info = getattr(one, method).info
+    if not ranged:
+        pools = [info(fields=fields)]
+    else:
+        # VMs in the DONE state are only listed when asking for any state (-2)
+        extra = (-2 if any_state else -1,) if kind == "vm" else ()
+        pools = [info(-2, start, end, *extra, fields=fields) for start, end in id_ranges(ids)]
+    for pool in pools:
+        for obj in getattr(pool, element):
+            if obj.ID in ids:
+                yield obj
+
+
+def _failed(kind, obj, state, lcm_state):
+    failure_states = WAITABLE[kind][3]
+    if obj.STATE in failure_states and not _matches(obj.STATE, state):
+        return True
+    if kind == "vm" and obj.STATE == VM_STATE.ACTIVE and obj.LCM_STATE in LCM_FAILURE_STATES:
+        return not _matches(obj.LCM_STATE, lcm_state)
+    return False
+
+
+def wait_for(one, kind, ids, state=None, lcm_state=None, timeout=None, interval=None, max_interval=None,
+             fail_fast=True, fields=WAIT_FIELDS):
+    '''
+    Waits for a set of objects to reach a state, polling them with pool requests, a few ID ranges
+    per round, instead of an info call per object. Polls back off exponentially, with jitter.
+
+        one.wait_for('vm', ids, state=VM_STATE.ACTIVE, lcm_state=LCM_STATE.RUNNING, timeout=600)
+
+    :param one: the XMLRPC server
+    :param kind: vm, image, host or marketapp
+    :param ids: object ID or list of IDs
+    :param state: expected STATE, or list of accepted states
+    :param lcm_state: expected LCM_STATE of VMs, or list of accepted states
+    :param timeout: seconds to wait, OneWaitTimeout is raised once elapsed. None waits forever.
+    :param interval: first wait between polls, defaults to server_retry_interval
+    :param max_interval: longest wait between polls, defaults to 30 times the first one
+    :param fail_fast: raise OneWaitFailure as soon as an object reaches a failure state, e.g. BOOT_FAILURE
+    :param fields: projection of the polled objects, None for the complete objects
+    :return: the objects as last polled, a list in the order of ids, or a single object for a single ID
+    '''
+    if kind not in WAITABLE:
+        raise OneException("Cannot wait for %s objects" % kind)
+    single = isinstance(ids, integer_types)
+    ids = [ids] if single else list(ids)
+    if not ids:
+        return []
+
+    interval = interval or one.server_retry_interval()
+    max_interval = max_interval or interval * 30
+    deadline = None if timeout is None else time.time() + timeout
+    any_state = state is not None and _matches(VM_STATE.DONE, state)
+    pending = set(ids)
+    found = {}
+
+    while True:
+        seen = set()
+        for obj in _poll(one, kind, set(pending), any_state, fields):
+            seen.add(obj.ID)
+            if _matches(obj.STATE, state) and (kind != "vm" or _matches(obj.LCM_STATE, lcm_state)):
+                found[obj.ID] = obj
+                pending.discard(obj.ID)
+            elif fail_fast and _failed(kind, obj, state, lcm_state):
+                raise OneWaitFailure("%s %d failed, state %s" % (kind, obj.ID, _state_name(kind, obj)))
+
+        missing = pending - seen
+        if missing:
+            raise OneNoExistsException("%s %s not found" % (kind, ", ".join(str(id) for id in sorted(missing))))
+        if not pending:
+            ret = [found[id] for id in ids]
+            return ret[0] if single else ret
+
+        now = time.time()
+        if deadline is not None and now >= deadline:
+            raise OneWaitTimeout("Timeout waiting for %s %s" % (kind, ", ".join(str(id) for id in sorted(pending))))
+        # "equal jitter", spreads the polls of concurrent waiters
+        delay = random.uniform(interval / 2.0, interval)
+        if deadline is not None:
+            delay = min(delay, deadline - now)
+        time.sleep(delay)
+        interval = min(interval * 2, max_interval)
+
+
+def _state_name(kind, obj):
+    try:
+        if kind == "vm":
+            name = VM_STATE(obj.STATE).name
+            if obj.STATE == VM_STATE.ACTIVE:
+                name = "%s/%s" % (name, LCM_STATE(obj.LCM_STATE).name)
+            return name
+        return {"image": IMAGE_STATES, "host": HOST_STATES, "marketapp": MARKETPLACEAPP_STATES}[kind](obj.STATE).name
+    except ValueError:
+        return str(obj.STATE)
@@ -0,0 +1,155 @@
+# Copyright 2018 www.privaz.io Valletech AB
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import time
+from collections import namedtuple
+from . import OneException
+from .pools import id_ranges
+
+ADDED = "added"
+CHANGED = "changed"
+REMOVED = "removed"
+
+# type is ADDED, CHANGED or REMOVED, object is None for removals and previous is None for additions
+PoolEvent = namedtuple("PoolEvent", ["type", "id", "object", "previous"])
+
+# object element, whether the pool takes an ID range, extra info parameters and default signature of each pool
+WATCHABLE = {
+    "vmpool": ("VM", True, (-1,), ("LAST_POLL", "STATE", "LCM_STATE", "RESCHED", "NAME", "UID", "GID")),
+    "imagepool": ("IMAGE", True, (), ("STATE", "RUNNING_VMS", "SIZE", "PERSISTENT", "NAME", "UID", "GID")),
+    "vnpool": ("VNET", True, (), ("USED_LEASES", "NAME", "UID", "GID")),
+    "hostpool": ("HOST", False, (), ("LAST_MON_TIME", "STATE", "NAME", "CLUSTER_ID")),
+    "datastorepool": ("DATASTORE", False, (), ("STATE", "FREE_MB", "USED_MB", "NAME"))
+}
+
+
+class PoolWatcher(object):
+    '''
+    Keeps the last snapshot of a pool, indexed by ID, and reports the objects added, changed and removed
+    since the previous poll. Objects are compared by a signature, a few elements that change along with
+    the object, e.g. LAST_POLL, STATE and LCM_STATE for VMs:
+
+        watcher = PoolWatcher(one, "vmpool")
+        for event in watcher.watch(interval=10):
+            print(event.type, event.id)
+
+    With extended, polls only bind the signature of each object, and the complete objects are requested
+    with the pool infoextended call, for the ID ranges of the added and changed objects.
+    '''
+
+    def __init__(self, one, pool="vmpool", filter=-2, signature=None, extended=False):
+        '''
+        :param one: the XMLRPC server
+        :param pool: pool method namespace, e.g. vmpool or hostpool
+        :param filter: ownership filter flag as in pool.info, -2 for all resources
+        :param signature: list of the elements compared to detect changes, defaults to the pool ones
+        :param extended: request the complete objects, only for those that changed, with infoextended.
+                         Requires a pool taking ID ranges, e.g. vmpool.
+        '''
+        if pool not in WATCHABLE:
+            raise OneException("Cannot watch %s" % pool)
+        self._one = one
+        self._pool = pool
+        self._filter = filter
+        self._element, self._ranged, self._extra, default = WATCHABLE[pool]
+        if extended and not self._ranged:
+            raise OneException("%s does not support extended polls" % pool)
+        self._extended = extended
+        self._signature = tuple(signature or default)
+        # ID: (signature, object)
+        self._snapshot = {}
+        self.polls = 0
+
+    @property
+    def snapshot(self):
+        '''
+        :return: dictionary with the objects of the last poll, by ID
+        '''
+        return dict((id, entry[1]) for id, entry in self._snapshot.items())
+
+    def _info(self, method, *args, **kwargs):
+        pool = getattr(getattr(self._one, self._pool), method)(*args, **kwargs)
+        return getattr(pool, self._element, None) or []
+
+    def _sign(self, obj):
+        return tuple(getattr(obj, field, None) for field in self._signature)
+
+    def poll(self):
+        '''
+        Requests the pool and updates the snapshot
+        :return: list of PoolEvent, additions and changes in pool order followed by removals
+        '''
+        if self._ranged:
+            args = (self._filter, -1, -1) + self._extra
+        else:
+            args = ()
+        fields = ("ID",) + self._signature if self._extended else None
+        objects = self._info("info", *args, fields=fields)
+
+        current = {}
+        pending = []
+        for obj in objects:
+            signature = self._sign(obj)
+            current[obj.ID] = (signature, obj)
+            previous = self._snapshot.get(obj.ID)
+            if previous is None or previous[0] != signature:
+                pending.append(obj.ID)
+
+        if self._extended and pending:
+            wanted = set(pending)
+            for start, end in id_ranges(pending):
+                for obj in self._info("infoextended", self._filter, start, end, *self._extra):
+                    if obj.ID in wanted:
+                        # the signature of the extended object, it may have changed since the poll
+                        current[obj.ID] = (self._sign(obj), obj)
+
+        events = []
+        for id in pending:
+            previous = self._snapshot.get(id)
+            obj = current[id][1]
+            if previous is None:
+                events.append(PoolEvent(ADDED, id, obj, None))
+            else:
+                events.append(PoolEvent(CHANGED, id, obj, previous[1]))
+        for id, entry in self._snapshot.items():
+            if id not in current:
+                events.append(PoolEvent(REMOVED, id, None, entry[1]))
+
+        if self._extended:
+            # keep the complete objects of those that did not change
+            for id, entry in current.items():
+                if id not in pending:
+                    current[id] = (entry[0], self._snapshot[id][1])
+        self._snapshot = current
+        self.polls += 1
+        return events
+
+    def watch(self, interval=10, timeout=None):
+        '''
+        Generator polling the pool every interval seconds and yielding the events
+        :param interval: seconds between polls
+        :param timeout: seconds to watch, None watches forever
+        :return: generator of PoolEvent
+        '''
+        deadline = None if timeout is None else time.time() + timeout
+        while True:
+            for event in self.poll():
+                yield event
+            now = time.time()
+            if deadline is not None:
+                if now >= deadline:
+                    return
+                time.sleep(min(interval, deadline - now))
+            else:
+                time.sleep(interval)
@@ -54,10 +54,9 @@ setup(
     packages=find_packages(),
     install_requires=[
         'lxml',
-        'dicttoxml',
-        'xmltodict',
         'six',
         "future ; python_version<'3.0'",
+        "futures ; python_version<'3.0'",
         'aenum',
         'tblib'
     ],
@@ -66,7 +65,9 @@ setup(
     },
     extras_require={
         'dev': ['check-manifest'],
-        'test': ['coverage'],
+        'test': ['coverage', 'xmltodict'],
+        'benchmark': ['xmltodict', 'dicttoxml'],
+        'numpy': ['numpy'],
     },
     test_suite="tests"
 )
@@ -0,0 +1,138 @@
+# Copyright 2018 www.privaz.io Valletech AB
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+# Post-processes the generateDS bindings so that binding classes declare __slots__,
+# instances then have no per-instance __dict__. Used by "make slots".
+#
+#   python src/slotify.py pyone/bindings/supbind.py pyone/bindings/__init__.py
+
+import ast
+import io
+import sys
+
+# bases that make a class a binding class
+SLOTTED_BASES = ("GeneratedsSuper", "TemplatedType")
+
+# added to GeneratedsSuper, Python 2 pickle protocols below 2 drop the slots of instances otherwise
+SLOTS_STATE = """\
+def __getstate__(self):
+    return dict((name, getattr(self, name)) for cls in type(self).__mro__
+                for name in getattr(cls, '__slots__', ()) if hasattr(self, name))
+
+def __setstate__(self, state):
+    for name, value in state.items():
+        setattr(self, name, value)
+
+"""
+
+
+def _base_name(base):
+    if isinstance(base, ast.Name):
+        return base.id
+    if isinstance(base, ast.Attribute) and isinstance(base.value, ast.Name) and base.value.id == "supermod":
+        # generated binding of the super module, always slotted
+        return "GeneratedsSuper"
+    return None
+
+
+def _classes(nodes):
+    # GeneratedsSuper is defined inside a try/except block
+    for node in nodes:
+        if isinstance(node, ast.ClassDef):
+            yield node
+        for block in ("body", "orelse", "finalbody"):
+            if isinstance(node, (ast.If, getattr(ast, "Try", ()), getattr(ast, "TryExcept", ()))):
+                for child in _classes(getattr(node, block, [])):
+                    yield child
+        for handler in getattr(node, "handlers", []):
+            for child in _classes(handler.body):
+                yield child
+
+
+def _instance_attributes(cls):
+    ret = []
+    for function in cls.body:
+        if not isinstance(function, ast.FunctionDef):
+            continue
+        for node in ast.walk(function):
+            if isinstance(node, ast.Assign):
+                targets = node.targets
+            elif isinstance(node, ast.AugAssign):
+                targets = [node.target]
+            else:
+                continue
+            for target in targets:
+                if isinstance(target, ast.Attribute) and isinstance(target.value, ast.Name) \
+                        and target.value.id == "self" and target.attr not in ret:
+                    ret.append(target.attr)
+    return ret
+
+
+def _has_slots(cls):
+    return any(isinstance(node, ast.Assign) and any(isinstance(t, ast.Name) and t.id == "__slots__"
+                                                    for t in node.targets) for node in cls.body)
+
+
+def slotify(source):
+    '''
+    Adds __slots__ to the binding classes of a generated module
+    :param source: module source
+    :return: new module source, unchanged classes that already declare __slots__
+    '''
+    lines = source.splitlines(True)
+    slotted = {}
+    inserts = []
+    if sys.version_info[0] < 3 and not isinstance(source, bytes):
+        # Python 2 refuses unicode sources that carry a coding declaration
+        tree = ast.parse(source.encode("utf-8"))
+    else:
+        tree = ast.parse(source)
+    for cls in _classes(tree.body):
+        bases = [_base_name(base) for base in cls.bases]
+        if cls.name not in SLOTTED_BASES and not any(base in SLOTTED_BASES or base in slotted for base in bases):
+            continue
+        inherited = set()
+        for base in bases:
+            inherited.update(slotted.get(base, ()))
+        attributes = [name for name in _instance_attributes(cls) if name not in inherited]
+        slotted[cls.name] = inherited.union(attributes)
+        if _has_slots(cls):
+            continue
+
+        first = cls.body[0]
+        if ast.get_docstring(cls) is not None and len(cls.body) > 1:
+            # keep the docstring first
+            first = cls.body[1]
+        indent = " " * first.col_offset
+        lineno = min([first.lineno] + [d.lineno for d in getattr(first, "decorator_list", [])])
+        text = "%s__slots__ = (%s)\n" % (indent, "".join("'%s', " % name for name in attributes))
+        if cls.name == "GeneratedsSuper":
+            text += "".join(indent + line if line.strip() else line for line in SLOTS_STATE.splitlines(True))
+        inserts.append((lineno - 1, text))
+
+    for line, text in sorted(inserts, reverse=True):
+        lines.insert(line, text)
+    return "".join(lines)
+
+
+def main(paths):
+    for path in paths:
+        with io.open(path, encoding="utf-8") as f:
+            source = f.read()
+        with io.open(path, "w", encoding="utf-8") as f:
+            f.write(slotify(source))
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
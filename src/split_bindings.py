@@ -0,0 +1,306 @@
+# Copyright 2018 www.privaz.io Valletech AB
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+# Post-processes the generateDS bindings into one module per top level element, e.g. pyone/bindings/vm.py
+# for VM_POOL and VM, imported on first use. supbind keeps the code shared by all bindings and imports
+# the module of a binding class when it is first accessed, parsing a document imports the module of its root only.
+# Used by "make all", after the generation.
+#
+#   python src/split_bindings.py pyone/bindings
+
+import ast
+import io
+import os
+import re
+import sys
+
+# classes whose subclasses are bindings
+BINDING_BASES = ("GeneratedsSuper",)
+
+# names of the anonymous types, generated for the children of elements
+ANONYMOUS_TYPE = re.compile(r"Type\d*$")
+
+# try blocks, a single node type since Python 3
+TRY_NODES = tuple(getattr(ast, name) for name in ("Try", "TryExcept", "TryFinally") if hasattr(ast, name))
+
+LAZY_SUPER = '''
+#
+# Binding classes, defined in one module per top level element by src/split_bindings.py,
+# imported on first use
+#
+
+from importlib import import_module
+
+_MODULES = {
+%s}
+
+
+def _binding(name):
+    module = _MODULES.get(name)
+    if module is None:
+        return None
+    ret = getattr(import_module("." + module, __package__), name)
+    globals()[name] = ret
+    return ret
+
+
+def __getattr__(name):
+    ret = _binding(name)
+    if ret is None:
+        raise AttributeError("module %%r has no attribute %%r" %% (__name__, name))
+    return ret
+
+
+'''
+
+LAZY_SUB = '''
+#
+# Subclasses are defined with their binding classes, see supbind
+#
+
+from importlib import import_module
+
+
+def __getattr__(name):
+    module = supermod._MODULES.get(name[:-3]) if name.endswith("Sub") else None
+    ret = getattr(import_module("." + module, __name__), name, None) if module is not None else None
+    if ret is None:
+        raise AttributeError("module %r has no attribute %r" % (__name__, name))
+    return ret
+
+
+if sys.version_info < (3, 7):
+    # module __getattr__ is not supported, all the bindings are imported, once supbind is
+    for _name in sorted(supermod._MODULES):
+        supermod._binding(_name)
+    for _module in sorted(set(supermod._MODULES.values())):
+        globals().update((_name, _value) for _name, _value in vars(import_module("." + _module, __name__)).items()
+                         if _name.endswith("Sub"))
+
+'''
+
+HEADER = '''#!/usr/bin/env python
+
+#
+# Bindings of %s, generated by generateDS.py and split from supbind by src/split_bindings.py
+#
+
+'''
+
+
+def _bound_names(nodes):
+    # names bound at module level, including those of imports and of if and try blocks
+    ret = set()
+    for node in nodes:
+        if isinstance(node, (ast.FunctionDef, ast.ClassDef)):
+            ret.add(node.name)
+        elif isinstance(node, ast.Assign):
+            ret.update(target.id for target in node.targets if isinstance(target, ast.Name))
+        elif isinstance(node, (ast.Import, ast.ImportFrom)):
+            ret.update((alias.asname or alias.name).split(".")[0] for alias in node.names)
+        for block in ("body", "orelse", "finalbody"):
+            if not isinstance(node, (ast.FunctionDef, ast.ClassDef)):
+                ret.update(_bound_names(getattr(node, block, [])))
+        for handler in getattr(node, "handlers", []):
+            ret.update(_bound_names(handler.body))
+    return ret
+
+
+def _outside_functions(node):
+    yield node
+    for child in ast.iter_child_nodes(node):
+        if not isinstance(child, ast.FunctionDef):
+            for descendant in _outside_functions(child):
+                yield descendant
+
+
+def _parse(source):
+    # Python 2 does not parse unicode sources with an encoding declaration
+    if not isinstance(source, str):
+        source = source.encode("utf-8")
+    return ast.parse(source)
+
+
+def _argument_name(arg):
+    # ast.arg since Python 3, Name for the arguments and str for *args and **kwargs in Python 2
+    if isinstance(arg, ast.Name):
+        return arg.id
+    return getattr(arg, "arg", arg)
+
+
+def _loaded_names(node):
+    # global names read by the code of a node, the arguments and local variables of functions excluded
+    ret = set(name.id for name in _outside_functions(node) if isinstance(name, ast.Name)
+              and isinstance(name.ctx, ast.Load))
+    for function in ast.walk(node):
+        if not isinstance(function, ast.FunctionDef):
+            continue
+        local = set(_argument_name(arg) for arg in function.args.args + getattr(function.args, "kwonlyargs", []))
+        local.update(_argument_name(arg) for arg in (function.args.vararg, function.args.kwarg) if arg is not None)
+        local.update(name.id for name in ast.walk(function) if isinstance(name, ast.Name)
+                     and isinstance(name.ctx, ast.Store))
+        ret.update(name.id for name in ast.walk(function) if isinstance(name, ast.Name)
+                   and isinstance(name.ctx, ast.Load) and name.id not in local)
+    return ret
+
+
+def _segments(source):
+    # source lines of each top level statement, up to the next one, comments after a class are kept with it
+    lines = source.splitlines(True)
+    nodes = _parse(source).body
+    ret = []
+    for i, node in enumerate(nodes):
+        end = nodes[i + 1].lineno - 1 if i + 1 < len(nodes) else len(lines)
+        ret.append((node, "".join(lines[node.lineno - 1:end])))
+    return "".join(lines[:nodes[0].lineno - 1]), ret
+
+
+def _split_segments(segments, selected):
+    # the statements before, the selected statements and those after, the selected ones must be contiguous
+    indexes = [i for i, (node, text) in enumerate(segments) if selected(node)]
+    if indexes != list(range(indexes[0], indexes[-1] + 1)):
+        raise ValueError("binding classes are not contiguous")
+    return segments[:indexes[0]], segments[indexes[0]:indexes[-1] + 1], segments[indexes[-1] + 1:]
+
+
+def _is_registration(node):
+    return isinstance(node, ast.Assign) and isinstance(node.targets[0], ast.Attribute) and \
+        node.targets[0].attr == "subclass" and isinstance(node.targets[0].value, ast.Attribute)
+
+
+def _components(classes, references):
+    # binding classes referring to each other, directly or not, go in the same module
+    parent = dict((name, name) for name in classes)
+
+    def find(name):
+        while parent[name] != name:
+            parent[name] = parent[parent[name]]
+            name = parent[name]
+        return name
+
+    for name in classes:
+        for other in references[name]:
+            parent[find(other)] = find(name)
+    components = {}
+    for name in classes:
+        components.setdefault(find(name), []).append(name)
+    return sorted(components.values(), key=lambda component: classes.index(component[0]))
+
+
+def _module_name(component):
+    # named after its shortest element, e.g. vm for VM_POOL and VM
+    elements = [name for name in component if not ANONYMOUS_TYPE.search(name)] or component
+    return min(elements, key=lambda name: (len(name), name)).lower()
+
+
+def split(super_source, sub_source):
+    '''
+    Splits the generated bindings into one module per top level element
+    :param super_source: source of the super module, supbind
+    :param sub_source: source of the subclass module, the package __init__
+    :return: new super module source, new subclass module source and the source of each element module by name.
+             None if the bindings are already split.
+    '''
+    super_head, super_segments = _segments(super_source)
+    classes = []
+    for node, text in super_segments:
+        if isinstance(node, ast.ClassDef) and any(isinstance(base, ast.Name) and
+                                                  (base.id in BINDING_BASES or base.id in classes)
+                                                  for base in node.bases):
+            classes.append(node.name)
+    if not classes:
+        return None
+    before, bindings, after = _split_segments(super_segments, lambda node: getattr(node, "name", None) in classes)
+    base_nodes = [node for node, text in before]
+    imports = [(node, text) for node, text in before[:next(i for i, (node, text) in enumerate(before)
+                                                            if not isinstance(node, (ast.Import, ast.ImportFrom) +
+                                                                              TRY_NODES))]]
+    shared = _bound_names(base_nodes) - _bound_names([node for node, text in imports])
+
+    sub_head, sub_segments = _segments(sub_source)
+    subclasses = {}
+    for node, text in sub_segments:
+        if isinstance(node, ast.ClassDef) and node.name.endswith("Sub") and node.name[:-3] in classes:
+            subclasses[node.name[:-3]] = text
+        elif _is_registration(node) and node.targets[0].value.attr in subclasses:
+            # supermod.VM.subclass = VMSub
+            subclasses[node.targets[0].value.attr] += text
+    sub_before, sub_classes, sub_after = _split_segments(
+        sub_segments, lambda node: isinstance(node, ast.ClassDef) and node.name[:-3] in subclasses or
+        _is_registration(node))
+    bound = _bound_names([node for node, text in imports])
+    sub_imports = []
+    for node, text in sub_before:
+        if isinstance(node, (ast.Import, ast.ImportFrom)) and not _bound_names([node]).issubset(bound):
+            sub_imports.append(text)
+            bound.update(_bound_names([node]))
+
+    references = {}
+    for node, text in bindings:
+        references[node.name] = _loaded_names(node).intersection(classes).difference([node.name])
+    texts = dict((node.name, text) for node, text in bindings)
+
+    modules = {}
+    names = {}
+    for component in _components(classes, references):
+        name = _module_name(component)
+        elements = [element for element in component if not ANONYMOUS_TYPE.search(element)] or component
+        local = re.compile(r"\bsupermod\.(%s)\b" % "|".join(component))
+        body = "".join(texts[cls] for cls in component)
+        body = re.sub(r"\bCurrentSubclassModule_\b", "supermod.CurrentSubclassModule_", body)
+        body += "".join(local.sub(r"\1", subclasses[cls]) for cls in component if cls in subclasses)
+        used = set()
+        for node in _parse(body).body:
+            used.update(_loaded_names(node))
+        used = sorted(used.intersection(shared).difference(["CurrentSubclassModule_"]))
+        module_imports = [text.strip() + "\n" for node, text in imports] + [text.strip() + "\n" for text in sub_imports]
+        module_imports.append("from .supbind import (\n%s)\n" % "".join("    %s,\n" % shared for shared in used))
+        modules[name] = HEADER % ", ".join(elements) + "".join(module_imports) + "\n\n" + body
+        names.update((cls, name) for cls in component)
+
+    tail = "".join(text for node, text in after)
+    tail = tail.replace("globals().get(tag)", "_binding(tag)")
+    tail = re.sub(r"\brootClass = (%s)$" % "|".join(classes), r"rootClass = _binding('\1')", tail, flags=re.M)
+    unresolved = set()
+    for node in _parse(tail).body:
+        unresolved.update(_loaded_names(node).intersection(classes))
+    if unresolved:
+        raise ValueError("the super module refers to %s" % ", ".join(sorted(unresolved)))
+    lazy = LAZY_SUPER % "".join('    "%s": "%s",\n' % (cls, names[cls]) for cls in sorted(classes))
+    super_module = super_head + "".join(text for node, text in before) + lazy + "\n" + tail
+    sub_module = (sub_head + "".join(text for node, text in sub_before) + LAZY_SUB + "\n" +
+                  "".join(text for node, text in sub_after))
+    return super_module, sub_module, modules
+
+
+def main(directory):
+    with io.open(os.path.join(directory, "supbind.py"), encoding="utf-8") as f:
+        super_source = f.read()
+    with io.open(os.path.join(directory, "__init__.py"), encoding="utf-8") as f:
+        sub_source = f.read()
+    ret = split(super_source, sub_source)
+    if ret is None:
+        return
+    super_module, sub_module, modules = ret
+    for name, source in sorted(modules.items()):
+        with io.open(os.path.join(directory, name + ".py"), "w", encoding="utf-8") as f:
+            f.write(source)
+    with io.open(os.path.join(directory, "supbind.py"), "w", encoding="utf-8") as f:
+        f.write(super_module)
+    with io.open(os.path.join(directory, "__init__.py"), "w", encoding="utf-8") as f:
+        f.write(sub_module)
+
+
+if __name__ == "__main__":
+    main(sys.argv[1])
@@ -0,0 +1,51 @@
+# Copyright 2018 www.privaz.io Valletech AB
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+# Coroutines of the asyncio client tests, imported by test_aio on Python 3.5 or newer only
+
+import asyncio
+from pyone.aio import AsyncOneServer
+
+SESSION = "oneadmin:onepass"
+
+
+async def vm_info(endpoint, vmid, **kwargs):
+    async with AsyncOneServer(endpoint, session=SESSION, **kwargs) as one:
+        return await one.vm.info(vmid)
+
+
+async def vm_infos(endpoint, vmids, **kwargs):
+    async with AsyncOneServer(endpoint, session=SESSION, **kwargs) as one:
+        return await asyncio.gather(*[one.vm.info(vmid) for vmid in vmids])
+
+
+async def invalid_call(endpoint):
+    async with AsyncOneServer(endpoint, session=SESSION) as one:
+        await one.invalid.api.call()
+
+
+async def marketapp_export(endpoint, appid):
+    async with AsyncOneServer(endpoint, session=SESSION) as one:
+        return await one.marketapp.export(appid)
+
+
+async def vm_info_timeouts(endpoint, vmid, timeout, override):
+    # whether a call times out with the server timeout, and the result of the same call with its own timeout
+    async with AsyncOneServer(endpoint, session=SESSION, timeout=timeout) as one:
+        try:
+            await one.vm.info(vmid, 0.5)
+            timed_out = False
+        except asyncio.TimeoutError:
+            timed_out = True
+        return timed_out, await one.vm.info(vmid, 0.5, _timeout=override)
@@ -0,0 +1,89 @@
+# Copyright 2018 www.privaz.io Valletech AB
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+# A minimal, in process, XML-RPC server answering like OpenNebula does.
+# Used by tests that need to exercise the HTTP transport rather than the fixtures.
+
+import socket
+import threading
+from six.moves.socketserver import ThreadingMixIn
+from six.moves.xmlrpc_server import SimpleXMLRPCServer, SimpleXMLRPCRequestHandler
+
+
+class KeepAliveRequestHandler(SimpleXMLRPCRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, format, *args):
+        pass
+
+
+class ThreadedXMLRPCServer(ThreadingMixIn, SimpleXMLRPCServer):
+    daemon_threads = True
+
+
+class FakeOned(object):
+    '''
+    Runs an XML-RPC server in a background thread.
+    Methods are registered with their full name, e.g. "one.vm.info", and should
+    return the OpenNebula [success, value, code] response.
+    '''
+
+    def __init__(self, multicall=False):
+        self.server = ThreadedXMLRPCServer(("127.0.0.1", 0), requestHandler=KeepAliveRequestHandler,
+                                           logRequests=False, allow_none=True)
+        if multicall:
+            self.server.register_multicall_functions()
+        self.connections = 0
+        self.calls = []
+        self._lock = threading.Lock()
+        # accepted connections, kept alive by the clients
+        self._sockets = []
+        server = self
+
+        class CountingHandler(KeepAliveRequestHandler):
+            def setup(self):
+                with server._lock:
+                    server.connections += 1
+                    server._sockets.append(self.request)
+                KeepAliveRequestHandler.setup(self)
+
+        self.server.RequestHandlerClass = CountingHandler
+        self.thread = threading.Thread(target=self.server.serve_forever, args=(0.05,))
+        self.thread.daemon = True
+
+    @property
+    def endpoint(self):
+        return "http://127.0.0.1:%d/RPC2" % self.server.server_address[1]
+
+    def register(self, name, function):
+        def recorder(*params):
+            with self._lock:
+                self.calls.append((name, params))
+            return function(*params)
+        self.server.register_function(recorder, name)
+
+    def start(self):
+        self.thread.start()
+        return self
+
+    def stop(self):
+        self.server.shutdown()
+        self.server.server_close()
+        # ends the handler threads waiting on kept alive connections, before the interpreter exits
+        with self._lock:
+            for sock in self._sockets:
+                try:
+                    sock.shutdown(socket.SHUT_RDWR)
+                except socket.error:
+                    pass
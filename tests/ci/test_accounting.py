@@ -0,0 +1,102 @@
+# Copyright 2018 www.privaz.io Valletech AB
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import unittest
+from io import BytesIO
+from lxml import etree
+from pyone import accounting
+from pyone.accounting import AccountingAggregator, aggregate_accounting
+
+HOUR = 3600
+
+
+def record(oid, uid, gid, hid, stime, etime, rstime=None, retime=None, cpu="1", memory=1024, disks=(10,)):
+    rstime = stime if rstime is None else rstime
+    retime = etime if retime is None else retime
+    disks = "".join("<DISK><SIZE>%d</SIZE></DISK>" % size for size in disks)
+    return "<HISTORY><OID>%d</OID><SEQ>0</SEQ><HOSTNAME>host%d</HOSTNAME><HID>%d</HID>" \
+           "<STIME>%d</STIME><ETIME>%d</ETIME><RSTIME>%d</RSTIME><RETIME>%d</RETIME><UID>0</UID><GID>0</GID>" \
+           "<VM><ID>%d</ID><UID>%d</UID><GID>%d</GID><TEMPLATE><CPU>%s</CPU><MEMORY>%d</MEMORY>%s</TEMPLATE>" \
+           "<HISTORY_RECORDS><HISTORY><OID>%d</OID><HID>99</HID></HISTORY></HISTORY_RECORDS></VM></HISTORY>" % \
+           (oid, hid, hid, stime, etime, rstime, retime, oid, uid, gid, cpu, memory, disks, oid)
+
+
+def records(*history):
+    return "<HISTORY_RECORDS>%s</HISTORY_RECORDS>" % "".join(history)
+
+
+DOCUMENT = records(record(1, 5, 1, 0, HOUR, 3 * HOUR),
+                   record(2, 6, 1, 1, 2 * HOUR, 0, retime=0, cpu="0.5", disks=(10, 30)),
+                   # powered off, disks are accounted but not CPU or memory
+                   record(3, 5, 2, 1, 2 * HOUR, 3 * HOUR, rstime=0, retime=0))
+
+
+class AccountingTests(unittest.TestCase):
+
+    def test_per_user(self):
+        usage = aggregate_accounting(DOCUMENT, now=4 * HOUR)
+        self.assertEqual(sorted(usage), [(5,), (6,)])
+        self.assertEqual(usage[(5,)], {"CPU_HOURS": 2.0, "MEMORY_HOURS": 2048.0, "DISK_HOURS": 30.0,
+                                       "HOURS": 2.0, "RECORDS": 2})
+        # still running at now
+        self.assertEqual(usage[(6,)]["CPU_HOURS"], 1.0)
+        self.assertEqual(usage[(6,)]["DISK_HOURS"], 80.0)
+
+    def test_groups(self):
+        usage = aggregate_accounting(DOCUMENT, by=("GID", "HOSTNAME"), now=4 * HOUR)
+        self.assertEqual(sorted(usage), [(1, "host0"), (1, "host1"), (2, "host1")])
+        self.assertEqual(aggregate_accounting(DOCUMENT, by=("VM",), now=4 * HOUR)[(3,)]["HOURS"], 0.0)
+
+    def test_period_and_windows(self):
+        usage = aggregate_accounting(DOCUMENT, by=("HID",), start=2 * HOUR, end=4 * HOUR, window=HOUR,
+                                     now=10 * HOUR)
+        self.assertEqual(sorted(usage), [(0, 2 * HOUR), (1, 2 * HOUR), (1, 3 * HOUR)])
+        self.assertEqual(usage[(0, 2 * HOUR)]["CPU_HOURS"], 1.0)
+        self.assertEqual(usage[(1, 3 * HOUR)]["CPU_HOURS"], 0.5)
+        self.assertEqual(usage[(1, 2 * HOUR)]["RECORDS"], 2)
+        self.assertEqual(usage[(1, 3 * HOUR)]["RECORDS"], 0)
+
+    def test_sources(self):
+        expected = aggregate_accounting(DOCUMENT, now=4 * HOUR)
+        self.assertEqual(aggregate_accounting(BytesIO(DOCUMENT.encode("utf-8")), now=4 * HOUR), expected)
+        self.assertEqual(aggregate_accounting(etree.fromstring(DOCUMENT), now=4 * HOUR), expected)
+        self.assertEqual(aggregate_accounting([DOCUMENT, records()], now=4 * HOUR), expected)
+        namespaced = DOCUMENT.replace("<HISTORY_RECORDS>", '<HISTORY_RECORDS xmlns="http://opennebula.org/XMLSchema">', 1)
+        self.assertEqual(aggregate_accounting(namespaced, now=4 * HOUR), expected)
+
+    def test_incremental(self):
+        aggregator = AccountingAggregator(now=4 * HOUR)
+        self.assertEqual(aggregator.add(records(record(1, 5, 1, 0, HOUR, 3 * HOUR))), 1)
+        self.assertEqual(aggregator.add(records(record(4, 5, 1, 0, HOUR, 2 * HOUR))), 1)
+        self.assertEqual(aggregator.results()[(5,)]["HOURS"], 3.0)
+
+    def test_columns(self):
+        numpy = accounting.numpy
+        try:
+            for module in (None, numpy):
+                accounting.numpy = module
+                aggregator = AccountingAggregator(by=("UID", "HOSTNAME"), now=4 * HOUR)
+                aggregator.add(DOCUMENT)
+                columns = aggregator.columns()
+                self.assertEqual(list(columns), ["UID", "HOSTNAME", "CPU_HOURS", "MEMORY_HOURS", "DISK_HOURS",
+                                                 "HOURS", "RECORDS"])
+                self.assertEqual(list(columns["UID"]), [5, 5, 6])
+                self.assertEqual(columns["HOSTNAME"], ["host0", "host1", "host1"])
+                self.assertEqual(list(columns["CPU_HOURS"]), [2.0, 0.0, 1.0])
+        finally:
+            accounting.numpy = numpy
+
+    def test_unknown_key(self):
+        with self.assertRaises(ValueError):
+            AccountingAggregator(by=("TEMPLATE",))
@@ -0,0 +1,123 @@
+# Copyright 2018 www.privaz.io Valletech AB
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import unittest
+from os import path
+from pyone import bindings, AddressIndex, OneException
+from pyone.addresses import Address
+
+testData = path.join(path.dirname(path.abspath(__file__)), "test_issue_006_data")
+
+
+def read(name):
+    with open(path.join(testData, name), "rb") as f:
+        return bindings.parseString(f.read())
+
+
+def vnet(id, ip, mac, size, leases=()):
+    lease = "".join("<LEASE><IP>%s</IP><MAC>%s</MAC><VM>%d</VM></LEASE>" % lease for lease in leases)
+    return bindings.parseString((
+        "<VNET><ID>%d</ID><NAME>net%d</NAME><AR_POOL><AR><AR_ID>0</AR_ID><IP>%s</IP><MAC>%s</MAC>"
+        "<SIZE>%d</SIZE><TYPE>IP4</TYPE><USED_LEASES>%d</USED_LEASES><LEASES>%s</LEASES></AR></AR_POOL>"
+        "</VNET>" % (id, id, ip, mac, size, len(leases), lease)).encode("utf-8"))
+
+
+class AddressIndexTests(unittest.TestCase):
+
+    def setUp(self):
+        self.index = AddressIndex()
+        self.assertEqual(self.index.update(read("vnet_02.xml")), 1)
+
+    def test_lookup_lease(self):
+        address = self.index.lookup_ip("10.156.16.198")
+        self.assertEqual(address, Address(444, 2, "10.156.16.198", "02:00:0a:9c:10:c6", 3086, None))
+        self.assertEqual(self.index.lookup_mac("02:00:0a:9c:10:c6"), address)
+        # held addresses
+        self.assertEqual(self.index.lookup_ip("10.156.17.220").vm, -1)
+
+    def test_lookup_free(self):
+        address = self.index.lookup_ip("10.156.67.250")
+        self.assertEqual(address, Address(444, 5, "10.156.67.250", "02:00:0a:9c:43:fa", None, None))
+        self.assertEqual(self.index.lookup_mac("02:00:0a:9c:43:fa"), address)
+        self.assertIsNone(self.index.lookup_ip("10.156.67.254"))
+        self.assertIsNone(self.index.lookup_ip("10.156.67.128"))
+        self.assertIsNone(self.index.lookup_ip("10.156.67.250", vnet=1))
+        with self.assertRaises(OneException):
+            self.index.lookup_ip("10.156.67")
+
+    def test_free_addresses(self):
+        free = self.index.free_addresses(444, 3)
+        self.assertEqual([address.ip for address in free], ["10.156.67.209", "10.156.67.210", "10.156.67.211"])
+        self.assertEqual(len(self.index.free_addresses(444, 1000)), 299 - 255)
+        self.assertEqual(self.index.free_addresses(444, 10, ar=0), [])
+        self.assertEqual(len(self.index.leases(444)), 255)
+        # the same as walking every address of the ranges
+        leased = set(address.mac for address in self.index.leases(444))
+        walked = [address for address_range in self.index._vnets[444]
+                  for address in map(address_range.address, range(address_range.size)) if address.mac not in leased]
+        self.assertEqual(self.index.free_addresses(444, 1000), walked)
+        self.assertEqual(self.index.free_addresses(444, 50), walked[:50])
+        with self.assertRaises(OneException):
+            self.index.free_addresses(1)
+
+    def test_ethernet(self):
+        self.index.update(read("vnet_01.xml"))
+        self.assertEqual(self.index.free_addresses(11, 1), [Address(11, 0, None, "02:00:93:99:6a:9f", None, None)])
+        self.assertEqual(self.index.lookup_mac("02:00:93:99:6b:9c").vnet, 11)
+
+    def test_overlapping_networks(self):
+        self.index.update([vnet(1, "10.0.0.1", "02:00:00:00:00:01", 10, [("10.0.0.5", "02:00:00:00:00:05", 7)]),
+                           vnet(2, "10.0.0.4", "02:00:01:00:00:04", 10, [("10.0.0.6", "02:00:01:00:00:06", 8)])])
+        self.assertEqual(self.index.lookup_ip("10.0.0.5").vm, 7)
+        self.assertEqual(self.index.lookup_ip("10.0.0.5", vnet=2), Address(2, 0, "10.0.0.5", "02:00:01:00:00:05",
+                                                                           None, None))
+        self.assertEqual(self.index.lookup_ip("10.0.0.6").vm, 8)
+        self.assertEqual(self.index.lookup_ip("10.0.0.2").vnet, 1)
+        self.assertEqual(self.index.lookup_ip("10.0.0.13").vnet, 2)
+
+    def test_nested_networks(self):
+        # a large range holding smaller ones, and a range sharing its first address
+        self.index.update([vnet(1, "10.0.0.1", "02:00:00:00:00:01", 1000)] +
+                          [vnet(id, "10.0.%d.1" % id, "02:00:00:00:%02x:01" % id, 10) for id in range(2, 4)] +
+                          [vnet(4, "10.0.0.1", "02:00:00:00:00:01", 2)])
+        self.assertEqual(self.index.lookup_ip("10.0.2.5").vnet, 1)
+        self.assertEqual(self.index.lookup_ip("10.0.2.5", vnet=2).mac, "02:00:00:00:02:05")
+        self.assertIsNone(self.index.lookup_ip("10.0.2.11", vnet=2))
+        self.assertEqual(self.index.lookup_ip("10.0.3.200").vnet, 1)
+        self.assertEqual(self.index.lookup_ip("10.0.0.2", vnet=4).vnet, 4)
+        self.assertIsNone(self.index.lookup_ip("10.0.0.3", vnet=4))
+        self.assertEqual(self.index.lookup_mac("02:00:00:00:03:0a", vnet=3).ip, "10.0.3.10")
+        self.assertIsNone(self.index.lookup_ip("10.0.3.233"))
+
+    def test_incremental_update(self):
+        self.index.update(vnet(1, "10.0.0.1", "02:00:00:00:00:01", 4, [("10.0.0.1", "02:00:00:00:00:01", 7)]))
+        self.assertEqual(self.index.free_addresses(1, 1)[0].ip, "10.0.0.2")
+        self.index.update(vnet(1, "10.0.0.1", "02:00:00:00:00:01", 4, [("10.0.0.2", "02:00:00:00:00:02", 8)]))
+        self.assertEqual(self.index.lookup_ip("10.0.0.1").vm, None)
+        self.assertEqual(self.index.lookup_ip("10.0.0.2").vm, 8)
+        self.assertEqual(self.index.free_addresses(1, 1)[0].ip, "10.0.0.1")
+        self.assertTrue(self.index.remove(1))
+        self.assertFalse(self.index.remove(1))
+        self.assertIsNone(self.index.lookup_ip("10.0.0.2"))
+        self.assertEqual(len(self.index), 1)
+
+    def test_pool(self):
+        pool = bindings.parseString(
+            b"<VNET_POOL><VNET><ID>3</ID><NAME>pool</NAME><AR_POOL><AR><AR_ID>0</AR_ID><IP>192.168.0.1</IP>"
+            b"<MAC>02:00:c0:a8:00:01</MAC><SIZE>8</SIZE><TYPE>IP4</TYPE></AR></AR_POOL></VNET></VNET_POOL>")
+        self.assertEqual(self.index.update(pool), 1)
+        self.assertEqual(self.index.lookup_ip("192.168.0.8").mac, "02:00:c0:a8:00:08")
+        # pool responses do not include the leases
+        with self.assertRaises(OneException):
+            self.index.free_addresses(3)
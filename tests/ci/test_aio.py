@@ -0,0 +1,92 @@
+# Copyright 2018 www.privaz.io Valletech AB
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import sys
+import unittest
+from base64 import b64encode
+from pyone import OneNoExistsException, OneException
+
+ASYNCIO = sys.version_info >= (3, 5)
+
+if ASYNCIO:
+    # the coroutines are in their own module, async is not valid syntax before Python 3.5
+    import asyncio
+    from . import aio_calls
+    from .oned import FakeOned
+
+
+def vm_info(session, vmid):
+    if vmid < 0:
+        return [False, "[one.vm.info] Error getting virtual machine [%d]." % vmid, 0x0400]
+    return [True, "<VM><ID>%d</ID><NAME>vm-%d</NAME></VM>" % (vmid, vmid), 0]
+
+
+def datastorepool_info(session):
+    return [True, "<DATASTORE_POOL><DATASTORE><ID>0</ID><NAME>system</NAME></DATASTORE>"
+                  "<DATASTORE><ID>1</ID><NAME>default</NAME></DATASTORE></DATASTORE_POOL>", 0]
+
+
+def marketapp_info(session, appid):
+    return [True, "<MARKETPLACEAPP><ID>%d</ID><NAME>alpine</NAME><STATE>1</STATE><TYPE>1</TYPE>"
+                  "<APPTEMPLATE64>%s</APPTEMPLATE64><TEMPLATE></TEMPLATE></MARKETPLACEAPP>"
+            % (appid, b64encode(b'PATH="http://market/alpine"').decode()), 0]
+
+
+@unittest.skipUnless(ASYNCIO, "the asyncio client requires Python 3.5")
+class AsyncOneServerTests(unittest.TestCase):
+
+    def setUp(self):
+        self.oned = FakeOned()
+        self.oned.register("one.vm.info", vm_info)
+        self.oned.register("one.datastorepool.info", datastorepool_info)
+        self.oned.register("one.marketapp.info", marketapp_info)
+        self.oned.register("one.image.allocate", lambda session, templ, dsid: [True, 42, 0])
+        self.oned.start()
+
+    def tearDown(self):
+        self.oned.stop()
+
+    def run_async(self, coro):
+        loop = asyncio.new_event_loop()
+        try:
+            return loop.run_until_complete(coro)
+        finally:
+            loop.close()
+
+    def test_vm_info(self):
+        vm = self.run_async(aio_calls.vm_info(self.oned.endpoint, 7))
+        self.assertEqual(vm.ID, 7)
+        self.assertEqual(vm.NAME, "vm-7")
+        self.assertEqual(self.oned.calls[0], ("one.vm.info", ("oneadmin:onepass", 7)))
+
+    def test_concurrent_calls(self):
+        vms = self.run_async(aio_calls.vm_infos(self.oned.endpoint, range(40), max_concurrency=4))
+        self.assertEqual([vm.ID for vm in vms], list(range(40)))
+        self.assertLessEqual(self.oned.connections, 4)
+
+    def test_error_mapping(self):
+        with self.assertRaises(OneNoExistsException):
+            self.run_async(aio_calls.vm_info(self.oned.endpoint, -1))
+
+    def test_invalid_method(self):
+        with self.assertRaises(OneException):
+            self.run_async(aio_calls.invalid_call(self.oned.endpoint))
+
+    def test_helper(self):
+        ret = self.run_async(aio_calls.marketapp_export(self.oned.endpoint, 6))
+        self.assertEqual(ret, {"image": 42, "vmtemplate": -1})
+        name, params = self.oned.calls[-1]
+        self.assertEqual(name, "one.image.allocate")
+        self.assertIn('NAME="alpine"', params[1])
+        self.assertEqual(params[2], 1)
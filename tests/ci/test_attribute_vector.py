@@ -13,7 +13,14 @@
 # limitations under the License.
 
 import unittest
+from collections import OrderedDict
+from os import path
+from lxml import etree
 import pyone
+from pyone.util import child2dict
+
+data_dir = path.join(path.dirname(path.abspath(__file__)), 'test_issue_006_data')
+
 
 class AttributeVectorTests(unittest.TestCase):
     def test_dict_to_attr(self):
@@ -22,3 +29,38 @@ class AttributeVectorTests(unittest.TestCase):
             'MEMORY': '1024',
             }
         self.assertIn(pyone.util.cast2one(atts), ['''NAME="abc"\nMEMORY="1024"\n''', '''MEMORY="1024"\nNAME="abc"\n'''])
+
+    def test_escaping(self):
+        atts = OrderedDict([('NAME', 'say "hi"'), ('EMPTY', None), ('SCRIPT', 'line1\nline2')])
+        self.assertEqual(pyone.util.cast2one(atts), u'NAME="say \\"hi\\""\nEMPTY=""\nSCRIPT="line1\nline2"\n')
+
+    def test_vectors(self):
+        atts = OrderedDict([('NAME', 'vm'),
+                            ('DISK', [OrderedDict([('IMAGE_ID', 1), ('SIZE', '10')]), OrderedDict([('IMAGE_ID', 2)])]),
+                            ('CONTEXT', OrderedDict([('NETWORK', 'YES')])),
+                            ('LABELS', ['a', 'b'])])
+        self.assertEqual(pyone.util.cast2one(atts), u'NAME="vm"\n'
+                                                    u'DISK=[\n  IMAGE_ID="1",\n  SIZE="10" ]\n'
+                                                    u'DISK=[\n  IMAGE_ID="2" ]\n'
+                                                    u'CONTEXT=[\n  NETWORK="YES" ]\n'
+                                                    u'LABELS="a"\nLABELS="b"\n')
+        with self.assertRaises(ValueError):
+            pyone.util.dict2template({'NIC': {'ALIAS': {'IP': '1'}}})
+
+    def test_xml(self):
+        template = OrderedDict([('TEMPLATE', OrderedDict([
+            ('NAME', 'a<b&c'), ('EMPTY', None), ('ENABLED', True), ('CPU', 0.5), ('END', 'x]]>y'),
+            ('DISK', [OrderedDict([('IMAGE_ID', '1')]), OrderedDict([('IMAGE_ID', '2')])]),
+            ('GRAPHICS', OrderedDict([('@TYPE', 'vnc'), ('#text', 'x')]))]))])
+        self.assertEqual(pyone.util.cast2one(template),
+                         u'<TEMPLATE><NAME><![CDATA[a<b&c]]></NAME><EMPTY></EMPTY><ENABLED>true</ENABLED>'
+                         u'<CPU><![CDATA[0.5]]></CPU><END>x]]&gt;y</END>'
+                         u'<DISK><IMAGE_ID><![CDATA[1]]></IMAGE_ID></DISK>'
+                         u'<DISK><IMAGE_ID><![CDATA[2]]></IMAGE_ID></DISK>'
+                         u'<GRAPHICS TYPE="vnc"><![CDATA[x]]></GRAPHICS></TEMPLATE>')
+
+    def test_xml_round_trip(self):
+        with open(path.join(data_dir, 'vm_01.xml'), 'rb') as f:
+            template = etree.fromstring(f.read()).find('{*}TEMPLATE')
+        d = child2dict(template)
+        self.assertEqual(child2dict(etree.fromstring(pyone.util.cast2one(d))), d)
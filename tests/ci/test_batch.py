@@ -0,0 +1,139 @@
+# Copyright 2018 www.privaz.io Valletech AB
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import threading
+import time
+import unittest
+import xmlrpc.client
+from pyone import OneServer, OneException, OneNoExistsException
+from .oned import FakeOned
+
+
+def vm_info(session, vmid):
+    if vmid < 0:
+        return [False, "[one.vm.info] Error getting virtual machine [%d]." % vmid, 0x0400]
+    return [True, "<VM><ID>%d</ID><NAME>vm-%d</NAME></VM>" % (vmid, vmid), 0]
+
+
+def host_info(session, hid):
+    return [True, "<HOST><ID>%d</ID><NAME>host-%d</NAME></HOST>" % (hid, hid), 0]
+
+
+class Concurrency(object):
+
+    def __init__(self, function, delay=0.02):
+        self.function = function
+        self.delay = delay
+        self.lock = threading.Lock()
+        self.running = 0
+        self.max_running = 0
+
+    def __call__(self, *params):
+        with self.lock:
+            self.running += 1
+            self.max_running = max(self.max_running, self.running)
+        time.sleep(self.delay)
+        with self.lock:
+            self.running -= 1
+        return self.function(*params)
+
+
+def too_large(calls):
+    raise xmlrpc.client.Fault(-32500, "request too large")
+
+
+class BatchTests(unittest.TestCase):
+
+    def start(self, multicall):
+        self.oned = FakeOned(multicall=multicall)
+        self.oned.register("one.vm.info", vm_info)
+        self.oned.register("one.host.info", host_info)
+        self.oned.start()
+
+    def tearDown(self):
+        self.oned.stop()
+
+    def check_results(self, one):
+        with one.batch() as b:
+            vm1 = b.vm.info(1)
+            missing = b.vm.info(-1)
+            host = b.host.info(3)
+            invalid = b.invalid.api.call()
+
+        self.assertEqual(vm1.result().NAME, "vm-1")
+        self.assertEqual(host.result().NAME, "host-3")
+        self.assertIsInstance(missing.exception(), OneNoExistsException)
+        with self.assertRaises(OneNoExistsException):
+            missing.result()
+        self.assertIsInstance(invalid.exception(), OneException)
+
+        results = b.results()
+        self.assertEqual(results[0].ID, 1)
+        self.assertIsInstance(results[1], OneNoExistsException)
+
+    def test_multicall(self):
+        self.start(multicall=True)
+        one = OneServer(self.oned.endpoint, session="oneadmin:onepass")
+        self.check_results(one)
+        self.assertEqual([name for name, _ in self.oned.calls], ["one.vm.info", "one.vm.info", "one.host.info"])
+        self.assertTrue(one._multicall)
+
+    def test_fan_out_without_multicall(self):
+        self.start(multicall=False)
+        one = OneServer(self.oned.endpoint, session="oneadmin:onepass", pool_size=4)
+        self.check_results(one)
+        self.assertFalse(one._multicall)
+
+    def test_parallel_fallback_without_pool(self):
+        self.start(multicall=False)
+        counting = Concurrency(vm_info)
+        self.oned.register("one.vm.info", counting)
+        one = OneServer(self.oned.endpoint, session="oneadmin:onepass")
+        batch = one.batch()
+        calls = [batch.vm.info(i) for i in range(8)]
+        batch.execute()
+        self.assertEqual([c.result().ID for c in calls], list(range(8)))
+        self.assertFalse(one._multicall)
+        self.assertGreater(counting.max_running, 1)
+        # the threads closed their connections, the server one is still usable
+        self.assertEqual(one.vm.info(9).ID, 9)
+
+    def test_other_faults_keep_multicall(self):
+        self.start(multicall=False)
+        self.oned.register("system.multicall", too_large)
+        one = OneServer(self.oned.endpoint, session="oneadmin:onepass")
+        self.check_results(one)
+        self.assertTrue(one._multicall)
+        self.assertEqual(self.oned.calls[0][0], "system.multicall")
+
+    def test_chunks(self):
+        self.start(multicall=True)
+        one = OneServer(self.oned.endpoint, session="oneadmin:onepass")
+        batch = one.batch(chunk_size=3)
+        calls = [batch.vm.info(i) for i in range(10)]
+        batch.execute()
+        self.assertEqual([c.result().ID for c in calls], list(range(10)))
+
+    def test_result_before_execution(self):
+        self.start(multicall=True)
+        one = OneServer(self.oned.endpoint, session="oneadmin:onepass")
+        call = one.batch().vm.info(1)
+        with self.assertRaises(OneException):
+            call.result()
+
+    def test_helpers_are_not_batched(self):
+        self.start(multicall=True)
+        one = OneServer(self.oned.endpoint, session="oneadmin:onepass")
+        with self.assertRaises(OneException):
+            one.batch().marketapp.export(1)
@@ -0,0 +1,105 @@
+# Copyright 2018 www.privaz.io Valletech AB
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import threading
+import time
+import unittest
+from pyone import OneServer, OneActionException, OneNoExistsException
+from pyone.batch import RateLimiter
+from .oned import FakeOned
+
+
+class FakeActions(object):
+
+    def __init__(self, delay=0):
+        self.delay = delay
+        self.lock = threading.Lock()
+        self.running = 0
+        self.max_running = 0
+
+    def vm_action(self, session, action, vmid):
+        with self.lock:
+            self.running += 1
+            self.max_running = max(self.max_running, self.running)
+        time.sleep(self.delay)
+        with self.lock:
+            self.running -= 1
+        if vmid % 10 == 3:
+            return [False, "[one.vm.action] Wrong state to perform action", 0x0800]
+        if vmid % 10 == 7:
+            return [False, "[one.vm.action] Error getting virtual machine [%d]." % vmid, 0x0400]
+        return [True, vmid, 0]
+
+
+class BulkTests(unittest.TestCase):
+
+    def setUp(self):
+        self.actions = FakeActions(delay=0.02)
+        self.oned = FakeOned()
+        self.oned.register("one.vm.action", self.actions.vm_action)
+        self.oned.register("one.vm.info", lambda session, vmid: [True, "<VM><ID>%d</ID></VM>" % vmid, 0])
+        self.oned.start()
+
+    def tearDown(self):
+        self.oned.stop()
+
+    def test_concurrent_results(self):
+        one = OneServer(self.oned.endpoint, session="oneadmin:onepass", pool_size=8)
+        result = one.bulk("vm.action", [("poweroff", vmid) for vmid in range(40)], concurrency=8)
+        self.assertEqual(len(result), 40)
+        self.assertEqual(len(result.succeeded()), 32)
+        failed = result.failed()
+        self.assertEqual([call.params[1] for call in failed], [3, 7, 13, 17, 23, 27, 33, 37])
+        self.assertIsInstance(failed[0].exception(), OneActionException)
+        self.assertIsInstance(failed[1].exception(), OneNoExistsException)
+        results = result.results()
+        self.assertEqual(results[0], 0)
+        self.assertIsInstance(results[3], OneActionException)
+        self.assertGreater(self.actions.max_running, 1)
+        self.assertLessEqual(self.actions.max_running, 8)
+
+    def test_sequential_without_pool(self):
+        one = OneServer(self.oned.endpoint, session="oneadmin:onepass")
+        result = one.bulk("vm.info", [1, 2, 3])
+        self.assertEqual([call.result().ID for call in result], [1, 2, 3])
+
+    def test_progress(self):
+        one = OneServer(self.oned.endpoint, session="oneadmin:onepass", pool_size=4)
+        reports = []
+        one.bulk("vm.action", [("resume", vmid) for vmid in range(10)],
+                 progress=lambda done, total, call: reports.append((done, total, call.done)))
+        self.assertEqual(reports, [(done, 10, True) for done in range(1, 11)])
+
+    def test_rate_limit(self):
+        one = OneServer(self.oned.endpoint, session="oneadmin:onepass", pool_size=4)
+        start = time.time()
+        one.bulk("vm.info", range(10), rate=100)
+        self.assertGreaterEqual(time.time() - start, 0.09)
+
+
+class RateLimiterTests(unittest.TestCase):
+
+    def test_spacing(self):
+        limiter = RateLimiter(200)
+        start = time.time()
+        threads = [threading.Thread(target=limiter.wait) for _ in range(11)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        self.assertGreaterEqual(time.time() - start, 0.05 - 0.005)
+
+    def test_invalid_rate(self):
+        with self.assertRaises(ValueError):
+            RateLimiter(0)
@@ -0,0 +1,169 @@
+# Copyright 2018 www.privaz.io Valletech AB
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import time
+import unittest
+from pyone import OneServer, OneNoExistsException
+from pyone.cache import ResponseCache, method_kind
+from .oned import FakeOned
+
+
+def host_info(session, hostid, *args):
+    if hostid > 10:
+        return [False, "[one.host.info] Error getting host [%d]." % hostid, 0x0400]
+    return [True, "<HOST><ID>%d</ID><NAME>host%d</NAME></HOST>" % (hostid, hostid), 0]
+
+
+def hostpool_info(session):
+    return [True, "<HOST_POOL><HOST><ID>0</ID><NAME>host0</NAME></HOST></HOST_POOL>", 0]
+
+
+class CacheTests(unittest.TestCase):
+
+    def setUp(self):
+        self.oned = FakeOned()
+        self.oned.register("one.host.info", host_info)
+        self.oned.register("one.hostpool.info", hostpool_info)
+        self.oned.register("one.host.update", lambda session, hostid, template, type: [True, hostid, 0])
+        self.oned.register("one.vm.info", lambda session, vmid: [True, "<VM><ID>%d</ID></VM>" % vmid, 0])
+        self.oned.start()
+
+    def tearDown(self):
+        self.oned.stop()
+
+    def calls(self, name):
+        return len([call for call in self.oned.calls if call[0] == name])
+
+    def test_not_cached_by_default(self):
+        one = OneServer(self.oned.endpoint, session="oneadmin:onepass")
+        one.host.info(0)
+        one.host.info(0)
+        self.assertEqual(self.calls("one.host.info"), 2)
+        self.assertIsNone(one.server_cache_stats())
+
+    def test_hits(self):
+        one = OneServer(self.oned.endpoint, session="oneadmin:onepass", cache=True)
+        first = one.host.info(0)
+        second = one.host.info(0)
+        one.host.info(1)
+        self.assertEqual(self.calls("one.host.info"), 2)
+        self.assertEqual(second.NAME, "host0")
+        # every call gets its own objects
+        self.assertIsNot(first, second)
+        stats = one.server_cache_stats()
+        self.assertEqual((stats["hits"], stats["misses"], stats["size"]), (1, 2, 2))
+
+    def test_projection_of_cached_response(self):
+        one = OneServer(self.oned.endpoint, session="oneadmin:onepass", cache=True)
+        one.host.info(0)
+        host = one.host.info(0, fields=["ID"])
+        self.assertEqual(self.calls("one.host.info"), 1)
+        self.assertEqual(host.ID, 0)
+        self.assertIsNone(host.NAME)
+
+    def test_expiry(self):
+        one = OneServer(self.oned.endpoint, session="oneadmin:onepass", cache=ResponseCache(ttl=0.1))
+        one.host.info(0)
+        time.sleep(0.2)
+        one.host.info(0)
+        self.assertEqual(self.calls("one.host.info"), 2)
+
+    def test_update_invalidates(self):
+        one = OneServer(self.oned.endpoint, session="oneadmin:onepass", cache=True)
+        one.host.info(0)
+        one.hostpool.info()
+        one.vm.info(1)
+        one.host.update(0, "LABELS=SSD", 1)
+        one.host.info(0)
+        one.hostpool.info()
+        one.vm.info(1)
+        self.assertEqual(self.calls("one.host.info"), 2)
+        self.assertEqual(self.calls("one.hostpool.info"), 2)
+        self.assertEqual(self.calls("one.vm.info"), 1)
+        self.assertEqual(one.server_cache_stats()["invalidations"], 2)
+
+    def test_batch_invalidates(self):
+        one = OneServer(self.oned.endpoint, session="oneadmin:onepass", cache=True)
+        one.host.info(0)
+        with one.batch() as batch:
+            batch.host.update(0, "LABELS=SSD", 1)
+        one.host.info(0)
+        self.assertEqual(self.calls("one.host.info"), 2)
+
+    def test_errors_not_cached(self):
+        one = OneServer(self.oned.endpoint, session="oneadmin:onepass", cache=True)
+        for _ in range(2):
+            with self.assertRaises(OneNoExistsException):
+                one.host.info(20)
+        self.assertEqual(self.calls("one.host.info"), 2)
+
+    def test_method_ttl(self):
+        cache = ResponseCache(ttls={"host.info": 0})
+        one = OneServer(self.oned.endpoint, session="oneadmin:onepass", cache=cache)
+        one.host.info(0)
+        one.host.info(0)
+        one.hostpool.info()
+        one.host.info(0)
+        one.hostpool.info()
+        self.assertEqual(self.calls("one.host.info"), 3)
+        # not cached does not mean changing the host
+        self.assertEqual(self.calls("one.hostpool.info"), 1)
+        self.assertEqual(one.server_cache_stats()["invalidations"], 0)
+
+    def test_shared_and_cleared(self):
+        cache = ResponseCache()
+        one = OneServer(self.oned.endpoint, session="oneadmin:onepass", cache=cache)
+        other = OneServer(self.oned.endpoint, session="oneadmin:onepass", cache=cache)
+        one.host.info(0)
+        other.host.info(0)
+        self.assertEqual(self.calls("one.host.info"), 1)
+        other.server_cache_invalidate()
+        one.host.info(0)
+        self.assertEqual(self.calls("one.host.info"), 2)
+
+
+class ResponseCacheTests(unittest.TestCase):
+
+    def test_method_kind(self):
+        self.assertEqual(method_kind("hostpool.info"), "host")
+        self.assertEqual(method_kind("host.update"), "host")
+        self.assertEqual(method_kind("system.version"), "system")
+
+    def test_lru_eviction(self):
+        cache = ResponseCache(max_size=2)
+        for vmid in range(2):
+            cache.put("vm.info", (vmid,), [True, "<VM/>", 0])
+        # 0 becomes the most recently used
+        self.assertIsNotNone(cache.get("vm.info", (0,)))
+        cache.put("vm.info", (2,), [True, "<VM/>", 0])
+        self.assertIsNotNone(cache.get("vm.info", (0,)))
+        self.assertIsNone(cache.get("vm.info", (1,)))
+        self.assertEqual(cache.stats()["evictions"], 1)
+
+    def test_read_only_calls(self):
+        cache = ResponseCache()
+        cache.put("vmpool.info", (-2, -1, -1, -1), [True, "<VM_POOL/>", 0])
+        for methodname in ("vmpool.infoextended", "vmpool.accounting", "vmpool.showback", "vmpool.monitoring",
+                           "vm.info"):
+            cache.put(methodname, (-2,), [True, "<VM_POOL/>", 0])
+        self.assertIsNotNone(cache.get("vmpool.info", (-2, -1, -1, -1)))
+        self.assertEqual(cache.stats()["size"], 6)
+        cache.put("vmpool.calculateshowback", (1, 2018, 12, 2018), [True, "", 0])
+        self.assertEqual(cache.stats()["size"], 0)
+
+    def test_failures_not_stored(self):
+        cache = ResponseCache()
+        cache.put("vm.info", (0,), [False, "error", 0x400])
+        cache.put("vm.info", (1,), None)
+        self.assertEqual(cache.stats()["size"], 0)
@@ -0,0 +1,137 @@
+# Copyright 2018 www.privaz.io Valletech AB
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import unittest
+from os import path
+from pyone import bindings, CapacityIndex, OneException, HOST_STATES
+from pyone.capacity import requirements
+
+testData = path.join(path.dirname(path.abspath(__file__)), "test_issue_006_data")
+
+
+def host(id, cpu_usage, mem_usage, cluster=0, state=2, datastores=()):
+    ds = "".join("<DS><ID>%d</ID><FREE_MB>%d</FREE_MB></DS>" % datastore for datastore in datastores)
+    return "<HOST><ID>%d</ID><NAME>node%d</NAME><STATE>%d</STATE><CLUSTER_ID>%d</CLUSTER_ID>" \
+           "<HOST_SHARE><MEM_USAGE>%d</MEM_USAGE><CPU_USAGE>%d</CPU_USAGE><MAX_MEM>8388608</MAX_MEM>" \
+           "<MAX_CPU>800</MAX_CPU><RUNNING_VMS>1</RUNNING_VMS><DATASTORES>%s</DATASTORES></HOST_SHARE>" \
+           "</HOST>" % (id, id, state, cluster, mem_usage, cpu_usage, ds)
+
+
+def host_pool(*hosts):
+    return bindings.parseString(("<HOST_POOL>%s</HOST_POOL>" % "".join(hosts)).encode("utf-8"))
+
+
+def datastore(id, free, clusters, type=1):
+    return bindings.parseString(("<DATASTORE><ID>%d</ID><TYPE>%d</TYPE><CLUSTERS>%s</CLUSTERS><FREE_MB>%d</FREE_MB>"
+                                 "</DATASTORE>" % (id, type, "".join("<ID>%d</ID>" % cluster for cluster in clusters),
+                                                   free)).encode("utf-8"))
+
+
+GB = 1024 * 1024
+
+
+class CapacityIndexTests(unittest.TestCase):
+
+    def setUp(self):
+        self.index = CapacityIndex()
+        self.assertEqual(self.index.update(host_pool(host(0, 100, 1 * GB), host(1, 600, 2 * GB),
+                                                     host(2, 300, 7 * GB, cluster=1),
+                                                     host(3, 0, 0, state=HOST_STATES.DISABLED),
+                                                     host(4, 400, 4 * GB, datastores=[(0, 100)]))), 5)
+
+    def ids(self, hosts):
+        return [capacity.id for capacity in hosts]
+
+    def test_fit(self):
+        self.assertEqual(self.ids(self.index.fit(cpu=200, memory=2 * GB, k=5)), [0, 4, 1])
+        self.assertEqual(self.ids(self.index.fit(cpu=200, memory=2 * GB, k=2, packing=True)), [1, 4])
+        self.assertEqual(self.ids(self.index.fit(cpu=100, k=5, rank="FREE_MEMORY")), [0, 1, 4, 2])
+        self.assertEqual(self.ids(self.index.fit(cpu=100, k=5, clusters=[1])), [2])
+        self.assertEqual(self.ids(self.index.fit(cpu=100, k=5, clusters=[1, 2])), [2])
+        self.assertEqual(self.index.fit(cpu=800), [])
+        self.assertEqual(self.ids(self.index.fit(cpu=800, states=[HOST_STATES.DISABLED])), [3])
+        with self.assertRaises(OneException):
+            self.index.fit(rank="RUNNING_VMS")
+
+    def test_template(self):
+        template = {"CPU": "1.5", "MEMORY": "2048", "DISK": [{"IMAGE_ID": "0", "SIZE": "200"}, {"SIZE": "50"}]}
+        self.assertEqual(requirements(template), (150, 2 * GB, 250))
+        # the local datastore of node4 is too small
+        self.assertEqual(self.ids(self.index.fit(template, k=5)), [0, 1])
+        self.assertEqual(self.ids(self.index.fit({"CPU": "0.5", "MEMORY": "128", "DISK": {"SIZE": "10"}}, k=5)),
+                         [0, 2, 4, 1])
+
+    def test_datastores(self):
+        self.index.update(datastore(100, 50, [1]))
+        self.index.update(datastore(1, 10 ** 6, [1], type=0))
+        self.assertEqual(self.index.get(2).free_disk, 50)
+        self.assertEqual(self.index.fit(cpu=100, disk=60, clusters=[1]), [])
+        self.index.update(datastore(100, 100, [1]))
+        self.assertEqual(self.ids(self.index.fit(cpu=100, disk=60, clusters=[1])), [2])
+
+    def test_incremental(self):
+        self.index.update(bindings.parseString(host(0, 700, 1 * GB).encode("utf-8")))
+        self.assertEqual(self.ids(self.index.fit(cpu=200, k=5)), [2, 4, 1])
+        self.index.allocate(4, cpu=300, memory=1 * GB)
+        self.assertEqual(self.index.get(4).free_cpu, 100)
+        self.assertEqual(self.index.get(4).running_vms, 2)
+        self.assertEqual(self.ids(self.index.fit(cpu=200, k=5)), [2, 1])
+        self.assertTrue(self.index.remove(2))
+        self.assertFalse(self.index.remove(2))
+        self.assertEqual(self.ids(self.index.fit(cpu=200, k=5)), [1])
+        with self.assertRaises(OneException):
+            self.index.allocate(2, cpu=100)
+        self.assertEqual(len(self.index), 4)
+
+    def test_no_cluster(self):
+        # hosts without cluster are found when no cluster is requested
+        self.index.update(bindings.parseString(host(5, 0, 0).replace("<CLUSTER_ID>0</CLUSTER_ID>", "")
+                                               .encode("utf-8")))
+        self.assertIsNone(self.index.get(5).cluster)
+        self.assertEqual(self.ids(self.index.fit(cpu=750, k=5)), [5])
+        self.index.update(bindings.parseString(host(5, 200, 0).replace("<CLUSTER_ID>0</CLUSTER_ID>", "")
+                                               .encode("utf-8")))
+        self.assertEqual(self.index.fit(cpu=750, k=5), [])
+        self.assertEqual(self.ids(self.index.fit(cpu=550, k=5)), [0, 5])
+        self.assertTrue(self.index.remove(5))
+        self.assertEqual(self.ids(self.index.fit(cpu=550, k=5)), [0])
+
+    def test_only_requested_groups(self):
+        merged = []
+
+        class Index(CapacityIndex):
+            @staticmethod
+            def _candidates(lists, needed, packing):
+                merged.append(sum(len(entries) for entries in lists))
+                return CapacityIndex._candidates(lists, needed, packing)
+
+        index = Index()
+        index.update(host_pool(*[host(i, 0, 0, cluster=i % 4, state=HOST_STATES.DISABLED if i % 2 else 2)
+                                 for i in range(100)]))
+        self.assertEqual(self.ids(index.fit(cpu=100, k=2, clusters=[2])), [98, 94])
+        self.assertEqual(self.ids(index.fit(cpu=100, k=2, states=[HOST_STATES.DISABLED])), [99, 97])
+        self.assertEqual(self.ids(index.fit(cpu=100, k=2)), [98, 96])
+        # disabled hosts and other clusters are not merged
+        self.assertEqual(merged, [25, 50, 50])
+
+    def test_groups(self):
+        self.assertEqual(self.index.hosts(cluster=0), [0, 1, 3, 4])
+        self.assertEqual(self.index.hosts(state=HOST_STATES.DISABLED), [3])
+        self.assertEqual(self.index.hosts(cluster=1, state=HOST_STATES.MONITORED), [2])
+
+    def test_host_info(self):
+        with open(path.join(testData, "host_01.xml"), "rb") as f:
+            self.index.update(bindings.parseString(f.read()))
+        capacity = self.index.get(0)
+        self.assertEqual((capacity.name, capacity.free_cpu, capacity.free_memory), ("hv1", 100, 1020364))
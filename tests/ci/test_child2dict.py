@@ -0,0 +1,81 @@
+# coding: utf-8
+
+# Copyright 2018 www.privaz.io Valletech AB
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import os
+import unittest
+import xmltodict
+from collections import OrderedDict
+from lxml import etree
+from pyone.util import child2dict, cast2one
+
+data_dir = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'test_issue_006_data')
+
+
+def xmltodict_child2dict(element):
+    # reference: serialize the element and parse it back with xmltodict
+    tag = etree.QName(element).localname
+    ret = xmltodict.parse(etree.tostring(element))
+    ret[tag].pop('@xmlns', None) if ret[tag] else None
+    return emptystr(ret[tag] or OrderedDict())
+
+
+def emptystr(value):
+    if value is None:
+        return ""
+    if isinstance(value, list):
+        return [emptystr(v) for v in value]
+    if isinstance(value, dict):
+        return OrderedDict((k, emptystr(v)) for k, v in value.items())
+    return value
+
+
+class Child2DictTests(unittest.TestCase):
+
+    def test_same_as_xmltodict(self):
+        for name in sorted(os.listdir(data_dir)):
+            tree = etree.parse(os.path.join(data_dir, name))
+            templates = tree.xpath("//*[local-name()='TEMPLATE' or local-name()='USER_TEMPLATE']")
+            self.assertTrue(templates)
+            for template in templates:
+                self.assertEqual(child2dict(template), xmltodict_child2dict(template), name)
+
+    def test_shape(self):
+        template = etree.fromstring(b'''<TEMPLATE xmlns="http://opennebula.org/XMLSchema">
+            <NAME> vm </NAME>
+            <EMPTY/>
+            <DISK><IMAGE_ID>1</IMAGE_ID><CACHE/></DISK>
+            <DISK><IMAGE_ID>2</IMAGE_ID></DISK>
+            <GRAPHICS TYPE="vnc">x</GRAPHICS>
+            <!-- comment -->
+        </TEMPLATE>''')
+        d = child2dict(template)
+        self.assertEqual(list(d.keys()), ["NAME", "EMPTY", "DISK", "GRAPHICS"])
+        self.assertEqual(d["NAME"], "vm")
+        self.assertEqual(d["EMPTY"], "")
+        self.assertEqual(d["DISK"], [OrderedDict([("IMAGE_ID", "1"), ("CACHE", "")]),
+                                     OrderedDict([("IMAGE_ID", "2")])])
+        self.assertEqual(d["GRAPHICS"], OrderedDict([("@TYPE", "vnc"), ("#text", "x")]))
+        self.assertEqual(list(d._root.keys()), ["TEMPLATE"])
+        self.assertIs(d._root["TEMPLATE"], d)
+
+    def test_empty_template(self):
+        d = child2dict(etree.fromstring(b"<USER_TEMPLATE/>"))
+        self.assertEqual(d, OrderedDict())
+        self.assertEqual(list(d._root.keys()), ["USER_TEMPLATE"])
+
+    def test_round_trip(self):
+        d = child2dict(etree.fromstring(b"<TEMPLATE><LABELS>SSD</LABELS><NOTES>ESPA\xc3\x91A</NOTES></TEMPLATE>"))
+        self.assertEqual(cast2one(d), u"<TEMPLATE><LABELS><![CDATA[SSD]]></LABELS><NOTES><![CDATA[ESPAÑA]]></NOTES></TEMPLATE>")
@@ -0,0 +1,112 @@
+# coding: utf-8
+
+# Copyright 2018 www.privaz.io Valletech AB
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import array
+import unittest
+from os import path
+from pyone import bindings, columns, VM_STATE, LCM_STATE
+from pyone.util import INT64_TYPECODE
+
+testData = path.join(path.dirname(path.abspath(__file__)), "test_issue_006_data")
+
+FIELDS = ["ID", "NAME", "STATE", "LCM_STATE", "STIME", "HISTORY_RECORDS/HISTORY/HOSTNAME", "MISSING"]
+
+
+def read(name):
+    with open(path.join(testData, name), "rb") as f:
+        return f.read()
+
+
+class FieldTypeTests(unittest.TestCase):
+
+    def test_types(self):
+        self.assertEqual(columns.field_type("HOST_POOL", "HOST/HOST_SHARE/USED_CPU"), "integer")
+        self.assertEqual(columns.field_type("VM_POOL", "VM/NAME"), "string")
+        self.assertEqual(columns.field_type("VM", "STIME"), "integer")
+        self.assertIsNone(columns.field_type("VM", "TEMPLATE/CPU"))
+
+
+class ArrayColumnsTests(unittest.TestCase):
+    '''
+    Columns without NumPy
+    '''
+
+    def setUp(self):
+        self.numpy = columns.numpy
+        columns.numpy = None
+
+    def tearDown(self):
+        columns.numpy = self.numpy
+
+    def check(self, pool):
+        ret = bindings.to_columns(pool, FIELDS)
+        self.assertEqual(list(ret), FIELDS)
+        self.assertEqual(ret["ID"], array.array(INT64_TYPECODE, [1, 2]))
+        self.assertEqual(ret["NAME"], [u"testvmæ-1", "testvm2"])
+        self.assertEqual(ret["STIME"], array.array(INT64_TYPECODE, [1521297900, 1521406778]))
+        self.assertEqual(ret["HISTORY_RECORDS/HISTORY/HOSTNAME"], ["node2", "node1"])
+        self.assertEqual(ret["MISSING"], [None, None])
+
+    def test_xml(self):
+        self.check(read("vm_pool_01.xml"))
+
+    def test_bindings(self):
+        self.check(bindings.parseString(read("vm_pool_01.xml")))
+
+    def test_states(self):
+        ret = bindings.to_columns(read("vm_pool_01.xml"), ["STATE", "LCM_STATE"], states=True)
+        self.assertEqual(ret["STATE"], [VM_STATE.ACTIVE, VM_STATE.ACTIVE])
+        self.assertIs(ret["LCM_STATE"][0], LCM_STATE.UNKNOWN)
+
+    def test_single_object(self):
+        ret = bindings.to_columns(read("host_01.xml"), ["ID", "NAME", "HOST_SHARE/MAX_CPU"])
+        self.assertEqual(ret["NAME"], ["hv1"])
+        self.assertEqual(ret["HOST_SHARE/MAX_CPU"].typecode, INT64_TYPECODE)
+
+    def test_missing(self):
+        xml = "<VM_POOL><VM><ID>1</ID><ETIME>5</ETIME></VM><VM><ID>2</ID></VM></VM_POOL>"
+        ret = bindings.to_columns(xml, ["ID", "ETIME"], missing=0)
+        self.assertEqual(ret["ETIME"], array.array(INT64_TYPECODE, [5, 0]))
+
+    def test_repeated(self):
+        # the first history record of each VM, even if others have more or none
+        history = "<HISTORY_RECORDS>%s</HISTORY_RECORDS>"
+        record = "<HISTORY><HOSTNAME>%s</HOSTNAME></HISTORY>"
+        xml = "<VM_POOL><VM><ID>1</ID>%s</VM><VM><ID>2</ID></VM></VM_POOL>" % \
+              (history % (record % "a" + record % "b"))
+        ret = bindings.to_columns(xml, ["HISTORY_RECORDS/HISTORY/HOSTNAME"])
+        self.assertEqual(ret["HISTORY_RECORDS/HISTORY/HOSTNAME"], ["a", None])
+
+    def test_empty(self):
+        ret = bindings.to_columns(b"<HOST_POOL/>", ["ID"])
+        self.assertEqual(len(ret["ID"]), 0)
+
+
+@unittest.skipIf(columns.numpy is None, "NumPy is not installed")
+class NumPyColumnsTests(unittest.TestCase):
+
+    def test_dtypes(self):
+        numpy = columns.numpy
+        ret = bindings.to_columns(read("vm_pool_01.xml"), FIELDS)
+        self.assertEqual(ret["ID"].dtype, numpy.int64)
+        self.assertEqual(ret["STIME"].tolist(), [1521297900, 1521406778])
+        self.assertEqual(ret["NAME"].dtype, object)
+        self.assertEqual(ret["HISTORY_RECORDS/HISTORY/HOSTNAME"].tolist(), ["node2", "node1"])
+
+    def test_decimal(self):
+        column = columns._column(["0.5", None], "decimal", -1)
+        self.assertEqual(column[0], 0.5)
+        self.assertTrue(columns.numpy.isnan(column[1]))
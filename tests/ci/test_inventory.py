@@ -0,0 +1,101 @@
+# Copyright 2018 www.privaz.io Valletech AB
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import unittest
+from os import path
+from pyone import bindings, Inventory, OneException, VM_STATE
+from pyone.watcher import PoolEvent, ADDED, CHANGED, REMOVED
+
+testData = path.join(path.dirname(path.abspath(__file__)), "test_issue_006_data")
+
+
+def read(name):
+    with open(path.join(testData, name), "rb") as f:
+        return bindings.parseString(f.read())
+
+
+def vm(id, name, hostname=None, state=3, lcm_state=3, gid=0):
+    history = ""
+    if hostname:
+        history = "<HISTORY_RECORDS><HISTORY><HOSTNAME>%s</HOSTNAME><HID>%d</HID><CID>0</CID>" \
+                  "</HISTORY></HISTORY_RECORDS>" % (hostname, len(hostname))
+    return "<VM><ID>%d</ID><UID>0</UID><GID>%d</GID><NAME>%s</NAME><STATE>%d</STATE>" \
+           "<LCM_STATE>%d</LCM_STATE>%s</VM>" % (id, gid, name, state, lcm_state, history)
+
+
+def vm_pool(*vms):
+    return bindings.parseString(("<VM_POOL>%s</VM_POOL>" % "".join(vms)).encode("utf-8"))
+
+
+class InventoryTests(unittest.TestCase):
+
+    def setUp(self):
+        self.inventory = Inventory()
+        self.inventory.update(vm_pool(vm(1, "web1", "node1"), vm(2, "web2", "node2"),
+                                      vm(3, "db", "node1", state=VM_STATE.POWEROFF, lcm_state=0, gid=1),
+                                      vm(4, "new", state=VM_STATE.PENDING, lcm_state=0)))
+
+    def ids(self, objects):
+        return [obj.ID for obj in objects]
+
+    def test_find(self):
+        self.assertEqual(self.ids(self.inventory.find("VM", HOST="node1")), [1, 3])
+        self.assertEqual(self.ids(self.inventory.find("VM", STATE=VM_STATE.POWEROFF, GID=1)), [3])
+        self.assertEqual(self.ids(self.inventory.find("VM", HOST="node1", GID=0)), [1])
+        self.assertEqual(self.ids(self.inventory.find("VM", NAME="web2")), [2])
+        self.assertEqual(self.inventory.find("VM", HOST="node3"), [])
+        self.assertEqual(self.ids(self.inventory.find("VM")), [1, 2, 3, 4])
+        self.assertEqual(sorted(self.inventory.keys("VM", "HOST")), ["node1", "node2"])
+        self.assertEqual(self.inventory.get("VM", 2).NAME, "web2")
+        self.assertEqual(len(self.inventory), 4)
+
+    def test_update_single(self):
+        migrated = bindings.parseString(vm(1, "web1", "node2").encode("utf-8"))
+        self.assertEqual(self.inventory.update(migrated), 1)
+        self.assertEqual(self.ids(self.inventory.find("VM", HOST="node1")), [3])
+        self.assertEqual(self.ids(self.inventory.find("VM", HOST="node2")), [1, 2])
+        self.assertIs(self.inventory.get("VM", 1), migrated)
+
+    def test_replace(self):
+        self.inventory.update(vm_pool(vm(2, "web2", "node2")), replace=True)
+        self.assertEqual(self.ids(self.inventory.find("VM")), [2])
+        self.assertEqual(self.inventory.keys("VM", "HOST"), ["node2"])
+
+    def test_remove(self):
+        self.assertEqual(self.inventory.remove("VM", 3).NAME, "db")
+        self.assertIsNone(self.inventory.remove("VM", 3))
+        self.assertEqual(self.inventory.find("VM", GID=1), [])
+
+    def test_apply(self):
+        changed = bindings.parseString(vm(2, "web2", "node1").encode("utf-8"))
+        added = bindings.parseString(vm(5, "web3", "node2").encode("utf-8"))
+        self.inventory.apply([PoolEvent(CHANGED, 2, changed, None), PoolEvent(ADDED, 5, added, None),
+                              PoolEvent(REMOVED, 1, None, None)], "VM")
+        self.assertEqual(self.ids(self.inventory.find("VM", HOST="node1")), [2, 3])
+        self.assertEqual(self.ids(self.inventory.find("VM", HOST="node2")), [5])
+
+    def test_other_kinds(self):
+        self.inventory.update(read("host_01.xml"))
+        host = self.inventory.find("HOST")[0]
+        self.assertEqual(self.inventory.find("HOST", NAME=host.NAME), [host])
+        self.assertEqual(self.inventory.find("HOST", CLUSTER=host.CLUSTER_ID), [host])
+        vnet = read("vnet_01.xml")
+        self.inventory.update([vnet], kind="VNET")
+        self.assertEqual(self.inventory.find("VNET", CLUSTER=0), [vnet])
+
+    def test_errors(self):
+        with self.assertRaises(OneException):
+            self.inventory.update([])
+        with self.assertRaises(OneException):
+            self.inventory.find("VM", TEMPLATE="x")
@@ -0,0 +1,89 @@
+# coding: utf-8
+
+# Copyright 2018 www.privaz.io Valletech AB
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import os
+import re
+import unittest
+from io import BytesIO
+from pyone import bindings
+
+data_dir = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'test_issue_006_data')
+
+
+def read_xml_data(name):
+    with open(os.path.join(data_dir, name), 'rb') as f:
+        return f.read()
+
+
+def binding_fields(obj):
+    # bindings generated by "make slots" have no __dict__
+    if hasattr(obj, '__dict__'):
+        return vars(obj)
+    return dict((name, getattr(obj, name)) for cls in type(obj).__mro__ for name in getattr(cls, '__slots__', ()))
+
+
+def state(obj):
+    '''
+    comparable representation of a binding object
+    '''
+    if isinstance(obj, list):
+        return [state(item) for item in obj]
+    if type(obj).__module__.startswith('pyone.bindings'):
+        return dict((key, state(value)) for key, value in binding_fields(obj).items())
+    return obj
+
+
+def vnet_pool():
+    vnets = [re.sub(br'^<\?xml[^>]*>\s*', b'', read_xml_data(name)) for name in ('vnet_01.xml', 'vnet_02.xml')]
+    return b'<VNET_POOL>' + b''.join(vnets) + b'</VNET_POOL>'
+
+
+class IterparseTests(unittest.TestCase):
+
+    def test_vm_pool(self):
+        data = read_xml_data('vm_pool_01.xml')
+        vms = list(bindings.iterparse(data, 'VM'))
+        self.assertEqual([vm.ID for vm in vms], [1, 2])
+        self.assertEqual(state(vms), state(bindings.parseString(data).VM))
+
+    def test_single_object(self):
+        data = read_xml_data('vnet_02.xml')
+        vnets = list(bindings.iterparse(BytesIO(data), 'VNET'))
+        self.assertEqual(len(vnets), 1)
+        self.assertEqual(state(vnets[0]), state(bindings.parseString(data)))
+
+    def test_nested_elements_with_the_same_name(self):
+        # vnet_02 leases have VM children
+        data = vnet_pool()
+        vnets = list(bindings.iterparse(data.decode('utf-8'), 'VNET'))
+        self.assertEqual([vnet.ID for vnet in vnets], [vnet.ID for vnet in bindings.parseString(data).VNET])
+        self.assertEqual(state(vnets), state(bindings.parseString(data).VNET))
+
+    def test_file_name(self):
+        vms = bindings.iterparse(os.path.join(data_dir, 'vm_pool_01.xml'), 'VM', fields=['ID', 'NAME'])
+        self.assertEqual([(vm.ID, vm.NAME, vm.TEMPLATE) for vm in vms],
+                         [(1, u'testvmæ-1', None), (2, u'testvm2', None)])
+
+    def test_processed_elements_are_released(self):
+        data = b'<VM_POOL>' + b''.join(b'<VM><ID>%d</ID></VM>' % i for i in range(10)) + b'</VM_POOL>'
+        ids = []
+        for vm in bindings.iterparse(data, 'VM'):
+            ids.append(vm.ID)
+        self.assertEqual(ids, list(range(10)))
+
+    def test_unknown_element(self):
+        with self.assertRaises(ValueError):
+            list(bindings.iterparse(b'<POOL><THING/></POOL>', 'THING'))
@@ -0,0 +1,167 @@
+# Copyright 2018 www.privaz.io Valletech AB
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import importlib
+import io
+import json
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import unittest
+from six import text_type
+
+root_dir = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..')
+
+# module __getattr__, before it everything is imported with the package
+LAZY = sys.version_info >= (3, 7)
+
+sys.path.insert(0, os.path.join(root_dir, 'src'))
+from split_bindings import split  # noqa
+sys.path.pop(0)
+
+SUPER = '''import sys
+import re as re_
+CurrentSubclassModule_ = None
+Tag_pattern_ = re_.compile(r'({.*})?(.*)')
+def getSubclassFromModule_(module, class_):
+    return None
+class GeneratedsSuper(object):
+    pass
+class A_POOL(GeneratedsSuper):
+    subclass = None
+    def __init__(self, A=None):
+        self.A = A
+    def factory(*args_, **kwargs_):
+        if CurrentSubclassModule_ is not None:
+            return getSubclassFromModule_(CurrentSubclassModule_, A_POOL)(*args_, **kwargs_)
+        if A_POOL.subclass:
+            return A_POOL.subclass(*args_, **kwargs_)
+        return A_POOL(*args_, **kwargs_)
+    factory = staticmethod(factory)
+    def build(self, node):
+        self.A = A.factory()
+        return self
+# end class A_POOL
+class A(GeneratedsSuper):
+    subclass = None
+    def factory(*args_, **kwargs_):
+        if A.subclass:
+            return A.subclass(*args_, **kwargs_)
+        return A(*args_, **kwargs_)
+    factory = staticmethod(factory)
+class B(GeneratedsSuper):
+    subclass = None
+    def factory(*args_, **kwargs_):
+        return B(*args_, **kwargs_)
+    factory = staticmethod(factory)
+GDSClassesMapping = {
+}
+def get_root_tag(node):
+    tag = Tag_pattern_.match(node).groups()[-1]
+    rootClass = GDSClassesMapping.get(tag)
+    if rootClass is None:
+        rootClass = globals().get(tag)
+    return tag, rootClass
+def parse(node):
+    rootTag, rootClass = get_root_tag(node)
+    if rootClass is None:
+        rootClass = A_POOL
+    return rootClass.factory().build(node)
+'''
+
+SUB = '''import sys
+from . import supbind as supermod
+class A_POOLSub(supermod.A_POOL):
+    def __init__(self, A=None):
+        super(A_POOLSub, self).__init__(A, )
+supermod.A_POOL.subclass = A_POOLSub
+# end class A_POOLSub
+class ASub(supermod.A):
+    pass
+supermod.A.subclass = ASub
+def get_root_tag(node):
+    return supermod.get_root_tag(node)
+'''
+
+
+class SplitBindingsTests(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        package = os.path.join(self.directory, 'split_bindings_test')
+        os.mkdir(package)
+        super_module, sub_module, modules = split(SUPER, SUB)
+        self.assertEqual(sorted(modules), ['a', 'b'])
+        self.assertIsNone(split(super_module, sub_module))
+        modules.update({'supbind': super_module, '__init__': sub_module})
+        for name, source in modules.items():
+            with io.open(os.path.join(package, name + '.py'), 'w', encoding='utf-8') as f:
+                f.write(text_type(source))
+        sys.path.insert(0, self.directory)
+
+    def tearDown(self):
+        sys.path.remove(self.directory)
+        for name in list(sys.modules):
+            if name.startswith('split_bindings_test'):
+                del sys.modules[name]
+        shutil.rmtree(self.directory)
+
+    def test_lazy(self):
+        bindings = importlib.import_module('split_bindings_test')
+        self.assertEqual('split_bindings_test.a' in sys.modules, not LAZY)
+        pool = bindings.supermod.parse('A_POOL')
+        self.assertEqual(type(pool).__name__, 'A_POOLSub')
+        self.assertEqual(type(pool.A).__name__, 'ASub')
+        self.assertEqual(type(bindings.supermod.parse('OTHER')).__name__, 'A_POOLSub')
+        self.assertEqual('split_bindings_test.b' in sys.modules, not LAZY)
+        self.assertIs(bindings.ASub, sys.modules['split_bindings_test.a'].ASub)
+        self.assertEqual(bindings.get_root_tag('B')[1].__module__, 'split_bindings_test.b')
+        for name in ('C', 'BSub', 'OTHERSub'):
+            with self.assertRaises(AttributeError):
+                getattr(bindings, name)
+        with self.assertRaises(AttributeError):
+            bindings.supermod.C
+
+
+class LazyAttributesTests(unittest.TestCase):
+
+    def test_constants(self):
+        import pyone
+        self.assertEqual(pyone.VM_STATE.ACTIVE, 3)
+        self.assertIs(pyone.HOST_STATES, importlib.import_module("pyone.constants").HOST_STATES)
+        self.assertIn("CapacityIndex", dir(pyone))
+        with self.assertRaises(AttributeError):
+            pyone.NOT_A_CONSTANT
+
+
+@unittest.skipUnless(LAZY, "module __getattr__ requires Python 3.7")
+class LazyImportTests(unittest.TestCase):
+
+    def modules(self, statement):
+        # modules imported by a statement in a new interpreter
+        code = "import sys, json; %s; print(json.dumps(sorted(sys.modules)))" % statement
+        output = subprocess.check_output([sys.executable, "-c", code], cwd=root_dir)
+        return set(json.loads(output.decode("utf-8").splitlines()[-1]))
+
+    def test_import(self):
+        modules = self.modules("import pyone")
+        for name in ("numpy", "aenum", "pyone.constants", "pyone.columns", "pyone.batch", "pyone.bindings.vm"):
+            self.assertNotIn(name, modules)
+
+    def test_parse(self):
+        modules = self.modules("import pyone; pyone.bindings.parseString(b'<VM_POOL><VM><ID>1</ID></VM></VM_POOL>')")
+        self.assertEqual(sorted(name for name in modules if name.startswith("pyone.bindings.")),
+                         ["pyone.bindings.supbind", "pyone.bindings.vm"])
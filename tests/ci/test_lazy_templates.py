@@ -0,0 +1,93 @@
+# coding: utf-8
+
+# Copyright 2018 www.privaz.io Valletech AB
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import os
+import copy
+import json
+import pickle
+import unittest
+import pyone.bindings as bindings
+from pyone.util import lazy_templates, LazyTemplate, cast2one, one2dict
+
+
+def read_xml_data(name):
+    data_dir = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'test_issue_006_data')
+    with open(os.path.join(data_dir, name), 'rb') as f:
+        return f.read()
+
+
+class LazyTemplateTests(unittest.TestCase):
+
+    def setUp(self):
+        self.eager = bindings.parseString(read_xml_data('vm_pool_01.xml'))
+        with lazy_templates():
+            self.lazy = bindings.parseString(read_xml_data('vm_pool_01.xml'))
+
+    def test_default_is_eager(self):
+        pool = bindings.parseString(read_xml_data('vm_pool_01.xml'))
+        self.assertNotIsInstance(pool.VM[0].TEMPLATE, LazyTemplate)
+
+    def test_not_materialized_until_used(self):
+        vm = self.lazy.VM[0]
+        self.assertIsInstance(vm.TEMPLATE, LazyTemplate)
+        self.assertEqual(vm.ID, self.eager.VM[0].ID)
+        self.assertFalse(vm.TEMPLATE.materialized)
+        self.assertFalse(vm.USER_TEMPLATE.materialized)
+        vm.TEMPLATE.get('CPU')
+        self.assertTrue(vm.TEMPLATE.materialized)
+        self.assertFalse(vm.USER_TEMPLATE.materialized)
+
+    def test_same_content(self):
+        for lazy, eager in zip(self.lazy.VM, self.eager.VM):
+            self.assertEqual(lazy.TEMPLATE, eager.TEMPLATE)
+            self.assertEqual(list(lazy.USER_TEMPLATE.items()), list(eager.USER_TEMPLATE.items()))
+            self.assertEqual(dict(lazy.TEMPLATE), dict(eager.TEMPLATE))
+
+    def test_comparison_materializes_both(self):
+        with lazy_templates():
+            other = bindings.parseString(read_xml_data('vm_pool_01.xml'))
+        self.assertEqual(self.lazy.VM[0].TEMPLATE, other.VM[0].TEMPLATE)
+
+    def test_update_compatibility(self):
+        template = self.lazy.VM[0].USER_TEMPLATE
+        self.assertEqual(cast2one(template), cast2one(self.eager.VM[0].USER_TEMPLATE))
+        self.assertIs(one2dict(template)['USER_TEMPLATE'], template)
+
+    def test_modification(self):
+        template = self.lazy.VM[0].USER_TEMPLATE
+        template['LABELS'] = u'España'
+        self.assertIn('LABELS', template)
+        self.assertIn(u'<LABELS><![CDATA[España]]></LABELS>', cast2one(template))
+        del template['LABELS']
+        self.assertNotIn('LABELS', template)
+
+    def test_copies(self):
+        template = self.lazy.VM[0].TEMPLATE
+        self.assertEqual(copy.deepcopy(template), self.eager.VM[0].TEMPLATE)
+        self.assertEqual(pickle.loads(pickle.dumps(template)), self.eager.VM[0].TEMPLATE)
+        template = self.lazy.VM[1].USER_TEMPLATE
+        copied = copy.deepcopy(template)
+        self.assertTrue(copied.materialized)
+        self.assertIs(copied._root["USER_TEMPLATE"], copied)
+        self.assertEqual(copy.copy(self.lazy.VM[0].USER_TEMPLATE), self.eager.VM[0].USER_TEMPLATE)
+
+    def test_json(self):
+        # the C encoder reads the storage of dictionaries, it must not find the template empty
+        for lazy, eager in zip(self.lazy.VM, self.eager.VM):
+            self.assertEqual(json.dumps(lazy.TEMPLATE), json.dumps(eager.TEMPLATE))
+            self.assertEqual(json.loads(json.dumps({"T": lazy.USER_TEMPLATE}, sort_keys=True))["T"],
+                             eager.USER_TEMPLATE)
+        self.assertEqual(json.dumps(LazyTemplate()), "{}")
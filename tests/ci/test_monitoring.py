@@ -0,0 +1,135 @@
+# Copyright 2018 www.privaz.io Valletech AB
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import math
+import unittest
+from os import path
+from pyone import OneServer, monitoring
+from pyone.monitoring import decode_monitoring
+from pyone.util import INT64_TYPECODE
+from .oned import FakeOned
+
+testData = path.join(path.dirname(path.abspath(__file__)), "test_issue_006_data")
+
+
+def vm(id, last_poll, netrx, cpu=None):
+    counters = "<NETRX><![CDATA[%d]]></NETRX><NETTX>10</NETTX>" % netrx
+    if cpu is not None:
+        counters += "<CPU>%s</CPU>" % cpu
+    return "<VM><ID>%d</ID><LAST_POLL>%d</LAST_POLL><TEMPLATE><CPU>1</CPU></TEMPLATE>" \
+           "<MONITORING>%s<DISK_SIZE><ID>0</ID><SIZE>5</SIZE></DISK_SIZE></MONITORING></VM>" % \
+           (id, last_poll, counters)
+
+
+def pool(*vms):
+    return "<VM_POOL>%s</VM_POOL>" % "".join(vms)
+
+
+class MonitoringTests(object):
+    '''
+    Checks run with and without NumPy
+    '''
+
+    def test_vm_pool(self):
+        data = decode_monitoring(pool(vm(1, 100, 1000, "12.5"), vm(2, 110, 500)))
+        self.assertEqual(len(data), 2)
+        self.assertEqual(list(data.ids), [1, 2])
+        self.assertEqual(list(data.timestamps), [100, 110])
+        self.assertEqual(list(data["NETRX"]), [1000, 500])
+        self.assertEqual(data["CPU"][0], 12.5)
+        self.assertTrue(math.isnan(data["CPU"][1]))
+        self.assertEqual(list(data.counters), list(monitoring.MONITORING_COUNTERS))
+
+    def test_single_vm(self):
+        with open(path.join(testData, "vm_01.xml"), "rb") as f:
+            data = decode_monitoring(f.read(), counters=["NETRX", "DISKRDIOPS"])
+        self.assertEqual(list(data.ids), [595])
+        self.assertEqual(list(data.timestamps), [1511608767])
+        self.assertEqual(list(data["NETRX"]), [252586401])
+        self.assertEqual(list(data.counters), ["NETRX", "DISKRDIOPS"])
+
+    def test_monitoring_records(self):
+        # OpenNebula 6 MONITORING_DATA, several records per VM
+        records = "".join("<MONITORING><ID>%d</ID><TIMESTAMP>%d</TIMESTAMP><NETRX>%d</NETRX></MONITORING>" % r
+                          for r in [(7, 200, 20), (3, 100, 5), (7, 100, 10), (3, 200, 6)])
+        data = decode_monitoring("<MONITORING_DATA>%s</MONITORING_DATA>" % records)
+        self.assertEqual(list(data.ids), [7, 3, 7, 3])
+        latest = data.latest()
+        self.assertEqual(list(latest.ids), [3, 7])
+        self.assertEqual(list(latest.timestamps), [200, 200])
+        self.assertEqual(list(latest["NETRX"]), [6, 20])
+
+    def test_pages(self):
+        data = decode_monitoring(page for page in [pool(vm(1, 100, 1)), pool(), pool(vm(2, 100, 2))])
+        self.assertEqual(list(data.ids), [1, 2])
+        self.assertEqual(len(decode_monitoring([])), 0)
+
+    def test_rates(self):
+        previous = decode_monitoring(pool(vm(1, 100, 1000), vm(2, 100, 5000), vm(3, 100, 0)))
+        current = decode_monitoring(pool(vm(4, 160, 0), vm(2, 160, 100), vm(1, 160, 7000)))
+        rates = current.rates(previous)
+        self.assertEqual(list(rates.ids), [1, 2])
+        self.assertEqual(list(rates.timestamps), [160, 160])
+        self.assertEqual(rates["NETRX"][0], 100.0)
+        # counter reset
+        self.assertTrue(math.isnan(rates["NETRX"][1]))
+        self.assertEqual(list(rates["NETTX"]), [0.0, 0.0])
+        self.assertEqual(list(rates.counters), list(monitoring.CUMULATIVE_COUNTERS))
+        # not updated since the previous snapshot
+        self.assertTrue(math.isnan(previous.rates(previous)["NETRX"][0]))
+
+
+class ArrayMonitoringTests(MonitoringTests, unittest.TestCase):
+
+    def setUp(self):
+        self.numpy = monitoring.numpy
+        monitoring.numpy = None
+
+    def tearDown(self):
+        monitoring.numpy = self.numpy
+
+    def test_arrays(self):
+        data = decode_monitoring(pool(vm(1, 100, 1000)))
+        self.assertEqual(data.ids.typecode, INT64_TYPECODE)
+        self.assertEqual(data["NETRX"].typecode, "d")
+
+
+@unittest.skipIf(monitoring.numpy is None, "NumPy is not installed")
+class NumPyMonitoringTests(MonitoringTests, unittest.TestCase):
+
+    def test_arrays(self):
+        data = decode_monitoring(pool(vm(1, 100, 1000)))
+        self.assertEqual(data.ids.dtype, monitoring.numpy.int64)
+        self.assertEqual(data["NETRX"].dtype, monitoring.numpy.float64)
+
+
+class RawResponseTests(unittest.TestCase):
+
+    def setUp(self):
+        self.oned = FakeOned()
+        self.oned.register("one.vmpool.monitoring", lambda session, filter: [True, pool(vm(1, 100, 1000)), 0])
+        self.oned.start()
+
+    def tearDown(self):
+        self.oned.stop()
+
+    def test_raw(self):
+        one = OneServer(self.oned.endpoint, session="oneadmin:onepass")
+        raw = one.vmpool.monitoring(-2, raw=True)
+        self.assertEqual(raw, pool(vm(1, 100, 1000)))
+        self.assertEqual(list(decode_monitoring(raw).ids), [1])
+
+    def test_raw_single_pass(self):
+        one = OneServer(self.oned.endpoint, session="oneadmin:onepass", single_pass_decoding=True)
+        self.assertEqual(list(decode_monitoring(one.vmpool.monitoring(-2, raw=True))["NETRX"]), [1000])
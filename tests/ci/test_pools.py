@@ -0,0 +1,67 @@
+# Copyright 2018 www.privaz.io Valletech AB
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import unittest
+from pyone import OneServer, OneException, PAGINATED_POOLS
+from .oned import FakeOned
+
+VM_IDS = list(range(100, 125))
+
+
+def vmpool_info(session, filter, start, end, state):
+    # pagination: start is the offset and -end the page size
+    page = VM_IDS[start:start - end]
+    return [True, "<VM_POOL>%s</VM_POOL>" % "".join("<VM><ID>%d</ID></VM>" % i for i in page), 0]
+
+
+class IterPoolTests(unittest.TestCase):
+
+    def setUp(self):
+        self.oned = FakeOned()
+        self.oned.register("one.vmpool.info", vmpool_info)
+        self.oned.start()
+
+    def tearDown(self):
+        self.oned.stop()
+
+    def test_pages(self):
+        one = OneServer(self.oned.endpoint, session="oneadmin:onepass")
+        ids = [vm.ID for vm in one.iter_pool("vmpool", page_size=10)]
+        self.assertEqual(ids, VM_IDS)
+        self.assertEqual([params[1:] for _, params in self.oned.calls],
+                         [(-2, 0, -10, -1), (-2, 10, -10, -1), (-2, 20, -10, -1)])
+
+    def test_exact_pages(self):
+        one = OneServer(self.oned.endpoint, session="oneadmin:onepass")
+        ids = [vm.ID for vm in one.iter_pool(PAGINATED_POOLS.VM_POOL, page_size=5)]
+        self.assertEqual(ids, VM_IDS)
+        self.assertEqual(len(self.oned.calls), 6)
+
+    def test_prefetch(self):
+        one = OneServer(self.oned.endpoint, session="oneadmin:onepass", pool_size=2)
+        ids = [vm.ID for vm in one.iter_pool("VM_POOL", page_size=7, prefetch=True)]
+        self.assertEqual(ids, VM_IDS)
+
+    def test_page_size(self):
+        one = OneServer(self.oned.endpoint, session="oneadmin:onepass")
+        for page_size in (1, 0, -10):
+            with self.assertRaises(ValueError):
+                list(one.iter_pool("vmpool", page_size=page_size))
+        self.assertEqual(self.oned.calls, [])
+        self.assertEqual([vm.ID for vm in one.iter_pool("vmpool", page_size=2)], VM_IDS)
+
+    def test_not_paginated(self):
+        one = OneServer(self.oned.endpoint, session="oneadmin:onepass")
+        with self.assertRaises(OneException):
+            list(one.iter_pool("hostpool"))
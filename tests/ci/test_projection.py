@@ -0,0 +1,116 @@
+# coding: utf-8
+
+# Copyright 2018 www.privaz.io Valletech AB
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import os
+import unittest
+from lxml import etree
+from pyone import OneServer, bindings
+from pyone.parsing import compile_fields, project
+from .oned import FakeOned
+
+FIELDS = ['ID', 'STATE', 'HISTORY_RECORDS/HISTORY/HOSTNAME', 'TEMPLATE/CPU']
+
+
+def read_xml_data(name):
+    data_dir = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'test_issue_006_data')
+    with open(os.path.join(data_dir, name), 'rb') as f:
+        return f.read()
+
+
+class CompileFieldsTests(unittest.TestCase):
+
+    def test_tree(self):
+        self.assertEqual(compile_fields(FIELDS), {
+            'ID': True,
+            'STATE': True,
+            'HISTORY_RECORDS': {'HISTORY': {'HOSTNAME': True}},
+            'TEMPLATE': {'CPU': True}
+        })
+
+    def test_whole_element_wins(self):
+        self.assertEqual(compile_fields(['TEMPLATE/CPU', 'TEMPLATE']), {'TEMPLATE': True})
+        self.assertEqual(compile_fields(['TEMPLATE', 'TEMPLATE/CPU']), {'TEMPLATE': True})
+
+    def test_empty_field(self):
+        with self.assertRaises(ValueError):
+            compile_fields(['ID', '/'])
+
+
+class ProjectionTests(unittest.TestCase):
+
+    def check_pool(self, pool):
+        full = bindings.parseString(read_xml_data('vm_pool_01.xml'))
+        self.assertEqual(len(pool.VM), len(full.VM))
+        for vm, reference in zip(pool.VM, full.VM):
+            self.assertEqual(vm.ID, reference.ID)
+            self.assertEqual(vm.STATE, reference.STATE)
+            self.assertEqual([h.HOSTNAME for h in vm.HISTORY_RECORDS.HISTORY],
+                             [h.HOSTNAME for h in reference.HISTORY_RECORDS.HISTORY])
+            self.assertEqual(vm.TEMPLATE, {'CPU': reference.TEMPLATE['CPU']})
+            self.assertIsNone(vm.NAME)
+            self.assertIsNone(vm.MONITORING)
+            self.assertIsNone(vm.USER_TEMPLATE)
+            self.assertIsNone(vm.HISTORY_RECORDS.HISTORY[0].SEQ)
+
+    def test_parse_pool(self):
+        self.check_pool(bindings.parseString(read_xml_data('vm_pool_01.xml'), fields=FIELDS))
+
+    def test_project_parsed_pool(self):
+        root = etree.fromstring(read_xml_data('vm_pool_01.xml'))
+        projected = project(root, FIELDS)
+        self.assertEqual([child.tag for child in projected[0]], ['ID', 'STATE', 'TEMPLATE', 'HISTORY_RECORDS'])
+        self.assertIsNotNone(root[0].find('MONITORING'))
+        self.check_pool(bindings.supermod.VM_POOL.factory().build(projected))
+
+    def test_single_object_with_namespace(self):
+        host = bindings.parseString(read_xml_data('host_01.xml'), fields=['ID', 'TEMPLATE/NOTES'])
+        self.assertEqual(host.ID, 0)
+        self.assertEqual(host.TEMPLATE['NOTES'], u"Hostname is: ESPAÑA")
+        self.assertIsNone(host.NAME)
+        self.assertIsNone(host.HOST_SHARE)
+
+    def test_no_projection(self):
+        data = read_xml_data('vnet_02.xml')
+        self.assertEqual(bindings.parseString(data, fields=None).AR_POOL.AR[0].SIZE,
+                         bindings.parseString(data).AR_POOL.AR[0].SIZE)
+
+
+class ServerProjectionTests(unittest.TestCase):
+
+    def setUp(self):
+        self.oned = FakeOned()
+        self.oned.register("one.vmpool.info",
+                           lambda *params: [True, read_xml_data('vm_pool_01.xml').decode('utf-8'), 0])
+        self.oned.start()
+
+    def tearDown(self):
+        self.oned.stop()
+
+    def test_fields(self):
+        for options in ({}, {"single_pass_decoding": True}):
+            one = OneServer(self.oned.endpoint, session="oneadmin:onepass", **options)
+            pool = one.vmpool.info(-2, -1, -1, -1, fields=FIELDS)
+            self.assertEqual([vm.ID for vm in pool.VM], [1, 2])
+            self.assertIsNone(pool.VM[0].MONITORING)
+            self.assertEqual(pool.VM[0].HISTORY_RECORDS.HISTORY[0].HOSTNAME, "node2")
+            one.server_close()
+        self.assertEqual(self.oned.calls[0], ("one.vmpool.info", ("oneadmin:onepass", -2, -1, -1, -1)))
+
+    def test_unknown_keyword(self):
+        one = OneServer(self.oned.endpoint, session="oneadmin:onepass")
+        with self.assertRaises(TypeError):
+            one.vmpool.info(-2, -1, -1, -1, filter=None)
+        self.assertEqual(self.oned.calls, [])
@@ -0,0 +1,108 @@
+# coding: utf-8
+
+# Copyright 2018 www.privaz.io Valletech AB
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import os
+import unittest
+import xmlrpc.client
+from six import text_type
+from pyone import OneServer, OneException, OneNoExistsException
+from pyone.transport import OneResponseParser
+from .oned import FakeOned
+from .test_iterparse import state
+
+
+def read_xml_data(name):
+    data_dir = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'test_issue_006_data')
+    with open(os.path.join(data_dir, name), 'rb') as f:
+        return f.read().decode('utf-8')
+
+
+def decode(response):
+    parser = OneResponseParser()
+    # Python 2 dumps text as encoded bytes
+    parser.feed(response.encode("utf-8") if isinstance(response, text_type) else response)
+    parser.close()
+    return parser.close()
+
+
+class OneResponseParserTests(unittest.TestCase):
+
+    def test_scalars(self):
+        response = xmlrpc.client.dumps(([True, "text", 7, 1.5, "", [1, "a"], {"k": 2}],), methodresponse=True)
+        self.assertEqual(decode(response), ([True, "text", 7, 1.5, "", [1, "a"], {"k": 2}],))
+
+    def test_untyped_string(self):
+        response = "<methodResponse><params><param><value>plain</value></param></params></methodResponse>"
+        self.assertEqual(decode(response), ("plain",))
+
+    def test_document(self):
+        response = xmlrpc.client.dumps(([True, read_xml_data("host_01.xml"), 0],), methodresponse=True)
+        host = decode(response)[0][1]
+        self.assertEqual(host.findtext("{http://opennebula.org/XMLSchema}TEMPLATE/{http://opennebula.org/XMLSchema}NOTES"),
+                         u"Hostname is: ESPAÑA")
+
+    def test_top_level_only(self):
+        document = u'<?xml version="1.0" encoding="UTF-8"?><HOST><NAME>ESPAÑA</NAME></HOST>'
+        host = decode(xmlrpc.client.dumps(([True, document, 0],), methodresponse=True))[0][1]
+        self.assertEqual(host.findtext("NAME"), u"ESPAÑA")
+        # multicall results, failed calls and other values are not documents
+        multicall = [[[True, "<HOST/>", 0]], [False, "<not a document", 0x0400]]
+        response = xmlrpc.client.dumps((multicall,), methodresponse=True)
+        self.assertEqual(decode(response), (multicall,))
+        for value in ([False, "<HOST/>", 0x0400], ["<HOST/>"], "<HOST/>", [True, "<not a document", 0]):
+            self.assertEqual(decode(xmlrpc.client.dumps((value,), methodresponse=True)), (value,))
+
+    def test_fault(self):
+        response = xmlrpc.client.dumps(xmlrpc.client.Fault(-501, "No such method"), methodresponse=True)
+        with self.assertRaises(xmlrpc.client.Fault) as fault:
+            decode(response)
+        self.assertEqual(fault.exception.faultCode, -501)
+
+
+class SinglePassDecodingTests(unittest.TestCase):
+
+    def setUp(self):
+        self.oned = FakeOned()
+        self.oned.register("one.vmpool.info", lambda *params: [True, read_xml_data("vm_pool_01.xml"), 0])
+        self.oned.register("one.vn.info", lambda *params: [True, read_xml_data("vnet_02.xml"), 0])
+        self.oned.register("one.host.info", lambda *params: [True, read_xml_data("host_01.xml"), 0])
+        self.oned.register("one.vm.info", lambda *params: [False, "Error getting virtual machine", 0x0400])
+        self.oned.register("one.vm.action", lambda *params: [True, 12, 0])
+        self.oned.start()
+        self.one = OneServer(self.oned.endpoint, session="oneadmin:onepass", single_pass_decoding=True)
+        self.reference = OneServer(self.oned.endpoint, session="oneadmin:onepass")
+
+    def tearDown(self):
+        self.oned.stop()
+
+    def test_same_bindings(self):
+        for method in ("vmpool", "vn", "host"):
+            fast = getattr(self.one, method).info(-2)
+            slow = getattr(self.reference, method).info(-2)
+            self.assertEqual(type(fast), type(slow))
+            self.assertEqual(state(fast), state(slow))
+
+        vmpool = self.one.vmpool.info(-2, -1, -1, -1)
+        self.assertEqual([vm.ID for vm in vmpool.VM], [vm.ID for vm in self.reference.vmpool.info(-2, -1, -1, -1).VM])
+        self.assertEqual(self.one.host.info(0).TEMPLATE['NOTES'], u"Hostname is: ESPAÑA")
+        self.assertEqual(self.one.vn.info(0).ID, 444)
+
+    def test_scalar_and_errors(self):
+        self.assertEqual(self.one.vm.action("poweroff", 12), 12)
+        with self.assertRaises(OneNoExistsException):
+            self.one.vm.info(1)
+        with self.assertRaises(OneException):
+            self.one.invalid.api.call()
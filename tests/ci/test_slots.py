@@ -0,0 +1,113 @@
+# coding: utf-8
+
+# Copyright 2018 www.privaz.io Valletech AB
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import importlib
+import io
+import os
+import pickle
+import shutil
+import sys
+import tempfile
+import unittest
+from lxml import etree
+from pyone import bindings
+
+root_dir = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..')
+data_dir = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'test_issue_006_data')
+
+sys.path.insert(0, os.path.join(root_dir, 'src'))
+from slotify import slotify  # noqa
+sys.path.pop(0)
+
+
+class SlotifyTests(unittest.TestCase):
+
+    def test_source(self):
+        source = (
+            "class GeneratedsSuper(object):\n"
+            "    def gds_format_string(self, input_data):\n"
+            "        return input_data\n"
+            "class A(GeneratedsSuper):\n"
+            "    '''doc'''\n"
+            "    subclass = None\n"
+            "    def __init__(self, ID=None):\n"
+            "        self.original_tagname_ = None\n"
+            "        self.ID = ID\n"
+            "class B(A):\n"
+            "    def __init__(self, ID=None, NAME=None):\n"
+            "        super(B, self).__init__(ID)\n"
+            "        self.NAME = NAME\n"
+            "class Other(object):\n"
+            "    def __init__(self):\n"
+            "        self.x = 1\n")
+        namespace = {}
+        exec(slotify(source), namespace)
+        self.assertEqual(namespace['GeneratedsSuper'].__slots__, ())
+        self.assertEqual(namespace['A'].__slots__, ('original_tagname_', 'ID'))
+        self.assertEqual(namespace['A'].__doc__, 'doc')
+        self.assertEqual(namespace['B'].__slots__, ('NAME',))
+        self.assertFalse(hasattr(namespace['Other'], '__slots__'))
+        # idempotent
+        self.assertEqual(slotify(slotify(source)), slotify(source))
+
+
+class SlottedBindingsTests(unittest.TestCase):
+    '''
+    Slotted copy of the generated bindings, as built by "make slots"
+    '''
+
+    @classmethod
+    def setUpClass(cls):
+        cls.directory = tempfile.mkdtemp()
+        package = os.path.join(cls.directory, 'slotted_bindings')
+        os.mkdir(package)
+        for name in sorted(os.listdir(os.path.dirname(bindings.__file__))):
+            if not name.endswith('.py'):
+                continue
+            with io.open(os.path.join(os.path.dirname(bindings.__file__), name), encoding='utf-8') as f:
+                source = f.read()
+            with io.open(os.path.join(package, name), 'w', encoding='utf-8') as f:
+                f.write(slotify(source))
+        sys.path.insert(0, cls.directory)
+        cls.bindings = importlib.import_module('slotted_bindings')
+
+    @classmethod
+    def tearDownClass(cls):
+        sys.path.remove(cls.directory)
+        for name in list(sys.modules):
+            if name.startswith('slotted_bindings'):
+                del sys.modules[name]
+        shutil.rmtree(cls.directory)
+
+    def parse(self, name):
+        root = etree.parse(os.path.join(data_dir, name)).getroot()
+        rootClass = self.bindings.get_root_tag(root)[1]
+        return rootClass.factory().build(root)
+
+    def test_attribute_access(self):
+        pool = self.parse('vm_pool_01.xml')
+        vm = pool.VM[0]
+        self.assertFalse(hasattr(vm, '__dict__'))
+        self.assertEqual(vm.ID, 1)
+        self.assertEqual(vm.HISTORY_RECORDS.HISTORY[0].HOSTNAME, 'node2')
+        self.assertEqual(vm.TEMPLATE['CPU'], '0.3')
+        self.assertEqual(self.parse('host_01.xml').TEMPLATE['NOTES'], u"Hostname is: ESPAÑA")
+        with self.assertRaises(AttributeError):
+            vm.NOT_IN_SCHEMA = 1
+
+    def test_pickle(self):
+        vnet = pickle.loads(pickle.dumps(self.parse('vnet_02.xml')))
+        self.assertEqual(vnet.ID, 444)
@@ -0,0 +1,97 @@
+# coding: utf-8
+
+# Copyright 2018 www.privaz.io Valletech AB
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import io
+import os
+import unittest
+from collections import OrderedDict
+from lxml import etree
+from pyone.util import template2dict, iter_template, child2dict, cast2one, dict2template
+
+data_dir = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'test_issue_006_data')
+
+TEMPLATE = u'''# a VM template
+NAME = "vm \\"one\\""
+CPU=0.5 MEMORY = 1024
+DISK = [ IMAGE_ID = 1, SIZE="10" ]
+DISK=[
+  IMAGE="España",
+  IMAGE_UNAME="oneadmin" ]  # the second disk
+CONTEXT=[NETWORK="YES",SSH_PUBLIC_KEY="$USER[SSH_PUBLIC_KEY]"]
+EMPTY=""
+START_SCRIPT="#!/bin/sh
+echo [ok], done"'''
+
+EXPECTED = OrderedDict([
+    ('NAME', 'vm "one"'), ('CPU', '0.5'), ('MEMORY', '1024'),
+    ('DISK', [OrderedDict([('IMAGE_ID', '1'), ('SIZE', '10')]),
+              OrderedDict([('IMAGE', u'España'), ('IMAGE_UNAME', 'oneadmin')])]),
+    ('CONTEXT', OrderedDict([('NETWORK', 'YES'), ('SSH_PUBLIC_KEY', '$USER[SSH_PUBLIC_KEY]')])),
+    ('EMPTY', ''), ('START_SCRIPT', '#!/bin/sh\necho [ok], done')])
+
+
+class TemplateParserTests(unittest.TestCase):
+
+    def test_parse(self):
+        d = template2dict(TEMPLATE)
+        self.assertEqual(d, EXPECTED)
+        self.assertEqual(list(d._root.keys()), ["TEMPLATE"])
+        self.assertFalse(hasattr(template2dict(TEMPLATE, root=None), "_root"))
+        self.assertEqual(template2dict(u""), OrderedDict())
+
+    def test_stream(self):
+        for chunk_size in (1, 7, 4096):
+            stream = io.BytesIO(TEMPLATE.encode("utf-8"))
+            self.assertEqual(OrderedDict(template2dict(stream, root=None)), EXPECTED)
+            stream = io.StringIO(TEMPLATE)
+            self.assertEqual(list(iter_template(stream, chunk_size))[:3],
+                             [('NAME', 'vm "one"'), ('CPU', '0.5'), ('MEMORY', '1024')])
+
+    def test_names_and_escapes(self):
+        # only \" is unescaped, as oned does, other backslashes are kept
+        d = template2dict(u'name="a\\\\b \\"c\\" C:\\dir"\nDisk=[ image_id=1, PATH="C:\\tmp \\"x\\"" ]\n'
+                          u'NIC=[]\nNIC_ALIAS=[ ]')
+        self.assertEqual(d, OrderedDict([('NAME', u'a\\\\b "c" C:\\dir'),
+                                         ('DISK', OrderedDict([('IMAGE_ID', '1'), ('PATH', u'C:\\tmp "x"')])),
+                                         ('NIC', ''), ('NIC_ALIAS', '')]))
+        # the closing quote of a value ending in a backslash reads as escaped
+        with self.assertRaises(ValueError):
+            template2dict(u'A="x\\"')
+        self.assertEqual(list(iter_template(u'vcpu=2')), [('VCPU', '2')])
+
+    def test_errors(self):
+        for text in (u'NAME="open', u'NAME', u'DISK=[ IMAGE_ID ]', u'A="1"B="2"', u'= "x"'):
+            with self.assertRaises(ValueError):
+                template2dict(text)
+        with self.assertRaises(ValueError) as context:
+            template2dict(io.StringIO(u'A="1"\nB="2"\nC=[x]'))
+        self.assertIn("line 3", str(context.exception))
+
+    def test_round_trip(self):
+        d = template2dict(TEMPLATE)
+        self.assertEqual(template2dict(dict2template(d)), d)
+        self.assertEqual(child2dict(etree.fromstring(cast2one(d))), d)
+        # backslashes are sent as they are, oned only unescapes \"
+        d = OrderedDict([('A', u'C:\\dir'), ('B', u'^\\s+\\w'), ('C', u'echo "a\\tb"'), ('D', u'a\\"b')])
+        self.assertEqual(dict2template(d), u'A="C:\\dir"\nB="^\\s+\\w"\nC="echo \\"a\\tb\\""\nD="a\\\\"b"\n')
+        self.assertEqual(template2dict(dict2template(d), root=None), d)
+
+    def test_same_as_child2dict(self):
+        for name in sorted(os.listdir(data_dir)):
+            tree = etree.parse(os.path.join(data_dir, name))
+            for element in tree.xpath("//*[local-name()='TEMPLATE' or local-name()='USER_TEMPLATE']"):
+                d = child2dict(element)
+                self.assertEqual(template2dict(dict2template(d)), d, name)
@@ -0,0 +1,122 @@
+# Copyright 2018 www.privaz.io Valletech AB
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import os
+import shutil
+import socket
+import tempfile
+import time
+import unittest
+import xmlrpc.client
+from pyone import OneServer
+from pyone.tester import OneServerTester
+from .oned import FakeOned
+from .test_aio import ASYNCIO
+
+if ASYNCIO:
+    import asyncio
+    from . import aio_calls
+
+
+def vm_info(session, vmid, delay=0):
+    time.sleep(delay)
+    return [True, "<VM><ID>%d</ID></VM>" % vmid, 0]
+
+
+class TimeoutTests(unittest.TestCase):
+
+    def setUp(self):
+        self.oned = FakeOned()
+        self.oned.register("one.vm.info", vm_info)
+        self.oned.start()
+
+    def tearDown(self):
+        self.oned.stop()
+
+    def test_process_default_is_not_changed(self):
+        OneServer(self.oned.endpoint, session="oneadmin:onepass", timeout=5)
+        self.assertIsNone(socket.getdefaulttimeout())
+
+    def test_server_timeout(self):
+        for options in ({}, {"pool_size": 2}):
+            one = OneServer(self.oned.endpoint, session="oneadmin:onepass", timeout=0.1, **options)
+            with self.assertRaises(socket.timeout):
+                one.vm.info(1, 0.5)
+            self.assertEqual(one.vm.info(2, 0.5, _timeout=2).ID, 2)
+            self.assertEqual(one.vm.info(3).ID, 3)
+            one.server_close()
+
+    def test_call_timeout(self):
+        for options in ({}, {"pool_size": 1}):
+            one = OneServer(self.oned.endpoint, session="oneadmin:onepass", **options)
+            self.assertEqual(one.vm.info(1).ID, 1)
+            with self.assertRaises(socket.timeout):
+                one.vm.info(2, 0.5, _timeout=0.1)
+            # the override does not outlive the call
+            self.assertEqual(one.vm.info(3, 0.3).ID, 3)
+            one.server_close()
+
+    def test_connect_and_read_timeouts(self):
+        one = OneServer(self.oned.endpoint, session="oneadmin:onepass", timeout=30, connect_timeout=2)
+        transport = one._ServerProxy__transport
+        self.assertEqual((transport.connect_timeout, transport.read_timeout), (2, 30))
+        one.vm.info(1)
+        connection = transport._connection[1]
+        self.assertEqual(connection.timeout, 2)
+        self.assertEqual(connection.sock.gettimeout(), 30)
+        one.vm.info(2, _timeout=5)
+        self.assertEqual((connection.timeout, connection.sock.gettimeout()), (2, 5))
+        one.vm.info(3, _timeout=1)
+        self.assertEqual((connection.timeout, connection.sock.gettimeout()), (1, 1))
+
+    def test_custom_transport(self):
+        one = OneServer(self.oned.endpoint, session="oneadmin:onepass", transport=xmlrpc.client.Transport())
+        self.assertEqual(one.vm.info(1).ID, 1)
+        with self.assertRaises(TypeError):
+            one.vm.info(1, _timeout=1)
+
+    @unittest.skipUnless(ASYNCIO, "the asyncio client requires Python 3.5")
+    def test_async_call_timeout(self):
+        loop = asyncio.new_event_loop()
+        try:
+            timed_out, vm = loop.run_until_complete(aio_calls.vm_info_timeouts(self.oned.endpoint, 2, 0.1, 2))
+        finally:
+            loop.close()
+        self.assertTrue(timed_out)
+        self.assertEqual(vm.ID, 2)
+
+
+class TesterTimeoutTests(unittest.TestCase):
+
+    def setUp(self):
+        self.oned = FakeOned()
+        self.oned.register("one.vm.info", vm_info)
+        self.oned.start()
+        self.directory = tempfile.mkdtemp()
+        self.fixture_file = os.path.join(self.directory, "fixtures.json.gz")
+
+    def tearDown(self):
+        self.oned.stop()
+        shutil.rmtree(self.directory)
+
+    def test_timeout_is_not_part_of_the_signature(self):
+        one = OneServerTester(self.oned.endpoint, "oneadmin:onepass", fixture_file=self.fixture_file,
+                              fixture_unit="timeouts", fixture_replay=False)
+        self.assertEqual(one.vm.info(1, _timeout=5).ID, 1)
+        one.server_close()
+
+        one = OneServerTester(self.oned.endpoint, "oneadmin:onepass", fixture_file=self.fixture_file,
+                              fixture_unit="timeouts", fixture_replay=True)
+        self.assertEqual(one.vm.info(1).ID, 1)
+        self.assertEqual(len(self.oned.calls), 1)
@@ -0,0 +1,112 @@
+# Copyright 2018 www.privaz.io Valletech AB
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import copy
+import unittest
+from collections import OrderedDict
+from pyone import OneServer, TrackedTemplate
+from pyone.util import template2dict, cast2one
+from .oned import FakeOned
+
+USER_TEMPLATE = u'LABELS="SSD"\nNOTES="web"\nCONTEXT=[ NETWORK="YES", TOKEN="NO" ]\n' \
+                u'DISK=[ SIZE="1" ]\nDISK=[ SIZE="2" ]\n'
+
+
+def vm_info(session, vmid):
+    return [True, "<VM><ID>%d</ID><USER_TEMPLATE><LABELS>SSD</LABELS><NOTES>web</NOTES></USER_TEMPLATE>"
+                  "</VM>" % vmid, 0]
+
+
+class TrackedTemplateTests(unittest.TestCase):
+
+    def setUp(self):
+        self.template = TrackedTemplate(template2dict(USER_TEMPLATE, root="USER_TEMPLATE"))
+
+    def test_unchanged(self):
+        self.assertFalse(self.template.modified)
+        self.assertEqual(self.template.delta(), u"")
+        self.template["LABELS"] = "SSD"
+        self.assertFalse(self.template.modified)
+        self.assertEqual(self.template, template2dict(USER_TEMPLATE))
+        self.assertEqual(cast2one(self.template), cast2one(template2dict(USER_TEMPLATE, root="USER_TEMPLATE")))
+
+    def test_delta(self):
+        self.template["LABELS"] = "SSD,HA"
+        self.template["CONTEXT"]["TOKEN"] = "YES"
+        self.template.setdefault("NEW", "1")
+        self.assertEqual(self.template.changed, set(["LABELS", "CONTEXT", "NEW"]))
+        self.assertEqual(self.template.delta(), u'LABELS="SSD,HA"\nCONTEXT=[\n  NETWORK="YES",\n  TOKEN="YES" ]\n'
+                                                u'NEW="1"\n')
+        self.template.commit()
+        self.assertFalse(self.template.modified)
+
+    def test_repeated(self):
+        self.template["DISK"][1]["SIZE"] = "3"
+        self.assertEqual(self.template.delta(), u'DISK=[\n  SIZE="1" ]\nDISK=[\n  SIZE="3" ]\n')
+        self.template.commit()
+        self.template["DISK"].append(OrderedDict([("SIZE", "4")]))
+        self.assertFalse(self.template.modified)
+        self.template.touch("DISK")
+        self.assertEqual(self.template.changed, set(["DISK"]))
+
+    def test_deleted(self):
+        self.template["NEW"] = "1"
+        del self.template["NEW"]
+        self.assertFalse(self.template.modified)
+        self.assertEqual(self.template.pop("NOTES"), "web")
+        self.template.update(NOTES="db")
+        self.assertEqual((self.template.changed, self.template.deleted), (set(["NOTES"]), set()))
+        self.template.clear()
+        self.assertEqual(self.template.deleted, set(["LABELS", "NOTES", "CONTEXT", "DISK"]))
+        self.assertEqual(self.template.changed, set())
+
+    def test_copy(self):
+        self.template["LABELS"] = "HA"
+        copied = copy.deepcopy(self.template)
+        self.assertEqual(copied, self.template)
+        self.assertEqual(copied.changed, set(["LABELS"]))
+        copied["CONTEXT"]["TOKEN"] = "YES"
+        self.assertEqual(copied.changed, set(["LABELS", "CONTEXT"]))
+        self.assertEqual(self.template.changed, set(["LABELS"]))
+
+
+class UpdateTemplateTests(unittest.TestCase):
+
+    def setUp(self):
+        self.oned = FakeOned()
+        self.oned.register("one.vm.info", vm_info)
+        self.oned.register("one.vm.update", lambda session, vmid, template, type: [True, vmid, 0])
+        self.oned.start()
+        self.one = OneServer(self.oned.endpoint, session="oneadmin:onepass")
+
+    def tearDown(self):
+        self.oned.stop()
+
+    def updates(self):
+        return [params[1:] for name, params in self.oned.calls if name == "one.vm.update"]
+
+    def test_merge(self):
+        template = TrackedTemplate(self.one.vm.info(3).USER_TEMPLATE)
+        self.assertIsNone(self.one.update_template("vm.update", 3, template))
+        template["LABELS"] = "SSD,HA"
+        self.assertEqual(self.one.update_template("vm.update", 3, template), 3)
+        self.assertFalse(template.modified)
+        self.assertEqual(self.updates(), [(3, u'LABELS="SSD,HA"\n', 1)])
+
+    def test_replace(self):
+        template = TrackedTemplate(self.one.vm.info(3).USER_TEMPLATE)
+        del template["NOTES"]
+        self.one.update_template("vm.update", 3, template)
+        self.assertEqual(self.updates(),
+                         [(3, u"<USER_TEMPLATE><LABELS><![CDATA[SSD]]></LABELS></USER_TEMPLATE>", 0)])
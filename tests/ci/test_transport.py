@@ -0,0 +1,132 @@
+# Copyright 2018 www.privaz.io Valletech AB
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import unittest
+import threading
+import time
+from pyone import OneServer, OneNoExistsException
+from pyone.transport import ConnectionPool, OneTransport, OneSafeTransport
+from .oned import FakeOned
+
+
+def vm_info(session, vmid):
+    if vmid < 0:
+        return [False, "[one.vm.info] Error getting virtual machine [%d]." % vmid, 0x0400]
+    return [True, "<VM><ID>%d</ID><NAME>vm-%d</NAME></VM>" % (vmid, vmid), 0]
+
+
+class PooledTransportTests(unittest.TestCase):
+
+    def setUp(self):
+        self.oned = FakeOned()
+        self.oned.register("one.vm.info", vm_info)
+        self.oned.start()
+
+    def tearDown(self):
+        self.oned.stop()
+
+    def test_connections_are_reused(self):
+        one = OneServer(self.oned.endpoint, session="oneadmin:onepass", pool_size=2)
+        for i in range(5):
+            self.assertEqual(one.vm.info(i).ID, i)
+        stats = one.server_pool_stats()
+        pool = list(stats.values())[0]
+        self.assertEqual(pool["created"], 1)
+        self.assertEqual(pool["reused"], 4)
+        self.assertEqual(pool["requests"], [5])
+        self.assertEqual(self.oned.connections, 1)
+        one.server_close()
+        # a new pool after closing
+        self.assertEqual(one.vm.info(5).ID, 5)
+        self.assertEqual(list(one.server_pool_stats().values())[0]["created"], 1)
+        one.server_close()
+
+    def test_errors_keep_the_connection(self):
+        one = OneServer(self.oned.endpoint, session="oneadmin:onepass", pool_size=1)
+        with self.assertRaises(OneNoExistsException):
+            one.vm.info(-1)
+        self.assertEqual(one.vm.info(3).NAME, "vm-3")
+        self.assertEqual(self.oned.connections, 1)
+
+    def test_concurrent_calls(self):
+        one = OneServer(self.oned.endpoint, session="oneadmin:onepass", pool_size=4)
+        results = {}
+
+        def worker(n):
+            for i in range(10):
+                results[(n, i)] = one.vm.info(n * 100 + i).ID
+
+        threads = [threading.Thread(target=worker, args=(n,)) for n in range(8)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        self.assertEqual(len(results), 80)
+        for (n, i), vmid in results.items():
+            self.assertEqual(vmid, n * 100 + i)
+        self.assertLessEqual(self.oned.connections, 4)
+
+    def test_default_transport_is_not_pooled(self):
+        # also on Python 2, where xmlrpclib.Transport has no use_builtin_types option
+        one = OneServer(self.oned.endpoint, session="oneadmin:onepass")
+        self.assertIsInstance(one._ServerProxy__transport, OneTransport)
+        self.assertIsNone(one.server_pool_stats())
+        self.assertEqual(one.vm.info(1).ID, 1)
+        one = OneServer(self.oned.endpoint.replace("http", "https"), session="oneadmin:onepass")
+        self.assertIsInstance(one._ServerProxy__transport, OneSafeTransport)
+
+
+class ConnectionPoolTests(unittest.TestCase):
+
+    class Connection(object):
+        closed = False
+
+        def close(self):
+            self.closed = True
+
+    def test_idle_eviction(self):
+        pool = ConnectionPool(self.Connection, max_size=2, idle_timeout=0.01)
+        conn = pool.acquire()
+        pool.release(conn)
+        time.sleep(0.02)
+        conn2 = pool.acquire()
+        self.assertTrue(conn.connection.closed)
+        self.assertIsNot(conn, conn2)
+        self.assertEqual(pool.stats()["evicted"], 1)
+
+    def test_discard_frees_slot(self):
+        pool = ConnectionPool(self.Connection, max_size=1)
+        conn = pool.acquire()
+        pool.discard(conn)
+        self.assertTrue(conn.connection.closed)
+        pool.release(pool.acquire())
+        self.assertEqual(pool.stats()["created"], 2)
+
+    def test_close_in_use(self):
+        pool = ConnectionPool(self.Connection, max_size=2)
+        idle, in_use = pool.acquire(), pool.acquire()
+        pool.release(idle)
+        pool.close()
+        self.assertTrue(idle.connection.closed)
+        self.assertFalse(in_use.connection.closed)
+        pool.release(in_use)
+        self.assertTrue(in_use.connection.closed)
+        self.assertEqual(pool.stats()["idle"], 0)
+        # the slot is free again
+        pool.discard(pool.acquire())
+
+    def test_invalid_size(self):
+        with self.assertRaises(ValueError):
+            ConnectionPool(self.Connection, max_size=0)
@@ -0,0 +1,123 @@
+# Copyright 2018 www.privaz.io Valletech AB
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import unittest
+from pyone import OneServer, OneNoExistsException, OneWaitTimeout, OneWaitFailure, VM_STATE, LCM_STATE, \
+    HOST_STATES
+from .oned import FakeOned
+
+PENDING = (VM_STATE.PENDING, LCM_STATE.LCM_INIT)
+PROLOG = (VM_STATE.ACTIVE, LCM_STATE.PROLOG)
+RUNNING = (VM_STATE.ACTIVE, LCM_STATE.RUNNING)
+BOOT_FAILURE = (VM_STATE.ACTIVE, LCM_STATE.BOOT_FAILURE)
+DONE = (VM_STATE.DONE, LCM_STATE.LCM_INIT)
+
+
+class FakeVMs(object):
+    '''
+    VMs going through a list of states, one step per pool request
+    '''
+
+    def __init__(self, states):
+        self.states = states
+        self.polls = 0
+
+    def vmpool_info(self, session, filter, start, end, state):
+        self.polls += 1
+        vms = []
+        for vmid, steps in sorted(self.states.items()):
+            if not start <= vmid <= end:
+                continue
+            vm_state, lcm_state = steps[min(self.polls, len(steps)) - 1]
+            if vm_state == VM_STATE.DONE and state != -2:
+                continue
+            vms.append("<VM><ID>%d</ID><NAME>vm</NAME><STATE>%d</STATE><LCM_STATE>%d</LCM_STATE></VM>"
+                       % (vmid, vm_state, lcm_state))
+        return [True, "<VM_POOL>%s</VM_POOL>" % "".join(vms), 0]
+
+
+class WaitForTests(unittest.TestCase):
+
+    def setUp(self):
+        self.oned = FakeOned()
+        self.oned.start()
+        self.one = OneServer(self.oned.endpoint, session="oneadmin:onepass")
+
+    def tearDown(self):
+        self.oned.stop()
+
+    def start(self, states):
+        vms = FakeVMs(states)
+        self.oned.register("one.vmpool.info", vms.vmpool_info)
+        return vms
+
+    def test_batched_polling(self):
+        states = dict((vmid, [PENDING, PROLOG, RUNNING]) for vmid in range(100, 600))
+        states[700] = [PENDING, RUNNING]
+        vms = self.start(states)
+        ret = self.one.wait_for("vm", sorted(states), state=VM_STATE.ACTIVE, lcm_state=LCM_STATE.RUNNING,
+                                timeout=10, interval=0.01)
+        self.assertEqual([vm.ID for vm in ret], sorted(states))
+        self.assertTrue(all(vm.LCM_STATE == LCM_STATE.RUNNING for vm in ret))
+        # only the state is requested
+        self.assertIsNone(ret[0].NAME)
+        self.assertEqual(vms.polls, 3)
+        # two ID ranges, the second one is not polled again once its VM is running
+        self.assertEqual([params[2:4] for _, params in self.oned.calls], [(100, 599), (700, 700), (100, 599)])
+
+    def test_single_id(self):
+        self.start({7: [PENDING, RUNNING]})
+        vm = self.one.wait_for("vm", 7, state=VM_STATE.ACTIVE, interval=0.01, fields=None)
+        self.assertEqual((vm.ID, vm.NAME), (7, "vm"))
+
+    def test_accepted_states(self):
+        self.start({1: [PENDING, PROLOG], 2: [PENDING, PENDING, RUNNING]})
+        ret = self.one.wait_for("vm", [1, 2], lcm_state=[LCM_STATE.PROLOG, LCM_STATE.RUNNING], interval=0.01)
+        self.assertEqual([vm.LCM_STATE for vm in ret], [LCM_STATE.PROLOG, LCM_STATE.RUNNING])
+
+    def test_fail_fast(self):
+        self.start({1: [PENDING, RUNNING], 2: [PENDING, BOOT_FAILURE, RUNNING]})
+        with self.assertRaises(OneWaitFailure) as failure:
+            self.one.wait_for("vm", [1, 2], state=VM_STATE.ACTIVE, lcm_state=LCM_STATE.RUNNING, interval=0.01)
+        self.assertIn("BOOT_FAILURE", str(failure.exception))
+
+        self.start({2: [PENDING, BOOT_FAILURE]})
+        vm = self.one.wait_for("vm", 2, lcm_state=LCM_STATE.BOOT_FAILURE, interval=0.01)
+        self.assertEqual(vm.LCM_STATE, LCM_STATE.BOOT_FAILURE)
+
+    def test_done(self):
+        vms = self.start({1: [RUNNING, DONE]})
+        vm = self.one.wait_for("vm", 1, state=VM_STATE.DONE, interval=0.01)
+        self.assertEqual(vm.STATE, VM_STATE.DONE)
+        self.assertEqual(vms.polls, 2)
+
+    def test_deleted(self):
+        self.start({1: [PENDING, DONE]})
+        with self.assertRaises(OneNoExistsException):
+            self.one.wait_for("vm", 1, state=VM_STATE.ACTIVE, interval=0.01)
+
+    def test_timeout(self):
+        self.start({1: [PENDING]})
+        with self.assertRaises(OneWaitTimeout):
+            self.one.wait_for("vm", 1, state=VM_STATE.ACTIVE, timeout=0.1, interval=0.01)
+
+    def test_hosts(self):
+        def hostpool_info(session):
+            return [True, "<HOST_POOL><HOST><ID>0</ID><STATE>2</STATE></HOST>"
+                          "<HOST><ID>1</ID><STATE>3</STATE></HOST></HOST_POOL>", 0]
+
+        self.oned.register("one.hostpool.info", hostpool_info)
+        self.assertEqual(self.one.wait_for("host", 0, state=HOST_STATES.MONITORED).STATE, HOST_STATES.MONITORED)
+        with self.assertRaises(OneWaitFailure):
+            self.one.wait_for("host", 1, state=HOST_STATES.MONITORED)
@@ -0,0 +1,120 @@
+# Copyright 2018 www.privaz.io Valletech AB
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import unittest
+from pyone import OneServer, OneException, PoolWatcher
+from pyone.pools import id_ranges
+from pyone.watcher import ADDED, CHANGED, REMOVED
+from .oned import FakeOned
+
+
+class FakeVMs(object):
+
+    def __init__(self):
+        # ID: [STATE, LCM_STATE, LAST_POLL]
+        self.vms = dict((id, [3, 3, 1000]) for id in range(10))
+
+    def vm(self, id, extended=False):
+        state, lcm_state, last_poll = self.vms[id]
+        template = "<TEMPLATE><MEMORY>1024</MEMORY></TEMPLATE>" if extended else ""
+        return "<VM><ID>%d</ID><NAME>vm%d</NAME><LAST_POLL>%d</LAST_POLL><STATE>%d</STATE>" \
+               "<LCM_STATE>%d</LCM_STATE>%s</VM>" % (id, id, last_poll, state, lcm_state, template)
+
+    def pool(self, start, end, extended):
+        ids = [id for id in sorted(self.vms) if start < 0 or start <= id <= end]
+        return [True, "<VM_POOL>%s</VM_POOL>" % "".join(self.vm(id, extended) for id in ids), 0]
+
+    def info(self, session, filter, start, end, state):
+        return self.pool(start, end, False)
+
+    def infoextended(self, session, filter, start, end, state):
+        return self.pool(start, end, True)
+
+
+class PoolWatcherTests(unittest.TestCase):
+
+    def setUp(self):
+        self.fake = FakeVMs()
+        self.oned = FakeOned()
+        self.oned.register("one.vmpool.info", self.fake.info)
+        self.oned.register("one.vmpool.infoextended", self.fake.infoextended)
+        self.oned.start()
+        self.one = OneServer(self.oned.endpoint, session="oneadmin:onepass")
+
+    def tearDown(self):
+        self.oned.stop()
+
+    def churn(self):
+        self.fake.vms[2][1] = 5
+        self.fake.vms[7][2] = 1010
+        del self.fake.vms[4]
+        self.fake.vms[12] = [1, 0, 0]
+
+    def test_events(self):
+        watcher = self.one.pool_watcher("vmpool")
+        events = watcher.poll()
+        self.assertEqual([(e.type, e.id) for e in events], [(ADDED, id) for id in range(10)])
+        self.assertEqual(watcher.poll(), [])
+
+        self.churn()
+        events = watcher.poll()
+        self.assertEqual([(e.type, e.id) for e in events],
+                         [(CHANGED, 2), (CHANGED, 7), (ADDED, 12), (REMOVED, 4)])
+        self.assertEqual(events[0].object.LCM_STATE, 5)
+        self.assertEqual(events[0].previous.LCM_STATE, 3)
+        self.assertIsNone(events[2].previous)
+        self.assertIsNone(events[3].object)
+        self.assertEqual(events[3].previous.ID, 4)
+        self.assertEqual(sorted(watcher.snapshot), [0, 1, 2, 3, 5, 6, 7, 8, 9, 12])
+
+    def test_signature(self):
+        watcher = PoolWatcher(self.one, "vmpool", signature=["STATE"])
+        watcher.poll()
+        self.churn()
+        self.assertEqual([(e.type, e.id) for e in watcher.poll()], [(ADDED, 12), (REMOVED, 4)])
+
+    def test_extended(self):
+        watcher = self.one.pool_watcher("vmpool", extended=True)
+        events = watcher.poll()
+        self.assertEqual(len(events), 10)
+        self.assertEqual(events[0].object.TEMPLATE["MEMORY"], "1024")
+        self.assertEqual(watcher.poll(), [])
+
+        self.churn()
+        del self.oned.calls[:]
+        events = watcher.poll()
+        self.assertEqual([(e.type, e.id) for e in events],
+                         [(CHANGED, 2), (CHANGED, 7), (ADDED, 12), (REMOVED, 4)])
+        self.assertEqual(events[2].object.TEMPLATE["MEMORY"], "1024")
+        # only the changed objects are requested again
+        self.assertEqual([(name, params[2:4]) for name, params in self.oned.calls],
+                         [("one.vmpool.info", (-1, -1)), ("one.vmpool.infoextended", (2, 12))])
+        # unchanged objects keep their complete binding
+        self.assertEqual(watcher.snapshot[0].TEMPLATE["MEMORY"], "1024")
+
+    def test_watch(self):
+        watcher = self.one.pool_watcher("vmpool")
+        events = list(watcher.watch(interval=0.05, timeout=0.12))
+        self.assertEqual(len(events), 10)
+        self.assertGreaterEqual(watcher.polls, 3)
+
+    def test_not_watchable(self):
+        with self.assertRaises(OneException):
+            self.one.pool_watcher("zonepool")
+        with self.assertRaises(OneException):
+            self.one.pool_watcher("hostpool", extended=True)
+
+    def test_id_ranges(self):
+        self.assertEqual(list(id_ranges([7, 1, 3])), [(1, 7)])
+        self.assertEqual(list(id_ranges([0, 499, 500, 1200], 500)), [(0, 499), (500, 500), (1200, 1200)])